@@ -27,11 +27,14 @@ from threading import Lock
 from collections import namedtuple
 import logging
 import functools
+import time
 from queue import Queue
 
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import QThread, QEvent, QTimer
 
+from brickv.profiler import profiler, get_function_name, DEPTH_BOUNDS
+
 ASYNC_EVENT = 12345
 
 async_call_queue = Queue()
@@ -39,6 +42,8 @@ async_event_queue = Queue()
 async_session_lock = Lock()
 async_session_id = 1
 
+profiler.add_gauge_callback(lambda p: p.set_gauge('Async Queue', 'Current Depth', async_call_queue.qsize()))
+
 AsyncCall = namedtuple('AsyncCall', 'function arguments result_callback error_callback pass_arguments_to_result_callback pass_arguments_to_error_callback pass_exception_to_error_callback expand_arguments_tuple_for_callback expand_result_tuple_for_callback debug_exception retry_on_exception session_id')
 
 def async_stop_thread():
@@ -64,6 +69,9 @@ def async_call(function, arguments, result_callback, error_callback,
     else:
         async_call_queue.put(ac)
 
+    if profiler.enabled:
+        profiler.record('Async Queue', 'Depth', async_call_queue.qsize(), bounds=DEPTH_BOUNDS)
+
 def async_event_handler():
     while not async_event_queue.empty():
         try:
@@ -88,7 +96,7 @@ def async_event_handler():
                 if ac.pass_exception_to_error_callback:
                     arguments += (result,)
 
-                ac.error_callback(*arguments)
+                callback = ac.error_callback
             else:
                 arguments = tuple()
 
@@ -107,7 +115,17 @@ def async_event_handler():
                 elif result != None:
                     arguments += (result,)
 
-                ac.result_callback(*arguments)
+                callback = ac.result_callback
+
+            if profiler.enabled:
+                start = time.monotonic()
+
+                try:
+                    callback(*arguments)
+                finally:
+                    profiler.record('Async Result Callbacks', get_function_name(callback), time.monotonic() - start)
+            else:
+                callback(*arguments)
         except StopIteration:
             pass
         except:
@@ -138,6 +156,7 @@ class AsyncThread(QThread):
                     continue
 
             result = None
+            start = time.monotonic() if profiler.enabled else None
 
             try:
                 retry_on_exception = ac.retry_on_exception
@@ -172,6 +191,9 @@ class AsyncThread(QThread):
                     QApplication.postEvent(self, QEvent(ASYNC_EVENT))
 
                 continue
+            finally:
+                if start != None:
+                    profiler.record('Async Calls', get_function_name(ac.function), time.monotonic() - start)
 
             if ac.result_callback != None:
                 with async_session_lock:
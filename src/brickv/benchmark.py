@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2026 Matthias Bolte <matthias@tinkerforge.com>
+
+benchmark.py: Benchmarks for hot paths with JSON baselines
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# Usage: python3 -m brickv.benchmark --save baseline.json
+#        python3 -m brickv.benchmark --baseline baseline.json
+#
+# Every benchmark is a generator that does its setup, yields a run function
+# that returns the number of performed operations and cleans up afterwards.
+# Qt benchmarks use the offscreen platform and are skipped if PyQt5 is not
+# available. The exit code is 1 if a regression was found.
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import queue
+import shutil
+import socket
+import statistics
+import struct
+import sys
+import tempfile
+import threading
+import time
+
+from brickv.bindings.ip_connection import IPConnection, pack_payload, unpack_payload
+
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.15 # relative throughput drop
+DEFAULT_LATENCY_TOLERANCE = 0.5 # relative increase of the slowest run
+BASELINE_VERSION = 1
+
+PAYLOAD_FORMS = [
+    ('h', (1234,)),
+    ('B I 8s', (1, 123456, 'abcdefgh')),
+    ('! B I B 15B', (True, 1, 0x1234, 8, tuple(range(15)))),
+    ('H H 60B', (1000, 60, tuple(range(60)))),
+    ('64!', (tuple(i % 3 == 0 for i in range(64)),))
+]
+
+benchmarks = [] # (name, function)
+
+def benchmark(name):
+    def register(function):
+        benchmarks.append((name, contextlib.contextmanager(function)))
+
+        return function
+
+    return register
+
+# the Qt benchmarks share one application object
+qt_application = None
+
+def get_qt_application():
+    global qt_application
+
+    if qt_application == None:
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+        from PyQt5.QtWidgets import QApplication
+
+        qt_application = QApplication.instance()
+
+        if qt_application == None:
+            qt_application = QApplication(['brickv-benchmark'])
+
+    return qt_application
+
+@benchmark('ip_connection.pack_payload')
+def bench_pack_payload():
+    def run():
+        for _ in range(2000):
+            for form, data in PAYLOAD_FORMS:
+                pack_payload(data, form)
+
+        return 2000 * len(PAYLOAD_FORMS)
+
+    yield run
+
+@benchmark('ip_connection.unpack_payload')
+def bench_unpack_payload():
+    packed = [(form, pack_payload(data, form)) for form, data in PAYLOAD_FORMS]
+
+    def run():
+        for _ in range(2000):
+            for form, data in packed:
+                unpack_payload(data, form)
+
+        return 2000 * len(packed)
+
+    yield run
+
+@benchmark('IPConnection.receive_loop')
+def bench_receive_loop():
+    from brickv.bindings.bricklet_temperature_v2 import BrickletTemperatureV2
+
+    count = 20000
+    ipcon = IPConnection()
+    device = BrickletTemperatureV2('XYZ', ipcon)
+
+    device.register_callback(BrickletTemperatureV2.CALLBACK_TEMPERATURE, lambda temperature: None)
+
+    callback = struct.pack('<IBBBBh', device.uid, 10, BrickletTemperatureV2.CALLBACK_TEMPERATURE, 0, 0, 2150)
+    data = callback * count
+
+    def run():
+        reader, writer = socket.socketpair()
+        writer_thread = threading.Thread(target=lambda: (writer.sendall(data), writer.close()), daemon=True)
+
+        ipcon.socket = reader
+        ipcon.receive_flag = True
+        ipcon.callback = IPConnection.CallbackContext()
+        ipcon.callback.queue = queue.Queue()
+
+        writer_thread.start()
+        ipcon.receive_loop(ipcon.socket_id) # returns on EOF
+        writer_thread.join()
+        reader.close()
+
+        ipcon.socket = None
+        ipcon.receive_flag = False
+
+        # all callbacks plus the disconnect notification
+        assert ipcon.callback.queue.qsize() == count + 1, ipcon.callback.queue.qsize()
+
+        return count
+
+    yield run
+
+# the benchmarks drive the plot themselves. pass a timer that is never started,
+# otherwise the PlotWidget starts its own timer with a float interval that is
+# rejected by PyQt 5.15
+def create_plot_widget(curves):
+    from PyQt5.QtCore import QTimer
+    from brickv.plot_widget import PlotWidget
+
+    timer = QTimer()
+    widget = PlotWidget('Value', curves, external_timer=timer)
+
+    timer.setParent(widget)
+
+    return widget
+
+@benchmark('Plot.add_data')
+def bench_plot_add_data():
+    get_qt_application()
+
+    from PyQt5.QtCore import Qt
+
+    widget = create_plot_widget([('A', Qt.red, None, str), ('B', Qt.blue, None, str)])
+    plot = widget.plot
+    x = [0]
+
+    def run():
+        for _ in range(5000):
+            x[0] += 0.01
+            plot.add_data(0, x[0], x[0] % 7)
+            plot.add_data(1, x[0], -(x[0] % 5))
+
+        return 10000
+
+    yield run
+
+    widget.deleteLater()
+
+@benchmark('CurveArea.paintEvent')
+def bench_curve_area_paint():
+    get_qt_application()
+
+    from PyQt5.QtCore import Qt
+
+    widget = create_plot_widget([('A', Qt.red, None, str), ('B', Qt.blue, None, str), ('C', Qt.green, None, str)])
+    widget.resize(800, 400)
+
+    for i in range(2000):
+        for c in range(3):
+            widget.plot.add_data(c, i * 0.01, (i * (c + 1)) % 101)
+
+    curve_area = widget.plot.curve_area
+
+    def run():
+        for _ in range(50):
+            curve_area.grab() # renders the widget, calling paintEvent
+
+        return 50
+
+    yield run
+
+    widget.deleteLater()
+
+@benchmark('CSVWriter.write_data_row')
+def bench_csv_writer():
+    from brickv.data_logger.utils import CSVWriter, CSVData
+
+    directory = tempfile.mkdtemp()
+    writer = CSVWriter(os.path.join(directory, 'benchmark.csv'))
+    row = CSVData('2026-01-01T00:00:00', 'Temperature Bricklet 2.0', 'XYZ', 'Temperature', 2150, '°C/100')
+
+    def run():
+        for _ in range(5000):
+            writer.write_data_row(row)
+
+        return 5000
+
+    try:
+        yield run
+    finally:
+        writer.close_file()
+        shutil.rmtree(directory, ignore_errors=True)
+
+@benchmark('DeviceImpl._timer')
+def bench_device_impl_timer():
+    from brickv.simulator import Simulator, SimulatedDevice, DeviceSpec
+    from brickv.bindings.bricklet_temperature_v2 import BrickletTemperatureV2
+    from brickv.data_logger.data_logger import DataLogger
+    from brickv.data_logger.loggable_devices import DeviceImpl
+
+    device = SimulatedDevice('XYZ', '0', 'a', DeviceSpec.get(BrickletTemperatureV2), (1, 0, 0), (2, 0, 0))
+    simulator = Simulator([device])
+    port = simulator.listen(port=0)
+
+    threading.Thread(target=simulator.accept_loop, daemon=True).start()
+
+    config = {
+        'hosts': {'default': {'name': '127.0.0.1', 'port': port, 'secret': None}},
+        'data': {'time_format': 'iso', 'time_format_strftime': ''}
+    }
+    data_logger = DataLogger(config, None)
+    data = {'name': BrickletTemperatureV2.DEVICE_DISPLAY_NAME, 'uid': 'XYZ',
+            'values': {'Temperature': {'interval': 1}}, 'options': {}}
+    device_impl = DeviceImpl(data, data_logger)
+    data_queue = queue.Queue()
+    data_logger.data_queue['benchmark'] = data_queue
+
+    def run():
+        for _ in range(500):
+            device_impl._timer('Temperature')
+
+        with data_queue.mutex:
+            data_queue.queue.clear()
+
+        return 500
+
+    try:
+        yield run
+    finally:
+        data_logger.ipcon.disconnect()
+        simulator.stop()
+
+def run_benchmark(function, repeat):
+    with function() as run:
+        run() # warm up
+
+        durations = []
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            operations = run()
+            durations.append((time.perf_counter() - start) / operations)
+
+    return {
+        'ops_per_second': 1 / statistics.median(durations),
+        'max_seconds_per_op': max(durations),
+        'repeat': repeat
+    }
+
+def compare(result, baseline, tolerance, latency_tolerance):
+    problems = []
+
+    if result['ops_per_second'] < baseline['ops_per_second'] * (1 - tolerance):
+        problems.append('throughput')
+
+    if result['max_seconds_per_op'] > baseline['max_seconds_per_op'] * (1 + latency_tolerance):
+        problems.append('latency')
+
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description='Brick Viewer benchmarks')
+
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='timed runs per benchmark (default: {0})'.format(DEFAULT_REPEAT))
+    parser.add_argument('--save', metavar='FILE', help='save the results as JSON baseline')
+    parser.add_argument('--baseline', metavar='FILE', help='compare the results to this JSON baseline')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='allowed relative throughput drop (default: {0})'.format(DEFAULT_TOLERANCE))
+    parser.add_argument('--latency-tolerance', type=float, default=DEFAULT_LATENCY_TOLERANCE,
+                        help='allowed relative increase of the slowest run (default: {0})'.format(DEFAULT_LATENCY_TOLERANCE))
+
+    args = parser.parse_args(sys.argv[1:])
+    baseline = {}
+
+    if args.baseline != None:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)['results']
+
+    results = {}
+    regressions = 0
+
+    print('{0:<32} {1:>14} {2:>14} {3:>9}  {4}'.format('Benchmark', 'Ops/s', 'Baseline', 'Change', 'Status'))
+
+    for name, function in benchmarks:
+        if args.filter not in name:
+            continue
+
+        try:
+            result = run_benchmark(function, args.repeat)
+        except ImportError as e:
+            print('{0:<32} {1:>14} {2:>14} {3:>9}  skipped ({4})'.format(name, '-', '-', '-', e))
+            continue
+        except Exception as e:
+            print('{0:<32} {1:>14} {2:>14} {3:>9}  failed ({4})'.format(name, '-', '-', '-', e))
+            regressions += 1
+            continue
+
+        results[name] = result
+        reference = baseline.get(name)
+
+        if reference == None:
+            print('{0:<32} {1:>14.0f} {2:>14} {3:>9}  new'.format(name, result['ops_per_second'], '-', '-'))
+            continue
+
+        change = result['ops_per_second'] / reference['ops_per_second'] - 1
+        problems = compare(result, reference, args.tolerance, args.latency_tolerance)
+
+        if len(problems) > 0:
+            status = 'REGRESSION ({0})'.format(', '.join(problems))
+            regressions += 1
+        else:
+            status = 'ok'
+
+        print('{0:<32} {1:>14.0f} {2:>14.0f} {3:>+8.1f}%  {4}'.format(name, result['ops_per_second'],
+                                                                      reference['ops_per_second'], change * 100, status))
+
+    if args.save != None:
+        with open(args.save, 'w') as f:
+            json.dump({'version': BASELINE_VERSION,
+                       'python': platform.python_version(),
+                       'platform': platform.platform(),
+                       'results': results}, f, indent=2, sort_keys=True)
+
+    if regressions > 0:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -25,9 +25,17 @@ import threading
 import logging
 import time
 import queue
+import weakref
 
 from PyQt5.QtCore import QObject, pyqtSignal
 
+from brickv.profiler import profiler, get_function_name
+
+# emulators with a running loop thread
+active_callback_emulators = weakref.WeakSet()
+
+profiler.add_gauge_callback(lambda p: p.set_gauge('Callback Emulators', 'Active', len(active_callback_emulators)))
+
 class CallbackEmulator(QObject):
     qtcb_result = pyqtSignal(object)
     qtcb_error = pyqtSignal(object)
@@ -77,6 +85,8 @@ class CallbackEmulator(QObject):
 
                 self.thread = threading.Thread(target=self.loop, args=(self.period_queue, self.enable_ref), daemon=True)
                 self.thread.start()
+
+                active_callback_emulators.add(self)
         else:
             if period != 0:
                 self.period_queue.put(period)
@@ -88,6 +98,8 @@ class CallbackEmulator(QObject):
 
                 self.thread = None
 
+                active_callback_emulators.discard(self)
+
     def cb_result(self, result):
         arguments = tuple()
 
@@ -126,6 +138,9 @@ class CallbackEmulator(QObject):
             if period == None:
                 break
 
+            if profiler.enabled:
+                profiler.count('Callback Emulator Ticks', get_function_name(self.function))
+
             try:
                 if self.arguments == None:
                     result = self.function()
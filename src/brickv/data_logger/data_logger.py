@@ -33,73 +33,94 @@ if 'merged_data_logger_modules' not in globals():
     from brickv.data_logger.event_logger import EventLogger
     from brickv.data_logger.job import CSVWriterJob#, GuiDataJob
     from brickv.data_logger.loggable_devices import DeviceImpl
-    from brickv.data_logger.utils import DataLoggerException
+    from brickv.data_logger.utils import DataLoggerException, LoggerTimer
 else:
     from tinkerforge.ip_connection import IPConnection, base58decode
 
-class DataLogger(threading.Thread):
+RECONNECT_INTERVAL = 5 # seconds, for hosts that could not be connected at startup
+REQUEST_TIMEOUT = 1 # seconds
+MERGE_WINDOW = 2 * REQUEST_TIMEOUT # seconds, rows of all hosts are sorted within this window
+STATS_INTERVAL = 60 # seconds
+
+class HostConnection:
     """
-    This class represents the data logger and an object of this class is
-    the actual instance of a logging process
+    Connection to one Brick Daemon or Ethernet/WIFI Extension. Every host
+    has its own IPConnection, so a slow or disconnected host does not block
+    the requests to the other hosts.
     """
 
-    # constructor and other functions
-    def __init__(self, config, gui_job):
-        super().__init__()
-
-        self.daemon = True
-
-        self.jobs = []  # thread hashmap for all running threads/jobs
-        self.job_exit_flag = False  # flag for stopping the thread
-        self.job_sleep = 1  # TODO: Enahncement -> use condition objects
-        self.timers = []
-        self._gui_job = gui_job
-        self.data_queue = {}  # universal data_queue hash map
-        self.host = config['hosts']['default']['name']
-        self.port = config['hosts']['default']['port']
-        self.secret = config['hosts']['default']['secret']
+    def __init__(self, datalogger, host_id, host_config):
+        self.datalogger = datalogger
+        self.host_id = host_id
+        self.host = host_config['name']
+        self.port = host_config['port']
+        self.secret = host_config['secret']
 
         if self.secret != None:
             try:
                 self.secret.encode('ascii')
             except:
-                EventLogger.critical('Authentication secret cannot contain non-ASCII characters')
+                EventLogger.critical('Authentication secret for host "{0}" cannot contain non-ASCII characters'.format(self.host_id))
                 self.secret = None
 
-        self.loggable_devices = []
         self.ipcon = IPConnection()
+        self.ipcon.set_timeout(REQUEST_TIMEOUT)
 
         self.ipcon.register_callback(IPConnection.CALLBACK_CONNECTED, self.cb_connected)
+        self.ipcon.register_callback(IPConnection.CALLBACK_DISCONNECTED, self.cb_disconnected)
         self.ipcon.register_callback(IPConnection.CALLBACK_ENUMERATE, self.cb_enumerate)
 
-        try:
-            self.ipcon.connect(self.host, self.port)  # Connect to brickd
-        except Exception as e:
-            EventLogger.critical("A critical error occur: " + str(e))
-            self.ipcon = None
-            raise DataLoggerException(DataLoggerException.DL_CRITICAL_ERROR, "A critical error occur: " + str(e))
+        self.stats_lock = threading.Lock()
+        self.rows = 0 # protected by stats_lock
+        self.reported_rows = 0 # protected by stats_lock
+        self.errors = 0 # protected by stats_lock
+        self.reconnects = 0 # protected by stats_lock
+        self.stop_event = threading.Event()
+        self.connect_thread = None
 
-        EventLogger.info("Connection to " + self.host + ":" + str(self.port) + " established.")
-        self.ipcon.set_timeout(1)  # TODO: Timeout number
-        EventLogger.debug("Set ipcon.time_out to 1.")
-        self._config = config
-        self.csv_file_name = 'logger_data_{0}.csv'.format(int(time.time()))
-        self.csv_enabled = True
-        self.stopped = False
+    def get_label(self):
+        return '"{0}" ({1}:{2})'.format(self.host_id, self.host, self.port)
 
-    def cb_connected(self, connect_reason):
-        if self.secret != None:
-            try:
-                self.secret.encode('ascii')
-            except:
+    def connect(self):
+        self.ipcon.connect(self.host, self.port)  # Connect to brickd
+
+        EventLogger.info("Connection to " + self.get_label() + " established.")
+
+    # keeps trying to connect in the background, once connected the
+    # IPConnection auto-reconnect takes over
+    def connect_in_background(self):
+        def loop():
+            while not self.stop_event.wait(RECONNECT_INTERVAL):
                 try:
-                    self.ipcon.disconnect()
-                except:
-                    pass
+                    self.connect()
+                except Exception as e:
+                    EventLogger.debug("Could not connect to " + self.get_label() + ": " + str(e))
+                else:
+                    break
 
-                EventLogger.critical('Authentication secret cannot contain non-ASCII characters')
-                return
+        self.connect_thread = threading.Thread(target=loop, daemon=True)
+        self.connect_thread.start()
 
+    def disconnect(self):
+        self.stop_event.set()
+
+        if self.connect_thread != None:
+            self.connect_thread.join()
+            self.connect_thread = None
+
+        try:
+            self.ipcon.disconnect()
+        except:
+            pass
+
+    def cb_connected(self, connect_reason):
+        if connect_reason == IPConnection.CONNECT_REASON_AUTO_RECONNECT:
+            EventLogger.info("Reconnected to " + self.get_label())
+
+            with self.stats_lock:
+                self.reconnects += 1
+
+        if self.secret != None:
             self.ipcon.set_auto_reconnect(False) # don't auto-reconnect on authentication error
 
             try:
@@ -115,25 +136,125 @@ class DataLogger(threading.Thread):
                 else:
                     extra = ''
 
-                EventLogger.critical('Could not authenticate' + extra)
+                EventLogger.critical('Could not authenticate to ' + self.get_label() + extra)
                 return
 
             self.ipcon.set_auto_reconnect(True)
 
-            EventLogger.info("Successfully authenticated")
+            EventLogger.info("Successfully authenticated to " + self.get_label())
 
-        self.apply_options()
+        self.datalogger.apply_options(self.host_id)
+
+    def cb_disconnected(self, disconnect_reason):
+        if disconnect_reason != IPConnection.DISCONNECT_REASON_REQUEST:
+            EventLogger.warning("Connection to " + self.get_label() + " lost")
 
     def cb_enumerate(self, uid, connected_uid, position,
                      hardware_version, firmware_version,
                      device_identifier, enumeration_type):
         if enumeration_type in [IPConnection.ENUMERATION_TYPE_AVAILABLE,
                                 IPConnection.ENUMERATION_TYPE_CONNECTED]:
-            self.apply_options()
+            self.datalogger.apply_options(self.host_id)
+
+    def record_row(self):
+        with self.stats_lock:
+            self.rows += 1
+
+    def record_error(self):
+        with self.stats_lock:
+            self.errors += 1
 
-    def apply_options(self):
+    def report_stats(self, interval, log):
+        with self.stats_lock:
+            rate = (self.rows - self.reported_rows) / interval if interval > 0 else 0
+            self.reported_rows = self.rows
+
+            log("Host {0}: {1} rows ({2:.1f} rows/s), {3} errors, {4} reconnects"
+                .format(self.get_label(), self.rows, rate, self.errors, self.reconnects))
+
+class DataLogger(threading.Thread):
+    """
+    This class represents the data logger and an object of this class is
+    the actual instance of a logging process
+    """
+
+    # constructor and other functions
+    def __init__(self, config, gui_job):
+        super().__init__()
+
+        self.daemon = True
+
+        self.jobs = []  # thread hashmap for all running threads/jobs
+        self.job_exit_flag = False  # flag for stopping the thread
+        self.job_sleep = 1  # TODO: Enahncement -> use condition objects
+        self.timers = []
+        self._gui_job = gui_job
+        self.data_queue = {}  # universal data_queue hash map
+        self.loggable_devices = []
+        self.hosts = {} # by host ID
+        self.stats_timestamp = time.monotonic()
+
+        for host_id, host_config in config['hosts'].items():
+            self.hosts[host_id] = HostConnection(self, host_id, host_config)
+
+        # rows of different hosts are only sorted if there are multiple hosts
+        self.multiple_hosts = len(self.hosts) > 1
+        self.merge_window = MERGE_WINDOW if self.multiple_hosts else 0
+
+        # all hosts are connected independently. as before, a single host
+        # that cannot be connected is a critical error
+        connected = 0
+
+        for host_connection in self.hosts.values():
+            try:
+                host_connection.connect()
+            except Exception as e:
+                if not self.multiple_hosts:
+                    EventLogger.critical("A critical error occur: " + str(e))
+                    self.ipcon = None
+                    raise DataLoggerException(DataLoggerException.DL_CRITICAL_ERROR, "A critical error occur: " + str(e))
+
+                EventLogger.warning("Could not connect to " + host_connection.get_label() + ", retrying in the background: " + str(e))
+                host_connection.connect_in_background()
+            else:
+                connected += 1
+
+        if connected == 0:
+            for host_connection in self.hosts.values():
+                host_connection.disconnect()
+
+            self.ipcon = None
+            raise DataLoggerException(DataLoggerException.DL_CRITICAL_ERROR, "A critical error occur: Could not connect to any host")
+
+        # the connection of the default host, kept for existing users
+        self.ipcon = self.hosts['default'].ipcon
+        self._config = config
+        self.csv_file_name = 'logger_data_{0}.csv'.format(int(time.time()))
+        self.csv_enabled = True
+        self.stopped = False
+
+    def get_ipcon(self, host_id):
+        return self.hosts[host_id].ipcon
+
+    def apply_options(self, host_id=None):
         for loggable_device in self.loggable_devices:
-            loggable_device.apply_options()
+            if host_id == None or loggable_device.host_id == host_id:
+                loggable_device.apply_options()
+
+    # called by a LoggerTimer, which passes a variable name
+    def report_host_stats(self, _var_name=None):
+        now = time.monotonic()
+        interval = now - self.stats_timestamp
+        self.stats_timestamp = now
+
+        # the stats are only interesting to compare multiple hosts
+        if len(self.hosts) > 1:
+            log = EventLogger.info
+        else:
+            log = EventLogger.debug
+
+        for host_connection in self.hosts.values():
+            host_connection.report_stats(interval, log)
 
     def process_data_csv_section(self):
         """
@@ -202,6 +323,9 @@ class DataLogger(threading.Thread):
         EventLogger.debug("Jobs started.")
 
         """START-TIMERS"""
+        self.stats_timestamp = time.monotonic()
+        self.timers.append(LoggerTimer(STATS_INTERVAL, "report_host_stats", None, self))
+
         for t in self.timers:
             t.start()
         EventLogger.debug("Get-Timers started.")
@@ -231,10 +355,10 @@ class DataLogger(threading.Thread):
             job.join()
         EventLogger.debug("Jobs[" + str(len(self.jobs)) + "] stopped.")
 
-        try:
-            self.ipcon.disconnect()
-        except:
-            pass
+        self.report_host_stats()
+
+        for host_connection in self.hosts.values():
+            host_connection.disconnect()
 
         EventLogger.info("Connection closed successfully.")
 
@@ -246,5 +370,10 @@ class DataLogger(threading.Thread):
 
         csv --
         """
+        host_connection = self.hosts.get(csv.host)
+
+        if host_connection != None:
+            host_connection.record_row()
+
         for q in self.data_queue.values():
             q.put(csv)
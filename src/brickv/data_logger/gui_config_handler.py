@@ -50,11 +50,13 @@ class GuiConfigHandler:
         Creates the hosts section part of the config file
         and returns it as a dictonary.
         """
-        # store hosts as a dict as preparation for multi-host support. so the
-        # config format doesn't have to be changed if multi-host support is added
-        hosts = {'default': {'name': setup_dialog.combo_host.currentText(),
-                             'port': setup_dialog.spin_port.value(),
-                             'secret': setup_dialog.edit_secret.text() if setup_dialog.check_authentication.isChecked() else None}}
+        # only the default host can be edited, additional hosts of a loaded
+        # config are kept as they are
+        hosts = dict(setup_dialog.extra_hosts)
+
+        hosts['default'] = {'name': setup_dialog.combo_host.currentText(),
+                            'port': setup_dialog.spin_port.value(),
+                            'secret': setup_dialog.edit_secret.text() if setup_dialog.check_authentication.isChecked() else None}
 
         return hosts
 
@@ -89,7 +91,7 @@ class GuiConfigHandler:
             name_item = setup_dialog.model_devices.item(row, 0)
             uid_item = setup_dialog.model_devices.item(row, 1)
             device = {
-                'host': 'default',
+                'host': name_item.data(),
                 'name': name_item.text(),
                 'uid': setup_dialog.tree_devices.indexWidget(uid_item.index()).text(),
                 'values': {}
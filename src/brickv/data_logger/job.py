@@ -28,6 +28,7 @@ Boston, MA 02111-1307, USA.
 #                               Jobs
 #---------------------------------------------------------------------------
 
+import heapq
 import queue
 import threading
 import time
@@ -88,18 +89,42 @@ class CSVWriterJob(AbstractJob):
                 return
 
             EventLogger.debug(self._job_name + " Started")
-            csv_writer = CSVWriter(self._datalogger.csv_file_name)
+            csv_writer = CSVWriter(self._datalogger.csv_file_name, with_host=self._datalogger.multiple_hosts)
+
+            # with multiple hosts the rows are held back for the merge window
+            # and written ordered by time, a slow host can delay a row by up
+            # to one request timeout
+            merge_window = self._datalogger.merge_window
+            pending = [] # heap of (epoch, sequence number, csv_data)
+            sequence_number = 0
+
+            def write(csv_data):
+                if not csv_writer.write_data_row(csv_data):
+                    EventLogger.warning(self._job_name + " Could not write csv row!")
 
             while True:
                 if not self._datalogger.data_queue[self.name].empty():
                     csv_data = self._get_data_from_queue()
-                    if not csv_writer.write_data_row(csv_data):
-                        EventLogger.warning(self._job_name + " Could not write csv row!")
+
+                    if merge_window > 0 and csv_data.epoch != None:
+                        heapq.heappush(pending, (csv_data.epoch, sequence_number, csv_data))
+                        sequence_number += 1
+                    else:
+                        write(csv_data)
+
+                if len(pending) > 0:
+                    deadline = time.time() - merge_window
+
+                    while len(pending) > 0 and pending[0][0] <= deadline:
+                        write(heapq.heappop(pending)[2])
 
                 if not self._exit_flag and self._datalogger.data_queue[self.name].empty():
                     time.sleep(self._datalogger.job_sleep)
 
                 if self._exit_flag and self._datalogger.data_queue[self.name].empty():
+                    while len(pending) > 0:
+                        write(heapq.heappop(pending)[2])
+
                     exit_return_value = csv_writer.close_file()
                     if exit_return_value:
                         EventLogger.debug(self._job_name + " Closed his csv_writer")
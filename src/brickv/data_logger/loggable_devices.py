@@ -7076,9 +7076,10 @@ class DeviceImpl(AbstractDevice):
 
         self.device_name = self.data['name']
         self.device_uid = self.data['uid']
+        self.host_id = self.data.get('host', 'default')
         self.device_spec = device_specs[self.device_name]
         device_class = self.device_spec['class']
-        self.device = device_class(self.device_uid, self.datalogger.ipcon)
+        self.device = device_class(self.device_uid, self.datalogger.get_ipcon(self.host_id))
 
         self.__name__ = "devices:" + str(self.device_name)
 
@@ -7121,6 +7122,12 @@ class DeviceImpl(AbstractDevice):
                 EventLogger.warning('Could not apply options for "{0}" with UID "{1}": {2}'
                                     .format(self.device_name, self.device_uid, e))
 
+    def _add_to_queue(self, now, csv_data):
+        csv_data.host = self.host_id
+        csv_data.epoch = now
+
+        self.datalogger.add_to_queue(csv_data)
+
     def _timer(self, var_name):
         """
         This function is used by the LoggerTimer to get the variable values from the brickd.
@@ -7165,13 +7172,15 @@ class DeviceImpl(AbstractDevice):
         try:
             value = getter(self.device)
         except Exception as e:
+            self.datalogger.hosts[self.host_id].record_error()
+
             value = self._exception_msg(self.device_name + "-" + var_name, e)
-            self.datalogger.add_to_queue(CSVData(timestamp,
-                                                 self.device_name,
-                                                 self.device_uid,
-                                                 var_name,
-                                                 value,
-                                                 ''))
+            self._add_to_queue(now, CSVData(timestamp,
+                                            self.device_name,
+                                            self.device_uid,
+                                            var_name,
+                                            value,
+                                            ''))
             # log_exception(timestamp, value_name, e)
             return
 
@@ -7191,12 +7200,12 @@ class DeviceImpl(AbstractDevice):
                     else:
                         keyed_var_name = var_name
 
-                    self.datalogger.add_to_queue(CSVData(timestamp,
-                                                         self.device_name,
-                                                         self.device_uid,
-                                                         keyed_var_name,
-                                                         keyed_value,
-                                                         unit_str))
+                    self._add_to_queue(now, CSVData(timestamp,
+                                                    self.device_name,
+                                                    self.device_uid,
+                                                    keyed_var_name,
+                                                    keyed_value,
+                                                    unit_str))
             else:
                 subvalue_bool = self.data['values'][var_name]['subvalues']
 
@@ -7215,20 +7224,20 @@ class DeviceImpl(AbstractDevice):
                                     else:
                                         unit_str = unit[i]
 
-                                    self.datalogger.add_to_queue(CSVData(timestamp,
-                                                                         self.device_name,
-                                                                         self.device_uid,
-                                                                         keyed_var_name + "-" + subvalue_names[i],
-                                                                         keyed_value[i],
-                                                                         unit_str))
+                                    self._add_to_queue(now, CSVData(timestamp,
+                                                                    self.device_name,
+                                                                    self.device_uid,
+                                                                    keyed_var_name + "-" + subvalue_names[i],
+                                                                    keyed_value[i],
+                                                                    unit_str))
                             except Exception as e:
                                 err_value = self._exception_msg(self.device_name + "-" + keyed_var_name, e)
-                                self.datalogger.add_to_queue(CSVData(timestamp,
-                                                                     self.device_name,
-                                                                     self.device_uid,
-                                                                     keyed_var_name + "-" + subvalue_names[i],
-                                                                     err_value,
-                                                                     ''))
+                                self._add_to_queue(now, CSVData(timestamp,
+                                                                self.device_name,
+                                                                self.device_uid,
+                                                                keyed_var_name + "-" + subvalue_names[i],
+                                                                err_value,
+                                                                ''))
                                 return
                         else:
                             for k in range(len(subvalue_names[i])):
@@ -7239,27 +7248,27 @@ class DeviceImpl(AbstractDevice):
                                         else:
                                             unit_str = unit[i][k]
 
-                                        self.datalogger.add_to_queue(CSVData(timestamp,
-                                                                             self.device_name,
-                                                                             self.device_uid,
-                                                                             keyed_var_name + "-" + subvalue_names[i][k],
-                                                                             keyed_value[i][k],
-                                                                             unit_str))
+                                        self._add_to_queue(now, CSVData(timestamp,
+                                                                        self.device_name,
+                                                                        self.device_uid,
+                                                                        keyed_var_name + "-" + subvalue_names[i][k],
+                                                                        keyed_value[i][k],
+                                                                        unit_str))
                                 except Exception as e:
                                     err_value = self._exception_msg(str(self.device_name) + "-" + keyed_var_name, e)
-                                    self.datalogger.add_to_queue(CSVData(timestamp,
-                                                                         self.device_name,
-                                                                         self.device_uid,
-                                                                         keyed_var_name + "-" + subvalue_names[i][k],
-                                                                         err_value,
-                                                                         ''))
+                                    self._add_to_queue(now, CSVData(timestamp,
+                                                                    self.device_name,
+                                                                    self.device_uid,
+                                                                    keyed_var_name + "-" + subvalue_names[i][k],
+                                                                    err_value,
+                                                                    ''))
                                     return
 
         except Exception as e:
             err_value = self._exception_msg(self.device_name + "-" + var_name, e)
-            self.datalogger.add_to_queue(CSVData(timestamp,
-                                                 self.device_name,
-                                                 self.device_uid,
-                                                 var_name,
-                                                 err_value,
-                                                 ''))
+            self._add_to_queue(now, CSVData(timestamp,
+                                            self.device_name,
+                                            self.device_uid,
+                                            var_name,
+                                            err_value,
+                                            ''))
@@ -194,6 +194,7 @@ class SetupDialog(QDialog, Ui_SetupDialog):
         self.tab_debug_warning = False
         self.device_dialog = None
         self.last_host_index = -1
+        self.extra_hosts = {} # by host ID, hosts of a loaded config other than the default host
 
         self.setupUi(self)
 
@@ -540,6 +541,8 @@ class SetupDialog(QDialog, Ui_SetupDialog):
         port = config['hosts']['default']['port']
         secret = config['hosts']['default']['secret']
 
+        self.extra_hosts = {host_id: host for host_id, host in config['hosts'].items() if host_id != 'default'}
+
         i = self.combo_host.findText(name)
         if i >= 0:
             self.combo_host.setCurrentIndex(i)
@@ -574,16 +577,18 @@ class SetupDialog(QDialog, Ui_SetupDialog):
         # check if device is already added
         if len(device['uid']) > 0:
             for row in range(self.model_devices.rowCount()):
+                existing_host = self.model_devices.item(row, 0).data()
                 existing_name = self.model_devices.item(row, 0).text()
                 exisitng_uid = self.tree_devices.indexWidget(self.model_devices.item(row, 1).index()).text()
 
-                if device['name'] == existing_name and device['uid'] == exisitng_uid:
+                if device['host'] == existing_host and device['name'] == existing_name and device['uid'] == exisitng_uid:
                     EventLogger.info('Ignoring duplicate device "{0}" with UID "{1}"'
                                      .format(device['name'], device['uid']))
                     return
 
         # add device
         name_item = QStandardItem(device['name'])
+        name_item.setData(device['host'])
         uid_item = QStandardItem('')
 
         self.model_devices.appendRow([name_item, uid_item])
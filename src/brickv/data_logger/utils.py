@@ -120,7 +120,7 @@ class CSVData:
     This class is used as a temporary save spot for all csv relevant data.
     """
 
-    def __init__(self, timestamp, name, uid, var_name, raw_data, var_unit):
+    def __init__(self, timestamp, name, uid, var_name, raw_data, var_unit, host=None, epoch=None):
         """
         timestamp -- time data was
         name      -- display name of Brick(let)
@@ -128,6 +128,8 @@ class CSVData:
         var_name  -- name of logged value
         raw_data  -- logged value
         var_unit  -- unit of logged value
+        host      -- ID of the host the Brick(let) is connected to
+        epoch     -- time data was, as Unix timestamp for sorting
         """
         self.timestamp = timestamp # datatime object
         self.name = name
@@ -135,6 +137,8 @@ class CSVData:
         self.var_name = var_name
         self.raw_data = raw_data
         self.var_unit = var_unit
+        self.host = host
+        self.epoch = epoch
 
     def __str__(self):
         """
@@ -145,7 +149,8 @@ class CSVData:
                ";UID=" + str(self.uid) + \
                ";VAR=" + str(self.var_name) + \
                ";RAW=" + str(self.raw_data) + \
-               ";UNIT=" + str(self.var_unit) + "]"
+               ";UNIT=" + str(self.var_unit) + \
+               ";HOST=" + str(self.host) + "]"
 
 '''
 /*---------------------------------------------------------------------------
@@ -322,11 +327,13 @@ class CSVWriter:
     a CSV formatted file.
     """
 
-    def __init__(self, file_path, max_file_count=1, max_file_size=0):
+    def __init__(self, file_path, max_file_count=1, max_file_size=0, with_host=False):
         """
         file_path = Path to the csv file
+        with_host = Add a HOST column, used if data from multiple hosts is logged
         """
         self._file_path = file_path
+        self._with_host = with_host
         # check if file path exists
         if not Utilities.check_file_path_exists(self._file_path):
             raise Exception("File Path not found! -> " + str(self._file_path))
@@ -383,7 +390,12 @@ class CSVWriter:
             return
 
         EventLogger.debug("CSVWriter._write_header() - done")
-        self._csv_file.writerow(["TIME"] + ["NAME"] + ["UID"] + ["VAR"] + ["RAW"] + ["UNIT"])
+        header = ["TIME"] + ["NAME"] + ["UID"] + ["VAR"] + ["RAW"] + ["UNIT"]
+
+        if self._with_host:
+            header += ["HOST"]
+
+        self._csv_file.writerow(header)
         self._raw_file.flush()
 
     def write_data_row(self, csv_data):
@@ -396,7 +408,12 @@ class CSVWriter:
         if self._raw_file is None or self._csv_file is None:
             return False
 
-        self._csv_file.writerow([csv_data.timestamp] + [csv_data.name] + [csv_data.uid] + [csv_data.var_name] + [str(csv_data.raw_data)] + [csv_data.var_unit])
+        row = [csv_data.timestamp] + [csv_data.name] + [csv_data.uid] + [csv_data.var_name] + [str(csv_data.raw_data)] + [csv_data.var_unit]
+
+        if self._with_host:
+            row += [csv_data.host]
+
+        self._csv_file.writerow(row)
         self._raw_file.flush()
 
         if self._file_size > 0:
@@ -22,12 +22,29 @@ Boston, MA 02111-1307, USA.
 """
 
 import gc
+import os
+from datetime import datetime
 
-from PyQt5.QtCore import pyqtSignal
-from PyQt5.QtWidgets import QDialog
+from PyQt5.QtCore import pyqtSignal, QTimer
+from PyQt5.QtWidgets import QDialog, QTreeWidgetItem, QMessageBox
 
 from brickv.ui_developer import Ui_Developer
-from brickv.utils import get_modeless_dialog_flags
+from brickv.utils import get_modeless_dialog_flags, get_save_file_name, get_home_path
+from brickv.profiler import profiler, DURATION_BOUNDS
+
+PROFILER_UPDATE_INTERVAL = 1000 # milliseconds
+
+def format_profiler_value(value, bounds):
+    if value == None:
+        return '-'
+
+    if bounds is DURATION_BOUNDS:
+        return '{0:.3f} ms'.format(value * 1000)
+
+    if isinstance(value, float):
+        return '{0:.1f}'.format(value)
+
+    return str(value)
 
 class DeveloperWindow(QDialog, Ui_Developer):
     gc_stats_changed = pyqtSignal(int, int)
@@ -50,6 +67,31 @@ class DeveloperWindow(QDialog, Ui_Developer):
 
         gc.callbacks.append(self.gc_callback)
 
+        self.profiler_items = {} # by category or (category, name)
+        self.profiler_update_timer = QTimer(self)
+        self.profiler_update_timer.setInterval(PROFILER_UPDATE_INTERVAL)
+        self.profiler_update_timer.timeout.connect(self.update_profiler)
+
+        self.check_profiler_enabled.setChecked(profiler.enabled)
+        self.check_profiler_enabled.toggled.connect(self.profiler_enabled_toggled)
+        self.button_profiler_reset.clicked.connect(self.reset_profiler)
+        self.button_profiler_save.clicked.connect(self.save_profile_to_json_file)
+
+        self.tree_profiler.setColumnWidth(0, 350)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+
+        if profiler.enabled:
+            self.update_profiler()
+            self.profiler_update_timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+
+        # the profiler keeps collecting while the window is hidden
+        self.profiler_update_timer.stop()
+
     def force_gc(self):
         gc.collect()
 
@@ -72,6 +114,89 @@ class DeveloperWindow(QDialog, Ui_Developer):
         self.label_gc_collected.setText(str(self.gc_collected))
         self.label_gc_uncollectable.setText(str(self.gc_uncollectable))
 
+    def profiler_enabled_toggled(self, enabled):
+        if enabled:
+            self.clear_profiler_tree()
+            profiler.enable()
+            self.profiler_update_timer.start()
+        else:
+            profiler.disable()
+            self.profiler_update_timer.stop()
+            self.update_profiler()
+
+    def reset_profiler(self):
+        profiler.reset()
+
+        self.clear_profiler_tree()
+        self.update_profiler()
+
+    def clear_profiler_tree(self):
+        self.tree_profiler.clear()
+        self.profiler_items = {}
+
+    def get_profiler_item(self, category, name):
+        category_item = self.profiler_items.get(category)
+
+        if category_item == None:
+            category_item = QTreeWidgetItem([category])
+            self.profiler_items[category] = category_item
+
+            self.tree_profiler.addTopLevelItem(category_item)
+            category_item.setExpanded(True)
+
+        item = self.profiler_items.get((category, name))
+
+        if item == None:
+            item = QTreeWidgetItem([name])
+            self.profiler_items[(category, name)] = item
+
+            category_item.addChild(item)
+
+        return item
+
+    def update_profiler(self):
+        snapshot = profiler.snapshot()
+
+        self.tree_profiler.setUpdatesEnabled(False)
+
+        for category, histograms in snapshot['histograms'].items():
+            for name, histogram in histograms.items():
+                item = self.get_profiler_item(category, name)
+                bounds = histogram['bounds']
+
+                item.setText(1, str(histogram['count']))
+                item.setText(2, format_profiler_value(histogram['rate'], None))
+
+                for column, key in [(3, 'mean'), (4, 'p50'), (5, 'p95'), (6, 'max')]:
+                    item.setText(column, format_profiler_value(histogram[key], bounds))
+
+        for category, counters in snapshot['counters'].items():
+            for name, counter in counters.items():
+                item = self.get_profiler_item(category, name)
+
+                item.setText(1, str(counter['count']))
+                item.setText(2, format_profiler_value(counter['rate'], None))
+
+        for category, gauges in snapshot['gauges'].items():
+            for name, value in gauges.items():
+                self.get_profiler_item(category, name).setText(1, str(value))
+
+        self.tree_profiler.setUpdatesEnabled(True)
+
+    def save_profile_to_json_file(self):
+        date = datetime.now().replace(microsecond=0).isoformat().replace('T', '_').replace(':', '-')
+        filename = get_save_file_name(self, 'Save Profile To JSON File', os.path.join(get_home_path(), 'brickv_profile_{0}.json'.format(date)))
+
+        if len(filename) == 0:
+            return
+
+        try:
+            profiler.save_json(filename)
+        except Exception as e:
+            QMessageBox.critical(self, 'Save Profile To JSON File',
+                                 'Could not save profile to JSON file:\n\n' + str(e),
+                                 QMessageBox.Ok)
+
     def update_ui_state(self):
         pass
 
@@ -64,10 +64,14 @@ class ESPROM:
     # Flash sector size, minimum unit of erase.
     ESP_FLASH_SECTOR = 0x1000
 
-    def __init__(self, master):
-        self._port = TFSerial(master)
+    def __init__(self, master, startup_delay=1):
+        self._port = TFSerial(master, startup_delay)
         self._slip_reader = slip_reader(self._port)
 
+    """ Stop relaying data from the serial port """
+    def close(self):
+        self._port.close()
+
     """ Read a SLIP packet from the serial port """
     def read(self):
         return next(self._slip_reader)
@@ -390,6 +394,51 @@ class CesantaFlasher:
         if status_code != 0:
             raise FatalError('Write failure, status: %x' % status_code)
 
+    # Compares the MD5 digest of each sector of the flash with the image and
+    # only erases and writes the runs of sectors that differ
+    def flash_write_changed(self, addr, data, progress):
+        sector_size = self._esp.ESP_FLASH_SECTOR
+        block_size = self._esp.ESP_FLASH_BLOCK
+
+        assert addr % sector_size == 0, 'Address must be sector-aligned'
+        assert len(data) % sector_size == 0, 'Length must be sector-aligned'
+
+        digest, sector_digests = self.flash_digest(addr, len(data), sector_size)
+
+        if digest == hashlib.md5(data).digest():
+            progress(len(data) // block_size)
+            return 0
+
+        if len(sector_digests) != len(data) // sector_size:
+            # unexpected digest response, fall back to writing everything
+            self.flash_write(addr, data, progress)
+            return len(data)
+
+        runs = [] # [offset, length]
+
+        for i, sector_digest in enumerate(sector_digests):
+            offset = i * sector_size
+
+            if sector_digest == hashlib.md5(data[offset:offset + sector_size]).digest():
+                continue
+
+            if len(runs) > 0 and runs[-1][0] + runs[-1][1] == offset:
+                runs[-1][1] += sector_size
+            else:
+                runs.append([offset, sector_size])
+
+        written = 0
+
+        for offset, length in runs:
+            progress(offset // block_size)
+            self.flash_write(addr + offset, data[offset:offset + length],
+                             lambda value, offset=offset: progress(offset // block_size + value))
+            written += length
+
+        progress(len(data) // block_size)
+
+        return written
+
     def flash_read(self, addr, length, show_progress=False):
         sys.stdout.write('Reading %d @ 0x%x... ' % (length, addr))
         sys.stdout.flush()
@@ -628,25 +677,71 @@ entry": 1074792180, "num_params": 1, "params_start": 1074790400, "data": "FE0510
 
 
 from zipfile import ZipFile
-from threading import Thread
+from threading import Thread, Condition, Event
 
 from io import BytesIO as FileLike
 
 from queue import Queue, Empty
 
+# The ESP8266 UART is tunneled through the Master Brick. Reads are driven by
+# the data_received callback: read waits for it to deliver enough data instead
+# of polling the Master Brick itself. The Master Brick has no callback for data
+# received from the ESP8266, so a relay thread requests it and feeds it to
+# data_received. While data is flowing the relay requests the next chunk right
+# away. While the port is idle it waits for the next write, because the ESP8266
+# only sends data in response to a request, but at most for an interval that
+# backs off from RELAY_IDLE_MIN_INTERVAL to RELAY_IDLE_MAX_INTERVAL. Once the
+# interval reached RELAY_IDLE_MAX_INTERVAL and no read is waiting, the relay
+# stops polling until the next write or read. A read error ends the relay,
+# flushInput starts a fresh one, so every connect attempt starts over. Any object
+# providing start_wifi2_bootloader, write_wifi2_serial_port and
+# read_wifi2_serial_port like the Master Brick can be used as master.
 class TFSerial:
-    def __init__(self, master):
+    RELAY_IDLE_MIN_INTERVAL = 0.001
+    RELAY_IDLE_MAX_INTERVAL = 0.05
+
+    def __init__(self, master, startup_delay=1):
         self.master = master
         self.timeout = 1
-        self.read_buffer = []
+        self.read_buffer = bytearray()
+        self.read_error = None
+        self.read_waiting = 0
+        self.read_condition = Condition()
+        self.write_event = Event()
         self.baudrate = None
-        time.sleep(1)
+        time.sleep(startup_delay)
+
+        self.start_relay()
+
+    def start_relay(self):
+        self.relay_running = True
+        self.relay_thread = Thread(target=self.relay)
+        self.relay_thread.daemon = True
+        self.relay_thread.start()
+
+    def stop_relay(self):
+        self.relay_running = False
+        self.write_event.set()
+        self.relay_thread.join()
+        self.write_event.clear()
+
+    def close(self):
+        self.stop_relay()
 
     # Implement Serial functions that we don't need
     def setDTR(self, _): pass
-    def flushInput(self): pass
     def flushOutput(self): pass
 
+    # Discard all received data and errors and start a fresh relay
+    def flushInput(self):
+        self.stop_relay()
+
+        with self.read_condition:
+            del self.read_buffer[:]
+            self.read_error = None
+
+        self.start_relay()
+
     # We misuse the setRTS call to start the bootloader mode (and flush everyting etc)
     def setRTS(self, value):
         if value:
@@ -664,32 +759,77 @@ class TFSerial:
                 data = data[60:]
         except:
             raise Exception('Failed to write data')
+        finally:
+            self.write_event.set()
 
-    def read(self, length):
-        if len(self.read_buffer) < length:
+    def relay(self):
+        idle_interval = self.RELAY_IDLE_MIN_INTERVAL
+
+        while self.relay_running:
             try:
-                t = time.time()
+                data, l = self.master.read_wifi2_serial_port(60)
+            except Exception as e:
+                self.data_received(None, e)
+                return
 
-                while len(self.read_buffer) < length:
-                    data, l = self.master.read_wifi2_serial_port(60)
-                    data = data[:l]
-                    self.read_buffer.extend(data)
+            if l > 0:
+                self.data_received(data[:l])
+                idle_interval = self.RELAY_IDLE_MIN_INTERVAL
+                continue
 
-                    if len(self.read_buffer) < length:
-                        time.sleep(0.1)
+            if idle_interval >= self.RELAY_IDLE_MAX_INTERVAL:
+                with self.read_condition:
+                    wait_for_request = self.read_waiting == 0
+            else:
+                wait_for_request = False
+
+            if self.write_event.wait(None if wait_for_request else idle_interval):
+                self.write_event.clear()
+                idle_interval = self.RELAY_IDLE_MIN_INTERVAL
+            else:
+                idle_interval = min(idle_interval * 2, self.RELAY_IDLE_MAX_INTERVAL)
 
-                    if time.time() - t > self.timeout:
+    def data_received(self, data, error=None):
+        with self.read_condition:
+            if error != None:
+                self.read_error = error
+            else:
+                self.read_buffer.extend(data)
+
+            self.read_condition.notify_all()
+
+    def read(self, length):
+        deadline = time.time() + self.timeout
+
+        with self.read_condition:
+            self.read_waiting += 1
+
+            try:
+                # wake up the relay if it stopped polling
+                if len(self.read_buffer) < length:
+                    self.write_event.set()
+
+                while len(self.read_buffer) < length and self.read_error == None:
+                    remaining = deadline - time.time()
+
+                    if remaining <= 0:
                         break
-            except:
+
+                    self.read_condition.wait(remaining)
+            finally:
+                self.read_waiting -= 1
+
+            if self.read_error != None:
                 raise Exception('Failed to read data')
 
-        ret = self.read_buffer[:length]
-        self.read_buffer = self.read_buffer[length:]
+            ret = bytes(self.read_buffer[:length])
+            del self.read_buffer[:length]
 
-        return bytes(ret)
+        return ret
 
     def inWaiting(self):
-        return len(self.read_buffer)
+        with self.read_condition:
+            return len(self.read_buffer)
 
 class ESPFlash:
     def __init__(self, master, progress=None):
@@ -716,33 +856,11 @@ class ESPFlash:
                     files.append((int(name.replace('.bin', ''), 0), name))
 
                 esp = ESPROM(self.master)
-                esp.connect()
-
-                flasher = CesantaFlasher(esp, ESPROM.ESP_ROM_BAUD)
-
-                flash_mode = 0 # QIO
-                flash_size_freq = 0x40 # flash size 4MB (0x4_) + flash freq 40m (0x_0)
-                flash_info = struct.pack('BB', flash_mode, flash_size_freq)
-
-                for i, f in enumerate(files):
-                    address = f[0]
-                    image = zf.read(f[1])
-
-                    # Fix sflash config data
-                    if address == 0 and image.startswith(b'\xe9'):
-                        image = image[0:2] + flash_info + image[4:]
 
-                    # Pad to sector size
-                    if len(image) % esp.ESP_FLASH_SECTOR != 0:
-                        image += b'\xff' * (esp.ESP_FLASH_SECTOR - (len(image) % esp.ESP_FLASH_SECTOR))
-
-                    q.put(('reset', ('Writing flash section {0} of {1}'.format(i + 1, len(files)), len(image) // esp.ESP_FLASH_BLOCK)))
-
-                    flasher.flash_write(address, image, lambda value: q.put(('update', (value,))))
-
-                    q.put(('update', (len(image) // esp.ESP_FLASH_BLOCK,)))
-
-                flasher.boot_fw()
+                try:
+                    self.flash_files(esp, zf, files, q)
+                finally:
+                    esp.close()
             except Exception as e:
                 q.put(('raise', e))
 
@@ -769,3 +887,32 @@ class ESPFlash:
                 self.update_progress(*message[1])
 
         t.join()
+
+    def flash_files(self, esp, zf, files, q):
+        esp.connect()
+
+        flasher = CesantaFlasher(esp, ESPROM.ESP_ROM_BAUD)
+
+        flash_mode = 0 # QIO
+        flash_size_freq = 0x40 # flash size 4MB (0x4_) + flash freq 40m (0x_0)
+        flash_info = struct.pack('BB', flash_mode, flash_size_freq)
+
+        for i, f in enumerate(files):
+            address = f[0]
+            image = zf.read(f[1])
+
+            # Fix sflash config data
+            if address == 0 and image.startswith(b'\xe9'):
+                image = image[0:2] + flash_info + image[4:]
+
+            # Pad to sector size
+            if len(image) % esp.ESP_FLASH_SECTOR != 0:
+                image += b'\xff' * (esp.ESP_FLASH_SECTOR - (len(image) % esp.ESP_FLASH_SECTOR))
+
+            q.put(('reset', ('Writing flash section {0} of {1}'.format(i + 1, len(files)), len(image) // esp.ESP_FLASH_BLOCK)))
+
+            flasher.flash_write_changed(address, image, lambda value: q.put(('update', (value,))))
+
+            q.put(('update', (len(image) // esp.ESP_FLASH_BLOCK,)))
+
+        flasher.boot_fw()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2026 Matthias Bolte <matthias@tinkerforge.com>
+
+framebuffer.py: Bulk pixel conversion and dirty rectangle tracking
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import array
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QPainter, QColor
+
+# accepts a QColor, a Qt.GlobalColor or a 0xRRGGBB value
+def get_rgb(color):
+    # Qt.GlobalColor is an int subclass, check it before plain ints
+    if isinstance(color, int) and not isinstance(color, Qt.GlobalColor):
+        return color & 0xFFFFFF
+
+    return QColor(color).rgb() & 0xFFFFFF
+
+def image_to_rgbs(image):
+    image = image.convertToFormat(QImage.Format_RGB32)
+    bits = image.constBits()
+
+    bits.setsize(image.byteCount())
+
+    # Format_RGB32 lines are always 32-bit aligned, so there is no padding
+    # between the lines and every pixel is a native endian 0xffRRGGBB value
+    return array.array('I', bytes(bits))
+
+def rgbs_to_image(image, rgbs):
+    data = array.array('I', [0xFF000000 | rgb for rgb in rgbs]).tobytes()
+    source = QImage(data, image.width(), image.height(), image.width() * 4, QImage.Format_RGB32)
+    painter = QPainter(image)
+
+    painter.setCompositionMode(QPainter.CompositionMode_Source)
+    painter.drawImage(0, 0, source)
+    painter.end()
+
+# returns a list of bools, one per pixel, that is True for all pixels that
+# have one of the given colors
+def image_to_pixels(image, colors):
+    rgbs = set(get_rgb(color) for color in colors)
+
+    return [(value & 0xFFFFFF) in rgbs for value in image_to_rgbs(image)]
+
+# sets all pixels that are True in the pixel list to on_color. if off_color
+# is None then all other pixels are kept as they are
+def pixels_to_image(image, pixels, on_color, off_color=None):
+    on_rgb = get_rgb(on_color)
+
+    if off_color == None:
+        rgbs = [on_rgb if pixel else value for pixel, value in zip(pixels, image_to_rgbs(image))]
+    else:
+        off_rgb = get_rgb(off_color)
+        rgbs = [on_rgb if pixel else off_rgb for pixel in pixels]
+
+    rgbs_to_image(image, rgbs)
+
+class FrameBuffer:
+    """
+    Shadow copy of the pixels last sent to or read from a display. Instead of
+    the full frame only the bounding rectangles of the changed lines have to
+    be transmitted.
+    """
+
+    def __init__(self, width, height):
+        self.width  = width
+        self.height = height
+        self.shadow = None
+
+    # forget the shadow copy, the next update will contain the full frame
+    def invalidate(self):
+        self.shadow = None
+
+    # pixels are known to be on the display
+    def set_pixels(self, pixels):
+        self.shadow = list(pixels)
+
+    def get_dirty_rects(self, pixels):
+        width  = self.width
+        height = self.height
+        shadow = self.shadow
+
+        if shadow == None:
+            return [(0, 0, width - 1, height - 1)]
+
+        rects = []
+        band  = None # [x0, y0, x1, y1] of consecutive changed lines
+
+        for y in range(height):
+            start = y * width
+            end   = start + width
+
+            if pixels[start:end] == shadow[start:end]:
+                if band != None:
+                    rects.append(tuple(band))
+                    band = None
+
+                continue
+
+            x0 = 0
+
+            while pixels[start + x0] == shadow[start + x0]:
+                x0 += 1
+
+            x1 = width - 1
+
+            while pixels[start + x1] == shadow[start + x1]:
+                x1 -= 1
+
+            if band == None:
+                band = [x0, y, x1, y]
+            else:
+                band[0] = min(band[0], x0)
+                band[2] = max(band[2], x1)
+                band[3] = y
+
+        if band != None:
+            rects.append(tuple(band))
+
+        return rects
+
+    # returns a list of (x0, y0, x1, y1, pixels) tuples that have to be
+    # written to bring the display up to date and assumes that they will be
+    # written. call invalidate() if writing them fails
+    def get_changes(self, pixels):
+        width   = self.width
+        changes = []
+
+        for x0, y0, x1, y1 in self.get_dirty_rects(pixels):
+            data = []
+
+            for y in range(y0, y1 + 1):
+                data += pixels[y * width + x0:y * width + x1 + 1]
+
+            changes.append((x0, y0, x1, y1, data))
+
+        self.shadow = list(pixels)
+
+        return changes
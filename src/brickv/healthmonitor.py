@@ -22,11 +22,13 @@ Boston, MA 02111-1307, USA.
 """
 
 import os
+import re
 import time
 import csv
+import collections
 from datetime import datetime
 
-from PyQt5.QtCore import Qt, QTimer, QModelIndex
+from PyQt5.QtCore import Qt, QObject, QTimer
 from PyQt5.QtWidgets import QDialog, QHeaderView, QMessageBox
 from PyQt5.QtGui import QStandardItemModel, QStandardItem
 
@@ -37,6 +39,191 @@ from brickv.devicesproxymodel import DevicesProxyModel
 from brickv.infos import DeviceInfo, inventory, get_version_string
 
 SETTLE_DURATION = 5.0 # seconds
+POLL_INTERVAL = 1.0 # seconds, per device
+POLL_TICK_INTERVAL = 50 # milliseconds
+POLL_STACK_BUDGET = 2 # concurrent requests per stack
+HISTORY_LENGTH = 1000 # value changes per metric
+RATE_DURATION = 60.0 # seconds
+
+# metric values are numbers or strings such as 'A: 0, B: 3' for Bricks, for
+# the latter the sum of all numbers is used to calculate the rate
+def get_numeric_value(value):
+    if isinstance(value, bool):
+        return None
+
+    if isinstance(value, (int, float)):
+        return value
+
+    if isinstance(value, str):
+        numbers = re.findall(r':\s*(-?\d+)', value)
+
+        if len(numbers) > 0:
+            return sum(map(int, numbers))
+
+    return None
+
+class MetricHistory:
+    """
+    Bounded time series per device and metric. Only changes are recorded,
+    the value at any point in time is the last recorded value before it.
+    """
+
+    def __init__(self, length=HISTORY_LENGTH):
+        self.length = length
+        self.series = {} # by uid, by metric name: deque of (timestamp, value)
+
+    def clear(self):
+        self.series = {}
+
+    def add(self, uid, metric_name, value, timestamp=None):
+        if timestamp == None:
+            timestamp = time.time()
+
+        series = self.series.setdefault(uid, {}).get(metric_name)
+
+        if series == None:
+            series = collections.deque(maxlen=self.length)
+            self.series[uid][metric_name] = series
+        elif series[-1][1] == value:
+            return False
+
+        series.append((timestamp, value))
+
+        return True
+
+    def get_value_at(self, uid, metric_name, timestamp):
+        series = self.series.get(uid, {}).get(metric_name)
+
+        if series == None:
+            return None
+
+        for sample_timestamp, sample_value in reversed(series):
+            if sample_timestamp <= timestamp:
+                return sample_value
+
+        return None
+
+    # returns (delta, rate per minute) over the last duration seconds or None
+    def get_rate(self, uid, metric_name, duration=RATE_DURATION):
+        series = self.series.get(uid, {}).get(metric_name)
+
+        if series == None or len(series) == 0:
+            return None
+
+        now = time.time()
+        new_value = get_numeric_value(series[-1][1])
+        first_timestamp = series[0][0]
+
+        if new_value == None:
+            return None
+
+        start = max(now - duration, first_timestamp)
+        old_value = get_numeric_value(self.get_value_at(uid, metric_name, start))
+
+        if old_value == None or now <= start:
+            return None
+
+        delta = new_value - old_value
+
+        return delta, delta * 60.0 / (now - start)
+
+    def get_rows(self, names):
+        rows = []
+
+        for uid, metrics in self.series.items():
+            for metric_name, series in metrics.items():
+                for timestamp, value in series:
+                    rows.append((timestamp, uid, names.get(uid, ''), metric_name, value))
+
+        rows.sort()
+
+        return [[datetime.fromtimestamp(timestamp).isoformat(), uid, name, metric_name, str(value)]
+                for timestamp, uid, name, metric_name, value in rows]
+
+class HealthPoller(QObject):
+    """
+    Polls the health metric values of all devices. Instead of querying all
+    devices at once every second, the requests are spread over the interval
+    and only POLL_STACK_BUDGET requests are in flight per stack at any time.
+    """
+
+    def __init__(self, parent, values_callback, error_callback):
+        super().__init__(parent)
+
+        self.values_callback = values_callback
+        self.error_callback = error_callback
+        self.stacks = {} # by uid: uid of the device at the stack root
+        self.next_due = {} # by uid: time.monotonic() of the next request
+        self.in_flight = {} # by stack uid: number of requests
+        self.pending = {} # by uid: stack uid of the outstanding request
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.poll)
+        self.timer.setInterval(POLL_TICK_INTERVAL)
+
+    def set_devices(self, stacks):
+        now = time.monotonic()
+        new_uids = [uid for uid in stacks if uid not in self.next_due]
+        next_due = {}
+
+        for uid in stacks:
+            if uid in self.next_due:
+                next_due[uid] = self.next_due[uid]
+
+        # spread the first requests of new devices over the interval
+        for i, uid in enumerate(new_uids):
+            next_due[uid] = now + i * POLL_INTERVAL / len(new_uids)
+
+        self.stacks = dict(stacks)
+        self.next_due = next_due
+
+    def start(self):
+        self.timer.start()
+        self.poll()
+
+    def stop(self):
+        self.timer.stop()
+
+    def poll(self):
+        now = time.monotonic()
+        due = sorted((timestamp, uid) for uid, timestamp in self.next_due.items()
+                     if timestamp <= now and uid not in self.pending)
+
+        for _, uid in due:
+            stack_uid = self.stacks[uid]
+
+            if self.in_flight.get(stack_uid, 0) >= POLL_STACK_BUDGET:
+                continue
+
+            info = inventory.get_info(uid)
+
+            if info == None or info.plugin == None:
+                self.next_due[uid] = now + POLL_INTERVAL
+                continue
+
+            self.in_flight[stack_uid] = self.in_flight.get(stack_uid, 0) + 1
+            self.pending[uid] = stack_uid
+
+            async_call(info.plugin.get_health_metric_values, None,
+                       lambda metric_values, uid=uid: self.request_done(uid, metric_values),
+                       lambda uid=uid: self.request_done(uid, None))
+
+    def request_done(self, uid, metric_values):
+        stack_uid = self.pending.pop(uid, None)
+
+        if stack_uid != None:
+            self.in_flight[stack_uid] -= 1
+
+        if uid in self.next_due:
+            self.next_due[uid] = max(self.next_due[uid] + POLL_INTERVAL, time.monotonic())
+
+        if uid not in self.stacks:
+            return
+
+        if metric_values == None:
+            self.error_callback(uid)
+        else:
+            self.values_callback(uid, metric_values)
 
 class HealthMonitorWindow(QDialog, Ui_HealthMonitor):
     def __init__(self, parent):
@@ -47,12 +234,16 @@ class HealthMonitorWindow(QDialog, Ui_HealthMonitor):
         self.ipcon_available = False
 
         self.button_save_report_to_csv_file.clicked.connect(self.save_report_to_csv_file)
+        self.button_save_history_to_csv_file.clicked.connect(self.save_history_to_csv_file)
         self.button_close.clicked.connect(self.hide)
 
         self.fixed_column_names = ['Name', 'UID', 'Position', 'FW Version', 'Metric Errors']
         self.dynamic_column_names = []
         self.metric_errors = {} # by uid
         self.old_values = {} # by uid, by metric name
+        self.metric_items = {} # by uid, by metric name
+        self.history = MetricHistory()
+        self.poller = HealthPoller(self, self.get_health_metric_values_async, self.get_health_metric_values_error)
 
         self.tree_view_model = QStandardItemModel(self)
 
@@ -69,14 +260,19 @@ class HealthMonitorWindow(QDialog, Ui_HealthMonitor):
 
         inventory.info_changed.connect(lambda: self.delayed_refresh_tree_view_timer.start())
 
-        self.update_metric_values_timer = QTimer(self)
-        self.update_metric_values_timer.timeout.connect(lambda: self.update_metric_values())
-        self.update_metric_values_timer.setInterval(1000)
-        self.update_metric_values_timer.start()
-
         self.refresh_tree_view()
         self.update_ui_state()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+
+        self.poller.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+
+        self.poller.stop()
+
     def delayed_refresh_tree_view(self):
         self.delayed_refresh_tree_view_timer.stop()
 
@@ -91,9 +287,11 @@ class HealthMonitorWindow(QDialog, Ui_HealthMonitor):
         self.tree_view_model.setHorizontalHeaderLabels(self.fixed_column_names)
 
         self.dynamic_column_names = []
+        self.metric_items = {}
+        stacks = {}
         column_offset = len(self.fixed_column_names)
 
-        def create_and_append_row(info, parent):
+        def create_and_append_row(info, parent, stack_uid):
             try:
                 metric_names = info.plugin.get_health_metric_names()
             except:
@@ -112,6 +310,8 @@ class HealthMonitorWindow(QDialog, Ui_HealthMonitor):
                    fw_version,
                    QStandardItem(str(self.metric_errors.get(info.uid, 0)))]
 
+            items = {'Metric Errors': row[self.fixed_column_names.index('Metric Errors')]}
+
             for metric_name in metric_names:
                 try:
                     i = self.dynamic_column_names.index(metric_name)
@@ -126,6 +326,7 @@ class HealthMonitorWindow(QDialog, Ui_HealthMonitor):
                     row.append(QStandardItem())
 
                 item = row[column_offset + i]
+                items[metric_name] = item
 
                 old_timestamp, old_value = self.old_values.get(info.uid, {}).get(metric_name, (None, None))
 
@@ -143,16 +344,19 @@ class HealthMonitorWindow(QDialog, Ui_HealthMonitor):
 
             parent.appendRow(row)
 
+            self.metric_items[info.uid] = items
+            stacks[info.uid] = stack_uid
+
             return row
 
-        def recurse_on_device(info, parent):
+        def recurse_on_device(info, parent, stack_uid):
             if not isinstance(info, DeviceInfo):
                 return
 
-            row = create_and_append_row(info, parent)
+            row = create_and_append_row(info, parent, stack_uid)
 
             for child in info.connections_values():
-                recurse_on_device(child, row[0])
+                recurse_on_device(child, row[0], stack_uid)
 
         for info in inventory.get_infos():
             if not isinstance(info, DeviceInfo):
@@ -162,10 +366,10 @@ class HealthMonitorWindow(QDialog, Ui_HealthMonitor):
             if info.reverse_connection != None:
                 continue
 
-            row = create_and_append_row(info, self.tree_view_model)
+            row = create_and_append_row(info, self.tree_view_model, info.uid)
 
             for child in info.connections_values():
-                recurse_on_device(child, row[0])
+                recurse_on_device(child, row[0], info.uid)
 
         self.tree_view.setAnimated(False)
         self.tree_view.expandAll()
@@ -176,45 +380,23 @@ class HealthMonitorWindow(QDialog, Ui_HealthMonitor):
         self.tree_view.header().setStretchLastSection(False)
         self.tree_view.header().setSectionResizeMode(QHeaderView.ResizeToContents)
 
-        self.update_metric_values()
+        self.poller.set_devices(stacks)
 
-    def get_health_metric_values_async(self, uid, index, metric_values):
-        if self.tree_view_model.itemFromIndex(index) == None:
-            # FIXME: item was removed in the meantime?
-            return
-
-        column_offset = len(self.fixed_column_names)
+    def get_health_metric_values_async(self, uid, metric_values):
+        items = self.metric_items.get(uid, {})
 
         for metric_name, metric_value in metric_values.items():
-            try:
-                i = self.dynamic_column_names.index(metric_name)
-            except:
-                # FIXME: column for this metric was removed in the meantime?
-                continue
+            self.history.add(uid, metric_name, metric_value)
 
-            sibling = index.sibling(index.row(), column_offset + i)
-
-            if not sibling.isValid():
-                # FIXME: item for this metric was removed in the meantime?
-                continue
-
-            item = self.tree_view_model.itemFromIndex(sibling)
+            item = items.get(metric_name)
 
             if item == None:
-                # FIXME: item for this metric was removed in the meantime?
+                # FIXME: column for this metric was removed in the meantime?
                 continue
 
             self.update_item_text(uid, item, metric_name, metric_value)
 
-        metric_name = 'Metric Errors'
-        sibling = index.sibling(index.row(), self.fixed_column_names.index(metric_name))
-        item = self.tree_view_model.itemFromIndex(sibling)
-
-        if item == None:
-            # FIXME: item was removed in the meantime?
-            return
-
-        self.update_item_text(uid, item, metric_name, self.metric_errors.get(uid, 0))
+        self.update_metric_errors(uid)
 
     def update_item_text(self, uid, item, metric_name, new_value):
         new_timestamp = time.monotonic()
@@ -242,56 +424,35 @@ class HealthMonitorWindow(QDialog, Ui_HealthMonitor):
                 font.setBold(False)
                 item.setFont(font)
 
-    def get_health_metric_values_error(self, uid, index):
+        rate = self.history.get_rate(uid, metric_name)
+
+        if rate != None:
+            tool_tip = 'Change in the last {0:.0f} seconds: {1:+} ({2:.1f} per minute)'.format(RATE_DURATION, rate[0], rate[1])
+
+            if item.toolTip() != tool_tip:
+                item.setToolTip(tool_tip)
+
+    def get_health_metric_values_error(self, uid):
         if uid in self.metric_errors:
             self.metric_errors[uid] += 1
         else:
             self.metric_errors[uid] = 1
 
-        if self.tree_view_model.itemFromIndex(index) == None:
-            # FIXME: item was removed in the meantime?
-            return
+        self.update_metric_errors(uid)
 
+    def update_metric_errors(self, uid):
         metric_name = 'Metric Errors'
-        sibling = index.sibling(index.row(), self.fixed_column_names.index(metric_name))
-        item = self.tree_view_model.itemFromIndex(sibling)
+        metric_errors = self.metric_errors.get(uid, 0)
 
-        if item == None:
-            # FIXME: item was removed in the meantime?
-            return
+        self.history.add(uid, metric_name, metric_errors)
 
-        self.update_item_text(uid, item, metric_name, self.metric_errors[uid])
+        item = self.metric_items.get(uid, {}).get(metric_name)
 
-    def update_metric_values(self, parent=None):
-        if not self.isVisible():
+        if item == None:
+            # FIXME: item was removed in the meantime?
             return
 
-        self.update_metric_values_timer.stop()
-
-        if parent == None:
-            parent = self.tree_view_model.invisibleRootItem()
-
-        def make_async_call(info, uid, index):
-            async_call(info.plugin.get_health_metric_values, None,
-                       lambda metric_values: self.get_health_metric_values_async(uid, index, metric_values),
-                       lambda: self.get_health_metric_values_error(uid, index))
-
-        # FIXME: avoid getter burst!
-        for r in range(parent.rowCount()):
-            child = parent.child(r, 0)
-            index = child.index()
-            uid = parent.child(r, 1).text()
-            info = inventory.get_info(uid)
-
-            if info == None:
-                # FIXME: unknown UID, remove row or mark it as broken?
-                continue
-
-            make_async_call(info, uid, index)
-
-            self.update_metric_values(parent=child)
-
-        async_call(lambda: None, None, self.update_metric_values_timer.start, None)
+        self.update_item_text(uid, item, metric_name, metric_errors)
 
     def collect_metric_values(self, parent=None, indent=''):
         if parent == None:
@@ -354,6 +515,31 @@ class HealthMonitorWindow(QDialog, Ui_HealthMonitor):
                                  'Could not save report to CSV file:\n\n' + str(e),
                                  QMessageBox.Ok)
 
+    def save_history_to_csv_file(self):
+        date = datetime.now().replace(microsecond=0).isoformat().replace('T', '_').replace(':', '-')
+        filename = get_save_file_name(self, 'Save History To CSV File', os.path.join(get_home_path(), 'brickv_health_history_{0}.csv'.format(date)))
+
+        if len(filename) == 0:
+            return
+
+        names = {}
+
+        for uid in self.history.series:
+            info = inventory.get_info(uid)
+
+            if info != None:
+                names[uid] = info.name
+
+        rows = [['Time', 'UID', 'Name', 'Metric', 'Value']] + self.history.get_rows(names)
+
+        try:
+            with open(filename, 'w', newline='') as f:
+                csv.writer(f).writerows(rows)
+        except Exception as e:
+            QMessageBox.critical(self, 'Save History To CSV File',
+                                 'Could not save history to CSV file:\n\n' + str(e),
+                                 QMessageBox.Ok)
+
     def update_ui_state(self):
         pass
 
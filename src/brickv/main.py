@@ -85,6 +85,7 @@ except:
 
 from brickv import config
 from brickv.async_call import ASYNC_EVENT, async_event_handler
+from brickv.profiler import profiler
 from brickv.load_pixmap import load_pixmap
 from brickv.ui_errorreporter import Ui_ErrorReporter
 from brickv.utils import get_save_file_name, get_home_path
@@ -246,8 +247,28 @@ class BrickViewer(QApplication):
         if event.type() > QEvent.User and event.type() == ASYNC_EVENT:
             async_event_handler()
 
+        if profiler.enabled and event.type() == QEvent.Paint:
+            start = time.monotonic()
+
+            try:
+                return QApplication.notify(self, receiver, event)
+            finally:
+                profiler.record('Paint', self.get_paint_owner_name(receiver), time.monotonic() - start)
+
         return QApplication.notify(self, receiver, event)
 
+    # paint time is attributed to the plugin that contains the widget
+    def get_paint_owner_name(self, widget):
+        from brickv.plugin_system.plugin_base import PluginBase
+
+        while widget != None:
+            if isinstance(widget, PluginBase):
+                return '{0} [{1}]'.format(widget.base_name, widget.device_info.uid)
+
+            widget = widget.parent()
+
+        return 'Other'
+
 class ErrorReporter(QMainWindow, Ui_ErrorReporter):
     def closeEvent(self, event):
         QApplication.exit(int(self.check_show_again.isChecked()))
@@ -24,15 +24,21 @@ Boston, MA 02111-1307, USA.
 import os
 
 from PyQt5.QtCore import pyqtSignal, QTimer
-from PyQt5.QtWidgets import QMessageBox, QTreeWidgetItem, QAction
+from PyQt5.QtWidgets import QMessageBox, QAction
 
 from brickv.plugin_system.comcu_plugin_base import COMCUPluginBase
 from brickv.bindings.bricklet_can_v2 import BrickletCANV2, GetReadFilterConfiguration
 from brickv.plugin_system.plugins.can_v2.ui_can_v2 import Ui_CANV2
+from brickv.plugin_system.plugins.can_v2.frame_trace import FrameTraceModel, format_frame
 from brickv.async_call import async_call
 from brickv.hex_validator import HexValidator
 from brickv.utils import get_main_window, get_home_path, get_save_file_name
 
+HISTORY_CAPACITY = 100000 # frames
+HISTORY_UPDATE_INTERVAL = 50 # milliseconds
+HISTORY_FILTER_DELAY = 300 # milliseconds, the filter is applied once typing paused
+HISTORY_HEADER = 'Frame Type;Identifier [Hex];Data [Hex];Length\n'
+
 class CANV2(COMCUPluginBase, Ui_CANV2):
     qtcb_frame_read = pyqtSignal(int, int, object)
 
@@ -51,6 +57,32 @@ class CANV2(COMCUPluginBase, Ui_CANV2):
 
         self.frame_read_callback_was_enabled = None
 
+        # received frames are kept in a fixed-size ring buffer and shown in
+        # batches, so that a busy bus neither grows the memory usage without
+        # bound nor blocks the GUI with one update per frame
+        self.trace_model = FrameTraceModel(HISTORY_CAPACITY, self)
+        self.tree_frames.setModel(self.trace_model)
+
+        self.trace_update_timer = QTimer(self)
+        self.trace_update_timer.timeout.connect(self.update_trace)
+        self.trace_update_timer.setInterval(HISTORY_UPDATE_INTERVAL)
+
+        self.stream_file = None
+        self.stream_lines = []
+        self.last_stream_filename = os.path.join(get_home_path(), 'can_bricklet_v2_stream.log')
+
+        # applying the filter rescans the whole history, don't do this for
+        # every keystroke
+        self.trace_filter_timer = QTimer(self)
+        self.trace_filter_timer.setSingleShot(True)
+        self.trace_filter_timer.setInterval(HISTORY_FILTER_DELAY)
+        self.trace_filter_timer.timeout.connect(self.apply_trace_filter)
+
+        self.edit_filter_identifier.textChanged.connect(self.trace_filter_changed)
+        self.edit_filter_data.textChanged.connect(self.trace_filter_changed)
+        self.check_aggregate.toggled.connect(self.trace_aggregate_toggled)
+        self.check_stream_history.toggled.connect(self.stream_history_toggled)
+
         self.tree_frames.header().resizeSection(0, 150)
         self.tree_frames.header().resizeSection(1, 170)
         self.tree_frames.header().resizeSection(2, 300)
@@ -78,7 +110,7 @@ class CANV2(COMCUPluginBase, Ui_CANV2):
         self.spin_filter_identifier.valueChanged.connect(self.read_filter_configuration_changed)
 
         self.button_write_frame.clicked.connect(self.write_frame)
-        self.button_clear_history.clicked.connect(self.tree_frames.clear)
+        self.button_clear_history.clicked.connect(self.trace_model.clear)
         self.button_save_history.clicked.connect(self.save_history)
         self.button_save_transceiver_configuration.clicked.connect(self.save_transceiver_configuration)
         self.button_reset_transceiver_configuration.clicked.connect(self.reset_transceiver_configuration)
@@ -142,15 +174,18 @@ class CANV2(COMCUPluginBase, Ui_CANV2):
 
         self.update_error_log()
         self.error_log_timer.start()
+        self.trace_update_timer.start()
 
     def stop(self):
         self.error_log_timer.stop()
+        self.trace_update_timer.stop()
+        self.update_trace()
 
         if self.frame_read_callback_was_enabled == False: # intentionally check for False to distinguish from None
             async_call(self.can.set_frame_read_callback_configuration, False, None, self.increase_error_count)
 
     def destroy(self):
-        pass
+        self.stop_stream_history()
 
     @staticmethod
     def has_device_identifier(device_identifier):
@@ -179,35 +214,91 @@ class CANV2(COMCUPluginBase, Ui_CANV2):
             self.error_led_show_error_action.trigger()
 
     def cb_frame_read(self, frame_type, identifier, data):
-        length = len(data)
-        parts = []
-        max_length = 0
-
-        if frame_type == self.can.FRAME_TYPE_STANDARD_DATA:
-            parts.append('Standard Data')
-            max_length = 8
-        elif frame_type == self.can.FRAME_TYPE_STANDARD_REMOTE:
-            parts.append('Standard Remote')
-        elif frame_type == self.can.FRAME_TYPE_EXTENDED_DATA:
-            parts.append('Extended Data')
-            max_length = 8
-        elif frame_type == self.can.FRAME_TYPE_EXTENDED_REMOTE:
-            parts.append('Extended Remote')
-        else:
-            parts.append('Unknown')
+        self.trace_model.add_frame(frame_type, identifier, data)
+
+        if self.stream_file != None:
+            self.stream_lines.append(';'.join(format_frame(frame_type, identifier, len(data), data)) + '\n')
+
+            if len(self.stream_lines) >= 10000:
+                self.write_stream_lines()
 
-        parts.append(self.spin_identifier.textFromValue(identifier))
-        parts.append(' '.join(['%02X' % c for c in data[:min(length, max_length)]]))
-        parts.append(str(length))
+    def update_trace(self):
+        self.write_stream_lines()
 
         scroll_bar = self.tree_frames.verticalScrollBar()
         at_bottom = scroll_bar.value() == scroll_bar.maximum()
 
-        self.tree_frames.addTopLevelItem(QTreeWidgetItem(parts))
-
-        if at_bottom:
+        if self.trace_model.flush() and at_bottom:
             self.tree_frames.scrollToBottom()
 
+    def trace_filter_changed(self):
+        self.trace_filter_timer.start()
+
+    def apply_trace_filter(self):
+        self.trace_model.set_filter(self.edit_filter_identifier.text(), self.edit_filter_data.text())
+
+    def trace_aggregate_toggled(self, aggregate):
+        self.trace_model.set_aggregate(aggregate)
+
+    def stream_history_toggled(self, enabled):
+        if not enabled:
+            self.stop_stream_history()
+            return
+
+        filename = get_save_file_name(get_main_window(), 'Stream History', self.last_stream_filename)
+
+        if len(filename) == 0:
+            self.check_stream_history.setChecked(False)
+            return
+
+        self.last_stream_filename = filename
+
+        try:
+            self.stream_file = open(filename, 'w')
+            self.stream_file.write(HISTORY_HEADER)
+        except OSError as e:
+            self.stream_file = None
+            self.check_stream_history.setChecked(False)
+
+            QMessageBox.critical(get_main_window(), 'Stream History Error',
+                                 'Could not open {0} for writing:\n\n{1}'.format(filename, e))
+
+    def write_stream_lines(self):
+        if self.stream_file == None or len(self.stream_lines) == 0:
+            return
+
+        lines = self.stream_lines
+        self.stream_lines = []
+
+        try:
+            self.stream_file.write(''.join(lines))
+        except Exception as e:
+            filename = self.stream_file.name
+
+            self.check_stream_history.setChecked(False)
+
+            QMessageBox.critical(get_main_window(), 'Stream History Error',
+                                 'Could not write to {0}:\n\n{1}'.format(filename, e))
+
+    def stop_stream_history(self):
+        if self.stream_file == None:
+            return
+
+        stream_file = self.stream_file
+        self.stream_file = None
+        lines = self.stream_lines
+        self.stream_lines = []
+
+        try:
+            stream_file.write(''.join(lines))
+        except:
+            pass
+
+        try:
+            stream_file.close()
+        except:
+            pass
+
     def get_frame_read_callback_configuration_async(self, enabled):
         self.frame_read_callback_was_enabled = enabled
 
@@ -355,20 +446,24 @@ class CANV2(COMCUPluginBase, Ui_CANV2):
                                  'Could not open {0} for writing:\n\n{1}'.format(filename, e))
             return
 
-        root = self.tree_frames.invisibleRootItem()
-        content = ['Frame Type;Identifier [Hex];Data [Hex];Length\n']
+        if self.trace_model.aggregate:
+            header = HISTORY_HEADER.replace('\n', ';Count\n')
+        else:
+            header = HISTORY_HEADER
 
-        for i in range(root.childCount()):
-            child = root.child(i)
-            row = []
+        try:
+            f.write(header)
 
-            for c in range(child.columnCount()):
-                row.append(child.text(c))
+            # write in chunks instead of building the whole content in memory
+            content = []
 
-            content.append(';'.join(row) + '\n')
+            for row in self.trace_model.iter_rows():
+                content.append(';'.join(row) + '\n')
+
+                if len(content) >= 10000:
+                    f.write(''.join(content))
+                    content = []
 
-        try:
-            # FIXME: add progress dialog if content is bigger than some megabytes
             f.write(''.join(content))
         except Exception as e:
             QMessageBox.critical(get_main_window(), 'Save History Error',
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+CAN V2 Plugin
+Copyright (C) 2026 Matthias Bolte <matthias@tinkerforge.com>
+
+frame_trace.py: Bounded CAN frame trace model
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import struct
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from brickv.bindings.bricklet_can_v2 import BrickletCANV2
+from brickv.spin_box_hex import format_hex_blocks
+
+FRAME_TYPE_NAMES = {
+    BrickletCANV2.FRAME_TYPE_STANDARD_DATA: 'Standard Data',
+    BrickletCANV2.FRAME_TYPE_STANDARD_REMOTE: 'Standard Remote',
+    BrickletCANV2.FRAME_TYPE_EXTENDED_DATA: 'Extended Data',
+    BrickletCANV2.FRAME_TYPE_EXTENDED_REMOTE: 'Extended Remote'
+}
+
+DATA_FRAME_TYPES = [BrickletCANV2.FRAME_TYPE_STANDARD_DATA, BrickletCANV2.FRAME_TYPE_EXTENDED_DATA]
+
+# frame type, identifier, length, data
+RECORD_FORMAT = struct.Struct('<BIB8s')
+
+# same format as the SpinBoxHex identifier input
+def format_identifier(identifier):
+    return format_hex_blocks(identifier)
+
+def format_frame(frame_type, identifier, length, data):
+    if frame_type in DATA_FRAME_TYPES:
+        data_str = ' '.join(['%02X' % c for c in data[:min(length, 8)]])
+    else:
+        data_str = ''
+
+    return [FRAME_TYPE_NAMES.get(frame_type, 'Unknown'), format_identifier(identifier), data_str, str(length)]
+
+class FrameRingBuffer:
+    """
+    Fixed-capacity buffer of packed frame records. Every frame gets a
+    sequence number, once the buffer is full the oldest frames are
+    overwritten and their sequence numbers become invalid.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.records = bytearray(capacity * RECORD_FORMAT.size)
+        self.next_seq = 0
+
+    def clear(self):
+        self.next_seq = 0
+
+    def first_seq(self):
+        return max(0, self.next_seq - self.capacity)
+
+    def append(self, frame_type, identifier, data):
+        seq = self.next_seq
+        length = len(data)
+
+        RECORD_FORMAT.pack_into(self.records, (seq % self.capacity) * RECORD_FORMAT.size,
+                                frame_type, identifier, length, bytes(data[:8]))
+
+        self.next_seq += 1
+
+        return seq
+
+    # returns (frame_type, identifier, length, data) or None if the frame
+    # was already overwritten
+    def get(self, seq):
+        if seq < self.first_seq() or seq >= self.next_seq:
+            return None
+
+        return RECORD_FORMAT.unpack_from(self.records, (seq % self.capacity) * RECORD_FORMAT.size)
+
+class FrameTraceModel(QAbstractTableModel):
+    HEADERS = ['Frame Type', 'Identifier [Hex]', 'Data [Hex]', 'Length']
+    AGGREGATE_HEADERS = HEADERS + ['Count']
+
+    def __init__(self, capacity, parent=None):
+        super().__init__(parent)
+
+        self.frames = FrameRingBuffer(capacity)
+        self.visible = [] # sequence numbers of the frames shown as rows
+        self.pending = [] # sequence numbers received since the last flush
+        self.aggregate = False
+        self.aggregate_rows = [] # identifiers shown as rows
+        self.aggregate_frames = {} # identifier -> [last frame, count]
+        self.aggregate_changed = False
+        self.identifier_filter = ''
+        self.data_filter = ''
+
+    # Qt model interface
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        if self.aggregate:
+            return len(self.aggregate_rows)
+
+        return len(self.visible)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        if self.aggregate:
+            return len(self.AGGREGATE_HEADERS)
+
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            if self.aggregate:
+                return self.AGGREGATE_HEADERS[section]
+
+            return self.HEADERS[section]
+
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+
+        row = self.get_row(index.row())
+
+        if row == None:
+            return None
+
+        return row[index.column()]
+
+    # trace interface
+    def get_row(self, row):
+        if self.aggregate:
+            if row >= len(self.aggregate_rows):
+                return None
+
+            frame, count = self.aggregate_frames[self.aggregate_rows[row]]
+
+            return format_frame(*frame) + [str(count)]
+
+        if row >= len(self.visible):
+            return None
+
+        frame = self.frames.get(self.visible[row])
+
+        if frame == None:
+            return None
+
+        return format_frame(*frame)
+
+    def iter_rows(self):
+        for row in range(self.rowCount()):
+            values = self.get_row(row)
+
+            if values != None:
+                yield values
+
+    def add_frame(self, frame_type, identifier, data):
+        self.pending.append(self.frames.append(frame_type, identifier, data))
+
+        # without regular flushes only the last capacity frames can be shown
+        if len(self.pending) > 2 * self.frames.capacity:
+            del self.pending[:-self.frames.capacity]
+
+        entry = self.aggregate_frames.get(identifier)
+        frame = (frame_type, identifier, len(data), bytes(data[:8]))
+
+        if entry == None:
+            self.aggregate_frames[identifier] = [frame, 1]
+        else:
+            entry[0] = frame
+            entry[1] += 1
+
+        self.aggregate_changed = True
+
+    def matches_filter(self, frame):
+        if frame == None:
+            return False
+
+        values = format_frame(*frame)
+
+        if len(self.identifier_filter) > 0 and self.identifier_filter not in values[1].replace(' ', ''):
+            return False
+
+        if len(self.data_filter) > 0 and self.data_filter not in values[2].replace(' ', ''):
+            return False
+
+        return True
+
+    def has_filter(self):
+        return len(self.identifier_filter) > 0 or len(self.data_filter) > 0
+
+    def set_filter(self, identifier_filter, data_filter):
+        self.identifier_filter = identifier_filter.replace(' ', '').upper()
+        self.data_filter = data_filter.replace(' ', '').upper()
+
+        self.rebuild()
+
+    def set_aggregate(self, aggregate):
+        self.aggregate = aggregate
+
+        self.rebuild()
+
+    def clear(self):
+        self.beginResetModel()
+
+        self.frames.clear()
+        self.visible = []
+        self.pending = []
+        self.aggregate_rows = []
+        self.aggregate_frames = {}
+        self.aggregate_changed = False
+
+        self.endResetModel()
+
+    def get_aggregate_rows(self):
+        return sorted(identifier for identifier, (frame, count) in self.aggregate_frames.items()
+                      if self.matches_filter(frame))
+
+    def rebuild(self):
+        self.beginResetModel()
+
+        if self.has_filter():
+            self.visible = [seq for seq in range(self.frames.first_seq(), self.frames.next_seq)
+                            if self.matches_filter(self.frames.get(seq))]
+        else:
+            self.visible = list(range(self.frames.first_seq(), self.frames.next_seq))
+
+        self.pending = []
+        self.aggregate_rows = self.get_aggregate_rows()
+        self.aggregate_changed = False
+
+        self.endResetModel()
+
+    # called once per display tick, publishes all frames received since the
+    # last call. returns True if rows were added or changed
+    def flush(self):
+        if self.aggregate:
+            return self.flush_aggregate()
+
+        # drop the rows of overwritten frames
+        first_seq = self.frames.first_seq()
+        dropped = 0
+
+        while dropped < len(self.visible) and self.visible[dropped] < first_seq:
+            dropped += 1
+
+        if dropped > 0:
+            self.beginRemoveRows(QModelIndex(), 0, dropped - 1)
+            del self.visible[:dropped]
+            self.endRemoveRows()
+
+        pending = [seq for seq in self.pending if seq >= first_seq]
+        self.pending = []
+
+        if self.has_filter():
+            pending = [seq for seq in pending if self.matches_filter(self.frames.get(seq))]
+
+        if len(pending) == 0:
+            return dropped > 0
+
+        self.beginInsertRows(QModelIndex(), len(self.visible), len(self.visible) + len(pending) - 1)
+        self.visible += pending
+        self.endInsertRows()
+
+        return True
+
+    def flush_aggregate(self):
+        self.pending = []
+
+        if not self.aggregate_changed:
+            return False
+
+        self.aggregate_changed = False
+        aggregate_rows = self.get_aggregate_rows()
+
+        if aggregate_rows != self.aggregate_rows:
+            self.beginResetModel()
+            self.aggregate_rows = aggregate_rows
+            self.endResetModel()
+        elif len(aggregate_rows) > 0:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(aggregate_rows) - 1, self.columnCount() - 1))
+
+        return True
@@ -29,6 +29,7 @@ from brickv.async_call import async_call
 from brickv.plugin_system.plugins.e_paper_296x128.ui_e_paper_296x128 import Ui_EPaper296x128
 from brickv.bindings.bricklet_e_paper_296x128 import BrickletEPaper296x128
 from brickv.scribblewidget import ScribbleWidget
+from brickv.framebuffer import FrameBuffer, image_to_pixels, pixels_to_image
 
 WIDTH = 296
 HEIGHT = 128
@@ -42,6 +43,8 @@ class EPaper296x128(COMCUPluginBase, Ui_EPaper296x128):
         self.epaper = self.device
 
         self.scribble_widget = ScribbleWidget(WIDTH, HEIGHT, 2, QColor(Qt.white), QColor(Qt.black), enable_grid=False)
+        self.frame_buffer_bw = FrameBuffer(WIDTH, HEIGHT)
+        self.frame_buffer_color = FrameBuffer(WIDTH, HEIGHT)
         self.image_button_layout.insertWidget(0, self.scribble_widget)
 
         self.draw_button.clicked.connect(self.draw_clicked)
@@ -70,6 +73,8 @@ class EPaper296x128(COMCUPluginBase, Ui_EPaper296x128):
 
     def fill_clicked(self, color):
         self.epaper.fill_display(color)
+        self.frame_buffer_bw.invalidate()
+        self.frame_buffer_color.invalidate()
         self.start()
 
     def send_clicked(self):
@@ -81,43 +86,45 @@ class EPaper296x128(COMCUPluginBase, Ui_EPaper296x128):
         text  = self.text_edit.text()
 
         self.epaper.draw_text(pos_x, pos_y, font, color, orien, text)
+        self.frame_buffer_bw.invalidate()
+        self.frame_buffer_color.invalidate()
         self.start()
 
     def draw_clicked(self):
-        bw = [False] * WIDTH * HEIGHT
-        red = [False] * WIDTH * HEIGHT
+        image = self.scribble_widget.image()
+        bw = image_to_pixels(image, [Qt.white])
+        red = image_to_pixels(image, [Qt.red, Qt.darkGray])
 
-        for i in range(HEIGHT):
-            for j in range(WIDTH):
-                if QColor(self.scribble_widget.image().pixel(j, i)) == Qt.white:
-                    bw[i * WIDTH + j] = True
+        try:
+            for x0, y0, x1, y1, data in self.frame_buffer_bw.get_changes(bw):
+                self.epaper.write_black_white(x0, y0, x1, y1, data)
 
-                if QColor(self.scribble_widget.image().pixel(j, i)) in (Qt.red, Qt.darkGray):
-                    red[i * WIDTH + j] = True
+            for x0, y0, x1, y1, data in self.frame_buffer_color.get_changes(red):
+                self.epaper.write_color(x0, y0, x1, y1, data)
+        except:
+            self.frame_buffer_bw.invalidate()
+            self.frame_buffer_color.invalidate()
+            raise
 
-        self.epaper.write_black_white(0, 0, WIDTH - 1, HEIGHT - 1, bw)
-        self.epaper.write_color(0, 0, WIDTH - 1, HEIGHT - 1, red)
         self.epaper.draw()
 
     def read_black_white_async(self, pixels):
-        for i in range(HEIGHT):
-            for j in range(WIDTH):
-                if pixels[i * WIDTH + j]:
-                    self.scribble_widget.image().setPixel(j, i, 0xFFFFFF)
-                else:
-                    self.scribble_widget.image().setPixel(j, i, 0)
+        self.frame_buffer_bw.set_pixels(pixels)
+
+        pixels_to_image(self.scribble_widget.image(), pixels, 0xFFFFFF, 0)
 
         async_call(self.epaper.read_color, (0, 0, WIDTH - 1, HEIGHT - 1), self.read_color_async, self.increase_error_count)
 
     def read_color_async(self, pixels):
         if pixels:
-            for i in range(HEIGHT):
-                for j in range(WIDTH):
-                    if pixels[i * WIDTH + j]:
-                        if self.display_type == self.epaper.DISPLAY_TYPE_BLACK_WHITE_RED:
-                            self.scribble_widget.image().setPixel(j, i, 0xFF0000)
-                        else:
-                            self.scribble_widget.image().setPixel(j, i, 0x808080)
+            self.frame_buffer_color.set_pixels(pixels)
+
+            if self.display_type == self.epaper.DISPLAY_TYPE_BLACK_WHITE_RED:
+                color = 0xFF0000
+            else:
+                color = 0x808080
+
+            pixels_to_image(self.scribble_widget.image(), pixels, color)
 
         self.scribble_widget.update()
 
@@ -32,6 +32,7 @@ from brickv.plugin_system.plugins.lcd_128x64.ui_lcd_128x64 import Ui_LCD128x64
 from brickv.bindings.bricklet_lcd_128x64 import BrickletLCD128x64
 from brickv.callback_emulator import CallbackEmulator
 from brickv.scribblewidget import ScribbleWidget
+from brickv.framebuffer import FrameBuffer, image_to_pixels, pixels_to_image
 
 class TouchScribbleWidget(ScribbleWidget):
     def __init__(self, width, height, scaling_factor, foreground_color, background_color, outline_color=None, enable_grid=True, grid_color=None, parent=None):
@@ -102,6 +103,7 @@ class LCD128x64(COMCUPluginBase, Ui_LCD128x64):
         self.lcd = self.device
 
         self.scribble_widget = TouchScribbleWidget(128, 64, 5, QColor(Qt.black), QColor(Qt.white), enable_grid=False)
+        self.frame_buffer = FrameBuffer(128, 64)
         self.image_button_layout.insertWidget(0, self.scribble_widget)
 
         self.contrast_syncer = SliderSpinSyncer(self.contrast_slider, self.contrast_spin, lambda value: self.new_configuration(), spin_signal='valueChanged')
@@ -154,8 +156,11 @@ class LCD128x64(COMCUPluginBase, Ui_LCD128x64):
 
             self.lcd.write_line(j, 8, start + str(value + j) + ": " + chr(value + j) + '\0')
 
+        self.frame_buffer.invalidate()
+
     def clear_display_clicked(self):
         self.lcd.clear_display()
+        self.frame_buffer.set_pixels([False] * 128 * 64)
 
     def clear_clicked(self):
         self.scribble_widget.clear_image()
@@ -165,18 +170,24 @@ class LCD128x64(COMCUPluginBase, Ui_LCD128x64):
         pos = int(self.pos_combobox.currentText())
         text = self.text_edit.text()
         self.lcd.write_line(line, pos, text)
+        self.frame_buffer.invalidate()
 
     def draw_clicked(self):
-        data = []
+        pixels = image_to_pixels(self.scribble_widget.image(), [self.scribble_widget.foreground_color()])
+        changes = self.frame_buffer.get_changes(pixels)
+
+        if len(changes) == 0:
+            return
 
-        for i in range(64):
-            for j in range(128):
-                if QColor(self.scribble_widget.image().pixel(j, i)) == self.scribble_widget.foreground_color():
-                    data.append(True)
-                else:
-                    data.append(False)
+        def write_changes():
+            for x0, y0, x1, y1, data in changes:
+                self.lcd.write_pixels(x0, y0, x1, y1, data)
 
-        async_call(self.lcd.write_pixels, (0, 0, 127, 63, data), None, self.increase_error_count)
+        def cb_error():
+            self.frame_buffer.invalidate()
+            self.increase_error_count()
+
+        async_call(write_changes, None, None, cb_error)
 
     def get_display_configuration_async(self, conf):
         self.contrast_slider.setValue(conf.contrast)
@@ -184,12 +195,11 @@ class LCD128x64(COMCUPluginBase, Ui_LCD128x64):
         self.invert_checkbox.setChecked(conf.invert)
 
     def read_pixels_async(self, pixels):
-        for i in range(64):
-            for j in range(128):
-                if pixels[i * 128 + j]:
-                    self.scribble_widget.image().setPixel(j, i, self.scribble_widget.foreground_color().rgb())
-                else:
-                    self.scribble_widget.image().setPixel(j, i, self.scribble_widget.background_color().rgb())
+        self.frame_buffer.set_pixels(pixels)
+
+        pixels_to_image(self.scribble_widget.image(), pixels,
+                        self.scribble_widget.foreground_color(),
+                        self.scribble_widget.background_color())
 
         self.scribble_widget.update()
 
@@ -31,6 +31,7 @@ from brickv.slider_spin_syncer import SliderSpinSyncer
 from brickv.plugin_system.plugins.oled_128x64_v2.ui_oled_128x64_v2 import Ui_OLED128x64V2
 from brickv.bindings.bricklet_oled_128x64_v2 import BrickletOLED128x64V2
 from brickv.scribblewidget import ScribbleWidget
+from brickv.framebuffer import FrameBuffer, image_to_pixels, pixels_to_image
 
 class OLED128x64V2(COMCUPluginBase, Ui_OLED128x64V2):
     def __init__(self, *args):
@@ -41,6 +42,7 @@ class OLED128x64V2(COMCUPluginBase, Ui_OLED128x64V2):
         self.oled = self.device
 
         self.scribble_widget = ScribbleWidget(128, 64, 5, QColor(Qt.white), QColor(Qt.black), enable_grid=False)
+        self.frame_buffer = FrameBuffer(128, 64)
         self.image_button_layout.insertWidget(0, self.scribble_widget)
 
         self.contrast_syncer = SliderSpinSyncer(self.contrast_slider, self.contrast_spin, lambda value: self.new_configuration(), spin_signal='valueChanged')
@@ -78,8 +80,11 @@ class OLED128x64V2(COMCUPluginBase, Ui_OLED128x64V2):
                 start = " "
             async_call(self.oled.write_line, (j, 8, start + str(value + j) + ": " + chr(value + j) + '\0'), None, self.increase_error_count)
 
+        self.frame_buffer.invalidate()
+
     def clear_display_clicked(self):
         self.oled.clear_display()
+        self.frame_buffer.set_pixels([False] * 128 * 64)
 
     def clear_clicked(self):
         self.scribble_widget.clear_image()
@@ -89,30 +94,33 @@ class OLED128x64V2(COMCUPluginBase, Ui_OLED128x64V2):
         pos = int(self.pos_combobox.currentText())
         text = self.text_edit.text()
         self.oled.write_line(line, pos, text)
+        self.frame_buffer.invalidate()
 
     def draw_clicked(self):
-        data = []
+        pixels = image_to_pixels(self.scribble_widget.image(), [Qt.white])
+        changes = self.frame_buffer.get_changes(pixels)
+
+        if len(changes) == 0:
+            return
 
-        for i in range(64):
-            for j in range(128):
-                if QColor(self.scribble_widget.image().pixel(j, i)) == Qt.white:
-                    data.append(True)
-                else:
-                    data.append(False)
+        def write_changes():
+            for x0, y0, x1, y1, data in changes:
+                self.oled.write_pixels(x0, y0, x1, y1, data)
 
-        async_call(self.oled.write_pixels, (0, 0, 127, 63, data), None, self.increase_error_count)
+        def cb_error():
+            self.frame_buffer.invalidate()
+            self.increase_error_count()
+
+        async_call(write_changes, None, None, cb_error)
 
     def get_display_configuration_async(self, conf):
         self.contrast_slider.setValue(conf.contrast)
         self.invert_checkbox.setChecked(conf.invert)
 
     def read_pixels_async(self, pixels):
-        for i in range(64):
-            for j in range(128):
-                if pixels[i*128 + j]:
-                    self.scribble_widget.image().setPixel(j, i, 0xFFFFFF)
-                else:
-                    self.scribble_widget.image().setPixel(j, i, 0)
+        self.frame_buffer.set_pixels(pixels)
+
+        pixels_to_image(self.scribble_widget.image(), pixels, 0xFFFFFF, 0)
 
         self.scribble_widget.update()
 
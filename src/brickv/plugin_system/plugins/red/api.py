@@ -28,7 +28,7 @@ import sys
 import threading
 import time
 
-from PyQt5.QtCore import pyqtSignal, Qt, QObject, QTimer
+from PyQt5.QtCore import pyqtSignal, Qt, QObject
 
 from brickv.bindings.ip_connection import Error
 from brickv.bindings.brick_red import BrickRED
@@ -188,24 +188,135 @@ class REDBrick(BrickRED):
             self._active_callbacks = {}
 
 
+class REDSessionWorker(threading.Thread):
+    RETRY_INTERVAL = 1 # seconds
+
+    # sends the keep-alive requests of a session, so they are not delayed by a
+    # busy GUI thread. object releases are not sent from here, they have to
+    # reach the RED Brick in order with the requests that follow them
+    def __init__(self, brick, session_id, lifetime, keep_alive_interval, increase_error_count, report_state):
+        super().__init__(name='REDSessionWorker-{0}'.format(brick._uid_str))
+
+        self.daemon                = True
+        self._brick                = brick
+        self._session_id           = session_id
+        self._lifetime             = lifetime
+        self._keep_alive_interval  = keep_alive_interval
+        self._increase_error_count = increase_error_count
+        self._report_state         = report_state # MethodRef, don't keep the session alive
+        self._condition            = threading.Condition()
+        self._stopped              = False
+        self.last_keep_alive       = time.monotonic() # creating the session set the lifetime
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+
+            self._condition.notify()
+
+    def run(self):
+        next_keep_alive = self.last_keep_alive + self._keep_alive_interval
+
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    timeout = next_keep_alive - time.monotonic()
+
+                    if timeout <= 0:
+                        break
+
+                    self._condition.wait(timeout)
+
+                if self._stopped:
+                    return
+
+            next_keep_alive = self._keep_session_alive()
+
+            if next_keep_alive == None:
+                with self._condition:
+                    self._stopped = True
+
+                return
+
+    # returns the time of the next keep-alive or None if the session is lost
+    def _keep_session_alive(self):
+        try:
+            error_code = self._brick.keep_session_alive(self._session_id, self._lifetime)
+
+            if error_code == REDError.E_SUCCESS:
+                self.last_keep_alive = time.monotonic()
+        except Error:
+            # just report IPConnection-level error, but don't re-raise it
+            self._increase_error_count()
+
+        if self._stopped:
+            # session got expired during the keep-alive call
+            return None
+
+        now = time.monotonic()
+        age = now - self.last_keep_alive
+
+        if age > self._lifetime - self._keep_alive_interval * 2:
+            # could not keep session alive
+            self._set_state(REDSession.STATE_LOST)
+            return None
+
+        if age > self._keep_alive_interval:
+            # retry more often, the session expires if the deadline is missed
+            self._set_state(REDSession.STATE_AT_RISK)
+            return now + REDSessionWorker.RETRY_INTERVAL
+
+        self._set_state(REDSession.STATE_ALIVE)
+
+        return self.last_keep_alive + self._keep_alive_interval
+
+    def _set_state(self, state):
+        target, function = self._report_state.get()
+
+        if target != None and function != None:
+            function(target, self._session_id, state)
+
+
 class REDSession(QObject):
     KEEP_ALIVE_INTERVAL = 5 # seconds
     LIFETIME            = 60 # seconds
 
+    STATE_EXPIRED = 0
+    STATE_ALIVE   = 1
+    STATE_AT_RISK = 2 # keep-alive requests are failing
+    STATE_LOST    = 3
+
+    STATE_NAMES = {
+        STATE_EXPIRED: 'Expired',
+        STATE_ALIVE:   'Alive',
+        STATE_AT_RISK: 'At Risk',
+        STATE_LOST:    'Lost'
+    }
+
+    state_changed = pyqtSignal(int)
+    _qtcb_state = pyqtSignal(int, int) # emitted from the worker thread
     _qtcb_lost = pyqtSignal(str)
 
     def __init__(self, brick, increase_error_count):
         super().__init__()
 
+        self._qtcb_state.connect(self._cb_worker_state)
         self._qtcb_lost.connect(get_main_window().hack_to_remove_red_brick_tab)
 
         self._brick               = brick
         self._session_id          = None
-        self._keep_alive_timer    = QTimer(self)
-        self._last_keep_alive     = 0
+        self._worker              = None
+        self._state               = REDSession.STATE_EXPIRED
+        self._program_catalogue   = None
         self.increase_error_count = increase_error_count
 
-        self._keep_alive_timer.timeout.connect(self._keep_session_alive)
+        # string objects are immutable after allocation. cache their content by
+        # object ID as long as at least one REDString is attached to the object
+        # ID, because the RED Brick might reuse the object ID after the last
+        # reference to it was released
+        self._string_cache      = {}
+        self._string_cache_refs = {}
+        self._string_cache_lock = threading.Lock()
 
     def __del__(self):
         self.expire()
@@ -213,27 +324,24 @@ class REDSession(QObject):
     def __repr__(self):
         return '<REDSession session_id: {0}>'.format(self._session_id)
 
-    def _keep_session_alive(self):
-        if self._session_id == None:
-            # session is expired, don't keep it alive anymore longer
-            self._keep_alive_timer.stop()
-            return
+    # called from the worker thread, the state is changed in the GUI thread
+    def _report_worker_state(self, session_id, state):
+        self._qtcb_state.emit(session_id, state)
 
-        try:
-            error_code = self._brick.keep_session_alive(self._session_id, REDSession.LIFETIME)
-            self._last_keep_alive = time.monotonic()
-        except Error:
-            # just report IPConnection-level error, but don't re-raise it
-            self.increase_error_count()
+    def _cb_worker_state(self, session_id, state):
+        # ignore state changes of the worker of an already expired session
+        if session_id == self._session_id:
+            self._set_state(state)
 
-        if self._session_id == None:
-            # session got expired during the keep-alive call, don't keep it alive any longer
-            self._keep_alive_timer.stop()
+    def _set_state(self, state):
+        if self._state == state or (self._session_id == None and state != REDSession.STATE_EXPIRED):
             return
 
-        if abs(time.monotonic() - self._last_keep_alive) > (REDSession.LIFETIME - REDSession.KEEP_ALIVE_INTERVAL * 2):
-            # could not keep sesion alive
-            self._keep_alive_timer.stop()
+        self._state = state
+
+        self.state_changed.emit(state)
+
+        if state == REDSession.STATE_LOST:
             self._qtcb_lost.emit(self._brick._uid_str)
 
     def create(self):
@@ -246,7 +354,13 @@ class REDSession(QObject):
 
         self._session_id = session_id
 
-        self._keep_alive_timer.start(REDSession.KEEP_ALIVE_INTERVAL * 1000)
+        self._clear_string_cache()
+
+        self._worker = REDSessionWorker(self._brick, session_id, REDSession.LIFETIME, REDSession.KEEP_ALIVE_INTERVAL,
+                                        self.increase_error_count, MethodRef(self._report_worker_state))
+
+        self._worker.start()
+        self._set_state(REDSession.STATE_ALIVE)
 
         return self
 
@@ -256,8 +370,9 @@ class REDSession(QObject):
             # expiring an unattached session is allowed and does nothing
             return
 
-        if self._keep_alive_timer != None:
-            self._keep_alive_timer.stop()
+        if self._worker != None:
+            self._worker.stop()
+            self._worker = None
 
         # ensure to remove references to REDObject via their added callback methods
         self._brick.remove_all_callbacks()
@@ -265,14 +380,81 @@ class REDSession(QObject):
         session_id       = self._session_id
         self._session_id = None
 
+        self._program_catalogue = None
+
+        self._clear_string_cache()
+        self._set_state(REDSession.STATE_EXPIRED)
+
         try:
             self._brick.expire_session_unchecked(session_id)
         except:
             # just report IPConnection-level error, but don't re-raise it
             self.increase_error_count()
 
+    # don't call this method with async_call, this is already non-blocking
+    def _release_object(self, object_id):
+        session_id = self._session_id
+
+        # only release object if the session was not already expired
+        if session_id == None:
+            return
+
+        try:
+            self._brick.release_object_unchecked(object_id, session_id)
+        except:
+            # just report IPConnection-level error, but don't re-raise it
+            self.increase_error_count()
+
+    def _ref_cached_string(self, object_id):
+        with self._string_cache_lock:
+            self._string_cache_refs[object_id] = self._string_cache_refs.get(object_id, 0) + 1
+
+    def _unref_cached_string(self, object_id):
+        with self._string_cache_lock:
+            refs = self._string_cache_refs.get(object_id, 0) - 1
+
+            if refs > 0:
+                self._string_cache_refs[object_id] = refs
+            else:
+                self._string_cache_refs.pop(object_id, None)
+                self._string_cache.pop(object_id, None)
+
+    def _get_cached_string(self, object_id):
+        with self._string_cache_lock:
+            return self._string_cache.get(object_id)
+
+    def _set_cached_string(self, object_id, data):
+        with self._string_cache_lock:
+            # only cache content of strings that are still referenced
+            if object_id in self._string_cache_refs:
+                self._string_cache[object_id] = data
+
+    def _clear_string_cache(self):
+        with self._string_cache_lock:
+            self._string_cache      = {}
+            self._string_cache_refs = {}
+
     @property
     def session_id(self): return self._session_id
+    @property
+    def state(self):      return self._state
+
+    @property
+    def program_catalogue(self):
+        if self._program_catalogue == None:
+            self._program_catalogue = REDProgramCatalogue(self)
+
+        return self._program_catalogue
+
+    # seconds since the last successful keep-alive or None if expired
+    @property
+    def keep_alive_age(self):
+        worker = self._worker
+
+        if worker == None:
+            return None
+
+        return time.monotonic() - worker.last_keep_alive
 
 
 def _attach_or_release(session, object_class, object_id, extra_object_ids_to_release_on_error=None, extra_parameters=None):
@@ -287,18 +469,10 @@ def _attach_or_release(session, object_class, object_id, extra_object_ids_to_rel
     try:
         obj = create_object_in_qt_main_thread(object_class, parameters).attach(object_id)
     except:
-        try:
-            session._brick.release_object_unchecked(object_id, session._session_id)
-        except:
-            # just report IPConnection-level error, but don't re-raise it
-            session.increase_error_count()
+        session._release_object(object_id)
 
         for extra_object_id in extra_object_ids_to_release_on_error:
-            try:
-                session._brick.release_object_unchecked(extra_object_id, session._session_id)
-            except:
-                # just report IPConnection-level error, but don't re-raise it
-                session.increase_error_count()
+            session._release_object(extra_object_id)
 
         raise # just re-raise the original exception
 
@@ -310,19 +484,17 @@ class REDObjectReleaser:
         self._object_ref  = weakref.ref(obj, self.release)
         self._object_id   = object_id
         self._session     = session
+        self._is_string   = isinstance(obj, REDString)
         self.armed        = True
 
     def release(self, ref):
         if not self.armed:
             return
 
-        # only release object if the session was not already expired
-        if self._session._session_id is not None:
-            try:
-                self._session._brick.release_object_unchecked(self._object_id, self._session._session_id)
-            except:
-                # just report IPConnection-level error, but don't re-raise it
-                self._session.increase_error_count()
+        if self._is_string:
+            self._session._unref_cached_string(self._object_id)
+
+        self._session._release_object(self._object_id)
 
 
 class REDObject(QObject):
@@ -396,13 +568,7 @@ class REDObject(QObject):
 
         object_id = self.detach()
 
-        # only release object if the session was not already expired
-        if self._session._session_id is not None:
-            try:
-                self._session._brick.release_object_unchecked(object_id, self._session._session_id)
-            except:
-                # just report IPConnection-level error, but don't re-raise it
-                self._session.increase_error_count()
+        self._session._release_object(object_id)
 
     @property
     def session(self):   return self._session
@@ -425,15 +591,21 @@ class REDString(REDObject):
         self._data = None # stored as unicode
 
     def _attach_callbacks(self):
-        pass
+        self._session._ref_cached_string(self.object_id)
 
     def _detach_callbacks(self):
-        pass
+        self._session._unref_cached_string(self.object_id)
 
     def update(self):
         if self.object_id is None:
             raise RuntimeError('Cannot update unattached string object')
 
+        data = self._session._get_cached_string(self.object_id)
+
+        if data is not None:
+            self._data = data
+            return
+
         try:
             error_code, length = self._session._brick.get_string_length(self.object_id)
         except Error:
@@ -459,6 +631,8 @@ class REDString(REDObject):
 
         self._data = data_utf8.decode('utf-8')
 
+        self._session._set_cached_string(self.object_id, self._data)
+
     def allocate(self, data):
         self.release()
 
@@ -497,6 +671,8 @@ class REDString(REDObject):
 
         self._data = data_unicode
 
+        self._session._set_cached_string(self.object_id, self._data)
+
         return self
 
     @property
@@ -675,6 +851,10 @@ class REDFileBase(REDObject):
     EVENT_READABLE = BrickRED.FILE_EVENT_READABLE
     EVENT_WRITABLE = BrickRED.FILE_EVENT_WRITABLE
 
+    ORIGIN_BEGINNING = BrickRED.FILE_ORIGIN_BEGINNING
+    ORIGIN_CURRENT   = BrickRED.FILE_ORIGIN_CURRENT
+    ORIGIN_END       = BrickRED.FILE_ORIGIN_END
+
     # data is always a bytes object containing the read data.
     # on success error is None, on failure error is an Exception object
     AsyncReadResult = namedtuple('AsyncReadResult', 'data error')
@@ -1009,6 +1189,21 @@ class REDFileBase(REDObject):
         if self._write_async_data != None:
             self._write_async_data.abort = True
 
+    def set_position(self, offset, origin=ORIGIN_BEGINNING):
+        if self.object_id is None:
+            raise RuntimeError('Cannot set position of unattached file object')
+
+        try:
+            error_code, position = self._session._brick.set_file_position(self.object_id, offset, origin)
+        except Error:
+            self._session.increase_error_count()
+            raise
+
+        if error_code != REDError.E_SUCCESS:
+            raise REDError('Could not set position of file object {0}'.format(self.object_id), error_code)
+
+        return position
+
     def set_events(self, events):
         if self.object_id is None:
             raise RuntimeError('Cannot set events of unattached file object')
@@ -1136,11 +1331,7 @@ class REDFileOrPipeAttacher(REDObject):
         if type_ == REDFileBase.TYPE_PIPE:
             obj = _attach_or_release(self._session, REDPipe, self.object_id)
         else:
-            try:
-                self._session._brick.release_object_unchecked(name_string_id, self._session._session_id)
-            except:
-                # just report IPConnection-level error, but don't re-raise it
-                self._session.increase_error_count()
+            self._session._release_object(name_string_id)
 
             obj = _attach_or_release(self._session, REDFile, self.object_id)
 
@@ -1768,6 +1959,7 @@ class REDProgram(REDProgramBase):
         self._last_spawned_process      = None
         self._last_spawned_lite_process = None
         self._last_spawned_timestamp    = None
+        self._details_valid             = False
 
         self.enable_callbacks                      = False
         self.scheduler_state_changed_callback      = None
@@ -1863,6 +2055,10 @@ class REDProgram(REDProgramBase):
         if self.object_id != program_id:
             return
 
+        # the full scheduler state is only tracked while callbacks are enabled
+        if not self.enable_callbacks:
+            self._details_valid = False
+
         # cannot directly use emit function as callback functions, because this
         # triggers a segfault on the second call for some unknown reason. adding
         # a method in between helps
@@ -1881,11 +2077,7 @@ class REDProgram(REDProgramBase):
         if error_code != REDError.E_SUCCESS:
             return
 
-        try:
-            self._session._brick.release_object_unchecked(message_string_id, self._session._session_id)
-        except:
-            # just report IPConnection-level error, but don't re-raise it
-            self._session.increase_error_count()
+        self._session._release_object(message_string_id)
 
         self._lite_scheduler_state = state
 
@@ -1945,6 +2137,10 @@ class REDProgram(REDProgramBase):
         if self.object_id != program_id:
             return
 
+        # the full last spawned process is only tracked while callbacks are enabled
+        if not self.enable_callbacks:
+            self._details_valid = False
+
         # cannot directly use emit function as callback functions, because this
         # triggers a segfault on the second call for some unknown reason. adding
         # a method in between helps
@@ -1984,15 +2180,25 @@ class REDProgram(REDProgramBase):
             self._last_spawned_lite_process._fake_state_change_callback()
 
     def update(self):
+        self.update_summary()
+        self.update_details()
+
+    # only the fields needed to list the program, see REDProgramCatalogue
+    def update_summary(self):
         self.update_identifier()
+        self.update_custom_options()
+        self.update_lite_scheduler_state()
+        self.update_last_spawned_lite_process()
+
+    def update_details(self):
         self.update_root_directory()
         self.update_command()
         self.update_stdio_redirection()
         self.update_schedule()
         self.update_scheduler_state()
         self.update_last_spawned_process()
-        self.update_last_spawned_lite_process()
-        self.update_custom_options()
+
+        self._details_valid = True
 
     def update_root_directory(self):
         if self.object_id is None:
@@ -2129,6 +2335,23 @@ class REDProgram(REDProgramBase):
         self._scheduler_timestamp  = timestamp
         self._scheduler_message    = message
 
+    def update_lite_scheduler_state(self):
+        if self.object_id is None:
+            raise RuntimeError('Cannot update unattached program object')
+
+        try:
+            error_code, state, timestamp, message_string_id = self._session._brick.get_program_scheduler_state(self.object_id, self._session._session_id)
+        except Error:
+            self._session.increase_error_count()
+            raise
+
+        if error_code != REDError.E_SUCCESS:
+            raise REDError('Could not get scheduler state of program object {0}'.format(self.object_id), error_code)
+
+        self._session._release_object(message_string_id)
+
+        self._lite_scheduler_state = state
+
     def update_last_spawned_process(self):
         if self.object_id is None:
             raise RuntimeError('Cannot update unattached program object')
@@ -2420,6 +2643,8 @@ class REDProgram(REDProgramBase):
     def last_spawned_lite_process(self): return self._last_spawned_lite_process
     @property
     def last_spawned_timestamp(self):    return self._last_spawned_timestamp
+    @property
+    def details_valid(self):             return self._details_valid
 
 
 class REDLiteProgram(REDProgramBase):
@@ -2450,17 +2675,87 @@ def get_programs(session):
     return _attach_or_release(session, REDList, programs_list_id).items
 
 
+# the returned programs only have their summary fields updated
 def get_lite_programs(session):
-    try:
-        error_code, programs_list_id = session._brick.get_programs(session._session_id)
-    except Error:
-        session.increase_error_count()
-        raise
+    return session.program_catalogue.refresh()
 
-    if error_code != REDError.E_SUCCESS:
-        raise REDError('Could not get programs list object', error_code)
 
-    return _attach_or_release(session, REDList, programs_list_id, extra_parameters=(REDLiteProgram,)).items
+class REDProgramCatalogue:
+    # session-scoped cache of the programs. a refresh only fetches the
+    # programs list and the summary of programs that are new since the last
+    # refresh. known programs are kept up-to-date by their callbacks, their
+    # details are fetched on demand by REDProgram.update_details. a refresh
+    # requested by the user also fetches the summary of the known programs
+    def __init__(self, session):
+        self._session  = session
+        self._programs = {} # by object ID
+        self._lock     = threading.Lock()
+
+    def refresh(self, update_known_programs=False):
+        session = self._session
+
+        with self._lock:
+            try:
+                error_code, programs_list_id = session._brick.get_programs(session._session_id)
+            except Error:
+                session.increase_error_count()
+                raise
+
+            if error_code != REDError.E_SUCCESS:
+                raise REDError('Could not get programs list object', error_code)
+
+            programs_list = create_object_in_qt_main_thread(REDList, (session,)).attach(programs_list_id, False)
+            programs      = {}
+
+            try:
+                try:
+                    error_code, length = session._brick.get_list_length(programs_list_id)
+                except Error:
+                    session.increase_error_count()
+                    raise
+
+                if error_code != REDError.E_SUCCESS:
+                    raise REDError('Could not get length of list object {0}'.format(programs_list_id), error_code)
+
+                for i in range(length):
+                    try:
+                        error_code, program_id, _ = session._brick.get_list_item(programs_list_id, i, session._session_id)
+                    except Error:
+                        session.increase_error_count()
+                        raise
+
+                    if error_code != REDError.E_SUCCESS:
+                        raise REDError('Could not get item at index {0} of list object {1}'.format(i, programs_list_id), error_code)
+
+                    program = self._programs.get(program_id)
+
+                    if program != None:
+                        # the known program object already holds a reference
+                        session._release_object(program_id)
+
+                        if update_known_programs:
+                            program.update_summary()
+                    else:
+                        program = create_object_in_qt_main_thread(REDProgram, (session,)).attach(program_id, False)
+                        program.update_summary()
+
+                    programs[program_id] = program
+            finally:
+                programs_list.release()
+
+            self._programs = programs
+
+            return list(programs.values())
+
+    def add(self, program):
+        with self._lock:
+            self._programs[program.object_id] = program
+
+    def remove(self, program):
+        with self._lock:
+            for object_id, known_program in list(self._programs.items()):
+                if known_program == program:
+                    del self._programs[object_id]
 
 
 REDObject._subclasses = {
@@ -5,7 +5,7 @@ Copyright (C) 2015 Ishraq Ibne Ashraf <ishraq@tinkerforge.com>
 Copyright (C) 2015 Matthias Bolte <matthias@tinkerforge.com>
 Copyright (C) 2020 Erik Fleckstein <erik@tinkerforge.com>
 
-build_serviceproviders.py: Generate python dicts for mobile internet feature
+build_serviceproviders.py: Generate provider index for mobile internet feature
 
 This program is free software; you can redistribute it and/or
 modify it under the terms of the GNU General Public License
@@ -32,6 +32,96 @@ import urllib.error
 import xml.etree.ElementTree as ET
 from pprint import pformat
 
+def first_name(name):
+    if isinstance(name, list):
+        return name[0]
+
+    return name
+
+def as_list(value):
+    if isinstance(value, list):
+        return value
+
+    return [value]
+
+def compact_plan(dict_apn):
+    if 'name' not in dict_apn:
+        name = 'Default'
+    else:
+        name = first_name(dict_apn['name'])
+
+    return [name,
+            dict_apn['@value'],
+            dict_apn.get('username', 'none'),
+            dict_apn.get('password', 'none'),
+            dict_apn.get('dial', '')]
+
+# Reduces the expanded provider dict to the internet APNs of GSM providers and
+# returns a dict that maps the country code to the JSON encoded and by name
+# sorted list of [provider, plans] pairs. Each plan is a [name, apn, username,
+# password, dial] list. Countries without such providers are left out
+def compact_providers(dict_provider):
+    providers = {}
+
+    for dict_c in dict_provider['country']:
+        plans_by_provider = {}
+
+        for dict_p in as_list(dict_c.get('provider', [])):
+            if not isinstance(dict_p.get('gsm'), dict) or 'apn' not in dict_p['gsm']:
+                continue
+
+            plans = []
+
+            for dict_apn in as_list(dict_p['gsm']['apn']):
+                if not isinstance(dict_apn, dict) or '@value' not in dict_apn:
+                    continue
+
+                if not isinstance(dict_apn.get('usage'), dict) or dict_apn['usage'].get('@type') != 'internet':
+                    continue
+
+                plans.append(compact_plan(dict_apn))
+
+            if len(plans) > 0:
+                plans_by_provider.setdefault(first_name(dict_p['name']), []).extend(plans)
+
+        if len(plans_by_provider) > 0:
+            providers[dict_c['@code']] = json.dumps(sorted(plans_by_provider.items()),
+                                                    ensure_ascii=False, separators=(',', ':'))
+
+    return providers
+
+def write_data_file(data_file, providers, dict_country):
+    countries = {}
+
+    for code_country in providers:
+        countries[code_country] = dict_country[code_country]
+
+    with open(data_file + '.tmp', 'w', encoding='utf-8') as f:
+        f.write('# -*- coding: utf-8 -*-\n')
+        f.write('# This file is generated, don\'t edit it.\n')
+        f.write('\n')
+        f.write('# The provider data comes from the GNOME mobile-broadband-provider-info package\n')
+        f.write('# that is released as public domain:\n')
+        f.write('#\n')
+        f.write('# https://git.gnome.org/browse/mobile-broadband-provider-info/plain/serviceproviders.xml\n')
+        f.write('#\n')
+        f.write('# The country data comes from the Debian iso-codes package that is released\n')
+        f.write('# under LGPLv2.1+:\n')
+        f.write('#\n')
+        f.write('# /usr/share/xml/iso-codes/iso_3166.xml\n')
+        f.write('\n')
+        f.write('# Maps the country code to the country name\n')
+        f.write('countries = \\\n')
+        f.write(pformat(countries) + '\n')
+        f.write('\n')
+        f.write('# Maps the country code to a JSON encoded and by name sorted list of\n')
+        f.write('# [provider, plans] pairs. Each plan is a [name, apn, username, password,\n')
+        f.write('# dial] list. Decode only the entry of the selected country\n')
+        f.write('providers = \\\n')
+        f.write(pformat(providers) + '\n')
+
+    os.replace(data_file + '.tmp', data_file)
+
 def main():
     try:
         XML_URL = 'file://{0}'.format(os.environ['SERVICEPROVIDERS_XML_PATH'])
@@ -121,31 +211,11 @@ def main():
         exit(1)
 
     try:
-        print('[*] Writing provider and country dicts')
-
-        with open(DATA_FILE + '.tmp', 'w') as f:
-            f.write('# -*- coding: utf-8 -*-\n')
-            f.write('# This file is generated, don\'t edit it.\n')
-            f.write('\n')
-            f.write('# The provider data comes from the GNOME mobile-broadband-provider-info package\n')
-            f.write('# that is released as public domain:\n')
-            f.write('#\n')
-            f.write('# https://git.gnome.org/browse/mobile-broadband-provider-info/plain/serviceproviders.xml\n')
-            f.write('\n')
-            f.write('dict_provider = \\\n')
-            f.write(pformat(dict_provider) + '\n')
-            f.write('\n')
-            f.write('# The country data comes from the Debian iso-codes package that is released\n')
-            f.write('# under LGPLv2.1+:\n')
-            f.write('#\n')
-            f.write('# /usr/share/xml/iso-codes/iso_3166.xml\n')
-            f.write('\n')
-            f.write('dict_country = \\\n')
-            f.write(pformat(dict_country) + '\n')
-
-        os.replace(DATA_FILE + '.tmp', DATA_FILE)
+        print('[*] Writing provider index')
+
+        write_data_file(DATA_FILE, compact_providers(dict_provider), dict_country)
     except Exception as e:
-        print('----> Failed to write provider and country dict: ' + str(e))
+        print('----> Failed to write provider index: ' + str(e))
         exit(1)
 
 
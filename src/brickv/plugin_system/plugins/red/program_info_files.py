@@ -28,11 +28,12 @@ import zlib
 import html
 
 from PyQt5.QtCore import Qt, QDateTime, QDir, QSortFilterProxyModel
-from PyQt5.QtWidgets import QWidget, QDialog, QMessageBox, QInputDialog, QApplication
+from PyQt5.QtWidgets import QWidget, QDialog, QMessageBox, QInputDialog
 from PyQt5.QtGui import QStandardItem, QStandardItemModel, QIcon
 
 from brickv.plugin_system.plugins.red.program_utils import Download, ExpandingProgressDialog, \
-                                                           ExpandingInputDialog, get_file_display_size
+                                                           ExpandingInputDialog, \
+                                                           get_file_display_size
 from brickv.plugin_system.plugins.red.ui_program_info_files import Ui_ProgramInfoFiles
 from brickv.plugin_system.plugins.red.program_info_files_permissions import ProgramInfoFilesPermissions
 from brickv.plugin_system.plugins.red.script_manager import check_script_result, report_script_result
@@ -44,6 +45,7 @@ USER_ROLE_ITEM_TYPE     = Qt.UserRole + 2
 USER_ROLE_SIZE          = Qt.UserRole + 3
 USER_ROLE_LAST_MODIFIED = Qt.UserRole + 4
 USER_ROLE_PERMISSIONS   = Qt.UserRole + 5
+USER_ROLE_LOADED        = Qt.UserRole + 6
 
 ITEM_TYPE_FILE      = 1
 ITEM_TYPE_DIRECTORY = 2
@@ -68,6 +70,74 @@ def expand_walk_to_lists(walk):
     return sorted(files), sorted(list(directories))
 
 
+# lists a directory with a single script invocation instead of opening a
+# REDDirectory, which needs several requests per entry. the listing_callback
+# is called with a dict mapping entry names to dicts with the keys 'l' (mtime),
+# 'p' (mode) and either 's' (size) for files or 'd' for directories, and with
+# a flag telling if the listing changed. the optional cache dict maps directory
+# names to (token, listing) tuples. if the directory did not change since it
+# was cached, then the listing is not transferred again and the cached listing
+# is passed to the listing_callback. the error_callback is called with an error
+# message
+def list_directory_async(script_manager, name, listing_callback, error_callback, max_length=1024*1024, cache=None):
+    if cache != None:
+        cached = cache.get(name)
+    else:
+        cached = None
+
+    def cb_list(result):
+        okay, message = check_script_result(result, decode_stderr=True)
+
+        if not okay:
+            if error_callback != None:
+                error_callback(message)
+
+            return
+
+        def decode_async(data):
+            response = json.loads(zlib.decompress(memoryview(data)).decode('utf-8'))
+
+            if not isinstance(response, dict) or not isinstance(response.get('t'), str):
+                raise ValueError('Response is not a dict')
+
+            token   = response['t']
+            listing = response.get('e')
+
+            if listing == None:
+                if cached == None or cached[0] != token:
+                    raise ValueError('Listing is missing')
+
+                return token, cached[1], False
+
+            if not isinstance(listing, dict):
+                raise ValueError('Listing is not a dict')
+
+            return token, listing, True
+
+        def cb_decode(result):
+            token, listing, changed = result
+
+            if cache != None:
+                cache[name] = (token, listing)
+
+            if listing_callback != None:
+                listing_callback(listing, changed)
+
+        def cb_decode_error():
+            if error_callback != None:
+                error_callback('Received invalid data')
+
+        async_call(decode_async, result.stdout, cb_decode, cb_decode_error)
+
+    if cached != None:
+        params = [name, cached[0]]
+    else:
+        params = [name]
+
+    script_manager.execute_script('directory_list', cb_list, params, max_length=max_length,
+                                  decode_output_as_utf8=False)
+
+
 def get_full_item_path(item):
     def expand(item, path):
         parent = item.parent()
@@ -80,61 +150,89 @@ def get_full_item_path(item):
     return expand(item, item.text())
 
 
-def expand_walk_to_model(walk, model, folder_icon, file_icon):
-    def create_last_modified_item(last_modified):
-        #FIXME: fromTime_t is obsolete: https://doc.qt.io/qt-5/qdatetime-obsolete.html#toTime_t
-        item = QStandardItem(QDateTime.fromTime_t(last_modified).toString('yyyy-MM-dd HH:mm:ss'))
-        item.setData(last_modified, USER_ROLE_LAST_MODIFIED)
+def create_last_modified_item(last_modified):
+    #FIXME: fromTime_t is obsolete: https://doc.qt.io/qt-5/qdatetime-obsolete.html#toTime_t
+    item = QStandardItem(QDateTime.fromTime_t(last_modified).toString('yyyy-MM-dd HH:mm:ss'))
+    item.setData(last_modified, USER_ROLE_LAST_MODIFIED)
 
-        return item
+    return item
 
-    def expand(parent_item, name, dw):
-        QApplication.processEvents()
 
-        if 'c' in dw:
-            if name == None:
-                name_item = parent_item
-                size_item = None
-            else:
-                name_item = QStandardItem(name)
-                name_item.setData(folder_icon, Qt.DecorationRole)
-                name_item.setData(ITEM_TYPE_DIRECTORY, USER_ROLE_ITEM_TYPE)
-                name_item.setData(int(dw['p']), USER_ROLE_PERMISSIONS)
+# directories are listed when they get expanded for the first time. until
+# then they contain a placeholder item, so that the tree view shows them as
+# expandable
+def create_placeholder_item():
+    item = QStandardItem('Loading...')
+    item.setFlags(Qt.ItemIsEnabled)
 
-                size_item          = QStandardItem('')
-                last_modified_item = create_last_modified_item(int(dw['l']))
+    return item
 
-                parent_item.appendRow([name_item, size_item, last_modified_item])
 
-            size = 0
+def create_entry_row(name, entry, folder_icon, file_icon):
+    name_item = QStandardItem(name)
+    name_item.setData(int(entry['p']), USER_ROLE_PERMISSIONS)
 
-            for child_name, child_dw in dw['c'].items():
-                size += expand(name_item, child_name, child_dw)
+    if 'd' in entry:
+        name_item.setData(folder_icon, Qt.DecorationRole)
+        name_item.setData(ITEM_TYPE_DIRECTORY, USER_ROLE_ITEM_TYPE)
+        name_item.setData(False, USER_ROLE_LOADED)
+        name_item.appendRow(create_placeholder_item())
 
-            if size_item != None:
-                size_item.setText(get_file_display_size(size))
-                size_item.setData(size, USER_ROLE_SIZE)
+        # the size of a directory is unknown without walking it
+        size_item = QStandardItem('')
+        size_item.setData(0, USER_ROLE_SIZE)
+    else:
+        name_item.setData(file_icon, Qt.DecorationRole)
+        name_item.setData(ITEM_TYPE_FILE, USER_ROLE_ITEM_TYPE)
 
-            return size
-        else:
-            name_item = QStandardItem(name)
-            name_item.setData(file_icon, Qt.DecorationRole)
-            name_item.setData(ITEM_TYPE_FILE, USER_ROLE_ITEM_TYPE)
-            name_item.setData(int(dw['p']), USER_ROLE_PERMISSIONS)
+        size      = int(entry['s'])
+        size_item = QStandardItem(get_file_display_size(size))
+        size_item.setData(size, USER_ROLE_SIZE)
 
-            size      = int(dw['s'])
-            size_item = QStandardItem(get_file_display_size(size))
-            size_item.setData(size, USER_ROLE_SIZE)
+    return [name_item, size_item, create_last_modified_item(int(entry['l']))]
+
+
+# updates the children of a directory item in place to match the listing, so
+# the expansion state of unchanged subdirectories and the selection are kept
+def update_directory_item(parent_item, listing, folder_icon, file_icon):
+    for row in reversed(range(parent_item.rowCount())):
+        name_item = parent_item.child(row, 0)
+        item_type = name_item.data(USER_ROLE_ITEM_TYPE)
+        entry     = listing.get(name_item.text())
 
-            last_modified_item = create_last_modified_item(int(dw['l']))
+        if entry == None or item_type == None or (item_type == ITEM_TYPE_DIRECTORY) != ('d' in entry):
+            parent_item.removeRow(row)
 
-            parent_item.appendRow([name_item, size_item, last_modified_item])
+    existing = {}
 
-            return size
+    for row in range(parent_item.rowCount()):
+        existing[parent_item.child(row, 0).text()] = row
 
-    expand(model.invisibleRootItem(), None, walk)
+    for name, entry in listing.items():
+        row = existing.get(name)
 
-    return model
+        if row == None:
+            parent_item.appendRow(create_entry_row(name, entry, folder_icon, file_icon))
+            continue
+
+        name_item          = parent_item.child(row, 0)
+        size_item          = parent_item.child(row, 1)
+        last_modified_item = parent_item.child(row, 2)
+        last_modified      = int(entry['l'])
+
+        name_item.setData(int(entry['p']), USER_ROLE_PERMISSIONS)
+
+        if 's' in entry and size_item.data(USER_ROLE_SIZE) != int(entry['s']):
+            size = int(entry['s'])
+
+            size_item.setText(get_file_display_size(size))
+            size_item.setData(size, USER_ROLE_SIZE)
+
+        if last_modified_item.data(USER_ROLE_LAST_MODIFIED) != last_modified:
+            parent_item.setChild(row, 2, create_last_modified_item(last_modified))
+
+    if parent_item.data(USER_ROLE_ITEM_TYPE) == ITEM_TYPE_DIRECTORY:
+        parent_item.setData(True, USER_ROLE_LOADED)
 
 
 class FilesProxyModel(QSortFilterProxyModel):
@@ -164,8 +262,9 @@ class ProgramInfoFiles(QWidget, Ui_ProgramInfoFiles):
         self.bin_directory           = posixpath.join(self.program.root_directory, 'bin')
         self.refresh_in_progress     = False
         self.any_refresh_in_progress = False # set from ProgramInfoMain.update_ui_state
-        self.available_files         = []
+        self.available_files         = [] # of the listed directories only
         self.available_directories   = []
+        self.listing_cache           = {} # by absolute directory name
         self.folder_icon             = QIcon(load_pixmap('folder-icon.png'))
         self.file_icon               = QIcon(load_pixmap('file-icon.png'))
         self.tree_files_model        = QStandardItemModel(self)
@@ -181,6 +280,7 @@ class ProgramInfoFiles(QWidget, Ui_ProgramInfoFiles):
         self.tree_files.setColumnWidth(1, 85)
 
         self.tree_files.selectionModel().selectionChanged.connect(self.update_ui_state)
+        self.tree_files.expanded.connect(self.load_expanded_directory)
         self.tree_files.activated.connect(self.rename_activated_file)
         self.button_upload_files.clicked.connect(show_upload_files_wizard)
         self.button_download_files.clicked.connect(self.download_selected_files)
@@ -206,69 +306,119 @@ class ProgramInfoFiles(QWidget, Ui_ProgramInfoFiles):
         self.refresh_in_progress = False
         self.update_main_ui_state()
 
-    def refresh_files(self):
-        def cb_walk(result):
-            okay, message = check_script_result(result, decode_stderr=True)
+    def show_error(self, message):
+        self.label_error.setText('<b>Error:</b> ' + html.escape(message))
+        self.label_error.setVisible(True)
 
-            if not okay:
-                self.label_error.setText('<b>Error:</b> ' + html.escape(message))
-                self.label_error.setVisible(True)
-                self.refresh_files_done()
-                return
+    def find_directory_item(self, path):
+        item = self.tree_files_model.invisibleRootItem()
 
-            self.label_error.setVisible(False)
+        if len(path) == 0:
+            return item
 
-            def expand_async(data):
-                try:
-                    walk = json.loads(zlib.decompress(memoryview(data)).decode('utf-8'))
-                except:
-                    walk = None
+        for part in path.split('/'):
+            for row in range(item.rowCount()):
+                child = item.child(row, 0)
 
-                if walk == None or not isinstance(walk, dict):
-                    available_files       = []
-                    available_directories = []
-                    walk                  = None
-                else:
-                    available_files, available_directories = expand_walk_to_lists(walk)
+                if child.text() == part and child.data(USER_ROLE_ITEM_TYPE) == ITEM_TYPE_DIRECTORY:
+                    item = child
+                    break
+            else:
+                return None
 
-                return walk, available_files, available_directories
+        return item
 
-            def cb_expand_success(result):
-                walk, available_files, available_directories = result
+    def update_available_lists(self):
+        available_files       = []
+        available_directories = []
 
-                self.available_files       = available_files
-                self.available_directories = available_directories
+        def collect(parent_item, path):
+            for row in range(parent_item.rowCount()):
+                name_item = parent_item.child(row, 0)
+                item_type = name_item.data(USER_ROLE_ITEM_TYPE)
+                name      = posixpath.join(path, name_item.text())
 
-                if walk != None:
-                    expand_walk_to_model(walk, self.tree_files_model, self.folder_icon, self.file_icon)
-                else:
-                    self.label_error.setText('<b>Error:</b> Received invalid data')
-                    self.label_error.setVisible(True)
+                if item_type == ITEM_TYPE_DIRECTORY:
+                    available_directories.append(name)
+                    collect(name_item, name)
+                elif item_type == ITEM_TYPE_FILE:
+                    available_files.append(name)
 
-                self.tree_files.header().setSortIndicator(0, Qt.AscendingOrder)
-                self.refresh_files_done()
+        collect(self.tree_files_model.invisibleRootItem(), '')
 
-            def cb_expand_error():
-                self.label_error.setText('<b>Error:</b> Internal async error')
-                self.label_error.setVisible(True)
-                self.refresh_files_done()
+        self.available_files       = sorted(available_files)
+        self.available_directories = sorted(available_directories)
 
-            async_call(expand_async, result.stdout, cb_expand_success, cb_expand_error)
+    # lists the directory and updates its item. the done_callback is called with
+    # the directory item, or with None if the listing failed or the item is gone
+    def load_directory(self, path, done_callback):
+        def cb_listing(listing, changed):
+            # the tree might have been changed by a refresh in the meantime
+            directory_item = self.find_directory_item(path)
 
-        self.refresh_in_progress = True
-        self.update_main_ui_state()
+            if directory_item != None and (changed or directory_item.data(USER_ROLE_LOADED) != True):
+                update_directory_item(directory_item, listing, self.folder_icon, self.file_icon)
 
-        width1 = self.tree_files.columnWidth(0)
-        width2 = self.tree_files.columnWidth(1)
+            done_callback(directory_item)
 
-        self.tree_files_model.clear()
-        self.tree_files_model.setHorizontalHeaderLabels(self.tree_files_model_header)
-        self.tree_files.setColumnWidth(0, width1)
-        self.tree_files.setColumnWidth(1, width2)
+        def cb_error(message):
+            self.show_error(message)
+            done_callback(None)
+
+        list_directory_async(self.script_manager, posixpath.join(self.bin_directory, path),
+                             cb_listing, cb_error, cache=self.listing_cache)
+
+    def load_expanded_directory(self, index):
+        mapped_index = self.tree_files_proxy_model.mapToSource(index.sibling(index.row(), 0))
+        name_item    = self.tree_files_model.itemFromIndex(mapped_index)
+
+        if name_item == None or name_item.data(USER_ROLE_LOADED) != False:
+            return
+
+        # mark the directory as being loaded to avoid listing it twice
+        name_item.setData(None, USER_ROLE_LOADED)
+
+        def cb_done(directory_item):
+            if directory_item != None and directory_item.data(USER_ROLE_LOADED) == None:
+                directory_item.setData(False, USER_ROLE_LOADED)
+
+            self.update_available_lists()
+
+        self.load_directory(get_full_item_path(name_item), cb_done)
+
+    # lists the root directory and all directories that were listed before
+    def refresh_files(self):
+        pending_count = [0]
+        first_refresh = self.tree_files_model.rowCount() == 0
+
+        def refresh_directory(path):
+            pending_count[0] += 1
+
+            def cb_done(directory_item):
+                if directory_item != None:
+                    for row in range(directory_item.rowCount()):
+                        name_item = directory_item.child(row, 0)
+
+                        if name_item.data(USER_ROLE_LOADED) == True:
+                            refresh_directory(posixpath.join(path, name_item.text()))
+
+                pending_count[0] -= 1
+
+                if pending_count[0] == 0:
+                    self.update_available_lists()
+
+                    if first_refresh:
+                        self.tree_files.header().setSortIndicator(0, Qt.AscendingOrder)
+
+                    self.refresh_files_done()
+
+            self.load_directory(path, cb_done)
+
+        self.refresh_in_progress = True
+        self.update_main_ui_state()
+        self.label_error.setVisible(False)
 
-        self.script_manager.execute_script('walk', cb_walk,
-                                           [self.bin_directory], max_length=1024*1024,
-                                           decode_output_as_utf8=False)
+        refresh_directory('')
 
     def get_directly_selected_name_items(self):
         selected_indexes    = self.tree_files.selectedIndexes()
@@ -287,22 +437,63 @@ class ProgramInfoFiles(QWidget, Ui_ProgramInfoFiles):
         if len(selected_name_items) == 0:
             return
 
-        downloads = []
+        downloads   = []
+        directories = []
 
-        def expand(name_item):
-            item_type = name_item.data(USER_ROLE_ITEM_TYPE)
+        for selected_name_item in selected_name_items:
+            item_type = selected_name_item.data(USER_ROLE_ITEM_TYPE)
+            filename  = get_full_item_path(selected_name_item)
 
             if item_type == ITEM_TYPE_DIRECTORY:
-                for i in range(name_item.rowCount()):
-                    expand(name_item.child(i, 0))
+                directories.append(filename)
             elif item_type == ITEM_TYPE_FILE:
-                filename = get_full_item_path(name_item)
-
                 downloads.append(Download(filename, QDir.toNativeSeparators(filename)))
 
-        for selected_name_item in selected_name_items:
-            expand(selected_name_item)
+        # selected directories might not be listed yet, walk them now
+        def walk_next_directory():
+            if len(directories) == 0:
+                self.show_download_files_wizard(downloads)
+                return
+
+            directory = directories.pop(0)
+
+            def cb_walk(result):
+                okay, message = check_script_result(result, decode_stderr=True)
+
+                if not okay:
+                    QMessageBox.critical(get_main_window(), 'Download Files Error',
+                                         'Could not list files of directory {0}:\n\n{1}'.format(directory, message))
+                    return
+
+                def expand_async(data):
+                    walk = json.loads(zlib.decompress(memoryview(data)).decode('utf-8'))
+
+                    if not isinstance(walk, dict):
+                        raise ValueError('Walk is not a dict')
+
+                    return expand_walk_to_lists(walk)[0]
+
+                def cb_expand_success(files):
+                    for filename in files:
+                        filename = posixpath.join(directory, filename)
+
+                        downloads.append(Download(filename, QDir.toNativeSeparators(filename)))
+
+                    walk_next_directory()
+
+                def cb_expand_error():
+                    QMessageBox.critical(get_main_window(), 'Download Files Error',
+                                         'Received invalid data for directory {0}.'.format(directory))
+
+                async_call(expand_async, result.stdout, cb_expand_success, cb_expand_error)
+
+            self.script_manager.execute_script('walk', cb_walk,
+                                               [posixpath.join(self.bin_directory, directory)],
+                                               max_length=1024*1024, decode_output_as_utf8=False)
+
+        walk_next_directory()
 
+    def show_download_files_wizard(self, downloads):
         if len(downloads) == 0:
             return
 
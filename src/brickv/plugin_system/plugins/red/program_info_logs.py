@@ -82,6 +82,11 @@ class ProgramInfoLogs(QWidget, Ui_ProgramInfoLogs):
         self.tree_logs_model_header        = ['Date/Time', 'Size']
         self.tree_logs_proxy_model         = LogsProxyModel(self)
         self.last_download_directory       = get_home_path()
+        self.log_cursor                    = None # from program_logs_list, to only get changes
+        self.log_rows                      = {} # by file name, [row, parent rows]
+        self.continuous_row                = None
+        self.date_rows                     = {} # by date
+        self.time_rows                     = {} # by date and time
 
         self.tree_logs_model.setHorizontalHeaderLabels(self.tree_logs_model_header)
         self.tree_logs_proxy_model.setSourceModel(self.tree_logs_model)
@@ -111,6 +116,142 @@ class ProgramInfoLogs(QWidget, Ui_ProgramInfoLogs):
         self.refresh_in_progress = False
         self.update_main_ui_state()
 
+    def clear_logs(self):
+        width = self.tree_logs.columnWidth(0)
+        self.tree_logs_model.clear()
+        self.tree_logs_model.setHorizontalHeaderLabels(self.tree_logs_model_header)
+        self.tree_logs.setColumnWidth(0, width)
+
+        self.log_cursor     = None
+        self.log_rows       = {}
+        self.continuous_row = None
+        self.date_rows      = {}
+        self.time_rows      = {}
+
+    def create_file_size_item(self, size):
+        item = QStandardItem(get_file_display_size(size))
+        item.setData(size, USER_ROLE_SIZE)
+
+        return item
+
+    def update_file_size_item(self, item, additional_size):
+        current_size = item.data(USER_ROLE_SIZE)
+        new_size     = current_size + additional_size
+
+        item.setText(get_file_display_size(new_size))
+        item.setData(new_size, USER_ROLE_SIZE)
+
+    def add_log_file(self, file_name, file_size):
+        file_name_parts = file_name.split('_')
+
+        if file_name_parts[0] == "continuous":
+            if len(file_name_parts) != 2:
+                return
+
+            if self.continuous_row == None:
+                continuous_item = QStandardItem("Continuous")
+                continuous_item.setData(ITEM_TYPE_PARENT_CONT, USER_ROLE_ITEM_TYPE)
+
+                self.continuous_row = [continuous_item, self.create_file_size_item(0)]
+
+                self.tree_logs_model.appendRow(self.continuous_row)
+
+            log_item = QStandardItem(file_name_parts[1])
+            log_item.setData(self.file_icon, Qt.DecorationRole)
+            log_item.setData(file_name, USER_ROLE_FILE_NAME)
+            log_item.setData(ITEM_TYPE_LOG_FILE_CONT, USER_ROLE_ITEM_TYPE)
+
+            parent_rows = [self.continuous_row]
+        else:
+            if len(file_name_parts) != 3:
+                return
+
+            try:
+                timestamp = int(file_name_parts[1].split('+')[0]) // 1000000
+            except ValueError:
+                return
+
+            #FIXME: fromTime_t is obsolete: https://doc.qt.io/qt-5/qdatetime-obsolete.html#toTime_t
+            date      = QDateTime.fromTime_t(timestamp).toString('yyyy-MM-dd')
+            time      = QDateTime.fromTime_t(timestamp).toString('HH:mm:ss')
+            date_time = date + 'T' + time
+
+            if date in self.date_rows:
+                date_row = self.date_rows[date]
+            else:
+                date_item = QStandardItem(date)
+                date_item.setData(ITEM_TYPE_PARENT_DATE, USER_ROLE_ITEM_TYPE)
+
+                date_row             = [date_item, self.create_file_size_item(0)]
+                self.date_rows[date] = date_row
+
+                self.tree_logs_model.appendRow(date_row)
+
+            if date_time in self.time_rows:
+                time_row = self.time_rows[date_time]
+            else:
+                time_item = QStandardItem(time)
+                time_item.setData(ITEM_TYPE_PARENT_TIME, USER_ROLE_ITEM_TYPE)
+
+                time_row                  = [time_item, self.create_file_size_item(0)]
+                self.time_rows[date_time] = time_row
+
+                date_row[0].appendRow(time_row)
+
+            log_item = QStandardItem(file_name_parts[2])
+            log_item.setData(self.file_icon, Qt.DecorationRole)
+            log_item.setData(file_name, USER_ROLE_FILE_NAME)
+            log_item.setData(ITEM_TYPE_LOG_FILE, USER_ROLE_ITEM_TYPE)
+
+            parent_rows = [time_row, date_row]
+
+        log_row = [log_item, self.create_file_size_item(file_size)]
+
+        parent_rows[0][0].appendRow(log_row)
+
+        for parent_row in parent_rows:
+            self.update_file_size_item(parent_row[1], file_size)
+
+        self.log_rows[file_name] = [log_row, parent_rows]
+
+    def set_log_file_size(self, file_name, file_size):
+        log_row, parent_rows = self.log_rows[file_name]
+        additional_size      = file_size - log_row[1].data(USER_ROLE_SIZE)
+
+        self.update_file_size_item(log_row[1], additional_size)
+
+        for parent_row in parent_rows:
+            self.update_file_size_item(parent_row[1], additional_size)
+
+    def remove_log_file(self, file_name):
+        log_row, parent_rows = self.log_rows.pop(file_name)
+        file_size            = log_row[1].data(USER_ROLE_SIZE)
+
+        parent_rows[0][0].removeRow(log_row[0].row())
+
+        for parent_row in parent_rows:
+            self.update_file_size_item(parent_row[1], -file_size)
+
+        # remove parents that became empty, innermost first
+        for parent_row in parent_rows:
+            parent_item = parent_row[0]
+
+            if parent_item.rowCount() > 0:
+                break
+
+            if parent_item.parent() != None:
+                parent_item.parent().removeRow(parent_item.row())
+            else:
+                self.tree_logs_model.removeRow(parent_item.row())
+
+            if parent_row is self.continuous_row:
+                self.continuous_row = None
+            else:
+                for rows in [self.time_rows, self.date_rows]:
+                    for key, row in list(rows.items()):
+                        if row is parent_row:
+                            del rows[key]
+
     def refresh_logs(self):
         def cb_program_logs_list(result):
             okay, message = check_script_result(result, decode_stderr=True)
@@ -118,6 +259,7 @@ class ProgramInfoLogs(QWidget, Ui_ProgramInfoLogs):
             if not okay:
                 self.label_error.setText('<b>Error:</b> ' + html.escape(message))
                 self.label_error.setVisible(True)
+                self.log_cursor = None
                 self.refresh_logs_done()
                 return
 
@@ -127,113 +269,50 @@ class ProgramInfoLogs(QWidget, Ui_ProgramInfoLogs):
             except:
                 program_logs_list = None
 
-            if program_logs_list == None or not isinstance(program_logs_list, dict):
+            if program_logs_list == None or not isinstance(program_logs_list, dict) or \
+               not isinstance(program_logs_list.get('files'), dict) or not isinstance(program_logs_list.get('deleted'), list):
                 self.label_error.setText('<b>Error:</b> Received invalid data')
                 self.label_error.setVisible(True)
+                self.log_cursor = None
                 self.refresh_logs_done()
                 return
 
             self.label_error.setVisible(False)
 
-            def create_file_size_item(size):
-                item = QStandardItem(get_file_display_size(size))
-                item.setData(size, USER_ROLE_SIZE)
-
-                return item
+            # only new, changed and deleted files are reported, unless the
+            # cursor was unknown to the RED Brick
+            if program_logs_list.get('full', True):
+                self.clear_logs()
 
-            def update_file_size_item(item, additional_size):
-                current_size = item.data(USER_ROLE_SIZE)
-                new_size     = current_size + additional_size
+            for file_name in program_logs_list['deleted']:
+                if file_name in self.log_rows:
+                    self.remove_log_file(file_name)
 
-                item.setText(get_file_display_size(new_size))
-                item.setData(new_size, USER_ROLE_SIZE)
-
-            continuous_row = None
-            date_rows      = {}
-            time_rows      = {}
-
-            for file_name, file_size in program_logs_list.items():
+            for file_name, file_size in program_logs_list['files'].items():
                 QApplication.processEvents()
 
-                file_name_parts = file_name.split('_')
-
-                if file_name_parts[0] == "continuous":
-                    if len(file_name_parts) != 2:
-                        continue
-
-                    if continuous_row == None:
-                        continuous_item = QStandardItem("Continuous")
-                        continuous_item.setData(ITEM_TYPE_PARENT_CONT, USER_ROLE_ITEM_TYPE)
-
-                        continuous_row = [continuous_item, create_file_size_item(0)]
-
-                        self.tree_logs_model.appendRow(continuous_row)
-
-                    log_item = QStandardItem(file_name_parts[1])
-                    log_item.setData(self.file_icon, Qt.DecorationRole)
-                    log_item.setData(file_name, USER_ROLE_FILE_NAME)
-                    log_item.setData(ITEM_TYPE_LOG_FILE_CONT, USER_ROLE_ITEM_TYPE)
-
-                    continuous_row[0].appendRow([log_item, create_file_size_item(file_size)])
-                    update_file_size_item(continuous_row[1], file_size)
+                if file_name in self.log_rows:
+                    self.set_log_file_size(file_name, file_size)
                 else:
-                    if len(file_name_parts) != 3:
-                        continue
-
-                    try:
-                        timestamp = int(file_name_parts[1].split('+')[0]) // 1000000
-                    except ValueError:
-                        continue
-
-                    #FIXME: fromTime_t is obsolete: https://doc.qt.io/qt-5/qdatetime-obsolete.html#toTime_t
-                    date      = QDateTime.fromTime_t(timestamp).toString('yyyy-MM-dd')
-                    time      = QDateTime.fromTime_t(timestamp).toString('HH:mm:ss')
-                    date_time = date + 'T' + time
-
-                    if date in date_rows:
-                        date_row = date_rows[date]
-                    else:
-                        date_item = QStandardItem(date)
-                        date_item.setData(ITEM_TYPE_PARENT_DATE, USER_ROLE_ITEM_TYPE)
-
-                        date_row        = [date_item, create_file_size_item(0)]
-                        date_rows[date] = date_row
+                    self.add_log_file(file_name, file_size)
 
-                        self.tree_logs_model.appendRow(date_row)
+            self.log_cursor = program_logs_list.get('cursor')
 
-                    if date_time in time_rows:
-                        time_row = time_rows[date_time]
-                    else:
-                        time_item = QStandardItem(time)
-                        time_item.setData(ITEM_TYPE_PARENT_TIME, USER_ROLE_ITEM_TYPE)
+            if program_logs_list.get('full', True):
+                self.tree_logs.header().setSortIndicator(0, Qt.DescendingOrder)
 
-                        time_row             = [time_item, create_file_size_item(0)]
-                        time_rows[date_time] = time_row
-
-                        date_row[0].appendRow(time_row)
-
-                    log_item = QStandardItem(file_name_parts[2])
-                    log_item.setData(self.file_icon, Qt.DecorationRole)
-                    log_item.setData(file_name, USER_ROLE_FILE_NAME)
-                    log_item.setData(ITEM_TYPE_LOG_FILE, USER_ROLE_ITEM_TYPE)
-
-                    time_row[0].appendRow([log_item, create_file_size_item(file_size)])
-                    update_file_size_item(time_row[1], file_size)
-                    update_file_size_item(date_row[1], file_size)
-
-            self.tree_logs.header().setSortIndicator(0, Qt.DescendingOrder)
             self.refresh_logs_done()
 
         self.refresh_in_progress = True
         self.update_main_ui_state()
 
-        width = self.tree_logs.columnWidth(0)
-        self.tree_logs_model.clear()
-        self.tree_logs_model.setHorizontalHeaderLabels(self.tree_logs_model_header)
-        self.tree_logs.setColumnWidth(0, width)
+        if self.log_cursor == None:
+            cursor = ''
+        else:
+            cursor = self.log_cursor
 
         self.script_manager.execute_script('program_logs_list', cb_program_logs_list,
-                                           [self.log_directory], max_length=1024*1024,
+                                           [self.log_directory, cursor], max_length=1024*1024,
                                            decode_output_as_utf8=False)
 
     def get_directly_selected_log_items(self):
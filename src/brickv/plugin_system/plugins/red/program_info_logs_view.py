@@ -25,9 +25,9 @@ import posixpath
 import os
 import html
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QDialog, QMessageBox
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QSize, QTimer, QModelIndex, QAbstractListModel
+from PyQt5.QtWidgets import QApplication, QDialog, QMessageBox, QShortcut
+from PyQt5.QtGui import QFont, QFontMetrics, QKeySequence
 
 from brickv.plugin_system.plugins.red.ui_program_info_logs_view import Ui_ProgramInfoLogsView
 from brickv.plugin_system.plugins.red.api import *
@@ -35,7 +35,171 @@ from brickv.plugin_system.plugins.red.program_utils import timestamp_to_date_at_
 from brickv.async_call import async_call
 from brickv.utils import get_main_window, get_home_path, get_save_file_name
 
+class LogLineModel(QAbstractListModel):
+    """
+    Holds the lines of the loaded byte range of a log file as bytes and only
+    decodes the lines that the view asks for. If the range starts inside a
+    line then the bytes up to the first newline are kept as head until the
+    previous page is loaded. The bytes after the last newline are shown as
+    the last row and are completed by appended data.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.lines       = []
+        self.head        = b''
+        self.head_open   = False # range starts inside a line and no newline was seen yet
+        self.tail        = b''
+        self.max_length  = 0
+        self.char_width  = 0
+        self.line_height = 0
+
+    def set_font(self, font):
+        metrics = QFontMetrics(font)
+
+        self.char_width  = metrics.averageCharWidth()
+        self.line_height = metrics.lineSpacing()
+
+    def clear(self, at_start):
+        self.beginResetModel()
+
+        self.lines      = []
+        self.head       = b''
+        self.head_open  = not at_start
+        self.tail       = b''
+        self.max_length = 0
+
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        if len(self.tail) > 0:
+            return len(self.lines) + 1
+
+        return len(self.lines)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.DisplayRole:
+            row = index.row()
+
+            if row < len(self.lines):
+                line = self.lines[row]
+            elif row == len(self.lines) and len(self.tail) > 0:
+                line = self.tail
+            else:
+                return None
+
+            # FIXME: maybe add a encoding guesser here or try some common encodings if UTF-8 fails
+            return line.rstrip(b'\r').decode('utf-8', 'replace')
+        elif role == Qt.SizeHintRole:
+            # the view uses uniform item sizes, so only the first row is asked
+            return QSize(self.max_length * self.char_width + self.char_width, self.line_height)
+
+        return None
+
+    def update_max_length(self, lines):
+        if len(lines) > 0:
+            self.max_length = max(self.max_length, max(map(len, lines)))
+
+    def append(self, data):
+        if self.head_open:
+            i = data.find(b'\n')
+
+            if i < 0:
+                self.head += data
+                return
+
+            self.head     += data[:i + 1]
+            self.head_open = False
+            data           = data[i + 1:]
+
+        old_count = self.rowCount()
+        tail_row  = len(self.lines) if len(self.tail) > 0 else None
+        parts     = (self.tail + data).split(b'\n')
+        tail      = parts.pop()
+        new_count = len(self.lines) + len(parts) + (1 if len(tail) > 0 else 0)
+
+        self.update_max_length(parts + [tail])
+
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+
+        self.lines += parts
+        self.tail   = tail
+
+        if new_count > old_count:
+            self.endInsertRows()
+
+        if tail_row != None:
+            self.dataChanged.emit(self.index(tail_row), self.index(tail_row))
+
+    def prepend(self, data, at_start):
+        joined = data + self.head
+        parts  = joined.split(b'\n')
+        last   = parts.pop() # only non-empty if the head is open
+
+        if at_start:
+            head = b''
+        elif len(parts) == 0:
+            self.head = joined
+            return
+        else:
+            head = parts.pop(0) + b'\n'
+
+        self.update_max_length(parts + [last])
+
+        if self.head_open:
+            # nothing was shown so far, the last part is the tail
+            self.beginResetModel()
+
+            self.lines     = parts
+            self.head      = head
+            self.head_open = False
+            self.tail      = last
+
+            self.endResetModel()
+        else:
+            self.head = head
+
+            if len(parts) > 0:
+                self.beginInsertRows(QModelIndex(), 0, len(parts) - 1)
+
+                self.lines = parts + self.lines
+
+                self.endInsertRows()
+
+    # removes the first rows to keep at most max_lines lines, returns the
+    # number of bytes removed from the start of the range
+    def trim(self, max_lines):
+        count = len(self.lines) - max_lines
+
+        if count <= 0:
+            return 0
+
+        removed = len(self.head) + sum(len(line) + 1 for line in self.lines[:count])
+
+        self.beginRemoveRows(QModelIndex(), 0, count - 1)
+
+        del self.lines[:count]
+        self.head = b''
+
+        self.endRemoveRows()
+
+        return removed
+
 class ProgramInfoLogsView(QDialog, Ui_ProgramInfoLogsView):
+    PAGE_LENGTH        = 64 * 1024
+    FOLLOW_LENGTH      = 1024 * 1024
+    SAVE_CHUNK_LENGTH  = 1024 * 1024
+    FOLLOW_INTERVAL    = 1000 # milliseconds
+    MAX_FOLLOWED_LINES = 100000
+
     def __init__(self, parent, session, source_name):
         QDialog.__init__(self, parent)
 
@@ -45,7 +209,12 @@ class ProgramInfoLogsView(QDialog, Ui_ProgramInfoLogsView):
         self.source_name   = source_name
         self.last_filename = os.path.join(get_home_path(), posixpath.split(source_name)[1])
         self.log_file      = None
-        self.content       = None
+        self.start_offset  = 0 # the loaded byte range of the log file
+        self.end_offset    = 0
+        self.busy          = False # only one read can be in progress
+        self.show_progress = True
+        self.model         = LogLineModel(self)
+        self.follow_timer  = QTimer(self)
 
         source_name_parts = posixpath.split(source_name)[1].split('_')
 
@@ -61,66 +230,205 @@ class ProgramInfoLogsView(QDialog, Ui_ProgramInfoLogsView):
             date_time       = '{0} ({1})'.format(timestamp_to_date_at_time(timestamp), source_name_parts[2])
             self.continuous = False
 
-        self.rejected.connect(self.abort_download)
+        font = QFont('monospace')
+        font.setStyleHint(QFont.TypeWriter)
+
+        self.model.set_font(font)
+        self.list_content.setFont(font)
+        self.list_content.setModel(self.model)
+
+        self.copy_shortcut = QShortcut(QKeySequence.Copy, self.list_content)
+        self.copy_shortcut.activated.connect(self.copy_selected_lines)
+
+        self.follow_timer.setInterval(ProgramInfoLogsView.FOLLOW_INTERVAL)
+        self.follow_timer.timeout.connect(self.read_appended)
+
+        self.finished.connect(self.close_log_file)
         self.progress_download.setRange(0, 0)
         self.label_date_time.setText(date_time)
+        self.label_error.setVisible(False)
+        self.button_load_older.clicked.connect(self.read_older)
+        self.check_follow.setChecked(self.continuous)
+        self.check_follow.toggled.connect(self.update_ui_state)
         self.button_save.clicked.connect(self.save_content)
         self.button_close.clicked.connect(self.reject)
 
-        self.button_save.setEnabled(False)
+        self.busy = True
+        self.update_ui_state()
 
         def cb_open(dummy):
+            self.busy = False
+
+            # only read the last page, older pages are loaded on demand
+            length = self.log_file.length
+
+            self.start_offset = max(0, length - ProgramInfoLogsView.PAGE_LENGTH)
+            self.end_offset   = self.start_offset
+
+            self.model.clear(self.start_offset == 0)
+            self.read_range(self.start_offset, length - self.start_offset, self.cb_read_initial)
+
+        def cb_open_error():
+            self.busy = False
+
+            self.log_file = None
+            self.log('Error: Could not open log file')
+
+        self.log_file = REDFile(session)
+
+        async_call(self.log_file.open,
+                   (source_name, REDFile.FLAG_READ_ONLY | REDFile.FLAG_NON_BLOCKING, 0, 0, 0),
+                   cb_open, cb_open_error)
+
+    def update_ui_state(self):
+        available = self.log_file != None and self.log_file.object_id != None
+
+        self.label_download.setVisible(self.busy and self.show_progress)
+        self.progress_download.setVisible(self.busy and self.show_progress)
+        self.button_load_older.setEnabled(available and not self.busy and self.start_offset > 0)
+        self.check_follow.setEnabled(available)
+        self.button_save.setEnabled(available and not self.busy)
+
+        if available and self.check_follow.isChecked():
+            if not self.follow_timer.isActive():
+                self.follow_timer.start()
+        else:
+            self.follow_timer.stop()
+
+    # reads length bytes starting at offset, a shorter result means that the
+    # end of the file was reached
+    # the error_callback is called with an error message if the range could not
+    # be read, including the log file being closed while reading
+    def read_range(self, offset, length, result_callback, show_progress=True, error_callback=None):
+        def report_error(message):
+            self.log('Error: ' + message)
+
+            if error_callback != None:
+                error_callback(message)
+
+        def cb_set_position(dummy):
+            if self.log_file == None:
+                self.busy = False
+
+                if error_callback != None:
+                    error_callback('Log file was closed')
+
+                return
+
             def cb_read_status(bytes_read, max_length):
                 self.progress_download.setValue(bytes_read)
 
             def cb_read(result):
-                self.log_file.release()
-                self.log_file = None
+                self.busy = False
 
-                self.label_download.setVisible(False)
-                self.progress_download.setVisible(False)
+                if self.log_file == None:
+                    if error_callback != None:
+                        error_callback('Log file was closed')
 
-                if result.error != None:
-                    self.log('Error: ' + html.escape(str(result.error)), bold=True)
                     return
 
-                try:
-                    self.content = result.data.decode('utf-8')
-                except UnicodeDecodeError:
-                    # FIXME: maybe add a encoding guesser here or try some common encodings if UTF-8 fails
-                    self.log('Error: Log file is not UTF-8 encoded', bold=True)
-                    return
+                if result.error != None:
+                    report_error(str(result.error))
+                else:
+                    result_callback(result.data)
 
-                self.button_save.setEnabled(True)
+                self.update_ui_state()
 
-                if self.continuous:
-                    content = self.content.lstrip()
-                else:
-                    content = self.content
+            try:
+                self.log_file.read_async(length, cb_read, cb_read_status if show_progress else None)
+            except Exception as e:
+                self.busy = False
+                report_error(str(e))
+                self.update_ui_state()
+
+        def cb_set_position_error(error):
+            self.busy = False
+            report_error('Could not seek in log file: ' + str(error))
+            self.update_ui_state()
+
+        self.busy          = True
+        self.show_progress = show_progress
+
+        if show_progress:
+            self.progress_download.setRange(0, max(length, 1))
+            self.progress_download.setValue(0)
+        else:
+            self.progress_download.setRange(0, 0)
 
-                self.edit_content.setPlainText('')
+        self.update_ui_state()
 
-                font = QFont('monospace')
-                font.setStyleHint(QFont.TypeWriter)
+        async_call(self.log_file.set_position, offset, cb_set_position, cb_set_position_error,
+                   pass_exception_to_error_callback=True)
 
-                self.edit_content.setFont(font)
-                self.edit_content.setPlainText(content)
+    def cb_read_initial(self, data):
+        self.end_offset += len(data)
 
-            self.progress_download.setRange(0, self.log_file.length)
-            self.log_file.read_async(self.log_file.length, cb_read, cb_read_status)
+        if self.continuous and self.start_offset == 0:
+            data = data.lstrip()
 
-        def cb_open_error():
-            self.label_download.setVisible(False)
-            self.progress_download.setVisible(False)
-            self.log('Error: Could not open log file', bold=True)
+        self.model.append(data)
+        self.list_content.scrollToBottom()
 
-        self.log_file = REDFile(session)
+    def read_older(self):
+        if self.busy or self.log_file == None or self.start_offset == 0:
+            return
 
-        async_call(self.log_file.open,
-                   (source_name, REDFile.FLAG_READ_ONLY | REDFile.FLAG_NON_BLOCKING, 0, 0, 0),
-                   cb_open, cb_open_error)
+        offset = max(0, self.start_offset - ProgramInfoLogsView.PAGE_LENGTH)
+        length = self.start_offset - offset
+
+        def cb_read_older(data):
+            at_start = offset == 0
+
+            if self.continuous and at_start:
+                data = data.lstrip()
 
+            # keep the first visible row in place while rows are prepended
+            old_count = self.model.rowCount()
+            scroll    = self.list_content.verticalScrollBar()
+            position  = scroll.value()
+
+            self.start_offset = offset
+            self.model.prepend(data, at_start)
+
+            scroll.setValue(position + self.model.rowCount() - old_count)
+
+        self.read_range(offset, length, cb_read_older)
+
+    def read_appended(self):
+        if self.busy or self.log_file == None:
+            return
+
+        def cb_read_appended(data):
+            if len(data) == 0:
+                return
+
+            scroll    = self.list_content.verticalScrollBar()
+            at_bottom = scroll.value() == scroll.maximum()
+
+            self.end_offset += len(data)
+            self.model.append(data)
+            self.start_offset += self.model.trim(ProgramInfoLogsView.MAX_FOLLOWED_LINES)
+
+            if at_bottom:
+                self.list_content.scrollToBottom()
+
+            # read the rest right away, if more was appended than fits into one read
+            if len(data) == ProgramInfoLogsView.FOLLOW_LENGTH:
+                QTimer.singleShot(0, self.read_appended)
+
+        self.read_range(self.end_offset, ProgramInfoLogsView.FOLLOW_LENGTH, cb_read_appended, show_progress=False)
+
+    def copy_selected_lines(self):
+        rows = sorted(index.row() for index in self.list_content.selectionModel().selectedIndexes())
+
+        QApplication.clipboard().setText('\n'.join(self.model.data(self.model.index(row)) for row in rows))
+
+    # downloads the whole log file in chunks directly into the target file,
+    # instead of keeping the whole log in memory
     def save_content(self):
+        if self.busy or self.log_file == None:
+            return
+
         filename = get_save_file_name(get_main_window(), 'Save Log', self.last_filename, 'Log(*.log)')
 
         if len(filename) == 0:
@@ -129,23 +437,50 @@ class ProgramInfoLogsView(QDialog, Ui_ProgramInfoLogsView):
         self.last_filename = filename
 
         try:
-            f = open(filename, 'w')
+            f = open(filename, 'wb')
         except Exception as e:
             QMessageBox.critical(get_main_window(), 'Save Log Error',
                                  'Could not open {0} for writing:\n\n{1}'.format(filename, e))
             return
 
-        try:
-            # FIXME: add progress dialog if content is bigger than some megabytes
-            f.write(self.content)
-        except Exception as e:
+        offset_ref = [0]
+
+        def cb_read_error(message):
+            f.close()
             QMessageBox.critical(get_main_window(), 'Save Log Error',
-                                 'Could not write to {0}:\n\n{1}'.format(filename, e))
+                                 'Could not read log file for {0}:\n\n{1}'.format(filename, message))
+
+        def cb_read_chunk(data):
+            try:
+                f.write(data)
+            except Exception as e:
+                f.close()
+                QMessageBox.critical(get_main_window(), 'Save Log Error',
+                                     'Could not write to {0}:\n\n{1}'.format(filename, e))
+                return
 
-        f.close()
+            offset_ref[0] += len(data)
 
-    def abort_download(self):
-        log_file = self.log_file
+            if len(data) == ProgramInfoLogsView.SAVE_CHUNK_LENGTH:
+                read_next_chunk()
+            else:
+                f.close()
+
+        def read_next_chunk():
+            if self.log_file == None:
+                cb_read_error('Log file was closed')
+                return
+
+            self.read_range(offset_ref[0], ProgramInfoLogsView.SAVE_CHUNK_LENGTH, cb_read_chunk,
+                            error_callback=cb_read_error)
+
+        read_next_chunk()
+
+    def close_log_file(self):
+        self.follow_timer.stop()
+
+        log_file      = self.log_file
+        self.log_file = None
 
         if log_file != None:
             try:
@@ -153,10 +488,8 @@ class ProgramInfoLogsView(QDialog, Ui_ProgramInfoLogsView):
             except:
                 pass
 
-    def log(self, message, bold=False, pre=False):
-        if bold:
-            self.edit_content.appendHtml('<b>{0}</b>'.format(html.escape(message)))
-        elif pre:
-            self.edit_content.appendHtml('<pre>{0}</pre>'.format(message))
-        else:
-            self.edit_content.appendPlainText(message)
+            log_file.release()
+
+    def log(self, message):
+        self.label_error.setText('<b>{0}</b>'.format(html.escape(message)))
+        self.label_error.setVisible(True)
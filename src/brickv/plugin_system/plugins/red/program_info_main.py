@@ -248,10 +248,25 @@ class ProgramInfoMain(QWidget, Ui_ProgramInfoMain):
         self.widget_logs.close_all_dialogs()
         self.widget_files.close_all_dialogs()
 
+    # the program object is cached in the program catalogue and outlives this
+    # widget, don't let it keep calling into this widget
+    def detach_program_callbacks(self):
+        self.program.scheduler_state_changed_callback      = None
+        self.program.lite_scheduler_state_changed_callback = None
+        self.program.process_spawned_callback              = None
+        self.program.lite_process_spawned_callback         = None
+
+        if self.program.last_spawned_process != None:
+            self.program.last_spawned_process.state_changed_callback = None
+
+        if self.program.last_spawned_lite_process != None:
+            self.program.last_spawned_lite_process.state_changed_callback = None
+
     def set_program_callbacks_enabled(self, enable):
         self.program.enable_callbacks = enable
 
-        if enable:
+        # while callbacks were disabled the details might have become outdated
+        if enable and not self.program.details_valid:
             self.refresh_program()
 
     def refresh_info(self):
@@ -28,6 +28,7 @@ import re
 import sys
 import errno
 import html
+import time
 
 from PyQt5.QtWidgets import QWizard
 from PyQt5.QtGui import QTextCursor
@@ -38,33 +39,37 @@ from brickv.plugin_system.plugins.red.program_utils import *
 from brickv.plugin_system.plugins.red.ui_program_page_download import Ui_ProgramPageDownload
 from brickv.load_pixmap import load_pixmap
 
+# maximum number of files that are downloaded at the same time. small files
+# are dominated by the open, read and close round trips, downloading several
+# of them at once hides this latency
+MAX_PARALLEL_DOWNLOADS = 8
+
+# maximum number of bytes requested but not received yet over all downloads
+DOWNLOAD_WINDOW_SIZE = 2 * 1024 * 1024
+
 class ChunkedDownloader(ChunkedDownloaderBase):
-    def __init__(self, page):
-        super().__init__(page.wizard().session)
+    def __init__(self, page, download):
+        super().__init__(page.wizard().session, page.wizard().script_manager, page.download_window)
 
-        self.page = page
-        self.scale_factor = 1
+        self.page             = page
+        self.download         = download
+        self.progress_maximum = 0
+        self.progress_value   = 0
 
     def report_error(self, message, *args):
         self.page.download_error('...error: ' + message, *args)
+        self.page.download_failed(self)
 
     def set_progress_maximum(self, maximum):
-        if maximum == 0:
-            self.scale_factor = 1.0 / 1000
-        else:
-            self.scale_factor = 1000.0 / maximum
-        self.page.progress_file.setRange(0, 1000)
+        self.progress_maximum = maximum
+        self.page.update_progress()
 
     def set_progress_value(self, value, message):
-        value *= self.scale_factor
-        self.page.progress_file.setValue(int(value))
-        self.page.progress_file.setFormat(message)
+        self.progress_value = value
+        self.page.update_progress()
 
     def done(self):
-        self.page.chunked_downloader = None
-
-        self.page.log('...done')
-        self.page.download_next_file()
+        self.page.download_finished(self)
 
 
 class ProgramPageDownload(ProgramPage, Ui_ProgramPageDownload):
@@ -84,10 +89,16 @@ class ProgramPageDownload(ProgramPage, Ui_ProgramPageDownload):
         self.download_successful             = False
         self.root_directory                  = None
         self.remaining_downloads             = downloads
-        self.download                        = None
+        self.active_downloaders              = [] # preparing, waiting for conflict resolution or downloading
+        self.conflicting_downloaders         = [] # the first one is shown for conflict resolution
+        self.failed_downloads                = []
+        self.finished_size                   = 0
+        self.download_window                 = TransferWindow(DOWNLOAD_WINDOW_SIZE)
+        self.start_time                      = None
+        self.download                        = None # of the shown conflict
         self.created_directories             = set()
-        self.target_path                     = None # abolsute path on host in host format
-        self.chunked_downloader              = None
+        self.target_path                     = None # abolsute path on host in host format, of the shown conflict
+        self.chunked_downloader              = None # of the shown conflict
         self.replace_help_template           = self.label_replace_help.text()
         self.canceled                        = False
 
@@ -147,11 +158,16 @@ class ProgramPageDownload(ProgramPage, Ui_ProgramPageDownload):
         self.line2.setVisible(self.conflict_resolution_in_progress)
 
     def cancel_download(self):
-        self.canceled      = True
-        chunked_downloader = self.chunked_downloader
+        self.canceled = True
+
+        for downloader in self.active_downloaders:
+            downloader.canceled = True
 
-        if chunked_downloader != None:
-            chunked_downloader.canceled = True
+        # these are prepared, but not started yet
+        for downloader in self.conflicting_downloaders:
+            downloader.discard()
+
+        self.conflicting_downloaders = []
 
     def check_new_name(self, name):
         target = os.path.split(self.download.target)[1]
@@ -218,39 +234,91 @@ class ProgramPageDownload(ProgramPage, Ui_ProgramPageDownload):
         self.next_step('Downloading {0}...'.format(self.download_kind), log=False)
 
         self.root_directory = self.wizard().program.root_directory
+        self.start_time     = time.monotonic()
+
+        self.progress_file.setRange(0, 1000)
+
+        self.start_next_downloads()
+
+    def update_progress(self):
+        value   = self.finished_size
+        maximum = self.finished_size
 
-        self.progress_file.setRange(0, len(self.remaining_downloads))
+        for downloader in self.active_downloaders:
+            value   += downloader.progress_value
+            maximum += downloader.progress_maximum
 
-        self.download_next_file()
+        if maximum > 0:
+            self.progress_file.setValue(int(value * 1000.0 / maximum))
+        else:
+            self.progress_file.setValue(0)
+
+        self.progress_file.setFormat('{0} of {1}, {2} file(s) in progress{3}'
+                                     .format(get_file_display_size(value), get_file_display_size(maximum),
+                                             len(self.active_downloaders), get_transfer_rate_display(value, self.start_time)))
 
-    def download_next_file(self):
+    def start_next_downloads(self):
         if self.canceled:
             return
 
-        if len(self.remaining_downloads) == 0:
+        while len(self.remaining_downloads) > 0 and len(self.active_downloaders) < MAX_PARALLEL_DOWNLOADS:
+            download                 = self.remaining_downloads[0]
+            self.remaining_downloads = self.remaining_downloads[1:]
+
+            if self.download_kind == 'logs':
+                source_path = posixpath.join(self.root_directory, 'log', download.source)
+            else:
+                source_path = posixpath.join(self.root_directory, 'bin', download.source)
+
+            self.label_current_step.setText('Downloading {0}...'.format(download.source))
+            self.log('Downloading {0}...'.format(download.source))
+
+            downloader = ChunkedDownloader(self, download)
+
+            self.active_downloaders.append(downloader)
+            downloader.prepare(source_path, lambda downloader=downloader: self.download_prepared(downloader))
+
+        if len(self.remaining_downloads) == 0 and len(self.active_downloaders) == 0:
             self.download_files_done()
-            return
 
-        self.download            = self.remaining_downloads[0]
-        self.remaining_downloads = self.remaining_downloads[1:]
+    # called for finished, skipped and failed downloads
+    def download_completed(self, downloader):
+        self.active_downloaders.remove(downloader)
+        self.progress_total.setValue(self.progress_total.value() + 1)
+        self.update_progress()
+        self.start_next_downloads()
 
-        if self.download_kind == 'logs':
-            source_path = posixpath.join(self.root_directory, 'log', self.download.source)
-        else:
-            source_path = posixpath.join(self.root_directory, 'bin', self.download.source)
+    def download_finished(self, downloader):
+        self.finished_size += downloader.progress_maximum
+
+        self.log('...done: {0}'.format(downloader.download.source))
+        self.download_completed(downloader)
+
+    def download_skipped(self, downloader):
+        downloader.discard()
+
+        self.log('...skipped: {0}'.format(downloader.download.source))
+        self.download_completed(downloader)
+
+    def download_failed(self, downloader):
+        if downloader not in self.active_downloaders:
+            return # already reported
 
-        self.next_step('Downloading {0}...'.format(self.download.source))
+        downloader.abort_after_error()
 
-        self.chunked_downloader = ChunkedDownloader(self)
+        self.failed_downloads.append(downloader.download.source)
+        self.download_completed(downloader)
 
-        if not self.chunked_downloader.prepare(source_path):
+    def download_prepared(self, downloader):
+        if self.canceled:
+            downloader.discard()
             return
 
-        self.target_path = os.path.join(self.download_directory, self.download.target)
+        downloader.target_path = os.path.join(self.download_directory, downloader.download.target)
 
         # create target directory, if necessary
-        if len(os.path.split(self.download.target)[0]) > 0:
-            target_directory = os.path.split(self.target_path)[0]
+        if len(os.path.split(downloader.download.target)[0]) > 0:
+            target_directory = os.path.split(downloader.target_path)[0]
 
             if target_directory not in self.created_directories:
                 try:
@@ -258,41 +326,57 @@ class ProgramPageDownload(ProgramPage, Ui_ProgramPageDownload):
                 except OSError as e:
                     if e.errno != errno.EEXIST:
                         self.download_error('...error: Could not create target directory {0}: {1}', target_directory, e)
+                        self.download_failed(downloader)
                         return
                 except Exception as e:
                     self.download_error('...error: Could not create target directory {0}: {1}', target_directory, e)
+                    self.download_failed(downloader)
                     return
 
                 self.created_directories.add(target_directory)
 
-        self.continue_download_file()
+        self.continue_download_file(downloader)
 
-    def continue_download_file(self, replace_existing=False):
-        if os.path.exists(self.target_path):
+    def continue_download_file(self, downloader, replace_existing=False):
+        if os.path.exists(downloader.target_path):
             if replace_existing:
                 try:
-                    os.remove(self.target_path)
+                    os.remove(downloader.target_path)
                 except Exception as e:
-                    self.download_error('...error: Could not replace target file {0}: {1}', self.target_path, e)
+                    self.download_error('...error: Could not replace target file {0}: {1}', downloader.target_path, e)
+                    self.download_failed(downloader)
                     return
             else:
-                self.start_conflict_resolution()
+                self.log('...target file {0} already exists'.format(downloader.target_path))
+                self.conflicting_downloaders.append(downloader)
+
+                if not self.conflict_resolution_in_progress:
+                    self.start_conflict_resolution()
+
                 return
 
         self.progress_file.setVisible(True)
-        self.chunked_downloader.start(self.target_path)
+        downloader.start(downloader.target_path)
 
+    # shows the first conflict, conflicts are resolved one after another while
+    # the other downloads continue
     def start_conflict_resolution(self):
-        self.log('...target file {0} already exists'.format(self.target_path))
-
-        if self.auto_conflict_resolution == ProgramPageDownload.CONFLICT_RESOLUTION_REPLACE:
-            self.log('...replacing {0}'.format(self.download.target))
-            self.continue_download_file(True)
-        elif self.auto_conflict_resolution == ProgramPageDownload.CONFLICT_RESOLUTION_SKIP:
-            self.log('...skipped')
-            self.download_next_file()
-        else:
-            self.progress_file.setVisible(False)
+        while len(self.conflicting_downloaders) > 0:
+            downloader = self.conflicting_downloaders[0]
+
+            if self.auto_conflict_resolution == ProgramPageDownload.CONFLICT_RESOLUTION_REPLACE:
+                self.conflicting_downloaders.pop(0)
+                self.log('...replacing {0}'.format(downloader.download.target))
+                self.continue_download_file(downloader, True)
+                continue
+            elif self.auto_conflict_resolution == ProgramPageDownload.CONFLICT_RESOLUTION_SKIP:
+                self.conflicting_downloaders.pop(0)
+                self.download_skipped(downloader)
+                continue
+
+            self.chunked_downloader = downloader
+            self.download           = downloader.download
+            self.target_path        = downloader.target_path
 
             try:
                 target_stat = os.stat(self.target_path)
@@ -315,6 +399,8 @@ class ProgramPageDownload(ProgramPage, Ui_ProgramPageDownload):
             self.conflict_resolution_in_progress = True
             self.update_ui_state()
 
+            return
+
     def resolve_conflict_by_replace(self):
         if not self.conflict_resolution_in_progress or self.check_rename_new_file.isChecked():
             return
@@ -329,7 +415,8 @@ class ProgramPageDownload(ProgramPage, Ui_ProgramPageDownload):
         self.conflict_resolution_in_progress = False
         self.update_ui_state()
 
-        self.continue_download_file(True)
+        self.continue_download_file(self.conflicting_downloaders.pop(0), True)
+        self.start_conflict_resolution()
 
     def rename_download_target(self, new_name):
         if not self.conflict_resolution_in_progress:
@@ -338,6 +425,9 @@ class ProgramPageDownload(ProgramPage, Ui_ProgramPageDownload):
         self.download    = Download(self.download.source, os.path.join(os.path.split(self.download.target)[0], new_name))
         self.target_path = os.path.join(self.download_directory, self.download.target)
 
+        self.chunked_downloader.download    = self.download
+        self.chunked_downloader.target_path = self.target_path
+
     def resolve_conflict_by_rename(self):
         if not self.conflict_resolution_in_progress or not self.check_rename_new_file.isChecked():
             return
@@ -353,7 +443,8 @@ class ProgramPageDownload(ProgramPage, Ui_ProgramPageDownload):
         self.conflict_resolution_in_progress = False
         self.update_ui_state()
 
-        self.continue_download_file(False)
+        self.continue_download_file(self.conflicting_downloaders.pop(0), False)
+        self.start_conflict_resolution()
 
     def skip_conflict(self):
         if not self.conflict_resolution_in_progress:
@@ -367,12 +458,21 @@ class ProgramPageDownload(ProgramPage, Ui_ProgramPageDownload):
         self.conflict_resolution_in_progress = False
         self.update_ui_state()
 
-        self.log('...skipped')
-        self.download_next_file()
+        self.download_skipped(self.conflicting_downloaders.pop(0))
+        self.start_conflict_resolution()
 
     def download_files_done(self):
         self.progress_file.setVisible(False)
 
+        if len(self.failed_downloads) > 0:
+            self.next_step('Download failed for {0} file(s)'.format(len(self.failed_downloads)), log=False)
+            self.log('Download failed for:', bold=True)
+
+            for source in self.failed_downloads:
+                self.log(source)
+
+            return
+
         # download successful
         self.next_step('Download successful!')
 
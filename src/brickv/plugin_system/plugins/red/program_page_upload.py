@@ -22,22 +22,27 @@ Free Software Foundation, Inc., 59 Temple Place - Suite 330,
 Boston, MA 02111-1307, USA.
 """
 
+import json
 import posixpath
 import stat
 import time
 import html
+import zlib
 
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QWizard
 
 from brickv.plugin_system.plugins.red.api import *
 from brickv.plugin_system.plugins.red.program_page import ProgramPage
 from brickv.plugin_system.plugins.red.program_utils import *
+from brickv.plugin_system.plugins.red.script_manager import check_script_result
 from brickv.plugin_system.plugins.red.ui_program_page_upload import Ui_ProgramPageUpload
 from brickv.load_pixmap import load_pixmap
+from brickv.async_call import async_call
 
 class ChunkedUploader(ChunkedUploaderBase):
     def __init__(self, page):
-        super().__init__(page.wizard().session)
+        super().__init__(page.wizard().session, page.wizard().script_manager)
 
         self.page = page
         self.scale_factor = 1
@@ -59,9 +64,7 @@ class ChunkedUploader(ChunkedUploaderBase):
 
     def done(self):
         self.page.chunked_uploader = None
-
-        self.page.log('...done')
-        self.page.upload_next_file()
+        self.page.upload_file_done()
 
 class ProgramPageUpload(ProgramPage, Ui_ProgramPageUpload):
     CONFLICT_RESOLUTION_REPLACE = 1
@@ -90,6 +93,12 @@ class ProgramPageUpload(ProgramPage, Ui_ProgramPageUpload):
         self.replace_help_template           = self.label_replace_help.text()
         self.warnings                        = 0
         self.canceled                        = False
+        self.target_digests                  = {} # target -> (size, block digests) of existing files
+        self.unchanged_uploads               = 0
+        self.compared_upload_size            = 0
+        self.transferred_upload_size         = 0
+        self.changed_file_permissions        = None # permissions to apply after writing changes
+        self.changed_file_copy_path          = None # copy of the existing file the changes are written to
 
         self.setTitle(title_prefix + 'Upload')
 
@@ -143,6 +152,8 @@ class ProgramPageUpload(ProgramPage, Ui_ProgramPageUpload):
         self.button_reset_new_name.setVisible(self.conflict_resolution_in_progress and rename_new_file)
         self.label_new_name_help.setVisible(self.conflict_resolution_in_progress and rename_new_file)
         self.check_remember_decision.setVisible(self.conflict_resolution_in_progress)
+        self.check_upload_changes_only.setVisible(self.edit_mode)
+        self.check_upload_changes_only.setEnabled(self.button_start_upload.isEnabled())
         self.button_replace.setVisible(self.conflict_resolution_in_progress and not rename_new_file)
         self.button_rename.setVisible(self.conflict_resolution_in_progress and rename_new_file)
         self.button_skip.setVisible(self.conflict_resolution_in_progress)
@@ -155,6 +166,8 @@ class ProgramPageUpload(ProgramPage, Ui_ProgramPageUpload):
         if chunked_uploader != None:
             chunked_uploader.canceled = True
 
+        self.remove_changed_file_copy()
+
         if not self.edit_mode and self.program_defined:
             try:
                 self.program.purge() # FIXME: async_call
@@ -218,12 +231,22 @@ class ProgramPageUpload(ProgramPage, Ui_ProgramPageUpload):
 
         self.log(message, bold=True)
 
+        self.remove_changed_file_copy()
+
         if not self.edit_mode and self.program_defined:
             try:
                 self.program.purge() # FIXME: async_call
             except (Error, REDError):
                 pass # FIXME: report this error?
 
+    def remove_changed_file_copy(self):
+        if self.changed_file_copy_path == None:
+            return
+
+        self.wizard().script_manager.execute_script('delete', None, [json.dumps([self.changed_file_copy_path]), json.dumps([])])
+
+        self.changed_file_copy_path = None
+
     def get_total_step_count(self):
         count = 0
 
@@ -253,6 +276,7 @@ class ProgramPageUpload(ProgramPage, Ui_ProgramPageUpload):
 
     def start_upload(self):
         self.button_start_upload.setEnabled(False)
+        self.check_upload_changes_only.setEnabled(False)
         self.wizard().setOption(QWizard.DisabledBackButtonOnLastPage, True)
 
         self.remaining_uploads = self.wizard().page(Constants.PAGE_FILES).get_uploads()
@@ -346,7 +370,37 @@ class ProgramPageUpload(ProgramPage, Ui_ProgramPageUpload):
 
         self.progress_file.setRange(0, len(self.remaining_uploads))
 
-        self.upload_next_file()
+        if self.edit_mode and self.check_upload_changes_only.isChecked():
+            self.get_target_digests()
+        else:
+            self.upload_next_file()
+
+    def get_target_digests(self):
+        def cb_file_digests(result):
+            if self.canceled:
+                return
+
+            okay, message = check_script_result(result, decode_stderr=True)
+
+            if okay:
+                try:
+                    self.target_digests = json.loads(zlib.decompress(memoryview(result.stdout)).decode('utf-8'))
+                except Exception as e:
+                    okay    = False
+                    message = 'Received invalid data: {0}'.format(e)
+
+            if not okay:
+                self.target_digests = {}
+                self.upload_warning('...warning: Could not compare existing files, uploading all files completely: {0}', message)
+
+            self.upload_next_file()
+
+        self.log('...comparing existing files')
+
+        self.wizard().script_manager.execute_script('file_digests', cb_file_digests,
+                                                    [posixpath.join(self.root_directory, 'bin'), str(UPLOAD_DIGEST_BLOCK_SIZE)] +
+                                                    [upload.target for upload in self.remaining_uploads],
+                                                    max_length=10*1024*1024, decode_output_as_utf8=False)
 
     def upload_next_file(self):
         if self.canceled:
@@ -357,9 +411,11 @@ class ProgramPageUpload(ProgramPage, Ui_ProgramPageUpload):
             self.set_configuration()
             return
 
-        self.upload            = self.remaining_uploads[0]
-        self.remaining_uploads = self.remaining_uploads[1:]
-        source_path            = self.upload.source
+        self.upload                   = self.remaining_uploads[0]
+        self.remaining_uploads        = self.remaining_uploads[1:]
+        self.changed_file_permissions = None
+        self.changed_file_copy_path   = None
+        source_path                   = self.upload.source
 
         self.next_step('Uploading {0}...'.format(source_path))
 
@@ -385,12 +441,148 @@ class ProgramPageUpload(ProgramPage, Ui_ProgramPageUpload):
 
         self.continue_upload_file()
 
-    def continue_upload_file(self, replace_existing=False):
-        flags = REDFile.FLAG_WRITE_ONLY | REDFile.FLAG_CREATE | REDFile.FLAG_NON_BLOCKING | REDFile.FLAG_EXCLUSIVE
+    def upload_file_done(self):
+        if self.changed_file_permissions == None:
+            self.log('...done')
+            self.upload_next_file()
+            return
 
-        if replace_existing:
-            flags |= REDFile.FLAG_REPLACE
+        # the changes were written to a copy of the existing file, replace the
+        # existing file with it in one step, so a running program never sees a
+        # partially written file
+        def cb_rename(result):
+            if self.canceled:
+                return
+
+            okay, message = check_script_result(result)
+
+            if not okay:
+                self.upload_error('...error: Could not replace target file {0}: {1}', self.target_path, message)
+                return
+
+            self.changed_file_copy_path = None
+
+            self.log('...done')
+            self.upload_next_file()
+
+        # the existing file or its copy keeps the permissions of the existing file
+        def cb_change_permissions(result):
+            if self.canceled:
+                return
+
+            okay, message = check_script_result(result)
+
+            if not okay:
+                self.upload_error('...error: Could not set permissions of target file {0}: {1}', self.target_path, message)
+                return
+
+            if self.changed_file_copy_path != None:
+                self.wizard().script_manager.execute_script('rename', cb_rename,
+                                                            [self.changed_file_copy_path, self.target_path])
+            else:
+                self.log('...done')
+                self.upload_next_file()
+
+        permissions                   = self.changed_file_permissions
+        self.changed_file_permissions = None
+
+        if self.changed_file_copy_path != None:
+            path = self.changed_file_copy_path
+        else:
+            path = self.target_path
 
+        self.wizard().script_manager.execute_script('change_permissions', cb_change_permissions,
+                                                    [path, str(permissions)])
+
+    # only called after the user decided to replace the existing file
+    def upload_file_changes(self):
+        def cb_get_file_block_digests(source_digests):
+            if self.canceled:
+                return
+
+            self.upload_file_changes_with_digests(source_digests)
+
+        def cb_get_file_block_digests_error(error):
+            if self.canceled:
+                return
+
+            self.upload_error('...error: Could not read source file {0}: {1}', self.upload.source, error)
+
+        async_call(get_file_block_digests, self.upload.source, cb_get_file_block_digests,
+                   cb_get_file_block_digests_error, pass_exception_to_error_callback=True)
+
+    def upload_file_changes_with_digests(self, source_digests):
+        target_size, target_digests = self.target_digests[self.upload.target]
+        source_size                 = self.chunked_uploader.source_stat.st_size
+
+        ranges = get_changed_file_ranges(source_size, source_digests, target_size, target_digests)
+
+        self.compared_upload_size += source_size
+
+        if ranges == None:
+            # existing file is larger than the new file, replace it completely
+            self.transferred_upload_size += source_size
+            self.upload_file_completely(True)
+            return
+
+        changed_size                  = sum(length for offset, length in ranges)
+        self.transferred_upload_size += changed_size
+
+        if changed_size == 0:
+            self.unchanged_uploads       += 1
+            self.changed_file_permissions = self.get_upload_permissions()
+
+            self.chunked_uploader.source_file.close()
+            self.chunked_uploader = None
+
+            self.log('...unchanged, content skipped')
+
+            # avoid unbounded recursion for many unchanged files
+            QTimer.singleShot(0, self.upload_file_done)
+            return
+
+        self.log('...uploading {0} of {1} that changed'.format(get_file_display_size(changed_size),
+                                                               get_file_display_size(source_size)))
+
+        # write the changes to a copy of the existing file in the same directory,
+        # it replaces the existing file after all changes are written
+        target_directory, target_name = posixpath.split(self.target_path)
+        copy_path                     = posixpath.join(target_directory, '.{0}.brickv-upload'.format(target_name))
+
+        def cb_copy_file(result):
+            if self.canceled:
+                return
+
+            okay, message = check_script_result(result)
+
+            if not okay:
+                self.upload_error('...error: Could not copy target file {0}: {1}', self.target_path, message)
+                return
+
+            self.changed_file_copy_path = copy_path
+
+            try:
+                self.target_file = REDFile(self.wizard().session).open(copy_path,
+                                                                       REDFile.FLAG_WRITE_ONLY | REDFile.FLAG_NON_BLOCKING,
+                                                                       0, 1000, 1000) # FIXME: async_call
+            except (Error, REDError) as e:
+                self.upload_error('...error: Could not open target file {0}: {1}', copy_path, e)
+                return
+
+            self.changed_file_permissions = self.get_upload_permissions()
+
+            self.progress_file.setVisible(True)
+            self.chunked_uploader.start(copy_path, self.target_file, ranges)
+
+        self.wizard().script_manager.execute_script('copy_file', cb_copy_file, [self.target_path, copy_path])
+
+    def continue_upload_file(self, replace_existing=False):
+        if replace_existing and self.upload.target in self.target_digests:
+            self.upload_file_changes()
+        else:
+            self.upload_file_completely(replace_existing)
+
+    def get_upload_permissions(self):
         # FIXME: preserving the executable bit this way only works well on
         #        Linux and macOS hosts. on Windows Python deduces this from
         #        the file extension. this does not work if the executable is
@@ -408,6 +600,16 @@ class ProgramPageUpload(ProgramPage, Ui_ProgramPageUpload):
            posixpath.normpath(self.command[0]) == posixpath.normpath(self.upload.target):
             permissions = 0o755
 
+        return permissions
+
+    def upload_file_completely(self, replace_existing):
+        flags = REDFile.FLAG_WRITE_ONLY | REDFile.FLAG_CREATE | REDFile.FLAG_NON_BLOCKING | REDFile.FLAG_EXCLUSIVE
+
+        if replace_existing:
+            flags |= REDFile.FLAG_REPLACE
+
+        permissions = self.get_upload_permissions()
+
         try:
             self.target_file = REDFile(self.wizard().session).open(self.target_path, flags,
                                                                    permissions, 1000, 1000) # FIXME: async_call
@@ -634,6 +836,13 @@ class ProgramPageUpload(ProgramPage, Ui_ProgramPageUpload):
         self.upload_done()
 
     def upload_done(self):
+        if self.compared_upload_size > 0:
+            self.log('Skipped {0} unchanged file(s), transferred {1} instead of {2} (saved {3})'
+                     .format(self.unchanged_uploads,
+                             get_file_display_size(self.transferred_upload_size),
+                             get_file_display_size(self.compared_upload_size),
+                             get_file_display_size(self.compared_upload_size - self.transferred_upload_size)))
+
         if self.warnings == 1:
             self.next_step('Upload finished with 1 warning!')
         elif self.warnings > 1:
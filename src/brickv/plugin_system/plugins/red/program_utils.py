@@ -24,6 +24,11 @@ Boston, MA 02111-1307, USA.
 import re
 import os
 import stat
+import json
+import zlib
+import hashlib
+import time
+import uuid
 import posixpath
 from collections import namedtuple
 
@@ -32,6 +37,7 @@ from PyQt5.QtWidgets import QListWidget, QListWidgetItem, QTreeWidgetItem, \
                          QProgressDialog, QProgressBar, QInputDialog
 
 from brickv.plugin_system.plugins.red.api import *
+from brickv.plugin_system.plugins.red.script_manager import check_script_result
 from brickv.async_call import async_call
 
 ExecutableVersion = namedtuple('ExecutableVersion', 'executable version')
@@ -1167,11 +1173,88 @@ class ComboBoxFileEndingChecker:
             self.combo_file.clearEditText()
 
 
+# files smaller than this are always transferred uncompressed
+COMPRESSED_TRANSFER_MIN_SIZE = 64 * 1024
+
+# compression has to reduce the size of the sample at least this much
+COMPRESSED_TRANSFER_MAX_RATIO = 0.9
+
+# decides based on the first 64 KiB of a local file if compressing it is worth it
+def is_compressed_transfer_worth_it(path, size):
+    if size < COMPRESSED_TRANSFER_MIN_SIZE:
+        return False
+
+    try:
+        with open(path, 'rb') as f:
+            sample = f.read(COMPRESSED_TRANSFER_MIN_SIZE)
+    except:
+        return False
+
+    return len(zlib.compress(sample, 1)) < len(sample) * COMPRESSED_TRANSFER_MAX_RATIO
+
+
+def get_transfer_rate_display(size, start_time):
+    elapsed = time.monotonic() - start_time
+
+    if elapsed < 1:
+        return ''
+
+    return ' ({0}/s)'.format(get_file_display_size(size / elapsed))
+
+
+# maximum number of bytes requested per read if no transfer window is used
+DOWNLOAD_READ_LENGTH = 10 * 1000 * 1000
+
+# maximum number of bytes requested per read from a transfer window, so that
+# parallel downloads share the window
+DOWNLOAD_WINDOW_READ_LENGTH = 256 * 1024
+
+
+class TransferWindow:
+    # limits the total number of bytes that are requested but not received yet
+    # over several parallel transfers. a transfer that gets no share of the window
+    # is resumed by calling its waiting_callback once another transfer releases
+    # its share
+    def __init__(self, size):
+        self.size      = size
+        self.available = size
+        self.waiting   = []
+
+    def acquire(self, length, waiting_callback):
+        length = min(length, self.available)
+
+        if length <= 0:
+            self.waiting.append(waiting_callback)
+            return 0
+
+        self.available -= length
+
+        return length
+
+    def release(self, length):
+        self.available += length
+        waiting         = self.waiting
+        self.waiting    = []
+
+        for waiting_callback in waiting:
+            waiting_callback()
+
+
 class ChunkedDownloaderBase:
-    def __init__(self, session):
+    # if a script manager is given then files are compressed on the RED Brick
+    # before the download, if that makes the transfer smaller. if a transfer
+    # window is given then the reads of all downloaders sharing it are limited
+    # by its size
+    def __init__(self, session, script_manager=None, window=None):
         self.session               = session
+        self.script_manager        = script_manager
+        self.window                = window
+        self.read_length           = 0 # requested by the current read
         self.source_path           = None # abolsute path on RED Brick in POSIX format
         self.source_file           = None
+        self.compressed_path       = None # absolute path of compressed temporary file on RED Brick
+        self.compressed_file       = None
+        self.decompressor          = None
         self.target_path           = None # abolsute path on host in host format
         self.target_file           = None
         self.source_display_size   = None
@@ -1179,13 +1262,31 @@ class ChunkedDownloaderBase:
         self.current_progress      = None
         self.next_progress_update  = None
         self.last_download_size    = None
+        self.progress_scale        = 1.0 # uncompressed bytes per transferred byte
+        self.start_time            = None
         self.canceled              = False
 
+    def get_transfer_file(self):
+        if self.compressed_file != None:
+            return self.compressed_file
+
+        return self.source_file
+
+    def get_progress_message(self, progress):
+        message = get_file_display_size(progress) + ' of ' + self.source_display_size + \
+                  get_transfer_rate_display(progress, self.start_time)
+
+        if self.compressed_file != None:
+            message += ', compressed'
+
+        return message
+
     def download_read_async_cb_result(self, result):
-        if self.canceled:
-            if isinstance(result.error, REDError) and result.error.error_code == REDError.E_OPERATION_ABORTED:
-                self.download_read_async_cleanup()
+        self.release_read_length()
 
+        if self.canceled:
+            # the read might have completed before the abort took effect
+            self.download_read_async_cleanup()
             return
 
         if result.error != None:
@@ -1193,7 +1294,10 @@ class ChunkedDownloaderBase:
             return
 
         try:
-            self.target_file.write(result.data)
+            if self.decompressor != None:
+                self.target_file.write(self.decompressor.decompress(result.data))
+            else:
+                self.target_file.write(result.data)
         except Exception as e:
             self.report_error('Could not write to target file {0}: {1}', self.target_path, e)
             return
@@ -1208,33 +1312,56 @@ class ChunkedDownloaderBase:
     def download_read_async_cb_status(self, download_size, download_total):
         if self.canceled:
             try:
-                self.source_file.abort_async_read()
+                self.get_transfer_file().abort_async_read()
             except:
                 pass
 
             return
 
-        self.next_progress_update += download_size - self.last_download_size
+        self.next_progress_update += (download_size - self.last_download_size) * self.progress_scale
         self.last_download_size    = download_size
 
         if self.current_progress // (100 * 1024) != self.next_progress_update // (100 * 1024):
             self.current_progress = self.next_progress_update
 
-            self.set_progress_value(self.next_progress_update,
-                                    get_file_display_size(self.next_progress_update) + \
-                                    ' of ' + self.source_display_size)
+            self.set_progress_value(int(self.next_progress_update),
+                                    self.get_progress_message(int(self.next_progress_update)))
+
+    def release_read_length(self):
+        if self.window != None and self.read_length > 0:
+            self.window.release(self.read_length)
+
+        self.read_length = 0
 
     def download_read_async(self):
         if self.canceled:
+            # no read is in flight that would clean up on abort
+            if self.target_file != None:
+                self.download_read_async_cleanup()
+
             return
 
+        if self.remaining_source_size == 0:
+            self.download_read_async_done()
+            return
+
+        if self.window != None:
+            self.read_length = self.window.acquire(min(self.remaining_source_size, DOWNLOAD_WINDOW_READ_LENGTH),
+                                                   self.download_read_async)
+
+            if self.read_length == 0:
+                return # the window calls download_read_async again
+        else:
+            self.read_length = min(self.remaining_source_size, DOWNLOAD_READ_LENGTH)
+
         self.last_download_size = 0
 
         try:
-            self.source_file.read_async(min(self.remaining_source_size, 1000*1000*10), # Read 10mb at a time
-                                        self.download_read_async_cb_result,
-                                        self.download_read_async_cb_status)
+            self.get_transfer_file().read_async(self.read_length,
+                                                self.download_read_async_cb_result,
+                                                self.download_read_async_cb_status)
         except (Error, REDError) as e:
+            self.release_read_length()
             self.report_error('Could not read from source file {0}: {1}', self.source_path, e)
 
     def download_read_async_cleanup(self):
@@ -1260,38 +1387,77 @@ class ChunkedDownloaderBase:
         self.source_file.release()
         self.source_file = None
 
+        if self.compressed_file != None:
+            self.compressed_file.release()
+            self.compressed_file = None
+
+        if self.compressed_path != None:
+            self.script_manager.execute_script('delete', None, [json.dumps([self.compressed_path]), json.dumps([])])
+            self.compressed_path = None
+
     def download_read_async_done(self):
         if self.canceled:
             return
 
-        self.set_progress_value(self.source_file.length, self.source_display_size + ' of ' + self.source_display_size)
+        if self.decompressor != None:
+            try:
+                self.target_file.write(self.decompressor.flush())
+            except Exception as e:
+                self.report_error('Could not write to target file {0}: {1}', self.target_path, e)
+                return
+
+        self.set_progress_value(self.source_file.length, self.get_progress_message(self.source_file.length))
 
         self.download_read_async_cleanup()
         self.done()
 
-    def prepare(self, source_path):
+    # opens the source file without blocking, so that several downloaders can
+    # prepare in parallel. the prepared_callback is called on success only
+    def prepare(self, source_path, prepared_callback):
         self.source_path = source_path
 
-        try:
-            self.source_file = REDFile(self.session).open(self.source_path,
-                                                          REDFile.FLAG_READ_ONLY | REDFile.FLAG_NON_BLOCKING,
-                                                          0, 0, 0) # FIXME: async_call
-        except (Error, REDError) as e:
-            self.report_error('Could not open source file {0}: {1}', self.source_path, e)
-            return False
+        def cb_open(source_file):
+            if self.canceled:
+                source_file.release()
+                return
 
-        self.source_display_size   = get_file_display_size(self.source_file.length)
-        self.remaining_source_size = self.source_file.length
-        self.current_progress      = 0
-        self.next_progress_update  = 0
+            self.source_file           = source_file
+            self.source_display_size   = get_file_display_size(self.source_file.length)
+            self.remaining_source_size = self.source_file.length
+            self.current_progress      = 0
+            self.next_progress_update  = 0
 
-        self.set_progress_maximum(self.source_file.length)
-        self.set_progress_value(0, get_file_display_size(0) + ' of ' + self.source_display_size)
+            self.set_progress_maximum(self.source_file.length)
+            self.set_progress_value(0, get_file_display_size(0) + ' of ' + self.source_display_size)
 
-        return True
+            prepared_callback()
+
+        def cb_open_error(error):
+            if not self.canceled:
+                self.report_error('Could not open source file {0}: {1}', self.source_path, error)
+
+        async_call(REDFile(self.session).open,
+                   (self.source_path, REDFile.FLAG_READ_ONLY | REDFile.FLAG_NON_BLOCKING, 0, 0, 0),
+                   cb_open, cb_open_error, pass_exception_to_error_callback=True)
+
+    # releases the prepared source file if the download is not started
+    def discard(self):
+        if self.source_file != None:
+            self.source_file.release()
+            self.source_file = None
+
+    # cleans up after report_error was called, no read is in flight then
+    def abort_after_error(self):
+        self.canceled = True
+
+        if self.target_file != None:
+            self.download_read_async_cleanup()
+        else:
+            self.discard()
 
     def start(self, target_path):
         self.target_path = target_path
+        self.start_time  = time.monotonic()
 
         try:
             self.target_file = open(self.target_path, 'wb')
@@ -1299,7 +1465,50 @@ class ChunkedDownloaderBase:
             self.report_error('Could not open target file {0}: {1}', self.target_path, e)
             return
 
-        self.download_read_async()
+        if self.script_manager == None or self.source_file.length < COMPRESSED_TRANSFER_MIN_SIZE:
+            self.download_read_async()
+            return
+
+        def cb_compress(result):
+            okay, _ = check_script_result(result)
+
+            try:
+                compressed = json.loads(result.stdout) if okay else {}
+            except:
+                compressed = {}
+
+            if not isinstance(compressed, dict):
+                compressed = {}
+
+            if self.canceled:
+                self.compressed_path = compressed.get('path')
+                self.download_read_async_cleanup()
+                return
+
+            # fall back to an uncompressed download on any problem
+            if compressed.get('path') == None:
+                self.download_read_async()
+                return
+
+            self.compressed_path = compressed['path']
+
+            try:
+                self.compressed_file = REDFile(self.session).open(self.compressed_path,
+                                                                  REDFile.FLAG_READ_ONLY | REDFile.FLAG_NON_BLOCKING,
+                                                                  0, 0, 0) # FIXME: async_call
+            except (Error, REDError):
+                self.compressed_file = None
+                self.download_read_async()
+                return
+
+            self.decompressor          = zlib.decompressobj()
+            self.remaining_source_size = self.compressed_file.length
+            self.progress_scale        = self.source_file.length / max(self.compressed_file.length, 1)
+
+            self.download_read_async()
+
+        self.set_progress_value(0, 'Compressing...')
+        self.script_manager.execute_script('zlib_transfer', cb_compress, ['compress', self.source_path])
 
     def report_error(self, message, *args):
         pass
@@ -1314,19 +1523,83 @@ class ChunkedDownloaderBase:
         pass
 
 
+# block size used to compare existing files on the RED Brick with new files
+UPLOAD_DIGEST_BLOCK_SIZE = 64 * 1024
+
+# returns the list of MD5 hex digests of all blocks of a local file
+def get_file_block_digests(path, block_size=UPLOAD_DIGEST_BLOCK_SIZE):
+    digests = []
+
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(block_size)
+
+            if len(block) == 0:
+                break
+
+            digests.append(hashlib.md5(block).hexdigest())
+
+    return digests
+
+
+# returns a list of (offset, length) tuples of the blocks that have to be
+# written to turn the target file into the source file. returns None if the
+# target file has to be replaced completely, because files cannot be truncated
+def get_changed_file_ranges(source_size, source_digests, target_size, target_digests,
+                            block_size=UPLOAD_DIGEST_BLOCK_SIZE):
+    if target_size > source_size:
+        return None
+
+    ranges = []
+
+    for i, source_digest in enumerate(source_digests):
+        if i < len(target_digests) and target_digests[i] == source_digest:
+            continue
+
+        offset = i * block_size
+        length = min(block_size, source_size - offset)
+
+        # merge adjacent blocks to reduce the number of seeks
+        if len(ranges) > 0 and ranges[-1][0] + ranges[-1][1] == offset:
+            ranges[-1] = (ranges[-1][0], ranges[-1][1] + length)
+        else:
+            ranges.append((offset, length))
+
+    return ranges
+
+
 class ChunkedUploaderBase:
-    def __init__(self, session):
+    # if a script manager is given then compressible files are uploaded
+    # compressed and decompressed on the RED Brick afterwards
+    def __init__(self, session, script_manager=None):
         self.session               = session
+        self.script_manager        = script_manager
         self.source_path           = None # abolsute path on host in host format
         self.source_file           = None
         self.target_path           = None # abolsute path on RED Brick in POSIX format
         self.target_file           = None
+        self.final_target_file     = None # actual target file while uploading to compressed_path
+        self.compressed_path       = None # absolute path of compressed temporary file on RED Brick
+        self.compressor            = None
         self.source_stat           = None
         self.source_display_size   = None
         self.current_progress      = None
         self.next_progress_update  = None
         self.last_download_size    = None
+        self.progress_scale        = 1.0 # uncompressed bytes per transferred byte
+        self.start_time            = None
         self.canceled              = False
+        self.remaining_ranges      = None # list of (offset, length) tuples, None for a full upload
+        self.remaining_range_size  = 0
+
+    def get_progress_message(self, progress):
+        message = get_file_display_size(progress) + ' of ' + self.source_display_size + \
+                  get_transfer_rate_display(progress, self.start_time)
+
+        if self.compressed_path != None:
+            message += ', compressed'
+
+        return message
 
     def upload_write_async_cb_status(self, upload_size, upload_total):
         if self.canceled:
@@ -1337,15 +1610,14 @@ class ChunkedUploaderBase:
 
             return
 
-        self.next_progress_update += upload_size - self.last_upload_size
+        self.next_progress_update += (upload_size - self.last_upload_size) * self.progress_scale
         self.last_upload_size = upload_size
 
         if self.current_progress // (100 * 1024) != self.next_progress_update // (100 * 1024):
             self.current_progress = self.next_progress_update
 
-            self.set_progress_value(self.next_progress_update,
-                                    get_file_display_size(self.next_progress_update) + \
-                                    ' of ' + self.source_display_size)
+            self.set_progress_value(int(self.next_progress_update),
+                                    self.get_progress_message(int(self.next_progress_update)))
 
     def upload_write_async_cb_result(self, error):
         if self.canceled:
@@ -1363,12 +1635,55 @@ class ChunkedUploaderBase:
         if self.canceled:
             return
 
+        read_length = 1000*1000*10 # Read 10mb at a time
+
+        if self.remaining_ranges != None:
+            if self.remaining_range_size == 0:
+                if len(self.remaining_ranges) == 0:
+                    self.upload_write_async_done()
+                    return
+
+                offset, self.remaining_range_size = self.remaining_ranges.pop(0)
+
+                try:
+                    self.source_file.seek(offset)
+                except Exception as e:
+                    self.report_error('Could not seek in source file {0}: {1}', self.source_path, e)
+                    return
+
+                try:
+                    self.target_file.set_position(offset) # FIXME: async_call
+                except (Error, REDError) as e:
+                    self.report_error('Could not seek in target file {0}: {1}', self.target_path, e)
+                    return
+
+            read_length                = min(read_length, self.remaining_range_size)
+            self.remaining_range_size -= read_length
+
         try:
-            data = self.source_file.read(1000*1000*10) # Read 10mb at a time
+            data = self.source_file.read(read_length)
         except Exception as e:
             self.report_error('Could not read from source file {0}: {1}', self.source_path, e)
             return
 
+        self.progress_scale = 1.0
+
+        if self.compressor != None:
+            source_length = len(data)
+
+            if source_length > 0:
+                data = self.compressor.compress(data)
+            else:
+                data            = self.compressor.flush()
+                self.compressor = None
+
+            if len(data) > 0:
+                self.progress_scale = source_length / len(data)
+            elif self.compressor != None:
+                # compressor buffered everything, continue with the next chunk
+                self.upload_write_async()
+                return
+
         if len(data) == 0:
             self.upload_write_async_done()
             return
@@ -1384,6 +1699,13 @@ class ChunkedUploaderBase:
         self.target_file.release()
         self.target_file = None
 
+        if self.final_target_file != None:
+            self.final_target_file.release()
+            self.final_target_file = None
+
+            if self.canceled:
+                self.script_manager.execute_script('delete', None, [json.dumps([self.compressed_path]), json.dumps([])])
+
         self.source_file.close()
         self.source_file = None
 
@@ -1391,10 +1713,31 @@ class ChunkedUploaderBase:
         if self.canceled:
             return
 
-        self.set_progress_value(self.source_stat.st_size, self.source_display_size + ' of ' + self.source_display_size)
+        if self.compressed_path == None:
+            if self.remaining_ranges != None:
+                self.set_progress_value(self.next_progress_update, self.get_progress_message(self.next_progress_update))
+            else:
+                self.set_progress_value(self.source_stat.st_size, self.get_progress_message(self.source_stat.st_size))
+
+            self.upload_write_async_cleanup()
+            self.done()
+            return
+
+        def cb_decompress(result):
+            okay, message = check_script_result(result, decode_stderr=True)
 
+            if not okay:
+                self.report_error('Could not decompress target file {0}: {1}', self.target_path, message)
+                return
+
+            self.set_progress_value(self.source_stat.st_size, self.get_progress_message(self.source_stat.st_size))
+            self.done()
+
+        # releasing the actual target file finishes its creation, then the
+        # uploaded data can be decompressed into it
         self.upload_write_async_cleanup()
-        self.done()
+        self.set_progress_value(self.source_stat.st_size, 'Decompressing...')
+        self.script_manager.execute_script('zlib_transfer', cb_decompress, ['decompress', self.compressed_path, self.target_path])
 
     def prepare(self, source_path):
         self.source_path = source_path
@@ -1416,9 +1759,36 @@ class ChunkedUploaderBase:
 
         return True
 
-    def start(self, target_path, target_file):
+    # if ranges is given then only these (offset, length) tuples of the source
+    # file are written to the same offsets of the already existing target file
+    def start(self, target_path, target_file, ranges=None):
         self.target_path = target_path
         self.target_file = target_file
+        self.start_time  = time.monotonic()
+
+        if ranges != None:
+            total_size                = sum(length for offset, length in ranges)
+            self.remaining_ranges     = list(ranges)
+            self.remaining_range_size = 0
+            self.source_display_size  = get_file_display_size(total_size)
+
+            self.set_progress_maximum(total_size)
+            self.set_progress_value(0, get_file_display_size(0) + ' of ' + self.source_display_size)
+        elif self.script_manager != None and is_compressed_transfer_worth_it(self.source_path, self.source_stat.st_size):
+            compressed_path = '/tmp/brickv-upload-{0}.z'.format(uuid.uuid4().hex)
+
+            try:
+                compressed_file = REDFile(self.session).open(compressed_path,
+                                                             REDFile.FLAG_WRITE_ONLY | REDFile.FLAG_CREATE | REDFile.FLAG_EXCLUSIVE | REDFile.FLAG_NON_BLOCKING,
+                                                             0o600, 0, 0) # FIXME: async_call
+            except (Error, REDError):
+                compressed_file = None # fall back to an uncompressed upload
+
+            if compressed_file != None:
+                self.final_target_file = self.target_file
+                self.target_file       = compressed_file
+                self.compressed_path   = compressed_path
+                self.compressor        = zlib.compressobj(6)
 
         self.upload_write_async()
 
@@ -225,6 +225,10 @@ class Terminal:
         self.cy = 0
         # Tab stops
         self.tab_stops = list(range(0, self.w, 8))
+        # Dump cache, only dirty lines are rebuilt by dump()
+        self.dirty_lines = set(range(self.h))
+        self.dump_lines = [None] * self.h
+        self.dump_state = None
 
     # UTF-8 functions
     def utf8_decode(self, d):
@@ -275,6 +279,8 @@ class Terminal:
     def poke(self, y, x, s):
         pos = self.w * y + x
         self.screen[pos:pos + len(s)] = s
+        if len(s) > 0:
+            self.dirty_lines.update(range(pos // self.w, (pos + len(s) - 1) // self.w + 1))
 
     def fill(self, y0, x0, y1, x1, char):
         n = self.w * (y1 - y0 - 1) + (x1 - x0)
@@ -469,6 +475,7 @@ class Terminal:
                 if ((state and not self.vt100_mode_alt_screen) or
                         (not state and self.vt100_mode_alt_screen)):
                     self.screen, self.screen2 = self.screen2, self.screen
+                    self.dirty_lines.update(range(self.h))
                     self.vt100_saved, self.vt100_saved2 = self.vt100_saved2, self.vt100_saved
                 self.vt100_mode_alt_screen = state
             elif m == '?67':
@@ -1049,48 +1056,64 @@ class Terminal:
                     o += chr(10)
         return o
 
-    def dump(self):
-        screen = []
+    def dump_line(self, y, cx, cy):
+        line = [""]
         attr_ = -1
-        cx, cy = min(self.cx, self.w - 1), self.cy
-        for y in range(0, self.h):
-            wx = 0
-            line = [""]
-            for x in range(0, self.w):
-                d = self.screen[y * self.w + x]
-                char = d & 0xffff
-                attr = d >> 16
-                # Cursor
-                if cy == y and cx == x and self.vt100_mode_cursor:
-                    attr = attr & 0xfff0 | 0x000c
-                # Attributes
-                if attr != attr_:
-                    if attr_ != -1:
-                        line.append("")
-                    bg = attr & 0x000f
-                    fg = (attr & 0x00f0) >> 4
-                    # Inverse
-                    inv = attr & 0x0200
-                    inv2 = self.vt100_mode_inverse
-                    if (inv and not inv2) or (inv2 and not inv):
-                        fg, bg = bg, fg
-                    # Concealed
-                    if attr & 0x0400:
-                        fg = 0xc
-                    # Underline
-                    if attr & 0x0100:
-                        ul = True
-                    else:
-                        ul = False
-                    line.append((fg, bg, ul))
+        wx = 0
+        for x in range(0, self.w):
+            d = self.screen[y * self.w + x]
+            char = d & 0xffff
+            attr = d >> 16
+            # Cursor
+            if cy == y and cx == x and self.vt100_mode_cursor:
+                attr = attr & 0xfff0 | 0x000c
+            # Attributes
+            if attr != attr_:
+                if attr_ != -1:
                     line.append("")
-                    attr_ = attr
-                wx += self.utf8_charwidth(char)
-                if wx <= self.w:
-                    line[-1] += chr(char)
-            screen.append(line)
+                bg = attr & 0x000f
+                fg = (attr & 0x00f0) >> 4
+                # Inverse
+                inv = attr & 0x0200
+                inv2 = self.vt100_mode_inverse
+                if (inv and not inv2) or (inv2 and not inv):
+                    fg, bg = bg, fg
+                # Concealed
+                if attr & 0x0400:
+                    fg = 0xc
+                # Underline
+                if attr & 0x0100:
+                    ul = True
+                else:
+                    ul = False
+                line.append((fg, bg, ul))
+                line.append("")
+                attr_ = attr
+            wx += self.utf8_charwidth(char)
+            if wx <= self.w:
+                line[-1] += chr(char)
+        return line
 
-        return (cx, cy), screen
+    def dump(self):
+        # Every line starts with its own attributes, so that a single line
+        # can be rebuilt and painted without looking at the lines above it.
+        # Returns the cursor position, all lines and the rows that changed
+        # since the last dump
+        cx, cy = min(self.cx, self.w - 1), self.cy
+        state = (cx, cy, self.vt100_mode_cursor, self.vt100_mode_inverse)
+        dirty = self.dirty_lines
+        self.dirty_lines = set()
+        if state != self.dump_state:
+            if self.dump_state == None or state[3] != self.dump_state[3]:
+                dirty.update(range(self.h))
+            else:
+                dirty.add(self.dump_state[1])
+                dirty.add(cy)
+            self.dump_state = state
+        rows = sorted(y for y in dirty if 0 <= y < self.h)
+        for y in rows:
+            self.dump_lines[y] = self.dump_line(y, cx, cy)
+        return (cx, cy), list(self.dump_lines), rows
 
 
 class SerialSession(QObject):
@@ -1104,6 +1127,11 @@ class SerialSession(QObject):
         self.read_loop_stopped = True
         self.thread = None
         self.serial = None
+        # the terminal is written by the read loop and dumped by the GUI
+        self.lock = threading.Lock()
+        # set while a screen update was signaled but not yet dumped. this
+        # coalesces all data received in the meantime into a single update
+        self.update_pending = False
         self.signal_update_screen.connect(self.parent.update_screen)
 
     def start(self):
@@ -1115,13 +1143,24 @@ class SerialSession(QObject):
         self.read_loop_stopped = False
         while not self.read_loop_stopped:
             try:
-                d = self.serial.read(1)
+                # block for the first byte, then take everything available
+                # at once instead of feeding the terminal byte by byte
+                d = self.serial.read(max(1, self.serial.in_waiting))
             except:
                 continue
 
-            self.term.write(d)
-            self.signal_update_screen.emit()
-            d = self.term.read()
+            if not d:
+                continue
+
+            with self.lock:
+                self.term.write(d)
+                d = self.term.read()
+                signal = not self.update_pending
+                self.update_pending = True
+
+            if signal:
+                self.signal_update_screen.emit()
+
             if d:
                 try:
                     self.serial.write(d)
@@ -1144,8 +1183,11 @@ class SerialSession(QObject):
 
     def dump(self):
         if self.term == None:
-            return ""
-        return self.term.dump()
+            return (0, 0), [], []
+
+        with self.lock:
+            self.update_pending = False
+            return self.term.dump()
 
     def write(self, data):
         try:
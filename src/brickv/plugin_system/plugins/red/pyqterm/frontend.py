@@ -3,7 +3,7 @@ import time
 
 import sys
 
-from PyQt5.QtCore import QRect, Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtCore import QRect, Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QClipboard, QPainter, QFont, QBrush, QColor, QPen, QPixmap, QContextMenuEvent
 from PyQt5.QtWidgets import QApplication, QWidget
 
@@ -97,7 +97,9 @@ class TerminalWidget(QWidget):
         self.setFont(font)
         self._session = None
         self._last_update = 0
+        self._update_scheduled = False
         self._screen = []
+        self._dirty_rows = set()
         self._text = []
         self._cursor_rect = None
         self._cursor_col = 0
@@ -186,23 +188,31 @@ class TerminalWidget(QWidget):
         if self._session == None:
             return
 
-        # max 25 fps
+        # max 25 fps. an update that comes too early is deferred instead of
+        # dropped, otherwise the last chunk of a burst would not be shown
+        # until the next update arrives
         new_update = time.time()
+        elapsed = new_update - self._last_update
+
+        if elapsed < 0.040:
+            if not self._update_scheduled:
+                self._update_scheduled = True
+                QTimer.singleShot(int((0.040 - elapsed) * 1000) + 1, self._scheduled_update_screen)
 
-        if (new_update - self._last_update) < 0.040:
             return
 
         self._last_update = new_update
 
-        old_screen = self._screen
-        (self._cursor_col, self._cursor_row), self._screen = self._session.dump()
+        (self._cursor_col, self._cursor_row), self._screen, dirty_rows = self._session.dump()
         self._update_cursor_rect()
-
-        if old_screen != self._screen:
-            self._dirty = True
+        self._dirty_rows.update(dirty_rows)
 
         self.repaint()
 
+    def _scheduled_update_screen(self):
+        self._update_scheduled = False
+        self.update_screen()
+
     def paintEvent(self, event):
         # the original code tried to be clever about painting an caching. it
         # only painted the screen if it was dirty. for the redraws when the
@@ -213,13 +223,20 @@ class TerminalWidget(QWidget):
             self._pixmap = QPixmap(self.size())
             self._dirty = True
 
-        if self._dirty:
-            self._dirty = False
-
+        if self._dirty or len(self._dirty_rows) > 0:
             pixmap_painter = QPainter(self._pixmap)
             pixmap_painter.setFont(self.font())
 
-            self._paint_screen(pixmap_painter)
+            if self._dirty or len(self._text) != len(self._screen):
+                self._paint_screen(pixmap_painter)
+            else:
+                # only repaint the lines that changed since the last dump
+                self._paint_screen(pixmap_painter, sorted(self._dirty_rows))
+
+            pixmap_painter.end()
+
+            self._dirty = False
+            self._dirty_rows.clear()
 
         painter = QPainter(self)
         painter.drawPixmap(0, 0, self._pixmap)
@@ -257,7 +274,7 @@ class TerminalWidget(QWidget):
         painter.drawRect(self._cursor_rect)
         self._cursor_rect = None
 
-    def _paint_screen(self, painter):
+    def _paint_screen(self, painter, rows=None):
         # Speed hacks: local name lookups are faster
         vars().update(QColor=QColor, QBrush=QBrush, QPen=QPen, QRect=QRect)
         background_color_map = self.background_color_map
@@ -266,26 +283,32 @@ class TerminalWidget(QWidget):
         painter_fillRect = painter.fillRect
         painter_setPen = painter.setPen
         align = Qt.AlignTop | Qt.AlignLeft
+        char_height = self._char_height[0]
         # set defaults
         background_color = background_color_map[14]
         foreground_color = foreground_color_map[15]
-        brush = QBrush(QColor(background_color))
-        painter_fillRect(self.rect(), brush)
-        pen = QPen(QColor(foreground_color))
-        painter_setPen(pen)
-        y = 0
-        text = []
-        text_append = text.append
+        default_brush = QBrush(QColor(background_color))
+        default_pen = QPen(QColor(foreground_color))
+
+        if rows == None:
+            rows = range(len(self._screen))
+            painter_fillRect(self.rect(), default_brush)
+            self._text = [""] * len(self._screen)
 
-        for row, line in enumerate(self._screen):
+        for row in rows:
+            line = self._screen[row]
+            y = row * char_height
             col = 0
             text_line = ""
+            brush = default_brush
+            painter_setPen(default_pen)
+            painter_fillRect(QRect(0, y, self.width(), char_height), brush)
 
             for item in line:
                 if isinstance(item, str):
                     x = self._char_width[col]
                     length = len(item)
-                    rect = QRect(x, y, x + self._char_width[length], y + self._char_height[0])
+                    rect = QRect(x, y, self._char_width[length], char_height)
                     painter_fillRect(rect, brush)
                     painter_drawText(rect, align, item)
                     col += length
@@ -298,10 +321,7 @@ class TerminalWidget(QWidget):
                     brush = QBrush(QColor(background_color))
                     painter_setPen(pen)
 
-            y += self._char_height[0]
-            text_append(text_line)
-
-        self._text = text
+            self._text[row] = text_line
 
     def _paint_selection(self, painter):
         pcol = QColor(200, 200, 200, 50)
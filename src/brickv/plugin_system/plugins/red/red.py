@@ -56,6 +56,8 @@ class RED(PluginBase, Ui_RED):
             self.report_fatal_error('Could not create session', str(e), traceback.format_exc())
             return
 
+        self.session.state_changed.connect(self.session_state_changed)
+
         try:
             self.script_manager = ScriptManager(self.session)
         except Exception as e:
@@ -104,6 +106,15 @@ class RED(PluginBase, Ui_RED):
 
         QTimer.singleShot(250, functools.partial(self.query_image_version, functools.partial(self.query_extensions, self.query_bindings_versions)))
 
+    def session_state_changed(self, state):
+        message_id = 'red_session_state_' + self.device_info.uid
+
+        if state == REDSession.STATE_AT_RISK:
+            get_main_window().show_status('RED Brick [{0}] does not respond to session keep-alive requests, the session will be lost if this continues'.format(self.device_info.uid),
+                                          message_id=message_id)
+        else:
+            get_main_window().hide_status(message_id)
+
     def show_extension(self, ext):
         self.tab_widget.setCurrentWidget(self.tab_extension)
         self.tab_widget.currentWidget().tab_widget.setCurrentIndex(ext)
@@ -421,7 +432,10 @@ class RED(PluginBase, Ui_RED):
             self.dialog_update_tinkerforge_software = None
 
     def get_health_metric_names(self):
-        return []
+        return ['Session State']
 
     def get_health_metric_values(self):
-        return {}
+        if self.session == None:
+            return {}
+
+        return {'Session State': REDSession.STATE_NAMES[self.session.state]}
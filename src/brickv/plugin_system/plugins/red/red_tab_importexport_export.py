@@ -22,9 +22,7 @@ Boston, MA 02111-1307, USA.
 """
 
 import os
-import posixpath
 import time
-import html
 
 from PyQt5.QtCore import QTimer, QDateTime
 from PyQt5.QtWidgets import QWidget, QTreeWidgetItem, QMessageBox
@@ -33,50 +31,10 @@ from brickv.async_call import async_call
 from brickv.utils import get_main_window, get_home_path, get_save_file_name
 from brickv.plugin_system.plugins.red.ui_red_tab_importexport_export import Ui_REDTabImportExportExport
 from brickv.plugin_system.plugins.red.api import *
-from brickv.plugin_system.plugins.red.program_utils import Constants, ChunkedDownloaderBase, ExpandingProgressDialog
+from brickv.plugin_system.plugins.red.program_utils import Constants, ExpandingProgressDialog, \
+                                                      get_file_display_size, get_transfer_rate_display
 from brickv.plugin_system.plugins.red.script_manager import report_script_result
 
-class ChunkedDownloader(ChunkedDownloaderBase):
-    def __init__(self, widget):
-        super().__init__(widget.session)
-
-        self.widget = widget
-        self.scale_factor = 1
-
-    def report_error(self, message, *args):
-        string_args = []
-
-        for arg in args:
-            string_args.append(html.escape(str(arg)))
-
-        if len(string_args) > 0:
-            message = message.format(*tuple(string_args))
-
-        self.widget.progress.close()
-        QMessageBox.critical(get_main_window(), 'Export Error', message)
-
-    def set_progress_maximum(self, maximum):
-        if maximum == 0:
-            self.scale_factor = 1.0 / 1000
-        else:
-            self.scale_factor = 1000.0 / maximum
-        if self.widget.progress.isVisible():
-            self.widget.progress.setRange(0, 1000)
-
-    def set_progress_value(self, value, message):
-        value *= self.scale_factor
-        if self.widget.progress.isVisible():
-            self.widget.progress.setValue(int(value))
-            self.widget.progress.set_progress_text(message)
-
-    def done(self):
-        self.widget.chunked_downloader = None
-
-        self.widget.progress.close()
-        QMessageBox.information(get_main_window(), 'Export Success',
-                                'Selected programs successfully exported.')
-
-
 class REDTabImportExportExport(QWidget, Ui_REDTabImportExportExport):
     def __init__(self):
         QWidget.__init__(self)
@@ -90,7 +48,6 @@ class REDTabImportExportExport(QWidget, Ui_REDTabImportExportExport):
         self.refresh_in_progress = False
         self.last_directory      = get_home_path()
         self.progress            = None
-        self.chunked_downloader  = None
 
         self.tree_programs.setColumnWidth(0, 150)
         self.tree_programs.setColumnWidth(1, 150)
@@ -174,7 +131,29 @@ class REDTabImportExportExport(QWidget, Ui_REDTabImportExportExport):
             return
 
         self.last_directory = os.path.split(target_path)[0]
+
+        try:
+            target_file = open(target_path, 'wb')
+        except Exception as e:
+            QMessageBox.critical(get_main_window(), 'Export Error',
+                                 'Could not open target file {0}: {1}'.format(target_path, e))
+            return
+
         script_instance_ref = [None]
+        received_ref        = [0]
+        start_time          = time.monotonic()
+
+        def close_target_file(remove):
+            try:
+                target_file.close()
+            except:
+                pass
+
+            if remove:
+                try:
+                    os.remove(target_path)
+                except:
+                    pass
 
         def progress_canceled():
             script_instance = script_instance_ref[0]
@@ -182,17 +161,12 @@ class REDTabImportExportExport(QWidget, Ui_REDTabImportExportExport):
             if script_instance != None:
                 self.script_manager.abort_script(script_instance)
 
-            chunked_downloader = self.chunked_downloader
-
-            if chunked_downloader != None:
-                chunked_downloader.canceled = True
-
         self.progress = ExpandingProgressDialog(self)
         self.progress.set_progress_text_visible(False)
         self.progress.setModal(True)
         self.progress.setWindowTitle('Export Archive')
-        self.progress.setLabelText('Step 1 of 2: Archiving selected programs')
-        self.progress.setRange(0, 0)
+        self.progress.setLabelText('Archiving and downloading selected programs')
+        self.progress.setRange(0, 0) # the archive size is unknown until it is complete
         self.progress.setAutoClose(False)
         self.progress.canceled.connect(progress_canceled)
         self.progress.show()
@@ -202,6 +176,26 @@ class REDTabImportExportExport(QWidget, Ui_REDTabImportExportExport):
         for selected_item in self.tree_programs.selectedItems():
             selected_identifiers.append(selected_item.text(1))
 
+        def cb_export_stdout(data):
+            if target_file.closed:
+                return
+
+            try:
+                target_file.write(data)
+            except Exception as e:
+                self.script_manager.abort_script(script_instance_ref[0])
+                close_target_file(True)
+                self.progress.close()
+                QMessageBox.critical(get_main_window(), 'Export Error',
+                                     'Could not write to target file {0}: {1}'.format(target_path, e))
+                return
+
+            received_ref[0] += len(data)
+
+            self.progress.setLabelText('Archiving and downloading selected programs\n\n' +
+                                       get_file_display_size(received_ref[0]) + ' received' +
+                                       get_transfer_rate_display(received_ref[0], start_time))
+
         def cb_export(result):
             script_instance = script_instance_ref[0]
 
@@ -212,23 +206,26 @@ class REDTabImportExportExport(QWidget, Ui_REDTabImportExportExport):
 
             script_instance_ref[0] = None
 
-            if aborted:
+            if target_file.closed: # writing to the target file failed
                 return
 
-            if not report_script_result(result, 'Export Error', 'Could not archive selected programs',
-                                        before_message_box=self.progress.close):
+            if aborted:
+                close_target_file(True)
                 return
 
-            # step 2/2: download created archive
-            source_path             = posixpath.join(result.stdout.strip(), 'archive.tfrba')
-            self.chunked_downloader = ChunkedDownloader(self)
+            def before_message_box():
+                close_target_file(True)
+                self.progress.close()
 
-            if not self.chunked_downloader.prepare(source_path):
+            if not report_script_result(result, 'Export Error', 'Could not archive selected programs',
+                                        before_message_box=before_message_box):
                 return
 
-            self.progress.setLabelText('Step 2 of 2: Downloading archive')
-            self.progress.set_progress_text_visible(True)
-            self.chunked_downloader.start(target_path)
+            close_target_file(False)
+            self.progress.close()
+            QMessageBox.information(get_main_window(), 'Export Success',
+                                    'Selected programs successfully exported.')
 
-        # step 1/2: run export script to create archive
-        script_instance_ref[0] = self.script_manager.execute_script('export', cb_export, selected_identifiers)
+        # the export script writes the archive to stdout while creating it
+        script_instance_ref[0] = self.script_manager.execute_script('export', cb_export, selected_identifiers,
+                                                                    stdout_callback=cb_export_stdout)
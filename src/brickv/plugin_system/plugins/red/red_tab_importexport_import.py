@@ -22,10 +22,9 @@ Boston, MA 02111-1307, USA.
 """
 
 import os
-import posixpath
+import time
 import tarfile
 import contextlib
-import html
 
 from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QWidget, QTreeWidgetItem, QMessageBox
@@ -34,48 +33,9 @@ from brickv.async_call import async_call
 from brickv.utils import get_main_window, get_home_path, get_open_file_name
 from brickv.plugin_system.plugins.red.ui_red_tab_importexport_import import Ui_REDTabImportExportImport
 from brickv.plugin_system.plugins.red.api import *
-from brickv.plugin_system.plugins.red.program_utils import Constants, ChunkedUploaderBase, ExpandingProgressDialog
-from brickv.plugin_system.plugins.red.script_manager import report_script_result
-
-class ChunkedUploader(ChunkedUploaderBase):
-    def __init__(self, widget, done_callback):
-        super().__init__(widget.session)
-
-        self.widget        = widget
-        self.done_callback = done_callback
-        self.scale_factor = 1
-
-    def report_error(self, message, *args):
-        string_args = []
-
-        for arg in args:
-            string_args.append(html.escape(str(arg)))
-
-        if len(string_args) > 0:
-            message = message.format(*tuple(string_args))
-
-        self.widget.progress.close()
-        QMessageBox.critical(get_main_window(), 'Import Error', message)
-
-    def set_progress_maximum(self, maximum):
-        if maximum == 0:
-            self.scale_factor = 1.0 / 1000
-        else:
-            self.scale_factor = 1000.0 / maximum
-        if self.widget.progress.isVisible():
-            self.widget.progress.setRange(0, 1000)
-
-    def set_progress_value(self, value, message):
-        value *= self.scale_factor
-        if self.widget.progress.isVisible():
-            self.widget.progress.setValue(int(value))
-            self.widget.progress.set_progress_text(message)
-
-    def done(self):
-        self.widget.chunked_uploader = None
-
-        self.done_callback()
-
+from brickv.plugin_system.plugins.red.program_utils import Constants, ExpandingProgressDialog, \
+                                                      get_file_display_size, get_transfer_rate_display
+from brickv.plugin_system.plugins.red.script_manager import ScriptStream, report_script_result
 
 class REDTabImportExportImport(QWidget, Ui_REDTabImportExportImport):
     def __init__(self):
@@ -88,7 +48,6 @@ class REDTabImportExportImport(QWidget, Ui_REDTabImportExportImport):
         self.image_version       = None # Set from REDTabImportExport
         self.refresh_in_progress = False
         self.progress            = None
-        self.chunked_uploader    = None
 
         self.button_browse_archive.clicked.connect(self.browse_archive)
         self.edit_archive.textChanged.connect(self.update_ui_state)
@@ -255,25 +214,32 @@ class REDTabImportExportImport(QWidget, Ui_REDTabImportExportImport):
         if len(source_path) == 0:
             return
 
+        try:
+            source_file = open(source_path, 'rb')
+            source_size = os.fstat(source_file.fileno()).st_size
+        except Exception as e:
+            QMessageBox.critical(get_main_window(), 'Import Error',
+                                 'Could not open source file {0}: {1}'.format(source_path, e))
+            return
+
         script_instance_ref = [None]
+        sent_ref            = [0] # bytes written to the stdin pipe
+        consumed_ref        = [0] # bytes consumed by the import script
+        writing_ref         = [False]
+        ack_buffer_ref      = [b'']
+        start_time          = time.monotonic()
 
         def progress_canceled():
-            chunked_uploader = self.chunked_uploader
-
-            if chunked_uploader != None:
-                chunked_uploader.canceled = True
-
             script_instance = script_instance_ref[0]
 
             if script_instance != None:
                 self.script_manager.abort_script(script_instance)
 
         self.progress = ExpandingProgressDialog(self)
-        self.progress.set_progress_text_visible(False)
         self.progress.setModal(True)
         self.progress.setWindowTitle('Import Archive')
-        self.progress.setLabelText('Step 1 of 4: Creating import directory')
-        self.progress.setRange(0, 0)
+        self.progress.setLabelText('Step 1 of 2: Uploading and extracting archive')
+        self.progress.setRange(0, 1000)
         self.progress.setAutoClose(False)
         self.progress.canceled.connect(progress_canceled)
         self.progress.show()
@@ -283,53 +249,81 @@ class REDTabImportExportImport(QWidget, Ui_REDTabImportExportImport):
         for selected_item in self.tree_programs.selectedItems():
             selected_identifiers.append(selected_item.text(1))
 
-        import_directory_ref = [None]
+        def report_error(message):
+            script_instance = script_instance_ref[0]
+
+            if script_instance != None:
+                self.script_manager.abort_script(script_instance)
+
+            self.progress.close()
+            QMessageBox.critical(get_main_window(), 'Import Error', message)
+
+        # the script reports the consumed bytes, starting with 0 once it is
+        # running. only write as much as fits into the stdin pipe without
+        # blocking, the pipe is non-blocking and excess data would be lost
+        def write_next_chunk():
+            script_instance = script_instance_ref[0]
 
-        def extract_archive():
-            def cb_import_extract(result):
-                script_instance = script_instance_ref[0]
+            if script_instance == None or script_instance.abort or writing_ref[0] or source_file.closed:
+                return
 
-                if script_instance != None:
-                    aborted = script_instance.abort
-                else:
-                    aborted = False
+            length = min(ScriptStream.PIPE_LENGTH // 2 - (sent_ref[0] - consumed_ref[0]),
+                         source_size - sent_ref[0], 256 * 1024)
 
-                script_instance_ref[0] = None
+            if length <= 0:
+                return
 
-                if aborted:
+            try:
+                data = source_file.read(length)
+            except Exception as e:
+                report_error('Could not read from source file {0}: {1}'.format(source_path, e))
+                return
+
+            def cb_write(error):
+                writing_ref[0] = False
+
+                if script_instance.abort:
                     return
 
-                if not report_script_result(result, 'Import Error', 'Could not extract archive',
-                                            before_message_box=self.progress.close):
+                if error != None:
+                    report_error('Could not write archive to RED Brick: {0}'.format(error))
                     return
 
-                def cb_restart_reboot_shutdown(result):
-                    self.progress.close()
+                write_next_chunk()
+
+            writing_ref[0] = True
+            sent_ref[0]   += len(data)
+
+            try:
+                script_instance.stream.write(data, cb_write)
+            except Exception as e:
+                writing_ref[0] = False
+                report_error('Could not write archive to RED Brick: {0}'.format(e))
 
-                    report_script_result(result, 'Import Error', 'Could not reboot RED Brick to finish program import')
+        def cb_import_extract_stdout(data):
+            lines             = (ack_buffer_ref[0] + data).split(b'\n')
+            ack_buffer_ref[0] = lines.pop()
 
-                # step 4/4: reboot
-                self.progress.setLabelText('Step 4 of 4: Rebooting RED Brick')
-                self.progress.setRange(0, 0)
+            if len(lines) == 0:
+                return
 
-                self.script_manager.execute_script('restart_reboot_shutdown_systemd',
-                                                   cb_restart_reboot_shutdown, ['1'])
+            try:
+                consumed_ref[0] = int(lines[-1])
+            except ValueError:
+                return
 
-                def close_progress():
-                    # use a closure to capture self and ansure that it's safe
-                    # to call this even if the tab was official destroyed already
-                    self.progress.close()
+            if source_size > 0:
+                self.progress.setValue(int(consumed_ref[0] * 1000 / source_size))
 
-                QTimer.singleShot(1500, close_progress)
+            self.progress.set_progress_text(get_file_display_size(consumed_ref[0]) + ' of ' +
+                                            get_file_display_size(source_size) +
+                                            get_transfer_rate_display(consumed_ref[0], start_time))
 
-            # step 3/4: extract uploaded archive
-            self.progress.setLabelText('Step 3 of 4: Extracting archive')
-            self.progress.setRange(0, 0)
+            write_next_chunk()
 
-            script_instance_ref[0] = self.script_manager.execute_script('import_extract', cb_import_extract,
-                                                                        [import_directory_ref[0]] + selected_identifiers)
+        def cb_import_extract(result):
+            source_file.close()
 
-        def cb_import_directory(result):
             script_instance = script_instance_ref[0]
 
             if script_instance != None:
@@ -342,28 +336,32 @@ class REDTabImportExportImport(QWidget, Ui_REDTabImportExportImport):
             if aborted:
                 return
 
-            if not report_script_result(result, 'Import Error', 'Could not create import directory',
+            if not report_script_result(result, 'Import Error', 'Could not extract archive',
                                         before_message_box=self.progress.close):
                 return
 
-            # step 2/4: upload archive to temporary import directory
-            import_directory_ref[0] = result.stdout.strip()
-            target_path             = posixpath.join(import_directory_ref[0], 'archive.tfrba')
-            self.chunked_uploader   = ChunkedUploader(self, extract_archive)
+            def cb_restart_reboot_shutdown(result):
+                self.progress.close()
 
-            if not self.chunked_uploader.prepare(source_path):
-                return
+                report_script_result(result, 'Import Error', 'Could not reboot RED Brick to finish program import')
 
-            try:
-                target_file = REDFile(self.session).open(target_path, REDFile.FLAG_WRITE_ONLY | REDFile.FLAG_CREATE | REDFile.FLAG_NON_BLOCKING | REDFile.FLAG_EXCLUSIVE, 0o644, 1000, 1000) # FIXME: async_call
-            except (Error, REDError) as e:
-                QMessageBox.information(get_main_window(), 'Import Error',
-                                        'Could not open target file {0}: {1}'.format(target_path, e))
-                return
+            # step 2/2: reboot
+            self.progress.setLabelText('Step 2 of 2: Rebooting RED Brick')
+            self.progress.setRange(0, 0)
+
+            self.script_manager.execute_script('restart_reboot_shutdown_systemd',
+                                               cb_restart_reboot_shutdown, ['1'])
+
+            def close_progress():
+                # use a closure to capture self and ansure that it's safe
+                # to call this even if the tab was official destroyed already
+                self.progress.close()
 
-            self.progress.setLabelText('Step 2 of 4: Uploading archive')
-            self.progress.set_progress_text_visible(True)
-            self.chunked_uploader.start(target_path, target_file)
+            QTimer.singleShot(1500, close_progress)
 
-        # step 1/4: create temporary import directory
-        script_instance_ref[0] = self.script_manager.execute_script('import_directory', cb_import_directory, execute_as_user=True)
+        # step 1/2: stream the archive to the import script, it extracts the
+        # selected programs while the archive is being uploaded
+        script_instance_ref[0] = self.script_manager.execute_script('import_extract', cb_import_extract,
+                                                                    [str(source_size)] + selected_identifiers,
+                                                                    stdout_callback=cb_import_extract_stdout,
+                                                                    with_stdin=True)
@@ -25,12 +25,17 @@ Boston, MA 02111-1307, USA.
 import re
 import os
 import html
+import json
+import time
+import zlib
 
 from PyQt5.QtWidgets import QWidget, QPlainTextEdit, QMessageBox
 from PyQt5.QtGui import QTextOption, QFont
 
 from brickv.plugin_system.plugins.red.ui_red_tab_importexport_systemlogs import Ui_REDTabImportExportSystemLogs
 from brickv.plugin_system.plugins.red.api import *
+from brickv.plugin_system.plugins.red.program_utils import get_transfer_rate_display
+from brickv.plugin_system.plugins.red.script_manager import check_script_result
 from brickv.async_call import async_call
 from brickv.utils import get_main_window, get_home_path, get_save_file_name
 
@@ -82,6 +87,8 @@ class REDTabImportExportSystemLogs(QWidget, Ui_REDTabImportExportSystemLogs):
         self.script_manager = None # Set from REDTabImportExport
         self.image_version  = None # Set from REDTabImportExport
         self.log_file       = None
+        self.compress_script = None
+        self.refresh_in_progress = False
         self.image_version_lt_1_10 = True
         self.populated_custom_log_files = False
         self.logs           = [
@@ -144,9 +151,11 @@ class REDTabImportExportSystemLogs(QWidget, Ui_REDTabImportExportSystemLogs):
         pass
 
     def refresh_log(self):
-        if self.log_file != None:
+        if self.refresh_in_progress:
             return
 
+        self.refresh_in_progress = True
+
         log = self.logs[self.combo_log.currentIndex()]
 
         log.reset()
@@ -158,9 +167,18 @@ class REDTabImportExportSystemLogs(QWidget, Ui_REDTabImportExportSystemLogs):
         self.button_cancel.setVisible(True)
         self.button_refresh.setEnabled(False)
 
+        compressed_path = None
+        start_time      = time.monotonic()
+
         def done():
-            self.log_file.release()
-            self.log_file = None
+            if self.log_file != None:
+                self.log_file.release()
+                self.log_file = None
+
+            self.refresh_in_progress = False
+
+            if compressed_path != None:
+                self.script_manager.execute_script('delete', None, [json.dumps([compressed_path]), json.dumps([])])
 
             self.label_download.setVisible(False)
             self.progress_download.setVisible(False)
@@ -171,6 +189,13 @@ class REDTabImportExportSystemLogs(QWidget, Ui_REDTabImportExportSystemLogs):
             def cb_read_status(bytes_read, max_length):
                 self.progress_download.setValue(bytes_read)
 
+                if compressed_path != None:
+                    self.label_download.setText('Downloading {0} (compressed){1}'
+                                                .format(log.source_name, get_transfer_rate_display(bytes_read, start_time)))
+                else:
+                    self.label_download.setText('Downloading {0}{1}'
+                                                .format(log.source_name, get_transfer_rate_display(bytes_read, start_time)))
+
             def cb_read(result):
                 done()
 
@@ -180,8 +205,17 @@ class REDTabImportExportSystemLogs(QWidget, Ui_REDTabImportExportSystemLogs):
 
                     return
 
+                data = result.data
+
+                if compressed_path != None:
+                    try:
+                        data = zlib.decompress(data)
+                    except zlib.error as e:
+                        log.log('Error: Could not decompress log file: ' + html.escape(str(e)), bold=True)
+                        return
+
                 try:
-                    content = result.data.decode('utf-8')
+                    content = data.decode('utf-8')
                 except UnicodeDecodeError:
                     # FIXME: maybe add a encoding guesser here or try some common encodings if UTF-8 fails
                     log.log('Error: Log file is not UTF-8 encoded', bold=True)
@@ -200,11 +234,47 @@ class REDTabImportExportSystemLogs(QWidget, Ui_REDTabImportExportSystemLogs):
 
             done()
 
-        self.log_file = REDFile(self.session)
+        def open_log_file(name):
+            self.log_file = REDFile(self.session)
+
+            async_call(self.log_file.open,
+                       (name, REDFile.FLAG_READ_ONLY | REDFile.FLAG_NON_BLOCKING, 0, 0, 0),
+                       cb_open, cb_open_error, pass_exception_to_error_callback=True)
+
+        # log files are plain text, try to transfer them compressed. fall back
+        # to the uncompressed log file on any problem
+        def cb_compress(result):
+            nonlocal compressed_path
+
+            script_instance      = self.compress_script
+            self.compress_script = None
+
+            if script_instance != None and script_instance.abort:
+                done()
+                return
+
+            okay, _ = check_script_result(result)
+
+            try:
+                compressed = json.loads(result.stdout) if okay else {}
+            except:
+                compressed = {}
 
-        async_call(self.log_file.open,
-                   (log.source_name, REDFile.FLAG_READ_ONLY | REDFile.FLAG_NON_BLOCKING, 0, 0, 0),
-                   cb_open, cb_open_error, pass_exception_to_error_callback=True)
+            if isinstance(compressed, dict) and compressed.get('path') != None:
+                compressed_path = compressed['path']
+
+                open_log_file(compressed_path)
+            else:
+                open_log_file(log.source_name)
+
+        if self.script_manager != None:
+            script_instance = self.script_manager.execute_script('zlib_transfer', cb_compress, ['compress', log.source_name])
+
+            # the result callback was already called if the script could not be started
+            if self.refresh_in_progress and self.log_file == None:
+                self.compress_script = script_instance
+        else:
+            open_log_file(log.source_name)
 
     def save_log(self):
         log      = self.logs[self.combo_log.currentIndex()]
@@ -233,7 +303,11 @@ class REDTabImportExportSystemLogs(QWidget, Ui_REDTabImportExportSystemLogs):
         f.close()
 
     def cancel_download(self):
-        log_file = self.log_file
+        compress_script = self.compress_script
+        log_file        = self.log_file
+
+        if compress_script != None:
+            self.script_manager.abort_script(compress_script)
 
         if log_file != None:
             try:
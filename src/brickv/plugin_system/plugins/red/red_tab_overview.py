@@ -27,7 +27,6 @@ import json
 import time
 import sys
 import zlib
-from operator import itemgetter
 import html
 
 from PyQt5.QtCore import Qt, QSortFilterProxyModel, QTimer
@@ -46,6 +45,14 @@ DEFAULT_TVIEW_NIC_HEADER_WIDTH = 210 # in pixels
 DEFAULT_TVIEW_PROCESS_HEADER_WIDTH_FIRST = 210 # in pixels
 DEFAULT_TVIEW_PROCESS_HEADER_WIDTH_OTHER = 105 # in pixels
 
+# avoids dataChanged signals and resorting for unchanged values
+def update_item(item, text, data=None):
+    if item.text() != text:
+        item.setText(text)
+
+    if data != None and item.data() != data:
+        item.setData(data)
+
 class ProcessesProxyModel(QSortFilterProxyModel):
     # overrides QSortFilterProxyModel.lessThan
     def lessThan(self, left, right):
@@ -72,6 +79,8 @@ class REDTabOverview(REDTab, Ui_REDTabOverview):
         self.refresh_counter = 0
         self.nic_time = 0
 
+        self.overview_request_id = 0
+
         self.label_error.hide()
 
         # For MAC progress bar text fix
@@ -90,9 +99,7 @@ class REDTabOverview(REDTab, Ui_REDTabOverview):
         self.button_refresh.setText('Collecting data...')
         self.button_refresh.setDisabled(True)
         self.is_tab_on_focus = True
-        self.script_manager.execute_script('overview', self.cb_overview,
-                                           ["0.1"], max_length=1024*1024,
-                                           decode_output_as_utf8=False)
+        self.execute_overview(["0.1"])
         self.reset_tview_nic()
 
     def tab_off_focus(self):
@@ -102,6 +109,14 @@ class REDTabOverview(REDTab, Ui_REDTabOverview):
     def tab_destroy(self):
         pass
 
+    def execute_overview(self, params):
+        self.overview_request_id += 1
+        request_id = self.overview_request_id
+
+        self.script_manager.execute_script('overview', lambda result: self.cb_overview(result, request_id),
+                                           params, max_length=1024*1024,
+                                           decode_output_as_utf8=False)
+
     def refresh_clicked(self):
         self.refresh_timer.stop()
         self.refresh_counter = REFRESH_TIME//REFRESH_TIMEOUT
@@ -121,18 +136,21 @@ class REDTabOverview(REDTab, Ui_REDTabOverview):
             self.refresh_timer.stop()
             self.button_refresh.setText('Collecting data...')
             self.button_refresh.setDisabled(True)
-            self.script_manager.execute_script('overview', self.cb_overview,
-                                               max_length=1024*1024, decode_output_as_utf8=False)
+            self.execute_overview([])
         else:
             self.button_refresh.setDisabled(False)
             self.button_refresh.setText('Refresh in ' + str((REFRESH_TIME//REFRESH_TIMEOUT - self.refresh_counter)/2.0) + "...")
 
-    def cb_overview(self, result):
+    def cb_overview(self, result, request_id):
         # check if the tab is still on view or not
         if not self.is_tab_on_focus:
             self.refresh_timer.stop()
             return
 
+        # a newer request was started on tab focus, ignore this result
+        if request_id != self.overview_request_id:
+            return
+
         self.refresh_counter = 0
         self.refresh_timer.start(REFRESH_TIMEOUT)
 
@@ -190,7 +208,7 @@ class REDTabOverview(REDTab, Ui_REDTabOverview):
             storage_percent_v = int(storage_percent.split('.')[0])
 
             nic_data_dict = data['ifaces']
-            processes_data_list = data['processes']
+            processes_data_dict = {str(p['pid']): p for p in data['processes']}
         except:
             # some parsing error due to malfromed or incomplete output occured.
             # ignore it and wait for the next update
@@ -218,8 +236,6 @@ class REDTabOverview(REDTab, Ui_REDTabOverview):
         self.pbar_memory.setValue(memory_percent_v)
         self.pbar_storage.setValue(storage_percent_v)
 
-        self.nic_item_model.removeRows(0, self.nic_item_model.rowCount())
-
         def _get_nic_transfer_rate(bytes_now, bytes_previous, delta_time):
             return "%.1f" % float(((bytes_now - bytes_previous) / delta_time) / 1024.0)
 
@@ -227,24 +243,38 @@ class REDTabOverview(REDTab, Ui_REDTabOverview):
         delta = new_time - self.nic_time
         self.nic_time = new_time
 
-        for i, key in enumerate(nic_data_dict):
+        # remove the "Collecting data..." row
+        if len(self.nic_items) == 0:
+            self.nic_item_model.removeRows(0, self.nic_item_model.rowCount())
+
+        for key in list(self.nic_items.keys()):
+            if key not in nic_data_dict:
+                self.nic_item_model.removeRow(self.nic_items.pop(key)[0].row())
+                self.nic_previous_bytes.pop(key, None)
+
+        for key in nic_data_dict:
             if key not in self.nic_previous_bytes:
                 self.nic_time = time.time()
-                self.nic_item_model.setItem(i, 0, QStandardItem(key))
-                self.nic_item_model.setItem(i, 1, QStandardItem("Collecting data..."))
-                self.nic_item_model.setItem(i, 2, QStandardItem("Collecting data..."))
+                download_rate = "Collecting data..."
+                upload_rate = "Collecting data..."
             else:
                 download_rate = _get_nic_transfer_rate(nic_data_dict[key][1],
                                                        self.nic_previous_bytes[key]['received'],
-                                                       delta)
+                                                       delta) + " KiB/s"
 
                 upload_rate = _get_nic_transfer_rate(nic_data_dict[key][0],
                                                      self.nic_previous_bytes[key]['sent'],
-                                                     delta)
+                                                     delta) + " KiB/s"
+
+            items = self.nic_items.get(key)
 
-                self.nic_item_model.setItem(i, 0, QStandardItem(key))
-                self.nic_item_model.setItem(i, 1, QStandardItem(download_rate + " KiB/s"))
-                self.nic_item_model.setItem(i, 2, QStandardItem(upload_rate + " KiB/s"))
+            if items == None:
+                items = [QStandardItem(key), QStandardItem(download_rate), QStandardItem(upload_rate)]
+                self.nic_items[key] = items
+                self.nic_item_model.appendRow(items)
+            else:
+                update_item(items[1], download_rate)
+                update_item(items[2], upload_rate)
 
             self.nic_previous_bytes[key] = {'sent': nic_data_dict[key][0],
                                             'received': nic_data_dict[key][1]}
@@ -252,48 +282,55 @@ class REDTabOverview(REDTab, Ui_REDTabOverview):
         self.nic_item_model.sort(self.tview_nic_previous_sort['column_index'],
                                  self.tview_nic_previous_sort['order'])
 
-        self.process_item_model.removeRows(0, self.process_item_model.rowCount())
-
+        # the rows are updated in place, the proxy model keeps them sorted
+        # and the selection follows its row
         if self.cbox_based_on.currentIndex() == 0:
-            processes_data_list_sorted = sorted(processes_data_list,
-                                                key=itemgetter('cpu'),
-                                                reverse=True)
-        elif self.cbox_based_on.currentIndex() == 1:
-            processes_data_list_sorted = sorted(processes_data_list,
-                                                key=itemgetter('mem'),
-                                                reverse=True)
+            sort_key = 'cpu'
+        else:
+            sort_key = 'mem'
+
+        processes_sorted = sorted(processes_data_dict.items(),
+                                  key=lambda process: process[1][sort_key],
+                                  reverse=True)[:self.sbox_number_of_process.value()]
+        shown_pids = set(pid for pid, _ in processes_sorted)
 
-        processes_data_list_sorted = processes_data_list_sorted[:self.sbox_number_of_process.value()]
+        # remove the "Collecting data..." row
+        if len(self.process_items) == 0:
+            self.process_item_model.removeRows(0, self.process_item_model.rowCount())
 
-        for i, p in enumerate(processes_data_list_sorted):
+        for pid in list(self.process_items.keys()):
+            if pid not in shown_pids:
+                self.process_item_model.removeRow(self.process_items.pop(pid)[0].row())
+
+        for pid, p in processes_sorted:
             name = str(p['name'])
             cmdline = str(p['cmd'])
 
             if len(cmdline) == 0:
                 cmdline = name
 
-            item_name = QStandardItem(name)
-            item_name.setToolTip(cmdline)
-            self.process_item_model.setItem(i, 0, item_name)
-
-            item_pid = QStandardItem(str(p['pid']))
-            self.process_item_model.setItem(i, 1, item_pid)
+            cpu = p['cpu']
+            mem = p['mem']
+            items = self.process_items.get(pid)
 
-            item_user = QStandardItem(str(p['user']))
-            self.process_item_model.setItem(i, 2, item_user)
+            if items == None:
+                items = [QStandardItem(name), QStandardItem(pid), QStandardItem(str(p['user'])),
+                         QStandardItem(str(cpu / 10.0)+'%'), QStandardItem(str(mem / 10.0)+'%')]
 
-            cpu = p['cpu']
-            item_cpu = QStandardItem(str(cpu / 10.0)+'%')
-            item_cpu.setData(cpu)
-            self.process_item_model.setItem(i, 3, item_cpu)
+                items[0].setToolTip(cmdline)
+                items[3].setData(cpu)
+                items[4].setData(mem)
 
-            mem = p['mem']
-            item_mem = QStandardItem(str(mem / 10.0)+'%')
-            item_mem.setData(mem)
-            self.process_item_model.setItem(i, 4, item_mem)
+                self.process_items[pid] = items
+                self.process_item_model.appendRow(items)
+            else:
+                update_item(items[0], name)
+                update_item(items[2], str(p['user']))
+                update_item(items[3], str(cpu / 10.0)+'%', cpu)
+                update_item(items[4], str(mem / 10.0)+'%', mem)
 
-        self.process_item_model.sort(self.tview_process_previous_sort['column_index'],
-                                     self.tview_process_previous_sort['order'])
+                if items[0].toolTip() != cmdline:
+                    items[0].setToolTip(cmdline)
 
     def cb_tview_nic_sort_indicator_changed(self, column_index):
         self.tview_nic_previous_sort = {'column_index': column_index,\
@@ -332,6 +369,7 @@ class REDTabOverview(REDTab, Ui_REDTabOverview):
         self.tview_nic_previous_sort = {'column_index': self.tview_nic_previous_sort['column_index'],\
                                         'order': self.tview_nic_previous_sort['order']}
         self.nic_previous_bytes = {}
+        self.nic_items = {} # by name
 
     def setup_tview_process(self):
         self.process_item_model = QStandardItemModel(0, 5, self)
@@ -355,12 +393,14 @@ class REDTabOverview(REDTab, Ui_REDTabOverview):
                                      self.tview_process_previous_sort['order'])
         self.tview_process_previous_sort = {'column_index': self.tview_process_previous_sort['column_index'],\
                                             'order': self.tview_process_previous_sort['order']}
+        self.process_items = {} # by PID as string
         self.cbox_based_on.addItem("CPU")
         self.cbox_based_on.addItem("Memory")
 
     def reset_tview_nic(self):
         self.nic_item_model.clear()
         self.nic_previous_bytes.clear()
+        self.nic_items.clear()
         self.nic_item_model.setHorizontalHeaderItem(0, QStandardItem("Interface"))
         self.nic_item_model.setHorizontalHeaderItem(1, QStandardItem("Download"))
         self.nic_item_model.setHorizontalHeaderItem(2, QStandardItem("Upload"))
@@ -47,6 +47,9 @@ from brickv.plugin_system.plugins.red.program_page_shell import get_shell_versio
 from brickv.async_call import async_call
 from brickv.utils import get_main_window
 
+USER_ROLE_PROGRAM      = Qt.UserRole
+USER_ROLE_PROGRAM_INFO = Qt.UserRole + 1
+
 class REDTabProgram(REDTab, Ui_REDTabProgram):
     def __init__(self):
         REDTab.__init__(self)
@@ -69,6 +72,7 @@ class REDTabProgram(REDTab, Ui_REDTabProgram):
         self.first_tab_on_focus  = True
         self.tab_is_alive        = True
         self.refresh_in_progress = False
+        self.details_in_progress = set() # programs with pending update_details
         self.new_program_wizard  = None
 
         self.splitter.setSizes([175, 400])
@@ -105,14 +109,14 @@ class REDTabProgram(REDTab, Ui_REDTabProgram):
                 widget.close_all_dialogs()
 
     def update_ui_state(self):
+        self.progress_refresh.setVisible(self.refresh_in_progress or len(self.details_in_progress) > 0)
+
         if self.refresh_in_progress:
-            self.progress_refresh.setVisible(True)
             self.button_refresh.setText('Refreshing...')
             self.button_refresh.setEnabled(False)
             self.button_new.setEnabled(False)
             self.button_delete.setEnabled(False)
         else:
-            self.progress_refresh.setVisible(False)
             self.button_refresh.setText('Refresh')
             self.button_refresh.setEnabled(True)
             self.button_new.setEnabled(True)
@@ -124,26 +128,82 @@ class REDTabProgram(REDTab, Ui_REDTabProgram):
                 has_selection = True
 
             if has_selection:
-                index = self.tree_programs.indexOfTopLevelItem(self.tree_programs.selectedItems()[0])
-                self.stacked_container.setCurrentIndex(index + 1)
+                self.show_program_info(self.tree_programs.selectedItems()[0])
 
             self.button_delete.setEnabled(has_selection)
 
-    def add_program_to_tree(self, program):
-        program_info = ProgramInfoMain(self.session, self.script_manager, self.image_version, self.executable_versions, program)
-        program_info.name_changed.connect(self.refresh_program_name)
-        program_info.status_changed.connect(self.refresh_program_status)
+    # the program info widget is created on first selection, only then the
+    # details of the program are fetched
+    def show_program_info(self, item):
+        program_info = item.data(0, USER_ROLE_PROGRAM_INFO)
+
+        if program_info != None:
+            self.stacked_container.setCurrentWidget(program_info)
+            return
+
+        program = item.data(0, USER_ROLE_PROGRAM)
+
+        if program.details_valid:
+            program_info = ProgramInfoMain(self.session, self.script_manager, self.image_version, self.executable_versions, program)
+            program_info.name_changed.connect(self.refresh_program_name)
+            program_info.status_changed.connect(self.refresh_program_status)
+
+            item.setData(0, USER_ROLE_PROGRAM_INFO, program_info)
+
+            self.stacked_container.addWidget(program_info)
+            self.stacked_container.setCurrentWidget(program_info)
+            return
+
+        self.stacked_container.setCurrentWidget(self.widget_help)
+
+        if program in self.details_in_progress:
+            return
+
+        def cb_done():
+            self.details_in_progress.discard(program)
+
+            if self.tab_is_alive:
+                self.update_ui_state()
 
+        def cb_error(error):
+            self.details_in_progress.discard(program)
+
+            if not self.tab_is_alive:
+                return
+
+            self.progress_refresh.setVisible(self.refresh_in_progress or len(self.details_in_progress) > 0)
+
+            QMessageBox.critical(get_main_window(), 'Program Details Error',
+                                 'Could not get details of program [{0}]:\n\n{1}'
+                                 .format(program.cast_custom_option_value('name', str, '<unknown>'), error))
+
+        self.details_in_progress.add(program)
+        self.progress_refresh.setVisible(True)
+
+        async_call(program.update_details, None, cb_done, cb_error, pass_exception_to_error_callback=True)
+
+    def add_program_to_tree(self, program):
         item = QTreeWidgetItem([program.cast_custom_option_value('name', str, '<unknown>'),
                                 get_program_short_status(program)])
-        item.setData(0, Qt.UserRole, program_info)
+        item.setData(0, USER_ROLE_PROGRAM, program)
 
         self.tree_programs.addTopLevelItem(item)
-        self.stacked_container.addWidget(program_info)
+
+        # keep the status up-to-date, even if the program info widget was not created yet
+        program.lite_scheduler_state_changed_callback = self.refresh_program_status
+        program.lite_process_spawned_callback         = self.lite_process_spawned
+
+        if program.last_spawned_lite_process != None:
+            program.last_spawned_lite_process.state_changed_callback = lambda process: self.refresh_program_status(program)
+
+    def lite_process_spawned(self, program):
+        program.last_spawned_lite_process.state_changed_callback = lambda process: self.refresh_program_status(program)
+
+        self.refresh_program_status(program)
 
     def refresh_program_tree(self):
         def refresh_async():
-            return get_programs(self.session)
+            return self.session.program_catalogue.refresh(update_known_programs=True)
 
         def cb_success(programs):
             sorted_programs = {}
@@ -162,7 +222,6 @@ class REDTabProgram(REDTab, Ui_REDTabProgram):
 
             self.refresh_in_progress = False
             self.update_ui_state()
-            self.stacked_container.setCurrentIndex(1)
 
         def cb_error():
             pass # FIXME: report error
@@ -176,7 +235,10 @@ class REDTabProgram(REDTab, Ui_REDTabProgram):
         self.stacked_container.setCurrentWidget(self.widget_help)
 
         while self.stacked_container.count() > 1:
-            self.stacked_container.removeWidget(self.stacked_container.widget(1))
+            program_info = self.stacked_container.widget(1)
+
+            program_info.detach_program_callbacks()
+            self.stacked_container.removeWidget(program_info)
             QApplication.processEvents()
 
         async_call(refresh_async, None, cb_success, cb_error)
@@ -185,14 +247,14 @@ class REDTabProgram(REDTab, Ui_REDTabProgram):
         for i in range(self.tree_programs.topLevelItemCount()):
             item = self.tree_programs.topLevelItem(i)
 
-            if item.data(0, Qt.UserRole).program == program:
+            if item.data(0, USER_ROLE_PROGRAM) == program:
                 item.setText(0, program.cast_custom_option_value('name', str, '<unknown>'))
 
     def refresh_program_status(self, program):
         for i in range(self.tree_programs.topLevelItemCount()):
             item = self.tree_programs.topLevelItem(i)
 
-            if item.data(0, Qt.UserRole).program == program:
+            if item.data(0, USER_ROLE_PROGRAM) == program:
                 item.setText(1, get_program_short_status(program))
 
     def refresh_executable_versions(self):
@@ -215,9 +277,9 @@ class REDTabProgram(REDTab, Ui_REDTabProgram):
     def show_new_program_wizard(self):
         self.button_new.setEnabled(False)
 
-        if self.stacked_container.count() > 1:
-            current_widget = self.stacked_container.currentWidget()
-        else:
+        current_widget = self.stacked_container.currentWidget()
+
+        if not isinstance(current_widget, ProgramInfoMain):
             current_widget = None
 
         if current_widget != None:
@@ -226,7 +288,7 @@ class REDTabProgram(REDTab, Ui_REDTabProgram):
         identifiers = []
 
         for i in range(self.tree_programs.topLevelItemCount()):
-            identifiers.append(self.tree_programs.topLevelItem(i).data(0, Qt.UserRole).program.identifier)
+            identifiers.append(self.tree_programs.topLevelItem(i).data(0, USER_ROLE_PROGRAM).identifier)
 
         context = ProgramWizardContext(self.session, identifiers, self.script_manager, self.image_version, self.executable_versions)
 
@@ -235,6 +297,7 @@ class REDTabProgram(REDTab, Ui_REDTabProgram):
         self.new_program_wizard.exec_()
 
         if self.new_program_wizard.upload_successful:
+            self.session.program_catalogue.add(self.new_program_wizard.program)
             self.add_program_to_tree(self.new_program_wizard.program)
             self.tree_programs.topLevelItem(self.tree_programs.topLevelItemCount() - 1).setSelected(True)
 
@@ -255,8 +318,8 @@ class REDTabProgram(REDTab, Ui_REDTabProgram):
         if len(selected_items) == 0:
             return
 
-        program_info = selected_items[0].data(0, Qt.UserRole)
-        program      = program_info.program
+        program_info = selected_items[0].data(0, USER_ROLE_PROGRAM_INFO)
+        program      = selected_items[0].data(0, USER_ROLE_PROGRAM)
         name         = program.cast_custom_option_value('name', str, '<unknown>')
         button       = QMessageBox.question(get_main_window(), 'Delete Program',
                                             'Deleting program [{0}] is irreversible. All files of this program will be deleted.'.format(name),
@@ -265,8 +328,9 @@ class REDTabProgram(REDTab, Ui_REDTabProgram):
         if not self.tab_is_alive or button != QMessageBox.Ok:
             return
 
-        program_info.name_changed.disconnect(self.refresh_program_name)
-        program_info.status_changed.disconnect(self.refresh_program_status)
+        if program_info != None:
+            program_info.name_changed.disconnect(self.refresh_program_name)
+            program_info.status_changed.disconnect(self.refresh_program_status)
 
         try:
             program.purge() # FIXME: async_call
@@ -275,6 +339,9 @@ class REDTabProgram(REDTab, Ui_REDTabProgram):
                                  'Could not delete program [{0}]:\n\n{1}'.format(name, e))
             return
 
-        self.stacked_container.removeWidget(program_info)
+        self.session.program_catalogue.remove(program)
+
+        if program_info != None:
+            self.stacked_container.removeWidget(program_info)
         self.tree_programs.takeTopLevelItem(self.tree_programs.indexOfTopLevelItem(selected_items[0]))
         self.update_ui_state()
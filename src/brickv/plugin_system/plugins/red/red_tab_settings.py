@@ -28,6 +28,7 @@ import json
 from brickv.plugin_system.plugins.red.red_tab import REDTab
 from brickv.plugin_system.plugins.red.ui_red_tab_settings import Ui_REDTabSettings
 from brickv.plugin_system.plugins.red.script_manager import check_script_result
+from brickv.plugin_system.plugins.red.settings_utils import SettingsStatus, get_settings_status_sections
 
 class ServiceState:
     fetched          = False
@@ -44,8 +45,9 @@ class REDTabSettings(REDTab, Ui_REDTabSettings):
     def __init__(self):
         REDTab.__init__(self)
 
-        self.tabs          = []
-        self.service_state = ServiceState()
+        self.tabs            = []
+        self.service_state   = ServiceState()
+        self.settings_status = SettingsStatus()
 
         self.setupUi(self)
 
@@ -61,10 +63,21 @@ class REDTabSettings(REDTab, Ui_REDTabSettings):
             tab.session        = self.session
             tab.script_manager = self.script_manager
             tab.image_version  = self.image_version
-            tab.service_state  = self.service_state
+            tab.service_state   = self.service_state
+            tab.settings_status = self.settings_status
 
         if not self.service_state.fetched:
-            def cb_settings_services_check(result):
+            # collect the status of all settings tabs at once, the services
+            # status is required before any tab can be shown, the other tabs
+            # render their first view from the remaining sections
+            sections = get_settings_status_sections(self.image_version)
+
+            def cb_settings_status(results):
+                results = dict(zip([section for section, _, _ in sections], results))
+                result  = results.pop('services')
+
+                self.settings_status.update(results)
+
                 okay, message = check_script_result(result)
 
                 if not okay:
@@ -101,14 +114,14 @@ class REDTabSettings(REDTab, Ui_REDTabSettings):
                         self.tab_widget.show()
                         self.tab_widget.currentWidget().tab_on_focus()
 
-
-            self.script_manager.execute_script('settings_services',
-                                               cb_settings_services_check,
-                                               ['CHECK'])
+            self.script_manager.execute_scripts([(script_name, params) for _, script_name, params in sections],
+                                                cb_settings_status)
         else:
             self.tab_widget.currentWidget().tab_on_focus()
 
     def tab_off_focus(self):
+        self.settings_status.clear()
+
         for tab in self.tabs:
             tab.tab_off_focus()
 
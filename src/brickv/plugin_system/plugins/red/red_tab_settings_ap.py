@@ -50,10 +50,11 @@ class REDTabSettingsAP(QWidget, Ui_REDTabSettingsAP):
 
         self.setupUi(self)
 
-        self.session        = None # Set from REDTabSettings
-        self.script_manager = None # Set from REDTabSettings
-        self.image_version  = None # Set from REDTabSettings
-        self.service_state  = None # Set from REDTabSettings
+        self.session         = None # Set from REDTabSettings
+        self.script_manager  = None # Set from REDTabSettings
+        self.image_version   = None # Set from REDTabSettings
+        self.service_state   = None # Set from REDTabSettings
+        self.settings_status = None # Set from REDTabSettings
 
         self.is_tab_on_focus = False
 
@@ -241,8 +242,9 @@ class REDTabSettingsAP(QWidget, Ui_REDTabSettingsAP):
         self.pbar_working_wait.show()
         self.sarea_ap.setEnabled(False)
 
-        self.script_manager.execute_script('settings_ap_status',
-                                           cb_settings_ap_status)
+        self.settings_status.execute_script(self.script_manager, 'ap_status',
+                                            'settings_ap_status',
+                                            cb_settings_ap_status)
 
     def slot_pbutton_ap_save_clicked(self):
         def gui_after_apply(result):
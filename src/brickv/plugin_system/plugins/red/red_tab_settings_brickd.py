@@ -49,10 +49,11 @@ class REDTabSettingsBrickd(QWidget, Ui_REDTabSettingsBrickd):
         QWidget.__init__(self)
         self.setupUi(self)
 
-        self.session        = None # Set from REDTabSettings
-        self.script_manager = None # Set from REDTabSettings
-        self.image_version  = None # Set from REDTabSettings
-        self.service_state  = None # Set from REDTabSettings
+        self.session         = None # Set from REDTabSettings
+        self.script_manager  = None # Set from REDTabSettings
+        self.image_version   = None # Set from REDTabSettings
+        self.service_state   = None # Set from REDTabSettings
+        self.settings_status = None # Set from REDTabSettings
 
         self.brickd_conf = {}
 
@@ -41,10 +41,11 @@ class REDTabSettingsDateTime(QWidget, Ui_REDTabSettingsDateTime):
         QWidget.__init__(self)
         self.setupUi(self)
 
-        self.session        = None # Set from REDTabSettings
-        self.script_manager = None # Set from REDTabSettings
-        self.image_version  = None # Set from REDTabSettings
-        self.service_state  = None # Set from REDTabSettings
+        self.session         = None # Set from REDTabSettings
+        self.script_manager  = None # Set from REDTabSettings
+        self.image_version   = None # Set from REDTabSettings
+        self.service_state   = None # Set from REDTabSettings
+        self.settings_status = None # Set from REDTabSettings
 
         self.time_refresh_timer = QTimer(self)
         self.time_refresh_timer.setInterval(1000)
@@ -39,10 +39,11 @@ class REDTabSettingsFileSystem(QWidget, Ui_REDTabSettingsFileSystem):
         QWidget.__init__(self)
         self.setupUi(self)
 
-        self.session        = None # Set from REDTabSettings
-        self.script_manager = None # Set from REDTabSettings
-        self.image_version  = None # Set from REDTabSettings
-        self.service_state  = None # Set from REDTabSettings
+        self.session         = None # Set from REDTabSettings
+        self.script_manager  = None # Set from REDTabSettings
+        self.image_version   = None # Set from REDTabSettings
+        self.service_state   = None # Set from REDTabSettings
+        self.settings_status = None # Set from REDTabSettings
 
         self.is_tab_on_focus = False
 
@@ -56,9 +57,10 @@ class REDTabSettingsFileSystem(QWidget, Ui_REDTabSettingsFileSystem):
 
     def tab_on_focus(self):
         self.is_tab_on_focus = True
-        self.script_manager.execute_script('settings_fs_expand_check',
-                                           self.cb_settings_fs_expand_check,
-                                           ['/dev/mmcblk0'])
+        self.settings_status.execute_script(self.script_manager, 'fs_expand_check',
+                                            'settings_fs_expand_check',
+                                            self.cb_settings_fs_expand_check,
+                                            ['/dev/mmcblk0'])
 
     def tab_off_focus(self):
         self.is_tab_on_focus = False
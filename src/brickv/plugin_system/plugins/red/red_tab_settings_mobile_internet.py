@@ -33,7 +33,6 @@ from brickv.plugin_system.plugins.red.api import *
 from brickv.plugin_system.plugins.red.program_utils import TextFile
 from brickv.plugin_system.plugins.red import config_parser
 from brickv.plugin_system.plugins.red.script_manager import report_script_result, check_script_result
-from brickv.plugin_system.plugins.red.serviceprovider_data import dict_provider, dict_country
 from brickv.async_call import async_call
 from brickv.utils import get_main_window
 
@@ -75,10 +74,11 @@ class REDTabSettingsMobileInternet(QWidget, Ui_REDTabSettingsMobileInternet):
         QWidget.__init__(self)
         self.setupUi(self)
 
-        self.session        = None # Set from REDTabSettings
-        self.script_manager = None # Set from REDTabSettings
-        self.image_version  = None # Set from REDTabSettings
-        self.service_state  = None # Set from REDTabSettings
+        self.session         = None # Set from REDTabSettings
+        self.script_manager  = None # Set from REDTabSettings
+        self.image_version   = None # Set from REDTabSettings
+        self.service_state   = None # Set from REDTabSettings
+        self.settings_status = None # Set from REDTabSettings
 
         self.is_tab_on_focus = False
         self.working = False
@@ -153,10 +153,7 @@ class REDTabSettingsMobileInternet(QWidget, Ui_REDTabSettingsMobileInternet):
             self.ledit_mi_sim_card_pin.setEchoMode(QLineEdit.Password)
 
     def pbutton_mi_provider_presets_clicked(self):
-        provider_preset_dialog = REDTabSettingsMobileInternetProviderPresetDialog(self,
-                                                                                  self.session,
-                                                                                  dict_provider,
-                                                                                  dict_country)
+        provider_preset_dialog = REDTabSettingsMobileInternetProviderPresetDialog(self, self.session)
         if provider_preset_dialog.exec_() == QDialog.Accepted:
             if provider_preset_dialog.label_mi_preview_apn.text() and \
                provider_preset_dialog.label_mi_preview_apn.text() != '-':
@@ -296,10 +296,11 @@ class REDTabSettingsNetwork(QWidget, Ui_REDTabSettingsNetwork):
         QWidget.__init__(self)
         self.setupUi(self)
 
-        self.session        = None # Set from REDTabSettings
-        self.script_manager = None # Set from REDTabSettings
-        self.image_version  = None # Set from REDTabSettings
-        self.service_state  = None # Set from REDTabSettings
+        self.session         = None # Set from REDTabSettings
+        self.script_manager  = None # Set from REDTabSettings
+        self.image_version   = None # Set from REDTabSettings
+        self.service_state   = None # Set from REDTabSettings
+        self.settings_status = None # Set from REDTabSettings
 
         self.is_tab_on_focus = False
 
@@ -1497,14 +1498,17 @@ class REDTabSettingsNetwork(QWidget, Ui_REDTabSettingsNetwork):
         self.network_refresh_tasks_error_occured = False
 
         if self.image_version_lt_1_10:
-            self.script_manager.execute_script('settings_network_status',
-                                               cb_settings_network_status)
+            self.settings_status.execute_script(self.script_manager, 'network_status',
+                                                'settings_network_status',
+                                                cb_settings_network_status)
         else:
-            self.script_manager.execute_script('settings_network_status_nm',
-                                               cb_settings_network_status)
+            self.settings_status.execute_script(self.script_manager, 'network_status',
+                                                'settings_network_status_nm',
+                                                cb_settings_network_status)
 
-        self.script_manager.execute_script('settings_network_get_interfaces',
-                                           cb_settings_network_get_interfaces)
+        self.settings_status.execute_script(self.script_manager, 'network_interfaces',
+                                            'settings_network_get_interfaces',
+                                            cb_settings_network_get_interfaces)
 
         if self.image_version_lt_1_10:
             TextFile.read_async(self.session,
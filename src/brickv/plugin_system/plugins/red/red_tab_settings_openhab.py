@@ -101,6 +101,7 @@ class REDTabSettingsOpenHAB(QWidget, Ui_REDTabSettingsOpenHAB):
         self.script_manager      = None # Set from REDTabSettings
         self.image_version       = None # Set from REDTabSettings
         self.service_state       = None # Set from REDTabSettings
+        self.settings_status     = None # Set from REDTabSettings
         self.action_in_progress  = False
         self.configs             = None
 
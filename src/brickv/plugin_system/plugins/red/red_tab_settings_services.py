@@ -37,10 +37,11 @@ class REDTabSettingsServices(QWidget, Ui_REDTabSettingsServices):
 
         self.setupUi(self)
 
-        self.session        = None # Set from REDTabSettings
-        self.script_manager = None # Set from REDTabSettings
-        self.image_version  = None # Set from REDTabSettings
-        self.service_state  = None # Set from REDTabSettings
+        self.session         = None # Set from REDTabSettings
+        self.script_manager  = None # Set from REDTabSettings
+        self.image_version   = None # Set from REDTabSettings
+        self.service_state   = None # Set from REDTabSettings
+        self.settings_status = None # Set from REDTabSettings
 
         self.chkbox_gpu.stateChanged.connect(self.service_config_changed)
         self.chkbox_desktopenv.stateChanged.connect(self.service_config_changed)
@@ -22,14 +22,16 @@ Free Software Foundation, Inc., 59 Temple Place - Suite 330,
 Boston, MA 02111-1307, USA.
 """
 
+import json
+import struct
 import posixpath
 from collections import namedtuple
 from threading import Lock
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 from PyQt5.QtWidgets import QMessageBox
 
-from brickv.plugin_system.plugins.red.api import REDFile, REDPipe, REDProcess
+from brickv.plugin_system.plugins.red.api import REDError, REDFile, REDPipe, REDProcess
 from brickv.async_call import async_call
 from brickv.object_creator import create_object_in_qt_main_thread
 from brickv.plugin_system.plugins.red.script_data import script_data
@@ -37,6 +39,21 @@ from brickv.utils import get_main_window
 
 SCRIPT_FOLDER = '/usr/local/scripts'
 
+# scripts that only read state and don't rely on their own process, these are
+# executed by the long-running script agent instead of spawning a new process.
+# the agent executes one script after another, scripts that block for a while
+# (like overview measuring the CPU usage for a second) are not executed by it
+AGENT_SCRIPT_NAMES = {
+    'directory_list',
+    'file_digests',
+    'program_logs_list',
+    'settings_ap_status',
+    'settings_network_get_interfaces',
+    'settings_network_status',
+    'settings_time_get',
+    'walk'
+}
+
 script_instances = set()
 
 class Script:
@@ -57,6 +74,7 @@ class ScriptInstance(QObject):
         self.name                      = None
         self.script                    = None
         self.process                   = None
+        self.stdin                     = None
         self.stdout                    = None
         self.stderr                    = None
         self.result_callback           = None
@@ -66,6 +84,10 @@ class ScriptInstance(QObject):
         self.redirect_stderr_to_stdout = False
         self.abort                     = False
         self.execute_as_user           = False
+        self.use_agent                 = False
+        self.stream                    = None
+        self.batch                     = None # [(script_name, params), ...] executed as one agent request
+        self.dependencies              = [] # scripts to upload before executing
 
     def release(self):
         if self.process != None:
@@ -76,6 +98,14 @@ class ScriptInstance(QObject):
 
             self.process = None
 
+        if self.stdin != None:
+            try:
+                self.stdin.release()
+            except:
+                pass
+
+            self.stdin = None
+
         if self.stdout != None:
             try:
                 self.stdout.release()
@@ -108,6 +138,437 @@ class ScriptInstance(QObject):
 # stdout and stderr are either strings or None (UTF-8 decode error)
 ScriptResult = namedtuple('ScriptResult', 'error stdout stderr exit_code')
 
+class ScriptAgent(QObject):
+    STATE_STOPPED  = 0
+    STATE_STARTING = 1
+    STATE_RUNNING  = 2
+    STATE_FAILED   = 3 # don't try again for the lifetime of the session
+
+    PIPE_LENGTH      = 1024 * 1024
+    RESPONSE_TIMEOUT = 30 # seconds
+
+    RESPONSE_HEADER_FORMAT = '<iII'
+    RESPONSE_HEADER_LENGTH = struct.calcsize(RESPONSE_HEADER_FORMAT)
+
+    def __init__(self, script_manager):
+        super().__init__()
+
+        self.script_manager = script_manager
+        self.session        = script_manager.session
+        self.state          = ScriptAgent.STATE_STOPPED
+        self.process        = None
+        self.stdin          = None
+        self.stdout         = None
+        self.pending        = [] # ScriptInstances waiting for their turn
+        self.current        = None # ScriptInstance currently handled by the agent
+        self.buffer         = b''
+        self.reading        = False
+        self.read_again     = False
+        self.timeout_timer  = QTimer(self)
+
+        self.timeout_timer.setSingleShot(True)
+        self.timeout_timer.timeout.connect(lambda: self.fail('Script agent did not respond in time'))
+
+    @property
+    def usable(self):
+        return self.state != ScriptAgent.STATE_FAILED and 'script_agent' in self.script_manager.scripts
+
+    def execute(self, si):
+        self.pending.append(si)
+
+        if self.state == ScriptAgent.STATE_STOPPED:
+            self.start()
+        elif self.state == ScriptAgent.STATE_RUNNING:
+            self.send_next_request()
+
+    def start(self):
+        def cb_success(result):
+            self.process, self.stdin, self.stdout = result
+            self.state                            = ScriptAgent.STATE_RUNNING
+
+            self.process.state_changed_callback = self.cb_process_state_changed
+            self.stdout.events_occurred_callback = self.cb_stdout_events_occurred
+
+            try:
+                self.stdout.set_events(REDFile.EVENT_READABLE)
+            except Exception as e:
+                self.fail('Could not watch script agent output: {0}'.format(e))
+                return
+
+            self.send_next_request()
+
+        def cb_error(exception):
+            self.fail('Could not start script agent: {0}'.format(exception))
+
+        self.state = ScriptAgent.STATE_STARTING
+
+        async_call(self.start_async, None, cb_success, cb_error, pass_exception_to_error_callback=True)
+
+    def start_async(self):
+        script = self.script_manager.scripts['script_agent']
+        path   = posixpath.join(SCRIPT_FOLDER, script.name + script.extension)
+
+        self.script_manager._upload_script_sync(script)
+
+        stdin   = create_object_in_qt_main_thread(REDPipe, (self.session,)).create(REDPipe.FLAG_NON_BLOCKING_WRITE, ScriptAgent.PIPE_LENGTH)
+        stdout  = create_object_in_qt_main_thread(REDPipe, (self.session,)).create(REDPipe.FLAG_NON_BLOCKING_READ, ScriptAgent.PIPE_LENGTH)
+        process = create_object_in_qt_main_thread(REDProcess, (self.session,))
+        env     = ['LANG=en_US.UTF-8', 'PATH=/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin']
+
+        process.spawn(path, [], env, '/', 0, 0, stdin, stdout, self.script_manager.devnull)
+
+        return process, stdin, stdout
+
+    def stop(self):
+        self.timeout_timer.stop()
+
+        if self.process != None:
+            self.process.state_changed_callback = None
+
+            try:
+                self.process.kill(REDProcess.SIGNAL_KILL)
+            except:
+                pass
+
+            self.process.release()
+            self.process = None
+
+        for pipe in [self.stdin, self.stdout]:
+            if pipe != None:
+                pipe.release()
+
+        self.stdin      = None
+        self.stdout     = None
+        self.buffer     = b''
+        self.reading    = False
+        self.read_again = False
+
+    # give up on the agent and let the pending scripts fall back to spawning
+    # their own process
+    def fail(self, message):
+        if self.state == ScriptAgent.STATE_FAILED:
+            return
+
+        self.state = ScriptAgent.STATE_FAILED
+
+        self.stop()
+
+        pending = self.pending
+
+        if self.current != None:
+            pending.insert(0, self.current)
+
+        self.current = None
+        self.pending = []
+
+        for si in pending:
+            si.use_agent = False
+            self.script_manager._execute_after_init(si)
+
+    def send_next_request(self):
+        if self.current != None or len(self.pending) == 0:
+            return
+
+        self.current = self.pending.pop(0)
+
+        if self.current.abort:
+            si           = self.current
+            self.current = None
+
+            self.script_manager._report_result_and_cleanup(si, ScriptResult('Script "{0}" aborted'.format(si.name), None, None, None))
+            self.send_next_request()
+            return
+
+        if self.current.batch != None:
+            request = [[name, [str(param) for param in params]] for name, params in self.current.batch]
+        else:
+            request = [self.current.script.name, [str(param) for param in self.current.params]]
+
+        body  = json.dumps(request).encode('utf-8')
+        frame = struct.pack('<I', len(body)) + body
+
+        def cb_write(error):
+            if error != None:
+                self.fail('Could not send request to script agent: {0}'.format(error))
+
+        try:
+            self.stdin.write_async(frame, cb_write)
+        except Exception as e:
+            self.fail('Could not send request to script agent: {0}'.format(e))
+            return
+
+        self.timeout_timer.start(ScriptAgent.RESPONSE_TIMEOUT * 1000)
+
+    def cb_process_state_changed(self, process):
+        if process.state not in [REDProcess.STATE_RUNNING, REDProcess.STATE_STOPPED]:
+            self.fail('Script agent exited unexpectedly')
+
+    def cb_stdout_events_occurred(self, events):
+        if (events & REDFile.EVENT_READABLE) == 0 or self.stdout == None:
+            return
+
+        if self.reading:
+            self.read_again = True
+            return
+
+        self.read_stdout()
+
+    def read_stdout(self):
+        def cb_read(result):
+            self.reading = False
+
+            if self.state != ScriptAgent.STATE_RUNNING:
+                return
+
+            # a non-blocking pipe reports E_WOULD_BLOCK after all currently
+            # available data was read, this is not an error here
+            if result.error != None and \
+               (not isinstance(result.error, REDError) or result.error.error_code != REDError.E_WOULD_BLOCK):
+                self.fail('Could not read response from script agent: {0}'.format(result.error))
+                return
+
+            self.buffer += result.data
+
+            self.handle_responses()
+
+            if self.read_again:
+                self.read_again = False
+                self.read_stdout()
+
+        self.reading = True
+
+        try:
+            self.stdout.read_async(ScriptAgent.PIPE_LENGTH, cb_read)
+        except Exception as e:
+            self.reading = False
+            self.fail('Could not read response from script agent: {0}'.format(e))
+
+    def handle_responses(self):
+        while len(self.buffer) >= ScriptAgent.RESPONSE_HEADER_LENGTH:
+            exit_code, stdout_length, stderr_length = struct.unpack_from(ScriptAgent.RESPONSE_HEADER_FORMAT, self.buffer)
+            frame_length = ScriptAgent.RESPONSE_HEADER_LENGTH + stdout_length + stderr_length
+
+            if len(self.buffer) < frame_length:
+                return
+
+            if self.current == None:
+                self.fail('Received unexpected response from script agent')
+                return
+
+            out         = self.buffer[ScriptAgent.RESPONSE_HEADER_LENGTH:ScriptAgent.RESPONSE_HEADER_LENGTH + stdout_length]
+            err         = self.buffer[ScriptAgent.RESPONSE_HEADER_LENGTH + stdout_length:frame_length]
+            self.buffer = self.buffer[frame_length:]
+            si          = self.current
+
+            self.current = None
+            self.timeout_timer.stop()
+
+            self.report_response(si, exit_code, out, err)
+            self.send_next_request()
+
+    def report_response(self, si, exit_code, out, err):
+        if si.abort:
+            self.script_manager._report_result_and_cleanup(si, ScriptResult('Script "{0}" aborted'.format(si.name), None, None, None))
+            return
+
+        out = out[:si.max_length]
+        err = err[:si.max_length]
+
+        if si.redirect_stderr_to_stdout:
+            out = (out + err)[:si.max_length]
+            err = b''
+
+        if si.decode_output_as_utf8:
+            try:
+                out = out.decode('utf-8')
+            except UnicodeDecodeError as e:
+                self.script_manager._report_result_and_cleanup(si, ScriptResult('Could not decode stdout for script "{0}" as UTF-8: {1}'.format(si.name, e), None, None, None))
+                return
+
+            try:
+                err = err.decode('utf-8')
+            except UnicodeDecodeError as e:
+                self.script_manager._report_result_and_cleanup(si, ScriptResult('Could not decode stderr for script "{0}" as UTF-8: {1}'.format(si.name, e), None, None, None))
+                return
+
+        if si.redirect_stderr_to_stdout:
+            err = ''
+
+        if si.batch != None:
+            if exit_code != 0:
+                self.script_manager._report_result_and_cleanup(si, ScriptResult('Script agent could not execute scripts "{0}": {1}'.format(si.name, err), None, None, None))
+                return
+
+            try:
+                out = [ScriptResult(None, batch_out, batch_err, batch_exit_code) for batch_exit_code, batch_out, batch_err in json.loads(out)]
+            except Exception as e:
+                self.script_manager._report_result_and_cleanup(si, ScriptResult('Received malformed response for scripts "{0}" from script agent: {1}'.format(si.name, e), None, None, None))
+                return
+
+            if len(out) != len(si.batch):
+                self.script_manager._report_result_and_cleanup(si, ScriptResult('Received incomplete response for scripts "{0}" from script agent'.format(si.name), None, None, None))
+                return
+
+        self.script_manager._report_result_and_cleanup(si, ScriptResult(None, out, err, exit_code))
+
+# streams the stdout of a spawned script to a callback while the script is
+# still running, instead of reading it once after the script exited. if the
+# stream has a stdin pipe then data can be written to the script while it runs
+class ScriptStream(QObject):
+    PIPE_LENGTH = 1024 * 1024
+
+    def __init__(self, script_manager, si, stdout_callback, with_stdin):
+        super().__init__()
+
+        self.script_manager  = script_manager
+        self.si              = si
+        self.stdout_callback = stdout_callback
+        self.with_stdin      = with_stdin
+        self.reading         = False
+        self.read_again      = False
+        self.exited          = False
+        self.finished        = False
+
+    # the caller has to ensure that the stdin pipe cannot overflow, because
+    # the pipe is non-blocking and only one write can be in progress
+    def write(self, data, result_callback):
+        self.si.stdin.write_async(data, result_callback)
+
+    def start(self):
+        si = self.si
+
+        try:
+            if self.with_stdin:
+                si.stdin = REDPipe(self.script_manager.session).create(REDPipe.FLAG_NON_BLOCKING_WRITE, ScriptStream.PIPE_LENGTH)
+
+            si.stdout = REDPipe(self.script_manager.session).create(REDPipe.FLAG_NON_BLOCKING_READ, ScriptStream.PIPE_LENGTH)
+            si.stderr = REDPipe(self.script_manager.session).create(REDPipe.FLAG_NON_BLOCKING_READ, si.max_length)
+
+            si.stdout.events_occurred_callback = self.cb_stdout_events_occurred
+            si.stdout.set_events(REDFile.EVENT_READABLE)
+        except Exception as e:
+            self.report_result(ScriptResult('Could not create pipes for script "{0}": {1}'.format(si.name, e), None, None, None))
+            return
+
+        si.process                        = REDProcess(self.script_manager.session)
+        si.process.state_changed_callback = self.cb_process_state_changed
+
+        if si.stdin != None:
+            stdin = si.stdin
+        else:
+            stdin = self.script_manager.devnull
+
+        try:
+            self.script_manager._spawn_process(si, stdin)
+        except Exception as e:
+            self.report_result(ScriptResult('Could not execute script "{0}": {1}'.format(si.name, e), None, None, None))
+
+    def report_result(self, result):
+        if self.finished:
+            return
+
+        self.finished = True
+
+        self.script_manager._report_result_and_cleanup(self.si, result)
+
+    def cb_process_state_changed(self, process):
+        si = self.si
+
+        if si.process == None or self.finished:
+            pass # ignore stale state-changed callback
+        elif si.abort:
+            self.report_result(ScriptResult('Script "{0}" aborted'.format(si.name), None, None, None))
+        elif si.process.state == REDProcess.STATE_RUNNING:
+            pass # still running ignore it
+        elif si.process.state != REDProcess.STATE_EXITED:
+            self.report_result(ScriptResult('Script "{0}" in wrong state: {1} (exit-code {2})'
+                                            .format(si.name, si.process.state, si.process.exit_code), None, None, None))
+        else:
+            # the output that arrived between the last read and the exit of
+            # the script still has to be read before the result is reported
+            self.exited = True
+
+            self.read_stdout()
+
+    def cb_stdout_events_occurred(self, events):
+        if (events & REDFile.EVENT_READABLE) == 0:
+            return
+
+        self.read_stdout()
+
+    def read_stdout(self):
+        if self.finished:
+            return
+
+        if self.reading:
+            self.read_again = True
+            return
+
+        def cb_read(result):
+            self.reading = False
+
+            if self.finished:
+                return
+
+            if self.si.abort:
+                self.report_result(ScriptResult('Script "{0}" aborted'.format(self.si.name), None, None, None))
+                return
+
+            # a non-blocking pipe reports E_WOULD_BLOCK after all currently
+            # available data was read, this is not an error here
+            if result.error != None and \
+               (not isinstance(result.error, REDError) or result.error.error_code != REDError.E_WOULD_BLOCK):
+                self.report_result(ScriptResult('Could not read stdout for script "{0}": {1}'.format(self.si.name, result.error), None, None, None))
+                return
+
+            if len(result.data) > 0:
+                self.stdout_callback(result.data)
+
+            if self.read_again or len(result.data) >= ScriptStream.PIPE_LENGTH:
+                self.read_again = False
+                self.read_stdout()
+            elif self.exited:
+                self.read_stderr()
+
+        self.reading = True
+
+        try:
+            self.si.stdout.read_async(ScriptStream.PIPE_LENGTH, cb_read)
+        except Exception as e:
+            self.reading = False
+            self.report_result(ScriptResult('Could not read stdout for script "{0}": {1}'.format(self.si.name, e), None, None, None))
+
+    def read_stderr(self):
+        si = self.si
+
+        def cb_read(result):
+            if self.finished:
+                return
+
+            if result.error != None:
+                self.report_result(ScriptResult('Could not read stderr for script "{0}": {1}'.format(si.name, result.error), None, None, None))
+                return
+
+            if si.decode_output_as_utf8:
+                try:
+                    err = result.data.decode('utf-8')
+                except UnicodeDecodeError as e:
+                    self.report_result(ScriptResult('Could not decode stderr for script "{0}" as UTF-8: {1}'.format(si.name, e), None, None, None))
+                    return
+
+                out = ''
+            else:
+                err = result.data
+                out = b''
+
+            # stdout was already passed to the stdout callback
+            self.report_result(ScriptResult(None, out, err, si.process.exit_code))
+
+        try:
+            si.stderr.read_async(si.max_length, cb_read)
+        except Exception as e:
+            self.report_result(ScriptResult('Could not read stderr for script "{0}": {1}'.format(si.name, e), None, None, None))
+
 class ScriptManager:
     def __init__(self, session):
         self.session = session
@@ -118,17 +579,24 @@ class ScriptManager:
             name, extension, content = sd
             self.scripts[name] = Script(name, extension, content)
 
+        self.agent = ScriptAgent(self)
+
     def destroy(self):
         # ensure to release all REDObjects
+        self.agent.stop()
         self.devnull.release()
         self.scripts = {}
 
     # Call with a script name from the scripts/ folder.
     # The stdout and stderr from the script will be given back to result_callback.
     # If there is an error, result_callback will report an ScriptResult with an error.
+    # If stdout_callback is given, then stdout is passed to it in chunks while
+    # the script is running and is not part of the ScriptResult. If with_stdin
+    # is True, then the returned ScriptInstance's stream can write to the stdin
+    # of the script.
     def execute_script(self, script_name, result_callback, params=None, max_length=65536,
                        decode_output_as_utf8=True, redirect_stderr_to_stdout=False,
-                       execute_as_user=False):
+                       execute_as_user=False, stdout_callback=None, with_stdin=False):
         if not script_name in self.scripts:
             if result_callback != None:
                 result_callback(ScriptResult('Script "{0}" is unknown'.format(script_name), None, None, None)) # We are still in GUI thread, use result_callback instead of signal
@@ -146,6 +614,12 @@ class ScriptManager:
         si.decode_output_as_utf8     = decode_output_as_utf8
         si.redirect_stderr_to_stdout = redirect_stderr_to_stdout
         si.execute_as_user           = execute_as_user
+        si.use_agent                 = script_name in AGENT_SCRIPT_NAMES and not execute_as_user and stdout_callback == None and self.agent.usable
+
+        if stdout_callback != None:
+            assert not redirect_stderr_to_stdout
+
+            si.stream = ScriptStream(self, si, stdout_callback, with_stdin)
 
         script_instances.add(si)
 
@@ -170,6 +644,50 @@ class ScriptManager:
 
         return None
 
+    # Call with a list of (script_name, params) tuples of scripts from the
+    # scripts/ folder. The scripts are executed one after another by the script
+    # agent with a single request. The result_callback is called with a list of
+    # ScriptResults in the same order. If the script agent is not usable, then
+    # each script is executed in its own process instead.
+    def execute_scripts(self, requests, result_callback, max_length=1024*1024):
+        def cb_result(result):
+            if result.error != None:
+                result_callback([result] * len(requests))
+            else:
+                result_callback(result.stdout)
+
+        for script_name, _ in requests:
+            if not script_name in self.scripts:
+                cb_result(ScriptResult('Script "{0}" is unknown'.format(script_name), None, None, None)) # We are still in GUI thread, use result_callback instead of signal
+                return
+
+        si                 = ScriptInstance()
+        si.name            = ', '.join([script_name for script_name, _ in requests])
+        si.script          = self.scripts['script_agent']
+        si.result_callback = cb_result
+        si.params          = []
+        si.max_length      = max_length
+        si.use_agent       = self.agent.usable
+        si.batch           = [(script_name, params if params != None else []) for script_name, params in requests]
+        si.dependencies    = [self.scripts[script_name] for script_name, _ in requests]
+
+        script_instances.add(si)
+        si.qtcb_result.connect(si.result_callback)
+
+        try:
+            self._init_script(si)
+            return si
+        except Exception as e:
+            si.qtcb_result.disconnect(si.result_callback)
+
+            si.script.uploaded = False
+
+            si.result_callback(ScriptResult('Could not initialize scripts "{0}": {1}'.format(si.name, e), None, None, None)) # We are still in GUI thread, use result_callback instead of signal
+
+            script_instances.remove(si)
+
+        return None
+
     def abort_script(self, si):
         if si.abort:
             return
@@ -183,6 +701,23 @@ class ScriptManager:
                 pass
 
     def _init_script(self, si):
+        dependencies = []
+
+        for script in si.dependencies:
+            if not script.uploaded:
+                dependencies.append(script)
+
+        if len(dependencies) > 0:
+            def cb_dependencies_success(result):
+                self._init_script(si)
+
+            def cb_dependencies_error(exception):
+                si.report_result(ScriptResult('Could not upload dependencies of script "{0}": {1}'.format(si.name, exception), None, None, None))
+                script_instances.remove(si)
+
+            async_call(self._upload_scripts_async, dependencies, cb_dependencies_success, cb_dependencies_error, pass_exception_to_error_callback=True)
+            return
+
         if si.script.uploaded:
             return self._execute_after_init(si)
 
@@ -196,6 +731,27 @@ class ScriptManager:
 
         async_call(self._init_script_async, si, cb_success, cb_error, pass_exception_to_error_callback=True)
 
+    # blocking, only call this from the async_call thread
+    def _upload_script_sync(self, script):
+        with script.upload_lock:
+            if script.uploaded:
+                return
+
+            red_file = create_object_in_qt_main_thread(REDFile, (self.session,))
+            red_file.open(posixpath.join(SCRIPT_FOLDER, script.name + script.extension),
+                          REDFile.FLAG_WRITE_ONLY | REDFile.FLAG_CREATE | REDFile.FLAG_TRUNCATE, 0o755, 0, 0)
+
+            try:
+                red_file.write(script.content.encode('utf-8'))
+            finally:
+                red_file.release()
+
+            script.uploaded = True
+
+    def _upload_scripts_async(self, scripts):
+        for script in scripts:
+            self._upload_script_sync(script)
+
     def _init_script_async(self, si):
         si.script.upload_lock.acquire()
 
@@ -241,6 +797,18 @@ class ScriptManager:
             self._report_result_and_cleanup(si, ScriptResult('Script "{0}" aborted'.format(si.name), None, None, None))
             return
 
+        if si.stream != None:
+            si.stream.start()
+            return
+
+        if si.use_agent:
+            self.agent.execute(si)
+            return
+
+        if si.batch != None:
+            self._execute_batch_separately(si)
+            return
+
         try:
             si.stdout = REDPipe(self.session).create(REDPipe.FLAG_NON_BLOCKING_READ, si.max_length)
 
@@ -334,6 +902,24 @@ class ScriptManager:
             pass
         """
 
+        try:
+            self._spawn_process(si, self.devnull)
+        except Exception as e:
+            self._report_result_and_cleanup(si, ScriptResult('Could not execute script "{0}": {1}'.format(si.name, e), None, None, None))
+
+    def _execute_batch_separately(self, si):
+        results = [None] * len(si.batch)
+
+        def cb_result(index, result):
+            results[index] = result
+
+            if None not in results:
+                self._report_result_and_cleanup(si, ScriptResult(None, results, '', 0))
+
+        for index, (script_name, params) in enumerate(si.batch):
+            self.execute_script(script_name, lambda result, index=index: cb_result(index, result), params, si.max_length)
+
+    def _spawn_process(self, si, stdin):
         # need to set LANG otherwise python will not correctly handle non-ASCII filenames
         # also set a sensible PATH so scripts can find basic command without an absolute path
         env = ['LANG=en_US.UTF-8', 'PATH=/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin']
@@ -345,12 +931,9 @@ class ScriptManager:
             uid = 0
             gid = 0
 
-        try:
-            # FIXME: Do we need a timeout here in case that the state_changed callback never comes?
-            si.process.spawn(posixpath.join(SCRIPT_FOLDER, si.script.name + si.script.extension),
-                             si.params, env, '/', uid, gid, self.devnull, si.stdout, si.stderr)
-        except Exception as e:
-            self._report_result_and_cleanup(si, ScriptResult('Could not execute script "{0}": {1}'.format(si.name, e), None, None, None))
+        # FIXME: Do we need a timeout here in case that the state_changed callback never comes?
+        si.process.spawn(posixpath.join(SCRIPT_FOLDER, si.script.name + si.script.extension),
+                         si.params, env, '/', uid, gid, stdin, si.stdout, si.stderr)
 
 def check_script_result(result, decode_stderr=False, stderr_is_redirected=False, add_stdout_to_message=False):
     assert result is not None, "result of script execution was None, this was refactored incompletly"
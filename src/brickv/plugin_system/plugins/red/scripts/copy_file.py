@@ -0,0 +1,26 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+
+# copy_file.py <source> <target>
+#   copies <source> to <target>, replacing <target> if it exists. <target>
+#   gets the owner and permissions of <source>
+
+import os
+import shutil
+import sys
+
+if len(sys.argv) < 3:
+    sys.stderr.write(u'Missing parameters'.encode('utf-8'))
+    exit(2)
+
+try:
+    st = os.stat(sys.argv[1])
+
+    shutil.copyfile(sys.argv[1], sys.argv[2])
+    os.chmod(sys.argv[2], st.st_mode & 0o7777)
+    os.chown(sys.argv[2], st.st_uid, st.st_gid)
+except Exception as e:
+    sys.stderr.write(unicode(e).encode('utf-8'))
+    exit(3)
+
+exit(0)
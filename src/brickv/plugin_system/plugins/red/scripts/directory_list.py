@@ -0,0 +1,46 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+
+# Lists the entries of a directory with their size, mtime and mode. The
+# result contains a token identifying the listing. If the token of a
+# previous listing is passed and nothing changed, then the entries are
+# omitted. The directory mtime alone is not enough for this, because it
+# does not change if a file in the directory is modified.
+
+import hashlib
+import json
+import os
+import stat
+import sys
+import zlib
+
+if len(sys.argv) < 2 or not os.path.isdir(sys.argv[1]):
+    sys.stderr.write(u'Missing or invalid parameters'.encode('utf-8'))
+    exit(2)
+
+base    = sys.argv[1]
+entries = {}
+
+try:
+    for name in os.listdir(base):
+        st = os.lstat(os.path.join(base, name))
+
+        if stat.S_ISDIR(st.st_mode):
+            # don't report the size of directories, it's meaningless
+            entries[name] = {'d': 1, 'l': int(st.st_mtime), 'p': int(st.st_mode)}
+        else:
+            entries[name] = {'s': st.st_size, 'l': int(st.st_mtime), 'p': int(st.st_mode)}
+except Exception as e:
+    sys.stderr.write(unicode(e).encode('utf-8'))
+    exit(3)
+
+encoded = json.dumps(entries, separators=(',', ':'), sort_keys=True)
+token   = hashlib.md5(encoded).hexdigest()
+
+if len(sys.argv) > 2 and sys.argv[2] == token:
+    result = '{"t":"' + token + '"}'
+else:
+    result = '{"t":"' + token + '","e":' + encoded + '}'
+
+sys.stdout.write(zlib.compress(result))
+exit(0)
@@ -1,10 +1,15 @@
 #!/usr/bin/env python2
 # -*- coding: utf-8 -*-
 
+# writes the archive to stdout while it is being created, Brick Viewer
+# receives it through a pipe and no temporary archive is stored on the
+# SD card
+
 import os
 import sys
 import tarfile
-import tempfile
+import time
+from StringIO import StringIO
 
 programs = sys.argv[1:]
 
@@ -13,24 +18,22 @@ if len(programs) == 0:
     exit(1)
 
 try:
-    directory = tempfile.mkdtemp(prefix='tfrba-export-')
-    archive = os.path.join(directory, 'archive.tfrba')
-    version = os.path.join(directory, 'tfrba-version')
-
-    os.chmod(directory, 0o755)
+    version = '1'
+    info = tarfile.TarInfo('tfrba-version')
+    info.size = len(version)
+    info.mode = 0o644
+    info.mtime = time.time()
 
-    with open(version, 'wb') as f:
-        f.write('1')
-
-    with tarfile.open(archive, 'w:gz') as a:
-        a.add(version, 'tfrba-version')
+    with tarfile.open(fileobj=sys.stdout, mode='w|gz') as a:
+        a.addfile(info, StringIO(version))
 
         for program in programs:
             a.add(os.path.join('/', 'home', 'tf', 'programs', program),
                   os.path.join('programs', program))
+
+    sys.stdout.flush()
 except Exception as e:
     sys.stderr.write(unicode(e).encode('utf-8'))
     exit(2)
 
-sys.stdout.write(unicode(directory).encode('utf-8'))
 exit(0)
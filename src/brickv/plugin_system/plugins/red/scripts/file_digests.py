@@ -0,0 +1,48 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+import stat
+import sys
+import zlib
+
+if len(sys.argv) < 3 or not os.path.isdir(sys.argv[1]):
+    sys.stderr.write(u'Missing or invalid parameters'.encode('utf-8'))
+    exit(2)
+
+base       = sys.argv[1]
+block_size = int(sys.argv[2])
+result     = {}
+
+try:
+    for name in sys.argv[3:]:
+        path = os.path.join(base, name)
+
+        try:
+            st = os.lstat(path)
+        except OSError:
+            continue # file doesn't exist yet
+
+        if not stat.S_ISREG(st.st_mode):
+            continue
+
+        digests = []
+
+        with open(path, 'rb') as f:
+            while True:
+                block = f.read(block_size)
+
+                if len(block) == 0:
+                    break
+
+                digests.append(hashlib.md5(block).hexdigest())
+
+        result[name.decode('utf-8')] = [st.st_size, digests]
+except Exception as e:
+    sys.stderr.write(unicode(e).encode('utf-8'))
+    exit(3)
+
+sys.stdout.write(zlib.compress(json.dumps(result, separators=(',', ':'))))
+exit(0)
@@ -55,22 +55,59 @@ esac
 exit 0
 """
 
+# reads the archive from stdin while it is being uploaded and extracts the
+# selected programs on the fly, no temporary archive is stored on the SD card.
+# the number of consumed archive bytes is reported on stdout, Brick Viewer
+# uses this for flow control and progress
+
+class ArchiveReader(object):
+    def __init__(self, length):
+        self.remaining = length
+        self.consumed = 0
+
+        self.report()
+
+    def report(self):
+        sys.stdout.write('{0}\n'.format(self.consumed))
+        sys.stdout.flush()
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+
+        data = ''
+
+        while len(data) < size:
+            chunk = sys.stdin.read(size - len(data))
+
+            if len(chunk) == 0:
+                raise Exception(u'Archive ended unexpectedly')
+
+            data += chunk
+
+        self.remaining -= len(data)
+        self.consumed += len(data)
+
+        self.report()
+
+        return data
+
 if len(sys.argv) < 3:
     sys.stderr.write(u'Missing parameters'.encode('utf-8'))
     exit(2)
 
-archive = os.path.join(sys.argv[1], 'archive.tfrba')
 programs = sys.argv[2:]
 
 try:
-    with tarfile.open(archive, 'r:gz') as a:
-        try:
-            v = a.extractfile('tfrba-version')
-        except Exception as e:
-            raise Exception(u'Could not extract tfrba-version: {0}'.format(e))
+    reader = ArchiveReader(int(sys.argv[1]))
+
+    with tarfile.open(fileobj=reader, mode='r|gz') as a:
+        v = a.next()
 
-        version = v.read()
-        v.close()
+        if v == None or v.name != 'tfrba-version':
+            raise Exception(u'Could not extract tfrba-version: Not the first archive member')
+
+        version = a.extractfile(v).read()
 
         if version != '1':
             raise Exception(u'Unknown tfrba-version {0}'.format(version))
@@ -81,17 +118,18 @@ try:
             if len(program) > 0:
                 prefixes.append('programs/' + program + '/')
 
-        members = []
+        directory = tempfile.mkdtemp(prefix='extracted-tfrba-import-', dir='/home/tf')
 
-        for member in a.getmembers():
+        for member in a:
             for prefix in prefixes:
                 if member.name.startswith(prefix):
-                    members.append(member)
+                    a.extract(member, path=directory)
                     break
 
-        directory = tempfile.mkdtemp(prefix='extracted-tfrba-import-', dir='/home/tf')
-
-        a.extractall(path=directory, members=members)
+    # consume the padding after the end of the archive, so the upload can
+    # finish even if tarfile stopped reading early
+    while len(reader.read(65536)) > 0:
+        pass
 
     def fixup(path):
         os.chown(path, 1000, 1000)
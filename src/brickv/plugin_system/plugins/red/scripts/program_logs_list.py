@@ -1,19 +1,70 @@
 #!/usr/bin/env python2
 # -*- coding: utf-8 -*-
 
+# Lists the log files of a program with their sizes. Without a cursor all
+# files are returned. With the cursor of a previous call only new files,
+# files with a changed size and deleted files are returned. The listing of
+# each cursor is kept in a state file, if it is missing a full listing is
+# returned instead.
+
 import json
 import os
 import stat
 import sys
+import time
 import zlib
 
-result = {}
+STATE_PREFIX = '/tmp/tf-program-logs-list-'
+STATE_MAX_AGE = 24 * 60 * 60 # seconds
+
+def state_path(cursor):
+    return STATE_PREFIX + os.path.basename(cursor) + '.json'
+
+def load_state(cursor, base):
+    try:
+        with open(state_path(cursor), 'rb') as f:
+            state = json.load(f)
+
+        os.remove(state_path(cursor))
+    except:
+        return None
+
+    if state.get('base') != base or not isinstance(state.get('files'), dict):
+        return None
+
+    return state['files']
+
+def save_state(base, files):
+    cursor = os.urandom(8).encode('hex')
+
+    try:
+        with open(state_path(cursor), 'wb') as f:
+            json.dump({'base': base, 'files': files}, f, separators=(',', ':'))
+    except:
+        return None
+
+    return cursor
+
+def prune_states():
+    directory, prefix = os.path.split(STATE_PREFIX)
+    now = time.time()
+
+    for name in os.listdir(directory):
+        if name.startswith(prefix):
+            try:
+                path = os.path.join(directory, name)
+
+                if now - os.lstat(path).st_mtime > STATE_MAX_AGE:
+                    os.remove(path)
+            except:
+                pass
 
 if len(sys.argv) < 2 or not os.path.isdir(sys.argv[1]):
     sys.stderr.write(u'Missing or invalid parameters'.encode('utf-8'))
     exit(2)
 
 base = sys.argv[1]
+files = {}
 
 try:
     for name in os.listdir(base):
@@ -23,10 +74,31 @@ try:
         st = os.lstat(os.path.join(base, name))
 
         if stat.S_ISREG(st.st_mode):
-            result[name] = st.st_size
+            files[name] = st.st_size
 except Exception as e:
     sys.stderr.write(unicode(e).encode('utf-8'))
     exit(3)
 
+if len(sys.argv) > 2 and len(sys.argv[2]) > 0:
+    previous = load_state(sys.argv[2], base)
+else:
+    previous = None
+
+if previous == None:
+    result = {'full': True, 'files': files, 'deleted': []}
+else:
+    changed = {}
+
+    for name, size in files.items():
+        if previous.get(name) != size:
+            changed[name] = size
+
+    deleted = [name for name in previous if name not in files]
+    result = {'full': False, 'files': changed, 'deleted': deleted}
+
+prune_states()
+
+result['cursor'] = save_state(base, files)
+
 sys.stdout.write(zlib.compress(json.dumps(result, separators=(',', ':'))))
 exit(0)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+
+# Long-running helper that executes other scripts from the scripts/ folder
+# in-process instead of spawning a new interpreter for each invocation.
+#
+# Request frame (stdin):   <uint32 length> <JSON [script_name, [param, ...]]>
+# Response frame (stdout): <int32 exit_code> <uint32 stdout_length>
+#                          <uint32 stderr_length> <stdout> <stderr>
+#
+# A request can also be a batch of scripts that are executed one after another:
+#
+# Request frame (stdin):   <uint32 length> <JSON [[script_name, [param, ...]], ...]>
+#
+# The stdout of the response to a batch is a JSON list with one entry
+# [exit_code, stdout, stderr] per script.
+#
+# All integers are little endian. Requests are handled one after another.
+#
+# While a script is executed file descriptors 1 and 2 are redirected to the
+# temporary files that capture its stdout and stderr, so the output of child
+# processes started by the script is part of the response as well.
+
+import json
+import os
+import struct
+import sys
+import tempfile
+import traceback
+
+SCRIPT_FOLDER = '/usr/local/scripts'
+
+# writes unbuffered to a temporary file, so that the output of the script and
+# of its child processes that share the file descriptor stays in order
+class Capture(object):
+    def __init__(self):
+        self.file = tempfile.TemporaryFile()
+        self.fd   = self.file.fileno()
+
+    def write(self, data):
+        if isinstance(data, unicode):
+            data = data.encode('utf-8')
+
+        while len(data) > 0:
+            data = data[os.write(self.fd, data):]
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+    def getvalue(self):
+        chunks = []
+
+        os.lseek(self.fd, 0, os.SEEK_SET)
+
+        while True:
+            chunk = os.read(self.fd, 65536)
+
+            if len(chunk) == 0:
+                break
+
+            chunks.append(chunk)
+
+        self.file.close()
+
+        return ''.join(chunks)
+
+def read_exactly(f, length):
+    data = ''
+
+    while len(data) < length:
+        chunk = f.read(length - len(data))
+
+        if len(chunk) == 0:
+            return None
+
+        data += chunk
+
+    return data
+
+# script path -> (mtime, size, code object)
+code_cache = {}
+
+def get_code(name):
+    path = os.path.join(SCRIPT_FOLDER, os.path.basename(name) + '.py')
+    st   = os.stat(path)
+    key  = (st.st_mtime, st.st_size)
+
+    try:
+        cached_key, code = code_cache[path]
+
+        if cached_key == key:
+            return path, code
+    except KeyError:
+        pass
+
+    with open(path, 'rb') as f:
+        code = compile(f.read(), path, 'exec')
+
+    code_cache[path] = (key, code)
+
+    return path, code
+
+def execute(name, params):
+    stdout = Capture()
+    stderr = Capture()
+
+    saved_argv   = sys.argv
+    saved_stdin  = sys.stdin
+    saved_stdout = sys.stdout
+    saved_stderr = sys.stderr
+    exit_code    = 0
+
+    try:
+        path, code = get_code(name)
+
+        # the site exit() function closes sys.stdin, give it a throwaway file
+        sys.argv   = [path] + [param.encode('utf-8') for param in params]
+        sys.stdin  = open(os.devnull, 'rb')
+        sys.stdout = stdout
+        sys.stderr = stderr
+
+        os.dup2(stdout.fd, 1)
+        os.dup2(stderr.fd, 2)
+
+        exec(code, {'__name__': '__main__', '__file__': path})
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, (int, long)):
+            exit_code = e.code
+        else:
+            stderr.write(str(e.code))
+            exit_code = 1
+    except:
+        traceback.print_exc(file=stderr)
+        exit_code = 1
+    finally:
+        try:
+            sys.stdin.close()
+        except:
+            pass
+
+        sys.argv   = saved_argv
+        sys.stdin  = saved_stdin
+        sys.stdout = saved_stdout
+        sys.stderr = saved_stderr
+
+        os.dup2(devnull, 1)
+        os.dup2(original_stderr, 2)
+
+        os.chdir('/')
+
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+requests  = os.fdopen(os.dup(sys.stdin.fileno()), 'rb', 0)
+responses = os.fdopen(os.dup(sys.stdout.fileno()), 'wb')
+
+# child processes started by scripts inherit file descriptors 0 and 1, ensure
+# that they cannot interfere with the framed request and response streams
+devnull         = os.open(os.devnull, os.O_RDWR)
+original_stderr = os.dup(2)
+
+os.dup2(devnull, 0)
+os.dup2(devnull, 1)
+
+while True:
+    header = read_exactly(requests, 4)
+
+    if header == None:
+        break
+
+    length = struct.unpack('<I', header)[0]
+    body   = read_exactly(requests, length)
+
+    if body == None:
+        break
+
+    try:
+        request = json.loads(body.decode('utf-8'))
+
+        if isinstance(request[0], list):
+            batch = [(name, params) for name, params in request]
+        else:
+            batch = None
+            name, params = request
+    except Exception as e:
+        exit_code, out, err = 2, '', 'Malformed request: {0}'.format(e)
+    else:
+        if batch == None:
+            exit_code, out, err = execute(name, params)
+        else:
+            results = []
+
+            for name, params in batch:
+                result_exit_code, result_out, result_err = execute(name, params)
+
+                results.append([result_exit_code, result_out.decode('utf-8', 'replace'), result_err.decode('utf-8', 'replace')])
+
+            exit_code, out, err = 0, json.dumps(results, separators=(',', ':')), ''
+
+    responses.write(struct.pack('<iII', exit_code, len(out), len(err)) + out + err)
+    responses.flush()
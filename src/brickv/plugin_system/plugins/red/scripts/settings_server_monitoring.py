@@ -3,6 +3,7 @@
 
 import os
 import re
+import grp
 import sys
 import json
 import stat
@@ -74,6 +75,9 @@ with open('/etc/tf_image_version', 'r') as f:
     IMAGE_VERSION = StrictVersion(f.read().split(' ')[0].strip())
 
 FILE_PATH_CHECK_SCRIPT = '/usr/local/bin/check_tinkerforge.py'
+FILE_PATH_CHECK_DAEMON_UNIT = '/etc/systemd/system/check-tinkerforge.service'
+FILE_PATH_CHECK_DAEMON_CONFIG = '/etc/check-tinkerforge.json'
+CHECK_DAEMON_USER = 'nagios'
 
 if IMAGE_VERSION and IMAGE_VERSION >= MIN_VERSION_WITH_NAGIOS4:
     FILE_PATH_TF_NAGIOS_CONFIGURATION = '/usr/local/nagios/etc/objects/tinkerforge.cfg'
@@ -83,8 +87,31 @@ else:
 SCRIPT_TINKERFORGE_CHECK = '''#!/usr/bin/env python2
 # -*- coding: utf-8 -*-
 
+# Nagios/Shinken check for Bricklet readings. The check asks the resident
+# check daemon (started with --daemon) over a local socket. The daemon keeps
+# one connection per Brick Daemon and caches the readings reported by the
+# Bricklet callbacks, so a check is answered within milliseconds. If the
+# daemon is not running then the check connects to the Brick Daemon itself.
+#
+# The daemon runs as the nagios user and only the nagios group can access its
+# socket. It only serves the checks listed in CONFIG_PATH, which is written by
+# the server monitoring settings. Other checks are answered with null and the
+# check connects to the Brick Daemon itself.
+#
+# Note: The callback configuration of a Bricklet is shared by all connections.
+# The daemon only enables a value callback (or the interrupts of the IO-4 and
+# Industrial Digital In 4 Bricklets) if it is disabled. If it is in use by
+# someone else then the daemon leaves it alone and reads the value with the
+# getter once the cached reading is older than the maximum age.
+
+import os
+import sys
+import json
 import time
+import socket
 import argparse
+import threading
+import SocketServer
 from tinkerforge.ip_connection import IPConnection
 
 from tinkerforge.bricklet_ptc import BrickletPTC
@@ -171,619 +198,835 @@ MESSAGE_WARNING_IO4_IDI4  = 'WARNING - CH0 = %s, CH1 = %s, CH2 = %s, CH3 = %s'
 MESSAGE_OK_IO4_IDI4 = 'OK - CH0 = %s, CH1 = %s, CH2 = %s, CH3 = %s'
 MESSAGE_UNKNOWN_READING = 'UNKNOWN - Unknown state'
 
-global args
-global ipcon
-global return_code
-global return_message
-args               = None
-ipcon              = None
-return_code        = None
-return_message     = None
+SOCKET_PATH     = '/run/check-tinkerforge/check.sock'
+CONFIG_PATH     = '/etc/check-tinkerforge.json'
+DEFAULT_MAX_AGE = 10.0 # seconds, older cached readings are read again
+CACHE_MAX_IDLE  = 600 # seconds, sensors and connections unused for longer are dropped
+CALLBACK_PERIOD = 1000 # milliseconds, for value callbacks that were disabled
+CLIENT_TIMEOUT  = 10 # seconds
+
+class CheckError(Exception):
+    def __init__(self, message):
+        Exception.__init__(self, message)
+
+        self.message = message
 
-def handle_result(message, code):
+def get_device_identifier(device):
     try:
-        ipcon.disconnect()
+        return device.get_identity().device_identifier
     except:
-        pass
+        raise CheckError(MESSAGE_CRITICAL_ERROR_GETTING_DEVICE_IDENTITY)
+
+class Sensor(object):
+    def __init__(self, ipcon, bricklet, uid, use_callbacks):
+        self.bricklet  = bricklet
+        self.uid       = uid
+        self.unit      = None
+        self.version   = 1 # of the IO4 and IDI4 Bricklet
+        self.device    = None
+        self.getter    = None
+        self.reading   = None
+        self.timestamp = None
+        self.lock      = threading.Lock()
+
+        if bricklet in [BRICKLET_PTC_2_WIRE, BRICKLET_PTC_3_WIRE, BRICKLET_PTC_4_WIRE]:
+            self.setup_ptc(ipcon, use_callbacks)
+        elif bricklet == BRICKLET_TEMPERATURE:
+            self.setup_temperature(ipcon, use_callbacks)
+        elif bricklet in [BRICKLET_HUMIDITY, BRICKLET_HUMIDITY_TEMP]:
+            self.setup_humidity(ipcon, use_callbacks)
+        elif bricklet == BRICKLET_AMBIENT_LIGHT:
+            self.setup_ambient_light(ipcon, use_callbacks)
+        elif bricklet == BRICKLET_IO4:
+            self.setup_io4(ipcon, use_callbacks)
+        elif bricklet == BRICKLET_IDI4:
+            self.setup_idi4(ipcon, use_callbacks)
+        else:
+            raise CheckError(MESSAGE_UNKNOWN_READING)
+
+    def update(self, reading):
+        with self.lock:
+            self.reading   = reading
+            self.timestamp = time.time()
+
+    def invalidate(self):
+        with self.lock:
+            self.timestamp = None
 
-    global return_code
-    global return_message
-    return_message = message
-    return_code = code
+    # the callbacks keep the reading up-to-date, but if the callback is not
+    # supported or the value did not change then the reading is fetched again
+    # once it is older than max_age
+    def read(self, max_age):
+        with self.lock:
+            if self.timestamp != None and time.time() - self.timestamp <= max_age:
+                return self.reading
 
-def cb_connect(connect_reason):
-    if args.secret:
         try:
-            ipcon.authenticate(args.secret)
+            reading = self.getter()
+        except CheckError:
+            raise
         except:
-            handle_result(MESSAGE_CRITICAL_AUTHENTICATION_FAILED,
-                          RETURN_CODE_CRITICAL)
+            raise CheckError(MESSAGE_CRITICAL_ERROR_READING_VALUE)
 
-    read(args.bricklet,
-         args.uid,
-         args.warning,
-         args.critical,
-         args.warning2,
-         args.critical2)
-
-def connect():
-    try:
-        ipcon.register_callback(IPConnection.CALLBACK_CONNECTED, cb_connect)
-        ipcon.connect(args.host, args.port)
-        time.sleep(1)
-    except:
-        handle_result(MESSAGE_CRITICAL_ERROR_CONNECTING,
-                      RETURN_CODE_CRITICAL)
-
-def read(bricklet, uid, warning, critical, warning2, critical2):
-    reading = None
-
-    if bricklet == BRICKLET_PTC_2_WIRE or\
-       bricklet == BRICKLET_PTC_3_WIRE or\
-       bricklet == BRICKLET_PTC_4_WIRE:
-            unit = '°C'
-            bricklet_ptc = BrickletPTC(uid, ipcon)
-
-            if got_ptc_v2:
-                device_identifier = None
-
-                try:
-                    device_identifier = bricklet_ptc.get_identity().device_identifier
-                except:
-                    bricklet_ptc = None
-                    handle_result(MESSAGE_CRITICAL_ERROR_GETTING_DEVICE_IDENTITY,
-                                  RETURN_CODE_CRITICAL)
-
-                    return
-
-                if device_identifier == BrickletPTCV2.DEVICE_IDENTIFIER:
-                    bricklet_ptc = BrickletPTCV2(uid, ipcon)
-
-            if bricklet_ptc != None:
-                try:
-                    if not bricklet_ptc.is_sensor_connected():
-                        bricklet_ptc = None
-                        handle_result(MESSAGE_CRITICAL_NO_PTC_CONNECTED,
-                                      RETURN_CODE_CRITICAL)
-
-                        return
-                except:
-                    bricklet_ptc = None
-                    handle_result(MESSAGE_CRITICAL_ERROR_GETTING_PTC_STATE,
-                                  RETURN_CODE_CRITICAL)
-
-                    return
-
-                try:
-                    if bricklet == BRICKLET_PTC_2_WIRE:
-                        bricklet_ptc.set_wire_mode(bricklet_ptc.WIRE_MODE_2)
-                    elif bricklet == BRICKLET_PTC_3_WIRE:
-                        bricklet_ptc.set_wire_mode(bricklet_ptc.WIRE_MODE_3)
-                    elif bricklet == BRICKLET_PTC_4_WIRE:
-                        bricklet_ptc.set_wire_mode(bricklet_ptc.WIRE_MODE_4)
-                except:
-                    bricklet_ptc = None
-                    handle_result(MESSAGE_CRITICAL_ERROR_SETTING_PTC_MODE,
-                                  RETURN_CODE_CRITICAL)
-
-                    return
-
-                try:
-                    reading = bricklet_ptc.get_temperature() / 100.0
-                except:
-                    handle_result(MESSAGE_CRITICAL_ERROR_READING_VALUE,
-                                  RETURN_CODE_CRITICAL)
-
-                    return
-
-    elif bricklet == BRICKLET_TEMPERATURE:
-        unit = '°C'
-        bricklet_temperature = BrickletTemperature(uid, ipcon)
-
-        if got_temperature_v2:
-            device_identifier = None
+        self.update(reading)
 
-            try:
-                device_identifier = bricklet_temperature.get_identity().device_identifier
-            except:
-                bricklet_temperature = None
-                handle_result(MESSAGE_CRITICAL_ERROR_GETTING_DEVICE_IDENTITY,
-                              RETURN_CODE_CRITICAL)
+        return reading
 
+    # the callback is only enabled if is_disabled reports that nobody else uses
+    # it, otherwise the reading is fetched with the getter
+    def enable_callback(self, callback_id, convert, is_disabled, configure):
+        try:
+            if not is_disabled():
                 return
 
-            if device_identifier == BrickletTemperatureV2.DEVICE_IDENTIFIER:
-                bricklet_temperature = BrickletTemperatureV2(uid, ipcon)
+            configure()
+        except:
+            return
 
-        if bricklet_temperature != None:
-            try:
-                reading = bricklet_temperature.get_temperature() / 100.0
-            except:
-                handle_result(MESSAGE_CRITICAL_ERROR_READING_VALUE,
-                            RETURN_CODE_CRITICAL)
+        self.device.register_callback(callback_id, lambda *values: self.update(convert(*values)))
 
-                return
+    def setup_ptc(self, ipcon, use_callbacks):
+        self.unit   = '°C'
+        self.device = BrickletPTC(self.uid, ipcon)
+        version     = 1
+
+        if got_ptc_v2 and get_device_identifier(self.device) == BrickletPTCV2.DEVICE_IDENTIFIER:
+            self.device = BrickletPTCV2(self.uid, ipcon)
+            version     = 2
 
-    elif bricklet == BRICKLET_HUMIDITY:
-        unit = '%RH'
-        divisor = 10.0
-        bricklet_humidity = BrickletHumidity(uid, ipcon)
+        device = self.device
 
-        if got_humidity_v2:
-            device_identifier = None
+        try:
+            if self.bricklet == BRICKLET_PTC_2_WIRE:
+                device.set_wire_mode(device.WIRE_MODE_2)
+            elif self.bricklet == BRICKLET_PTC_3_WIRE:
+                device.set_wire_mode(device.WIRE_MODE_3)
+            elif self.bricklet == BRICKLET_PTC_4_WIRE:
+                device.set_wire_mode(device.WIRE_MODE_4)
+        except:
+            raise CheckError(MESSAGE_CRITICAL_ERROR_SETTING_PTC_MODE)
 
+        def get_temperature():
             try:
-                device_identifier = bricklet_humidity.get_identity().device_identifier
+                connected = device.is_sensor_connected()
             except:
-                bricklet_humidity = None
-                handle_result(MESSAGE_CRITICAL_ERROR_GETTING_DEVICE_IDENTITY,
-                              RETURN_CODE_CRITICAL)
+                raise CheckError(MESSAGE_CRITICAL_ERROR_GETTING_PTC_STATE)
 
-                return
+            if not connected:
+                raise CheckError(MESSAGE_CRITICAL_NO_PTC_CONNECTED)
 
-            if device_identifier == BrickletHumidityV2.DEVICE_IDENTIFIER:
-                divisor = 100.0
-                bricklet_humidity = BrickletHumidityV2(uid, ipcon)
+            return device.get_temperature() / 100.0
 
-        if bricklet_humidity != None:
-            try:
-                reading = bricklet_humidity.get_humidity() / divisor
-            except:
-                handle_result(MESSAGE_CRITICAL_ERROR_READING_VALUE,
-                            RETURN_CODE_CRITICAL)
+        self.getter = get_temperature
+
+        if not use_callbacks:
+            return
+
+        if version == 1:
+            is_disabled = lambda: device.get_temperature_callback_period() == 0
+            configure   = lambda: device.set_temperature_callback_period(CALLBACK_PERIOD)
+        else:
+            is_disabled = lambda: device.get_temperature_callback_configuration().period == 0
+            configure   = lambda: device.set_temperature_callback_configuration(CALLBACK_PERIOD, False, 'x', 0, 0)
+
+        self.enable_callback(device.CALLBACK_TEMPERATURE, lambda temperature: temperature / 100.0, is_disabled, configure)
+
+        # a cached reading is not valid anymore if the sensor gets disconnected
+        device.register_callback(device.CALLBACK_SENSOR_CONNECTED,
+                                 lambda connected: None if connected else self.invalidate())
+
+        try:
+            if not device.get_sensor_connected_callback_configuration():
+                device.set_sensor_connected_callback_configuration(True)
+        except:
+            pass
+
+    def setup_temperature(self, ipcon, use_callbacks):
+        self.unit   = '°C'
+        self.device = BrickletTemperature(self.uid, ipcon)
+        version     = 1
+
+        if got_temperature_v2 and get_device_identifier(self.device) == BrickletTemperatureV2.DEVICE_IDENTIFIER:
+            self.device = BrickletTemperatureV2(self.uid, ipcon)
+            version     = 2
+
+        device      = self.device
+        self.getter = lambda: device.get_temperature() / 100.0
+
+        if not use_callbacks:
+            return
+
+        if version == 1:
+            is_disabled = lambda: device.get_temperature_callback_period() == 0
+            configure   = lambda: device.set_temperature_callback_period(CALLBACK_PERIOD)
+        else:
+            is_disabled = lambda: device.get_temperature_callback_configuration().period == 0
+            configure   = lambda: device.set_temperature_callback_configuration(CALLBACK_PERIOD, False, 'x', 0, 0)
+
+        self.enable_callback(device.CALLBACK_TEMPERATURE, lambda temperature: temperature / 100.0, is_disabled, configure)
+
+    def setup_humidity(self, ipcon, use_callbacks):
+        self.device = BrickletHumidity(self.uid, ipcon)
+        version     = 1
+
+        if got_humidity_v2 and get_device_identifier(self.device) == BrickletHumidityV2.DEVICE_IDENTIFIER:
+            self.device = BrickletHumidityV2(self.uid, ipcon)
+            version     = 2
+
+        device = self.device
+
+        if self.bricklet == BRICKLET_HUMIDITY_TEMP:
+            self.unit   = '°C'
+            self.getter = lambda: device.get_temperature() / 100.0
+
+            if use_callbacks and version == 2:
+                self.enable_callback(device.CALLBACK_TEMPERATURE, lambda temperature: temperature / 100.0,
+                                     lambda: device.get_temperature_callback_configuration().period == 0,
+                                     lambda: device.set_temperature_callback_configuration(CALLBACK_PERIOD, False, 'x', 0, 0))
+        else:
+            divisor     = 10.0 if version == 1 else 100.0
+            self.unit   = '%RH'
+            self.getter = lambda: device.get_humidity() / divisor
 
+            if not use_callbacks:
                 return
 
-    elif bricklet == BRICKLET_HUMIDITY_TEMP:
-        unit = '°C'
-        divisor = 100.0
-        bricklet_humidity = BrickletHumidity(uid, ipcon)
+            if version == 1:
+                is_disabled = lambda: device.get_humidity_callback_period() == 0
+                configure   = lambda: device.set_humidity_callback_period(CALLBACK_PERIOD)
+            else:
+                is_disabled = lambda: device.get_humidity_callback_configuration().period == 0
+                configure   = lambda: device.set_humidity_callback_configuration(CALLBACK_PERIOD, False, 'x', 0, 0)
+
+            self.enable_callback(device.CALLBACK_HUMIDITY, lambda humidity: humidity / divisor, is_disabled, configure)
 
-        if got_humidity_v2:
-            device_identifier = None
+    def setup_ambient_light(self, ipcon, use_callbacks):
+        self.unit         = 'Lux'
+        self.device       = BrickletAmbientLight(self.uid, ipcon)
+        divisor           = 10.0
+        version           = 1
+        device_identifier = get_device_identifier(self.device)
+
+        if got_ambient_light_v2 and device_identifier == BrickletAmbientLightV2.DEVICE_IDENTIFIER:
+            self.device = BrickletAmbientLightV2(self.uid, ipcon)
+            divisor     = 100.0
+            version     = 2
 
             try:
-                device_identifier = bricklet_humidity.get_identity().device_identifier
+                self.device.set_configuration(BrickletAmbientLightV2.ILLUMINANCE_RANGE_UNLIMITED,
+                                              BrickletAmbientLightV2.INTEGRATION_TIME_200MS)
             except:
-                bricklet_humidity = None
-                handle_result(MESSAGE_CRITICAL_ERROR_GETTING_DEVICE_IDENTITY,
-                              RETURN_CODE_CRITICAL)
+                raise CheckError(MESSAGE_CRITICAL_ERROR_SETTING_AMBIENT_LIGHT_CONFIGURATION)
 
-                return
-
-            if device_identifier == BrickletHumidityV2.DEVICE_IDENTIFIER:
-                bricklet_humidity = BrickletHumidityV2(uid, ipcon)
+        if got_ambient_light_v3 and device_identifier == BrickletAmbientLightV3.DEVICE_IDENTIFIER:
+            self.device = BrickletAmbientLightV3(self.uid, ipcon)
+            divisor     = 100.0
+            version     = 3
 
-        if bricklet_humidity != None:
             try:
-                reading = bricklet_humidity.get_temperature() / divisor
+                self.device.set_configuration(BrickletAmbientLightV3.ILLUMINANCE_RANGE_UNLIMITED,
+                                              BrickletAmbientLightV3.INTEGRATION_TIME_200MS)
             except:
-                handle_result(MESSAGE_CRITICAL_ERROR_READING_VALUE,
-                            RETURN_CODE_CRITICAL)
+                raise CheckError(MESSAGE_CRITICAL_ERROR_SETTING_AMBIENT_LIGHT_CONFIGURATION)
 
-                return
+        device      = self.device
+        self.getter = lambda: device.get_illuminance() / divisor
+
+        if not use_callbacks:
+            return
+
+        if version in [1, 2]:
+            is_disabled = lambda: device.get_illuminance_callback_period() == 0
+            configure   = lambda: device.set_illuminance_callback_period(CALLBACK_PERIOD)
+        else:
+            is_disabled = lambda: device.get_illuminance_callback_configuration().period == 0
+            configure   = lambda: device.set_illuminance_callback_configuration(CALLBACK_PERIOD, False, 'x', 0, 0)
+
+        self.enable_callback(device.CALLBACK_ILLUMINANCE, lambda illuminance: illuminance / divisor, is_disabled, configure)
 
-    elif bricklet == BRICKLET_AMBIENT_LIGHT:
-        unit = 'Lux'
-        divisor = 10.0
-        bricklet_ambient_light = BrickletAmbientLight(uid, ipcon)
-        range = None
-        integration_time = None
+    def setup_io4(self, ipcon, use_callbacks):
+        self.device = BrickletIO4(self.uid, ipcon)
+
+        if got_io4_v2 and get_device_identifier(self.device) == BrickletIO4V2.DEVICE_IDENTIFIER:
+            self.device  = BrickletIO4V2(self.uid, ipcon)
+            self.version = 2
+
+        device = self.device
 
         try:
-            device_identifier = bricklet_ambient_light.get_identity().device_identifier
+            if self.version == 1:
+                device.set_configuration(15, BrickletIO4V2.DIRECTION_IN, True)
+            else:
+                for channel in range(4):
+                    device.set_configuration(channel, BrickletIO4V2.DIRECTION_IN, True)
         except:
-            bricklet_ambient_light = None
-            handle_result(MESSAGE_CRITICAL_ERROR_GETTING_DEVICE_IDENTITY,
-                            RETURN_CODE_CRITICAL)
+            raise CheckError(MESSAGE_CRITICAL_ERROR_SETTING_IO4_CONFIGURATION)
+
+        self.getter = device.get_value
+
+        if not use_callbacks:
             return
 
-        if got_ambient_light_v2 and device_identifier == BrickletAmbientLightV2.DEVICE_IDENTIFIER:
-            divisor = 100.0
-            range = BrickletAmbientLightV2.ILLUMINANCE_RANGE_UNLIMITED
-            integration_time = BrickletAmbientLightV2.INTEGRATION_TIME_200MS
-            bricklet_ambient_light = BrickletAmbientLightV2(uid, ipcon)
+        if self.version == 1:
+            self.enable_callback(device.CALLBACK_INTERRUPT, lambda interrupt_mask, value_mask: value_mask,
+                                 lambda: device.get_interrupt() == 0,
+                                 lambda: device.set_interrupt(15))
+        else:
+            self.enable_callback(device.CALLBACK_ALL_INPUT_VALUE, lambda changed, value: value,
+                                 lambda: device.get_all_input_value_callback_configuration().period == 0,
+                                 lambda: device.set_all_input_value_callback_configuration(CALLBACK_PERIOD, False))
 
-        if got_ambient_light_v3 and device_identifier == BrickletAmbientLightV3.DEVICE_IDENTIFIER:
-            divisor = 100.0
-            range = BrickletAmbientLightV3.ILLUMINANCE_RANGE_UNLIMITED
-            integration_time = BrickletAmbientLightV3.INTEGRATION_TIME_200MS
-            bricklet_ambient_light = BrickletAmbientLightV3(uid, ipcon)
-
-        if bricklet_ambient_light != None:
-            if range is not None and integration_time is not None:
-                try:
-                    bricklet_ambient_light.set_configuration(range, integration_time)
-                except:
-                    bricklet_ambient_light = None
-                    handle_result(MESSAGE_CRITICAL_ERROR_SETTING_AMBIENT_LIGHT_CONFIGURATION,
-                                RETURN_CODE_CRITICAL)
-
-                    return
+    def setup_idi4(self, ipcon, use_callbacks):
+        self.device = BrickletIndustrialDigitalIn4(self.uid, ipcon)
 
-            try:
-                reading = bricklet_ambient_light.get_illuminance() / divisor
-            except:
-                handle_result(MESSAGE_CRITICAL_ERROR_READING_VALUE,
-                              RETURN_CODE_CRITICAL)
+        if got_idi4_v2 and get_device_identifier(self.device) == BrickletIndustrialDigitalIn4V2.DEVICE_IDENTIFIER:
+            self.device  = BrickletIndustrialDigitalIn4V2(self.uid, ipcon)
+            self.version = 2
 
-                return
+        device      = self.device
+        self.getter = device.get_value
 
-    elif bricklet == BRICKLET_IO4:
-        bricklet_io4_idi4_version = 1
-        bricklet_io4 = BrickletIO4(uid, ipcon)
+        if not use_callbacks:
+            return
 
-        if got_io4_v2:
-            device_identifier = None
+        if self.version == 1:
+            self.enable_callback(device.CALLBACK_INTERRUPT, lambda interrupt_mask, value_mask: value_mask,
+                                 lambda: device.get_interrupt() == 0,
+                                 lambda: device.set_interrupt(15))
+        else:
+            self.enable_callback(device.CALLBACK_ALL_VALUE, lambda changed, value: value,
+                                 lambda: device.get_all_value_callback_configuration().period == 0,
+                                 lambda: device.set_all_value_callback_configuration(CALLBACK_PERIOD, False))
+
+def evaluate(bricklet, reading, unit, bricklet_io4_idi4_version, warning, critical, warning2, critical2):
+    if bricklet != BRICKLET_IO4 and bricklet != BRICKLET_IDI4:
+        if reading >= critical:
+            return (MESSAGE_CRITICAL_READING_TOO_HIGH % (reading, unit),
+                    RETURN_CODE_CRITICAL)
+        elif reading >= warning:
+            return (MESSAGE_WARNING_READING_IS_HIGH % (reading, unit),
+                    RETURN_CODE_WARNING)
+        elif reading <= critical2:
+            return (MESSAGE_CRITICAL_READING_TOO_LOW % (reading, unit),
+                    RETURN_CODE_CRITICAL)
+        elif reading <= warning2:
+            return (MESSAGE_WARNING_READING_IS_LOW % (reading, unit),
+                    RETURN_CODE_WARNING)
+        elif reading > warning2 and reading < warning:
+            return (MESSAGE_OK_READING % (reading, unit),
+                    RETURN_CODE_OK)
+        else:
+            return (MESSAGE_UNKNOWN_READING, RETURN_CODE_UNKNOWN)
+    else:
+        warnings = []
+        criticals = []
+        warning = int(warning)
+        critical = int(critical)
+        io4_idi4_warning = False
+        io4_idi4_critical = False
+
+        ch0 =                {
+                'is_warning': False,
+                'is_critical': False,
+                'current_state': 0,
+                'warning':
+                    {
+                        'expected_state': None,
+                    },
+                'critical':
+                    {
+                        'expected_state': None,
+                    }
+            }
+        ch1 =                {
+                'is_warning': False,
+                'is_critical': False,
+                'current_state': 0,
+                'warning':
+                    {
+                        'expected_state': None,
+                    },
+                'critical':
+                    {
+                        'expected_state': None,
+                    }
+            }
+        ch2 =                {
+                'is_warning': False,
+                'is_critical': False,
+                'current_state': 0,
+                'warning':
+                    {
+                        'expected_state': None,
+                    },
+                'critical':
+                    {
+                        'expected_state': None,
+                    }
+            }
+        ch3 =                {
+                'is_warning': False,
+                'is_critical': False,
+                'current_state': 0,
+                'warning':
+                    {
+                        'expected_state': None,
+                    },
+                'critical':
+                    {
+                        'expected_state': None,
+                    }
+            }
 
-            try:
-                device_identifier = bricklet_io4.get_identity().device_identifier
-            except:
-                bricklet_io4 = None
-                handle_result(MESSAGE_CRITICAL_ERROR_GETTING_DEVICE_IDENTITY,
-                              RETURN_CODE_CRITICAL)
+        # Warning
+        if (warning & 0x03) == 0:
+            ch0['warning']['expected_state'] = False
+        elif (warning & 0x03) == 1:
+            ch0['warning']['expected_state']  = True
+        else:
+            ch0['warning']['expected_state']  = 'IGN'
 
-                return
+        if ((warning & 0x0C) >> 2) == 0:
+            ch1['warning']['expected_state']  = False
+        elif ((warning & 0x0C) >> 2) == 1:
+            ch1['warning']['expected_state']  = True
+        else:
+            ch1['warning']['expected_state']  = 'IGN'
 
-            if device_identifier == BrickletIO4V2.DEVICE_IDENTIFIER:
-                bricklet_io4_idi4_version = 2
-                bricklet_io4 = BrickletIO4V2(uid, ipcon)
-
-        if bricklet_io4 != None:
-            if bricklet_io4_idi4_version == 1:
-                try:
-                    bricklet_io4.set_configuration(15, BrickletIO4V2.DIRECTION_IN, True)
-                except:
-                    bricklet_io4 = None
-                    handle_result(MESSAGE_CRITICAL_ERROR_SETTING_IO4_CONFIGURATION,
-                                  RETURN_CODE_CRITICAL)
-
-                    return
-
-            elif bricklet_io4_idi4_version == 2:
-                try:
-                    bricklet_io4.set_configuration(0, BrickletIO4V2.DIRECTION_IN, True)
-                    bricklet_io4.set_configuration(1, BrickletIO4V2.DIRECTION_IN, True)
-                    bricklet_io4.set_configuration(2, BrickletIO4V2.DIRECTION_IN, True)
-                    bricklet_io4.set_configuration(3, BrickletIO4V2.DIRECTION_IN, True)
-                except:
-                    bricklet_io4 = None
-                    handle_result(MESSAGE_CRITICAL_ERROR_SETTING_IO4_CONFIGURATION,
-                                  RETURN_CODE_CRITICAL)
-
-                    return
+        if ((warning & 0x30) >> 4) == 0:
+            ch2['warning']['expected_state']  = False
+        elif ((warning & 0x30) >> 4) == 1:
+            ch2['warning']['expected_state']  = True
+        else:
+            ch2['warning']['expected_state']  = 'IGN'
 
-            try:
-                reading = bricklet_io4.get_value()
-            except:
-                handle_result(MESSAGE_CRITICAL_ERROR_READING_VALUE,
-                              RETURN_CODE_CRITICAL)
+        if ((warning & 0xC0) >> 6) == 0:
+            ch3['warning']['expected_state']  = False
+        elif ((warning & 0xC0) >> 6) == 1:
+            ch3['warning']['expected_state']  = True
+        else:
+            ch3['warning']['expected_state']  = 'IGN'
 
-                return
+        # Critical
+        if (critical & 0x03) == 0:
+            ch0['critical']['expected_state'] = False
+        elif ((critical & 0x03) == 1):
+            ch0['critical']['expected_state']= True
+        else:
+            ch0['critical']['expected_state'] = 'IGN'
 
-    elif bricklet == BRICKLET_IDI4:
-        bricklet_io4_idi4_version = 1
-        bricklet_idi4 = BrickletIndustrialDigitalIn4(uid, ipcon)
+        if ((critical & 0x0C) >> 2) == 0:
+            ch1['critical']['expected_state'] = False
+        elif ((critical & 0x0C) >> 2) == 1:
+            ch1['critical']['expected_state'] = True
+        else:
+            ch1['critical']['expected_state'] = 'IGN'
 
-        if got_idi4_v2:
-            device_identifier = None
+        if ((critical & 0x30) >> 4) == 0:
+            ch2['critical']['expected_state'] = False
+        elif ((critical & 0x30) >> 4) == 1:
+            ch2['critical']['expected_state'] = True
+        else:
+            ch2['critical']['expected_state'] = 'IGN'
 
-            try:
-                device_identifier = bricklet_idi4.get_identity().device_identifier
-            except:
-                bricklet_idi4 = None
-                handle_result(MESSAGE_CRITICAL_ERROR_GETTING_DEVICE_IDENTITY,
-                              RETURN_CODE_CRITICAL)
+        if ((critical & 0xC0) >> 6) == 0:
+            ch3['critical']['expected_state'] = False
+        elif ((critical & 0xC0) >> 6) == 1:
+            ch3['critical']['expected_state'] = True
+        else:
+            ch3['critical']['expected_state'] = 'IGN'
 
-                return
+        # Current state
+        if bricklet_io4_idi4_version == 1:
+            reading = int(reading)
 
-            if device_identifier == BrickletIndustrialDigitalIn4V2.DEVICE_IDENTIFIER:
-                bricklet_io4_idi4_version = 2
-                bricklet_idi4 = BrickletIndustrialDigitalIn4V2(uid, ipcon)
+            if (reading & 0x01):
+                ch0['current_state'] = 1
 
-        try:
-            reading = bricklet_idi4.get_value()
+            if (reading & 0x02):
+                ch1['current_state'] = 1
 
-        except:
-            handle_result(MESSAGE_CRITICAL_ERROR_READING_VALUE,
-                          RETURN_CODE_CRITICAL)
+            if (reading & 0x04):
+                ch2['current_state'] = 1
 
-            return
+            if (reading & 0x08):
+                ch3['current_state'] = 1
+
+        elif bricklet_io4_idi4_version == 2:
+            ch0['current_state'] = int(reading[0])
+            ch1['current_state'] = int(reading[1])
+            ch2['current_state'] = int(reading[2])
+            ch3['current_state'] = int(reading[3])
 
-    if reading != None:
-        if bricklet != BRICKLET_IO4 and bricklet != BRICKLET_IDI4:
-            if reading >= critical:
-                handle_result(MESSAGE_CRITICAL_READING_TOO_HIGH % (reading, unit),
-                              RETURN_CODE_CRITICAL)
-            elif reading >= warning:
-                handle_result(MESSAGE_WARNING_READING_IS_HIGH % (reading, unit),
-                              RETURN_CODE_WARNING)
-            elif reading <= critical2:
-                handle_result(MESSAGE_CRITICAL_READING_TOO_LOW % (reading, unit),
-                              RETURN_CODE_CRITICAL)
-            elif reading <= warning2:
-                handle_result(MESSAGE_WARNING_READING_IS_LOW % (reading, unit),
-                              RETURN_CODE_WARNING)
-            elif reading > warning2 and reading < warning:
-                handle_result(MESSAGE_OK_READING % (reading, unit),
-                              RETURN_CODE_OK)
+        # Warning: For channels
+        if ch0['warning']['expected_state'] != 'IGN':
+            if ch0['current_state'] == ch0['warning']['expected_state']:
+                ch0['is_warning'] = True
             else:
-                handle_result(MESSAGE_UNKNOWN_READING, RETURN_CODE_UNKNOWN)
+                ch0['is_warning'] = False
         else:
-            warnings = []
-            criticals = []
-            warning = int(warning)
-            critical = int(critical)
-            io4_idi4_warning = False
-            io4_idi4_critical = False
-
-            ch0 =\
-                {
-                    'is_warning': False,
-                    'is_critical': False,
-                    'current_state': 0,
-                    'warning':
-                        {
-                            'expected_state': None,
-                        },
-                    'critical':
-                        {
-                            'expected_state': None,
-                        }
-                }
-            ch1 =\
-                {
-                    'is_warning': False,
-                    'is_critical': False,
-                    'current_state': 0,
-                    'warning':
-                        {
-                            'expected_state': None,
-                        },
-                    'critical':
-                        {
-                            'expected_state': None,
-                        }
-                }
-            ch2 =\
-                {
-                    'is_warning': False,
-                    'is_critical': False,
-                    'current_state': 0,
-                    'warning':
-                        {
-                            'expected_state': None,
-                        },
-                    'critical':
-                        {
-                            'expected_state': None,
-                        }
-                }
-            ch3 =\
-                {
-                    'is_warning': False,
-                    'is_critical': False,
-                    'current_state': 0,
-                    'warning':
-                        {
-                            'expected_state': None,
-                        },
-                    'critical':
-                        {
-                            'expected_state': None,
-                        }
-                }
-
-            # Warning
-            if (warning & 0x03) == 0:
-                ch0['warning']['expected_state'] = False
-            elif (warning & 0x03) == 1:
-                ch0['warning']['expected_state']  = True
-            else:
-                ch0['warning']['expected_state']  = 'IGN'
+            ch0['current_state']= 'IGN'
+            ch0['is_warning'] = None
+
+        if ch0['is_warning'] != None:
+            warnings.append(ch0['is_warning'])
 
-            if ((warning & 0x0C) >> 2) == 0:
-                ch1['warning']['expected_state']  = False
-            elif ((warning & 0x0C) >> 2) == 1:
-                ch1['warning']['expected_state']  = True
+        if ch1['warning']['expected_state'] != 'IGN':
+            if ch1['current_state'] == ch1['warning']['expected_state']:
+                ch1['is_warning'] = True
             else:
-                ch1['warning']['expected_state']  = 'IGN'
+                ch1['is_warning'] = False
+        else:
+            ch1['current_state']= 'IGN'
+            ch1['is_warning'] = None
+
+        if ch1['is_warning'] != None:
+            warnings.append(ch1['is_warning'])
 
-            if ((warning & 0x30) >> 4) == 0:
-                ch2['warning']['expected_state']  = False
-            elif ((warning & 0x30) >> 4) == 1:
-                ch2['warning']['expected_state']  = True
+        if ch2['warning']['expected_state'] != 'IGN':
+            if ch2['current_state'] == ch2['warning']['expected_state']:
+                ch2['is_warning'] = True
             else:
-                ch2['warning']['expected_state']  = 'IGN'
+                ch2['is_warning'] = False
+        else:
+            ch2['current_state']= 'IGN'
+            ch2['is_warning'] = None
 
-            if ((warning & 0xC0) >> 6) == 0:
-                ch3['warning']['expected_state']  = False
-            elif ((warning & 0xC0) >> 6) == 1:
-                ch3['warning']['expected_state']  = True
+        if ch2['is_warning'] != None:
+            warnings.append(ch2['is_warning'])
+
+        if ch3['warning']['expected_state'] != 'IGN':
+            if ch3['current_state'] == ch3['warning']['expected_state']:
+                ch3['is_warning'] = True
             else:
-                ch3['warning']['expected_state']  = 'IGN'
+                ch3['is_warning'] = False
+        else:
+            ch3['current_state']= 'IGN'
+            ch3['is_warning'] = None
+
+        if ch3['is_warning'] != None:
+            warnings.append(ch3['is_warning'])
 
-            # Critical
-            if (critical & 0x03) == 0:
-                ch0['critical']['expected_state'] = False
-            elif ((critical & 0x03) == 1):
-                ch0['critical']['expected_state']= True
+        # Critical: For channels
+        if ch0['critical']['expected_state'] != 'IGN':
+            if ch0['current_state'] == ch0['critical']['expected_state']:
+                ch0['is_critical'] = True
             else:
-                ch0['critical']['expected_state'] = 'IGN'
+                ch0['is_critical'] = False
+        else:
+            ch0['current_state']= 'IGN'
+            ch0['is_critical'] = None
+
+        if ch0['is_critical'] != None:
+            criticals.append(ch0['is_critical'])
 
-            if ((critical & 0x0C) >> 2) == 0:
-                ch1['critical']['expected_state'] = False
-            elif ((critical & 0x0C) >> 2) == 1:
-                ch1['critical']['expected_state'] = True
+        if ch1['critical']['expected_state'] != 'IGN':
+            if ch1['current_state'] == ch1['critical']['expected_state']:
+                ch1['is_critical'] = True
             else:
-                ch1['critical']['expected_state'] = 'IGN'
+                ch1['is_critical'] = False
+        else:
+            ch1['current_state']= 'IGN'
+            ch1['is_critical'] = None
 
-            if ((critical & 0x30) >> 4) == 0:
-                ch2['critical']['expected_state'] = False
-            elif ((critical & 0x30) >> 4) == 1:
-                ch2['critical']['expected_state'] = True
+        if ch1['is_critical'] != None:
+            criticals.append(ch1['is_critical'])
+
+        if ch2['critical']['expected_state'] != 'IGN':
+            if ch2['current_state'] == ch2['critical']['expected_state']:
+                ch2['is_critical'] = True
             else:
-                ch2['critical']['expected_state'] = 'IGN'
+                ch2['is_critical'] = False
+        else:
+            ch2['current_state']= 'IGN'
+            ch2['is_critical'] = None
+
+        if ch2['is_critical'] != None:
+            criticals.append(ch2['is_critical'])
 
-            if ((critical & 0xC0) >> 6) == 0:
-                ch3['critical']['expected_state'] = False
-            elif ((critical & 0xC0) >> 6) == 1:
-                ch3['critical']['expected_state'] = True
+        if ch3['critical']['expected_state'] != 'IGN':
+            if ch3['current_state'] == ch3['critical']['expected_state']:
+                ch3['is_critical'] = True
             else:
-                ch3['critical']['expected_state'] = 'IGN'
+                ch3['is_critical'] = False
+        else:
+            ch3['current_state']= 'IGN'
+            ch3['is_critical'] = None
+
+        if ch3['is_critical'] != None:
+            criticals.append(ch3['is_critical'])
+
+        if warnings and all(warnings):
+            io4_idi4_warning = True
+
+        if criticals and all(criticals):
+            io4_idi4_critical = True
+
+        if io4_idi4_warning and io4_idi4_critical:
+            return (MESSAGE_CRITICAL_IO4_IDI4 % (ch0['current_state'],
+                                              ch1['current_state'],
+                                              ch2['current_state'],
+                                              ch3['current_state']),
+                  RETURN_CODE_CRITICAL)
+        elif io4_idi4_warning:
+            return (MESSAGE_WARNING_IO4_IDI4 % (ch0['current_state'],
+                                              ch1['current_state'],
+                                              ch2['current_state'],
+                                              ch3['current_state']),
+                  RETURN_CODE_WARNING)
+        elif io4_idi4_critical:
+            return (MESSAGE_CRITICAL_IO4_IDI4 % (ch0['current_state'],
+                                              ch1['current_state'],
+                                              ch2['current_state'],
+                                              ch3['current_state']),
+                  RETURN_CODE_CRITICAL)
+        else:
+            return (MESSAGE_OK_IO4_IDI4 % (ch0['current_state'],
+                                          ch1['current_state'],
+                                          ch2['current_state'],
+                                          ch3['current_state']),
+                  RETURN_CODE_OK)
+
+    return (MESSAGE_UNKNOWN_READING, RETURN_CODE_UNKNOWN)
 
-            # Current state
-            if bricklet_io4_idi4_version == 1:
-                reading = int(reading)
+def connect(host, port, secret):
+    ipcon = IPConnection()
 
-                if (reading & 0x01):
-                    ch0['current_state'] = 1
+    try:
+        ipcon.connect(host, port)
+    except:
+        raise CheckError(MESSAGE_CRITICAL_ERROR_CONNECTING)
 
-                if (reading & 0x02):
-                    ch1['current_state'] = 1
+    if secret:
+        try:
+            ipcon.authenticate(secret)
+        except:
+            try:
+                ipcon.disconnect()
+            except:
+                pass
+
+            raise CheckError(MESSAGE_CRITICAL_AUTHENTICATION_FAILED)
+
+    return ipcon
+
+# The global lock only protects the dicts. Connecting and setting up a sensor
+# can block for several seconds, this is done while holding a lock for the
+# connection or sensor key only, so an unreachable host or a missing Bricklet
+# does not stall the checks of all other sensors.
+class CheckDaemon(object):
+    def __init__(self, checks):
+        self.checks      = checks # set of allowed sensor keys
+        self.lock        = threading.Lock()
+        self.key_locks   = {} # by connection or sensor key
+        self.connections = {} # by (host, port, secret)
+        self.sensors     = {} # by (host, port, secret, bricklet, uid)
+        self.last_used   = {} # by sensor key
+
+    def get_key_lock(self, key):
+        with self.lock:
+            lock = self.key_locks.get(key)
+
+            if lock == None:
+                lock = threading.Lock()
+                self.key_locks[key] = lock
+
+            return lock
+
+    def drop_sensors(self, key, uid=None):
+        with self.lock:
+            for sensor_key in list(self.sensors.keys()):
+                if sensor_key[:3] == key and (uid == None or sensor_key[4] == uid):
+                    del self.sensors[sensor_key]
+
+    def get_connection(self, key):
+        with self.get_key_lock(key):
+            with self.lock:
+                ipcon = self.connections.get(key)
+
+            if ipcon == None:
+                ipcon = self.create_connection(key)
+
+                with self.lock:
+                    self.connections[key] = ipcon
+
+            return ipcon
+
+    def create_connection(self, key):
+        host, port, secret = key
+        ipcon = connect(host, port, secret)
+
+        # the Brick Daemon or the Bricklets might have been restarted, set
+        # the sensors up again. a disconnected sensor cannot be read
+        def cb_connected(connect_reason):
+            if connect_reason == IPConnection.CONNECT_REASON_AUTO_RECONNECT:
+                if secret:
+                    try:
+                        ipcon.authenticate(secret)
+                    except:
+                        pass
+
+                self.drop_sensors(key)
+
+        def cb_disconnected(disconnect_reason):
+            self.drop_sensors(key)
+
+        def cb_enumerate(uid, connected_uid, position, hardware_version, firmware_version,
+                         device_identifier, enumeration_type):
+            if enumeration_type != IPConnection.ENUMERATION_TYPE_AVAILABLE:
+                self.drop_sensors(key, uid)
+
+        ipcon.register_callback(IPConnection.CALLBACK_CONNECTED, cb_connected)
+        ipcon.register_callback(IPConnection.CALLBACK_DISCONNECTED, cb_disconnected)
+        ipcon.register_callback(IPConnection.CALLBACK_ENUMERATE, cb_enumerate)
+
+        return ipcon
+
+    # drops the sensors that were not checked for CACHE_MAX_IDLE seconds and
+    # disconnects the connections that have no sensors left
+    def prune(self):
+        now = time.time()
+        unused_connections = []
+
+        with self.lock:
+            for sensor_key, last_used in list(self.last_used.items()):
+                if now - last_used > CACHE_MAX_IDLE:
+                    del self.last_used[sensor_key]
+                    self.sensors.pop(sensor_key, None)
+
+            used_keys = set(sensor_key[:3] for sensor_key in self.last_used)
+
+            for key in list(self.connections.keys()):
+                if key not in used_keys:
+                    unused_connections.append(self.connections.pop(key))
+
+        for ipcon in unused_connections:
+            try:
+                ipcon.disconnect()
+            except:
+                pass
 
-                if (reading & 0x04):
-                    ch2['current_state'] = 1
+    # returns None if the check is not configured
+    def check(self, request):
+        key = (request['host'], request['port'], request['secret'] or None)
+        sensor_key = key + (request['bricklet'], request['uid'])
 
-                if (reading & 0x08):
-                    ch3['current_state'] = 1
+        if sensor_key not in self.checks:
+            return None
 
-            elif bricklet_io4_idi4_version == 2:
-                ch0['current_state'] = int(reading[0])
-                ch1['current_state'] = int(reading[1])
-                ch2['current_state'] = int(reading[2])
-                ch3['current_state'] = int(reading[3])
+        self.prune()
 
-            # Warning: For channels
-            if ch0['warning']['expected_state'] != 'IGN':
-                if ch0['current_state'] == ch0['warning']['expected_state']:
-                    ch0['is_warning'] = True
-                else:
-                    ch0['is_warning'] = False
-            else:
-                ch0['current_state']= 'IGN'
-                ch0['is_warning'] = None
+        with self.lock:
+            self.last_used[sensor_key] = time.time()
 
-            if ch0['is_warning'] != None:
-                warnings.append(ch0['is_warning'])
+        try:
+            with self.get_key_lock(sensor_key):
+                with self.lock:
+                    sensor = self.sensors.get(sensor_key)
 
-            if ch1['warning']['expected_state'] != 'IGN':
-                if ch1['current_state'] == ch1['warning']['expected_state']:
-                    ch1['is_warning'] = True
-                else:
-                    ch1['is_warning'] = False
-            else:
-                ch1['current_state']= 'IGN'
-                ch1['is_warning'] = None
+                if sensor == None:
+                    sensor = Sensor(self.get_connection(key), request['bricklet'], request['uid'], True)
 
-            if ch1['is_warning'] != None:
-                warnings.append(ch1['is_warning'])
+                    with self.lock:
+                        self.sensors[sensor_key] = sensor
 
-            if ch2['warning']['expected_state'] != 'IGN':
-                if ch2['current_state'] == ch2['warning']['expected_state']:
-                    ch2['is_warning'] = True
-                else:
-                    ch2['is_warning'] = False
-            else:
-                ch2['current_state']= 'IGN'
-                ch2['is_warning'] = None
+            reading = sensor.read(request['max_age'])
+        except CheckError as e:
+            return (e.message, RETURN_CODE_CRITICAL)
 
-            if ch2['is_warning'] != None:
-                warnings.append(ch2['is_warning'])
+        return evaluate(request['bricklet'], reading, sensor.unit, sensor.version,
+                        request['warning'], request['critical'], request['warning2'], request['critical2'])
 
-            if ch3['warning']['expected_state'] != 'IGN':
-                if ch3['current_state'] == ch3['warning']['expected_state']:
-                    ch3['is_warning'] = True
-                else:
-                    ch3['is_warning'] = False
-            else:
-                ch3['current_state']= 'IGN'
-                ch3['is_warning'] = None
+class CheckRequestHandler(SocketServer.StreamRequestHandler):
+    def handle(self):
+        try:
+            result = self.server.check_daemon.check(json.loads(self.rfile.readline()))
+        except:
+            result = (MESSAGE_UNKNOWN_READING, RETURN_CODE_UNKNOWN)
 
-            if ch3['is_warning'] != None:
-                warnings.append(ch3['is_warning'])
+        self.wfile.write(json.dumps(result) + '\\n')
 
-            # Critical: For channels
-            if ch0['critical']['expected_state'] != 'IGN':
-                if ch0['current_state'] == ch0['critical']['expected_state']:
-                    ch0['is_critical'] = True
-                else:
-                    ch0['is_critical'] = False
-            else:
-                ch0['current_state']= 'IGN'
-                ch0['is_critical'] = None
+class CheckServer(SocketServer.ThreadingMixIn, SocketServer.UnixStreamServer):
+    daemon_threads = True
 
-            if ch0['is_critical'] != None:
-                criticals.append(ch0['is_critical'])
+def load_checks():
+    with open(CONFIG_PATH, 'r') as f:
+        config = json.load(f)
 
-            if ch1['critical']['expected_state'] != 'IGN':
-                if ch1['current_state'] == ch1['critical']['expected_state']:
-                    ch1['is_critical'] = True
-                else:
-                    ch1['is_critical'] = False
-            else:
-                ch1['current_state']= 'IGN'
-                ch1['is_critical'] = None
+    return set((check['host'], check['port'], check['secret'] or None, check['bricklet'], check['uid'])
+               for check in config['checks'])
 
-            if ch1['is_critical'] != None:
-                criticals.append(ch1['is_critical'])
+def run_daemon():
+    checks = load_checks()
 
-            if ch2['critical']['expected_state'] != 'IGN':
-                if ch2['current_state'] == ch2['critical']['expected_state']:
-                    ch2['is_critical'] = True
-                else:
-                    ch2['is_critical'] = False
-            else:
-                ch2['current_state']= 'IGN'
-                ch2['is_critical'] = None
+    if os.path.exists(SOCKET_PATH):
+        os.remove(SOCKET_PATH)
 
-            if ch2['is_critical'] != None:
-                criticals.append(ch2['is_critical'])
+    # the checks are executed as the nagios user, the socket is created as
+    # the nagios user and group and only accessible to them
+    os.umask(0o117)
 
-            if ch3['critical']['expected_state'] != 'IGN':
-                if ch3['current_state'] == ch3['critical']['expected_state']:
-                    ch3['is_critical'] = True
-                else:
-                    ch3['is_critical'] = False
-            else:
-                ch3['current_state']= 'IGN'
-                ch3['is_critical'] = None
-
-            if ch3['is_critical'] != None:
-                criticals.append(ch3['is_critical'])
-
-            if warnings and all(warnings):
-                io4_idi4_warning = True
-
-            if criticals and all(criticals):
-                io4_idi4_critical = True
-
-            if io4_idi4_warning and io4_idi4_critical:
-                handle_result(MESSAGE_CRITICAL_IO4_IDI4 % (ch0['current_state'],
-                                                        ch1['current_state'],
-                                                        ch2['current_state'],
-                                                        ch3['current_state']),
-                            RETURN_CODE_CRITICAL)
-            elif io4_idi4_warning:
-                handle_result(MESSAGE_WARNING_IO4_IDI4 % (ch0['current_state'],
-                                                        ch1['current_state'],
-                                                        ch2['current_state'],
-                                                        ch3['current_state']),
-                            RETURN_CODE_WARNING)
-            elif io4_idi4_critical:
-                handle_result(MESSAGE_CRITICAL_IO4_IDI4 % (ch0['current_state'],
-                                                        ch1['current_state'],
-                                                        ch2['current_state'],
-                                                        ch3['current_state']),
-                            RETURN_CODE_CRITICAL)
-            else:
-                handle_result(MESSAGE_OK_IO4_IDI4 % (ch0['current_state'],
-                                                    ch1['current_state'],
-                                                    ch2['current_state'],
-                                                    ch3['current_state']),
-                            RETURN_CODE_OK)
+    server = CheckServer(SOCKET_PATH, CheckRequestHandler)
+    server.check_daemon = CheckDaemon(checks)
+
+    os.chmod(SOCKET_PATH, 0o660)
+
+    server.serve_forever()
+
+def check_with_daemon(request):
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(CLIENT_TIMEOUT)
+
+    try:
+        client.connect(SOCKET_PATH)
+        client.sendall(json.dumps(request) + '\\n')
+
+        response = ''
+
+        while not response.endswith('\\n'):
+            chunk = client.recv(4096)
+
+            if len(chunk) == 0:
+                break
+
+            response += chunk
+    finally:
+        client.close()
+
+    result = json.loads(response)
+
+    if result == None:
+        raise Exception('Check is not served by the daemon')
+
+    message, code = result
+
+    return message, code
+
+def check_directly(request):
+    try:
+        ipcon = connect(request['host'], request['port'], request['secret'])
+    except CheckError as e:
+        return (e.message, RETURN_CODE_CRITICAL)
+
+    try:
+        sensor = Sensor(ipcon, request['bricklet'], request['uid'], False)
+        reading = sensor.read(0)
+    except CheckError as e:
+        return (e.message, RETURN_CODE_CRITICAL)
+    finally:
+        try:
+            ipcon.disconnect()
+        except:
+            pass
+
+    return evaluate(request['bricklet'], reading, sensor.unit, sensor.version,
+                    request['warning'], request['critical'], request['warning2'], request['critical2'])
 
 if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--daemon':
+        run_daemon()
+        exit(0)
+
     parse = argparse.ArgumentParser()
 
     parse.add_argument('-H',
@@ -818,42 +1061,78 @@ if __name__ == '__main__':
 
     parse.add_argument('-w',
                        '--warning',
-                       help = 'Warning temperature level \
-                               (temperatures above this level will trigger a warning \
-                               message)',
+                       help = 'Warning temperature level                                (temperatures above this level will trigger a warning                                message)',
                        type = float,
                        required = True)
 
     parse.add_argument('-c',
                        '--critical',
-                       help = 'Critical temperature level \
-                               (temperatures above this level will trigger a critical \
-                               message)',
+                       help = 'Critical temperature level                                (temperatures above this level will trigger a critical                                message)',
                        type = float,
                        required = True)
 
     parse.add_argument('-w2',
                        '--warning2',
-                       help = 'Warning temperature level (temperatures \
-                               below this level will trigger a warning message)',
+                       help = 'Warning temperature level (temperatures                                below this level will trigger a warning message)',
                        type = float,
                        required = True)
 
     parse.add_argument('-c2',
                        '--critical2',
-                       help = 'Critical temperature level (temperatures below \
-                               this level will trigger a critical message)',
+                       help = 'Critical temperature level (temperatures below                                this level will trigger a critical message)',
                        type = float,
                        required = True)
 
-    args  = parse.parse_args()
-    ipcon = IPConnection()
+    parse.add_argument('-a',
+                       '--max-age',
+                       help = 'Maximum age of a cached reading in seconds (default = %s)' % DEFAULT_MAX_AGE,
+                       type = float,
+                       default = DEFAULT_MAX_AGE,
+                       required = False)
+
+    args    = parse.parse_args()
+    request = {'host': args.host,
+               'port': args.port,
+               'secret': args.secret,
+               'bricklet': args.bricklet,
+               'uid': args.uid,
+               'warning': args.warning,
+               'critical': args.critical,
+               'warning2': args.warning2,
+               'critical2': args.critical2,
+               'max_age': args.max_age}
+
+    try:
+        message, code = check_with_daemon(request)
+    except:
+        message, code = check_directly(request)
+
+    if isinstance(message, unicode):
+        message = message.encode('utf-8')
 
-    if args and ipcon:
-        connect()
-        time.sleep(3)
-        print return_message
-        exit(return_code)
+    print message
+    exit(code)
+'''
+
+# keeps the Brick Daemon connections and Bricklet readings of the checks alive.
+# the check script falls back to connecting by itself if the daemon is not
+# running, so failing to start the daemon is not fatal. the daemon runs
+# unprivileged as the user and group that execute the checks
+UNIT_CHECK_DAEMON = '''[Unit]
+Description=Tinkerforge Server Monitoring Check Daemon
+After=brickd.service
+
+[Service]
+User={0}
+Group={0}
+RuntimeDirectory=check-tinkerforge
+RuntimeDirectoryMode=0750
+ExecStart=/usr/local/bin/check_tinkerforge.py --daemon
+Restart=always
+RestartSec=5
+
+[Install]
+WantedBy=multi-user.target
 '''
 
 TEMPLATE_COMMAND_LINE_NOTIFY_HOST = '''/usr/bin/printf "%b" "***** Nagios *****\\n\\n \
@@ -925,6 +1204,14 @@ dict_enumerate = {'host'         : None,
 
 _find_unsafe = re.compile(r'[^\w@%+=:,./-]').search
 
+def parse_check_command_line(command_line):
+    parse = argparse.ArgumentParser()
+
+    for option in ['-H', '-P', '-S', '-b', '-u', '-m', '-w', '-c', '-w2', '-c2']:
+        parse.add_argument(option)
+
+    return parse.parse_args(shlex.split(command_line.split('/usr/local/bin/check_tinkerforge.py ')[1]))
+
 def quote(s):
     """Return a shell-escaped version of the string *s*."""
     if not s:
@@ -1159,6 +1446,40 @@ elif ACTION == 'APPLY':
                  stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH | \
                  stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
 
+        # the check daemon only serves the checks of the rules, the config
+        # contains the secrets and is only readable by the daemon's group
+        try:
+            check_daemon_gid = grp.getgrnam(CHECK_DAEMON_USER).gr_gid
+        except KeyError:
+            check_daemon_gid = None
+
+        if check_daemon_gid != None:
+            check_daemon_checks = []
+
+            for rule in apply_dict['rules']:
+                map_args = parse_check_command_line(rule['command_line'])
+
+                check_daemon_checks.append({'host'    : map_args.H,
+                                            'port'    : int(map_args.P),
+                                            'secret'  : map_args.S,
+                                            'bricklet': map_args.b,
+                                            'uid'     : map_args.u})
+
+            fd_cdc = os.open(FILE_PATH_CHECK_DAEMON_CONFIG, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o640)
+
+            with os.fdopen(fd_cdc, 'w') as fh_cdc:
+                json.dump({'checks': check_daemon_checks}, fh_cdc)
+
+            os.chown(FILE_PATH_CHECK_DAEMON_CONFIG, 0, check_daemon_gid)
+            os.chmod(FILE_PATH_CHECK_DAEMON_CONFIG, 0o640)
+
+            with open(FILE_PATH_CHECK_DAEMON_UNIT, 'w') as fh_cdu:
+                fh_cdu.write(UNIT_CHECK_DAEMON.format(CHECK_DAEMON_USER))
+
+            os.system('/bin/systemctl daemon-reload')
+            os.system('/bin/systemctl enable check-tinkerforge')
+            os.system('/bin/systemctl restart check-tinkerforge')
+
         if os.path.isfile(FILE_PATH_TF_NAGIOS_CONFIGURATION):
             os.remove(FILE_PATH_TF_NAGIOS_CONFIGURATION)
 
@@ -1241,6 +1562,15 @@ elif ACTION == 'APPLY':
 
 elif ACTION == 'APPLY_EMPTY':
     try:
+        if os.path.isfile(FILE_PATH_CHECK_DAEMON_UNIT):
+            os.system('/bin/systemctl stop check-tinkerforge')
+            os.system('/bin/systemctl disable check-tinkerforge')
+            os.remove(FILE_PATH_CHECK_DAEMON_UNIT)
+            os.system('/bin/systemctl daemon-reload')
+
+        if os.path.isfile(FILE_PATH_CHECK_DAEMON_CONFIG):
+            os.remove(FILE_PATH_CHECK_DAEMON_CONFIG)
+
         if os.path.isfile(FILE_PATH_CHECK_SCRIPT):
             os.remove(FILE_PATH_CHECK_SCRIPT)
 
@@ -0,0 +1,83 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+
+# zlib_transfer.py compress <source>
+#   compresses <source> into a temporary file and prints a JSON object with
+#   the temporary file path and its size. the path is null if compression
+#   doesn't reduce the size enough to be worth it
+#
+# zlib_transfer.py decompress <source> <target>
+#   decompresses <source> into the already existing <target> file, keeping
+#   its owner and permissions, and removes <source> afterwards
+
+import json
+import os
+import sys
+import tempfile
+import zlib
+
+CHUNK_SIZE = 1024 * 1024
+MIN_RATIO  = 0.9
+
+if len(sys.argv) < 3 or sys.argv[1] not in ['compress', 'decompress'] or \
+   (sys.argv[1] == 'decompress' and len(sys.argv) < 4):
+    sys.stderr.write(u'Missing or invalid parameters'.encode('utf-8'))
+    exit(2)
+
+command = sys.argv[1]
+source  = sys.argv[2]
+
+try:
+    if command == 'compress':
+        fd, path   = tempfile.mkstemp(prefix='brickv-download-', suffix='.z')
+        compressor = zlib.compressobj(6)
+        length     = 0
+
+        compressed = False
+
+        # the temporary file is only kept if compression is worth it, it is
+        # removed otherwise and if anything fails
+        try:
+            with os.fdopen(fd, 'wb') as t:
+                with open(source, 'rb') as s:
+                    while True:
+                        chunk = s.read(CHUNK_SIZE)
+
+                        if len(chunk) == 0:
+                            break
+
+                        length += len(chunk)
+                        t.write(compressor.compress(chunk))
+
+                t.write(compressor.flush())
+                size = t.tell()
+
+            compressed = size < length * MIN_RATIO
+        finally:
+            if not compressed:
+                os.remove(path)
+
+        print(json.dumps({'path': path if compressed else None, 'size': size, 'length': length}))
+    else:
+        decompressor = zlib.decompressobj()
+
+        # the uploaded temporary file is removed whether decompression succeeds or not
+        try:
+            with open(sys.argv[3], 'wb') as t:
+                with open(source, 'rb') as s:
+                    while True:
+                        chunk = s.read(CHUNK_SIZE)
+
+                        if len(chunk) == 0:
+                            break
+
+                        t.write(decompressor.decompress(chunk))
+
+                t.write(decompressor.flush())
+        finally:
+            os.remove(source)
+except Exception as e:
+    sys.stderr.write(unicode(e).encode('utf-8'))
+    exit(3)
+
+exit(0)
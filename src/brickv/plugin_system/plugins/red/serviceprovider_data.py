@@ -5,10385 +5,14 @@
 # that is released as public domain:
 #
 # https://git.gnome.org/browse/mobile-broadband-provider-info/plain/serviceproviders.xml
-
-dict_provider = \
-{'@format': '2.0',
- 'country': [{'@code': 'ad',
-              'provider': {'gsm': {'apn': [{'@value': 'internetand',
-                                            'name': 'Mobiland',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'internetclic',
-                                            'name': 'Mobiland Click!',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}}],
-                                   'network-id': {'@mcc': '213', '@mnc': '03'}},
-                           'name': 'Andorra Telecom (Mobiland)'}},
-             {'@code': 'ae',
-              'provider': [{'gsm': {'apn': [{'@value': 'mnet',
-                                             'dns': ['194.170.1.6',
-                                                     '194.170.1.7'],
-                                             'name': 'Etisalat',
-                                             'password': 'mnet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mnet'},
-                                            {'@value': 'etisalat.ae',
-                                             'name': 'Etisalat 3G',
-                                             'password': 'etisalat.ae',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'etisalat.ae'},
-                                            {'@value': 'etisalat',
-                                             'mmsc': 'http://10.99.52.150/servlets/mms',
-                                             'mmsproxy': '10.12.0.30:8080',
-                                             'name': 'etisalat MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'etisalat',
-                                             'mmsc': 'http://mms/servlets/mms',
-                                             'mmsproxy': '10.12.0.32:8080',
-                                             'name': 'etisalat MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '424',
-                                                   '@mnc': '02'}},
-                            'name': 'Etisalat'},
-                           {'gsm': {'apn': [{'@value': 'du',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'du',
-                                             'mmsc': 'http://mms.du.ae',
-                                             'mmsproxy': '10.19.18.4:8080',
-                                             'name': 'du MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'msisdn-query': {'ussd': '*#100#'},
-                                    'network-id': {'@mcc': '424',
-                                                   '@mnc': '03'}},
-                            'name': 'du'}]},
-             {'@code': 'af',
-              'provider': {'gsm': {'apn': {'@value': 'internet',
-                                           'password': '1111',
-                                           'plan': {'@type': 'postpaid'},
-                                           'usage': {'@type': 'internet'},
-                                           'username': 'awcc'},
-                                   'network-id': {'@mcc': '412', '@mnc': '01'}},
-                           'name': 'AWCC'}},
-             {'@code': 'al',
-              'provider': {'gsm': {'apn': [{'@value': 'Twa',
-                                            'name': 'TWA',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'vodafoneweb',
-                                            'name': 'Vodafone Web',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'mms',
-                                            'mmsc': 'http://217.31.233.18:6001/MM1Servlet',
-                                            'mmsproxy': '217.31.233.18:9401',
-                                            'name': 'Vodafone MMS',
-                                            'password': 'vodafone',
-                                            'usage': {'@type': 'mms'},
-                                            'username': 'vodafone'},
-                                           {'@value': 'portalnmms',
-                                            'mmsc': 'http://mms1.live.vodafone.in/mms/',
-                                            'mmsproxy': '10.10.1.100:9401',
-                                            'name': 'Vodafone MMS',
-                                            'usage': {'@type': 'mms'}}],
-                                   'network-id': {'@mcc': '276', '@mnc': '02'}},
-                           'name': 'Vodafone'}},
-             {'@code': 'am',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet.beeline.am',
-                                             'password': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internet'},
-                                            {'@value': 'mms.beeline.ua',
-                                             'mmsc': 'http://mms/',
-                                             'mmsproxy': '10.11.8.18:8080',
-                                             'name': 'Beeline MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms',
-                                             'mmsproxy': '10.16.70.199:8080',
-                                             'name': 'Beeline MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '283',
-                                                   '@mnc': '01'}},
-                            'name': 'Beeline'},
-                           {'gsm': {'apn': [{'@value': 'internet.orange',
-                                             'name': 'Internet Hima (USB)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'name': 'Mobile Broadband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.orange.nl:8002',
-                                             'mmsproxy': '10.250.255.183:5080',
-                                             'name': 'Orange MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'orangemms',
-                                             'mmsc': 'http://mms.orange.es',
-                                             'mmsproxy': 'wapmms.orange.es:8080',
-                                             'name': 'Orange MMS',
-                                             'password': 'orange',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'orange'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://192.168.151.3:8002',
-                                             'mmsproxy': '192.168.151.2:8080',
-                                             'name': 'Orange MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'orange.mms',
-                                             'mmsc': 'http://mmsc.orange.at/mms/wapenc',
-                                             'mmsproxy': '194.24.128.118:8080',
-                                             'name': 'Orange MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'},
-                                            {'@value': 'orangemms',
-                                             'mmsc': 'http://mms.orange.co.uk/',
-                                             'mmsproxy': '192.168.224.10:8080',
-                                             'name': 'Orange MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'mms.orange.dk',
-                                             'mmsc': 'http://mms.orange.dk:8002',
-                                             'mmsproxy': '172.18.251.11:8080',
-                                             'name': 'Orange MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'mms.orange.md',
-                                             'mmsc': 'http://mms/mms',
-                                             'mmsproxy': '192.168.127.125:3128',
-                                             'name': 'Orange MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'mms.orange.jo',
-                                             'mmsc': 'http://172.16.1.96/servlets/mms',
-                                             'mmsproxy': '172.16.1.2:8080',
-                                             'name': 'Orange MMS',
-                                             'password': 'mmc',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mmc'},
-                                            {'@value': 'orangerun.acte',
-                                             'mmsc': 'http://mms.orange.re',
-                                             'mmsproxy': '192.168.10.200:8080',
-                                             'name': 'Orange MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '283',
-                                                   '@mnc': '10'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': [{'@value': 'connect.vivacell.am',
-                                             'name': 'MTS connect',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'inet.vivacell.am',
-                                             'name': 'Mobile Broadband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '283',
-                                                   '@mnc': '05'}},
-                            'name': 'VivaCell/MTS'},
-                           {'gsm': {'apn': {'@value': 'connect.kt.am',
-                                            'name': 'KT_MARK',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*122#'},
-                                    'balance-top-up': {'ussd': {'#text': '*123*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '283',
-                                                   '@mnc': '04'}},
-                            'name': 'Karabakh Telecom'}]},
-             {'@code': 'ao',
-              'provider': [{'cdma': {'username': 'uname'}, 'name': 'Movinet'},
-                           {'gsm': {'apn': [{'@value': 'internet.unitel.co.ao',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'unitel',
-                                             'mmsc': 'http//mms.unitel.com',
-                                             'name': 'unitel mms',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '631',
-                                                   '@mnc': '02'}},
-                            'name': 'Unitel'}]},
-             {'@code': 'ar',
-              'provider': [{'gsm': {'apn': [{'@value': 'gprs.personal.com',
-                                             'dns': ['172.25.7.6',
-                                                     '172.25.7.7'],
-                                             'name': 'GPRS',
-                                             'password': 'adgj',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'gprs'},
-                                            {'@value': 'datos.personal.com',
-                                             'name': 'DATOS',
-                                             'password': 'datos',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'datos'}],
-                                    'network-id': [{'@mcc': '722',
-                                                    '@mnc': '341'},
-                                                   {'@mcc': '722',
-                                                    '@mnc': '34'}]},
-                            'name': 'Personal'},
-                           {'gsm': {'apn': [{'@value': 'arnet.personal.com',
-                                             'dns': ['172.25.7.6',
-                                                     '172.25.7.7'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.personal.com/',
-                                             'mmsproxy': '172.25.7.31:8080',
-                                             'name': 'Personal MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms',
-                                             'mmsproxy': '172.16.192.7:8080',
-                                             'name': 'MMS Personal',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '722',
-                                                   '@mnc': '340'}},
-                            'name': 'Arnet'},
-                           {'gsm': {'apn': [{'@value': 'gprs.claro.com.ar',
-                                             'dns': ['170.51.255.100',
-                                                     '170.51.242.18'],
-                                             'name': '3G Internet',
-                                             'password': 'clarogprs999',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'clarogprs'},
-                                            {'@value': 'internet.ctimovil.com.ar',
-                                             'name': 'GPRS',
-                                             'password': 'clarogprs999',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'clarogprs'},
-                                            {'@value': 'mms.claro.com.br',
-                                             'mmsc': 'http://mms.claro.com.br/',
-                                             'mmsproxy': '200.169.126.10:8799',
-                                             'name': 'Claro Foto',
-                                             'password': 'claro',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'claro'}],
-                                    'network-id': [{'@mcc': '722',
-                                                    '@mnc': '310'},
-                                                   {'@mcc': '722',
-                                                    '@mnc': '320'},
-                                                   {'@mcc': '722',
-                                                    '@mnc': '330'}]},
-                            'name': 'Claro'},
-                           {'gsm': {'apn': [{'@value': 'internet.gprs.unifon.com.ar',
-                                             'name': 'WAP',
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'wap'},
-                                            {'@value': 'internet.gprs.unifon.com.ar',
-                                             'name': 'Internet',
-                                             'password': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'Internet'}],
-                                    'network-id': [{'@mcc': '722',
-                                                    '@mnc': '010'},
-                                                   {'@mcc': '722',
-                                                    '@mnc': '070'}]},
-                            'name': 'Movistar'}]},
-             {'@code': 'at',
-              'provider': [{'gsm': {'apn': [{'@value': 'a1.net',
-                                             'dns': ['194.48.124.202',
-                                                     '194.48.124.200'],
-                                             'name': 'A1 Breitband',
-                                             'password': 'ppp',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'ppp@a1plus.at'},
-                                            {'@value': 'aon.data',
-                                             'name': 'aon (Flex, '
-                                                     'Breitband-Duo, '
-                                                     'BusinessFlex)',
-                                             'password': 'ppp',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mobile@aon.at'},
-                                            {'@value': 'aon.at',
-                                             'name': 'aonMobile',
-                                             'password': 'ppp',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mobile@aon.at'},
-                                            {'@value': 'free.A1.net',
-                                             'mmsc': 'http://mmsc.A1.net',
-                                             'mmsproxy': 'gateway.A1.net:8001',
-                                             'name': 'A1MMS',
-                                             'password': 'ppp',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'ppp@A1plus.at'}],
-                                    'network-id': {'@mcc': '232',
-                                                   '@mnc': '01'}},
-                            'name': 'A1/Telekom Austria'},
-                           {'gsm': {'apn': {'@value': 'mdata.com',
-                                            'name': 'International Roaming',
-                                            'password': 'ppp',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'mdata@mdata.com'},
-                                    'network-id': {'@mcc': '232',
-                                                   '@mnc': '01'}},
-                            'name': 'ABroadband'},
-                           {'gsm': {'apn': [{'@value': 'bob.at',
-                                             'password': 'ppp',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'data@bob.at'},
-                                            {'@value': 'bob.at',
-                                             'dns': ['194.48.139.254',
-                                                     '194.48.124.200'],
-                                             'password': 'ppp',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'ppp@bob.at'},
-                                            {'@value': 'mms.bob.at',
-                                             'password': 'ppp',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'data@bob.at'},
-                                            {'@value': 'mms.bob.at',
-                                             'mmsc': 'http://mmsc.bob.at',
-                                             'mmsproxy': '194.48.124.7:8001',
-                                             'name': 'data bob MMS',
-                                             'password': 'ppp',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'data@bob.at'}],
-                                    'network-id': {'@mcc': '232',
-                                                   '@mnc': '11'}},
-                            'name': 'Bob'},
-                           {'gsm': {'apn': [{'@value': 'webaut',
-                                             'password': None,
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': None},
-                                            {'@value': 'mmsaut',
-                                             'mmsc': 'http://mmsaut.at/send',
-                                             'mmsproxy': '212.95.31.50:80',
-                                             'name': 'HoT MMS',
-                                             'password': None,
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'mms'},
-                                             'username': None}],
-                                    'balance-check': {'ussd': '*101#'},
-                                    'balance-top-up': {'ussd': {'#text': '*103*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '232',
-                                                   '@mnc': '07'}},
-                            'name': 'HoT'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.at',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmat'},
-                                    'balance-check': {'ussd': '*231#'},
-                                    'balance-top-up': {'ussd': {'#text': '*231*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '232',
-                                                   '@mnc': '08'}},
-                            'name': 'Lycamobile'},
-                           {'gsm': {'apn': [{'@value': 'gprswap',
-                                             'name': 'WAP',
-                                             'password': 'tm',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'},
-                                             'username': 't-mobile'},
-                                            {'@value': 'gprsinternet',
-                                             'dns': ['213.162.69.169',
-                                                     '213.162.65.1'],
-                                             'name': 'Internet',
-                                             'password': 'tm',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 't-mobile'},
-                                            {'@value': 'business.gprsinternet',
-                                             'name': 'Business Internet',
-                                             'password': 'tm',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 't-mobile'},
-                                            {'@value': 'general.t-mobile.uk',
-                                             'mmsc': 'http://mmsc.t-mobile.co.uk:8002',
-                                             'mmsproxy': '149.254.201.135:8080',
-                                             'name': 'T-Mobile MMS',
-                                             'password': 'wap',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'user'},
-                                            {'@value': 'wap.voicestream.com',
-                                             'mmsc': 'http://216.155.174.84/servlets/mms',
-                                             'mmsproxy': '216.155.165.50:8080',
-                                             'name': 'MMS',
-                                             'password': '6600',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'nokia'}],
-                                    'network-id': {'@mcc': '232',
-                                                   '@mnc': '03'}},
-                            'name': 'T-Mobile'},
-                           {'gsm': {'apn': [{'@value': 'web',
-                                             'dns': ['213.162.69.170',
-                                                     '213.162.65.2'],
-                                             'name': 'Ge org:)',
-                                             'password': 'web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web@telering.at'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://relay.mms.telering.at',
-                                             'mmsproxy': '212.95.31.50:8080',
-                                             'name': 'tele ring mms',
-                                             'password': 'wap',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'wap@telering.at'}],
-                                    'balance-check': {'ussd': '*102#'},
-                                    'network-id': {'@mcc': '232',
-                                                   '@mnc': '07'}},
-                            'name': 'tele.ring'},
-                           {'gsm': {'apn': [{'@value': 'drei.at',
-                                             'dns': ['213.94.78.17',
-                                                     '213.94.78.16'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'drei.at',
-                                             'mmsc': 'http://mmsc',
-                                             'mmsproxy': '213.94.78.133:8799',
-                                             'name': '3MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'three.co.uk',
-                                             'mmsc': 'http://mms.um.three.co.uk:10021/mmsc',
-                                             'mmsproxy': 'mms.three.co.uk:8799',
-                                             'name': '3 MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'mobile.three.com.hk',
-                                             'mmsc': 'http://mms.um.three.com.hk:10021/mmsc',
-                                             'mmsproxy': '172.20.97.116:8799',
-                                             'name': '3MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': '3services',
-                                             'mmsc': 'http://mmsc.three.net.au:10021/mmsc',
-                                             'mmsproxy': 'mmscprox.three.net.au:8799',
-                                             'name': '3 MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': '3mms',
-                                             'mmsc': 'http://mms.three.co.id',
-                                             'mmsproxy': '10.4.0.10:3128',
-                                             'name': '3mms',
-                                             'password': '3mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': '3mms'}],
-                                    'network-id': [{'@mcc': '232',
-                                                    '@mnc': '10'},
-                                                   {'@mcc': '232',
-                                                    '@mnc': '05'}]},
-                            'name': ['Drei (3)',
-                                     {'#text': 'Drei',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'de'}]},
-                           {'gsm': {'apn': {'@value': 'web.yesss.at',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '232',
-                                                   '@mnc': '12'}},
-                            'name': 'Yesss'},
-                           {'gsm': {'apn': [{'@value': 'volmobil',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'gprsmms',
-                                             'mmsc': 'http://mmsc.t-mobile.at/servlets/mms',
-                                             'mmsproxy': '10.12.0.20:80',
-                                             'name': 'T-Mobile MMS',
-                                             'password': 'tm',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 't-mobile'}],
-                                    'network-id': {'@mcc': '232',
-                                                   '@mnc': '03'}},
-                            'name': 'VOLmobil'}]},
-             {'@code': 'au',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mmsc.optus.com.au:8002/',
-                                             'mmsproxy': '61.88.190.10:8070',
-                                             'name': 'Optus MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'Amaysim'},
-                           {'gsm': {'apn': {'@value': 'splns357'},
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'Apex Telecom'},
-                           {'gsm': {'apn': {'@value': 'splns357'},
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'Beagle'},
-                           {'gsm': {'apn': [{'@value': 'splns888a1',
-                                             'name': 'BLiNK (services after '
-                                                     '04/08/09)'},
-                                            {'@value': 'connect',
-                                             'name': 'BLiNK (services prior to '
-                                                     '04/08/09)'}],
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'BLiNK'},
-                           {'gsm': {'apn': [{'@value': 'purtona.net',
-                                             'dns': ['203.21.112.40',
-                                                     '203.21.113.40'],
-                                             'name': 'Crazy NET',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'purtona.wap',
-                                             'name': 'Crazy WAP/MMS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'}},
-                                            {'@value': 'purtona.wap',
-                                             'mmsc': 'http://purtona.mms/mmssend',
-                                             'mmsproxy': '10.202.2.20:8080',
-                                             'name': 'Crazy MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '505',
-                                                    '@mnc': '03'},
-                                                   {'@mcc': '505',
-                                                    '@mnc': '38'}]},
-                            'name': "Crazy John's"},
-                           {'gsm': {'apn': [{'@value': 'WirelessBroadband',
-                                             'name': 'Postpaid'},
-                                            {'@value': 'DODOLNS1',
-                                             'name': 'Prepaid'}],
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'Dodo'},
-                           {'gsm': {'apn': {'@value': 'splns357'},
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'Escape Net'},
-                           {'gsm': {'apn': [{'@value': 'exetel1',
-                                             'name': 'Exetel (Optus Based HSPA '
-                                                     'plans)'},
-                                            {'@value': 'INTERNET',
-                                             'name': 'Exetel (Optus Based CAP '
-                                                     'Plans) not iPhone'},
-                                            {'@value': 'OPTUSWAP',
-                                             'name': 'Exetel (Optus Based CAP '
-                                                     'Plans) not iPhone'},
-                                            {'@value': 'YesINTERNET',
-                                             'name': 'Exetel (Optus Based CAP '
-                                                     'Plans) iPhone'}],
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'Exetel'},
-                           {'gsm': {'apn': {'@value': 'vfinternet.au',
-                                            'name': 'Exetel (Vodafone Based)'},
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '03'}},
-                            'name': 'Exetel (Vodafone based)'},
-                           {'gsm': {'apn': {'@value': 'splns357'},
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'Highway1'},
-                           {'gsm': {'apn': {'@value': 'iinet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'iiNet'},
-                           {'gsm': {'apn': [{'@value': 'internode',
-                                             'name': 'NodeMobile Data',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'splns333a1',
-                                             'name': 'Old NodeMobile Data '
-                                                     '(before 2009-08-26)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'Internode'},
-                           {'gsm': {'apn': {'@value': 'primuslns1'},
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'iPrimus'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.com.au',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmau'},
-                                    'balance-check': {'ussd': '*131#'},
-                                    'balance-top-up': {'ussd': {'#text': '*131*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '19'}},
-                            'name': 'Lycamobile'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['211.29.132.12',
-                                                     '198.142.0.51'],
-                                             'name': 'Mobile Internet '
-                                                     '(handsets)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'yesinternet',
-                                             'dns': ['211.29.132.12',
-                                                     '198.142.0.51'],
-                                             'name': 'Optus Yes Internet',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'connect',
-                                             'dns': ['211.29.132.12',
-                                                     '198.142.0.51'],
-                                             'name': 'Wireless Broadband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'connectcap',
-                                             'dns': ['211.29.132.12',
-                                                     '198.142.0.51'],
-                                             'name': 'Post-Paid Mobile '
-                                                     'Broadband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'preconnect',
-                                             'dns': ['211.29.132.12',
-                                                     '198.142.0.51'],
-                                             'name': 'Pre-Paid Mobile '
-                                                     'Broadband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'name': 'Optus MMS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'Optus'},
-                           {'gsm': {'apn': [{'@value': 'yesinternet',
-                                             'name': 'TPG (iPhone)'},
-                                            {'@value': 'internet',
-                                             'name': 'TPG (all except iPhone)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'name': 'MMS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'TPG Mobile'},
-                           {'gsm': {'apn': [{'@value': 'live.vodafone.com',
-                                             'name': 'Pennytel (Vodafone) '
-                                                     'live.vodafone.com'},
-                                            {'@value': 'vfinternet.au',
-                                             'name': 'Pennytel (Vodafone) '
-                                                     'vfinternet.au'}],
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '03'}},
-                            'name': 'Pennytel'},
-                           {'gsm': {'apn': {'@value': 'splns357'},
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'Smelly Black Dog'},
-                           {'gsm': {'apn': [{'@value': 'telstra.wap',
-                                             'dns': ['139.130.4.4',
-                                                     '203.50.2.71'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'telstra.datapack',
-                                             'dns': ['139.130.4.4',
-                                                     '203.50.2.71'],
-                                             'name': 'Telstra (3G data pack)',
-                                             'password': 'Telstra',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'telstra.internet',
-                                             'dns': ['10.4.85.138',
-                                                     '10.4.176.234'],
-                                             'name': 'Telstra (Next G)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'telstra.pcpack',
-                                             'dns': ['139.130.4.4',
-                                                     '203.50.2.71'],
-                                             'name': 'Telstra (3G PC pack - '
-                                                     'pay by time)',
-                                             'password': 'Telstra',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'telstra.iph',
-                                             'name': 'Telstra Internet/Wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'}},
-                                            {'@value': 'telstra.mms',
-                                             'name': 'Telstra MMS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'telstra.bigpond',
-                                             'name': 'Telstra BigPond',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'telstra.mms',
-                                             'mmsc': 'http://mmsc.telstra.com:8002',
-                                             'mmsproxy': '10.1.1.180:80',
-                                             'name': 'Telstra MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'dtmf': ['125111',
-                                                               '1258888'],
-                                                      'ussd-response': '*100#'},
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '01'}},
-                            'name': 'Telstra'},
-                           {'gsm': {'apn': [{'@value': '3netaccess',
-                                             'dns': ['202.124.68.130',
-                                                     '202.124.76.66'],
-                                             'password': 'a',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'a'},
-                                            {'@value': '3services',
-                                             'dns': ['202.124.68.130',
-                                                     '202.124.76.66'],
-                                             'name': 'Three Prepaid',
-                                             'password': 'a',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'a'}],
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '06'}},
-                            'name': 'Three'},
-                           {'gsm': {'apn': [{'@value': 'VirginInternet',
-                                             'dns': '61.88.88.88',
-                                             'name': 'Mobile Internet',
-                                             'password': 'guest',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'guest'},
-                                            {'@value': 'VirginBroadband',
-                                             'name': 'Mobile Broadband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'Virgin Mobile'},
-                           {'gsm': {'apn': [{'@value': 'vfinternet.au',
-                                             'name': 'Postpaid and some '
-                                                     'prepaid phone plans',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'vfprepaymbb',
-                                             'dns': ['203.21.112.40',
-                                                     '203.21.113.40'],
-                                             'name': 'Prepaid',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'live.vodafone.com',
-                                             'name': 'Vodafone Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '03'}},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': [{'@value': 'yesinternet',
-                                             'name': 'Westnet (iPhone)'},
-                                            {'@value': 'internet',
-                                             'name': 'Westnet (all except '
-                                                     'iPhone)'}],
-                                    'network-id': {'@mcc': '505',
-                                                   '@mnc': '02'}},
-                            'name': 'Westnet'}]},
-             {'@code': 'az',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.azercell.com/cMMSC/post',
-                                             'mmsproxy': '10.0.154.101:8080',
-                                             'name': 'Azercell MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '400',
-                                                   '@mnc': '01'}},
-                            'name': 'Azercell'},
-                           {'gsm': {'apn': {'@value': 'mms',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '400',
-                                                   '@mnc': '02'}},
-                            'name': 'Bakcell'},
-                           {'gsm': {'apn': {'@value': 'azerfon',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'msisdn-query': {'ussd': '*100#3#'},
-                                    'network-id': {'@mcc': '400',
-                                                   '@mnc': '04'}},
-                            'name': 'Azerfon'}]},
-             {'@code': 'ba',
-              'provider': [{'gsm': {'apn': [{'@value': 'mms.bhmobile.ba',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'mms.bhmobile.ba',
-                                             'mmsc': 'http://mms.bhmobile.ba/cmmsc/post',
-                                             'mmsproxy': '195.222.56.41:8080',
-                                             'name': 'BHMobileMMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '218',
-                                                   '@mnc': '90'}},
-                            'name': 'BH GSM'},
-                           {'gsm': {'apn': [{'@value': 'mtelgprs1',
-                                             'dns': ['81.93.67.2',
-                                                     '81.93.67.3'],
-                                             'name': 'Package 1',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mtelgprs2',
-                                             'dns': ['81.93.67.2',
-                                                     '81.93.67.3'],
-                                             'name': 'Package 2',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mtelgprs3',
-                                             'dns': ['81.93.67.2',
-                                                     '81.93.67.3'],
-                                             'name': 'Package 3',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mtelgprs4',
-                                             'dns': ['81.93.67.2',
-                                                     '81.93.67.3'],
-                                             'name': 'Package 4',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mtelfun',
-                                             'dns': ['81.93.67.2',
-                                                     '81.93.67.3'],
-                                             'name': 'Prepaid',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mobismms',
-                                             'mmsc': 'http://mmsc.065mobis.com/mms/wapenc',
-                                             'mmsproxy': '192.168.61.11:80',
-                                             'name': 'mobismms',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*101#'},
-                                    'network-id': {'@mcc': '218',
-                                                   '@mnc': '05'}},
-                            'name': 'm:tel'},
-                           {'gsm': {'apn': [{'@value': 'gprs.eronet.ba',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.eronet.ba',
-                                             'mmsc': 'http://mms.gprs.eronet.ba/mms/wapenc',
-                                             'mmsproxy': '10.12.3.11:8080',
-                                             'name': 'ERONET MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*101#'},
-                                    'network-id': {'@mcc': '218',
-                                                   '@mnc': '03'}},
-                            'name': 'HT-ERONET'}]},
-             {'@code': 'bb',
-              'provider': {'gsm': {'apn': {'@value': 'isp.digicelbarbados.com',
-                                           'plan': {'@type': 'postpaid'},
-                                           'usage': {'@type': 'internet'}},
-                                   'network-id': {'@mcc': '342',
-                                                  '@mnc': '750'}},
-                           'name': 'Digicel'}},
-             {'@code': 'bd',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': '192.168.23.7',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'dns': '192.168.23.7',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'wap',
-                                             'mmsc': 'http://192.168.23.4/was',
-                                             'mmsproxy': '192.168.23.7:9028',
-                                             'name': 'AKTEL-MMS 2 0',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*222#'},
-                                    'balance-top-up': {'ussd': {'#text': '*111*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'msisdn-query': {'ussd': '*140*2*4#'},
-                                    'network-id': {'@mcc': '470',
-                                                   '@mnc': '02'}},
-                            'name': 'Robi (AKTel)'},
-                           {'gsm': {'apn': [{'@value': 'blweb',
-                                             'dns': '10.10.55.34',
-                                             'name': 'Web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'blweb',
-                                             'dns': '10.10.55.34',
-                                             'name': 'Web',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'blmms',
-                                             'mmsc': 'http://mmsc1:10021/mmsc/01',
-                                             'mmsproxy': '10.10.55.34:8799',
-                                             'name': 'blmms',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*124#'},
-                                    'balance-top-up': {'ussd': {'#text': '*123*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'msisdn-query': {'ussd': '*511#'},
-                                    'network-id': {'@mcc': '470',
-                                                   '@mnc': '03'}},
-                            'name': 'Banglalink'},
-                           {'gsm': {'apn': [{'@value': 'gpinternet',
-                                             'dns': ['202.56.4.120',
-                                                     '202.56.4.121'],
-                                             'password': 'gp',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'gp'},
-                                            {'@value': 'gpinternet',
-                                             'dns': ['202.56.4.120',
-                                                     '202.56.4.121'],
-                                             'password': 'gp',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'gp'},
-                                            {'@value': 'gpmms',
-                                             'mmsc': 'http://mms.gpsurf.net/servlets/mms',
-                                             'mmsproxy': '10.128.1.2:8080',
-                                             'name': 'GP MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*566#'},
-                                    'balance-top-up': {'ussd': {'#text': '*555*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'msisdn-query': {'ussd': '*2#'},
-                                    'network-id': {'@mcc': '470',
-                                                   '@mnc': '01'}},
-                            'name': 'GrameenPhone'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': '10.6.0.2',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'dns': '10.6.0.2',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://10.6.0.21/servlets/mms',
-                                             'mmsproxy': '10.6.0.2:8080',
-                                             'name': 'Airtel MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*778#'},
-                                    'balance-top-up': {'ussd': {'#text': '*787*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'msisdn-query': {'ussd': '*121*6*3#'},
-                                    'network-id': {'@mcc': '470',
-                                                   '@mnc': '07'}},
-                            'name': 'Airtel (Warid)'},
-                           {'gsm': {'apn': [{'@value': 'wap',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://10.5.4.22:38090/was',
-                                             'mmsproxy': '10.5.4.40:8080',
-                                             'name': 'Airtel MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*152#'},
-                                    'balance-top-up': {'ussd': {'#text': '#151*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'msisdn-query': {'ussd': '*551#'},
-                                    'network-id': {'@mcc': '470',
-                                                   '@mnc': '04'}},
-                            'name': 'Teletalk'},
-                           {'cdma': {'dns': ['117.18.224.146',
-                                             '117.18.224.147'],
-                                     'password': 'waps',
-                                     'sid': {'@value': '13480'},
-                                     'username': 'waps'},
-                            'name': 'Citycell'}]},
-             {'@code': 'be',
-              'provider': [{'gsm': {'apn': {'@value': 'data.lycamobile.be',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmbe'},
-                                    'balance-check': {'ussd': '*103#'},
-                                    'balance-top-up': {'ussd': {'#text': '*103*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '206',
-                                                   '@mnc': '06'}},
-                            'name': 'Lycamobile'},
-                           {'gsm': {'apn': [{'@value': 'web.pro.be',
-                                             'dns': ['212.65.63.10',
-                                                     '212.65.63.145'],
-                                             'name': 'Business',
-                                             'password': 'mobistar',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mobistar'},
-                                            {'@value': 'internet.be',
-                                             'dns': ['212.65.63.10',
-                                                     '212.65.63.145'],
-                                             'name': 'Personal',
-                                             'password': 'mobistar',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mobistar'},
-                                            {'@value': 'iew.be',
-                                             'dns': ['212.224.255.252',
-                                                     '212.65.63.217'],
-                                             'name': 'Internet Everywhere',
-                                             'password': 'mobistar',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mobistar'},
-                                            {'@value': 'mworld.be',
-                                             'dns': ['212.65.63.10',
-                                                     '212.65.63.145'],
-                                             'password': 'mobistar',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mobistar'},
-                                            {'@value': 'mms.be',
-                                             'mmsc': 'http://mmsc.mobistar.be',
-                                             'mmsproxy': '212.65.63.143:8080',
-                                             'name': 'Mobistar MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '#123#'},
-                                    'network-id': {'@mcc': '206', '@mnc': '10'},
-                                    'voicemail': '5555'},
-                            'name': 'Mobistar'},
-                           {'gsm': {'apn': [{'@value': 'mobile.internet.be',
-                                             'name': 'Old Walk & Surf',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'telenetwap.be',
-                                             'name': 'Walk & Talk',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'telenetwap.be',
-                                             'name': 'Walk & Surf',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '206',
-                                                   '@mnc': '10'}},
-                            'name': 'Telenet Mobile'},
-                           {'gsm': {'apn': {'@value': 'orangeinternet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '206',
-                                                   '@mnc': '10'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': [{'@value': 'internet.proximus.be',
-                                             'dns': ['195.238.2.21',
-                                                     '81.169.60.107'],
-                                             'name': 'Inter',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'intraprox.be',
-                                             'dns': ['195.238.2.21',
-                                                     '195.238.2.22'],
-                                             'name': 'Intra',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'event.proximus.be',
-                                             'mmsc': 'http://mmsc.proximus.be/mms',
-                                             'mmsproxy': '10.55.14.75:8080',
-                                             'name': 'MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '206', '@mnc': '01'},
-                                    'voicemail': '1230'},
-                            'name': 'Proximus'},
-                           {'gsm': {'apn': [{'@value': 'gprs.base.be',
-                                             'dns': ['195.130.131.139',
-                                                     '212.53.4.4'],
-                                             'password': 'base',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'base'},
-                                            {'@value': 'mms.base.be',
-                                             'mmsc': 'http://mmsc.base.be',
-                                             'mmsproxy': '217.72.235.1:8080',
-                                             'name': 'BASE MMS',
-                                             'password': 'base',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'base'}],
-                                    'network-id': {'@mcc': '206', '@mnc': '20'},
-                                    'voicemail': '1933'},
-                            'name': 'Base'},
-                           {'gsm': {'apn': {'@value': 'web.be',
-                                            'password': 'web',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'web'},
-                                    'network-id': {'@mcc': '206', '@mnc': '20'},
-                                    'voicemail': '1933'},
-                            'name': 'Mobile Vikings'}]},
-             {'@code': 'bf',
-              'provider': {'gsm': {'apn': {'@value': 'internet',
-                                           'plan': {'@type': 'prepaid'},
-                                           'usage': {'@type': 'internet'}},
-                                   'network-id': {'@mcc': '613', '@mnc': '02'}},
-                           'name': 'Airtel 3G'}},
-             {'@code': 'bg',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet.globul.bg',
-                                             'dns': '192.168.88.11',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'globul'},
-                                            {'@value': 'mms.globul.bg',
-                                             'mmsc': 'http://mmsc1.mms.globul.bg:8002',
-                                             'mmsproxy': '192.168.87.11:8004',
-                                             'name': 'GLOBUL MMS GPRS',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'balance-check': {'ussd': '*125#'},
-                                    'network-id': {'@mcc': '284', '@mnc': '05'},
-                                    'voicemail': '120'},
-                            'name': 'GloBul'},
-                           {'gsm': {'apn': [{'@value': 'inet-gprs.mtel.bg',
-                                             'dns': ['213.226.7.34',
-                                                     '213.226.7.35'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms-gprs.mtel.bg',
-                                             'mmsc': 'http://mmsc/',
-                                             'mmsproxy': '10.150.0.33:8080',
-                                             'name': 'MMS M-Tel GPRS',
-                                             'password': 'mtel',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mtel'}],
-                                    'balance-check': {'ussd': '*101#'},
-                                    'network-id': {'@mcc': '284', '@mnc': '01'},
-                                    'voicemail': '131'},
-                            'name': 'M-Tel'},
-                           {'gsm': {'apn': [{'@value': 'internet.vivacom.bg',
-                                             'name': 'Vivacom Internet '
-                                                     '(Postpaid)',
-                                             'password': 'vivacom',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vivacom'},
-                                            {'@value': 'internet.vivatel.bg',
-                                             'dns': '192.168.123.123',
-                                             'name': 'Vivatel (old)',
-                                             'password': 'vivatel',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vivatel'},
-                                            {'@value': 'mms.vivacom.bg',
-                                             'mmsc': 'http://mmsc.vivacom.bg',
-                                             'mmsproxy': '192.168.123.123:8080',
-                                             'name': 'vivacom MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'balance-check': {'ussd': '*102#'},
-                                    'network-id': {'@mcc': '284', '@mnc': '03'},
-                                    'voicemail': '110'},
-                            'name': 'Vivacom'}]},
-             {'@code': 'bh',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet.batelco.com',
-                                             'name': 'oNet',
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'wap'},
-                                            {'@value': 'mms.batelco.com',
-                                             'mmsc': 'http://192.168.36.10/servlets/mms',
-                                             'mmsproxy': '192.168.1.2:80',
-                                             'name': 'Batelco MMS',
-                                             'password': 'wap',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'wap'}],
-                                    'network-id': {'@mcc': '426',
-                                                   '@mnc': '01'}},
-                            'name': 'Batelco'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'Internet',
-                                             'password': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internet'},
-                                            {'@value': 'hsdpa',
-                                             'name': 'eGO',
-                                             'password': 'hsdpa',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'hsdpa'},
-                                            {'@value': 'http://172.18.83.129',
-                                             'mmsc': 'http://172.18.83.129',
-                                             'mmsproxy': '172.18.85.34:80',
-                                             'name': 'mms',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '426',
-                                                   '@mnc': '02'}},
-                            'name': 'Zain BH'},
-                           {'gsm': {'apn': {'@value': 'viva.bh',
-                                            'name': 'Viva',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '426',
-                                                   '@mnc': '04'}},
-                            'name': 'STC'}]},
-             {'@code': 'br',
-              'provider': [{'gsm': {'apn': [{'@value': 'brt.br',
-                                             'password': 'BrT',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'BrT'},
-                                            {'@value': 'mms.brt.br',
-                                             'mmsc': 'http://mms.brasiltelecom.com.br/',
-                                             'mmsproxy': '200.96.8.29:8080',
-                                             'name': 'BrT MMS',
-                                             'password': 'brt',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'brt'}],
-                                    'network-id': {'@mcc': '724',
-                                                   '@mnc': '16'}},
-                            'name': 'Brasil Telecom'},
-                           {'gsm': {'apn': [{'@value': 'claro.com.br',
-                                             'password': 'claro',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'claro'},
-                                            {'@value': 'bandalarga.claro.com.br',
-                                             'name': '3G',
-                                             'password': 'claro',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'claro'}],
-                                    'balance-check': {'ussd': ['*544#',
-                                                               '*545#',
-                                                               '*546#']},
-                                    'network-id': {'@mcc': '724', '@mnc': '05'},
-                                    'voicemail': '*100'},
-                            'name': 'Claro'},
-                           {'gsm': {'apn': [{'@value': 'ctbc.br',
-                                             'password': '1212',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'ctbc'},
-                                            {'@value': 'mms.ctbc.br',
-                                             'mmsc': 'http://mms.ctbccelular.com.br/was',
-                                             'mmsproxy': '172.29.7.70:8080',
-                                             'name': 'CTBC MMS',
-                                             'password': '1212',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'ctbc'}],
-                                    'balance-check': {'dtmf': '*22'},
-                                    'network-id': [{'@mcc': '724',
-                                                    '@mnc': '07'},
-                                                   {'@mcc': '724',
-                                                    '@mnc': '32'},
-                                                   {'@mcc': '724',
-                                                    '@mnc': '33'},
-                                                   {'@mcc': '724',
-                                                    '@mnc': '34'}]},
-                            'name': 'CTBC'},
-                           {'gsm': {'apn': [{'@value': 'gprs.oi.com.br',
-                                             'password': 'oioioi',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'wapgprs.oi.com.br',
-                                             'name': 'WAP',
-                                             'password': 'oioioi',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'},
-                                             'username': 'oiwap'},
-                                            {'@value': 'mmsgprs.oi.com.br',
-                                             'mmsc': 'http://200.222.42.204:8002',
-                                             'mmsproxy': '192.168.10.50:3128',
-                                             'name': 'Oi MMS',
-                                             'password': 'oioioi',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'oimms'}],
-                                    'balance-check': {'dtmf': ['*804', '*805']},
-                                    'network-id': [{'@mcc': '724',
-                                                    '@mnc': '16'},
-                                                   {'@mcc': '724',
-                                                    '@mnc': '31'},
-                                                   {'@mcc': '724',
-                                                    '@mnc': '24'}],
-                                    'voicemail': '*100'},
-                            'name': 'Oi'},
-                           {'gsm': {'apn': [{'@value': 'tim.br',
-                                             'dns': ['10.223.246.102',
-                                                     '10.223.246.103'],
-                                             'password': 'tim',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'tim'},
-                                            {'@value': 'unico.tim.it',
-                                             'mmsc': 'http://mms.tim.it/servlets/mms',
-                                             'mmsproxy': '213.230.130.89:80',
-                                             'name': 'iTIM',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'timbrasil.br',
-                                             'mmsc': 'http://mms.tim.br',
-                                             'mmsproxy': '200.179.66.242:8080',
-                                             'name': 'TIM MMS',
-                                             'password': 'tim',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'tim'}],
-                                    'balance-check': {'dtmf': '*222',
-                                                      'ussd': '*222#'},
-                                    'network-id': [{'@mcc': '724',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '724',
-                                                    '@mnc': '03'},
-                                                   {'@mcc': '724',
-                                                    '@mnc': '04'},
-                                                   {'@mcc': '724',
-                                                    '@mnc': '08'}],
-                                    'voicemail': '*100'},
-                            'name': 'TIM'},
-                           {'gsm': {'apn': {'@value': 'wap.telcel.com',
-                                            'dns': '66.36.250.14',
-                                            'password': 'iesgprs2002',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'iesgprs'}},
-                            'name': 'Velox'},
-                           {'gsm': {'apn': [{'@value': 'zap.vivo.com.br',
-                                             'password': 'vivo',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vivo'},
-                                            {'@value': 'mms.vivo.com.br',
-                                             'mmsc': 'http://termnat.vivomms.com.br:8088/mms',
-                                             'mmsproxy': '200.142.130.104:80',
-                                             'name': 'Vivo MMS',
-                                             'password': 'vivo',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'vivo'}],
-                                    'balance-check': {'dtmf': ['*8000',
-                                                               '*5005']},
-                                    'network-id': [{'@mcc': '724',
-                                                    '@mnc': '06'},
-                                                   {'@mcc': '724',
-                                                    '@mnc': '10'},
-                                                   {'@mcc': '724',
-                                                    '@mnc': '11'},
-                                                   {'@mcc': '724',
-                                                    '@mnc': '23'}],
-                                    'voicemail': '*555'},
-                            'name': 'Vivo'}]},
-             {'@code': 'bs',
-              'provider': [{'gsm': {'apn': {'@value': 'pda.newcomobile.com',
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '364',
-                                                   '@mnc': '49'}},
-                            'name': 'Aliv'},
-                           {'gsm': {'apn': {'@value': 'internet.btcbahamas.com',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '364',
-                                                   '@mnc': '390'}},
-                            'name': 'Batelco'}]},
-             {'@code': 'bm',
-              'provider': {'gsm': {'apn': {'@value': 'web.c1.bm',
-                                           'usage': {'@type': 'internet'}},
-                                   'network-id': {'@mcc': '350', '@mnc': '00'}},
-                           'name': 'CellOne'}},
-             {'@code': 'bn',
-              'provider': [{'gsm': {'apn': [{'@value': 'bmobilewap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'bmobilemms',
-                                             'mmsc': 'http://mms.bmobile.com.bn/was',
-                                             'mmsproxy': '129.9.10.20:6500',
-                                             'name': 'B-mobile MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '528',
-                                                   '@mnc': '02'}},
-                            'name': 'B-Mobile'},
-                           {'gsm': {'apn': [{'@value': 'dst.wap',
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'wap'},
-                                            {'@value': 'mms.movistar.es',
-                                             'mmsc': 'http://mms.movistar.com',
-                                             'mmsproxy': '10.138.255.5:8080',
-                                             'name': 'Movistar MMS',
-                                             'password': 'MOVISTAR',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'MOVISTAR@mms'}],
-                                    'network-id': {'@mcc': '528',
-                                                   '@mnc': '11'}},
-                            'name': 'DSTCOM'}]},
-             {'@code': 'by',
-              'provider': [{'gsm': {'apn': [{'@value': 'wap.velcom.by',
-                                             'name': 'GPRS WAP',
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'},
-                                             'username': 'wap'},
-                                            {'@value': 'web.velcom.by',
-                                             'name': 'GPRS WEB',
-                                             'password': 'web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web'},
-                                            {'@value': 'plus.velcom.by',
-                                             'name': 'GPRS WEB PLUS',
-                                             'password': 'plus',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'plus'},
-                                            {'@value': 'privet.velcom.by',
-                                             'name': 'GPRS PRIVET',
-                                             'password': 'privet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'privet'},
-                                            {'@value': 'web1.velcom.by',
-                                             'name': 'WEB BASIC',
-                                             'password': 'web1',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web1'},
-                                            {'@value': 'web2.velcom.by',
-                                             'name': 'WEB 25',
-                                             'password': 'web2',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web2'},
-                                            {'@value': 'web3.velcom.by',
-                                             'name': 'WEB 150',
-                                             'password': 'web3',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web3'},
-                                            {'@value': 'vmi.velcom.by',
-                                             'name': 'WEB 500',
-                                             'password': 'vmi',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vmi'},
-                                            {'@value': 'mms.velcom.by',
-                                             'mmsc': 'http://mms.velcom.by/servlets/mms',
-                                             'mmsproxy': '10.200.15.15:8080',
-                                             'name': 'VELCOM MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*100#'},
-                                    'network-id': {'@mcc': '257',
-                                                   '@mnc': '01'}},
-                            'name': 'velcom'},
-                           {'gsm': {'apn': [{'@value': 'internet.mts.by',
-                                             'password': 'mts',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mts'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.mts064.telekom.yu/mms/wapenc',
-                                             'mmsproxy': '172.17.85.131:8080',
-                                             'name': 'MTS MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'mms.mts.ru',
-                                             'mmsc': 'http://mmsc/',
-                                             'mmsproxy': '192.168.192.192:9201',
-                                             'name': 'MTS MMS',
-                                             'password': 'mts',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mts'},
-                                            {'@value': 'mms.umc.ua',
-                                             'mmsc': 'http://mmsc:8002/',
-                                             'mmsproxy': '192.168.10.10:8080',
-                                             'name': 'UMC MMS GPRS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'sp.mts',
-                                             'mmsc': 'http://mmsc2.mts.net',
-                                             'mmsproxy': '209.4.229.90:9401',
-                                             'name': 'MTS MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*100#'},
-                                    'network-id': {'@mcc': '257',
-                                                   '@mnc': '02'}},
-                            'name': 'MTS'},
-                           {'gsm': {'apn': {'@value': 'internet.life.com.by',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*100#'},
-                                    'network-id': {'@mcc': '257',
-                                                   '@mnc': '03'}},
-                            'name': 'life:)'}]},
-             {'@code': 'bw',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet.mascom',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.life.com.ua/cmmsc/post',
-                                             'mmsproxy': '212.58.162.230:8080',
-                                             'name': 'life:) MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '652',
-                                                   '@mnc': '01'}},
-                            'name': 'Mascom Wireless'},
-                           {'gsm': {'apn': {'@value': 'internet.orange.co.bw',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '652',
-                                                   '@mnc': '02'}},
-                            'name': 'Orange'}]},
-             {'@code': 'bi',
-              'provider': [{'gsm': {'apn': {'@value': 'ucnet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '642',
-                                                   '@mnc': '03'}},
-                            'name': 'Leo/UCom'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.mascom',
-                                             'mmsc': 'http://192.168.33.50/mms',
-                                             'mmsproxy': '192.168.33.138:8080',
-                                             'name': 'Mascom MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '642',
-                                                   '@mnc': '02'}},
-                            'name': 'Tempo/Africell'}]},
-             {'@code': 'ca',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet.fido.ca',
-                                             'dns': ['204.92.15.211',
-                                                     '207.181.101.4'],
-                                             'password': 'fido',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'fido'},
-                                            {'@value': 'mms.fido.ca',
-                                             'mmsc': 'http://mms.fido.ca',
-                                             'mmsproxy': 'mm1.fido.ca:80',
-                                             'name': 'Fido MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '302',
-                                                   '@mnc': '370'}},
-                            'name': 'Fido'},
-                           {'gsm': {'apn': [{'@value': 'internet.com',
-                                             'dns': ['207.181.101.4',
-                                                     '207.181.101.5'],
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'wapuser1'},
-                                            {'@value': 'media.com',
-                                             'mmsc': 'http://mms.gprs.rogers.com',
-                                             'mmsproxy': '10.128.1.69:80',
-                                             'name': 'Rogers Media',
-                                             'password': 'mda01',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'media'}],
-                                    'network-id': {'@mcc': '302',
-                                                   '@mnc': '720'}},
-                            'name': 'Rogers'},
-                           {'cdma': {'sid': [{'@value': '16420'},
-                                             {'@value': '16440'},
-                                             {'@value': '16456'},
-                                             {'@value': '16410'},
-                                             {'@value': '16444'},
-                                             {'@value': '16390'},
-                                             {'@value': '16394'},
-                                             {'@value': '16402'},
-                                             {'@value': '16414'},
-                                             {'@value': '16416'},
-                                             {'@value': '16418'},
-                                             {'@value': '16462'},
-                                             {'@value': '16472'},
-                                             {'@value': '16408'},
-                                             {'@value': '16404'},
-                                             {'@value': '16430'},
-                                             {'@value': '16396'},
-                                             {'@value': '16426'},
-                                             {'@value': '16388'},
-                                             {'@value': '16390'},
-                                             {'@value': '16408'},
-                                             {'@value': '16414'},
-                                             {'@value': '16430'},
-                                             {'@value': '16460'},
-                                             {'@value': '16468'}]},
-                            'gsm': {'apn': [{'@value': 'inet.bell.ca',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'pda.bell.ca',
-                                             'name': 'Mobile Web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'pda2.bell.ca',
-                                             'name': 'Mobile Fast Web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'pda.bell.ca',
-                                             'mmsc': 'http://mms.bell.ca/mms/wapenc',
-                                             'mmsproxy': 'web.wireless.bell.ca:80',
-                                             'name': 'Bell MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '302',
-                                                    '@mnc': '610'},
-                                                   {'@mcc': '302',
-                                                    '@mnc': '640'},
-                                                   {'@mcc': '302',
-                                                    '@mnc': '651'},
-                                                   {'@mcc': '302',
-                                                    '@mnc': '880'}]},
-                            'name': 'Bell Mobility'},
-                           {'cdma': {'sid': [{'@value': '16422'},
-                                             {'@value': '17500'},
-                                             {'@value': '16438'},
-                                             {'@value': '16458'},
-                                             {'@value': '16436'},
-                                             {'@value': '16434'},
-                                             {'@value': '16384'}]},
-                            'gsm': {'apn': [{'@value': 'isp.telus.com',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'vpn.telus.com',
-                                             'name': 'Internet (with VPN)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'bb.telus.com',
-                                             'name': 'Blackberry',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'sp.telus.com',
-                                             'name': 'Mobile Web/Smartphone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'sp.telus.com',
-                                             'mmsc': 'http://aliasredirect.net/proxy/mmsc',
-                                             'mmsproxy': '74.49.0.18:80',
-                                             'name': 'TELUS MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '302',
-                                                    '@mnc': '220'},
-                                                   {'@mcc': '302',
-                                                    '@mnc': '860'},
-                                                   {'@mcc': '302',
-                                                    '@mnc': '880'}]},
-                            'name': 'Telus Mobility'},
-                           {'cdma': None, 'name': 'Virgin Mobile'},
-                           {'cdma': {'sid': [{'@value': '16410'},
-                                             {'@value': '16412'}]},
-                            'gsm': {'apn': {'@value': 'inet.stm.sk.ca',
-                                            'name': 'Data Device or Tethering',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': [{'@mcc': '302',
-                                                    '@mnc': '680'},
-                                                   {'@mcc': '302',
-                                                    '@mnc': '750'},
-                                                   {'@mcc': '302',
-                                                    '@mnc': '780'},
-                                                   {'@mcc': '302',
-                                                    '@mnc': '880'}]},
-                            'name': 'SaskTel Mobility'},
-                           {'gsm': {'apn': [{'@value': 'media.videotron',
-                                             'name': 'Telephony data',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'ihvm.videotron',
-                                             'name': 'IHVM',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'media.videotron',
-                                             'mmsc': 'http://media.videotron.com',
-                                             'mmsproxy': '10.208.89.17:8080',
-                                             'name': 'Media',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '302',
-                                                    '@mnc': '500'},
-                                                   {'@mcc': '302',
-                                                    '@mnc': '510'}]},
-                            'name': 'Vidéotron'},
-                           {'gsm': {'apn': [{'@value': 'broadband.windmobile.ca',
-                                             'name': 'Laptop (data stick)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.windmobile.ca',
-                                             'name': 'Mobile (add-on for '
-                                                     'phone)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mnet.b-online.gr',
-                                             'mmsc': 'http://192.168.200.95/servlets/mms',
-                                             'mmsproxy': '192.168.200.11:9401',
-                                             'name': 'WIND MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'},
-                                            {'@value': 'mms.windmobile.ca',
-                                             'mmsc': 'http://mms.windmobile.ca',
-                                             'mmsproxy': '74.115.197.70:8080',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '302',
-                                                   '@mnc': '490'}},
-                            'name': 'WIND Mobile'},
-                           {'gsm': {'apn': [{'@value': 'wap.davewireless.com',
-                                             'name': 'Mobile Web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.davewireless.com',
-                                             'name': 'Mobile Broadband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.davewireless.com',
-                                             'mmsc': 'http://mms.mobilicity.net',
-                                             'mmsproxy': '10.100.3.4:8080',
-                                             'name': 'MoMMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '302',
-                                                   '@mnc': '320'}},
-                            'name': 'Mobilicity'}]},
-             {'@code': 'cd',
-              'provider': {'gsm': {'apn': [{'@value': 'vodanet',
-                                            'dns': '172.24.97.1',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'vodalive'},
-                                           {'@value': 'vodalive',
-                                            'mmsc': 'http://172.24.97.1/mmsc',
-                                            'mmsproxy': '172.24.97.1:3128',
-                                            'name': 'Vodalive',
-                                            'usage': {'@type': 'mms'}}],
-                                   'network-id': {'@mcc': '630', '@mnc': '01'}},
-                           'name': 'Vodacom'}},
-             {'@code': 'cg'},
-             {'@code': 'ch',
-              'provider': [{'gsm': {'apn': {'@value': 'data.lycamobile.ch',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmch'},
-                                    'balance-check': {'ussd': '*131#'},
-                                    'balance-top-up': {'ussd': {'#text': '*131*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '228',
-                                                   '@mnc': '54'}},
-                            'name': 'Lycamobile'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'Salt World - Prepaid',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'name': 'Salt Internet - Postpaid',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://192.168.151.3:8002',
-                                             'mmsproxy': '192.168.151.2:8080',
-                                             'name': 'Salt MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '#121#'},
-                                    'balance-top-up': {'ussd': {'#text': '#121*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '228',
-                                                   '@mnc': '03'}},
-                            'name': 'Salt'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['194.230.1.103',
-                                                     '194.230.1.71'],
-                                             'password': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internet'},
-                                            {'@value': 'wap.sunrise.ch',
-                                             'password': 'wap',
-                                             'username': 'wap'},
-                                            {'@value': 'mms.sunrise.ch',
-                                             'password': 'mms',
-                                             'username': 'mms'},
-                                            {'@value': 'mms.sunrise.ch',
-                                             'mmsc': 'http://mmsc.sunrise.ch',
-                                             'mmsproxy': '212.35.34.75:8080',
-                                             'name': 'Sunrise MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '228',
-                                                   '@mnc': '02'}},
-                            'name': 'Sunrise'},
-                           {'gsm': {'apn': [{'@value': 'gprs.swisscom.ch',
-                                             'dns': ['138.188.101.189',
-                                                     '138.188.101.186'],
-                                             'name': 'Swisscom GPRS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'corporate.swisscom.ch',
-                                             'name': 'Swisscom CAA',
-                                             'password': 'temporary',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'testprofil'},
-                                            {'@value': 'event.swisscom.ch',
-                                             'name': 'Swisscom MMS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'event.swisscom.ch',
-                                             'mmsc': 'http://mms.natel.ch:8079',
-                                             'mmsproxy': '192.168.210.2:8080',
-                                             'name': 'Swisscom MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*130#'},
-                                    'balance-top-up': {'ussd': {'#text': '*123*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '228',
-                                                   '@mnc': '01'}},
-                            'name': 'Swisscom'},
-                           {'gsm': {'apn': {'@value': 'gprs.swisscom.ch',
-                                            'name': 'Migros Data',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'msisdn-query': {'ussd': '*#100#'},
-                                    'network-id': {'@mcc': '228',
-                                                   '@mnc': '01'}},
-                            'name': 'M-Budget'}]},
-             {'@code': 'ci',
-              'provider': {'gsm': {'apn': [{'@value': 'internet',
-                                            'dns': '172.16.100.5',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'fast-mms',
-                                            'mmsc': 'http://192.168.97.1/mmsc',
-                                            'mmsproxy': '192.168.97.1:3130',
-                                            'name': 'MTN MMS',
-                                            'usage': {'@type': 'mms'},
-                                            'username': 'mms'},
-                                           {'@value': 'myMTN',
-                                            'mmsc': 'http://mms.mtn.co.za/mms/wapenc',
-                                            'mmsproxy': '196.11.240.241:8080',
-                                            'name': 'MTN-MMS',
-                                            'password': 'mtnmms',
-                                            'usage': {'@type': 'mms'},
-                                            'username': 'mtnmms'}],
-                                   'network-id': {'@mcc': '612', '@mnc': '05'}},
-                           'name': 'MTN'}},
-             {'@code': 'cl',
-              'provider': [{'gsm': {'apn': [{'@value': 'bam.clarochile.cl',
-                                             'password': 'clarochile',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'clarochile'},
-                                            {'@value': 'bap.clarochile.cl',
-                                             'name': 'Prepago',
-                                             'password': 'clarochile',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'clarochile'},
-                                            {'@value': 'wap.clarochile.cl',
-                                             'name': 'WAP',
-                                             'password': 'clarochile',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'},
-                                             'username': 'clarochile'},
-                                            {'@value': 'mms.clarochile.cl',
-                                             'mmsc': 'http://mms.clarochile.cl',
-                                             'mmsproxy': '172.23.200.200:8080',
-                                             'name': 'MMS CLARO',
-                                             'password': 'clarochile',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'clarochile'}],
-                                    'network-id': {'@mcc': '730',
-                                                   '@mnc': '03'}},
-                            'name': 'Claro Chile'},
-                           {'gsm': {'apn': [{'@value': 'imovil.entelpcs.cl',
-                                             'name': 'Contract / Prepaid / '
-                                                     'WebSession',
-                                             'password': 'entelpcs',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'entelpcs'},
-                                            {'@value': 'bam.entelpcs.cl',
-                                             'name': 'WAP',
-                                             'password': 'entelpcs',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'entelpcs'},
-                                            {'@value': 'mms.entelpcs.cl',
-                                             'mmsc': 'http://mmsc.entelpcs.cl',
-                                             'mmsproxy': '10.99.0.10:8080',
-                                             'name': 'MMS Entel PCS',
-                                             'password': 'entelpcs',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'entelmms'}],
-                                    'network-id': {'@mcc': '730',
-                                                   '@mnc': '01'}},
-                            'name': 'Entel PCS'},
-                           {'gsm': {'apn': [{'@value': 'web.tmovil.cl',
-                                             'name': 'Web',
-                                             'password': 'web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web'},
-                                            {'@value': 'wap.tmovil.cl',
-                                             'name': 'WAP',
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'},
-                                             'username': 'wap'},
-                                            {'@value': 'dst.mms',
-                                             'mmsc': 'http://mms.dst.com.bn/mmsc',
-                                             'mmsproxy': '10.100.6.101:3130',
-                                             'name': 'DSTMMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'},
-                                            {'@value': 'dst.mms',
-                                             'mmsc': 'http://mms.dst.com.bn/mmsc',
-                                             'mmsproxy': '10.100.6.101:3130',
-                                             'name': 'DSTMMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': [{'@mcc': '730',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '730',
-                                                    '@mnc': '10'}]},
-                            'name': 'Movistar'},
-                           {'gsm': {'apn': {'@value': 'imovil.virginmobile.cl',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '730',
-                                                   '@mnc': '07'}},
-                            'name': 'Virgin Mobile'},
-                           {'gsm': {'apn': {'@value': 'movil.vtr.com',
-                                            'password': 'vtrmovil',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'vtrmovil'},
-                                    'network-id': {'@mcc': '730',
-                                                   '@mnc': '08'}},
-                            'name': 'VTR Movil'},
-                           {'gsm': {'apn': {'@value': 'wap.nextelmovil.cl',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '730',
-                                                   '@mnc': '09'}},
-                            'name': 'Nextel'}]},
-             {'@code': 'cm',
-              'provider': [{'gsm': {'apn': {'@value': 'orangecmgprs',
-                                            'password': 'orange',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'orange'},
-                                    'network-id': {'@mcc': '624',
-                                                   '@mnc': '02'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': {'@value': 'INTERNET',
-                                            'password': 'guest',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'guest'},
-                                    'network-id': {'@mcc': '624',
-                                                   '@mnc': '01'}},
-                            'name': 'MTN'}]},
-             {'@code': 'cn',
-              'provider': [{'gsm': {'apn': [{'@value': 'cmwap',
-                                             'name': 'WAP',
-                                             'password': 'guest',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'},
-                                             'username': 'guest'},
-                                            {'@value': 'cmnet',
-                                             'dns': '211.136.20.203',
-                                             'name': 'Internet',
-                                             'password': 'guest',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'guest'},
-                                            {'@value': 'cmwap',
-                                             'mmsc': 'http://mmsc.monternet.com',
-                                             'mmsproxy': '10.0.0.172:80',
-                                             'name': '移动彩信',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '460',
-                                                    '@mnc': '00'},
-                                                   {'@mcc': '460',
-                                                    '@mnc': '02'}]},
-                            'name': 'China Mobile'},
-                           {'gsm': {'apn': [{'@value': '3gnet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'uninet'},
-                                            {'@value': '3gwap',
-                                             'mmsc': 'http://mmsc.myuni.com.cn',
-                                             'mmsproxy': '10.0.0.172:80',
-                                             'name': '联通彩信',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '460',
-                                                   '@mnc': '01'}},
-                            'name': 'China Unicom'},
-                           {'cdma': {'password': 'vnet.mobi',
-                                     'sid': [{'@value': '11296'},
-                                             {'@value': '11298'}],
-                                     'username': 'ctnet@mycdma.cn'},
-                            'gsm': {'apn': [{'@value': 'ctnet',
-                                             'name': 'CTNET',
-                                             'password': 'vnet.mobi',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'ctnet@mycdma.cn'},
-                                            {'@value': 'ctlte',
-                                             'name': 'CTLTE',
-                                             'password': 'vnet.mobi',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'ctlte@mycdma.cn'},
-                                            {'@value': 'ctwap',
-                                             'mmsc': 'http://mmsc.vnet.mobi',
-                                             'mmsproxy': '10.0.0.200:80',
-                                             'name': '电信彩信',
-                                             'password': 'vnet.mobi',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'ctwap@mycdma.cn'}],
-                                    'network-id': {'@mcc': '460',
-                                                   '@mnc': '11'}},
-                            'name': 'China Telecom'}]},
-             {'@code': 'cr',
-              'provider': [{'gsm': {'apn': {'@value': 'icecelular',
-                                            'dns': '208.133.206.44',
-                                            'password': 'guest',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'guest'},
-                                    'network-id': [{'@mcc': '712',
-                                                    '@mnc': '01'},
-                                                   {'@mcc': '712',
-                                                    '@mnc': '02'}]},
-                            'name': 'IceCelular'},
-                           {'gsm': {'apn': [{'@value': 'kolbi3g',
-                                             'name': 'Kolbi 3g',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.ideasclaro',
-                                             'mmsc': 'http://mms.ideasclaro.com:8002',
-                                             'mmsproxy': '216.230.133.66:8080',
-                                             'name': 'MMS CLARO CR',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'sms': {'#text': '1150',
-                                                              '@text': ''}},
-                                    'network-id': {'@mcc': '712', '@mnc': '03'},
-                                    'voicemail': '190'},
-                            'name': 'Kolbi'}]},
-             {'@code': 'co',
-              'provider': [{'gsm': {'apn': {'@value': 'internet.comcel.com.co',
-                                            'password': 'COMCELWEB',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'COMCELWEB'},
-                                    'network-id': {'@mcc': '732',
-                                                   '@mnc': '101'}},
-                            'name': 'Claro'},
-                           {'gsm': {'apn': {'@value': 'moviletb.net.co',
-                                            'password': 'etb',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'etb'}},
-                            'name': 'eTb'},
-                           {'gsm': {'apn': {'@value': 'internet.movistar.com.co',
-                                            'password': 'movistar',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'movistar'},
-                                    'network-id': [{'@mcc': '732',
-                                                    '@mnc': '102'},
-                                                   {'@mcc': '732',
-                                                    '@mnc': '123'}]},
-                            'name': 'Movistar'},
-                           {'gsm': {'apn': [{'@value': 'web.colombiamovil.com.co',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.sentelgsm.com',
-                                             'mmsc': 'http://mms.tigo.sn',
-                                             'mmsproxy': '172.16.16.16:8080',
-                                             'name': 'Tigo MMS',
-                                             'password': 'tigo',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'tigo'}],
-                                    'network-id': [{'@mcc': '732',
-                                                    '@mnc': '103'},
-                                                   {'@mcc': '732',
-                                                    '@mnc': '111'}]},
-                            'name': 'Tigo'},
-                           {'gsm': {'apn': {'@value': 'web.uffmovil.com.co',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}}},
-                            'name': 'Uff'},
-                           {'gsm': {'apn': [{'@value': 'www.une.net.co',
-                                             'password': 'une',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'une'},
-                                            {'@value': 'une4glte.net.co',
-                                             'name': 'LTE (4G)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.colombiamovil.com.co',
-                                             'mmsc': 'http://mms.ola.com.co',
-                                             'mmsproxy': '190.102.206.48:8080',
-                                             'name': 'TIGO multimedia',
-                                             'password': 'mms-cm1900',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms-cm1900'}],
-                                    'network-id': [{'@mcc': '732',
-                                                    '@mnc': '103'},
-                                                   {'@mcc': '732',
-                                                    '@mnc': '111'}]},
-                            'name': 'UNE'},
-                           {'gsm': {'apn': [{'@value': 'web.vmc.net.co',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.movistar.com.co',
-                                             'mmsc': 'http://mms.movistar.com.co',
-                                             'mmsproxy': '192.168.222.7:9001',
-                                             'name': 'movistar MMS',
-                                             'password': 'movistar',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'movistar'}],
-                                    'network-id': {'@mcc': '732',
-                                                   '@mnc': '123'}},
-                            'name': 'Virgin Mobile'}]},
-             {'@code': 'cy',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'Contract',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'pp.internet',
-                                             'name': 'Prepaid',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'cytamobile',
-                                             'mmsc': 'http://mmsc.cyta.com.cy',
-                                             'mmsproxy': '212.31.96.161:8080',
-                                             'name': 'CytaMMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'msisdn-query': {'ussd': '*#109#'},
-                                    'network-id': {'@mcc': '280',
-                                                   '@mnc': '01'}},
-                            'name': 'Cytamobile-Vodafone'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'password': 'wap',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'wap'},
-                                    'network-id': {'@mcc': '280',
-                                                   '@mnc': '10'}},
-                            'name': 'MTN'}]},
-             {'@code': 'cz',
-              'provider': [{'gsm': {'apn': {'@value': 'internet',
-                                            'dns': ['217.77.161.130',
-                                                    '217.77.161.131'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*22#'},
-                                    'network-id': {'@mcc': '230',
-                                                   '@mnc': '03'}},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['160.218.10.200',
-                                                     '160.218.43.200'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.open',
-                                             'dns': ['160.218.10.200',
-                                                     '160.218.43.200'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'name': 'Prepaid',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.o2active.cz:8002',
-                                             'mmsproxy': '160.218.160.218:8080',
-                                             'name': '02 MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*104*#'},
-                                    'balance-top-up': {'ussd': {'#text': '*102*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '230',
-                                                   '@mnc': '02'}},
-                            'name': 'O2'},
-                           {'gsm': {'apn': {'@value': 'internet.t-mobile.cz',
-                                            'dns': ['62.141.0.1',
-                                                    '213.162.65.1'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*101*#'},
-                                    'balance-top-up': {'ussd': {'#text': '*102*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '230',
-                                                   '@mnc': '01'}},
-                            'name': 'T-Mobile'},
-                           {'@primary': 'false',
-                            'gsm': {'apn': {'@value': 'internet.t-mobile.cz',
-                                            'password': 'gprs',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'gprs'},
-                                    'balance-check': {'ussd': '*146#'},
-                                    'balance-top-up': {'ussd': {'#text': '*144*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '230',
-                                                   '@mnc': '01'}},
-                            'name': 'MOBIL.CZ'}]},
-             {'@code': 'de',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet.eplus.de',
-                                             'dns': ['212.23.97.2',
-                                                     '212.23.97.3'],
-                                             'name': 'Volume rate/30 Day '
-                                                     'Flatrate',
-                                             'password': 'gprs',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'eplus'},
-                                            {'@value': 'mms.eplus.de',
-                                             'mmsc': 'http://mms/eplus/',
-                                             'mmsproxy': '212.23.97.153:5080',
-                                             'name': 'E-plus MMS',
-                                             'password': 'eplus',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'balance-check': {'ussd': '*100#'},
-                                    'balance-top-up': {'ussd': {'#text': '*104*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '262',
-                                                    '@mnc': '03'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '05'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '77'}],
-                                    'voicemail': '9911'},
-                            'name': 'AldiTalk/MedionMobile'},
-                           {'gsm': {'apn': [{'@value': 'internet.eplus.de',
-                                             'password': 'blau',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'blau'},
-                                            {'@value': 'tagesflat.eplus.de',
-                                             'name': ['24 Hour Flatrate',
-                                                      {'#text': 'Tages-Flatrate',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'de'}],
-                                             'password': 'blau',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'blau'}],
-                                    'balance-check': {'ussd': '*100#'},
-                                    'balance-top-up': {'ussd': {'#text': '*104*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '262',
-                                                    '@mnc': '03'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '05'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '77'}]},
-                            'name': 'blau.de'},
-                           {'gsm': {'apn': [{'@value': 'access.vodafone.de',
-                                             'name': 'BILD Mobilportal',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'web.vodafone.de',
-                                             'dns': ['139.7.30.125',
-                                                     '139.7.30.126'],
-                                             'name': 'Contract',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'event.vodafone.de',
-                                             'name': 'BILDmobil Speedstick '
-                                                     '(Surfpakete)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'event.vodafone.de',
-                                             'mmsc': 'http://139.7.24.1/servlets/mms',
-                                             'mmsproxy': '139.7.29.17:80',
-                                             'name': 'VF DE MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '262',
-                                                   '@mnc': '02'}},
-                            'name': 'Bild Mobil'},
-                           {'@primary': 'true',
-                            'gsm': {'apn': {'@value': 'internet.eplus.de',
-                                            'dns': ['212.23.97.2',
-                                                    '212.23.97.3'],
-                                            'password': 'gprs',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'eplus'},
-                                    'balance-check': {'ussd': '*100#'},
-                                    'balance-top-up': {'ussd': {'#text': '*104*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '262',
-                                                    '@mnc': '03'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '05'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '77'}]},
-                            'name': 'E-Plus'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.de',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmde'},
-                                    'balance-check': {'ussd': '*131#'},
-                                    'balance-top-up': {'ussd': {'#text': '*131*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '262',
-                                                   '@mnc': '43'}},
-                            'name': 'Lycamobile'},
-                           {'gsm': {'apn': [{'@value': 'pinternet.interkom.de',
-                                             'dns': ['193.189.244.225',
-                                                     '193.189.244.206'],
-                                             'name': 'LOOP',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'dns': ['195.182.110.132',
-                                                     '62.134.11.4'],
-                                             'name': 'Pay-by-MB',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'surfo2',
-                                             'dns': ['195.182.110.132',
-                                                     '62.134.11.4'],
-                                             'name': 'Pay-by-time',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'mmsc': 'http://10.81.0.7:8002',
-                                             'mmsproxy': '195.182.114.52:8080',
-                                             'name': 'o2 MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*101#'},
-                                    'balance-top-up': {'ussd': {'#text': '*103*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '262',
-                                                    '@mnc': '07'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '08'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '11'}],
-                                    'voicemail': '333'},
-                            'name': 'O2'},
-                           {'gsm': {'apn': {'@value': 'webmobil1',
-                                            'name': 'Tagesflat / '
-                                                    'Monats-Flatrate L / '
-                                                    'Monats-Flatrate XL',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*101#'},
-                                    'balance-top-up': {'ussd': {'#text': '*103*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '262',
-                                                    '@mnc': '07'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '08'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '11'}]},
-                            'name': 'Tchibo-Mobil'},
-                           {'gsm': {'apn': [{'@value': 'internet.t-d1.de',
-                                             'dns': ['193.254.160.1',
-                                                     '193.254.160.130'],
-                                             'password': 't-d1',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.t-mobile',
-                                             'dns': ['10.74.83.22',
-                                                     '193.254.160.1'],
-                                             'password': 'tm',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 't-mobile'},
-                                            {'@value': 'internet.v6.telekom',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.telekom',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'iot.telekom.net',
-                                             'name': 'Business Smart Connect',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.t-mobile',
-                                             'mmsc': 'http://mms.t-mobile.de/servlets/mms',
-                                             'mmsproxy': '172.28.23.131:8008',
-                                             'name': 'T-Mobile MMS',
-                                             'password': 'tm',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 't-mobile'}],
-                                    'balance-check': {'ussd': '*100#'},
-                                    'balance-top-up': {'ussd': {'#text': '*101*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '262',
-                                                    '@mnc': '01'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '06'}],
-                                    'voicemail': '3311'},
-                            'name': 'T-Mobile(Telekom)'},
-                           {'gsm': {'apn': {'@value': 'internet.t-mobile',
-                                            'dns': ['193.254.160.1',
-                                                    '10.74.83.22'],
-                                            'name': 'Prepaid Contracts',
-                                            'password': 'tm',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 't-mobile'},
-                                    'balance-check': {'ussd': '*100#'},
-                                    'balance-top-up': {'ussd': {'#text': '*101*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '262',
-                                                   '@mnc': '01'}},
-                            'name': 'Congstar'},
-                           {'gsm': {'apn': [{'@value': 'web.vodafone.de',
-                                             'dns': ['139.7.30.125',
-                                                     '139.7.30.126'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'event.vodafone.de',
-                                             'dns': ['139.7.30.125',
-                                                     '139.7.30.126'],
-                                             'name': 'WebSessions',
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vodafone'}],
-                                    'balance-check': {'ussd': '*100#'},
-                                    'balance-top-up': {'ussd': {'#text': '*100*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '262',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '04'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '09'}],
-                                    'voicemail': '5500'},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': {'@value': 'pinternet.interkom.de',
-                                            'password': 'fonic',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'fonic'},
-                                    'balance-check': {'ussd': '*101#'},
-                                    'balance-top-up': {'ussd': {'#text': '*103*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '262',
-                                                    '@mnc': '07'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '08'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '11'}]},
-                            'name': 'FONIC'},
-                           {'gsm': {'apn': {'@value': 'internet.eplus.de',
-                                            'dns': ['212.23.97.2',
-                                                    '212.23.97.3'],
-                                            'password': 'simyo',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'simyo'},
-                                    'balance-check': {'ussd': '*100#'},
-                                    'balance-top-up': {'ussd': {'#text': '*104*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '262',
-                                                    '@mnc': '03'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '05'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '77'}]},
-                            'name': 'simyo Internet'},
-                           {'gsm': {'apn': {'@value': 'internet.partner1',
-                                            'dns': ['193.189.244.225',
-                                                    '193.189.244.206'],
-                                            'name': 'Option Mobile',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '262',
-                                                   '@mnc': '07'}},
-                            'name': 'Alice'},
-                           {'gsm': {'apn': [{'@value': 'web.vodafone.de',
-                                             'name': 'Mobile Broadband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mail.partner.de',
-                                             'name': 'Mobile Web',
-                                             'password': 'Web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'D2'}],
-                                    'balance-check': {'ussd': '*100#'},
-                                    'network-id': [{'@mcc': '262',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '04'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '09'}],
-                                    'voicemail': '5500'},
-                            'name': '1&1'},
-                           {'gsm': {'apn': {'@value': 'pinternet.interkom.de',
-                                            'name': 'Internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': [{'@mcc': '262',
-                                                    '@mnc': '07'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '08'},
-                                                   {'@mcc': '262',
-                                                    '@mnc': '11'}]},
-                            'name': 'Netzclub'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}}},
-                            'name': 'winSIM'}]},
-             {'@code': 'dk',
-              'provider': [{'@primary': 'true',
-                            'gsm': {'apn': [{'@value': 'bredband.tre.dk',
-                                             'name': 'Bredbånd (standard)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'net.tre.dk',
-                                             'name': 'Bredbånd Premium Kontant',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'data.tre.dk',
-                                             'name': '3 (standard for '
-                                                     'mobilkunder; spærret for '
-                                                     'indgående trafik)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'static.tre.dk',
-                                             'name': '3 (statisk IP)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '238',
-                                                   '@mnc': '06'}},
-                            'name': '3'},
-                           {'gsm': {'apn': [{'@value': 'bredband.oister.dk',
-                                             'name': 'Mobile Broadband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'data.dk',
-                                             'name': 'Mobile Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'data.tre.dk',
-                                             'mmsc': 'http://mms.3.dk',
-                                             'mmsproxy': 'mmsproxy.3.dk:8799',
-                                             'name': '3mms',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '238',
-                                                   '@mnc': '06'}},
-                            'name': 'OiSTER'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.dk',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmdk'},
-                                    'balance-check': {'ussd': '*102#'},
-                                    'balance-top-up': {'ussd': {'#text': '*101*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '238',
-                                                   '@mnc': '12'}},
-                            'name': 'Lycamobile'},
-                           {'cdma': {'password': 'cdma', 'username': 'cdma'},
-                            'name': 'ice.net (Nordisk Mobiltelefon)'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['212.88.64.199',
-                                                     '212.88.64.14'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'telenor',
-                                             'mmsc': 'http://mms.telenor.dk',
-                                             'mmsproxy': '212.88.64.8:8080',
-                                             'name': 'Telenor MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'dtmf': '40454545',
-                                                      'ussd': '*101#'},
-                                    'network-id': [{'@mcc': '238',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '238',
-                                                    '@mnc': '77'}],
-                                    'voicemail': '20171717'},
-                            'name': 'Telenor'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': [{'@mcc': '238',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '238',
-                                                    '@mnc': '77'}]},
-                            'name': 'CBB Mobil'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['194.239.134.83',
-                                                     '193.162.153.164'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.no',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.se',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.tdc.fi',
-                                             'mmsc': 'http://mmsc.tdc.fi',
-                                             'mmsproxy': '10.1.12.2:8080',
-                                             'name': 'TDC MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'dtmf': '40454545',
-                                                      'ussd': '*101#'},
-                                    'network-id': {'@mcc': '238', '@mnc': '01'},
-                                    'voicemail': '20171717'},
-                            'name': 'TDC'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'password': 'Fullrate',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'Fullrate'}},
-                            'name': 'Fullrate'},
-                           {'gsm': {'apn': [{'@value': 'www.internet.mtelia.dk',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'www.mms.mtelia.dk',
-                                             'mmsc': 'http://mms.telia.dk',
-                                             'mmsproxy': '193.209.134.131:8080',
-                                             'name': 'Telia MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*101#'},
-                                    'network-id': {'@mcc': '238', '@mnc': '30'},
-                                    'voicemail': '28184000'},
-                            'name': 'Telia'},
-                           {'gsm': {'apn': {'@value': 'internet.bibob.dk',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '238',
-                                                   '@mnc': '02'}},
-                            'name': 'BiBoB'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['194.239.134.83',
-                                                     '193.162.153.164'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://192.168.241.114:8002',
-                                             'mmsproxy': '194.182.251.15:8080',
-                                             'name': 'Telmore MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '238',
-                                                   '@mnc': '01'}},
-                            'name': 'Telmore'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '238',
-                                                   '@mnc': '01'}},
-                            'name': 'Unotel'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '238',
-                                                   '@mnc': '01'}},
-                            'name': 'happiimobil'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '238',
-                                                   '@mnc': '01'}},
-                            'name': 'Onfone Internet DK'}]},
-             {'@code': 'do',
-              'provider': [{'gsm': {'apn': {'@value': 'orangenet.com.do',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '#131#'},
-                                    'network-id': {'@mcc': '370', '@mnc': '01'},
-                                    'voicemail': '*777'},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': {'@value': 'internet.ideasclaro.com.do',
-                                            'dns': ['196.3.81.5',
-                                                    '196.3.81.132'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'dtmf': '*22',
-                                                      'ussd': '*122#'},
-                                    'network-id': {'@mcc': '370', '@mnc': '02'},
-                                    'voicemail': '*99'},
-                            'name': 'Claro'},
-                           {'gsm': {'apn': {'@value': 'edge.viva.net.do',
-                                            'password': 'viva',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'viva'},
-                                    'balance-check': {'dtmf': '*74',
-                                                      'ussd': '#111#'},
-                                    'network-id': {'@mcc': '370',
-                                                   '@mnc': '04'}},
-                            'name': 'Viva'}]},
-             {'@code': 'dz',
-              'provider': [{'gsm': {'apn': [{'@value': 'djezzy.internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'djezzy.mms',
-                                             'mmsproxy': '172.24.97.158:8799',
-                                             'name': 'MMS djezzy',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '603',
-                                                   '@mnc': '02'}},
-                            'name': 'Djezzy'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'password': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internet'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://172.25.49.9/servlets/mms',
-                                             'mmsproxy': '172.25.49.2:8080',
-                                             'name': 'Mobilis MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '603',
-                                                   '@mnc': '01'}},
-                            'name': 'Mobilis'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'WEB',
-                                             'password': 'nedjma',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'nedjma'},
-                                            {'@value': 'nedjmaMMS',
-                                             'mmsc': 'http://10.10.111.1',
-                                             'mmsproxy': '192.168.52.3:3128',
-                                             'name': 'Nedjma MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '603',
-                                                   '@mnc': '03'}},
-                            'name': 'Nedjma'}]},
-             {'@code': 'ec',
-              'provider': [{'gsm': {'apn': [{'@value': 'navega.movistar.ec',
-                                             'password': 'movistar',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'movistar'},
-                                            {'@value': 'mms.movistar.com.ec',
-                                             'mmsc': 'http://mms.movistar.com.ec:8088/mms/',
-                                             'mmsproxy': '10.3.5.50:9001',
-                                             'name': 'movistar MMS',
-                                             'password': 'movistar',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'movistar'}],
-                                    'network-id': {'@mcc': '740',
-                                                   '@mnc': '00'}},
-                            'name': 'Movistar UMTS'},
-                           {'gsm': {'apn': [{'@value': 'internet.porta.com.ec',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.porta.com.ec',
-                                             'mmsc': 'http://iesmms.porta.com.ec',
-                                             'mmsproxy': '216.250.208.94:8799',
-                                             'name': 'MMS Porta',
-                                             'password': 'portamms2003',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'portamms'}],
-                                    'network-id': {'@mcc': '740',
-                                                   '@mnc': '01'}},
-                            'name': 'Porta 3G'}]},
-             {'@code': 'ee',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet.emt.ee',
-                                             'dns': ['217.71.32.116',
-                                                     '217.71.32.115'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.emt.ee',
-                                             'mmsc': 'http://mms.emt.ee/servlets/mms',
-                                             'mmsproxy': '217.71.32.82:8080',
-                                             'name': 'EMT MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '248',
-                                                   '@mnc': '01'}},
-                            'name': 'EMT'},
-                           {'gsm': {'apn': {'@value': 'internet.emt.ee',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '248',
-                                                   '@mnc': '01'}},
-                            'name': 'Nordea'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': '194.204.0.1',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.elisa.fi',
-                                             'mmsproxy': '213.161.41.57:80',
-                                             'name': 'Elisa MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://194.204.2.10',
-                                             'mmsproxy': '194.204.2.6:8000',
-                                             'name': 'Elisa MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '248',
-                                                   '@mnc': '02'}},
-                            'name': 'Elisa'},
-                           {'gsm': {'apn': [{'@value': 'internet.tele2.ee',
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'wap'},
-                                            {'@value': 'internet.tele2.fi',
-                                             'mmsc': 'http://mmsc.tele2.fi',
-                                             'mmsproxy': '193.12.40.19:80',
-                                             'name': 'Tele2 MMS',
-                                             'password': 'wap',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'wap'}],
-                                    'network-id': {'@mcc': '248',
-                                                   '@mnc': '03'}},
-                            'name': 'Tele2'}]},
-             {'@code': 'eg',
-              'provider': [{'gsm': {'apn': {'@value': 'internet.vodafone.net',
-                                            'dns': ['163.121.128.134',
-                                                    '212.103.160.18'],
-                                            'password': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'internet'},
-                                    'msisdn-query': {'ussd': '*878#'},
-                                    'network-id': {'@mcc': '602',
-                                                   '@mnc': '02'}},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': [{'@value': 'etisalat',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'Etisalat',
-                                             'mmsc': 'http://10.71.131.7:38090/',
-                                             'mmsproxy': '10.71.130.29:8080',
-                                             'name': 'Etisalat MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '602',
-                                                   '@mnc': '03'}},
-                            'name': 'Etisalat'},
-                           {'gsm': {'apn': [{'@value': 'mobinilweb',
-                                             'dns': ['80.75.166.250',
-                                                     '163.121.163.201'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mobinilmms',
-                                             'mmsc': 'http://10.7.13.24:8002/',
-                                             'mmsproxy': '62.241.155.45:8080',
-                                             'name': 'MobiNil MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '602',
-                                                   '@mnc': '01'}},
-                            'name': 'MobiNil'}]},
-             {'@code': 'es',
-              'provider': [{'gsm': {'apn': {'@value': 'internet.euskaltel.mobi',
-                                            'password': 'EUSKALTEL',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'CLIENTE'},
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '08'}},
-                            'name': 'Euskaltel'},
-                           {'gsm': {'apn': {'@value': 'gprsmov.lebaramobile.es',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}}},
-                            'name': 'Lebara'},
-                           {'gsm': {'apn': {'@value': 'lowi.private.omv.es',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}}},
-                            'name': 'Lowi'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.es',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmes'},
-                                    'balance-check': {'ussd': '*221#'},
-                                    'balance-top-up': {'ussd': {'#text': '*221*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '25'}},
-                            'name': 'Lycamobile'},
-                           {'gsm': {'apn': {'@value': 'internetmas',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '03'}},
-                            'name': 'Másmovil'},
-                           {'gsm': {'apn': {'@value': 'internet.mundo-r.com',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '17'}},
-                            'name': 'móbil R (Mundo-R)'},
-                           {'gsm': {'apn': {'@value': 'INTERNETTPH',
-                                            'dns': ['213.143.33.8',
-                                                    '62.36.225.150'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '03'}},
-                            'name': 'Happy Móvil/moviData'},
-                           {'gsm': {'apn': {'@value': 'internet.ono.com',
-                                            'dns': ['62.42.230.24',
-                                                    '62.42.63.52'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '18'}},
-                            'name': 'ONO'},
-                           {'gsm': {'apn': [{'@value': 'gprs.pepephone.com',
-                                             'name': 'Pepephone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'gprsmov.pepephone.com',
-                                             'name': 'Pepephone (Mobile)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '06'}},
-                            'name': 'Pepephone'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'dns': ['85.62.229.133',
-                                                    '85.62.229.134'],
-                                            'name': 'Orange',
-                                            'password': 'ORANGE',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'ORANGE'},
-                                    'balance-check': {'ussd': ['*111#',
-                                                               '*113#']},
-                                    'network-id': [{'@mcc': '214',
-                                                    '@mnc': '03'},
-                                                   {'@mcc': '214',
-                                                    '@mnc': '09'}],
-                                    'voicemail': '242'},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': {'@value': 'gprs-service.com',
-                                            'dns': ['195.230.105.134',
-                                                    '195.230.105.135'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '19'}},
-                            'name': 'Simyo'},
-                           {'gsm': {'apn': {'@value': 'internet.telecable.es',
-                                            'password': 'telecable',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'telecable'},
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '16'}},
-                            'name': 'Telecable'},
-                           {'gsm': {'apn': [{'@value': 'telefonica.es',
-                                             'dns': ['194.179.1.100',
-                                                     '194.179.1.101'],
-                                             'name': 'Telefónica',
-                                             'password': 'telefonica',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'telefonica'},
-                                            {'@value': 'movistar.es',
-                                             'name': 'Movistar (USB modems)',
-                                             'password': 'movistar',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'movistar'}],
-                                    'balance-check': {'dtmf': '2266'},
-                                    'network-id': [{'@mcc': '214',
-                                                    '@mnc': '05'},
-                                                   {'@mcc': '214',
-                                                    '@mnc': '07'}],
-                                    'voicemail': '123'},
-                            'name': 'Movistar (Telefónica)'},
-                           {'gsm': {'apn': [{'@value': 'ac.vodafone.es',
-                                             'dns': ['212.73.32.96',
-                                                     '212.73.32.67'],
-                                             'name': 'Vodafone',
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vodafone'},
-                                            {'@value': 'airtelnet.es',
-                                             'dns': ['212.73.32.3',
-                                                     '212.73.32.67'],
-                                             'name': 'Airtel (old)',
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vodafone'},
-                                            {'@value': 'mms.vodafone.net',
-                                             'mmsc': 'http://mmsc.vodafone.es/servlets/mms',
-                                             'mmsproxy': '212.73.32.10:80',
-                                             'name': 'MMS VODAFONE',
-                                             'password': 'wap125',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'wap@wap'}],
-                                    'msisdn-query': {'ussd': '*138#'},
-                                    'network-id': [{'@mcc': '214',
-                                                    '@mnc': '01'},
-                                                   {'@mcc': '214',
-                                                    '@mnc': '06'}]},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['213.248.76.210',
-                                                     '213.248.100.54'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mmss/',
-                                             'mmsproxy': '193.209.134.141:80',
-                                             'name': 'Yoigo MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*111#'},
-                                    'network-id': {'@mcc': '214', '@mnc': '04'},
-                                    'voicemail': '633'},
-                            'name': 'Yoigo'},
-                           {'gsm': {'apn': {'@value': 'jazzinternet',
-                                            'dns': ['87.216.1.65',
-                                                    '87.216.1.66'],
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '21'}},
-                            'name': 'Jazztel'},
-                           {'gsm': {'apn': {'@value': 'CARREFOURINTERNET',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}}},
-                            'name': 'Carrefour Móvil'},
-                           {'gsm': {'apn': {'@value': 'tuenti.com',
-                                            'password': 'tuenti',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'tuenti'},
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '05'}},
-                            'name': 'Tuenti Móvil'},
-                           {'gsm': {'apn': {'@value': 'gprs.eroskimovil.es',
-                                            'name': 'Eroski Móvil GPRS',
-                                            'password': 'wap125',
-                                            'username': 'wap@wap'},
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '24'}},
-                            'name': 'Eroski Móvil'},
-                           {'gsm': {'apn': {'@value': 'moreinternet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '03'}},
-                            'name': 'LlamaYa móvil'},
-                           {'gsm': {'apn': {'@value': 'orangeworld',
-                                            'password': 'orange',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'orange'},
-                                    'network-id': {'@mcc': '214',
-                                                   '@mnc': '03'}},
-                            'name': 'Amena'},
-                           {'gsm': {'apn': {'@value': 'inet.es',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*123#'}},
-                            'name': 'Suop'}]},
-             {'@code': 'et',
-              'provider': {'cdma': {'password': 'etc', 'username': 'etc'},
-                           'gsm': {'apn': {'@value': 'etc.com',
-                                           'dns': ['213.55.96.148',
-                                                   '213.55.96.166'],
-                                           'plan': {'@type': 'postpaid'},
-                                           'usage': {'@type': 'internet'}},
-                                   'balance-check': {'ussd': '*804#'},
-                                   'network-id': {'@mcc': '636', '@mnc': '01'}},
-                           'name': 'Ethio Telecom'}},
-             {'@code': 'fo',
-              'provider': {'gsm': {'apn': {'@value': 'vmc.vodafone.fo',
-                                           'plan': {'@type': 'postpaid'},
-                                           'usage': {'@type': 'internet'}},
-                                   'msisdn-query': {'ussd': '*#100#'},
-                                   'network-id': {'@mcc': '288', '@mnc': '02'}},
-                           'name': 'Vodafone FO'}},
-             {'@code': 'fi',
-              'provider': [{'gsm': {'apn': {'@value': 'kuirinet',
-                                            'name': 'Kuiri Internet',
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '244',
-                                                   '@mnc': '31'}},
-                            'name': 'Kuiri'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'Postpaid (contract) NAT '
-                                                     '(available for all '
-                                                     'subscribers)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'julkinen.dna.fi',
-                                             'name': 'Postpaid (contract) '
-                                                     'public IP address (Dec '
-                                                     '2016 and later '
-                                                     'individual '
-                                                     'subscriptions)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'data.dna.fi',
-                                             'name': 'Postpaid (contract) '
-                                                     'public IP address (Nov '
-                                                     '2016 and earlier '
-                                                     'individual, and all '
-                                                     'company subscriptions)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'data.moimobile.fi',
-                                             'name': 'Moi Mobiili',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mmsc.dnafinland.fi',
-                                             'mmsproxy': '10.1.1.2:8080',
-                                             'name': 'MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'dna'}],
-                                    'network-id': {'@mcc': '244',
-                                                   '@mnc': '12'}},
-                            'name': 'DNA'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'dtmf': '080090598',
-                                                      'sms': [{'#text': '18258',
-                                                               '@text': 'SALDO'},
-                                                              {'#text': '18258',
-                                                               '@text': 'PAKETTI'}]},
-                                    'network-id': {'@mcc': '244', '@mnc': '05'},
-                                    'voicemail': '777'},
-                            'name': 'Elisa'},
-                           {'gsm': {'apn': [{'@value': 'internet.saunalahti',
-                                             'dns': ['195.74.0.47',
-                                                     '195.197.54.100'],
-                                             'name': 'Postpaid (contract) NAT '
-                                                     '(available for all '
-                                                     'subscribers)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet4',
-                                             'dns': ['195.74.0.47',
-                                                     '195.197.54.100'],
-                                             'name': 'Postpaid (contract) '
-                                                     'public IP address (needs '
-                                                     'to be ordered)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'dns': ['195.74.0.47',
-                                                     '195.197.54.100'],
-                                             'name': 'Prepaid (no contract)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.saunalahti.fi',
-                                             'mmsc': 'http://mms.saunalahti.fi:8002/',
-                                             'mmsproxy': '62.142.4.197:8080',
-                                             'name': 'Saunalahti MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'sms': [{'#text': '16304',
-                                                               '@text': 'SALDO'},
-                                                              {'#text': '15045',
-                                                               '@text': 'SALDO'},
-                                                              {'#text': '16304',
-                                                               '@text': 'KOKOSALDO'},
-                                                              {'#text': '16304',
-                                                               '@text': 'GSALDO'},
-                                                              {'#text': '16304',
-                                                               '@text': 'PAKETTI'}]},
-                                    'network-id': {'@mcc': '244',
-                                                   '@mnc': '21'}},
-                            'name': 'Saunalahti'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['192.89.123.230',
-                                                     '192.89.123.231'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'opengate',
-                                             'dns': ['192.89.123.230',
-                                                     '192.89.123.231'],
-                                             'name': 'Open Gate (public IP, '
-                                                     'open ports; needs to be '
-                                                     'ordered)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'prointernet',
-                                             'dns': ['192.89.123.230',
-                                                     '192.89.123.231'],
-                                             'name': 'Prointernet (public IP)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'telefinland',
-                                             'mmsc': 'http://mms.sonera.net:8002',
-                                             'mmsproxy': '195.156.25.33:8080',
-                                             'name': 'TeleFinland MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'sms': {'#text': '15400',
-                                                              '@text': 'EASY '
-                                                                       'SALDO'}},
-                                    'network-id': {'@mcc': '244',
-                                                   '@mnc': '91'}},
-                            'name': 'Telia'},
-                           {'gsm': {'apn': {'@value': 'internet.welho.fi',
-                                            'name': 'Wekkula',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}}},
-                            'name': 'Welho'}]},
-             {'@code': 'fj',
-              'provider': {'gsm': {'apn': [{'@value': 'vfinternet.fj',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'kidanet.fj',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'prepay.vfinternet.fj',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}}],
-                                   'msisdn-query': {'ussd': '*999#'},
-                                   'network-id': {'@mcc': '542', '@mnc': '01'}},
-                           'name': 'Vodafone / Kidanet'}},
-             {'@code': 'fr',
-              'provider': [{'gsm': {'apn': {'@value': 'wap65',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}}},
-                            'name': 'A Mobile (Auchan Telecom)'},
-                           {'gsm': {'apn': [{'@value': 'a2bouygtel.com',
-                                             'dns': '62.201.129.99',
-                                             'name': 'Contrat Pro Data '
-                                                     'Illimité',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'b2bouygtel.com',
-                                             'dns': '62.201.129.99',
-                                             'name': 'B2Bouygtel',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'ebouygtel.com',
-                                             'dns': '62.201.129.99',
-                                             'name': 'Forfait Data',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mmsbouygtel.com',
-                                             'dns': '62.201.129.99',
-                                             'name': 'Forfait Data',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'pcebouygtel.com',
-                                             'dns': '62.201.129.99',
-                                             'name': 'Contrat Pro Data',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mmsbouygtel.com',
-                                             'mmsc': 'http://mms.bouyguestelecom.fr/mms/wapenc',
-                                             'mmsproxy': '62.201.129.226:8080',
-                                             'name': 'Bouygues MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'dtmf': '630'},
-                                    'network-id': [{'@mcc': '208',
-                                                    '@mnc': '20'},
-                                                   {'@mcc': '208',
-                                                    '@mnc': '21'}],
-                                    'voicemail': '660'},
-                            'name': 'Bouygues Telecom'},
-                           {'gsm': {'apn': [{'@value': 'free',
-                                             'name': 'Free-Mobile',
-                                             'password': 'free',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'free'},
-                                            {'@value': 'mmsfree',
-                                             'name': 'Free-Mobile',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'mmsfree',
-                                             'mmsc': 'http://mms.free.fr',
-                                             'mmsproxy': '10.0.0.10:8080',
-                                             'name': 'MMS Free',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '208',
-                                                   '@mnc': '15'}},
-                            'name': 'Free Mobile'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.fr',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmfr'},
-                                    'balance-check': {'ussd': '*131#'},
-                                    'balance-top-up': {'ussd': {'#text': '*131*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '208',
-                                                   '@mnc': '25'}},
-                            'name': 'Lycamobile'},
-                           {'gsm': {'apn': [{'@value': 'orange.fr',
-                                             'dns': ['194.51.3.56',
-                                                     '194.51.3.76'],
-                                             'name': 'Orange Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet-entreprise',
-                                             'dns': ['194.51.3.56',
-                                                     '194.51.3.76'],
-                                             'name': 'Business Contract',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'orange',
-                                             'dns': ['194.51.3.56',
-                                                     '194.51.3.76'],
-                                             'name': 'No Contract / Mobicarte',
-                                             'password': 'orange',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'orange'},
-                                            {'@value': 'orange-mib',
-                                             'dns': ['172.17.0.2',
-                                                     '172.17.0.4'],
-                                             'name': 'Orange Entreprises',
-                                             'password': 'mib',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mportail'},
-                                            {'@value': 'orange-acte',
-                                             'name': 'Orange MMS',
-                                             'password': 'orange',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'orange'},
-                                            {'@value': 'orange.ie',
-                                             'name': 'Internet Everywhere 3G',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'balance-check': {'ussd': '#123#'},
-                                    'balance-top-up': {'ussd': {'#text': '#124*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '208',
-                                                    '@mnc': '01'},
-                                                   {'@mcc': '208',
-                                                    '@mnc': '00'}],
-                                    'voicemail': '888'},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': [{'@value': 'Orange',
-                                             'name': 'via Orange',
-                                             'password': 'orange',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'orange'},
-                                            {'@value': 'orange.acte',
-                                             'mmsc': 'http://mms.orange.fr',
-                                             'mmsproxy': '192.168.10.200:8080',
-                                             'name': 'via Orange',
-                                             'password': 'orange',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'orange'},
-                                            {'@value': 'sl2sfr',
-                                             'name': 'via SFR',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'sl2sfr',
-                                             'mmsc': 'http://mms1',
-                                             'mmsproxy': '10.151.0.1:8080',
-                                             'name': 'via SFR',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '208',
-                                                    '@mnc': '01'},
-                                                   {'@mcc': '208',
-                                                    '@mnc': '10'}],
-                                    'voicemail': '789'},
-                            'name': 'Prixtel'},
-                           {'gsm': {'apn': [{'@value': 'websfr',
-                                             'dns': ['172.20.2.10',
-                                                     '172.20.2.39'],
-                                             'name': 'Web / Prepaid',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'wapsfr',
-                                             'name': 'WAP',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'}},
-                                            {'@value': 'internetpro',
-                                             'name': 'SFR internetpro',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'ipnet',
-                                             'name': 'SFR ipnet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'slsfr',
-                                             'dns': ['172.20.2.10',
-                                                     '172.20.2.39'],
-                                             'name': 'Mobile Broadband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'sl2sfr',
-                                             'name': 'Full Internet (Webphone)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internetneuf',
-                                             'name': 'Internet (Neuf Telecom)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms65',
-                                             'mmsc': 'http://mms65',
-                                             'mmsproxy': '10.143.156.8',
-                                             'name': 'mms65',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'dtmf': '950'},
-                                    'msisdn-query': {'sms': {'#text': '9445',
-                                                             '@text': 'ABCd84367'}},
-                                    'network-id': [{'@mcc': '208',
-                                                    '@mnc': '10'},
-                                                   {'@mcc': '208',
-                                                    '@mnc': '11'}],
-                                    'voicemail': '123'},
-                            'name': 'SFR'},
-                           {'gsm': {'apn': {'@value': 'netgprs.com',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '208',
-                                                   '@mnc': '22'}},
-                            'name': 'Transatel Telecom'},
-                           {'gsm': {'apn': [{'@value': 'ao.fr',
-                                             'password': 'orange',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'orange'},
-                                            {'@value': 'ofnew.fr',
-                                             'name': 'Pay-by-MB',
-                                             'password': 'orange',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'orange'},
-                                            {'@value': 'orange.acte',
-                                             'mmsc': 'http://mms.orange.fr',
-                                             'mmsproxy': '192.168.10.200:8080',
-                                             'name': 'Orange acte',
-                                             'password': 'orange',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'orange'}],
-                                    'network-id': {'@mcc': '208',
-                                                   '@mnc': '01'}},
-                            'name': 'TEN'}]},
-             {'@code': 'gb',
-              'provider': [{'gsm': {'apn': {'@value': 'btmobile.bt.com',
-                                            'password': 'bt',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'bt'},
-                                    'network-id': {'@mcc': '234',
-                                                   '@mnc': '00'}},
-                            'name': 'BT Mobile'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.co.uk',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmuk'},
-                                    'balance-check': {'ussd': '*131#'},
-                                    'balance-top-up': {'ussd': {'#text': '*131*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '234',
-                                                   '@mnc': '26'}},
-                            'name': 'Lycamobile'},
-                           {'gsm': {'apn': [{'@value': 'mobile.o2.co.uk',
-                                             'dns': ['193.113.200.200',
-                                                     '193.113.200.201'],
-                                             'name': 'Contract',
-                                             'password': 'password',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'o2web'},
-                                            {'@value': 'mobile.o2.co.uk',
-                                             'dns': ['193.113.200.200',
-                                                     '193.113.200.201'],
-                                             'name': 'Contract (faster)',
-                                             'password': 'password',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'faster'},
-                                            {'@value': 'payandgo.o2.co.uk',
-                                             'name': 'Pay and Go (Prepaid)',
-                                             'password': 'payandgo',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'payandgo'},
-                                            {'@value': 'idata.o2.co.uk',
-                                             'name': 'iPhone (Contract)',
-                                             'password': 'password',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vertigo'},
-                                            {'@value': 'm-bb.o2.co.uk',
-                                             'dns': ['82.132.254.2',
-                                                     '82.132.254.3'],
-                                             'name': 'Mobile Broadband',
-                                             'password': 'password',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'o2bb'},
-                                            {'@value': 'wap.o2.co.uk',
-                                             'name': 'WAP',
-                                             'password': 'password',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'},
-                                             'username': 'o2wap'}],
-                                    'balance-check': {'dtmf': '4444',
-                                                      'ussd': '*#10#'},
-                                    'network-id': [{'@mcc': '234',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '234',
-                                                    '@mnc': '10'},
-                                                   {'@mcc': '234',
-                                                    '@mnc': '11'}],
-                                    'voicemail': '901'},
-                            'name': 'O2'},
-                           {'gsm': {'apn': [{'@value': 'giffgaff.com',
-                                             'name': 'Mobile Broadband',
-                                             'password': 'password',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'giffgaff'},
-                                            {'@value': 'wap.o2.co.uk',
-                                             'mmsc': 'http://mmsc.mms.o2.co.uk:8002',
-                                             'mmsproxy': '193.113.200.195:8080',
-                                             'name': 'O2 MMS',
-                                             'password': 'password',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'o2wap'}],
-                                    'balance-check': {'ussd': '*100#'},
-                                    'network-id': [{'@mcc': '234',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '234',
-                                                    '@mnc': '10'},
-                                                   {'@mcc': '234',
-                                                    '@mnc': '11'}],
-                                    'voicemail': '443'},
-                            'name': 'giffgaff'},
-                           {'gsm': {'apn': {'@value': 'mobile.talktalk.co.uk',
-                                            'gateway': '212.183.137.12:8799',
-                                            'password': 'wap',
-                                            'username': 'wap'}},
-                            'name': 'TalkTalk'},
-                           {'gsm': {'apn': [{'@value': 'general.t-mobile.uk',
-                                             'dns': ['149.254.201.126',
-                                                     '149.254.192.126'],
-                                             'password': 'mms',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'User'},
-                                            {'@value': 'general.t-mobile.uk',
-                                             'dns': ['149.254.230.7',
-                                                     '149.254.199.126'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'balance-check': {'dtmf': '150',
-                                                      'sms': [{'#text': '150',
-                                                               '@text': 'BA'},
-                                                              {'#text': '150',
-                                                               '@text': 'AL'}]},
-                                    'network-id': {'@mcc': '234', '@mnc': '30'},
-                                    'voicemail': '222'},
-                            'name': 'T-Mobile'},
-                           {'gsm': {'apn': {'@value': 'prepay.tesco-mobile.com',
-                                            'dns': '193.113.200.195',
-                                            'password': 'password',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'tescowap'},
-                                    'network-id': [{'@mcc': '234',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '234',
-                                                    '@mnc': '10'},
-                                                   {'@mcc': '234',
-                                                    '@mnc': '11'}]},
-                            'name': 'Tesco Mobile'},
-                           {'gsm': {'apn': [{'@value': 'vdata',
-                                             'dns': ['196.7.0.138',
-                                                     '196.7.142.132'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'goto.virginmobile.uk',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'user'},
-                                            {'@value': 'orange.acte',
-                                             'mmsc': 'http://mms.orange.fr',
-                                             'mmsproxy': '192.168.10.200:8080',
-                                             'name': 'VM acte GPRS',
-                                             'password': 'orange',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'orange'},
-                                            {'@value': 'vmms',
-                                             'mmsc': 'http://mms.virginmobile.co.za',
-                                             'mmsproxy': '196.31.116.242:8080',
-                                             'name': 'Virgin MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '234',
-                                                    '@mnc': '31'},
-                                                   {'@mcc': '234',
-                                                    '@mnc': '32'}]},
-                            'name': 'Virgin Mobile'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['10.206.65.68',
-                                                     '10.203.65.68'],
-                                             'name': 'Contract',
-                                             'password': 'web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web'},
-                                            {'@value': 'pp.vodafone.co.uk',
-                                             'dns': ['172.29.1.11',
-                                                     '172.29.1.11'],
-                                             'name': 'Prepaid',
-                                             'password': 'web',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web'},
-                                            {'@value': 'ppbundle.internet',
-                                             'dns': ['10.203.129.68',
-                                                     '10.203.129.68'],
-                                             'name': 'TopUp and Go',
-                                             'password': 'web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web'},
-                                            {'@value': 'pp.internet',
-                                             'name': 'TopUp and Go (older 1GB '
-                                                     'SIMs)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'balance-check': {'dtmf': '2345',
-                                                      'ussd': '*#1345#'},
-                                    'msisdn-query': {'ussd': '*#100#'},
-                                    'network-id': {'@mcc': '234', '@mnc': '15'},
-                                    'voicemail': '121'},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': [{'@value': 'asdamobiles.co.uk',
-                                             'password': 'web',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web'},
-                                            {'@value': 'asdamobiles.co.uk',
-                                             'mmsc': 'http://mms.asdamobiles.co.uk/servlets/mms',
-                                             'mmsproxy': '212.183.137.12:8799',
-                                             'name': 'ASDA MMS',
-                                             'password': 'wap',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'wap'}],
-                                    'network-id': {'@mcc': '234',
-                                                   '@mnc': '15'}},
-                            'name': 'Asda Mobile'},
-                           {'gsm': {'apn': [{'@value': '3internet',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'three.co.uk',
-                                             'dns': ['172.30.139.17',
-                                                     '172.31.139.17'],
-                                             'name': 'Handsets',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '234',
-                                                   '@mnc': '20'}},
-                            'name': '3'},
-                           {'gsm': {'apn': [{'@value': 'orangeinternet',
-                                             'dns': ['193.35.133.10',
-                                                     '193.35.134.10'],
-                                             'name': 'Contract',
-                                             'password': 'orange',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'orange'},
-                                            {'@value': 'internetvpn',
-                                             'dns': ['193.35.133.10',
-                                                     '193.35.134.10'],
-                                             'name': 'Contract (with VPN)',
-                                             'password': 'orange',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'orange'},
-                                            {'@value': 'orangewap',
-                                             'dns': ['158.43.192.1',
-                                                     '158.43.128.1'],
-                                             'name': 'Orange WAP',
-                                             'password': 'multimedia',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'},
-                                             'username': 'orange'}],
-                                    'balance-check': {'dtmf': '453'},
-                                    'network-id': [{'@mcc': '234',
-                                                    '@mnc': '33'},
-                                                   {'@mcc': '234',
-                                                    '@mnc': '34'}],
-                                    'voicemail': '123'},
-                            'name': 'Orange'}]},
-             {'@code': 'ge',
-              'provider': {'gsm': {'apn': [{'@value': 'Internet',
-                                            'dns': ['212.72.130.20',
-                                                    '212.72.152.1'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'mms',
-                                            'mmsc': 'http://mms.geocell.com.ge/cmmsc/post',
-                                            'mmsproxy': '10.11.240.7:8080',
-                                            'name': 'Geo MMS',
-                                            'usage': {'@type': 'mms'}}],
-                                   'network-id': {'@mcc': '282', '@mnc': '01'}},
-                           'name': 'Geocell'}},
-             {'@code': 'gg',
-              'provider': [{'gsm': {'apn': {'@value': 'airtel-ci-gprs.com',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '234',
-                                                   '@mnc': '03'}},
-                            'name': 'Airtel-Vodaphone'},
-                           {'gsm': {'apn': [{'@value': 'wap',
-                                             'name': 'WAP',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'}},
-                                            {'@value': 'internet',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mmsc.gprs.cw.com/',
-                                             'mmsproxy': '10.0.3.101:80',
-                                             'name': 'Lifestyle MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '234',
-                                                   '@mnc': '55'}},
-                            'name': 'Sure (Cable & Wireless)'},
-                           {'gsm': {'apn': [{'@value': 'pepper',
-                                             'dns': ['212.9.0.135',
-                                                     '212.9.0.136'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mmsc.surfmail.com/mmsc',
-                                             'mmsproxy': '212.9.19.199:3130',
-                                             'name': 'pepperMMS',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '234',
-                                                   '@mnc': '50'}},
-                            'name': 'Wave Telecom'}]},
-             {'@code': 'gh',
-              'provider': [{'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*124#'},
-                                    'balance-top-up': {'ussd': {'#text': '*125*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '620',
-                                                   '@mnc': '01'}},
-                            'name': 'MTN'},
-                           {'gsm': {'apn': {'@value': 'browse',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*122#'},
-                                    'balance-top-up': {'ussd': {'#text': '*123*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'msisdn-query': {'ussd': '*127#'},
-                                    'network-id': {'@mcc': '620',
-                                                   '@mnc': '02'}},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': {'@value': 'web.tigo.com.gh',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'web'},
-                                    'balance-check': {'ussd': '*820#'},
-                                    'balance-top-up': {'ussd': {'#text': '*842*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '620',
-                                                   '@mnc': '03'}},
-                            'name': 'Tigo'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*133#'},
-                                    'balance-top-up': {'ussd': {'#text': '*134*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '620',
-                                                   '@mnc': '06'}},
-                            'name': 'Airtel'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mmsc.cosmote.gr:8002',
-                                             'mmsproxy': '10.10.10.20:8080',
-                                             'name': 'Cosmote MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*124#'},
-                                    'balance-top-up': {'ussd': {'#text': '*123*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '620',
-                                                   '@mnc': '07'}},
-                            'name': 'GloGhana'},
-                           {'cdma': {'password': 'evdo',
-                                     'username': 'evdo@expresso.com'},
-                            'name': 'Expresso'}]},
-             {'@code': 'gl',
-              'provider': {'gsm': {'apn': {'@value': 'internet',
-                                           'usage': {'@type': 'internet'}}},
-                           'name': 'Tele Greenland A/S'}},
-             {'@code': 'gr',
-              'provider': [{'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'dtmf': '1314',
-                                                      'sms': {'#text': '1314',
-                                                              '@text': 'YP'}},
-                                    'network-id': {'@mcc': '202', '@mnc': '01'},
-                                    'voicemail': '123'},
-                            'name': 'Cosmote'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'Contract',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'web.session',
-                                             'dns': ['213.249.17.10',
-                                                     '213.249.17.11'],
-                                             'name': 'Mobile Broadband On '
-                                                     'Demand',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'balance-check': {'dtmf': '1252',
-                                                      'sms': {'#text': '1252',
-                                                              '@text': 'Y'}},
-                                    'network-id': {'@mcc': '202', '@mnc': '05'},
-                                    'voicemail': '121'},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': [{'@value': 'gint.b-online.gr',
-                                             'password': 'web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web'},
-                                            {'@value': 'q-mms.myq.gr',
-                                             'mmsc': 'http://mms.myq.gr',
-                                             'mmsproxy': '192.168.80.134:8080',
-                                             'name': 'Q-Telecom MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'dtmf': ['1269', '1225'],
-                                                      'sms': [{'#text': '1269',
-                                                               '@text': ''},
-                                                              {'#text': '1225',
-                                                               '@text': ''}]},
-                                    'network-id': [{'@mcc': '202',
-                                                    '@mnc': '09'},
-                                                   {'@mcc': '202',
-                                                    '@mnc': '10'}],
-                                    'voicemail': ['122', '1333']},
-                            'name': 'Wind'}]},
-             {'@code': 'gt',
-              'provider': [{'gsm': {'apn': {'@value': 'internet.ideasclaro',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '704',
-                                                   '@mnc': '01'}},
-                            'name': 'Claro'},
-                           {'gsm': {'apn': [{'@value': 'Wap.tigo.gt',
-                                             'password': 'Wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'Wap'},
-                                            {'@value': 'mms.tigo.gt',
-                                             'mmsc': 'http://mms',
-                                             'mmsproxy': '10.16.17.12:8888',
-                                             'name': 'MMS TIGO',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '704',
-                                                   '@mnc': '02'}},
-                            'name': 'Comcel / Tigo'},
-                           {'gsm': {'apn': {'@value': 'internet.movistar.gt',
-                                            'password': 'movistargt',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'movistargt'},
-                                    'network-id': {'@mcc': '704',
-                                                   '@mnc': '03'}},
-                            'name': 'Movistar'}]},
-             {'@code': 'gn',
-              'provider': [{'gsm': {'apn': {'@value': 'internetogn',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '611',
-                                                   '@mnc': '01'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': {'@value': 'internet.cellcom.com',
-                                            'password': 'cellcom',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'internet'},
-                                    'network-id': {'@mcc': '611',
-                                                   '@mnc': '05'}},
-                            'name': 'Cellcom'}]},
-             {'@code': 'gy',
-              'provider': [{'gsm': {'apn': {'@value': 'wap.cellinkgy.com',
-                                            'password': 'test',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'test'},
-                                    'network-id': {'@mcc': '738',
-                                                   '@mnc': '02'}},
-                            'name': 'GT&T Cellink Plus'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'password': 'web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web'},
-                                            {'@value': 'wap.digicelgy.com',
-                                             'mmsc': 'http://mmc.digicelgy.com/servlets/mms',
-                                             'mmsproxy': '172.20.6.12:8080',
-                                             'name': 'Digicel Guyana MMS',
-                                             'password': 'wap',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'wap'}],
-                                    'network-id': {'@mcc': '738',
-                                                   '@mnc': '01'}},
-                            'name': 'DigiCel'}]},
-             {'@code': 'hk',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['202.84.255.1',
-                                                     '203.116.254.150'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'hkcsl',
-                                             'mmsc': 'http://192.168.58.171:8002',
-                                             'mmsproxy': '192.168.59.51:8080',
-                                             'name': 'CSL MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '454',
-                                                    '@mnc': '00'},
-                                                   {'@mcc': '454',
-                                                    '@mnc': '02'}]},
-                            'name': 'CSL'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'peoples.mms',
-                                             'mmsc': 'http://mms.hk.chinamobile.com/mms',
-                                             'mmsproxy': '172.31.31.36:8080',
-                                             'name': 'CMHK MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '454',
-                                                   '@mnc': '10'}},
-                            'name': 'New World'},
-                           {'gsm': {'apn': [{'@value': 'peoples.net',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'SmarTone-Vodafone',
-                                             'mmsc': 'http://mms.smartone-vodafone.com/server',
-                                             'mmsproxy': '10.9.9.9:8080',
-                                             'name': 'picturemail',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '454',
-                                                   '@mnc': '12'}},
-                            'name': 'China Mobile'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '454',
-                                                   '@mnc': '06'}},
-                            'name': 'SmarTone'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'Sunday (Old)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'pccwdata',
-                                             'name': 'PCCW 2G/GPRS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'pccw',
-                                             'name': 'PCCW 3G',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'pccwmms',
-                                             'mmsc': 'http://mmsc.mms.pccwmobile.com:8002/',
-                                             'mmsproxy': '10.131.2.8:8080',
-                                             'name': 'PCCW MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'pccw',
-                                             'mmsc': 'http://3gmms.pccwmobile.com:8080/was',
-                                             'mmsproxy': '10.140.14.10:8080',
-                                             'name': 'PCCW 3G MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '454',
-                                                    '@mnc': '16'},
-                                                   {'@mcc': '454',
-                                                    '@mnc': '19'}]},
-                            'name': 'PCCW (Sunday)'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '454',
-                                                   '@mnc': '16'}},
-                            'name': 'Sunday'},
-                           {'gsm': {'apn': {'@value': 'web.orangehk.com',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '454',
-                                                   '@mnc': '04'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': [{'@value': 'mobile.three.com.hk',
-                                             'name': '3G',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mobile.lte.three.com.hk',
-                                             'name': '4G LTE',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': [{'@mcc': '454',
-                                                    '@mnc': '03'},
-                                                   {'@mcc': '454',
-                                                    '@mnc': '04'}]},
-                            'name': '3'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.hk',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmhk'},
-                                    'balance-check': {'ussd': '*131#'},
-                                    'balance-top-up': {'ussd': {'#text': '*131*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '454',
-                                                   '@mnc': '23'}},
-                            'name': 'Lycamobile'}]},
-             {'@code': 'hn',
-              'provider': {'gsm': {'apn': {'@value': 'internet.tigo.hn',
-                                           'plan': {'@type': 'postpaid'},
-                                           'usage': {'@type': 'internet'}},
-                                   'network-id': {'@mcc': '708', '@mnc': '02'}},
-                           'name': 'Tigo'}},
-             {'@code': 'hr',
-              'provider': [{'gsm': {'apn': {'@value': 'web.htgprs',
-                                            'dns': '10.12.0.1',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '219',
-                                                   '@mnc': '01'}},
-                            'name': 'T-Mobile'},
-                           {'gsm': {'apn': [{'@value': 'data.vip.hr',
-                                             'name': 'Contract and Prepaid',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'gprs5.vipnet.hr',
-                                             'dns': '195.29.159.15',
-                                             'name': 'GPRS 5',
-                                             'password': '38591',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': '38591'},
-                                            {'@value': 'gprs0.vipnet.hr',
-                                             'dns': '195.29.159.15',
-                                             'name': 'GPRS 0',
-                                             'password': '38591',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': '38591'},
-                                            {'@value': '3g.vip.hr',
-                                             'dns': ['212.91.97.3',
-                                                     '212.91.97.4'],
-                                             'name': '3G',
-                                             'password': '38591',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': '38591'},
-                                            {'@value': 'mms.vipnet.hr',
-                                             'mmsc': 'http://mms.vipnet.hr/servlets/mms',
-                                             'mmsproxy': '212.91.99.91:8080',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '219',
-                                                   '@mnc': '10'}},
-                            'name': 'VIPNET'},
-                           {'gsm': {'apn': {'@value': 'carnet.vip.hr',
-                                            'password': None,
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'AAIEDU'},
-                                    'network-id': {'@mcc': '219',
-                                                   '@mnc': '10'}},
-                            'name': 'CARNet VIPNET'},
-                           {'gsm': {'apn': [{'@value': 'carnet.tele2.hr',
-                                             'password': None,
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'AAIEDU'},
-                                            {'@value': 'internet.tele2.hr',
-                                             'mmsc': 'http://mmsc.tele2.hr',
-                                             'mmsproxy': '193012040066:8080',
-                                             'name': 'Tele2 MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '219',
-                                                   '@mnc': '02'}},
-                            'name': 'CARNet Tele2'},
-                           {'gsm': {'apn': {'@value': 'mobileinternet.tele2.hr',
-                                            'dns': '212.247.156.66',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '219',
-                                                   '@mnc': '02'}},
-                            'name': 'Tele2'}]},
-             {'@code': 'hu',
-              'provider': [{'gsm': {'apn': [{'@value': 'net',
-                                             'dns': ['217.79.128.40',
-                                                     '217.79.128.45'],
-                                             'name': 'mobilinternet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mmsc.pgsm.hu/',
-                                             'mmsproxy': '84.225.255.1:8080',
-                                             'name': 'Pannon MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '216',
-                                                   '@mnc': '01'}},
-                            'name': 'Telenor'},
-                           {'gsm': {'apn': {'@value': 'digi',
-                                            'name': 'DIGI Move',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '216',
-                                                   '@mnc': '01'}},
-                            'name': 'DIGI'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['212.51.115.1',
-                                                     '194.176.224.6'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms-westel',
-                                             'dns': ['212.51.115.1',
-                                                     '194.176.224.3'],
-                                             'name': 'MMS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '216',
-                                                   '@mnc': '30'}},
-                            'name': 'T-Mobile'},
-                           {'gsm': {'apn': [{'@value': 'standardnet.vodafone.net',
-                                             'dns': ['80.244.97.30',
-                                                     '80.244.96.1'],
-                                             'name': 'Előf. Normál',
-                                             'password': 'vodawap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vodawap'},
-                                            {'@value': 'internet.vodafone.net',
-                                             'dns': ['80.244.97.30',
-                                                     '80.244.96.1'],
-                                             'name': 'Előf. töm.',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'vitamax.snet.vodafone.net',
-                                             'dns': ['80.244.97.30',
-                                                     '80.244.96.1'],
-                                             'name': 'Felt. norm.',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'vitamax.internet.vodafone.net',
-                                             'dns': ['80.244.97.30',
-                                                     '80.244.96.1'],
-                                             'name': 'Vodafone (felt. töm.)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '216',
-                                                   '@mnc': '70'}},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': {'@value': 'invitel.mobilnet',
-                                            'name': 'net.and.go',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}}},
-                            'name': 'Invitel'}]},
-             {'@code': 'id',
-              'provider': [{'gsm': {'apn': [{'@value': '3gprs',
-                                             'name': 'GPRS',
-                                             'password': '3gprs',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': '3gprs'},
-                                            {'@value': '3data',
-                                             'name': ['Monthly Internet '
-                                                      'Service',
-                                                      {'#text': 'Layanan '
-                                                                'Internet '
-                                                                'Bulanan',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'id'}],
-                                             'password': '3data',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': '3data'}],
-                                    'network-id': {'@mcc': '510',
-                                                   '@mnc': '89'}},
-                            'name': '3'},
-                           {'gsm': {'apn': [{'@value': 'AXIS',
-                                             'password': '123456',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'axis'},
-                                            {'@value': 'AXISmms',
-                                             'mmsc': 'http://mmsc.axis',
-                                             'mmsproxy': '10.8.3.8:8080',
-                                             'name': 'AXISmms',
-                                             'password': '123456',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'AXIS'}],
-                                    'network-id': {'@mcc': '510',
-                                                   '@mnc': '08'}},
-                            'name': 'AXIS'},
-                           {'cdma': {'name': 'StarOne',
-                                     'password': 'indosat',
-                                     'sid': [{'@value': '10817'},
-                                             {'@value': '10819'}],
-                                     'username': 'starone'},
-                            'gsm': {'apn': [{'@value': 'indosatgprs',
-                                             'name': 'IM3/Mentari Time-based',
-                                             'password': 'indosat@durasi',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'indosat@durasi'},
-                                            {'@value': 'indosatgprs',
-                                             'name': 'IM3/Mentari Volume-based',
-                                             'password': 'indosat',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'indosat'},
-                                            {'@value': 'indosatgprs',
-                                             'name': 'Matrix 3G/3.5G',
-                                             'password': 'indosat',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'indosat'},
-                                            {'@value': 'indosatmms',
-                                             'mmsc': 'http://mmsc.indosat.com',
-                                             'mmsproxy': '10.19.19.19:8080',
-                                             'name': 'IndosatMMS',
-                                             'password': 'indosat',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'indosat'}],
-                                    'network-id': [{'@mcc': '510',
-                                                    '@mnc': '21'},
-                                                   {'@mcc': '510',
-                                                    '@mnc': '01'}]},
-                            'name': 'Indosat'},
-                           {'gsm': {'apn': [{'@value': 'telkomsel',
-                                             'dns': ['202.152.0.2',
-                                                     '202.155.14.251'],
-                                             'password': 'wap123',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'wap'},
-                                            {'@value': 'flash',
-                                             'name': 'Flash Time-based',
-                                             'password': 'bar',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'foo'},
-                                            {'@value': 'internet',
-                                             'name': 'Flash Volume-based',
-                                             'password': 'bar',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'foo'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.telkomsel.com',
-                                             'mmsproxy': '10.1.89.150:8000',
-                                             'name': 'TSEL-MMS',
-                                             'password': 'wap123',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'wap'}],
-                                    'network-id': [{'@mcc': '510',
-                                                    '@mnc': '10'},
-                                                   {'@mcc': '510',
-                                                    '@mnc': '20'}]},
-                            'name': 'Telkomsel'},
-                           {'gsm': {'apn': [{'@value': 'www.xlgprs.net',
-                                             'dns': ['202.152.254.245',
-                                                     '202.152.254.246'],
-                                             'password': 'proxl',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'xlgprs'},
-                                            {'@value': 'www.xlmms.net',
-                                             'mmsc': 'http://mmc.xl.net.id/servlets/mms',
-                                             'mmsproxy': '202.152.240.50:8080',
-                                             'name': 'XL-MMS',
-                                             'password': 'proxl',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'xlgprs'}],
-                                    'network-id': {'@mcc': '510',
-                                                   '@mnc': '11'}},
-                            'name': 'Excelcomindo (XL)'},
-                           {'cdma': {'password': 'smart',
-                                     'sid': {'@value': '10608'},
-                                     'username': 'smart'},
-                            'name': 'SMART'},
-                           {'cdma': {'password': 'ceria',
-                                     'username': 'internet'},
-                            'name': 'Ceria'},
-                           {'cdma': {'password': 'm8',
-                                     'sid': {'@value': '10530'},
-                                     'username': 'm8'},
-                            'name': 'Fren'},
-                           {'cdma': {'password': 'telkom',
-                                     'sid': {'@value': '10496'},
-                                     'username': 'telkomnet@flexi'},
-                            'name': 'Telkom Flexy'},
-                           {'cdma': {'sid': {'@value': '10623'}},
-                            'name': 'Esia'}]},
-             {'@code': 'ie',
-              'provider': [{'gsm': {'apn': {'@value': 'data.lycamobile.ie',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmie'},
-                                    'balance-check': {'ussd': '*131#'},
-                                    'balance-top-up': {'ussd': {'#text': '*131*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '272',
-                                                   '@mnc': '13'}},
-                            'name': 'Lycamobile'},
-                           {'gsm': {'apn': [{'@value': 'open.internet',
-                                             'dns': ['62.40.32.33',
-                                                     '62.40.32.34'],
-                                             'name': 'Contract',
-                                             'password': 'gprs',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'gprs'},
-                                            {'@value': 'pp.internet',
-                                             'dns': ['62.40.32.33',
-                                                     '62.40.32.34'],
-                                             'name': 'Prepaid',
-                                             'password': 'web',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'faster'},
-                                            {'@value': 'internet',
-                                             'name': 'Old Config Internet and '
-                                                     'MMS',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'mmsc': 'http://mmsc.mms.o2.ie:8002',
-                                             'mmsproxy': '62.40.32.40:8080',
-                                             'name': 'O2 MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*#100#'},
-                                    'network-id': {'@mcc': '272',
-                                                   '@mnc': '02'}},
-                            'name': 'O2'},
-                           {'gsm': {'apn': [{'@value': 'hs.vodafone.ie',
-                                             'dns': ['89.19.64.36',
-                                                     '89.19.64.164'],
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vodafone'},
-                                            {'@value': 'isp.vodafone.ie',
-                                             'name': 'Old',
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vodafone'},
-                                            {'@value': 'live.vodafone.com',
-                                             'dns': '10.24.59.100',
-                                             'name': 'Prepaid',
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vodafone'}],
-                                    'msisdn-query': {'sms': {'#text': '50189',
-                                                             '@text': 'MYMSISDN:'}},
-                                    'network-id': {'@mcc': '272',
-                                                   '@mnc': '01'}},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': [{'@value': 'broadband.eircommbb.ie',
-                                             'dns': ['212.129.64.220',
-                                                     '212.129.64.221'],
-                                             'name': 'Broadband To Go',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.mymeteor.ie',
-                                             'mmsc': 'http://mms.mymeteor.ie',
-                                             'mmsproxy': '10.85.85.85:8799',
-                                             'name': 'MMS over GPRS',
-                                             'password': 'wap',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'my'}],
-                                    'network-id': {'@mcc': '272',
-                                                   '@mnc': '03'}},
-                            'name': 'E-Mobile'},
-                           {'gsm': {'apn': [{'@value': 'data.mymeteor.ie',
-                                             'name': 'Meteor Data',
-                                             'password': 'meteor',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'my'},
-                                            {'@value': 'broadband.mymeteor.ie',
-                                             'dns': ['212.129.64.220',
-                                                     '212.129.64.221'],
-                                             'name': 'Broadband To Go',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'isp.mymeteor.ie',
-                                             'name': 'GPRS',
-                                             'password': 'isp',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'my'}],
-                                    'network-id': {'@mcc': '272',
-                                                   '@mnc': '03'}},
-                            'name': 'Meteor'},
-                           {'gsm': {'apn': [{'@value': '3ireland.ie',
-                                             'dns': ['172.31.140.69',
-                                                     '172.30.140.69'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': '3ireland.ie',
-                                             'mmsc': 'http://mms.um.3ireland.ie:10021/mmsc',
-                                             'mmsproxy': 'mms.3ireland.ie:8799',
-                                             'name': '3MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '272',
-                                                   '@mnc': '05'}},
-                            'name': 'Three Ireland'}]},
-             {'@code': 'il',
-              'provider': [{'gsm': {'apn': [{'@value': 'internetg',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.cellcom.co.il',
-                                             'mmsproxy': 'vwapm2.ain.co.il:8080',
-                                             'name': 'Cellcom MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '425',
-                                                   '@mnc': '02'}},
-                            'name': 'CellCom'},
-                           {'gsm': {'apn': {'@value': 'internet.golantelecom.net.il',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '425',
-                                                   '@mnc': '08'}},
-                            'name': 'GolanTelecom'},
-                           {'gsm': {'apn': {'@value': 'hcminternet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '425',
-                                                   '@mnc': '15'}},
-                            'name': 'Home Cellular'},
-                           {'gsm': {'apn': {'@value': 'net.hotm',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '425',
-                                                   '@mnc': '07'}},
-                            'name': 'Hot Mobile'},
-                           {'gsm': {'apn': {'@value': 'uinternet',
-                                            'dns': ['158.43.192.1',
-                                                    '158.43.128.1'],
-                                            'name': '3G Internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '425',
-                                                   '@mnc': '01'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': [{'@value': 'internet.pelephone.net.il',
-                                             'name': '3G',
-                                             'password': 'pcl',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'pcl@3g'},
-                                            {'@value': 'mms.pelephone.net.il',
-                                             'mmsc': 'mmsu.pelephone.net.il',
-                                             'mmsproxy': '10.170.9.54:9093',
-                                             'name': 'Multimedia Pelephone',
-                                             'password': 'pcl',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'pcl@3g'}],
-                                    'network-id': {'@mcc': '425',
-                                                   '@mnc': '03'}},
-                            'name': 'Pelephone'},
-                           {'gsm': {'apn': {'@value': 'internet.rl',
-                                            'password': 'rl',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'rl@3g'},
-                                    'network-id': {'@mcc': '425',
-                                                   '@mnc': '16'}},
-                            'name': 'Rami Levi'},
-                           {'gsm': {'apn': {'@value': 'data.youphone.co.il',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '425',
-                                                   '@mnc': '14'}},
-                            'name': 'YouPhone 3G'}]},
-             {'@code': 'im',
-              'provider': [{'gsm': {'apn': [{'@value': '3gpronto',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.manxpronto.net',
-                                             'mmsc': 'http://mms.manxpronto.net:8002',
-                                             'mmsproxy': '195.10.99.46:80',
-                                             'name': 'Pronto MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '234',
-                                                   '@mnc': '58'}},
-                            'name': 'Manx Telecom'},
-                           {'gsm': {'apn': [{'@value': 'wap',
-                                             'name': 'WAP',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'}},
-                                            {'@value': 'internet',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': [{'@mcc': '234',
-                                                    '@mnc': '36'},
-                                                   {'@mcc': '234',
-                                                    '@mnc': '55'}]},
-                            'name': 'Sure (Cable & Wireless)'}]},
-             {'@code': 'in',
-              'provider': [{'gsm': {'apn': [{'@value': 'aircelweb',
-                                             'name': 'Web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'aircelgprs',
-                                             'name': 'GPRS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'aircelgprs.po',
-                                             'name': 'GPRS (Postpaid)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'aircelgprs.pr',
-                                             'name': 'GPRS (Prepaid)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'aircelmms',
-                                             'mmsc': 'http://172.17.83.67/servlets/mms',
-                                             'mmsproxy': '172.17.83.69:8080',
-                                             'name': 'Aircel MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'aircelmms.po',
-                                             'mmsc': 'http://mmsc/mmrelay.app',
-                                             'mmsproxy': '192.168.35.196:8081',
-                                             'name': 'Aircel MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'aircelmms',
-                                             'mmsc': 'http://mmsc/mmrelay.app',
-                                             'mmsproxy': '192.168.35.196:8081',
-                                             'name': 'Aircel MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '404',
-                                                    '@mnc': '17'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '28'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '29'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '37'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '41'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '42'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '91'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '800'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '801'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '802'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '803'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '804'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '805'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '806'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '807'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '808'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '809'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '810'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '811'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '812'}]},
-                            'name': 'AIRCEL'},
-                           {'gsm': {'apn': {'@value': 'airtelgprs.com',
-                                            'dns': ['202.56.230.5',
-                                                    '202.56.240.5'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': [{'@mcc': '404',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '03'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '06'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '10'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '28'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '31'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '37'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '40'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '41'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '42'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '45'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '49'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '70'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '90'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '92'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '93'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '96'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '97'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '98'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '51'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '52'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '54'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '56'}]},
-                            'name': 'Airtel'},
-                           {'gsm': {'apn': [{'@value': 'www',
-                                             'name': 'Vodafone Connect',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'portalnmms',
-                                             'name': 'Vodafone Live',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '404',
-                                                    '@mnc': '01'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '05'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '11'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '13'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '15'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '20'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '27'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '30'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '43'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '46'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '60'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '84'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '86'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '88'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '66'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '750'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '751'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '752'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '753'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '754'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '755'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '756'}]},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': [{'@value': 'bsnlnet',
-                                             'name': 'New GPRS/3G',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'bsnlwap',
-                                             'name': 'New WAP',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'}},
-                                            {'@value': 'bsnlsouth',
-                                             'name': 'Old South Zone A '
-                                                     '(Karnatka, Andhra '
-                                                     'Pradesh, Chennai, Tamil '
-                                                     'Nadu, Kerala)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'gprssouth.cellone.in',
-                                             'name': 'Old South Zone B '
-                                                     '(Karnatka, Andhra '
-                                                     'Pradesh, Chennai, Tamil '
-                                                     'Nadu, Kerala)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'gprsnorth.cellone.in',
-                                             'name': 'Old North Zone (Haryana, '
-                                                     'Punjab, UP(East), '
-                                                     'UP(West), Himachal '
-                                                     'Pradesh, Rajasthan, '
-                                                     'Jammu & Kashmir)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'gprswest.cellone.in',
-                                             'name': 'Old West Zone '
-                                                     '(Maharashtra, Gujrat, '
-                                                     'Madhya Pradesh, '
-                                                     'Chattishgarh)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'www.e.pr',
-                                             'dns': ['218.248.240.208',
-                                                     '218.248.240.135'],
-                                             'name': 'Old East Zone Prepaid '
-                                                     '(Jharkhand, Bihar, '
-                                                     'Kolkata, West Bengal, '
-                                                     'Orissa, Assam, North '
-                                                     'East, Adman Nicobar)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'www.e.po',
-                                             'dns': ['218.248.240.208',
-                                                     '218.248.240.135'],
-                                             'name': 'Old East Zone Postpaid '
-                                                     '(Jharkhand, Bihar, '
-                                                     'Kolkata, West Bengal, '
-                                                     'Orissa, Assam, North '
-                                                     'East, Adman Nicobar)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'bsnlmms',
-                                             'mmsc': 'http://bsnlmmsc.in:8514',
-                                             'mmsproxy': '10.210.10.11:8080',
-                                             'name': 'BSNL MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '404',
-                                                    '@mnc': '34'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '38'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '51'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '53'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '54'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '55'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '57'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '58'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '59'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '62'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '64'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '66'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '71'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '72'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '73'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '74'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '75'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '76'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '77'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '80'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '81'}]},
-                            'name': 'BSNL/CellOne'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.idea.pl',
-                                             'mmsproxy': '192.168.6.104:8080',
-                                             'name': 'MMS Idea GPRS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'mmsc',
-                                             'mmsc': 'http://10.4.42.21:8002',
-                                             'mmsproxy': '10.4.42.15:8080',
-                                             'name': 'Idea MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '404',
-                                                    '@mnc': '04'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '07'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '12'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '14'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '19'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '22'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '24'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '44'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '56'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '82'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '70'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '799'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '845'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '848'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '850'}]},
-                            'name': 'Idea Cellular'},
-                           {'gsm': {'apn': [{'@value': 'mtnl.net',
-                                             'name': 'Delhi (3G Prepaid / '
-                                                     'Postpaid)',
-                                             'password': 'mtnl123',
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mtnl'},
-                                            {'@value': 'mtnl.net',
-                                             'name': 'Mumbai (3G Prepaid / '
-                                                     'Postpaid)',
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'gprsmtnldel',
-                                             'name': 'Delhi',
-                                             'password': 'mtnl123',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mtnl'},
-                                            {'@value': 'gprsppsmum',
-                                             'name': 'Mumbai (Prepaid)',
-                                             'password': 'mtnl123',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mtnl'},
-                                            {'@value': 'gprsmtnlmum',
-                                             'name': 'Mumbai (Postpaid / Plan '
-                                                     '2)',
-                                             'password': 'mtnl123',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mtnl'},
-                                            {'@value': 'mmsmtnldel',
-                                             'mmsc': 'http://172.16.31.136/mms/',
-                                             'mmsproxy': '172.16.31.136:9401',
-                                             'name': 'MTNL MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '404',
-                                                    '@mnc': '68'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '69'}]},
-                            'name': 'MTNL'},
-                           {'cdma': {'name': 'Reliance Netconnect',
-                                     'sid': [{'@value': '14655'},
-                                             {'@value': '14656'},
-                                             {'@value': '14657'},
-                                             {'@value': '14658'},
-                                             {'@value': '14659'},
-                                             {'@value': '14660'},
-                                             {'@value': '14661'},
-                                             {'@value': '14662'},
-                                             {'@value': '14663'},
-                                             {'@value': '14664'},
-                                             {'@value': '14665'},
-                                             {'@value': '14666'},
-                                             {'@value': '14667'},
-                                             {'@value': '14668'},
-                                             {'@value': '14669'},
-                                             {'@value': '14670'},
-                                             {'@value': '14671'},
-                                             {'@value': '14672'},
-                                             {'@value': '14673'},
-                                             {'@value': '14674'},
-                                             {'@value': '14675'}]},
-                            'gsm': {'apn': [{'@value': 'smartnet',
-                                             'name': 'Smart Net',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'smartwap',
-                                             'name': 'Smart WAP',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'}},
-                                            {'@value': 'rcomnet',
-                                             'name': 'Netconnect (RCOMNET)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://10.239.221.47/mms/',
-                                             'mmsproxy': '10.239.221.7:8080',
-                                             'name': 'RMMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'rcommms',
-                                             'mmsc': 'http://mmsc.rcom.co.in/mms/',
-                                             'mmsproxy': '10.239.221.5:8080',
-                                             'name': 'Reliance MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*111*1*3#'},
-                                    'network-id': [{'@mcc': '404',
-                                                    '@mnc': '09'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '36'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '52'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '83'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '85'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '05'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '10'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '13'}]},
-                            'name': 'Reliance'},
-                           {'gsm': {'apn': [{'@value': 'Simplyenjoy',
-                                             'password': 'spice',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'spice'},
-                                            {'@value': 'simplydownload',
-                                             'name': 'kar',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mmsc',
-                                             'mmsc': 'http://10.4.42.21:8002/',
-                                             'mmsproxy': '10.4.42.15:8080',
-                                             'name': 'Idea MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '404',
-                                                    '@mnc': '14'},
-                                                   {'@mcc': '404',
-                                                    '@mnc': '44'}]},
-                            'name': 'Spice telecom'},
-                           {'gsm': {'apn': [{'@value': 'TATA.DOCOMO.INTERNET',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'TATADOCOMO3G',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'TATA.DOCOMO.MMS',
-                                             'mmsc': 'http://mmsc/',
-                                             'mmsproxy': '10.124.26.94:8799',
-                                             'name': 'TATA DOCOMO MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '405',
-                                                    '@mnc': '025'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '026'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '027'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '029'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '030'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '031'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '032'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '034'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '035'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '036'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '037'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '038'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '039'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '041'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '042'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '043'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '044'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '045'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '046'},
-                                                   {'@mcc': '405',
-                                                    '@mnc': '047'}]},
-                            'name': 'Tata Docomo'},
-                           {'cdma': {'password': 'internet',
-                                     'username': 'internet'},
-                            'name': 'Tata Indicom (Plug2Surf)'},
-                           {'cdma': {'password': 'internet',
-                                     'sid': {'@value': '14836'},
-                                     'username': 'internet'},
-                            'name': 'Tata Indicom (Photon+)'},
-                           {'cdma': {'password': 'mts',
-                                     'sid': [{'@value': '14554'},
-                                             {'@value': '14555'}],
-                                     'username': 'internet@internet.mtsindia.in'},
-                            'name': 'MTS MBlaze'}]},
-             {'@code': 'iq',
-              'provider': [{'cdma': {'password': 'itisaluna',
-                                     'sid': {'@value': '15456'},
-                                     'username': 'itisaluna'},
-                            'name': 'Itisaluna'},
-                           {'cdma': {'password': 'omnea', 'username': 'omnea'},
-                            'name': 'Omnea Telecom'},
-                           {'cdma': {'sid': {'@value': '15470'}},
-                            'name': 'Kalimat Telecom'},
-                           {'gsm': {'apn': {'@value': 'net.korek.com',
-                                            'password': 'korek',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'korek'},
-                                    'network-id': {'@mcc': '418',
-                                                   '@mnc': '40'}},
-                            'name': 'Korek'},
-                           {'gsm': {'apn': [{'@value': 'net.asiacell.com',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mtnirancell',
-                                             'mmsc': 'http://mms:8002',
-                                             'mmsproxy': '10.131.26.138:9200',
-                                             'name': 'Irancell-MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '418',
-                                                   '@mnc': '50'}},
-                            'name': 'Asia Cell'}]},
-             {'@code': 'ir',
-              'provider': [{'gsm': {'apn': {'@value': 'mcinet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '432',
-                                                   '@mnc': '11'}},
-                            'name': 'همراه اول'},
-                           {'gsm': {'apn': {'@value': 'mtnirancell',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '432',
-                                                   '@mnc': '35'}},
-                            'name': 'ایرانسل'}]},
-             {'@code': 'is',
-              'provider': [{'gsm': {'apn': {'@value': 'vmc.gprs.is',
-                                            'dns': ['213.176.128.51',
-                                                    '213.176.128.50'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': [{'@mcc': '274',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '274',
-                                                    '@mnc': '03'}]},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': [{'@value': 'internet.nova.is',
-                                             'dns': ['192.168.190.54',
-                                                     '192.168.190.55'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.nova.is',
-                                             'mmsc': 'http://mmsc.nova.is',
-                                             'mmsproxy': '10.10.2.60:8080',
-                                             'name': 'Nova MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '274',
-                                                   '@mnc': '11'}},
-                            'name': 'Nova'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['194.105.224.1',
-                                                     '212.30.200.200'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.simi.is',
-                                             'mmsc': 'http://mms.simi.is/servlets/mms',
-                                             'mmsproxy': '213.167.138.200:9201',
-                                             'name': 'Siminn MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '274',
-                                                   '@mnc': '01'}},
-                            'name': 'Síminn'}]},
-             {'@code': 'it',
-              'provider': [{'gsm': {'apn': [{'@value': 'mobile.vodafone.it',
-                                             'name': 'Mobile Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'web.omnitel.it',
-                                             'name': 'Vodafone Internet Key',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'web.omnitel.it',
-                                             'dns': ['83.224.70.62',
-                                                     '83.224.70.78'],
-                                             'name': 'Internet Facile (old)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '222',
-                                                   '@mnc': '10'}},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': [{'@value': 'ibox.tim.it',
-                                             'dns': ['217.200.200.42',
-                                                     '213.230.129.10'],
-                                             'name': 'Maxxi Alice/Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'wap.tim.it',
-                                             'dns': ['213.230.155.94',
-                                                     '213.230.130.222'],
-                                             'name': 'WAP',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'},
-                                             'username': 'WAPTIM'}],
-                                    'network-id': {'@mcc': '222',
-                                                   '@mnc': '01'}},
-                            'name': 'TIM'},
-                           {'gsm': {'apn': [{'@value': 'internet.wind',
-                                             'dns': ['193.70.152.25',
-                                                     '193.70.192.25'],
-                                             'name': 'Non-business',
-                                             'password': 'Wind',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'Wind'},
-                                            {'@value': 'internet.wind.biz',
-                                             'dns': ['193.70.152.25',
-                                                     '193.70.192.25'],
-                                             'name': 'Business',
-                                             'password': 'Wind',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'Wind'},
-                                            {'@value': 'mms.wind',
-                                             'mmsc': 'http://mms.wind.it',
-                                             'mmsproxy': '212.245.244.100:8080',
-                                             'name': 'WIND MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '222',
-                                                   '@mnc': '88'}},
-                            'name': 'Wind'},
-                           {'@primary': 'true',
-                            'gsm': {'apn': [{'@value': 'tre.it',
-                                             'dns': ['62.13.169.92',
-                                                     '62.13.169.93'],
-                                             'name': 'Ricaricabile',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'datacard.tre.it',
-                                             'name': 'Abbonamento',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '222',
-                                                   '@mnc': '99'}},
-                            'name': '3'},
-                           {'gsm': {'apn': [{'@value': 'apn.fastweb.it',
-                                             'name': 'Voce/dati',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'datacard.fastweb.it',
-                                             'dns': ['213.140.2.43',
-                                                     '213.140.2.49'],
-                                             'name': 'Solo dati',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'tre.it',
-                                             'mmsc': 'http://10.216.59.240:10021/mmsc',
-                                             'mmsproxy': 'wsb.treumts.it:8799',
-                                             'name': '3 MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '222',
-                                                   '@mnc': '99'}},
-                            'name': 'Fastweb'},
-                           {'gsm': {'apn': [{'@value': 'internet.postemobile.it',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.postemobile.it',
-                                             'mmsc': 'http://mms.postemobile.it/servlets/mms',
-                                             'mmsproxy': '10.128.224.10:80',
-                                             'name': 'PosteMobile MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '222',
-                                                   '@mnc': '10'}},
-                            'name': 'PosteMobile'},
-                           {'gsm': {'apn': {'@value': 'web.coopvoce.it',
-                                            'name': 'Internet Mobile',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '222',
-                                                   '@mnc': '01'}},
-                            'name': 'CoopVoce'},
-                           {'gsm': {'apn': {'@value': 'internet.vistream.it',
-                                            'name': 'Megabip Internet',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '222',
-                                                   '@mnc': '99'}},
-                            'name': 'Bip'},
-                           {'@primary': 'true',
-                            'gsm': {'apn': [{'@value': 'web.noverca.it',
-                                             'name': 'Noverca WEB',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.noverca.it',
-                                             'mmsc': 'http://mms.noverca.it/',
-                                             'mmsproxy': '10.248.1.12:80',
-                                             'name': 'Noverca MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'wap.noverca.it',
-                                             'gateway': '10.248.1.12:80',
-                                             'name': 'Noverca WAP',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'}}],
-                                    'network-id': {'@mcc': '222',
-                                                   '@mnc': '07'}},
-                            'name': 'Nòverca'},
-                           {'gsm': {'apn': {'@value': 'tiscalimobileinternet',
-                                            'name': 'Tiscali Internet',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '222',
-                                                   '@mnc': '01'}},
-                            'name': 'Tiscali'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.it',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmit'},
-                                    'balance-check': {'ussd': '*131#'},
-                                    'balance-top-up': {'ussd': {'#text': '*131*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '222',
-                                                   '@mnc': '35'}},
-                            'name': 'Lycamobile'},
-                           {'gsm': {'apn': [{'@value': 'iliad',
-                                             'name': 'Iliad',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.iliad.it',
-                                             'mmsc': 'http://mms.iliad.it',
-                                             'name': 'Iliad MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '222',
-                                                   '@mnc': '50'}},
-                            'name': 'Iliad'}]},
-             {'@code': 'je',
-              'provider': [{'gsm': {'apn': {'@value': 'airtel-ci-gprs.com',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '234',
-                                                   '@mnc': '03'}},
-                            'name': 'Airtel-Vodaphone'},
-                           {'gsm': {'apn': [{'@value': 'wap',
-                                             'name': 'WAP',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'}},
-                                            {'@value': 'internet',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '234',
-                                                   '@mnc': '55'}},
-                            'name': 'Sure (Cable & Wireless)'},
-                           {'gsm': {'apn': {'@value': 'pepper',
-                                            'dns': ['212.9.0.135',
-                                                    '212.9.0.136'],
-                                            'password': 'abc',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'abc'},
-                                    'network-id': {'@mcc': '234',
-                                                   '@mnc': '50'}},
-                            'name': 'Jersey Telecom'}]},
-             {'@code': 'jm',
-              'provider': [{'gsm': {'apn': {'@value': 'wap',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '338',
-                                                   '@mnc': '020'}},
-                            'name': 'Cable & Wireless'},
-                           {'gsm': {'apn': {'@value': 'web.digiceljamaica.com',
-                                            'dns': ['208.131.176.126',
-                                                    '200.10.152.232'],
-                                            'password': 'wap03jam',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'wapuser'},
-                                    'network-id': {'@mcc': '338',
-                                                   '@mnc': '050'}},
-                            'name': 'Digicel'}]},
-             {'@code': 'jo',
-              'provider': [{'gsm': {'apn': {'@value': 'net.orange.jo',
-                                            'name': 'Mobile Broadband',
-                                            'password': 'net',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'net'},
-                                    'network-id': {'@mcc': '416',
-                                                   '@mnc': '77'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': [{'@value': 'zain',
-                                             'name': 'Mobile Broadband',
-                                             'password': 'Zain',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'Zain'},
-                                            {'@value': 'Zain',
-                                             'mmsc': 'http://10.122.200.12:8002',
-                                             'mmsproxy': '10.122.200.10:8080',
-                                             'name': 'Zain-MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '416',
-                                                   '@mnc': '01'}},
-                            'name': 'Zain'}]},
-             {'@code': 'jp',
-              'provider': [{'gsm': {'apn': {'@value': 'softbank',
-                                            'password': 'softbank',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'ai@softbank'},
-                                    'network-id': [{'@mcc': '440',
-                                                    '@mnc': '04'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '06'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '20'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '40'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '41'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '42'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '43'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '44'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '45'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '46'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '47'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '48'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '90'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '92'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '93'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '94'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '95'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '96'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '97'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '98'}]},
-                            'name': 'Softbank Mobile'},
-                           {'@primary': 'false',
-                            'gsm': {'apn': [{'@value': 'dm.jplat.net',
-                                             'name': 'u300',
-                                             'password': 'bmobile',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'bmobile@u300'},
-                                            {'@value': 'bmobile.ne.jp',
-                                             'name': 'Visitor SIM',
-                                             'password': 'bmobile',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'bmobile@4g'}],
-                                    'network-id': {'@mcc': '440',
-                                                   '@mnc': '10'}},
-                            'name': 'b-mobile'},
-                           {'gsm': {'apn': {'@value': 'emb.ne.jp',
-                                            'password': 'em',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'em'},
-                                    'network-id': {'@mcc': '440',
-                                                   '@mnc': '00'}},
-                            'name': 'e-mobile'},
-                           {'@primary': 'true',
-                            'gsm': {'apn': [{'@value': 'mopera.ne.jp',
-                                             'name': 'mopera',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mopera.net',
-                                             'name': 'mopera U',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': [{'@mcc': '440',
-                                                    '@mnc': '01'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '03'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '09'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '10'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '11'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '12'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '13'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '14'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '15'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '16'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '17'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '18'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '19'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '21'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '22'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '23'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '24'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '25'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '26'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '27'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '28'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '29'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '30'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '31'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '32'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '33'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '34'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '35'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '36'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '37'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '38'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '39'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '49'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '58'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '60'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '61'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '62'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '63'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '64'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '65'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '66'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '67'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '68'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '69'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '87'},
-                                                   {'@mcc': '440',
-                                                    '@mnc': '99'}]},
-                            'name': 'NTTdocomo'},
-                           {'cdma': {'dns': ['210.196.3.183',
-                                             '210.141.112.163'],
-                                     'password': 'au',
-                                     'username': 'au@au-win.ne.jp'},
-                            'name': 'au(KDDI)'}]},
-             {'@code': 'ke',
-              'provider': [{'gsm': {'apn': [{'@value': 'ke.celtel.com',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.yu.co.ke',
-                                             'mmsc': 'http://mms.yu.co.ke',
-                                             'name': 'YU mms',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '639',
-                                                   '@mnc': '03'}},
-                            'name': 'Airtel'},
-                           {'gsm': {'apn': [{'@value': 'safaricom',
-                                             'name': 'Safaricom (Prepaid)',
-                                             'password': 'data',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'saf'},
-                                            {'@value': 'safaricom',
-                                             'password': 'web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web'},
-                                            {'@value': 'mms.safaricom.com',
-                                             'mmsc': 'http://mms.gprs.safaricom.com',
-                                             'mmsproxy': '172.22.2.38:8080',
-                                             'name': 'Safaricom MMS',
-                                             'password': 'data',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'saf'}],
-                                    'balance-check': {'ussd': '*144#'},
-                                    'balance-top-up': {'ussd': {'#text': '*544*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '639',
-                                                   '@mnc': '02'}},
-                            'name': 'Safaricom'},
-                           {'gsm': {'apn': {'@value': 'internet.econet.co.ke',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '639',
-                                                   '@mnc': '05'}},
-                            'name': 'yu (Econet)'},
-                           {'cdma': {'name': 'Orange Fixed Plus'},
-                            'gsm': {'apn': {'@value': 'bew.orange.co.ke',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '639',
-                                                   '@mnc': '07'}},
-                            'name': 'Orange'}]},
-             {'@code': 'kg',
-              'provider': [{'gsm': {'apn': {'@value': 'internet.beeline.kg',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*102#'},
-                                    'network-id': {'@mcc': '437',
-                                                   '@mnc': '01'}},
-                            'name': 'Beeline'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*500#'},
-                                    'network-id': {'@mcc': '437',
-                                                   '@mnc': '05'}},
-                            'name': 'MegaCom'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*100#'},
-                                    'network-id': {'@mcc': '437',
-                                                   '@mnc': '09'}},
-                            'name': 'O!'}]},
-             {'@code': 'kh',
-              'provider': [{'gsm': {'apn': [{'@value': 'cellcard',
-                                             'password': 'mobitel',
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mobitel'},
-                                            {'@value': 'internet',
-                                             'mmsc': 'http://mms.mobitel.si/servlets/mms',
-                                             'mmsproxy': '213.229.249.40:8080',
-                                             'name': 'Mobitel MMS',
-                                             'password': 'internet',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mobitel'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.mobitel.com.kh/mmsc',
-                                             'mmsproxy': '203.144.95.98:3130',
-                                             'name': 'GPRS MMS',
-                                             'password': 'mobitel',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mobitel'}],
-                                    'balance-check': {'ussd': '#124#'},
-                                    'network-id': {'@mcc': '456',
-                                                   '@mnc': '01'}},
-                            'name': 'Cellcard'},
-                           {'gsm': {'apn': [{'@value': 'hellowww',
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'hellomms',
-                                             'mmsc': 'http://mms.iq2mobile.com',
-                                             'mmsproxy': '192.168.205.20:8088',
-                                             'name': 'Hellow MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*100#'},
-                                    'network-id': {'@mcc': '456',
-                                                   '@mnc': '02'}},
-                            'name': 'Hello'},
-                           {'gsm': {'apn': {'@value': 'WAP',
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '#132#'},
-                                    'network-id': {'@mcc': '456',
-                                                   '@mnc': '04'}},
-                            'name': 'qb'},
-                           {'gsm': {'apn': {'@value': 'smart',
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*888#'},
-                                    'network-id': {'@mcc': '456',
-                                                   '@mnc': '06'}},
-                            'name': 'Smart Mobile'},
-                           {'gsm': {'apn': {'@value': 'metfone',
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*097#'},
-                                    'network-id': {'@mcc': '456',
-                                                   '@mnc': '08'}},
-                            'name': 'Metfone'},
-                           {'gsm': {'apn': {'@value': 'gprs.beeline.com.kh',
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*102#'},
-                                    'network-id': {'@mcc': '456',
-                                                   '@mnc': '09'}},
-                            'name': 'Beeline'},
-                           {'cdma': None, 'name': 'Excell'},
-                           {'gsm': {'apn': {'@value': 'Mfone',
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*222#'},
-                                    'network-id': {'@mcc': '456',
-                                                   '@mnc': '18'}},
-                            'name': 'Mfone'}]},
-             {'@code': 'kr',
-              'provider': [{'gsm': {'apn': [{'@value': 'alwayson.ktfwing.com',
-                                             'name': 'KT 3G',
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'lte.ktfwing.com',
-                                             'name': 'KT LTE',
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'lte.ktfwing.com',
-                                             'mmsc': 'http://mmsc.ktfwing.com:9082',
-                                             'name': 'KT MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '450',
-                                                   '@mnc': '08'}},
-                            'name': 'KT'},
-                           {'cdma': None,
-                            'gsm': {'apn': [{'@value': 'internet.lguplus.co.kr',
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.lguplus.co.kr',
-                                             'mmsc': 'http://omammsc.uplus.co.kr:9084',
-                                             'name': 'LG U+ MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '450',
-                                                   '@mnc': '06'}},
-                            'name': 'LG U+'},
-                           {'cdma': {'username': 'sktelecom'},
-                            'gsm': {'apn': [{'@value': 'web.sktelecom.com',
-                                             'name': 'SKT 3G',
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'lte.sktelecom.com',
-                                             'name': 'SKT LTE',
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'lte.sktelecom.com',
-                                             'mmsc': 'http://omms.nate.com:9082/oma_mms',
-                                             'mmsproxy': 'smart.nate.com:9093',
-                                             'name': 'SKT MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '450',
-                                                   '@mnc': '05'}},
-                            'name': 'SK Telecom'}]},
-             {'@code': 'kw',
-              'provider': [{'gsm': {'apn': [{'@value': 'pps',
-                                             'name': 'Personal',
-                                             'password': 'pps',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'pps'},
-                                            {'@value': 'apn01',
-                                             'name': 'Corporate',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '419',
-                                                   '@mnc': '02'}},
-                            'name': 'Zain'},
-                           {'gsm': {'apn': [{'@value': 'action.wataniya.com',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.wataniya.com',
-                                             'mmsc': 'http://action.wataniya.com',
-                                             'mmsproxy': '194.126.53.64:8080',
-                                             'name': 'MMS Action',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '419',
-                                                   '@mnc': '03'}},
-                            'name': 'Wataniya'},
-                           {'gsm': {'apn': [{'@value': 'viva',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'viva',
-                                             'mmsc': 'http://172.16.128.80:38090/was',
-                                             'mmsproxy': '172.16.128.228:8080',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '419',
-                                                   '@mnc': '04'}},
-                            'name': 'Viva'}]},
-             {'@code': 'kz',
-              'provider': [{'gsm': {'apn': {'@value': 'internet.beeline.kz',
-                                            'dns': ['212.19.149.53',
-                                                    '194.226.128.1'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': '@internet.beeline'},
-                                    'network-id': {'@mcc': '401',
-                                                   '@mnc': '01'}},
-                            'name': 'Beeline'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://192.168.75.10:6001/MM1Servlet',
-                                             'mmsproxy': '195.47.255.15:8080',
-                                             'name': 'kcell mms',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '401',
-                                                   '@mnc': '02'}},
-                            'name': "K'CELL"},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '401',
-                                                   '@mnc': '02'}},
-                            'name': 'Activ'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '401',
-                                                   '@mnc': '77'}},
-                            'name': 'Tele2'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '401',
-                                                   '@mnc': '77'}},
-                            'name': 'Altel 4G'}]},
-             {'@code': 'la',
-              'provider': [{'gsm': {'apn': {'@value': 'etlnet',
-                                            'dns': '192.168.4.130',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '457',
-                                                   '@mnc': '02'}},
-                            'name': 'ETL'},
-                           {'gsm': {'apn': {'@value': 'ltcnet',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*122#'},
-                                    'network-id': {'@mcc': '457',
-                                                   '@mnc': '01'}},
-                            'name': 'Lao Telecom'},
-                           {'gsm': {'apn': [{'@value': 'startelecom',
-                                             'name': 'Unitel (2G)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'unitel3g',
-                                             'name': 'Unitel (3G)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '457',
-                                                   '@mnc': '03'}},
-                            'name': 'Unitel'},
-                           {'gsm': {'apn': {'@value': 'beelinenet',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '457',
-                                                   '@mnc': '08'}},
-                            'name': 'Beeline (Tigo)'}]},
-             {'@code': 'lb',
-              'provider': {'gsm': {'apn': [{'@value': 'gprs.mtctouch.com.lb',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'mms.mtctouch.com.lb',
-                                            'mmsc': 'http://mms:8088/mms/',
-                                            'mmsproxy': '192.168.4.103:8080',
-                                            'name': 'mtctouch MMS',
-                                            'usage': {'@type': 'mms'},
-                                            'username': 'mtctouch'}],
-                                   'network-id': {'@mcc': '415', '@mnc': '03'}},
-                           'name': 'MTC Touch'}},
-             {'@code': 'li',
-              'provider': {'gsm': {'apn': {'@value': 'datamobile.ag',
-                                           'plan': {'@type': 'postpaid'},
-                                           'usage': {'@type': 'internet'}},
-                                   'network-id': {'@mcc': '295', '@mnc': '05'}},
-                           'name': 'Datamobile'}},
-             {'@code': 'lc',
-              'provider': {'gsm': {'apn': [{'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'multimedia',
-                                            'mmsc': 'http://mmsc',
-                                            'mmsproxy': '10.20.5.34:8799',
-                                            'name': 'MMS Postpaid',
-                                            'usage': {'@type': 'mms'}}],
-                                   'network-id': {'@mcc': '358',
-                                                  '@mnc': '110'}},
-                           'name': 'Cable & Wireless'}},
-             {'@code': 'lk',
-              'provider': [{'gsm': {'apn': {'@value': 'www.wap.airtel.lk',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '413',
-                                                   '@mnc': '05'}},
-                            'name': 'Airtel'},
-                           {'gsm': {'apn': [{'@value': 'www.dialogsl.com',
-                                             'name': 'Postpaid',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'ppinternet',
-                                             'name': 'Prepaid',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'dialogbb',
-                                             'name': 'Unlimited Broadband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'kitbb.com',
-                                             'name': 'Prepaid (Kitbb)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'www.dialogsl.com',
-                                             'mmsc': 'http://192.168.122.130:3130/mmsc',
-                                             'mmsproxy': '192.168.122.2:8080',
-                                             'name': 'Dialog - Go MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'ppwap',
-                                             'mmsc': 'http://mms.dialog.lk:3130/mmsc',
-                                             'mmsproxy': '192.168.122.2:8080',
-                                             'name': 'Go MMS for KIT',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '413',
-                                                   '@mnc': '02'}},
-                            'name': 'Dialog GSM'},
-                           {'gsm': {'apn': {'@value': 'htwap',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '413',
-                                                   '@mnc': '08'}},
-                            'name': 'Hutch'},
-                           {'gsm': {'apn': {'@value': 'isp',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '413',
-                                                   '@mnc': '01'}},
-                            'name': 'Mobitel'},
-                           {'gsm': {'apn': {'@value': 'wap',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '413',
-                                                   '@mnc': '03'}},
-                            'name': 'Tigo'}]},
-             {'@code': 'ls',
-              'provider': {'gsm': {'apn': {'@value': 'internet',
-                                           'plan': {'@type': 'postpaid'},
-                                           'usage': {'@type': 'internet'}},
-                                   'network-id': {'@mcc': '651', '@mnc': '01'}},
-                           'name': 'Vodacom Lesotho'}},
-             {'@code': 'lt',
-              'provider': [{'gsm': {'apn': [{'@value': 'banga',
-                                             'dns': ['213.226.131.131',
-                                                     '193.219.88.36'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mmsc/servlets/mms',
-                                             'mmsproxy': '192.168.150.2:8080',
-                                             'name': 'BITE mms',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms@mms'}],
-                                    'network-id': {'@mcc': '246',
-                                                   '@mnc': '02'}},
-                            'name': 'Bite'},
-                           {'gsm': {'apn': [{'@value': 'internet.tele2.lt',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.tele2.lt',
-                                             'mmsc': 'http://mmsc.tele2.lt',
-                                             'mmsproxy': '193.12.40.29:8080',
-                                             'name': 'Tele2 MMS',
-                                             'password': 'wap',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'wap'},
-                                            {'@value': 'mms.tele2.lv',
-                                             'mmsc': 'http://mmsc.tele2.lv',
-                                             'mmsproxy': '193.12.40.38:8080',
-                                             'name': 'Tele2 MMS',
-                                             'password': 'wap',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'wap'}],
-                                    'network-id': {'@mcc': '246',
-                                                   '@mnc': '03'}},
-                            'name': 'TELE2 GPRS'},
-                           {'gsm': {'apn': [{'@value': 'gprs.omnitel.net',
-                                             'dns': ['194.176.32.129',
-                                                     '195.22.175.1'],
-                                             'name': 'Contract',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'gprs.startas.lt',
-                                             'dns': ['194.176.32.129',
-                                                     '195.22.175.1'],
-                                             'name': 'No contract',
-                                             'password': 'omni',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'omni'},
-                                            {'@value': 'gprs.mms.lt',
-                                             'mmsc': 'http://mms.omnitel.net:8002/',
-                                             'mmsproxy': '194.176.32.149:8080',
-                                             'name': 'Omnitel MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '246',
-                                                   '@mnc': '01'}},
-                            'name': 'Omnitel (contract)'}]},
-             {'@code': 'lu',
-              'provider': [{'gsm': {'apn': [{'@value': 'web.pt.lu',
-                                             'dns': ['194.154.192.101',
-                                                     '194.154.192.102'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.pt.lu',
-                                             'mmsc': 'http://mmsc.pt.lu',
-                                             'mmsproxy': '194.154.192.88:8080',
-                                             'name': 'Luxgsm MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '270',
-                                                   '@mnc': '01'}},
-                            'name': 'LUXGSM'},
-                           {'gsm': {'apn': [{'@value': 'hspa',
-                                             'name': 'hspa',
-                                             'password': 'tango',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'tango'},
-                                            {'@value': 'internet',
-                                             'dns': ['212.66.70.3',
-                                                     '212.66.75.7'],
-                                             'name': 'internet',
-                                             'password': 'tango',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'tango'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.tango.lu/',
-                                             'mmsproxy': '212.66.75.3:8080',
-                                             'name': 'Tango MMS',
-                                             'password': 'tango',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'tango'},
-                                            {'@value': 'mms.li',
-                                             'mmsc': 'mms.tele2.li',
-                                             'mmsproxy': '212.66.75.9:8080',
-                                             'name': 'Tango MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '270',
-                                                   '@mnc': '77'}},
-                            'name': 'Tango'},
-                           {'gsm': {'apn': {'@value': 'orange.lu',
-                                            'dns': ['85.94.224.1',
-                                                    '85.94.224.2'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '270',
-                                                   '@mnc': '99'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': [{'@value': 'vox.lu',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'vox.lu',
-                                             'mmsc': 'http://mms.vox.lu',
-                                             'mmsproxy': 'proxy.vox.lu:8080',
-                                             'name': 'VOX mms GPRS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '270',
-                                                   '@mnc': '99'}},
-                            'name': 'VOXmobile'}]},
-             {'@code': 'lv',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet.lmt.lv',
-                                             'dns': ['212.93.96.2',
-                                                     '212.93.96.4'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'open.lmt.lv',
-                                             'name': 'O!Karte internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'okarte.lmt.lv',
-                                             'name': 'O!Karte',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.lmt.lv',
-                                             'mmsc': 'http://mmsc.lmt.lv/mmsc',
-                                             'name': 'LMT MMS',
-                                             'password': 'lmt',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'lmt'}],
-                                    'network-id': {'@mcc': '247',
-                                                   '@mnc': '01'}},
-                            'name': 'LMT'},
-                           {'gsm': {'apn': [{'@value': 'internet.tele2.lv',
-                                             'name': 'Regular',
-                                             'password': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'gprs'},
-                                            {'@value': 'mobileinternet.tele2.lv',
-                                             'name': 'Mobile Internet',
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'wap'},
-                                            {'@value': 'data.tele2.lv',
-                                             'name': 'Zelta Zivtina',
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'wap'}],
-                                    'network-id': {'@mcc': '247',
-                                                   '@mnc': '02'}},
-                            'name': 'Tele2'},
-                           {'gsm': {'apn': [{'@value': 'wap',
-                                             'name': 'Bite plus',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'name': 'Prepaid/Contract',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '247',
-                                                   '@mnc': '05'}},
-                            'name': 'Bite'}]},
-             {'@code': 'ma',
-              'provider': [{'gsm': {'apn': [{'@value': 'www.iamgprs1.ma',
-                                             'name': 'Abonnement',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'www.iamgprs2.ma',
-                                             'name': 'Pre-payé',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'Mmsiam',
-                                             'mmsc': 'http://mms:8002/',
-                                             'mmsproxy': '10.16.35.50:8080',
-                                             'name': 'MMSIAM',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '604',
-                                                   '@mnc': '01'}},
-                            'name': 'Ittissalat Al Maghrib (IAM)'},
-                           {'gsm': {'apn': [{'@value': 'internet1.meditel.ma',
-                                             'name': 'Abonnement',
-                                             'password': 'MEDINET',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'MEDINET'},
-                                            {'@value': 'internet2.meditel.ma',
-                                             'name': 'Pre-payé',
-                                             'password': 'MEDINET',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'MEDINET'},
-                                            {'@value': 'mms.meditel.ma',
-                                             'mmsc': 'http://mms.meditel.ma:8088/mms',
-                                             'mmsproxy': '10.8.8.9:8080',
-                                             'name': 'GPRS MMS',
-                                             'password': 'MEDIMMS',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'MEDIMMS'}],
-                                    'network-id': {'@mcc': '604',
-                                                   '@mnc': '00'}},
-                            'name': 'Medi Telecom'},
-                           {'gsm': {'apn': [{'@value': 'www.wana.ma',
-                                             'name': 'INWI',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.wana.ma',
-                                             'mmsc': 'http://mms.wana.ma:38090',
-                                             'mmsproxy': '10.86.0.10:8080',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '604',
-                                                   '@mnc': '02'}},
-                            'name': 'WANA'}]},
-             {'@code': 'md',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'Internet',
-                                             'password': 'gprs',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'gprs'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.moldcell.md/cmmsc/post',
-                                             'mmsproxy': '10.0.10.10:9401',
-                                             'name': 'Moldcell MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '259',
-                                                   '@mnc': '02'}},
-                            'name': 'Moldcell'},
-                           {'gsm': {'apn': [{'@value': 'internet.unite.md',
-                                             'name': 'Internet cu abonament',
-                                             'password': 'gprs',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'gprs'},
-                                            {'@value': 'internet3g.unite.md',
-                                             'name': 'Internet fără abonament',
-                                             'password': 'gprs',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'gprs'}],
-                                    'network-id': {'@mcc': '259',
-                                                   '@mnc': '05'}},
-                            'name': 'Unité'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'name': 'Internet',
-                                            'password': 'gprs',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'gprs'},
-                                    'network-id': {'@mcc': '259',
-                                                   '@mnc': '01'}},
-                            'name': 'Orange'}]},
-             {'@code': 'me',
-              'provider': [{'gsm': {'apn': [{'@value': 'gprs.promonte.com',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.promonte.com',
-                                             'mmsc': 'http://mm.vor.promonte.com',
-                                             'mmsproxy': '192.168.246.5:8080',
-                                             'name': 'ProMMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '297',
-                                                   '@mnc': '01'}},
-                            'name': 'ProMonte GSM'},
-                           {'gsm': {'apn': [{'@value': 'tmcg-data',
-                                             'name': 'Mobile Broadband',
-                                             'password': '38267',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': '38267'},
-                                            {'@value': 'tmcg-nw',
-                                             'name': 'GPRS',
-                                             'password': '38267',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': '38267'},
-                                            {'@value': 'internet-postpaid',
-                                             'name': 'Postpaid (old)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet-prepaid',
-                                             'name': 'Prepaid (old)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '297',
-                                                   '@mnc': '02'}},
-                            'name': 'T-Mobile'},
-                           {'gsm': {'apn': [{'@value': 'gprsinternet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mtelmms',
-                                             'mmsc': 'http://mmsmtel.com/mms/wapenc',
-                                             'mmsproxy': '172.17.85.131:8080',
-                                             'name': 'mtelmms',
-                                             'password': '068',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '297',
-                                                   '@mnc': '03'}},
-                            'name': 'm:tel'}]},
-             {'@code': 'mg',
-              'provider': [{'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '646',
-                                                   '@mnc': '01'}},
-                            'name': 'Airtel'},
-                           {'gsm': {'apn': {'@value': 'orangeworld',
-                                            'password': 'orange',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'world'},
-                                    'network-id': {'@mcc': '646',
-                                                   '@mnc': '02'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '646',
-                                                   '@mnc': '04'}},
-                            'name': 'Telma'}]},
-             {'@code': 'ml',
-              'provider': [{'cdma': {'name': 'Internet Mobile+',
-                                     'password': 'card',
-                                     'username': 'card'},
-                            'gsm': {'apn': {'@value': 'web.malitel3.ml',
-                                            'name': '3G+',
-                                            'password': 'internet',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'internet'},
-                                    'network-id': {'@mcc': '610',
-                                                   '@mnc': '01'}},
-                            'name': 'Malitel'},
-                           {'gsm': {'apn': [{'@value': 'iew',
-                                             'name': 'Internet Every Where',
-                                             'password': 'iew',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'iew'},
-                                            {'@value': 'internet',
-                                             'name': 'Internet',
-                                             'password': 'internet',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internet'}],
-                                    'network-id': {'@mcc': '610',
-                                                   '@mnc': '02'}},
-                            'name': 'Orange'}]},
-             {'@code': 'mm',
-              'provider': [{'gsm': {'apn': {'@value': 'mptnet',
-                                            'name': 'MPTNET',
-                                            'password': 'mptnet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'mptnet'},
-                                    'network-id': {'@mcc': '414',
-                                                   '@mnc': '01'}},
-                            'name': 'MPT'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'name': 'Telenor',
-                                            'password': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'internet'},
-                                    'network-id': {'@mcc': '414',
-                                                   '@mnc': '06'}},
-                            'name': 'Telenor'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'name': 'Ooredoo',
-                                            'password': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'internet'},
-                                    'network-id': {'@mcc': '414',
-                                                   '@mnc': '05'}},
-                            'name': 'Ooredoo'}]},
-             {'@code': 'mn',
-              'provider': {'gsm': {'apn': [{'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'mms',
-                                            'mmsc': 'http://mms',
-                                            'mmsproxy': '10.10.10.10:8080',
-                                            'name': 'MMS MobiCom',
-                                            'usage': {'@type': 'mms'}}],
-                                   'network-id': {'@mcc': '428', '@mnc': '99'}},
-                           'name': 'MobiCom'}},
-             {'@code': 'mo',
-              'provider': [{'gsm': {'apn': [{'@value': 'web.hutchisonmacau.com',
-                                             'password': '1234',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'hutchison'},
-                                            {'@value': 'mms.hutchisonmacau.com',
-                                             'mmsc': 'http://10.30.15.51:10021/mmsc',
-                                             'mmsproxy': '10.30.15.53:8080',
-                                             'name': 'HutchisonMMS',
-                                             'password': '1234',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'hutchison'}],
-                                    'network-id': [{'@mcc': '455',
-                                                    '@mnc': '03'},
-                                                   {'@mcc': '455',
-                                                    '@mnc': '05'}]},
-                            'name': '3 / Hutchison'},
-                           {'gsm': {'apn': [{'@value': 'ctm-mobile',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'ctmmms',
-                                             'mmsc': 'http://mms.wap.ctm.net:8002',
-                                             'mmsproxy': '192.168.99.3:8080',
-                                             'name': 'CTMMMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '455',
-                                                    '@mnc': '01'},
-                                                   {'@mcc': '455',
-                                                    '@mnc': '04'}]},
-                            'name': 'CTM'},
-                           {'cdma': None, 'name': 'China Telecom'}]},
-             {'@code': 'mk',
-              'provider': [{'gsm': {'apn': {'@value': 'internet',
-                                            'password': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'internet'},
-                                    'network-id': {'@mcc': '294',
-                                                   '@mnc': '01'}},
-                            'name': 'T-Mobile'},
-                           {'gsm': {'apn': [{'@value': 'datacard',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://195.167.65.220:8002',
-                                             'mmsproxy': '10.10.10.20:8080',
-                                             'name': 'Cosmofon MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '294',
-                                                   '@mnc': '02'}},
-                            'name': 'One'},
-                           {'gsm': {'apn': {'@value': 'vipoperator',
-                                            'password': 'vipoperator',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'vipoperator'},
-                                    'network-id': {'@mcc': '294',
-                                                   '@mnc': '03'}},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.mk',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmde'},
-                                    'balance-check': {'ussd': '*122#'},
-                                    'balance-top-up': {'ussd': {'#text': '*122*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '294',
-                                                   '@mnc': '04'}},
-                            'name': 'Lycamobile'}]},
-             {'@code': 'mt',
-              'provider': [{'gsm': {'apn': [{'@value': 'gosurfing',
-                                             'name': 'Postpaid',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'rtgsurfing',
-                                             'name': 'Prepaid',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'gomms',
-                                             'mmsc': 'http://mmsc',
-                                             'mmsproxy': '10.20.20.129:8080',
-                                             'name': 'go mms',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '278',
-                                                   '@mnc': '21'}},
-                            'name': 'GO Mobile'},
-                           {'gsm': {'apn': {'@value': 'web.melita',
-                                            'name': 'Melita Connector',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'sms': {'#text': '16877',
-                                                              '@text': 'melita'}},
-                                    'network-id': {'@mcc': '278',
-                                                   '@mnc': '77'}},
-                            'name': 'Melita'},
-                           {'gsm': {'apn': {'@value': 'Internet',
-                                            'dns': ['80.85.96.131',
-                                                    '80.85.97.70'],
-                                            'password': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'internet'},
-                                    'network-id': {'@mcc': '278',
-                                                   '@mnc': '01'}},
-                            'name': 'Vodafone'}]},
-             {'@code': 'mu',
-              'provider': {'gsm': {'apn': {'@value': 'WEB',
-                                           'plan': {'@type': 'postpaid'},
-                                           'usage': {'@type': 'internet'}},
-                                   'network-id': {'@mcc': '617', '@mnc': '10'}},
-                           'name': 'Emtel'}},
-             {'@code': 'mv',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet.dhimobile',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.dhimobile',
-                                             'mmsc': 'http://mmsc.dhimobile.com.mv',
-                                             'mmsproxy': '172.24.97.4:8080',
-                                             'name': 'DhiMMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '472',
-                                                   '@mnc': '01'}},
-                            'name': 'Dhiraagu'},
-                           {'gsm': {'apn': {'@value': 'WataniyaNet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '472',
-                                                   '@mnc': '02'}},
-                            'name': 'Wataniya'}]},
-             {'@code': 'mw',
-              'provider': [{'gsm': {'apn': {'@value': 'internet',
-                                            'name': 'All plans',
-                                            'plan': [{'@type': 'prepaid'},
-                                                     {'@type': 'postpaid'}],
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*137#'},
-                                    'balance-top-up': {'ussd': {'#text': '*136*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '650',
-                                                   '@mnc': '10'}},
-                            'name': 'Airtel MW'},
-                           {'gsm': {'apn': {'@value': 'Internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '650',
-                                                   '@mnc': '01'}},
-                            'name': 'TNM'}]},
-             {'@code': 'mx',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet.itelcel.com',
-                                             'password': 'webgprs2002',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'webgprs'},
-                                            {'@value': 'mms.itelcel.com',
-                                             'mmsc': 'http://mms.itelcel.com/servlets/mms',
-                                             'mmsproxy': '148.233.151.240:8080',
-                                             'name': 'Mensajes Multimedia',
-                                             'password': 'mmsgprs2003',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mmsgprs'}],
-                                    'balance-check': {'dtmf': '*333'},
-                                    'network-id': {'@mcc': '334', '@mnc': '02'},
-                                    'voicemail': '*86'},
-                            'name': 'Telcel'},
-                           {'gsm': {'apn': {'@value': 'internet.movistar.mx',
-                                            'password': 'movistar',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'movistar'},
-                                    'balance-check': {'dtmf': '*133#'},
-                                    'network-id': {'@mcc': '334', '@mnc': '03'},
-                                    'voicemail': '*86'},
-                            'name': 'Movistar'},
-                           {'cdma': None, 'name': 'Iusacell'}]},
-             {'@code': 'my',
-              'provider': [{'gsm': {'apn': [{'@value': 'diginet',
-                                             'dns': ['203.92.128.131',
-                                                     '203.92.128.132'],
-                                             'name': 'Mobile Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': '3gdgnet',
-                                             'name': 'Broadband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'digimms',
-                                             'mmsc': 'http://mms.digi.com.my/servlets/mms',
-                                             'mmsproxy': '203.92.128.160:80',
-                                             'name': 'DiGi MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '502',
-                                                   '@mnc': '16'}},
-                            'name': 'DiGi'},
-                           {'gsm': {'apn': [{'@value': 'maxisbb',
-                                             'name': 'Broadband',
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'maxis'},
-                                            {'@value': 'net',
-                                             'name': 'GPRS',
-                                             'password': 'net',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'maxis'},
-                                            {'@value': 'unet',
-                                             'dns': ['10.213.17.1',
-                                                     '10.213.17.2'],
-                                             'name': '3G (handsets)',
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'maxis'},
-                                            {'@value': 'unet',
-                                             'mmsc': 'http://172.16.74.100:10021/mmsc',
-                                             'mmsproxy': '202.75.133.49:80',
-                                             'name': 'Maxis 3G MMS',
-                                             'password': 'wap',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'maxis'}],
-                                    'network-id': [{'@mcc': '502',
-                                                    '@mnc': '12'},
-                                                   {'@mcc': '502',
-                                                    '@mnc': '17'}]},
-                            'name': 'Maxis'},
-                           {'gsm': {'apn': [{'@value': 'celcom.net.my',
-                                             'name': 'GPRS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'celcom3g',
-                                             'name': 'Celcom 3G',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'celcom3g',
-                                             'mmsc': 'http://mms.celcom.net.my',
-                                             'mmsproxy': '10.128.1.242:8080',
-                                             'name': 'Celcom 3G MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '502',
-                                                    '@mnc': '13'},
-                                                   {'@mcc': '502',
-                                                    '@mnc': '19'}]},
-                            'name': 'Celcom'}]},
-             {'@code': 'mz',
-              'provider': [{'gsm': {'apn': [{'@value': 'isp.mcel.mz',
-                                             'dns': ['212.96.24.2',
-                                                     '212.96.24.1'],
-                                             'password': 'guest',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'guest'},
-                                            {'@value': 'mms.mcel.mz',
-                                             'mmsc': 'http://mcelmms',
-                                             'mmsproxy': '10.1.4.35:8080',
-                                             'name': 'mCel MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '643',
-                                                   '@mnc': '01'}},
-                            'name': 'MCel'},
-                           {'gsm': {'apn': {'@value': 'default',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '643',
-                                                   '@mnc': '03'}},
-                            'name': 'Movitel'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'name': 'Contract / Prepaid',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '643',
-                                                   '@mnc': '04'}},
-                            'name': 'Vodacom'}]},
-             {'@code': 'na',
-              'provider': [{'gsm': {'apn': [{'@value': 'ppsinternet',
-                                             'name': 'Tango',
-                                             'password': 'ppsuser',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'ppsuser'},
-                                            {'@value': 'internet',
-                                             'name': 'Contract',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '649',
-                                                   '@mnc': '01'}},
-                            'name': 'MTC'},
-                           {'cdma': {'name': 'switch', 'password': 'telecom'},
-                            'name': 'Telecom'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'Leo',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'mms.cellone.com.na',
-                                             'mmsproxy': '41.223.80.10:8080',
-                                             'name': 'Cell One MMS',
-                                             'password': 'cellone',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'cellone'}],
-                                    'network-id': {'@mcc': '649',
-                                                   '@mnc': '03'}},
-                            'name': 'Leo'}]},
-             {'@code': 'ng',
-              'provider': [{'gsm': {'apn': {'@value': 'internet.ng.airtel.com.ng',
-                                            'password': 'internet',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'internet'},
-                                    'balance-check': {'ussd': '*123#'},
-                                    'balance-top-up': {'ussd': {'#text': '*126*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '621',
-                                                    '@mnc': '20'},
-                                                   {'@mcc': '621',
-                                                    '@mnc': '80'}]},
-                            'name': 'Airtel NG'},
-                           {'gsm': {'apn': {'@value': 'web.gprs.mtnnigeria.net',
-                                            'password': 'web',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'web'},
-                                    'balance-check': {'ussd': '*556#'},
-                                    'balance-top-up': {'ussd': {'#text': '*555*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '621',
-                                                    '@mnc': '30'},
-                                                   {'@mcc': '621',
-                                                    '@mnc': '60'}]},
-                            'name': 'MTN'},
-                           {'gsm': {'apn': [{'@value': 'glosecure',
-                                             'name': 'Pay as You Go',
-                                             'password': 'gprs',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'gprs'},
-                                            {'@value': 'gloflat',
-                                             'name': 'Glo 3G Packs',
-                                             'password': 'flat',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'flat'}],
-                                    'balance-check': {'ussd': '#124#',
-                                                      'ussd-response': '4'},
-                                    'balance-top-up': {'ussd': {'#text': '*123*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '621',
-                                                    '@mnc': '50'},
-                                                   {'@mcc': '621',
-                                                    '@mnc': '70'}]},
-                            'name': 'Glo Mobile'},
-                           {'gsm': {'apn': {'@value': 'etisalat',
-                                            'name': 'Etisalat Internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*232#'},
-                                    'balance-top-up': {'ussd': {'#text': '*222*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '621',
-                                                   '@mnc': '90'}},
-                            'name': 'Etisalat'},
-                           {'cdma': {'password': 'your_phone_number',
-                                     'sid': {'@value': '2'},
-                                     'username': 'your_phone_number@starcomms.com'},
-                            'name': 'Starcomms'},
-                           {'cdma': None, 'name': 'Multilinks'}]},
-             {'@code': 'ni',
-              'provider': [{'gsm': {'apn': [{'@value': 'wap.emovil',
-                                             'name': 'WAP',
-                                             'password': 'wapemovil',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'},
-                                             'username': 'wapemovil'},
-                                            {'@value': 'web.emovil',
-                                             'name': 'Web',
-                                             'password': 'webemovil',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'webemovil'},
-                                            {'@value': 'internet.ideasalo.ni',
-                                             'name': 'Web (Alo pcs)',
-                                             'password': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internet'},
-                                            {'@value': 'wap.ideasalo.ni',
-                                             'name': 'WAP (Alo pcs)',
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'},
-                                             'username': 'wap'}],
-                                    'network-id': [{'@mcc': '710',
-                                                    '@mnc': '21'},
-                                                   {'@mcc': '710',
-                                                    '@mnc': '73'}]},
-                            'name': 'Claro'},
-                           {'gsm': {'apn': {'@value': 'internet.movistar.ni',
-                                            'password': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'internet'},
-                                    'network-id': {'@mcc': '710',
-                                                   '@mnc': '30'}},
-                            'name': 'Movistar'}]},
-             {'@code': 'nl',
-              'provider': [{'gsm': {'apn': [{'@value': 'portalmmm.nl',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'portalmmm.nl',
-                                             'mmsc': 'http://mp.mobiel.kpn/mmsc',
-                                             'mmsproxy': '10.10.100.20:5080',
-                                             'name': 'KPN MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '204',
-                                                   '@mnc': '08'}},
-                            'name': 'Hi'},
-                           {'gsm': {'apn': [{'@value': 'multimedia.lebara.nl',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'mmsc': 'http://mms',
-                                             'mmsproxy': '193.113.200.195:8080',
-                                             'name': 'Telfort MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '204',
-                                                   '@mnc': '12'}},
-                            'name': 'Lebara'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.nl',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmnl'},
-                                    'balance-check': {'ussd': '*101#'},
-                                    'balance-top-up': {'ussd': {'#text': '*101*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '204',
-                                                   '@mnc': '09'}},
-                            'name': 'Lycamobile'},
-                           {'@primary': 'true',
-                            'gsm': {'apn': [{'@value': 'prepaidinternet',
-                                             'name': 'KPN Prepaid Mobiel '
-                                                     'Internet',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'fastinternet',
-                                             'name': 'KPN 3G/2G LTE Mobiel '
-                                                     'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'dns': ['62.133.126.28',
-                                                     '62.133.126.29'],
-                                             'password': 'gprs',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'KPN'},
-                                            {'@value': 'KPN4G.nl',
-                                             'name': 'KPN 4G LTE Mobiel '
-                                                     'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'portalmmm.nl',
-                                             'name': 'KPN Mobiel Internet',
-                                             'plan': [{'@type': 'postpaid'},
-                                                      {'@type': 'prepaid'}],
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'portalmmm.nl',
-                                             'mmsc': 'http://mp.mobiel.kpn/mmsc',
-                                             'mmsproxy': '10.10.100.20:5080',
-                                             'name': 'KPN MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '204',
-                                                   '@mnc': '08'}},
-                            'name': 'KPN NL'},
-                           {'gsm': {'apn': {'@value': 'portalmmm.nl',
-                                            'name': 'Aldi Talk Mobiel Prepaid '
-                                                    'Internet',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': [{'@mcc': '204',
-                                                    '@mnc': '08'},
-                                                   {'@mcc': '204',
-                                                    '@mnc': '10'}]},
-                            'name': 'MEDIONmobile'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'telfortnl'},
-                                    'network-id': {'@mcc': '204',
-                                                   '@mnc': '12'}},
-                            'name': 'Telfort'},
-                           {'@primary': 'true',
-                            'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'T-Mobile Internet',
-                                             'plan': [{'@type': 'postpaid'},
-                                                      {'@type': 'prepaid'}],
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'smartsites.t-mobile',
-                                             'name': 'T-Mobile NL',
-                                             'plan': [{'@type': 'postpaid'},
-                                                      {'@type': 'prepaid'}],
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://t-mobilemms',
-                                             'mmsproxy': '10.10.10.11:8080',
-                                             'name': 'T-Mobile NL MMS',
-                                             'password': 'tmobilemms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'tmobilemms'}],
-                                    'balance-check': {'sms': {'#text': '1144',
-                                                              '@text': 'SALDO'}},
-                                    'network-id': {'@mcc': '204',
-                                                   '@mnc': '16'}},
-                            'name': 'T-Mobile'},
-                           {'gsm': {'apn': [{'@value': 'basic.internet.ben.data',
-                                             'dns': ['193.78.240.12',
-                                                     '193.79.242.39'],
-                                             'name': 'Ben internet (prepaid)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.ben',
-                                             'dns': ['193.78.240.12',
-                                                     '193.79.242.39'],
-                                             'name': 'Ben internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.ben',
-                                             'mmsc': 'http://benmms',
-                                             'mmsproxy': '10.10.10.11:8080',
-                                             'name': 'Ben MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '204',
-                                                   '@mnc': '16'}},
-                            'name': 'Ben'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'password': 'orange',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'orange'},
-                                    'network-id': {'@mcc': '204',
-                                                   '@mnc': '20'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': {'@value': 'data.tele2.nl',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '204',
-                                                   '@mnc': '02'}},
-                            'name': 'Tele2'},
-                           {'gsm': {'apn': {'@value': 'umts.xs4all.nl',
-                                            'password': 'xs4all',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'xs4all'}},
-                            'name': 'XS4ALL Mobiel Internet'},
-                           {'gsm': {'apn': [{'@value': 'live.vodafone.com',
-                                             'dns': ['62.140.138.237',
-                                                     '62.140.140.250'],
-                                             'name': 'Non-business',
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vodafone'},
-                                            {'@value': 'office.vodafone.nl',
-                                             'name': 'Business',
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vodafone'},
-                                            {'@value': 'm2m.global.vodafone.nl',
-                                             'authentication': {'@method': 'pap'},
-                                             'name': 'M2M',
-                                             'password': 'web',
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web'}],
-                                    'msisdn-query': {'ussd': '*#100#'},
-                                    'network-id': {'@mcc': '204',
-                                                   '@mnc': '04'}},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '204',
-                                                   '@mnc': '08'}},
-                            'name': 'Galaxy'},
-                           {'gsm': {'apn': {'@value': 'internet.access.nl',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '204',
-                                                   '@mnc': '99'}},
-                            'name': 'Simpel'}]},
-             {'@code': 'no',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet.netcom.no',
-                                             'dns': ['212.169.123.67',
-                                                     '212.45.188.254'],
-                                             'password': 'netcom',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'netcom'},
-                                            {'@value': 'mms.netcom.no',
-                                             'mmsc': 'http://mms/',
-                                             'mmsproxy': '212.169.66.4:8080',
-                                             'name': 'NetCom mms',
-                                             'password': 'netcom',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'balance-check': {'ussd': '*150#'},
-                                    'network-id': {'@mcc': '242',
-                                                   '@mnc': '02'}},
-                            'name': 'Netcom'},
-                           {'gsm': {'apn': [{'@value': 'netcom',
-                                             'password': 'chess',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'chess'},
-                                            {'@value': 'mms.netcom.no',
-                                             'mmsc': 'http://mms/',
-                                             'mmsproxy': '212.169.66.4:8080',
-                                             'name': 'Chess MMS',
-                                             'password': 'chess',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'chess'}],
-                                    'network-id': {'@mcc': '242',
-                                                   '@mnc': '02'}},
-                            'name': 'Chess'},
-                           {'cdma': {'password': 'cdma', 'username': 'cdma'},
-                            'name': 'ice.net (Nordisk Mobiltelefon)'},
-                           {'gsm': {'apn': [{'@value': 'telenor.smart',
-                                             'name': 'Telenor',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'telenor.smart',
-                                             'mmsc': 'http://mmsc',
-                                             'mmsproxy': 'mms-proxy.telenor.no:8080',
-                                             'name': 'Telenor MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'mms.ventelo.no',
-                                             'mmsc': 'http://mmsc/',
-                                             'mmsproxy': '10.10.10.11:8080',
-                                             'name': 'Ventelo MMS',
-                                             'password': '1111',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'ventelo'}],
-                                    'balance-check': {'sms': {'#text': '2525',
-                                                              '@text': 'saldo'}},
-                                    'network-id': {'@mcc': '242', '@mnc': '01'},
-                                    'voicemail': '91500002'},
-                            'name': 'Telenor'},
-                           {'gsm': {'apn': {'@value': 'internet.no',
-                                            'dns': ['80.232.41.10',
-                                                    '80.232.41.20'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '242',
-                                                   '@mnc': '08'}},
-                            'name': 'TDC'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.nwn.no',
-                                             'mmsproxy': '89.254.65.20:80',
-                                             'name': 'NWN MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '242',
-                                                   '@mnc': '05'}},
-                            'name': 'Network Norway'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '242',
-                                                   '@mnc': '05'}},
-                            'name': 'OneCall'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '242',
-                                                   '@mnc': '05'}},
-                            'name': 'MyCall'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}}},
-                            'name': 'Altibox'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '242',
-                                                   '@mnc': '05'}},
-                            'name': 'Telipol'},
-                           {'gsm': {'apn': {'@value': 'internet.ventelo.no',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '242',
-                                                   '@mnc': '07'}},
-                            'name': 'Ventelo'},
-                           {'gsm': {'apn': {'@value': 'internet.ventelo.no',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '242',
-                                                   '@mnc': '07'}},
-                            'name': 'Ludo Mobil'},
-                           {'gsm': {'apn': [{'@value': 'internet.tele2.no',
-                                             'name': 'Mobilt internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'}},
-                                            {'@value': 'mobileinternet.tele2.no',
-                                             'name': 'Mobilt bredbånd',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'balance-check': {'dtmf': '47300000',
-                                                      'ussd': '*111#'},
-                                    'network-id': [{'@mcc': '242',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '242',
-                                                    '@mnc': '04'}],
-                                    'voicemail': '47230000'},
-                            'name': 'Tele2'},
-                           {'gsm': {'apn': {'@value': 'internet.phonero.no',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '242',
-                                                   '@mnc': '01'}},
-                            'name': 'Phonero'},
-                           {'gsm': {'apn': {'@value': 'data.lyca-mobile.no',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmno'},
-                                    'balance-check': {'ussd': '*150#'},
-                                    'balance-top-up': {'ussd': {'#text': '*150*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '242',
-                                                   '@mnc': '23'}},
-                            'name': 'Lycamobile'}]},
-             {'@code': 'np',
-              'provider': [{'gsm': {'apn': {'@value': 'ntnet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '429',
-                                                   '@mnc': '01'}},
-                            'name': 'Nepal Telecom'},
-                           {'gsm': {'apn': {'@value': 'mero',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '429',
-                                                   '@mnc': '02'}},
-                            'name': 'Mero Mobile'}]},
-             {'@code': 'nz',
-              'provider': [{'gsm': {'apn': [{'@value': 'wap.telecom.co.nz',
-                                             'name': 'XT mobile (WAP)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'}},
-                                            {'@value': 'internet.telecom.co.nz',
-                                             'dns': ['202.27.156.72',
-                                                     '202.27.158.40'],
-                                             'name': 'XT mobile (Internet with '
-                                                     'Firewall)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'direct.telecom.co.nz',
-                                             'dns': ['202.27.156.72',
-                                                     '202.27.158.40'],
-                                             'name': 'XT mobile (Direct '
-                                                     'Internet)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'oa.telecom.co.nz',
-                                             'name': 'XT mobile (One '
-                                                     'Office/Remote Office)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'wap.telecom.co.nz',
-                                             'mmsc': 'http://lsmmsc.xtra.co.nz',
-                                             'mmsproxy': '210.55.11.73:8080',
-                                             'name': 'TelecomMMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '530',
-                                                    '@mnc': '00'},
-                                                   {'@mcc': '530',
-                                                    '@mnc': '05'}]},
-                            'name': 'Telecom New Zealand'},
-                           {'gsm': {'apn': [{'@value': 'live.vodafone.com',
-                                             'dns': ['202.73.206.16',
-                                                     '202.73.198.16'],
-                                             'name': 'WAP',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'www.vodafone.net.nz',
-                                             'name': 'Contract / Prepaid '
-                                                     '(Restricted)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'dns': ['202.73.206.16',
-                                                     '202.73.198.16'],
-                                             'name': 'Unrestricted (public)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '530',
-                                                   '@mnc': '01'}},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': [{'@value': 'mms',
-                                             'name': 'MMS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'internet',
-                                             'dns': ['118.148.1.10',
-                                                     '118.148.1.20'],
-                                             'name': 'Broadband',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.2degrees.net.nz:48090',
-                                             'mmsproxy': '118.148.1.118:8080',
-                                             'name': 'mms',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '530',
-                                                   '@mnc': '24'}},
-                            'name': '2-Degrees'},
-                           {'gsm': {'apn': {'@value': 'www.telstraclear.net.nz',
-                                            'name': 'Broadband',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}}},
-                            'name': 'TelstraClear'},
-                           {'gsm': {'apn': {'@value': 'www.orcon.net.nz',
-                                            'name': 'Broadband',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}}},
-                            'name': 'Orcon'}]},
-             {'@code': 'om',
-              'provider': [{'gsm': {'apn': [{'@value': 'taif',
-                                             'name': 'Mobile Broadband',
-                                             'password': 'taif',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'taif'},
-                                            {'@value': 'internet',
-                                             'name': 'Internet (old)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'MMS',
-                                             'mmsproxy': '192.168.203.35:8080',
-                                             'name': 'Oman Mobile MMS',
-                                             'password': 'MMS',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'MMS'}],
-                                    'network-id': {'@mcc': '422',
-                                                   '@mnc': '02'}},
-                            'name': 'Oman Mobile'},
-                           {'gsm': {'apn': [{'@value': 'isp.nawras.com.om',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.nawras.com.om',
-                                             'mmsc': 'http://10.128.240.16/servlets/mms',
-                                             'mmsproxy': '10.128.240.19:8080',
-                                             'name': 'Nawras MMS',
-                                             'password': 'test',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'test'}],
-                                    'network-id': {'@mcc': '422',
-                                                   '@mnc': '03'}},
-                            'name': 'Nawras'}]},
-             {'@code': 'pa',
-              'provider': [{'gsm': {'apn': [{'@value': 'apn01.cwpanama.com.pa',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'apn02.cwpanama.com.pa',
-                                             'mmsc': 'http://mms.zonamovil.com.pa',
-                                             'mmsproxy': '172.25.3.5:8080',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '714',
-                                                   '@mnc': '01'}},
-                            'name': 'Cable and Wireless'},
-                           {'gsm': {'apn': {'@value': 'internet.movistar.pa',
-                                            'dns': ['200.39.10.1',
-                                                    '200.36.160.237'],
-                                            'password': 'movistarpa',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'movistarpa'},
-                                    'network-id': {'@mcc': '714',
-                                                   '@mnc': '02'}},
-                            'name': 'Movistar'}]},
-             {'@code': 'pe',
-              'provider': [{'gsm': {'apn': [{'@value': 'tim.pe',
-                                             'password': 'tulibertad',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'tim'},
-                                            {'@value': 'ba.amx',
-                                             'name': 'Internet Móvil Prepago',
-                                             'password': 'amx',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'amx'}],
-                                    'network-id': {'@mcc': '716',
-                                                   '@mnc': '10'}},
-                            'name': 'Claro'},
-                           {'gsm': {'apn': {'@value': 'movistar.pe',
-                                            'password': 'movistar',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'movistar@datos'},
-                                    'network-id': {'@mcc': '716',
-                                                   '@mnc': '06'}},
-                            'name': 'Movistar'},
-                           {'gsm': {'apn': [{'@value': 'datacard.nextel.com.pe',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.vini.pf/mmsc',
-                                             'mmsproxy': '172.20.10.16:9201',
-                                             'name': 'Vini MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '716',
-                                                   '@mnc': '07'}},
-                            'name': 'Nextel'}]},
-             {'@code': 'pf',
-              'provider': {'gsm': {'apn': {'@value': 'internet',
-                                           'plan': {'@type': 'postpaid'},
-                                           'usage': {'@type': 'internet'}},
-                                   'network-id': {'@mcc': '547', '@mnc': '20'}},
-                           'name': 'Vini'}},
-             {'@code': 'pg',
-              'provider': {'gsm': {'apn': {'@value': 'internet.digicelpng.com',
-                                           'dns': ['10.149.64.77', '8.8.8.8'],
-                                           'name': 'Prepaid',
-                                           'plan': {'@type': 'prepaid'},
-                                           'usage': {'@type': 'internet'}},
-                                   'network-id': {'@mcc': '537', '@mnc': '03'}},
-                           'name': 'Digicel'}},
-             {'@code': 'ph',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet.globe.com.ph',
-                                             'dns': ['203.127.225.10',
-                                                     '203.127.225.11'],
-                                             'name': 'Postpaid',
-                                             'password': 'globe',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'globe'},
-                                            {'@value': 'http.globe.com.ph',
-                                             'dns': ['203.127.225.10',
-                                                     '203.127.225.11'],
-                                             'name': 'Prepaid',
-                                             'password': 'globe',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'globe'},
-                                            {'@value': 'www.globe.com.ph',
-                                             'dns': ['203.127.225.10',
-                                                     '203.127.225.11'],
-                                             'name': 'WAP',
-                                             'password': 'globe',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'globe'},
-                                            {'@value': 'mms.globe.com.ph',
-                                             'mmsc': 'http://192.40.100.22:10021/mmsc',
-                                             'mmsproxy': '192.40.100.20:8080',
-                                             'name': 'myGlobe MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '515',
-                                                   '@mnc': '02'}},
-                            'name': 'Globe Telecom'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['202.57.96.3',
-                                                     '202.57.96.4'],
-                                             'password': 'banonoy',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'witsductoor'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://10.102.61.238:8002',
-                                             'mmsproxy': '10.102.61.46:8080',
-                                             'name': 'SmartMMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '515',
-                                                   '@mnc': '03'}},
-                            'name': 'Smart'},
-                           {'gsm': {'apn': [{'@value': 'minternet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mmscenter.suncellular.com.ph',
-                                             'mmsproxy': '202.138.159.78:8080',
-                                             'name': 'Sun MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '515',
-                                                   '@mnc': '05'}},
-                            'name': 'Digitel (Sun Cellular)'}]},
-             {'@code': 'pk',
-              'provider': [{'gsm': {'apn': {'@value': 'internet',
-                                            'password': 'telenor',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'telenor'},
-                                    'network-id': {'@mcc': '515',
-                                                   '@mnc': '06'}},
-                            'name': 'Djuice'},
-                           {'gsm': {'apn': [{'@value': 'connect.mobilinkworld.com',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'jazzconnect.mobilinkworld.com',
-                                             'name': 'Jazz',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '515',
-                                                   '@mnc': '01'}},
-                            'name': 'Mobilink'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'password': 'telenor',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'telenor'},
-                                    'network-id': {'@mcc': '515',
-                                                   '@mnc': '06'}},
-                            'name': 'Telenor'},
-                           {'gsm': {'apn': [{'@value': 'ufone.internet',
-                                             'password': 'ufone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'ufone'},
-                                            {'@value': 'ufone.mms',
-                                             'mmsc': 'http://www.ufonemms.com:80',
-                                             'mmsproxy': '172.16.13.27:8080',
-                                             'name': 'Ufone MMS',
-                                             'password': 'ufone',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'ufone'}],
-                                    'network-id': {'@mcc': '410',
-                                                   '@mnc': '03'}},
-                            'name': 'Ufone'},
-                           {'gsm': {'apn': [{'@value': 'warid',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'zongmms',
-                                             'mmsc': 'http://10.81.6.11:8080',
-                                             'mmsproxy': '10.81.6.33:8000',
-                                             'name': 'ZONG MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '515',
-                                                   '@mnc': '07'}},
-                            'name': 'Warid'},
-                           {'gsm': {'apn': {'@value': 'zonginternet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '515',
-                                                   '@mnc': '04'}},
-                            'name': 'ZONG'},
-                           {'cdma': {'password': 'ptcl',
-                                     'username': 'vwireless@ptcl.com'},
-                            'name': 'Ptcl EVO'},
-                           {'cdma': None, 'name': 'WorldCall Wireless'}]},
-             {'@code': 'pl',
-              'provider': [{'@primary': 'true',
-                            'gsm': {'apn': [{'@value': 'internet',
-                                             'plan': [{'@type': 'postpaid'},
-                                                      {'@type': 'prepaid'}],
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms/servlets/mms',
-                                             'mmsproxy': '213.158.194.226:8080',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*101#'},
-                                    'balance-top-up': {'ussd': {'#text': '*111*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '260', '@mnc': '02'},
-                                    'voicemail': '602950'},
-                            'name': 'T-Mobile'},
-                           {'@primary': 'true',
-                            'gsm': {'apn': [{'@value': 'internet',
-                                             'plan': [{'@type': 'postpaid'},
-                                                      {'@type': 'prepaid'}],
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mmsc.play.pl/mms/wapenc',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*101#'},
-                                    'balance-top-up': {'ussd': {'#text': '*100*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '260', '@mnc': '06'},
-                                    'voicemail': '*200'},
-                            'name': 'Play'},
-                           {'@primary': 'true',
-                            'cdma': {'password': 'orange',
-                                     'username': 'cdma@orange'},
-                            'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['194.204.159.1',
-                                                     '194.204.152.34'],
-                                             'name': ['Standard access',
-                                                      {'#text': 'Dostęp '
-                                                                'standardowy',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'pl'}],
-                                             'password': 'internet',
-                                             'plan': [{'@type': 'postpaid'},
-                                                      {'@type': 'prepaid'}],
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internet'},
-                                            {'@value': 'internetipv6',
-                                             'dns': ['194.204.159.1',
-                                                     '194.204.152.34'],
-                                             'name': ['Standard access (IPv6)',
-                                                      {'#text': 'Dostęp '
-                                                                'standardowy '
-                                                                '(IPv6)',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'pl'}],
-                                             'password': 'internetipv6',
-                                             'plan': [{'@type': 'postpaid'},
-                                                      {'@type': 'prepaid'}],
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internetipv6'},
-                                            {'@value': 'vpn',
-                                             'name': ['External dynamic IP '
-                                                      'address (requires '
-                                                      'activation)',
-                                                      {'#text': 'Zewnętrzny '
-                                                                'dynamiczny '
-                                                                'adres IP '
-                                                                '(wymaga '
-                                                                'aktywacji)',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'pl'}],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'vpn.static.pl',
-                                             'name': ['External static IP '
-                                                      'address (requires '
-                                                      'activation)',
-                                                      {'#text': 'Zewnętrzny '
-                                                                'statyczny '
-                                                                'adres IP '
-                                                                '(wymaga '
-                                                                'aktywacji)',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'pl'}],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.orange.pl',
-                                             'mmsproxy': '192.168.6.104:8080',
-                                             'name': 'MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'balance-check': {'ussd': '*124*#'},
-                                    'balance-top-up': {'ussd': {'#text': '*125*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '260', '@mnc': '03'},
-                                    'voicemail': '*501'},
-                            'name': 'Orange'},
-                           {'@primary': 'true',
-                            'gsm': {'apn': [{'@value': 'internet',
-                                             'name': ['Standard access',
-                                                      {'#text': 'Dostęp '
-                                                                'standardowy',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'pl'}],
-                                             'password': 'internet',
-                                             'plan': [{'@type': 'postpaid'},
-                                                      {'@type': 'prepaid'}],
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internet'},
-                                            {'@value': 'pro',
-                                             'name': ['External dynamic IP '
-                                                      'address (requires '
-                                                      'activation)',
-                                                      {'#text': 'Zewnętrzny '
-                                                                'dynamiczny '
-                                                                'adres IP '
-                                                                '(wymaga '
-                                                                'aktywacji)',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'pl'}],
-                                             'password': 'plusgsm',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'plusgsm'},
-                                            {'@value': 'm2m',
-                                             'name': ['External static IP '
-                                                      'address (requires '
-                                                      'activation)',
-                                                      {'#text': 'Zewnętrzny '
-                                                                'statyczny '
-                                                                'adres IP '
-                                                                '(wymaga '
-                                                                'aktywacji)',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'pl'}],
-                                             'password': 'plusgsm',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'plusgsm'},
-                                            {'@value': 'optimizer',
-                                             'name': ['iPlus optimizer with '
-                                                      'data compression',
-                                                      {'#text': 'iPlus '
-                                                                'optimizer z '
-                                                                'kompresją '
-                                                                'danych',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'pl'}],
-                                             'plan': [{'@type': 'postpaid'},
-                                                      {'@type': 'prepaid'}],
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.plusgsm.pl:8002',
-                                             'mmsproxy': '212.2.96.16:8080',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*100#'},
-                                    'balance-top-up': {'ussd': {'#text': '*123*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '260', '@mnc': '01'},
-                                    'voicemail': '2222'},
-                            'name': 'Plus'},
-                           {'@primary': 'true',
-                            'gsm': {'apn': {'@value': 'multi.internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '260',
-                                                   '@mnc': '12'}},
-                            'name': 'Cyfrowy Polsat'},
-                           {'@primary': 'true',
-                            'gsm': {'apn': {'@value': 'darmowy',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '260',
-                                                   '@mnc': '17'}},
-                            'name': 'aero2'},
-                           {'@primary': 'false',
-                            'cdma': {'password': 'orange',
-                                     'username': 'cdma@orange'},
-                            'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'Default APN',
-                                             'password': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internet'},
-                                            {'@value': 'mni.internet',
-                                             'name': 'APN: mni.internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mni.internet'},
-                                            {'@value': 'telogic.internet',
-                                             'name': 'APN: telogic.internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'telogic.internet'}],
-                                    'network-id': {'@mcc': '260',
-                                                   '@mnc': '03'}},
-                            'name': 'Multimo'},
-                           {'@primary': 'false',
-                            'gsm': {'apn': [{'@value': 'heyah.pl',
-                                             'name': 'heyah.pl',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'name': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'heyahmms',
-                                             'mmsc': 'http://mms.heyah.pl/servlets/mms',
-                                             'mmsproxy': '213.158.194.226:8080',
-                                             'name': 'heyahmms',
-                                             'password': 'heyah',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'heyah'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms/servlets/mms',
-                                             'mmsproxy': '213.158.194.226:8080',
-                                             'name': 'mms',
-                                             'password': 'mms',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'balance-check': {'ussd': '*108#'},
-                                    'balance-top-up': {'ussd': {'#text': '*109*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '260',
-                                                   '@mnc': '02'}},
-                            'name': 'Heyah'},
-                           {'@primary': 'false',
-                            'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '260',
-                                                   '@mnc': '06'}},
-                            'name': 'Netia'},
-                           {'@primary': 'false',
-                            'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '260',
-                                                   '@mnc': '06'}},
-                            'name': 'Vectra'},
-                           {'@primary': 'false',
-                            'gsm': {'apn': {'@value': 'telogic.internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'internet'},
-                                    'network-id': {'@mcc': '260',
-                                                   '@mnc': '03'}},
-                            'name': 'INEA'},
-                           {'@primary': 'false',
-                            'cdma': {'password': 'sferia',
-                                     'username': 'sferia'},
-                            'name': 'Sferia'},
-                           {'@primary': 'false',
-                            'cdma': {'password': 'CDMA', 'username': 'CDMA'},
-                            'name': 'Nordisk Polska'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.pl',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmpl'},
-                                    'balance-check': {'ussd': '*131#'},
-                                    'balance-top-up': {'ussd': {'#text': '*131*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '260',
-                                                   '@mnc': '09'}},
-                            'name': 'Lycamobile'},
-                           {'@primary': 'false',
-                            'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['194.204.159.1',
-                                                     '194.204.152.34'],
-                                             'name': ['Standard access',
-                                                      {'#text': 'Dostęp '
-                                                                'standardowy',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'pl'}],
-                                             'password': 'internet',
-                                             'plan': [{'@type': 'postpaid'},
-                                                      {'@type': 'prepaid'}],
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internet'},
-                                            {'@value': 'internetipv6',
-                                             'dns': ['194.204.159.1',
-                                                     '194.204.152.34'],
-                                             'name': ['Standard access (IPv6)',
-                                                      {'#text': 'Dostęp '
-                                                                'standardowy '
-                                                                '(IPv6)',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'pl'}],
-                                             'password': 'internetipv6',
-                                             'plan': [{'@type': 'postpaid'},
-                                                      {'@type': 'prepaid'}],
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internetipv6'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.njumobile.pl',
-                                             'mmsproxy': '192.168.6.104:8080',
-                                             'name': 'MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'balance-check': {'ussd': '*127*1#'},
-                                    'balance-top-up': {'ussd': {'#text': '*128*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '260', '@mnc': '03'},
-                                    'voicemail': '*501'},
-                            'name': 'nju mobile'},
-                           {'@primary': 'false',
-                            'gsm': {'apn': [{'@value': 'virgin-internet',
-                                             'name': 'Internet',
-                                             'plan': [{'@type': 'postpaid'},
-                                                      {'@type': 'prepaid'}],
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'virgin-mms',
-                                             'mmsc': 'http://mms.virginpol.jsc',
-                                             'mmsproxy': 'wap.virginpol.jsc:8080',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*101#'},
-                                    'balance-top-up': {'ussd': {'#text': '*100*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '260',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '260',
-                                                    '@mnc': '06'}]},
-                            'name': 'Virgin Mobile'}]},
-             {'@code': 'pt',
-              'provider': [{'gsm': {'apn': [{'@value': 'kanguru-portatil',
-                                             'dns': ['62.169.67.172',
-                                                     '62.169.67.171'],
-                                             'name': ['Portable',
-                                                      {'#text': 'Portátil',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'pt'}],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'kanguru-tempo',
-                                             'dns': ['62.169.67.172',
-                                                     '62.169.67.171'],
-                                             'name': 'Tempo (Prepaid)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'kangurufixo',
-                                             'dns': ['62.169.67.172',
-                                                     '62.169.67.171'],
-                                             'name': 'Fixo',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'noapn',
-                                             'dns': ['62.169.67.172',
-                                                     '62.169.67.171'],
-                                             'name': 'Apn dinâmico (no apn)'},
-                                            {'@value': 'umts',
-                                             'mmsc': 'http://mmsc:10021/mmsc',
-                                             'mmsproxy': '62.169.66.5:8799',
-                                             'name': 'Optimus MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '268',
-                                                   '@mnc': '03'}},
-                            'name': 'Kanguru'},
-                           {'gsm': {'apn': {'@value': 'clixinternetmovel',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '268',
-                                                   '@mnc': '03'}},
-                            'name': 'Clix'},
-                           {'gsm': {'apn': [{'@value': 'umts',
-                                             'name': '3G',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet',
-                                             'dns': '194.79.69.129',
-                                             'name': 'GPRS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '268',
-                                                   '@mnc': '03'}},
-                            'name': 'Optimus'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.pt',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmpt'},
-                                    'balance-check': {'ussd': '*123#'},
-                                    'balance-top-up': {'ussd': {'#text': '*#123*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '268',
-                                                   '@mnc': '04'}},
-                            'name': 'Lycamobile'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['88.214.178.1',
-                                                     '88.214.182.2'],
-                                             'name': 'Tmn Internet',
-                                             'password': 'tmn',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'tmn'},
-                                            {'@value': 'mmsc.tmn.pt',
-                                             'dns': ['194.65.3.20',
-                                                     '194.65.3.21'],
-                                             'name': 'Tmn Mms',
-                                             'password': 'tmnnet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'tmn'},
-                                            {'@value': 'mmsc.tmn.pt',
-                                             'mmsc': 'http://mmsc/',
-                                             'mmsproxy': '10.111.2.16:8080',
-                                             'name': 'MMSgprs',
-                                             'password': 'tmnnet',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'tmn'}],
-                                    'network-id': {'@mcc': '268',
-                                                   '@mnc': '06'}},
-                            'name': 'TMN'},
-                           {'gsm': {'apn': [{'@value': 'internet.vodafone.pt',
-                                             'dns': ['212.18.160.133',
-                                                     '212.18.160.134'],
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vodafone'},
-                                            {'@value': 'net2.vodafone.pt',
-                                             'name': 'Vodafone Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'vas.vodafone.pt',
-                                             'name': 'Vodafone MMS',
-                                             'password': 'vas',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'vas'}],
-                                    'network-id': {'@mcc': '268',
-                                                   '@mnc': '01'}},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': [{'@value': 'internet.zon.pt',
-                                             'name': 'Dados Móveis',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'vas.zon.pt',
-                                             'name': 'MMS',
-                                             'password': 'vas',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'vas'},
-                                            {'@value': 'vas.zon.pt',
-                                             'mmsc': 'http://mms/servlets/mms',
-                                             'mmsproxy': '213.30.27.63:8799',
-                                             'name': 'ZON MMS',
-                                             'password': 'vas',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'vas'}],
-                                    'network-id': {'@mcc': '268',
-                                                   '@mnc': '01'}},
-                            'name': 'ZON'}]},
-             {'@code': 'py',
-              'provider': [{'gsm': {'apn': [{'@value': 'vox.wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'vox.mms',
-                                             'mmsc': 'http:/mms.vox.com.py/mmsc',
-                                             'mmsproxy': '172.24.97.29:8080',
-                                             'name': 'e-magen',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '744',
-                                                   '@mnc': '01'}},
-                            'name': 'VOX'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '744',
-                                                   '@mnc': '05'}},
-                            'name': 'Personal'},
-                           {'gsm': {'apn': [{'@value': 'internet.tigo.py',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'broadband.tigo.py',
-                                             'name': ['Broadband',
-                                                      {'#text': 'Banda Ancha '
-                                                                'Móvil',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'es'}],
-                                             'password': 'tigo',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'tigo'}],
-                                    'network-id': {'@mcc': '744',
-                                                   '@mnc': '04'}},
-                            'name': 'Tigo'},
-                           {'gsm': {'apn': {'@value': 'gprs.claro.com.py',
-                                            'name': 'Internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '744',
-                                                   '@mnc': '02'}},
-                            'name': 'Claro'}]},
-             {'@code': 'qa',
-              'provider': [{'gsm': {'apn': [{'@value': 'web.vodafone.com.qa',
-                                             'name': 'Web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'vodafone.com.qa',
-                                             'name': 'Web (old)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'msisdn-query': {'ussd': '*#100#'},
-                                    'network-id': {'@mcc': '427',
-                                                   '@mnc': '02'}},
-                            'name': 'Vodafone'},
-                           {'gsm': {'apn': [{'@value': 'gprs.qtel',
-                                             'name': 'Qatarnet',
-                                             'password': 'gprs',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'gprs'},
-                                            {'@value': 'mms.qtel',
-                                             'mmsc': 'http://mmsr.qtelmms.qa',
-                                             'mmsproxy': '10.23.8.3:8080',
-                                             'name': 'Qtel MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '427',
-                                                   '@mnc': '01'}},
-                            'name': 'Q-Tel'}]},
-             {'@code': 're',
-              'provider': {'gsm': {'apn': [{'@value': 'websfr',
-                                            'name': 'Contract / Prepaid',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'slsfr',
-                                            'name': 'SFR slsfr',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'internetpro',
-                                            'name': 'SFR internetpro',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'ipnet',
-                                            'name': 'SFR ipnet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                           {'@value': 'mmssfr',
-                                            'mmsc': 'http://mms',
-                                            'mmsproxy': '10.0.224.145',
-                                            'name': 'MMSGPRS',
-                                            'password': 'mms',
-                                            'usage': {'@type': 'mms'},
-                                            'username': 'mms'}],
-                                   'msisdn-query': {'sms': {'#text': '+33621012555',
-                                                            '@text': 'ABCd84367'}},
-                                   'network-id': {'@mcc': '647', '@mnc': '10'}},
-                           'name': 'SFR Réunion'}},
-             {'@code': 'ro',
-              'provider': [{'gsm': {'apn': {'@value': 'internet',
-                                            'dns': ['172.22.7.21',
-                                                    '172.22.7.20'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '226',
-                                                   '@mnc': '10'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': [{'@value': 'tobe.vodafone.ro',
-                                             'name': 'Mobile Internet '
-                                                     '(Prepaid)',
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'tobe.vodafone.ro'},
-                                            {'@value': 'internet.vodafone.ro',
-                                             'name': 'Mobile Internet '
-                                                     '(Postpaid)',
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internet.vodafone.ro'},
-                                            {'@value': 'internet.pre.vodafone.ro',
-                                             'name': 'Mobile Internet '
-                                                     '(Prepaid)',
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internet.pre.vodafone.ro'},
-                                            {'@value': 'live.vodafone.com',
-                                             'name': 'Live! (Postpaid)',
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'live'},
-                                            {'@value': 'live.pre.vodafone.ro',
-                                             'name': 'Live! (Prepaid)',
-                                             'password': 'vodafone',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'live.pre.vodafone.com'}],
-                                    'network-id': {'@mcc': '226',
-                                                   '@mnc': '01'}},
-                            'name': 'Vodafone'},
-                           {'cdma': {'password': 'zapp', 'username': 'zapp'},
-                            'name': 'Zapp'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'Home',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'static',
-                                             'name': 'Business (static)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '226',
-                                                   '@mnc': '05'}},
-                            'name': 'Digi.Net Mobil'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.ro',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmro'},
-                                    'balance-check': {'ussd': '*131#'},
-                                    'balance-top-up': {'ussd': {'#text': '*131*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '226',
-                                                   '@mnc': '16'}},
-                            'name': 'Lycamobile'}]},
-             {'@code': 'rs',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet',
-                                             'password': 'gprs',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'telenor'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.telenor.rs/servlets/mms',
-                                             'mmsproxy': '217.65.192.33:8080',
-                                             'name': 'Telenor MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '220',
-                                                   '@mnc': '01'}},
-                            'name': 'Telenor'},
-                           {'gsm': {'apn': [{'@value': 'gprsinternet',
-                                             'dns': '195.178.38.3',
-                                             'password': '064',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mts'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.mts064.telekom.yu/mms/wapenc',
-                                             'mmsproxy': '172.17.85.131:9201',
-                                             'name': 'MMS',
-                                             'password': '"064"',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mts'}],
-                                    'network-id': {'@mcc': '220',
-                                                   '@mnc': '03'}},
-                            'name': 'Telekom Srbija'},
-                           {'gsm': {'apn': [{'@value': 'vipmobile',
-                                             'password': 'vipmobile',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vipmobile'},
-                                            {'@value': 'vipmobile.mms',
-                                             'mmsc': 'http://mmsc.vipmobile.rs',
-                                             'mmsproxy': '212.15.182.82:8080',
-                                             'name': 'Vip MMS',
-                                             'password': 'vipmobile',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'vipmobile'}],
-                                    'network-id': {'@mcc': '220',
-                                                   '@mnc': '05'}},
-                            'name': 'VIP Mobile'}]},
-             {'@code': 'rw',
-              'provider': [{'gsm': {'apn': {'@value': 'internet.mtn',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '635',
-                                                   '@mnc': '10'}},
-                            'name': 'MTN'},
-                           {'gsm': {'apn': {'@value': 'web.tigo.rw',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '635',
-                                                   '@mnc': '13'}},
-                            'name': 'Tigo'}]},
-             {'@code': 'ru',
-              'provider': [{'gsm': {'apn': [{'@value': 'inet.bwc.ru',
-                                             'dns': ['81.18.113.2',
-                                                     '81.18.112.50'],
-                                             'password': 'bwc',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'bwc'},
-                                            {'@value': 'mms.bwc.ru',
-                                             'mmsc': 'http://mmsc/mms',
-                                             'mmsproxy': '10.10.17.2:9201',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'bwc'}],
-                                    'network-id': {'@mcc': '250',
-                                                   '@mnc': '12'}},
-                            'name': ['BaikalWestCom',
-                                     {'#text': 'БайкалВестКом',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'ru'}]},
-                           {'gsm': {'apn': [{'@value': 'home.beeline.ru',
-                                             'dns': ['212.44.130.6',
-                                                     '217.118.83.6'],
-                                             'name': ['3G modem',
-                                                      {'#text': 'USB-модем',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'ru'}],
-                                             'password': 'beeline',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'beeline'},
-                                            {'@value': 'internet.beeline.ru',
-                                             'dns': ['217.118.66.243',
-                                                     '217.118.66.244'],
-                                             'name': ['Mobile phone',
-                                                      {'#text': 'Мобильный '
-                                                                'телефон',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'ru'}],
-                                             'password': 'beeline',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'beeline'}],
-                                    'balance-check': {'ussd': '*102#'},
-                                    'network-id': [{'@mcc': '250',
-                                                    '@mnc': '28'},
-                                                   {'@mcc': '250',
-                                                    '@mnc': '99'}]},
-                            'name': ['Beeline',
-                                     {'#text': 'Билайн',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'ru'}]},
-                           {'gsm': {'apn': {'@value': 'wap.etk.ru',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '250',
-                                                   '@mnc': '05'}},
-                            'name': 'ETK'},
-                           {'gsm': {'apn': {'@value': 'internet.mts.ru',
-                                            'dns': ['213.87.0.1', '213.87.1.1'],
-                                            'password': 'mts',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'mts'},
-                                    'balance-check': {'ussd': '*100#'},
-                                    'network-id': {'@mcc': '250',
-                                                   '@mnc': '01'}},
-                            'name': 'MTS'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'name': ['RUS',
-                                                      {'#text': 'Россия',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'ru'}],
-                                             'password': 'gdata',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'gdata'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mmsc:8002',
-                                             'mmsproxy': '10.10.10.10:8080',
-                                             'name': 'МегаФон MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'balance-check': {'ussd': '*100#'},
-                                    'network-id': {'@mcc': '250',
-                                                   '@mnc': '02'}},
-                            'name': ['Megafon',
-                                     {'#text': 'Мегафон',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'ru'}]},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'dns': ['10.0.3.5', '10.0.3.2'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'ncc'},
-                                    'network-id': {'@mcc': '250',
-                                                   '@mnc': '03'}},
-                            'name': 'NCC'},
-                           {'gsm': {'apn': [{'@value': 'internet.ntc',
-                                             'dns': ['80.243.64.67',
-                                                     '80.243.68.34'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.ntc',
-                                             'mmsc': 'http://mmsc.vntc.ru/was',
-                                             'mmsproxy': '80.243.64.68:8080',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '250',
-                                                   '@mnc': '16'}},
-                            'name': 'NTC'},
-                           {'gsm': {'apn': {'@value': 'internet.etk.ru',
-                                            'dns': ['10.10.30.3', '10.10.30.4'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'etk'},
-                                    'network-id': {'@mcc': '250',
-                                                   '@mnc': '05'}},
-                            'name': ['Enisey TeleCom',
-                                     {'#text': 'Енисей Телеком',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'ru'}]},
-                           {'gsm': {'apn': {'@value': 'inet.ycc.ru',
-                                            'dns': ['217.148.52.34',
-                                                    '217.148.52.3'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'motiv'},
-                                    'network-id': {'@mcc': '250',
-                                                   '@mnc': '35'}},
-                            'name': ['Motiv',
-                                     {'#text': 'Мотив',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'ru'}]},
-                           {'gsm': {'apn': {'@value': 'internet.tatincom.ru',
-                                            'dns': ['89.207.96.2',
-                                                    '89.207.97.18'],
-                                            'password': 'tatincom',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'tatincom'}},
-                            'name': ['Tatincom',
-                                     {'#text': 'Татинком',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'ru'}]},
-                           {'gsm': {'apn': {'@value': 'internet.tele2.ru',
-                                            'dns': ['130.244.127.161',
-                                                    '130.244.127.169'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '250',
-                                                   '@mnc': '20'}},
-                            'name': ['Tele2',
-                                     {'#text': 'Теле2',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'ru'}]},
-                           {'cdma': {'password': 'internet',
-                                     'sid': [{'@value': '11396'},
-                                             {'@value': '11398'},
-                                             {'@value': '11400'},
-                                             {'@value': '11418'},
-                                             {'@value': '11424'},
-                                             {'@value': '11432'},
-                                             {'@value': '11434'},
-                                             {'@value': '11438'},
-                                             {'@value': '11440'},
-                                             {'@value': '11442'},
-                                             {'@value': '11446'},
-                                             {'@value': '11452'},
-                                             {'@value': '11456'},
-                                             {'@value': '11462'},
-                                             {'@value': '11465'},
-                                             {'@value': '11482'},
-                                             {'@value': '11484'},
-                                             {'@value': '11492'},
-                                             {'@value': '11494'},
-                                             {'@value': '11498'},
-                                             {'@value': '11510'},
-                                             {'@value': '11532'},
-                                             {'@value': '11546'},
-                                             {'@value': '11556'},
-                                             {'@value': '11568'},
-                                             {'@value': '11572'},
-                                             {'@value': '11578'},
-                                             {'@value': '11582'},
-                                             {'@value': '11590'},
-                                             {'@value': '11596'},
-                                             {'@value': '11604'},
-                                             {'@value': '11616'},
-                                             {'@value': '11622'},
-                                             {'@value': '11630'},
-                                             {'@value': '11642'},
-                                             {'@value': '11646'},
-                                             {'@value': '11650'},
-                                             {'@value': '11668'},
-                                             {'@value': '11672'},
-                                             {'@value': '11676'},
-                                             {'@value': '11684'},
-                                             {'@value': '11692'},
-                                             {'@value': '11698'},
-                                             {'@value': '11700'},
-                                             {'@value': '11732'},
-                                             {'@value': '11736'},
-                                             {'@value': '11754'},
-                                             {'@value': '11758'},
-                                             {'@value': '11772'},
-                                             {'@value': '11780'},
-                                             {'@value': '11784'},
-                                             {'@value': '11788'},
-                                             {'@value': '11790'},
-                                             {'@value': '11794'},
-                                             {'@value': '11802'},
-                                             {'@value': '11806'},
-                                             {'@value': '11816'},
-                                             {'@value': '11826'},
-                                             {'@value': '11830'},
-                                             {'@value': '11844'},
-                                             {'@value': '11848'},
-                                             {'@value': '11868'},
-                                             {'@value': '11874'},
-                                             {'@value': '11884'},
-                                             {'@value': '11892'},
-                                             {'@value': '11908'},
-                                             {'@value': '11922'},
-                                             {'@value': '11924'},
-                                             {'@value': '11948'},
-                                             {'@value': '11960'},
-                                             {'@value': '11964'},
-                                             {'@value': '11968'},
-                                             {'@value': '11978'},
-                                             {'@value': '11984'},
-                                             {'@value': '11990'},
-                                             {'@value': '12006'},
-                                             {'@value': '12012'},
-                                             {'@value': '12020'},
-                                             {'@value': '12060'},
-                                             {'@value': '12061'},
-                                             {'@value': '12063'},
-                                             {'@value': '12064'},
-                                             {'@value': '12065'},
-                                             {'@value': '12066'},
-                                             {'@value': '12067'},
-                                             {'@value': '12085'},
-                                             {'@value': '12087'},
-                                             {'@value': '12090'},
-                                             {'@value': '12092'},
-                                             {'@value': '12094'},
-                                             {'@value': '12095'}],
-                                     'username': 'mobile'},
-                            'name': ['Skylink',
-                                     {'#text': 'Скайлинк',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'ru'}]},
-                           {'gsm': {'apn': [{'@value': 'internet.usi.ru',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mnc039.mcc250.gprs',
-                                             'mmsc': 'mms.usi.ru',
-                                             'mmsproxy': '192.168.168.192:8080',
-                                             'name': 'mms',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*100#'},
-                                    'network-id': {'@mcc': '250',
-                                                   '@mnc': '39'}},
-                            'name': 'U-tel'},
-                           {'gsm': {'apn': [{'@value': 'internet.yota',
-                                             'name': ['Internet for LTE modems',
-                                                      {'#text': 'Интернет для '
-                                                                'модемов',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'ru'}],
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'yota.ru',
-                                             'name': ['Internet for LTE modems '
-                                                      '(in case internet.yota '
-                                                      'does not work)',
-                                                      {'#text': 'Интернет для '
-                                                                'модемов (если '
-                                                                'internet.yota '
-                                                                'не работает)',
-                                                       '@{http://www.w3.org/XML/1998/namespace}lang': 'ru'}],
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '250',
-                                                   '@mnc': '11'}},
-                            'name': 'Yota'}]},
-             {'@code': 'sa',
-              'provider': [{'gsm': {'apn': [{'@value': 'web1',
-                                             'name': 'Postpaid',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'web2',
-                                             'name': 'Prepaid',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms1',
-                                             'mmsc': 'http://10.3.3.133:9090/was',
-                                             'mmsproxy': '10.3.2.133:8080',
-                                             'name': 'mobily MMS (Postpaid)',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '420',
-                                                   '@mnc': '03'}},
-                            'name': 'Mobily'},
-                           {'gsm': {'apn': [{'@value': 'jawalnet.com.sa',
-                                             'dns': ['212.118.133.101',
-                                                     '212.118.133.102'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.net.sa',
-                                             'mmsc': 'http://mms.net.sa:8002',
-                                             'mmsproxy': '10.1.1.1:8080',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'mms.net.sa',
-                                             'mmsc': 'http://mms.net.sa:8002',
-                                             'mmsproxy': '10.1.1.1:8080',
-                                             'name': 'ALJAWAL MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '420',
-                                                   '@mnc': '01'}},
-                            'name': 'STC'},
-                           {'gsm': {'apn': {'@value': 'zain',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '420',
-                                                   '@mnc': '04'}},
-                            'name': 'Zain'}]},
-             {'@code': 'se',
-              'provider': [{'@primary': 'true',
-                            'gsm': {'apn': [{'@value': 'data.tre.se',
-                                             'name': 'Mobiltelefon',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'bredband.tre.se',
-                                             'name': 'Bredband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'net.tre.se',
-                                             'name': 'Bredband Kontantkort',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': [{'@mcc': '240',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '240',
-                                                    '@mnc': '04'}]},
-                            'name': '3'},
-                           {'gsm': {'apn': [{'@value': 'bredband.glocalnet.se',
-                                             'name': 'Mobilt Bredband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.glocalnet.se',
-                                             'name': 'Glocalnet Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'services.glocalnet.se',
-                                             'mmsc': 'http://mms',
-                                             'mmsproxy': '172.30.253.241:8799',
-                                             'name': 'Glocalnet MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '240',
-                                                   '@mnc': '08'}},
-                            'name': 'Glocalnet'},
-                           {'gsm': {'apn': [{'@value': 'halebop.telia.se',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.telia.se',
-                                             'mmsc': 'http://mmss/',
-                                             'mmsproxy': '193.209.134.132:80',
-                                             'name': 'Halebop MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '240',
-                                                   '@mnc': '01'}},
-                            'name': 'Halebop'},
-                           {'cdma': {'password': 'cdma', 'username': 'cdma'},
-                            'name': 'ice.net (Nordisk Mobiltelefon)'},
-                           {'gsm': {'apn': [{'@value': 'internet.tele2.se',
-                                             'name': 'Mobilt Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mobileinternet.tele2.se',
-                                             'name': 'Mobilt Bredband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'balance-check': {'dtmf': '211',
-                                                      'ussd': '*111#'},
-                                    'network-id': [{'@mcc': '240',
-                                                    '@mnc': '07'},
-                                                   {'@mcc': '240',
-                                                    '@mnc': '05'}],
-                                    'voicemail': '222'},
-                            'name': 'Tele2'},
-                           {'gsm': {'apn': [{'@value': 'data.comviq.se',
-                                             'name': 'Surf',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.tele2.se',
-                                             'name': 'Tele2 Comviq 3G',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mobileinternet.tele2.se',
-                                             'name': 'Tele2 Comviq 3G (7,2 '
-                                                     'Mbit/s)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.tele2.se',
-                                             'mmsc': 'http://mmsc.tele2.se',
-                                             'mmsproxy': '130.244.202.30:8080',
-                                             'name': 'Tele2 MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'dtmf': '211',
-                                                      'ussd': '*111#'},
-                                    'balance-top-up': {'ussd': {'#text': '*110*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': [{'@mcc': '240',
-                                                    '@mnc': '07'},
-                                                   {'@mcc': '240',
-                                                    '@mnc': '05'}],
-                                    'voicemail': '222'},
-                            'name': 'Comviq'},
-                           {'gsm': {'apn': [{'@value': 'mobiflex.telia.se',
-                                             'name': 'Mobiflex',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.telia.se',
-                                             'mmsc': 'http://mmss/',
-                                             'mmsproxy': '193.209.134.132:80',
-                                             'name': 'Telia MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '240',
-                                                    '@mnc': '01'},
-                                                   {'@mcc': '240',
-                                                    '@mnc': '05'}]},
-                            'name': 'Multicom Security'},
-                           {'gsm': {'apn': [{'@value': 'internet.telenor.se',
-                                             'name': 'Mobilt Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'services.telenor.se',
-                                             'name': 'Mobilsurf med maxtaxa',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'bredband.telenor.se',
-                                             'name': 'Mobilt Bredband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'sp-services',
-                                             'mmsc': 'http://mms',
-                                             'mmsproxy': '172.30.253.241:8799',
-                                             'name': 'Cellmobile MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*222#'},
-                                    'network-id': [{'@mcc': '240',
-                                                    '@mnc': '04'},
-                                                   {'@mcc': '240',
-                                                    '@mnc': '06'},
-                                                   {'@mcc': '240',
-                                                    '@mnc': '08'}],
-                                    'voicemail': '888'},
-                            'name': 'Telenor'},
-                           {'gsm': {'apn': {'@value': 'online.telia.se',
-                                            'name': 'Telia 3G',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': ['*120#',
-                                                               '*121#']},
-                                    'network-id': [{'@mcc': '240',
-                                                    '@mnc': '01'},
-                                                   {'@mcc': '240',
-                                                    '@mnc': '05'}],
-                                    'voicemail': '*133#'},
-                            'name': 'Telia'},
-                           {'gsm': {'apn': [{'@value': 'internet.se',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'data.tre.se',
-                                             'mmsc': 'http://mms.tre.se',
-                                             'mmsproxy': 'mmsproxy.tre.se:8799',
-                                             'name': '3mms',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '240',
-                                                   '@mnc': '14'}},
-                            'name': 'TDC'},
-                           {'gsm': {'apn': {'@value': 'internet.djuice.se',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '240',
-                                                   '@mnc': '09'}},
-                            'name': 'djuice'},
-                           {'gsm': {'apn': {'@value': 'bredband.comhem.se',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': [{'@mcc': '240',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '240',
-                                                    '@mnc': '04'}]},
-                            'name': 'Com Hem'},
-                           {'gsm': {'apn': {'@value': 'internet.parlino.se',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '240',
-                                                   '@mnc': '07'}},
-                            'name': 'Parlino'},
-                           {'gsm': {'apn': [{'@value': 'sp-internet',
-                                             'name': 'Mobilt Bredband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet.uvtc.com',
-                                             'name': 'Mobilt Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}]},
-                            'name': 'Universal Telecom'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.se',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmse'},
-                                    'balance-check': {'ussd': '*102#'},
-                                    'balance-top-up': {'ussd': {'#text': '*101*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '240',
-                                                   '@mnc': '12'}},
-                            'name': 'Lycamobile'}]},
-             {'@code': 'sg',
-              'provider': [{'gsm': {'apn': [{'@value': 'sunsurf',
-                                             'dns': ['202.79.64.21',
-                                                     '202.79.64.26'],
-                                             'name': 'SunSurf/Mobile Broadband '
-                                                     '(postpaid)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': '65'},
-                                            {'@value': 'miworld',
-                                             'name': 'MiWorld Mobile '
-                                                     '(postpaid)',
-                                             'password': 'user123',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': '65(mobilenumber)'},
-                                            {'@value': 'miworldcard',
-                                             'name': 'MiWorld Mobile (prepaid)',
-                                             'password': 'user123',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': '65(mobilenumber)'},
-                                            {'@value': 'prepaidbb',
-                                             'name': 'Mobile Broadband '
-                                                     '(prepaid)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'sunsurfmcard',
-                                             'name': 'M Card (prepaid)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'miworld',
-                                             'mmsc': 'http://mmsgw:8002/',
-                                             'mmsproxy': '172.16.14.10:8080',
-                                             'name': 'M1 MMS',
-                                             'password': 'user123',
-                                             'usage': {'@type': 'mms'},
-                                             'username': '+65'}],
-                                    'network-id': {'@mcc': '525',
-                                                   '@mnc': '03'}},
-                            'name': 'M1'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['165.21.100.88',
-                                                     '165.21.83.88'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'e-ideas',
-                                             'mmsc': 'http://mms.singtel.com:10021/mmsc',
-                                             'mmsproxy': '165.21.42.84:8080',
-                                             'name': 'IDEAS MMS',
-                                             'password': 'IDEAS',
-                                             'usage': {'@type': 'mms'},
-                                             'username': '65IDEAS'}],
-                                    'network-id': [{'@mcc': '525',
-                                                    '@mnc': '01'},
-                                                   {'@mcc': '525',
-                                                    '@mnc': '02'}]},
-                            'name': 'SingTel'},
-                           {'gsm': {'apn': [{'@value': 'shwap',
-                                             'dns': '203.116.1.78',
-                                             'name': 'WAP',
-                                             'password': 'hub',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'},
-                                             'username': 'star'},
-                                            {'@value': 'shppd',
-                                             'name': 'MaxMobile Broadband '
-                                                     '(prepaid)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'shinternet',
-                                             'name': 'MaxMobile Broadband '
-                                                     '(postpaid)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'shmms',
-                                             'mmsc': 'http://mms.starhubgee.com.sg:8002/',
-                                             'mmsproxy': '10.12.1.80:80',
-                                             'name': 'Gee! MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*123*1*1#'},
-                                    'network-id': {'@mcc': '525',
-                                                   '@mnc': '05'}},
-                            'name': 'Starhub'}]},
-             {'@code': 'si',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['213.229.248.161',
-                                                     '193.189.160.11'],
-                                             'name': 'Postpaid',
-                                             'password': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mobitel'},
-                                            {'@value': 'internetpro',
-                                             'dns': ['213.229.248.161',
-                                                     '193.189.160.11'],
-                                             'password': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mobitel'}],
-                                    'network-id': {'@mcc': '293',
-                                                   '@mnc': '41'}},
-                            'name': 'Mobitel'},
-                           {'gsm': {'apn': [{'@value': 'internet.simobil.si',
-                                             'dns': ['121.30.86.130',
-                                                     '193.189.160.11'],
-                                             'password': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'simobil'},
-                                            {'@value': 'mms.simobil.si',
-                                             'mmsc': 'http://mmc/',
-                                             'mmsproxy': '80.95.224.46:9201',
-                                             'name': 'SI mobil MMS',
-                                             'password': 'internet',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'simobil'}],
-                                    'msisdn-query': {'ussd': '*100#'},
-                                    'network-id': {'@mcc': '293',
-                                                   '@mnc': '40'}},
-                            'name': 'Vodafone / Simobil'},
-                           {'gsm': {'apn': [{'@value': 'internet.t-2.net',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.t-2.net',
-                                             'mmsc': 'http://www.mms.t-2.net:8002',
-                                             'mmsproxy': '172.20.18.137:8080',
-                                             'name': 'T2 MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '293',
-                                                   '@mnc': '64'}},
-                            'name': 'T-2'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'name': 'NET2GO/FREE2GO',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*123#'},
-                                    'balance-top-up': {'ussd': {'#text': '*123*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '293',
-                                                   '@mnc': '70'}},
-                            'name': 'Telemach'}]},
-             {'@code': 'sk',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['195.91.0.17',
-                                                     '194.154.227.17'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms',
-                                             'mmsproxy': '192.168.1.1:8080',
-                                             'name': 'T-Mobile MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': [{'@mcc': '231',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '231',
-                                                    '@mnc': '04'}]},
-                            'name': 'Slovak Telekom'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'dns': ['213.151.200.31',
-                                                    '213.151.208.162'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '231',
-                                                   '@mnc': '01'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': [{'@value': 'o2internet',
-                                             'dns': ['160.218.161.60',
-                                                     '194.228.211.33'],
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'o2mms',
-                                             'mmsc': 'http://mms.o2world.sk:8002',
-                                             'mmsproxy': '10.97.1.11:8080',
-                                             'name': 'O2 SK MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '231',
-                                                   '@mnc': '06'}},
-                            'name': 'O2'}]},
-             {'@code': 'sn',
-              'provider': {'gsm': {'apn': {'@value': 'wap.sentelgsm.com',
-                                           'dns': ['200.85.0.104',
-                                                   '200.85.0.107'],
-                                           'plan': {'@type': 'postpaid'},
-                                           'usage': {'@type': 'internet'}},
-                                   'network-id': {'@mcc': '608', '@mnc': '02'}},
-                           'name': 'Tigo'}},
-             {'@code': 'sv',
-              'provider': [{'gsm': {'apn': {'@value': 'internet.movistar.sv',
-                                            'password': 'movistarsv',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'movistarsv'},
-                                    'network-id': {'@mcc': '706',
-                                                   '@mnc': '04'}},
-                            'name': 'Movistar'},
-                           {'gsm': {'apn': [{'@value': 'wap.digicelsv.com',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'wap.digicelsv.com',
-                                             'mmsc': 'http://172.26.5.132/servlets/mms',
-                                             'mmsproxy': '172.26.5.12:8080',
-                                             'name': 'Digicel El Salvador MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '706',
-                                                   '@mnc': '02'}},
-                            'name': 'digicel'},
-                           {'gsm': {'apn': {'@value': 'internet.tigo.sv',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '706',
-                                                   '@mnc': '03'}},
-                            'name': 'Tigo'},
-                           {'gsm': {'apn': {'@value': 'internet.ideasclaro',
-                                            'name': 'Internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '706',
-                                                   '@mnc': '01'}},
-                            'name': 'Claro'}]},
-             {'@code': 'sd',
-              'provider': [{'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*888#'},
-                                    'balance-top-up': {'ussd': {'#text': '*888*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '634',
-                                                   '@mnc': '01'}},
-                            'name': 'Zain'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '634',
-                                                   '@mnc': '02'}},
-                            'name': 'MTN'},
-                           {'cdma': {'password': 'sudani',
-                                     'username': 'sudani'},
-                            'gsm': {'apn': {'@value': 'sudaninet',
-                                            'password': 'sudani',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'sudani'},
-                                    'network-id': {'@mcc': '634',
-                                                   '@mnc': '07'}},
-                            'name': 'Sudani'}]},
-             {'@code': 'th',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['202.183.255.20',
-                                                     '202.183.255.21'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'multimedia',
-                                             'mmsc': 'http://mms.mobilelife.co.th',
-                                             'mmsproxy': '203.170.229.34:8080',
-                                             'name': 'AIS-GPRS-3 MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '520',
-                                                   '@mnc': '01'}},
-                            'name': 'AIS'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'authentication': {'@method': 'chap'},
-                                             'dns': ['202.183.255.20',
-                                                     '202.183.255.21'],
-                                             'name': 'AIS internet',
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'authentication': {'@method': 'chap'},
-                                             'mmsc': 'http://mms.ais.co.th',
-                                             'mmsproxy': '203.170.229.34:8080',
-                                             'name': 'AIS MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '520',
-                                                   '@mnc': '03'}},
-                            'name': 'AIS (AWN)'},
-                           {'gsm': {'apn': [{'@value': 'www.dtac.co.th',
-                                             'dns': ['202.44.202.2',
-                                                     '203.44.144.33'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.dtac.co.th:8002/',
-                                             'mmsproxy': '203.155.200.133:8080',
-                                             'name': 'DTAC-GPRS-3 MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '520',
-                                                   '@mnc': '18'}},
-                            'name': 'DTAC'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'password': 'true',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'true'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.trueworld.net:8002/',
-                                             'mmsproxy': '10.4.7.39:8080',
-                                             'name': 'True GPRS 3 MMS',
-                                             'password': 'true',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'true'}],
-                                    'network-id': {'@mcc': '520',
-                                                   '@mnc': '99'}},
-                            'name': 'True Move'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '520',
-                                                   '@mnc': '15'}},
-                            'name': 'TOT 3G'}]},
-             {'@code': 'tn',
-              'provider': [{'gsm': {'apn': [{'@value': 'weborange',
-                                             'name': 'Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.otun',
-                                             'name': 'Internet + MMS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'keygp',
-                                             'name': 'Internet Everywhere '
-                                                     'Prepaid',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'keypro',
-                                             'name': 'Internet Everywhere '
-                                                     'Professional',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '605',
-                                                   '@mnc': '01'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': [{'@value': 'mms.tn',
-                                             'name': 'MMS',
-                                             'password': 'mms',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms@tt1'},
-                                            {'@value': 'gprs.tn',
-                                             'name': 'GPRS DATA',
-                                             'password': 'gprs',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'gprs'},
-                                            {'@value': 'internet.tn',
-                                             'name': 'WEB DATA',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.tn',
-                                             'mmsc': 'http://mms',
-                                             'mmsproxy': '213.150.186.106:8080',
-                                             'name': 'MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms@tt1'}],
-                                    'network-id': {'@mcc': '605',
-                                                   '@mnc': '02'}},
-                            'name': 'Tunisie Télécom / TUNTEL'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.tn',
-                                            'password': 'plus',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'lmtn'},
-                                    'balance-check': {'ussd': '*143#'},
-                                    'balance-top-up': {'ussd': {'#text': '*143*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '605',
-                                                   '@mnc': '02'}},
-                            'name': 'Lycamobile'},
-                           {'gsm': {'apn': [{'@value': 'internet.tunisiana.com',
-                                             'name': 'Internet',
-                                             'password': 'internet',
-                                             'username': 'internet'},
-                                            {'@value': 'mms.tunisiana.com',
-                                             'mmsc': 'http://mmsc.tunisiana.com',
-                                             'mmsproxy': '10.3.2.100:80',
-                                             'name': 'mms tunisiana',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '605',
-                                                   '@mnc': '03'}},
-                            'name': 'Tunisiana'}]},
-             {'@code': 'tr',
-              'provider': [{'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['212.156.4.4',
-                                                     '212.156.4.20'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'aycell',
-                                             'dns': ['212.156.4.1',
-                                                     '212.156.4.4'],
-                                             'name': '(former Aycell)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.avea.com.tr/servlets/mms',
-                                             'mmsproxy': '213.161.151.201:8080',
-                                             'name': 'Avea MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': [{'@mcc': '286',
-                                                    '@mnc': '03'},
-                                                   {'@mcc': '286',
-                                                    '@mnc': '04'}]},
-                            'name': 'Avea'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'Turkcell internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mgb',
-                                             'name': 'Turkcell 3G',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.turkcell.com.tr/servlets/mms',
-                                             'mmsproxy': '212.252.169.217:8080',
-                                             'name': 'Turkcell MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '286',
-                                                   '@mnc': '01'}},
-                            'name': 'Turkcell'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'name': 'Vodafone Internet',
-                                             'password': 'vodafone',
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'vodafone'},
-                                            {'@value': 'edge.kktctelsim.com',
-                                             'name': 'KKTC Telsim',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'msisdn-query': {'ussd': '*101#'},
-                                    'network-id': {'@mcc': '286',
-                                                   '@mnc': '02'}},
-                            'name': 'Vodafone'}]},
-             {'@code': 'tt',
-              'provider': [{'gsm': {'apn': [{'@value': 'wap.digiceltt.com',
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'wap'},
-                                            {'@value': 'wap.digiceltt.com',
-                                             'mmsc': 'http://mmc.digiceltt.com/servlets/mms',
-                                             'mmsproxy': '172.20.6.12:8080',
-                                             'name': 'Digicel Trinidad MMS',
-                                             'password': 'wap',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'wap'}],
-                                    'network-id': {'@mcc': '374',
-                                                   '@mnc': '13'}},
-                            'name': 'Digicel'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'password': 'wap',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'wap'},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://192.168.210.104/mmrelay.app',
-                                             'mmsproxy': '192.168.210.104:8080',
-                                             'name': 'Bmobile mms',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '374',
-                                                   '@mnc': '12'}},
-                            'name': 'bmobile / TSTT'}]},
-             {'@code': 'tw',
-              'provider': [{'gsm': {'apn': [{'@value': 'emome',
-                                             'password': 'web',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'web'},
-                                            {'@value': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'emome',
-                                             'mmsc': 'http://mms.emome.net:8002',
-                                             'mmsproxy': '10.1.1.1:8080',
-                                             'name': 'CHT MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '466',
-                                                   '@mnc': '92'}},
-                            'name': ['Chunghwa Telecom (emome)',
-                                     {'#text': '中華電信 (emome)',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'zh'}]},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'fetnet01',
-                                             'mmsc': 'http://mms',
-                                             'mmsproxy': '210.241.199.199:9201',
-                                             'name': '遠傳影音訊息',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '466',
-                                                   '@mnc': '01'}},
-                            'name': ['Far EasTone / KGT',
-                                     {'#text': '遠傳電信 / 和信電訊',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'zh'}]},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms',
-                                             'mmsproxy': '211.78.224.100:8080',
-                                             'name': 'catch MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '466',
-                                                   '@mnc': '99'}},
-                            'name': ['TW Mobile',
-                                     {'#text': '台湾大哥大',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'zh'}]},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'vibo',
-                                             'mmsc': 'http://mms',
-                                             'mmsproxy': '172.24.128.36:8080',
-                                             'name': 'VIBO行動網-MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '466',
-                                                   '@mnc': '97'}},
-                            'name': ['TransAsia',
-                                     {'#text': '泛亞電信',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'zh'}]},
-                           {'gsm': {'apn': [{'@value': 'vibo',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'MMS',
-                                             'mmsproxy': '10.154.0.12',
-                                             'name': 'Vodacom MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '466',
-                                                   '@mnc': '89'}},
-                            'name': ['Vibo Telecom / Aurora',
-                                     {'#text': '威寶電信 (Vibo) / 震旦電信 (Aurora)',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'zh'}]},
-                           {'cdma': None,
-                            'name': ['Asia Pacific Telecom (APBW)',
-                                     {'#text': '亞太電信 (亞太行動寬頻電信)',
-                                      '@{http://www.w3.org/XML/1998/namespace}lang': 'zh'}]}]},
-             {'@code': 'tz',
-              'provider': [{'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '640',
-                                                   '@mnc': '05'}},
-                            'name': 'Airtel Tanzania'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '640',
-                                                   '@mnc': '04'}},
-                            'name': 'Vodacom'},
-                           {'cdma': {'password': None,
-                                     'username': '@zantel.com'},
-                            'gsm': {'apn': {'@value': 'znet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '640',
-                                                   '@mnc': '03'}},
-                            'name': 'Zantel'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '640',
-                                                   '@mnc': '02'}},
-                            'name': 'tiGO'},
-                           {'cdma': {'password': 'sasatel',
-                                     'sid': {'@value': '9891'},
-                                     'username': 'sasatel'},
-                            'name': 'Sasatel'},
-                           {'cdma': None, 'name': 'TTCL'}]},
-             {'@code': 'ua',
-              'provider': [{'gsm': {'apn': [{'@value': 'www.ab.kyivstar.net',
-                                             'name': 'Ace&Base',
-                                             'password': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'igprs'},
-                                            {'@value': 'www.kyivstar.net',
-                                             'name': 'Contract GPRS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': '3g.kyivstar.net',
-                                             'name': 'Internet 3G',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.kyivstar.net',
-                                             'mmsc': 'http://mms.kyivstar.net',
-                                             'mmsproxy': '10.10.10.10:8080',
-                                             'name': 'Kyivstar MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '255',
-                                                   '@mnc': '03'}},
-                            'name': 'kyivstar'},
-                           {'gsm': {'apn': [{'@value': 'www.djuice.com.ua',
-                                             'name': 'Internet GPRS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'xl.kyivstar.net',
-                                             'name': 'Internet XL',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': '3g.kyivstar.net',
-                                             'name': 'Internet 3G',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '255',
-                                                   '@mnc': '03'}},
-                            'name': 'Djuice'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['212.58.160.33',
-                                                     '212.58.160.34'],
-                                             'name': 'Standard',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'speed',
-                                             'dns': ['212.58.160.33',
-                                                     '212.58.160.34'],
-                                             'name': 'Faster',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'balance-check': {'ussd': '*111#'},
-                                    'network-id': {'@mcc': '255',
-                                                   '@mnc': '06'}},
-                            'name': 'life:)'},
-                           {'gsm': {'apn': {'@value': 'internet.beeline.ua',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '255',
-                                                   '@mnc': '02'}},
-                            'name': 'Beeline'},
-                           {'gsm': {'apn': [{'@value': 'www.jeans.ua',
-                                             'dns': ['80.255.64.23',
-                                                     '80.255.64.24'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'hyper.net',
-                                             'dns': ['212.58.160.33',
-                                                     '212.58.160.34'],
-                                             'name': 'Hyper.NET',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '255',
-                                                   '@mnc': '01'}},
-                            'name': 'Jeans'},
-                           {'cdma': {'name': 'MTS Connect 3G',
-                                     'password': 'internet',
-                                     'sid': {'@value': '15907'},
-                                     'username': 'mobile'},
-                            'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['212.58.160.33',
-                                                     '212.58.160.34'],
-                                             'name': 'GPRS Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'internet'},
-                                            {'@value': 'hyper.net',
-                                             'name': 'Hyper.NET',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'active',
-                                             'name': 'HyperActive',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'www.umc.ua',
-                                             'dns': ['80.255.64.23',
-                                                     '80.255.64.24'],
-                                             'name': 'umc.ua',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '255',
-                                                   '@mnc': '01'}},
-                            'name': 'MTS'},
-                           {'gsm': {'apn': [{'@value': '3g.utel.ua',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': '3g.utel.ua',
-                                             'mmsc': 'http://10.212.1.4/mms/wapenc',
-                                             'mmsproxy': '10.212.3.148:8080',
-                                             'name': 'Utel MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '255',
-                                                   '@mnc': '07'}},
-                            'name': 'Utel'},
-                           {'cdma': {'password': 'cdma', 'username': 'cdma'},
-                            'name': 'CDMA Ukraine'},
-                           {'cdma': {'password': 'IT',
-                                     'sid': {'@value': '15906'},
-                                     'username': 'IT@IT'},
-                            'name': 'InterTelecom'},
-                           {'cdma': None, 'name': 'PEOPLEnet'}]},
-             {'@code': 'ug',
-              'provider': [{'gsm': {'apn': {'@value': 'yellopix.mtn.co.ug',
-                                            'dns': ['193.108.252.50',
-                                                    '193.108.252.51'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '641',
-                                                   '@mnc': '10'}},
-                            'name': 'MTN'},
-                           {'gsm': {'apn': [{'@value': 'orange.ug',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.warid.co.ug',
-                                             'mmsc': 'http://mms.waridtel.co.ug',
-                                             'name': 'warid mms',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '641',
-                                                   '@mnc': '14'}},
-                            'name': 'Orange'},
-                           {'gsm': {'apn': [{'@value': 'utbroadband',
-                                             'name': 'Mobile Broadband',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'utweb',
-                                             'name': 'Mobile Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'utwap',
-                                             'mmsc': 'http://mmsc.ugandatelecom.com/',
-                                             'mmsproxy': '10.76.101.51:8080',
-                                             'name': 'Ug Telcom MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '641',
-                                                   '@mnc': '11'}},
-                            'name': 'UTL'},
-                           {'gsm': {'apn': {'@value': 'web.waridtel.co.ug',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '641',
-                                                   '@mnc': '22'}},
-                            'name': 'Warid'},
-                           {'gsm': {'apn': {'@value': 'web.ug.zain.com',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '641',
-                                                   '@mnc': '01'}},
-                            'name': 'Zain'}]},
-             {'@code': 'us',
-              'provider': [{'gsm': {'apn': [{'@value': 'wap.cingular',
-                                             'name': 'MEdia Net (phones)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'Broadband',
-                                             'name': 'LaptopConnect (data '
-                                                     'cards)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'isp.cingular',
-                                             'name': 'Data Connect (old)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'pta',
-                                             'name': 'LTE',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'wap.cingular',
-                                             'mmsc': 'http://mmsc.cingular.com',
-                                             'mmsproxy': 'wireless.cingular.com:80',
-                                             'name': 'AT&T MMS',
-                                             'password': 'CINGULAR1',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'WAP@CINGULARGPRS.COM'}],
-                                    'network-id': [{'@mcc': '310',
-                                                    '@mnc': '038'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '090'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '150'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '410'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '560'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '680'}]},
-                            'name': 'AT&T'},
-                           {'gsm': {'apn': [{'@value': 'fast.t-mobile.com',
-                                             'name': 'LTE',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'epc.tmobile.com',
-                                             'dns': ['10.177.0.34',
-                                                     '10.164.103.44'],
-                                             'name': 'Internet/WebConnect',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'wap.voicestream.com',
-                                             'name': 'Web2Go/t-zones',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet2.voicestream.com',
-                                             'name': 'Internet (old)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'internet3.voicestream.com',
-                                             'name': 'Internet with VPN (old)',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': [{'@mcc': '310',
-                                                    '@mnc': '026'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '160'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '200'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '210'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '220'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '230'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '240'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '250'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '260'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '270'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '310'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '490'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '580'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '660'},
-                                                   {'@mcc': '310',
-                                                    '@mnc': '800'}],
-                                    'voicemail': '123'},
-                            'name': 'T-Mobile'},
-                           {'gsm': {'apn': [{'@value': 'wap.gocbw.com',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'cbw'},
-                                            {'@value': 'wap.gocbw.com',
-                                             'mmsc': 'http://mms.gocbw.com:8088/mms',
-                                             'mmsproxy': '216.68.79.202:80',
-                                             'name': 'CBW MMS',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'cbw'}],
-                                    'network-id': {'@mcc': '310',
-                                                   '@mnc': '420'}},
-                            'name': 'Cincinnati Bell Wireless'},
-                           {'cdma': {'sid': [{'@value': '4103'},
-                                             {'@value': '4106'},
-                                             {'@value': '4107'},
-                                             {'@value': '4120'},
-                                             {'@value': '4121'},
-                                             {'@value': '4124'},
-                                             {'@value': '4126'},
-                                             {'@value': '4132'},
-                                             {'@value': '4135'},
-                                             {'@value': '4139'},
-                                             {'@value': '4144'},
-                                             {'@value': '4145'},
-                                             {'@value': '4148'},
-                                             {'@value': '4151'},
-                                             {'@value': '4153'},
-                                             {'@value': '4155'},
-                                             {'@value': '4157'},
-                                             {'@value': '4159'},
-                                             {'@value': '4162'},
-                                             {'@value': '4164'},
-                                             {'@value': '4166'},
-                                             {'@value': '4168'},
-                                             {'@value': '4170'},
-                                             {'@value': '4171'},
-                                             {'@value': '4174'},
-                                             {'@value': '4180'},
-                                             {'@value': '4181'},
-                                             {'@value': '4183'},
-                                             {'@value': '4184'},
-                                             {'@value': '4186'},
-                                             {'@value': '4188'},
-                                             {'@value': '4190'},
-                                             {'@value': '4194'},
-                                             {'@value': '4195'},
-                                             {'@value': '4198'},
-                                             {'@value': '4274'},
-                                             {'@value': '4376'},
-                                             {'@value': '4379'},
-                                             {'@value': '4384'},
-                                             {'@value': '4390'},
-                                             {'@value': '4396'},
-                                             {'@value': '4418'},
-                                             {'@value': '4622'},
-                                             {'@value': '4654'},
-                                             {'@value': '4694'},
-                                             {'@value': '4812'},
-                                             {'@value': '4982'},
-                                             {'@value': '5116'},
-                                             {'@value': '5142'}]},
-                            'name': 'Sprint'},
-                           {'cdma': None, 'name': 'Boost Mobile (Prepaid)'},
-                           {'cdma': {'sid': [{'@value': '2'},
-                                             {'@value': '4'},
-                                             {'@value': '5'},
-                                             {'@value': '6'},
-                                             {'@value': '8'},
-                                             {'@value': '12'},
-                                             {'@value': '15'},
-                                             {'@value': '17'},
-                                             {'@value': '18'},
-                                             {'@value': '20'},
-                                             {'@value': '21'},
-                                             {'@value': '22'},
-                                             {'@value': '26'},
-                                             {'@value': '28'},
-                                             {'@value': '30'},
-                                             {'@value': '32'},
-                                             {'@value': '33'},
-                                             {'@value': '37'},
-                                             {'@value': '40'},
-                                             {'@value': '41'},
-                                             {'@value': '48'},
-                                             {'@value': '51'},
-                                             {'@value': '54'},
-                                             {'@value': '56'},
-                                             {'@value': '58'},
-                                             {'@value': '59'},
-                                             {'@value': '60'},
-                                             {'@value': '64'},
-                                             {'@value': '65'},
-                                             {'@value': '69'},
-                                             {'@value': '73'},
-                                             {'@value': '75'},
-                                             {'@value': '78'},
-                                             {'@value': '80'},
-                                             {'@value': '86'},
-                                             {'@value': '92'},
-                                             {'@value': '93'},
-                                             {'@value': '94'},
-                                             {'@value': '95'},
-                                             {'@value': '96'},
-                                             {'@value': '104'},
-                                             {'@value': '107'},
-                                             {'@value': '110'},
-                                             {'@value': '112'},
-                                             {'@value': '113'},
-                                             {'@value': '119'},
-                                             {'@value': '126'},
-                                             {'@value': '127'},
-                                             {'@value': '133'},
-                                             {'@value': '137'},
-                                             {'@value': '139'},
-                                             {'@value': '143'},
-                                             {'@value': '150'},
-                                             {'@value': '154'},
-                                             {'@value': '162'},
-                                             {'@value': '163'},
-                                             {'@value': '165'},
-                                             {'@value': '170'},
-                                             {'@value': '172'},
-                                             {'@value': '179'},
-                                             {'@value': '180'},
-                                             {'@value': '181'},
-                                             {'@value': '186'},
-                                             {'@value': '189'},
-                                             {'@value': '190'},
-                                             {'@value': '203'},
-                                             {'@value': '213'},
-                                             {'@value': '214'},
-                                             {'@value': '222'},
-                                             {'@value': '224'},
-                                             {'@value': '226'},
-                                             {'@value': '228'},
-                                             {'@value': '241'},
-                                             {'@value': '250'},
-                                             {'@value': '258'},
-                                             {'@value': '262'},
-                                             {'@value': '263'},
-                                             {'@value': '266'},
-                                             {'@value': '272'},
-                                             {'@value': '276'},
-                                             {'@value': '284'},
-                                             {'@value': '286'},
-                                             {'@value': '294'},
-                                             {'@value': '298'},
-                                             {'@value': '299'},
-                                             {'@value': '300'},
-                                             {'@value': '314'},
-                                             {'@value': '316'},
-                                             {'@value': '319'},
-                                             {'@value': '323'},
-                                             {'@value': '328'},
-                                             {'@value': '329'},
-                                             {'@value': '330'},
-                                             {'@value': '349'},
-                                             {'@value': '356'},
-                                             {'@value': '377'},
-                                             {'@value': '385'},
-                                             {'@value': '404'},
-                                             {'@value': '428'},
-                                             {'@value': '443'},
-                                             {'@value': '456'},
-                                             {'@value': '465'},
-                                             {'@value': '482'},
-                                             {'@value': '483'},
-                                             {'@value': '486'},
-                                             {'@value': '490'},
-                                             {'@value': '498'},
-                                             {'@value': '502'},
-                                             {'@value': '506'},
-                                             {'@value': '528'},
-                                             {'@value': '530'},
-                                             {'@value': '532'},
-                                             {'@value': '539'},
-                                             {'@value': '1015'},
-                                             {'@value': '1026'},
-                                             {'@value': '1032'},
-                                             {'@value': '1034'},
-                                             {'@value': '1062'},
-                                             {'@value': '1072'},
-                                             {'@value': '1074'},
-                                             {'@value': '1076'},
-                                             {'@value': '1083'},
-                                             {'@value': '1086'},
-                                             {'@value': '1088'},
-                                             {'@value': '1094'},
-                                             {'@value': '1103'},
-                                             {'@value': '1129'},
-                                             {'@value': '1131'},
-                                             {'@value': '1137'},
-                                             {'@value': '1139'},
-                                             {'@value': '1145'},
-                                             {'@value': '1151'},
-                                             {'@value': '1153'},
-                                             {'@value': '1164'},
-                                             {'@value': '1166'},
-                                             {'@value': '1174'},
-                                             {'@value': '1180'},
-                                             {'@value': '1189'},
-                                             {'@value': '1193'},
-                                             {'@value': '1196'},
-                                             {'@value': '1220'},
-                                             {'@value': '1224'},
-                                             {'@value': '1227'},
-                                             {'@value': '1230'},
-                                             {'@value': '1267'},
-                                             {'@value': '1285'},
-                                             {'@value': '1330'},
-                                             {'@value': '1358'},
-                                             {'@value': '1417'},
-                                             {'@value': '1429'},
-                                             {'@value': '1476'},
-                                             {'@value': '1488'},
-                                             {'@value': '1492'},
-                                             {'@value': '1494'},
-                                             {'@value': '1506'},
-                                             {'@value': '1510'},
-                                             {'@value': '1514'},
-                                             {'@value': '1516'},
-                                             {'@value': '1517'},
-                                             {'@value': '1519'},
-                                             {'@value': '1523'},
-                                             {'@value': '1548'},
-                                             {'@value': '1552'},
-                                             {'@value': '1563'},
-                                             {'@value': '1567'},
-                                             {'@value': '1614'},
-                                             {'@value': '1626'},
-                                             {'@value': '1630'},
-                                             {'@value': '1632'},
-                                             {'@value': '1637'},
-                                             {'@value': '1639'},
-                                             {'@value': '1641'},
-                                             {'@value': '1653'},
-                                             {'@value': '1679'},
-                                             {'@value': '1736'},
-                                             {'@value': '1740'},
-                                             {'@value': '1749'},
-                                             {'@value': '1760'},
-                                             {'@value': '1776'},
-                                             {'@value': '1780'},
-                                             {'@value': '1790'},
-                                             {'@value': '1792'},
-                                             {'@value': '1824'},
-                                             {'@value': '1826'},
-                                             {'@value': '1827'},
-                                             {'@value': '1830'},
-                                             {'@value': '1832'},
-                                             {'@value': '1857'},
-                                             {'@value': '1910'},
-                                             {'@value': '1912'},
-                                             {'@value': '1940'},
-                                             {'@value': '1969'},
-                                             {'@value': '2004'},
-                                             {'@value': '2054'},
-                                             {'@value': '2058'},
-                                             {'@value': '2060'},
-                                             {'@value': '2076'},
-                                             {'@value': '2115'},
-                                             {'@value': '2119'},
-                                             {'@value': '2125'},
-                                             {'@value': '2127'},
-                                             {'@value': '2149'},
-                                             {'@value': '3004'},
-                                             {'@value': '3008'},
-                                             {'@value': '3046'},
-                                             {'@value': '3066'},
-                                             {'@value': '3216'},
-                                             {'@value': '3218'},
-                                             {'@value': '3228'},
-                                             {'@value': '6709'},
-                                             {'@value': '6711'},
-                                             {'@value': '7532'},
-                                             {'@value': '7536'},
-                                             {'@value': '9640'},
-                                             {'@value': '9642'},
-                                             {'@value': '9644'}]},
-                            'gsm': {'apn': [{'@value': 'vzwims',
-                                             'name': '4G LTE Contract',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'vzwinternet',
-                                             'dns': ['66.174.92.14',
-                                                     '69.78.96.14'],
-                                             'name': '4G LTE Contract',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'vzwapp',
-                                             'name': '4G LTE Contract',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'wap'}}],
-                                    'network-id': [{'@mcc': '310',
-                                                    '@mnc': '995'},
-                                                   {'@mcc': '311',
-                                                    '@mnc': '480'}]},
-                            'name': 'Verizon'},
-                           {'cdma': {'sid': [{'@value': '5'},
-                                             {'@value': '104'},
-                                             {'@value': '166'},
-                                             {'@value': '191'},
-                                             {'@value': '193'},
-                                             {'@value': '195'},
-                                             {'@value': '217'},
-                                             {'@value': '221'},
-                                             {'@value': '246'},
-                                             {'@value': '298'},
-                                             {'@value': '303'},
-                                             {'@value': '309'},
-                                             {'@value': '331'},
-                                             {'@value': '333'},
-                                             {'@value': '340'},
-                                             {'@value': '364'},
-                                             {'@value': '384'},
-                                             {'@value': '389'},
-                                             {'@value': '393'},
-                                             {'@value': '413'},
-                                             {'@value': '445'},
-                                             {'@value': '580'},
-                                             {'@value': '599'},
-                                             {'@value': '1059'},
-                                             {'@value': '1061'},
-                                             {'@value': '1075'},
-                                             {'@value': '1173'},
-                                             {'@value': '1175'},
-                                             {'@value': '1200'},
-                                             {'@value': '1211'},
-                                             {'@value': '1213'},
-                                             {'@value': '1219'},
-                                             {'@value': '1223'},
-                                             {'@value': '1228'},
-                                             {'@value': '1229'},
-                                             {'@value': '1237'},
-                                             {'@value': '1272'},
-                                             {'@value': '1317'},
-                                             {'@value': '1320'},
-                                             {'@value': '1399'},
-                                             {'@value': '1403'},
-                                             {'@value': '1406'},
-                                             {'@value': '1419'},
-                                             {'@value': '1425'},
-                                             {'@value': '1427'},
-                                             {'@value': '1484'},
-                                             {'@value': '1521'},
-                                             {'@value': '1541'},
-                                             {'@value': '1543'},
-                                             {'@value': '1574'},
-                                             {'@value': '1595'},
-                                             {'@value': '1607'},
-                                             {'@value': '1610'},
-                                             {'@value': '1643'},
-                                             {'@value': '1753'},
-                                             {'@value': '1779'},
-                                             {'@value': '1783'},
-                                             {'@value': '1794'},
-                                             {'@value': '1802'},
-                                             {'@value': '1819'},
-                                             {'@value': '1821'},
-                                             {'@value': '1881'},
-                                             {'@value': '1914'},
-                                             {'@value': '1983'},
-                                             {'@value': '2066'},
-                                             {'@value': '2141'}]},
-                            'name': 'US Cellular'},
-                           {'cdma': {'sid': [{'@value': '32'},
-                                             {'@value': '42'},
-                                             {'@value': '52'},
-                                             {'@value': '53'},
-                                             {'@value': '54'},
-                                             {'@value': '57'},
-                                             {'@value': '71'},
-                                             {'@value': '74'},
-                                             {'@value': '79'},
-                                             {'@value': '83'},
-                                             {'@value': '84'},
-                                             {'@value': '85'},
-                                             {'@value': '97'},
-                                             {'@value': '100'},
-                                             {'@value': '114'},
-                                             {'@value': '116'},
-                                             {'@value': '120'},
-                                             {'@value': '126'},
-                                             {'@value': '130'},
-                                             {'@value': '142'},
-                                             {'@value': '144'},
-                                             {'@value': '152'},
-                                             {'@value': '156'},
-                                             {'@value': '182'},
-                                             {'@value': '186'},
-                                             {'@value': '188'},
-                                             {'@value': '202'},
-                                             {'@value': '204'},
-                                             {'@value': '205'},
-                                             {'@value': '208'},
-                                             {'@value': '212'},
-                                             {'@value': '216'},
-                                             {'@value': '220'},
-                                             {'@value': '240'},
-                                             {'@value': '244'},
-                                             {'@value': '256'},
-                                             {'@value': '260'},
-                                             {'@value': '272'},
-                                             {'@value': '281'},
-                                             {'@value': '282'},
-                                             {'@value': '292'},
-                                             {'@value': '304'},
-                                             {'@value': '306'},
-                                             {'@value': '312'},
-                                             {'@value': '318'},
-                                             {'@value': '338'},
-                                             {'@value': '342'},
-                                             {'@value': '344'},
-                                             {'@value': '348'},
-                                             {'@value': '350'},
-                                             {'@value': '368'},
-                                             {'@value': '374'},
-                                             {'@value': '376'},
-                                             {'@value': '386'},
-                                             {'@value': '387'},
-                                             {'@value': '392'},
-                                             {'@value': '396'},
-                                             {'@value': '416'},
-                                             {'@value': '418'},
-                                             {'@value': '424'},
-                                             {'@value': '430'},
-                                             {'@value': '440'},
-                                             {'@value': '444'},
-                                             {'@value': '448'},
-                                             {'@value': '462'},
-                                             {'@value': '478'},
-                                             {'@value': '487'},
-                                             {'@value': '491'},
-                                             {'@value': '504'},
-                                             {'@value': '518'},
-                                             {'@value': '520'},
-                                             {'@value': '544'},
-                                             {'@value': '546'},
-                                             {'@value': '547'},
-                                             {'@value': '550'},
-                                             {'@value': '558'},
-                                             {'@value': '570'},
-                                             {'@value': '578'},
-                                             {'@value': '1008'},
-                                             {'@value': '1012'},
-                                             {'@value': '1014'},
-                                             {'@value': '1016'},
-                                             {'@value': '1025'},
-                                             {'@value': '1031'},
-                                             {'@value': '1033'},
-                                             {'@value': '1038'},
-                                             {'@value': '1040'},
-                                             {'@value': '1042'},
-                                             {'@value': '1044'},
-                                             {'@value': '1046'},
-                                             {'@value': '1048'},
-                                             {'@value': '1052'},
-                                             {'@value': '1054'},
-                                             {'@value': '1056'},
-                                             {'@value': '1058'},
-                                             {'@value': '1093'},
-                                             {'@value': '1118'},
-                                             {'@value': '1120'},
-                                             {'@value': '1124'},
-                                             {'@value': '1126'},
-                                             {'@value': '1148'},
-                                             {'@value': '1154'},
-                                             {'@value': '1156'},
-                                             {'@value': '1236'},
-                                             {'@value': '1244'},
-                                             {'@value': '1246'},
-                                             {'@value': '1248'},
-                                             {'@value': '1250'},
-                                             {'@value': '1252'},
-                                             {'@value': '1254'},
-                                             {'@value': '1256'},
-                                             {'@value': '1258'},
-                                             {'@value': '1260'},
-                                             {'@value': '1262'},
-                                             {'@value': '1264'},
-                                             {'@value': '1266'},
-                                             {'@value': '1268'},
-                                             {'@value': '1270'},
-                                             {'@value': '1271'},
-                                             {'@value': '1296'},
-                                             {'@value': '1298'},
-                                             {'@value': '1302'},
-                                             {'@value': '1311'},
-                                             {'@value': '1332'},
-                                             {'@value': '1334'},
-                                             {'@value': '1336'},
-                                             {'@value': '1338'},
-                                             {'@value': '1340'},
-                                             {'@value': '1342'},
-                                             {'@value': '1344'},
-                                             {'@value': '1346'},
-                                             {'@value': '1348'},
-                                             {'@value': '1370'},
-                                             {'@value': '1372'},
-                                             {'@value': '1375'},
-                                             {'@value': '1383'},
-                                             {'@value': '1385'},
-                                             {'@value': '1393'},
-                                             {'@value': '1400'},
-                                             {'@value': '1414'},
-                                             {'@value': '1422'},
-                                             {'@value': '1424'},
-                                             {'@value': '1426'},
-                                             {'@value': '1466'},
-                                             {'@value': '1493'},
-                                             {'@value': '1495'},
-                                             {'@value': '1499'},
-                                             {'@value': '1501'},
-                                             {'@value': '1526'},
-                                             {'@value': '1528'},
-                                             {'@value': '1530'},
-                                             {'@value': '1532'},
-                                             {'@value': '1534'},
-                                             {'@value': '1536'},
-                                             {'@value': '1538'},
-                                             {'@value': '1540'},
-                                             {'@value': '1542'},
-                                             {'@value': '1544'},
-                                             {'@value': '1546'},
-                                             {'@value': '1558'},
-                                             {'@value': '1560'},
-                                             {'@value': '1566'},
-                                             {'@value': '1568'},
-                                             {'@value': '1638'},
-                                             {'@value': '1640'},
-                                             {'@value': '1642'},
-                                             {'@value': '1650'},
-                                             {'@value': '1652'},
-                                             {'@value': '1654'},
-                                             {'@value': '1688'},
-                                             {'@value': '1712'},
-                                             {'@value': '1720'},
-                                             {'@value': '1763'},
-                                             {'@value': '1765'},
-                                             {'@value': '1800'},
-                                             {'@value': '1816'},
-                                             {'@value': '1818'},
-                                             {'@value': '1866'},
-                                             {'@value': '1874'},
-                                             {'@value': '1900'},
-                                             {'@value': '1913'},
-                                             {'@value': '1916'},
-                                             {'@value': '1928'},
-                                             {'@value': '1930'},
-                                             {'@value': '1934'},
-                                             {'@value': '1938'},
-                                             {'@value': '1972'},
-                                             {'@value': '1982'},
-                                             {'@value': '1984'},
-                                             {'@value': '1986'},
-                                             {'@value': '1989'},
-                                             {'@value': '1992'},
-                                             {'@value': '2010'},
-                                             {'@value': '2012'},
-                                             {'@value': '2014'},
-                                             {'@value': '2018'},
-                                             {'@value': '2022'},
-                                             {'@value': '2026'},
-                                             {'@value': '2040'},
-                                             {'@value': '2044'},
-                                             {'@value': '2046'},
-                                             {'@value': '2064'},
-                                             {'@value': '2133'},
-                                             {'@value': '3020'},
-                                             {'@value': '3226'},
-                                             {'@value': '3244'},
-                                             {'@value': '3292'},
-                                             {'@value': '30524'},
-                                             {'@value': '30635'}]},
-                            'gsm': {'apn': [{'@value': 'MMS',
-                                             'mmsc': 'http://mms.mycellonephone.com/highland/mms.php',
-                                             'mmsproxy': '66.255.55.23:80',
-                                             'name': 'Picture Message',
-                                             'usage': {'@type': 'mms'}},
-                                            {'@value': 'cellular1wap',
-                                             'mmsc': 'http://mmsc',
-                                             'mmsproxy': '172.23.1.252:8799',
-                                             'name': 'CellularOne MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '310',
-                                                   '@mnc': '590'}},
-                            'name': 'Alltel'},
-                           {'cdma': None, 'name': 'Leap Wireless'},
-                           {'cdma': None,
-                            'gsm': {'network-id': {'@mcc': '310',
-                                                   '@mnc': '000'}},
-                            'name': 'Cricket Communications'},
-                           {'cdma': None, 'name': 'Jump Mobile (Prepaid)'},
-                           {'cdma': {'sid': [{'@value': '4269'},
-                                             {'@value': '4273'},
-                                             {'@value': '4387'},
-                                             {'@value': '4531'},
-                                             {'@value': '4533'},
-                                             {'@value': '4547'},
-                                             {'@value': '4815'},
-                                             {'@value': '4855'},
-                                             {'@value': '5007'},
-                                             {'@value': '5023'},
-                                             {'@value': '5037'},
-                                             {'@value': '5097'},
-                                             {'@value': '5167'},
-                                             {'@value': '5199'},
-                                             {'@value': '21580'}]},
-                            'name': 'MetroPCS'},
-                           {'cdma': {'sid': {'@value': '4183'}},
-                            'name': 'Virgin Mobile / Helio'},
-                           {'cdma': {'sid': [{'@value': '160'},
-                                             {'@value': '264'},
-                                             {'@value': '1382'},
-                                             {'@value': '1394'},
-                                             {'@value': '1996'}]},
-                            'name': 'Cellular South'},
-                           {'gsm': {'apn': {'@value': 'ISP',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '311',
-                                                   '@mnc': '570'}},
-                            'name': 'BendBroadband'},
-                           {'gsm': {'apn': {'@value': 'wapgw.chinookwireless.net',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '310',
-                                                   '@mnc': '570'}},
-                            'name': 'MTPCS (Cellular One)'},
-                           {'cdma': {'sid': {'@value': '3102'}},
-                            'name': 'Mid-Rivers Cellular'},
-                           {'gsm': {'apn': [{'@value': 'att.mvno',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'tfdata',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}}],
-                                    'network-id': {'@mcc': '310',
-                                                   '@mnc': '410'}},
-                            'name': 'Straight Talk'},
-                           {'gsm': {'apn': [{'@value': 'mobilenet',
-                                             'name': 'Broadband',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'wholesale',
-                                             'mmsc': 'http://wholesale.mmsmvno.com/mms/wapenc',
-                                             'name': 'Cellular (MMS)',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '310',
-                                                   '@mnc': '260'}},
-                            'name': 'SpeedTalk Mobile'},
-                           {'gsm': {'apn': {'@value': 'data.lycamobile.com',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*611#'},
-                                    'balance-top-up': {'ussd': {'#text': '*611*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '311',
-                                                   '@mnc': '960'}},
-                            'name': 'Lycamobile'}]},
-             {'@code': 'uy',
-              'provider': [{'gsm': {'apn': [{'@value': 'adslmovil',
-                                             'dns': ['200.40.30.245',
-                                                     '200.40.220.245'],
-                                             'name': 'ADSL Móvil',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'prepago.ancel',
-                                             'name': 'ADSL Móvil Prepago',
-                                             'password': 'BAM',
-                                             'plan': {'@type': 'prepaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'BAM'},
-                                            {'@value': 'gprs.ancel',
-                                             'dns': ['200.40.30.245',
-                                                     '200.40.220.245'],
-                                             'name': 'GPRS',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mmsc.mms.ancelutil.com.uy',
-                                             'mmsproxy': '200.40.246.2:3128',
-                                             'name': 'mmsANCEL',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '748',
-                                                    '@mnc': '00'},
-                                                   {'@mcc': '748',
-                                                    '@mnc': '01'}]},
-                            'name': 'Ancel'},
-                           {'gsm': {'apn': [{'@value': 'gprs.claro.com.uy',
-                                             'name': '3G Internet',
-                                             'password': 'ctigprs999',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'ctigprs'},
-                                            {'@value': 'internet.ctimovil.com.uy',
-                                             'name': '2G Internet',
-                                             'password': 'ctiweb999',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'ctiweb'}],
-                                    'network-id': {'@mcc': '748',
-                                                   '@mnc': '10'}},
-                            'name': 'Claro'},
-                           {'gsm': {'apn': [{'@value': 'apnumt.movistar.com.uy',
-                                             'name': '3G Internet',
-                                             'password': 'movistar',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'movistar'},
-                                            {'@value': 'webapn.movistar.com.uy',
-                                             'name': '2G Internet',
-                                             'password': 'movistar',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'movistar'}],
-                                    'network-id': {'@mcc': '748',
-                                                   '@mnc': '07'}},
-                            'name': 'Movistar'}]},
-             {'@code': 'uz',
-              'provider': [{'gsm': {'apn': {'@value': 'internet.beeline.uz',
-                                            'password': 'beeline',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': 'beeline'},
-                                    'network-id': {'@mcc': '434',
-                                                   '@mnc': '04'}},
-                            'name': 'Beeline'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'password': None,
-                                            'username': None},
-                                    'network-id': {'@mcc': '434',
-                                                   '@mnc': '05'}},
-                            'name': 'Ucell'},
-                           {'gsm': {'apn': {'@value': 'net.ums.uz',
-                                            'password': None,
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'},
-                                            'username': None},
-                                    'network-id': {'@mcc': '434',
-                                                   '@mnc': '07'}},
-                            'name': 'UMS'}]},
-             {'@code': 'vc',
-              'provider': {'gsm': {'apn': {'@value': 'wap.digiceloecs.com',
-                                           'password': 'wap03oecs',
-                                           'plan': {'@type': 'postpaid'},
-                                           'usage': {'@type': 'internet'},
-                                           'username': 'wapoecs'},
-                                   'network-id': {'@mcc': '360',
-                                                  '@mnc': '070'}},
-                           'name': 'Digicel'}},
-             {'@code': 've',
-              'provider': [{'gsm': {'apn': [{'@value': 'gprsweb.digitel.ve',
-                                             'dns': '57.67.127.195',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'expresate.digitel.ve',
-                                             'mmsc': 'http://mms.412.com.ve/servlets/mms',
-                                             'mmsproxy': '10.99.0.10:8080',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': [{'@mcc': '734',
-                                                    '@mnc': '01'},
-                                                   {'@mcc': '734',
-                                                    '@mnc': '02'},
-                                                   {'@mcc': '734',
-                                                    '@mnc': '03'}]},
-                            'name': 'Digitel TIM'},
-                           {'gsm': {'apn': [{'@value': 'int.movilnet.com.ve',
-                                             'dns': ['200.44.32.12',
-                                                     '200.11.248.12'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mm.movilnet.com.ve',
-                                             'mmsc': 'http://mms2.movilnet.com.ve/servlets/mms',
-                                             'mmsproxy': '192.168.16.12:8080',
-                                             'name': 'MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '734',
-                                                   '@mnc': '06'}},
-                            'name': 'Movilnet'},
-                           {'gsm': {'apn': {'@value': 'internet.movistar.ve',
-                                            'dns': ['200.35.65.3',
-                                                    '200.35.65.4'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '734',
-                                                   '@mnc': '04'}},
-                            'name': 'Movistar'}]},
-             {'@code': 'vn',
-              'provider': [{'gsm': {'apn': [{'@value': 'm-wap',
-                                             'password': 'mms',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mms'},
-                                            {'@value': 'm-i090',
-                                             'mmsc': 'http://203.162.21.114/mmsc',
-                                             'mmsproxy': '203.162.21.114:3130',
-                                             'name': 'Mobifone MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '452',
-                                                   '@mnc': '01'}},
-                            'name': 'MobiFone'},
-                           {'gsm': {'apn': [{'@value': 'm3-world',
-                                             'name': 'Mobile Internet',
-                                             'password': 'mms',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mms'},
-                                            {'@value': 'm3-card',
-                                             'name': 'Mobile Broadband',
-                                             'password': 'mms',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'},
-                                             'username': 'mms'},
-                                            {'@value': 'm3-mms',
-                                             'mmsc': 'http://mms.vinaphone.com.vn',
-                                             'mmsproxy': '10.1.10.46:8000',
-                                             'name': 'Vinaphone MMS',
-                                             'password': 'mms',
-                                             'usage': {'@type': 'mms'},
-                                             'username': 'mms'}],
-                                    'network-id': {'@mcc': '452',
-                                                   '@mnc': '02'}},
-                            'name': 'Vinaphone'},
-                           {'cdma': {'sid': {'@value': '13331'},
-                                     'username': 'S-Fone'},
-                            'name': 'S-Fone'},
-                           {'gsm': {'apn': [{'@value': 'v-internet',
-                                             'name': 'Mobile Internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'e-connect',
-                                             'name': 'D-com 3G',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'v-mms',
-                                             'mmsc': 'http://mms.viettelmobile.com.vn/mms/wapenc',
-                                             'mmsproxy': '192.168.233.10:8080',
-                                             'name': 'Viettel MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '452',
-                                                   '@mnc': '04'}},
-                            'name': 'Viettel Mobile'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://10.10.128.58/servlets/mms',
-                                             'mmsproxy': '10.10.128.44:8080',
-                                             'name': 'Vietnamobile MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'network-id': {'@mcc': '452',
-                                                   '@mnc': '05'}},
-                            'name': 'Vietnamobile'},
-                           {'cdma': {'password': 'evntelecom',
-                                     'username': 'evntelecom'},
-                            'gsm': {'apn': {'@value': 'e-internet',
-                                            'name': 'EVNTelecomNet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '452',
-                                                   '@mnc': '08'}},
-                            'name': 'EVNTelecom/E-Mobile'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'network-id': {'@mcc': '452',
-                                                   '@mnc': '07'}},
-                            'name': 'Beeline VN'}]},
-             {'@code': 'za',
-              'provider': [{'gsm': {'apn': {'@value': 'internet',
-                                            'dns': ['196.7.0.138',
-                                                    '196.7.142.132'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*101#'},
-                                    'balance-top-up': {'ussd': {'#text': '*102*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'msisdn-query': {'ussd': '*147*100#'},
-                                    'network-id': {'@mcc': '655',
-                                                   '@mnc': '07'}},
-                            'name': 'Cell-c'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'dns': ['196.11.240.241',
-                                                    '209.212.97.1'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*141#'},
-                                    'balance-top-up': {'ussd': {'#text': '*141*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'msisdn-query': {'ussd': '*123*888#'},
-                                    'network-id': {'@mcc': '655',
-                                                   '@mnc': '10'}},
-                            'name': 'MTN'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'dns': ['196.207.40.165',
-                                                     '196.43.46.190'],
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'unrestricted',
-                                             'dns': ['196.207.32.69',
-                                                     '196.43.45.190'],
-                                             'name': 'Unrestricted',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms.vodacom.net',
-                                             'mmsc': 'http://mmsc.vodacom4me.co.za',
-                                             'mmsproxy': '196.6.128.13:8080',
-                                             'name': 'Vlive!MMS',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*100#'},
-                                    'balance-top-up': {'ussd': {'#text': '*100*01*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'msisdn-query': {'ussd': '*111*501#'},
-                                    'network-id': {'@mcc': '655',
-                                                   '@mnc': '01'}},
-                            'name': 'Vodacom'},
-                           {'gsm': {'apn': {'@value': 'vdata',
-                                            'dns': ['196.7.0.138',
-                                                    '196.7.142.132'],
-                                            'plan': {'@type': 'postpaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*101#'},
-                                    'balance-top-up': {'ussd': {'#text': '*102*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'network-id': {'@mcc': '655',
-                                                   '@mnc': '07'}},
-                            'name': 'Virgin Mobile'},
-                           {'gsm': {'apn': [{'@value': 'internet',
-                                             'plan': {'@type': 'postpaid'},
-                                             'usage': {'@type': 'internet'}},
-                                            {'@value': 'mms',
-                                             'mmsc': 'http://mms.8ta.com:38090/was',
-                                             'mmsproxy': '10.148.29.101:8080',
-                                             'name': '8 ta mms',
-                                             'usage': {'@type': 'mms'}}],
-                                    'balance-check': {'ussd': '*188#'},
-                                    'balance-top-up': {'ussd': {'#text': '*188*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'msisdn-query': {'ussd': '*1#'},
-                                    'network-id': {'@mcc': '655',
-                                                   '@mnc': '02'}},
-                            'name': '8.ta'}]},
-             {'@code': 'sz',
-              'provider': [{'gsm': {'apn': {'@value': 'mymtn.co.sz',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*556#'},
-                                    'balance-top-up': {'ussd': {'#text': '*555*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'msisdn-query': {'ussd': '*123#'},
-                                    'network-id': {'@mcc': '653',
-                                                   '@mnc': '10'}},
-                            'name': 'MTN Eswatini'},
-                           {'gsm': {'apn': {'@value': 'internet',
-                                            'plan': {'@type': 'prepaid'},
-                                            'usage': {'@type': 'internet'}},
-                                    'balance-check': {'ussd': '*202#'},
-                                    'balance-top-up': {'ussd': {'#text': '*200*CODE#',
-                                                                '@replacement': 'CODE'}},
-                                    'msisdn-query': {'ussd': '*123#'},
-                                    'network-id': {'@mcc': '653',
-                                                   '@mnc': '02'}},
-                            'name': 'Eswatini Mobile'}]}]}
-
+#
 # The country data comes from the Debian iso-codes package that is released
 # under LGPLv2.1+:
 #
 # /usr/share/xml/iso-codes/iso_3166.xml
 
-dict_country = \
+# Maps the country code to the country name
+countries = \
 {'ad': 'Andorra',
  'ae': 'United Arab Emirates',
  'af': 'Afghanistan',
@@ -10410,7 +39,6 @@ dict_country = \
  'by': 'Belarus',
  'ca': 'Canada',
  'cd': 'Congo, The Democratic Republic of the',
- 'cg': 'Congo',
  'ch': 'Switzerland',
  'ci': "Côte d'Ivoire",
  'cl': 'Chile',
@@ -10537,3 +165,626 @@ dict_country = \
  've': 'Venezuela, Bolivarian Republic of',
  'vn': 'Viet Nam',
  'za': 'South Africa'}
+
+# Maps the country code to a JSON encoded and by name sorted list of
+# [provider, plans] pairs. Each plan is a [name, apn, username, password,
+# dial] list. Decode only the entry of the selected country
+providers = \
+{'ad': '[["Andorra Telecom '
+       '(Mobiland)",[["Mobiland","internetand","none","none",""],["Mobiland '
+       'Click!","internetclic","none","none",""]]]]',
+ 'ae': '[["Etisalat",[["Etisalat","mnet","mnet","mnet",""],["Etisalat '
+       '3G","etisalat.ae","etisalat.ae","etisalat.ae",""]]],["du",[["Default","du","none","none",""]]]]',
+ 'af': '[["AWCC",[["Default","internet","awcc","1111",""]]]]',
+ 'al': '[["Vodafone",[["TWA","Twa","none","none",""],["Vodafone '
+       'Web","vodafoneweb","none","none",""]]]]',
+ 'am': '[["Beeline",[["Default","internet.beeline.am","internet","internet",""]]],["Karabakh '
+       'Telecom",[["KT_MARK","connect.kt.am","none","none",""]]],["Orange",[["Internet '
+       'Hima (USB)","internet.orange","none","none",""],["Mobile '
+       'Broadband","internet","none","none",""]]],["VivaCell/MTS",[["MTS '
+       'connect","connect.vivacell.am","none","none",""],["Mobile '
+       'Broadband","inet.vivacell.am","none","none",""]]]]',
+ 'ao': '[["Unitel",[["Default","internet.unitel.co.ao","none","none",""]]]]',
+ 'ar': '[["Arnet",[["Default","arnet.personal.com","none","none",""]]],["Claro",[["3G '
+       'Internet","gprs.claro.com.ar","clarogprs","clarogprs999",""],["GPRS","internet.ctimovil.com.ar","clarogprs","clarogprs999",""]]],["Movistar",[["WAP","internet.gprs.unifon.com.ar","wap","wap",""],["Internet","internet.gprs.unifon.com.ar","Internet","Internet",""]]],["Personal",[["GPRS","gprs.personal.com","gprs","adgj",""],["DATOS","datos.personal.com","datos","datos",""]]]]',
+ 'at': '[["A1/Telekom Austria",[["A1 '
+       'Breitband","a1.net","ppp@a1plus.at","ppp",""],["aon (Flex, '
+       'Breitband-Duo, '
+       'BusinessFlex)","aon.data","mobile@aon.at","ppp",""],["aonMobile","aon.at","mobile@aon.at","ppp",""]]],["ABroadband",[["International '
+       'Roaming","mdata.com","mdata@mdata.com","ppp",""]]],["Bob",[["Default","bob.at","data@bob.at","ppp",""],["Default","bob.at","ppp@bob.at","ppp",""],["Default","mms.bob.at","data@bob.at","ppp",""]]],["Drei '
+       '(3)",[["Default","drei.at","none","none",""]]],["HoT",[["Default","webaut",null,null,""]]],["Lycamobile",[["Default","data.lycamobile.at","lmat","plus",""]]],["T-Mobile",[["Internet","gprsinternet","t-mobile","tm",""],["Business '
+       'Internet","business.gprsinternet","t-mobile","tm",""]]],["VOLmobil",[["Default","volmobil","none","none",""]]],["Yesss",[["Default","web.yesss.at","none","none",""]]],["tele.ring",[["Ge '
+       'org:)","web","web@telering.at","web",""]]]]',
+ 'au': '[["Crazy John\'s",[["Crazy '
+       'NET","purtona.net","none","none",""]]],["Internode",[["NodeMobile '
+       'Data","internode","none","none",""],["Old NodeMobile Data (before '
+       '2009-08-26)","splns333a1","none","none",""]]],["Lycamobile",[["Default","data.lycamobile.com.au","lmau","plus",""]]],["Optus",[["Mobile '
+       'Internet (handsets)","internet","none","none",""],["Optus Yes '
+       'Internet","yesinternet","none","none",""],["Wireless '
+       'Broadband","connect","none","none",""],["Post-Paid Mobile '
+       'Broadband","connectcap","none","none",""],["Pre-Paid Mobile '
+       'Broadband","preconnect","none","none",""]]],["TPG Mobile",[["TPG (all '
+       'except '
+       'iPhone)","internet","none","none",""]]],["Telstra",[["Default","telstra.wap","none","none",""],["Telstra '
+       '(3G data pack)","telstra.datapack","none","Telstra",""],["Telstra '
+       '(Next G)","telstra.internet","none","none",""],["Telstra (3G PC pack - '
+       'pay by time)","telstra.pcpack","none","Telstra",""],["Telstra '
+       'BigPond","telstra.bigpond","none","none",""]]],["Three",[["Default","3netaccess","a","a",""],["Three '
+       'Prepaid","3services","a","a",""]]],["Virgin Mobile",[["Mobile '
+       'Internet","VirginInternet","guest","guest",""],["Mobile '
+       'Broadband","VirginBroadband","none","none",""]]],["Vodafone",[["Postpaid '
+       'and some prepaid phone '
+       'plans","vfinternet.au","none","none",""],["Prepaid","vfprepaymbb","none","none",""],["Vodafone '
+       'Internet","live.vodafone.com","none","none",""]]],["iiNet",[["Default","iinet","none","none",""]]]]',
+ 'az': '[["Azercell",[["Default","internet","none","none",""]]],["Azerfon",[["Default","azerfon","none","none",""]]],["Bakcell",[["Default","mms","none","none",""]]]]',
+ 'ba': '[["HT-ERONET",[["Default","gprs.eronet.ba","none","none",""]]],["m:tel",[["Package '
+       '1","mtelgprs1","none","none",""],["Package '
+       '2","mtelgprs2","none","none",""],["Package '
+       '3","mtelgprs3","none","none",""],["Package '
+       '4","mtelgprs4","none","none",""],["Prepaid","mtelfun","none","none",""]]]]',
+ 'bb': '[["Digicel",[["Default","isp.digicelbarbados.com","none","none",""]]]]',
+ 'bd': '[["Airtel '
+       '(Warid)",[["Internet","internet","none","none",""],["Internet","internet","none","none",""]]],["Banglalink",[["Web","blweb","none","none",""],["Web","blweb","none","none",""]]],["GrameenPhone",[["Default","gpinternet","gp","gp",""],["Default","gpinternet","gp","gp",""]]],["Robi '
+       '(AKTel)",[["Internet","internet","none","none",""],["Internet","internet","none","none",""]]],["Teletalk",[["Internet","wap","none","none",""]]]]',
+ 'be': '[["Base",[["Default","gprs.base.be","base","base",""]]],["Lycamobile",[["Default","data.lycamobile.be","lmbe","plus",""]]],["Mobile '
+       'Vikings",[["Default","web.be","web","web",""]]],["Mobistar",[["Business","web.pro.be","mobistar","mobistar",""],["Personal","internet.be","mobistar","mobistar",""],["Internet '
+       'Everywhere","iew.be","mobistar","mobistar",""],["Default","mworld.be","mobistar","mobistar",""]]],["Orange",[["Default","orangeinternet","none","none",""]]],["Proximus",[["Inter","internet.proximus.be","none","none",""],["Intra","intraprox.be","none","none",""]]],["Telenet '
+       'Mobile",[["Old Walk & '
+       'Surf","mobile.internet.be","none","none",""],["Walk & '
+       'Talk","telenetwap.be","none","none",""],["Walk & '
+       'Surf","telenetwap.be","none","none",""]]]]',
+ 'bf': '[["Airtel 3G",[["Default","internet","none","none",""]]]]',
+ 'bg': '[["GloBul",[["Default","internet.globul.bg","globul","none",""]]],["M-Tel",[["Default","inet-gprs.mtel.bg","none","none",""]]],["Vivacom",[["Vivacom '
+       'Internet '
+       '(Postpaid)","internet.vivacom.bg","vivacom","vivacom",""],["Vivatel '
+       '(old)","internet.vivatel.bg","vivatel","vivatel",""]]]]',
+ 'bh': '[["Batelco",[["oNet","internet.batelco.com","wap","wap",""]]],["STC",[["Viva","viva.bh","none","none",""]]],["Zain '
+       'BH",[["Internet","internet","internet","internet",""],["eGO","hsdpa","hsdpa","hsdpa",""]]]]',
+ 'bi': '[["Leo/UCom",[["Default","ucnet","none","none",""]]],["Tempo/Africell",[["Default","internet","none","none",""]]]]',
+ 'bm': '[["CellOne",[["Default","web.c1.bm","none","none",""]]]]',
+ 'bn': '[["B-Mobile",[["Default","bmobilewap","none","none",""]]],["DSTCOM",[["Default","dst.wap","wap","wap",""]]]]',
+ 'br': '[["Brasil '
+       'Telecom",[["Default","brt.br","BrT","BrT",""]]],["CTBC",[["Default","ctbc.br","ctbc","1212",""]]],["Claro",[["Default","claro.com.br","claro","claro",""],["3G","bandalarga.claro.com.br","claro","claro",""]]],["Oi",[["Default","gprs.oi.com.br","none","oioioi",""]]],["TIM",[["Default","tim.br","tim","tim",""]]],["Velox",[["Default","wap.telcel.com","iesgprs","iesgprs2002",""]]],["Vivo",[["Default","zap.vivo.com.br","vivo","vivo",""]]]]',
+ 'bs': '[["Aliv",[["Default","pda.newcomobile.com","none","none",""]]],["Batelco",[["Default","internet.btcbahamas.com","none","none",""]]]]',
+ 'bw': '[["Mascom '
+       'Wireless",[["Default","internet.mascom","none","none",""]]],["Orange",[["Default","internet.orange.co.bw","none","none",""]]]]',
+ 'by': '[["MTS",[["Default","internet.mts.by","mts","mts",""]]],["life:)",[["Default","internet.life.com.by","none","none",""]]],["velcom",[["GPRS '
+       'WEB","web.velcom.by","web","web",""],["GPRS WEB '
+       'PLUS","plus.velcom.by","plus","plus",""],["GPRS '
+       'PRIVET","privet.velcom.by","privet","privet",""],["WEB '
+       'BASIC","web1.velcom.by","web1","web1",""],["WEB '
+       '25","web2.velcom.by","web2","web2",""],["WEB '
+       '150","web3.velcom.by","web3","web3",""],["WEB '
+       '500","vmi.velcom.by","vmi","vmi",""]]]]',
+ 'ca': '[["Bell '
+       'Mobility",[["Internet","inet.bell.ca","none","none",""],["Mobile '
+       'Web","pda.bell.ca","none","none",""],["Mobile Fast '
+       'Web","pda2.bell.ca","none","none",""]]],["Fido",[["Default","internet.fido.ca","fido","fido",""]]],["Mobilicity",[["Mobile '
+       'Web","wap.davewireless.com","none","none",""],["Mobile '
+       'Broadband","internet.davewireless.com","none","none",""]]],["Rogers",[["Default","internet.com","wapuser1","wap",""]]],["SaskTel '
+       'Mobility",[["Data Device or '
+       'Tethering","inet.stm.sk.ca","none","none",""]]],["Telus '
+       'Mobility",[["Internet","isp.telus.com","none","none",""],["Internet '
+       '(with '
+       'VPN)","vpn.telus.com","none","none",""],["Blackberry","bb.telus.com","none","none",""],["Mobile '
+       'Web/Smartphone","sp.telus.com","none","none",""]]],["Vidéotron",[["Telephony '
+       'data","media.videotron","none","none",""],["IHVM","ihvm.videotron","none","none",""]]],["WIND '
+       'Mobile",[["Laptop (data '
+       'stick)","broadband.windmobile.ca","none","none",""],["Mobile (add-on '
+       'for phone)","internet.windmobile.ca","none","none",""]]]]',
+ 'cd': '[["Vodacom",[["Default","vodanet","vodalive","none",""]]]]',
+ 'ch': '[["Lycamobile",[["Default","data.lycamobile.ch","lmch","plus",""]]],["M-Budget",[["Migros '
+       'Data","gprs.swisscom.ch","none","none",""]]],["Salt",[["Salt World - '
+       'Prepaid","internet","none","none",""],["Salt Internet - '
+       'Postpaid","internet","none","none",""]]],["Sunrise",[["Default","internet","internet","internet",""]]],["Swisscom",[["Swisscom '
+       'GPRS","gprs.swisscom.ch","none","none",""],["Swisscom '
+       'CAA","corporate.swisscom.ch","testprofil","temporary",""],["Swisscom '
+       'MMS","event.swisscom.ch","none","none",""]]]]',
+ 'ci': '[["MTN",[["Default","internet","none","none",""]]]]',
+ 'cl': '[["Claro '
+       'Chile",[["Default","bam.clarochile.cl","clarochile","clarochile",""],["Prepago","bap.clarochile.cl","clarochile","clarochile",""]]],["Entel '
+       'PCS",[["Contract / Prepaid / '
+       'WebSession","imovil.entelpcs.cl","entelpcs","entelpcs",""],["WAP","bam.entelpcs.cl","entelpcs","entelpcs",""]]],["Movistar",[["Web","web.tmovil.cl","web","web",""]]],["Nextel",[["Default","wap.nextelmovil.cl","none","none",""]]],["VTR '
+       'Movil",[["Default","movil.vtr.com","vtrmovil","vtrmovil",""]]],["Virgin '
+       'Mobile",[["Default","imovil.virginmobile.cl","none","none",""]]]]',
+ 'cm': '[["MTN",[["Default","INTERNET","guest","guest",""]]],["Orange",[["Default","orangecmgprs","orange","orange",""]]]]',
+ 'cn': '[["China Mobile",[["Internet","cmnet","guest","guest",""]]],["China '
+       'Telecom",[["CTNET","ctnet","ctnet@mycdma.cn","vnet.mobi",""],["CTLTE","ctlte","ctlte@mycdma.cn","vnet.mobi",""]]],["China '
+       'Unicom",[["Default","3gnet","uninet","none",""]]]]',
+ 'co': '[["Claro",[["Default","internet.comcel.com.co","COMCELWEB","COMCELWEB",""]]],["Movistar",[["Default","internet.movistar.com.co","movistar","movistar",""]]],["Tigo",[["Default","web.colombiamovil.com.co","none","none",""]]],["UNE",[["Default","www.une.net.co","une","une",""],["LTE '
+       '(4G)","une4glte.net.co","none","none",""]]],["Uff",[["Default","web.uffmovil.com.co","none","none",""]]],["Virgin '
+       'Mobile",[["Default","web.vmc.net.co","none","none",""]]],["eTb",[["Default","moviletb.net.co","etb","etb",""]]]]',
+ 'cr': '[["IceCelular",[["Default","icecelular","guest","guest",""]]],["Kolbi",[["Kolbi '
+       '3g","kolbi3g","none","none",""]]]]',
+ 'cy': '[["Cytamobile-Vodafone",[["Contract","internet","none","none",""],["Prepaid","pp.internet","none","none",""]]],["MTN",[["Default","internet","wap","wap",""]]]]',
+ 'cz': '[["MOBIL.CZ",[["Default","internet.t-mobile.cz","gprs","gprs",""]]],["O2",[["Default","internet","none","none",""],["Default","internet.open","none","none",""],["Prepaid","internet","none","none",""]]],["T-Mobile",[["Default","internet.t-mobile.cz","none","none",""]]],["Vodafone",[["Default","internet","none","none",""]]]]',
+ 'de': '[["1&1",[["Mobile '
+       'Broadband","web.vodafone.de","none","none",""],["Mobile '
+       'Web","mail.partner.de","D2","Web",""]]],["AldiTalk/MedionMobile",[["Volume '
+       'rate/30 Day '
+       'Flatrate","internet.eplus.de","eplus","gprs",""]]],["Alice",[["Option '
+       'Mobile","internet.partner1","none","none",""]]],["Bild Mobil",[["BILD '
+       'Mobilportal","access.vodafone.de","none","none",""],["Contract","web.vodafone.de","none","none",""],["BILDmobil '
+       'Speedstick '
+       '(Surfpakete)","event.vodafone.de","none","none",""]]],["Congstar",[["Prepaid '
+       'Contracts","internet.t-mobile","t-mobile","tm",""]]],["E-Plus",[["Default","internet.eplus.de","eplus","gprs",""]]],["FONIC",[["Default","pinternet.interkom.de","fonic","fonic",""]]],["Lycamobile",[["Default","data.lycamobile.de","lmde","plus",""]]],["Netzclub",[["Internet","pinternet.interkom.de","none","none",""]]],["O2",[["LOOP","pinternet.interkom.de","none","none",""],["Pay-by-MB","internet","none","none",""],["Pay-by-time","surfo2","none","none",""]]],["T-Mobile(Telekom)",[["Default","internet.t-d1.de","none","t-d1",""],["Default","internet.t-mobile","t-mobile","tm",""],["Default","internet.v6.telekom","none","none",""],["Default","internet.telekom","none","none",""],["Business '
+       'Smart '
+       'Connect","iot.telekom.net","none","none",""]]],["Tchibo-Mobil",[["Tagesflat '
+       '/ Monats-Flatrate L / Monats-Flatrate '
+       'XL","webmobil1","none","none",""]]],["Vodafone",[["Default","web.vodafone.de","none","none",""],["WebSessions","event.vodafone.de","vodafone","vodafone",""]]],["blau.de",[["Default","internet.eplus.de","blau","blau",""],["24 '
+       'Hour Flatrate","tagesflat.eplus.de","blau","blau",""]]],["simyo '
+       'Internet",[["Default","internet.eplus.de","simyo","simyo",""]]],["winSIM",[["Default","internet","none","none",""]]]]',
+ 'dk': '[["3",[["Bredbånd '
+       '(standard)","bredband.tre.dk","none","none",""],["Bredbånd Premium '
+       'Kontant","net.tre.dk","none","none",""],["3 (standard for mobilkunder; '
+       'spærret for indgående trafik)","data.tre.dk","none","none",""],["3 '
+       '(statisk '
+       'IP)","static.tre.dk","none","none",""]]],["BiBoB",[["Default","internet.bibob.dk","none","none",""]]],["CBB '
+       'Mobil",[["Default","internet","none","none",""]]],["Fullrate",[["Default","internet","Fullrate","Fullrate",""]]],["Lycamobile",[["Default","data.lycamobile.dk","lmdk","plus",""]]],["OiSTER",[["Mobile '
+       'Broadband","bredband.oister.dk","none","none",""],["Mobile '
+       'Internet","data.dk","none","none",""]]],["Onfone Internet '
+       'DK",[["Default","internet","none","none",""]]],["TDC",[["Default","internet","none","none",""],["Default","internet.no","none","none",""],["Default","internet.se","none","none",""]]],["Telenor",[["Default","internet","none","none",""]]],["Telia",[["Default","www.internet.mtelia.dk","none","none",""]]],["Telmore",[["Default","internet","none","none",""]]],["Unotel",[["Default","internet","none","none",""]]],["happiimobil",[["Default","internet","none","none",""]]]]',
+ 'do': '[["Claro",[["Default","internet.ideasclaro.com.do","none","none",""]]],["Orange",[["Default","orangenet.com.do","none","none",""]]],["Viva",[["Default","edge.viva.net.do","viva","viva",""]]]]',
+ 'dz': '[["Djezzy",[["Default","djezzy.internet","none","none",""]]],["Mobilis",[["Default","internet","internet","internet",""]]],["Nedjma",[["WEB","internet","nedjma","nedjma",""]]]]',
+ 'ec': '[["Movistar '
+       'UMTS",[["Default","navega.movistar.ec","movistar","movistar",""]]],["Porta '
+       '3G",[["Default","internet.porta.com.ec","none","none",""]]]]',
+ 'ee': '[["EMT",[["Default","internet.emt.ee","none","none",""]]],["Elisa",[["Default","internet","none","none",""]]],["Nordea",[["Default","internet.emt.ee","none","none",""]]],["Tele2",[["Default","internet.tele2.ee","wap","wap",""]]]]',
+ 'eg': '[["Etisalat",[["Default","etisalat","none","none",""]]],["MobiNil",[["Default","mobinilweb","none","none",""]]],["Vodafone",[["Default","internet.vodafone.net","internet","internet",""]]]]',
+ 'es': '[["Amena",[["Default","orangeworld","orange","orange",""]]],["Carrefour '
+       'Móvil",[["Default","CARREFOURINTERNET","none","none",""]]],["Euskaltel",[["Default","internet.euskaltel.mobi","CLIENTE","EUSKALTEL",""]]],["Happy '
+       'Móvil/moviData",[["Default","INTERNETTPH","none","none",""]]],["Jazztel",[["Default","jazzinternet","none","none",""]]],["Lebara",[["Default","gprsmov.lebaramobile.es","none","none",""]]],["LlamaYa '
+       'móvil",[["Default","moreinternet","none","none",""]]],["Lowi",[["Default","lowi.private.omv.es","none","none",""]]],["Lycamobile",[["Default","data.lycamobile.es","lmes","plus",""]]],["Movistar '
+       '(Telefónica)",[["Telefónica","telefonica.es","telefonica","telefonica",""],["Movistar '
+       '(USB '
+       'modems)","movistar.es","movistar","movistar",""]]],["Másmovil",[["Default","internetmas","none","none",""]]],["ONO",[["Default","internet.ono.com","none","none",""]]],["Orange",[["Orange","internet","ORANGE","ORANGE",""]]],["Pepephone",[["Pepephone","gprs.pepephone.com","none","none",""],["Pepephone '
+       '(Mobile)","gprsmov.pepephone.com","none","none",""]]],["Simyo",[["Default","gprs-service.com","none","none",""]]],["Suop",[["Default","inet.es","none","none",""]]],["Telecable",[["Default","internet.telecable.es","telecable","telecable",""]]],["Tuenti '
+       'Móvil",[["Default","tuenti.com","tuenti","tuenti",""]]],["Vodafone",[["Vodafone","ac.vodafone.es","vodafone","vodafone",""],["Airtel '
+       '(old)","airtelnet.es","vodafone","vodafone",""]]],["Yoigo",[["Default","internet","none","none",""]]],["móbil '
+       'R (Mundo-R)",[["Default","internet.mundo-r.com","none","none",""]]]]',
+ 'et': '[["Ethio Telecom",[["Default","etc.com","none","none",""]]]]',
+ 'fi': '[["DNA",[["Postpaid (contract) NAT (available for all '
+       'subscribers)","internet","none","none",""],["Postpaid (contract) '
+       'public IP address (Dec 2016 and later individual '
+       'subscriptions)","julkinen.dna.fi","none","none",""],["Postpaid '
+       '(contract) public IP address (Nov 2016 and earlier individual, and all '
+       'company subscriptions)","data.dna.fi","none","none",""],["Moi '
+       'Mobiili","data.moimobile.fi","none","none",""]]],["Elisa",[["Default","internet","none","none",""]]],["Kuiri",[["Kuiri '
+       'Internet","kuirinet","none","none",""]]],["Saunalahti",[["Postpaid '
+       '(contract) NAT (available for all '
+       'subscribers)","internet.saunalahti","none","none",""],["Postpaid '
+       '(contract) public IP address (needs to be '
+       'ordered)","internet4","none","none",""],["Prepaid (no '
+       'contract)","internet","none","none",""]]],["Telia",[["Default","internet","none","none",""],["Open '
+       'Gate (public IP, open ports; needs to be '
+       'ordered)","opengate","none","none",""],["Prointernet (public '
+       'IP)","prointernet","none","none",""]]],["Welho",[["Wekkula","internet.welho.fi","none","none",""]]]]',
+ 'fj': '[["Vodafone / '
+       'Kidanet",[["Default","vfinternet.fj","none","none",""],["Default","kidanet.fj","none","none",""],["Default","prepay.vfinternet.fj","none","none",""]]]]',
+ 'fo': '[["Vodafone FO",[["Default","vmc.vodafone.fo","none","none",""]]]]',
+ 'fr': '[["A Mobile (Auchan '
+       'Telecom)",[["Default","wap65","none","none",""]]],["Bouygues '
+       'Telecom",[["Contrat Pro Data '
+       'Illimité","a2bouygtel.com","none","none",""],["B2Bouygtel","b2bouygtel.com","none","none",""],["Forfait '
+       'Data","ebouygtel.com","none","none",""],["Forfait '
+       'Data","mmsbouygtel.com","none","none",""],["Contrat Pro '
+       'Data","pcebouygtel.com","none","none",""]]],["Free '
+       'Mobile",[["Free-Mobile","free","free","free",""]]],["Lycamobile",[["Default","data.lycamobile.fr","lmfr","plus",""]]],["Orange",[["Orange '
+       'Internet","orange.fr","none","none",""],["Business '
+       'Contract","internet-entreprise","none","none",""],["No Contract / '
+       'Mobicarte","orange","orange","orange",""],["Orange '
+       'Entreprises","orange-mib","mportail","mib",""],["Internet Everywhere '
+       '3G","orange.ie","none","none",""]]],["Prixtel",[["via '
+       'Orange","Orange","orange","orange",""],["via '
+       'SFR","sl2sfr","none","none",""]]],["SFR",[["Web / '
+       'Prepaid","websfr","none","none",""],["SFR '
+       'internetpro","internetpro","none","none",""],["SFR '
+       'ipnet","ipnet","none","none",""],["Mobile '
+       'Broadband","slsfr","none","none",""],["Full Internet '
+       '(Webphone)","sl2sfr","none","none",""],["Internet (Neuf '
+       'Telecom)","internetneuf","none","none",""]]],["TEN",[["Default","ao.fr","orange","orange",""],["Pay-by-MB","ofnew.fr","orange","orange",""]]],["Transatel '
+       'Telecom",[["Default","netgprs.com","none","none",""]]]]',
+ 'gb': '[["3",[["Internet","3internet","none","none",""],["Handsets","three.co.uk","none","none",""]]],["Asda '
+       'Mobile",[["Default","asdamobiles.co.uk","web","web",""]]],["BT '
+       'Mobile",[["Default","btmobile.bt.com","bt","bt",""]]],["Lycamobile",[["Default","data.lycamobile.co.uk","lmuk","plus",""]]],["O2",[["Contract","mobile.o2.co.uk","o2web","password",""],["Contract '
+       '(faster)","mobile.o2.co.uk","faster","password",""],["Pay and Go '
+       '(Prepaid)","payandgo.o2.co.uk","payandgo","payandgo",""],["iPhone '
+       '(Contract)","idata.o2.co.uk","vertigo","password",""],["Mobile '
+       'Broadband","m-bb.o2.co.uk","o2bb","password",""]]],["Orange",[["Contract","orangeinternet","orange","orange",""],["Contract '
+       '(with '
+       'VPN)","internetvpn","orange","orange",""]]],["T-Mobile",[["Default","general.t-mobile.uk","User","mms",""],["Default","general.t-mobile.uk","none","none",""]]],["Tesco '
+       'Mobile",[["Default","prepay.tesco-mobile.com","tescowap","password",""]]],["Virgin '
+       'Mobile",[["Default","vdata","none","none",""],["Default","goto.virginmobile.uk","user","none",""]]],["Vodafone",[["Contract","internet","web","web",""],["Prepaid","pp.vodafone.co.uk","web","web",""],["TopUp '
+       'and Go","ppbundle.internet","web","web",""],["TopUp and Go (older 1GB '
+       'SIMs)","pp.internet","none","none",""]]],["giffgaff",[["Mobile '
+       'Broadband","giffgaff.com","giffgaff","password",""]]]]',
+ 'ge': '[["Geocell",[["Default","Internet","none","none",""]]]]',
+ 'gg': '[["Airtel-Vodaphone",[["Default","airtel-ci-gprs.com","none","none",""]]],["Sure '
+       '(Cable & Wireless)",[["Internet","internet","none","none",""]]],["Wave '
+       'Telecom",[["Default","pepper","none","none",""]]]]',
+ 'gh': '[["Airtel",[["Default","internet","none","none",""]]],["GloGhana",[["Default","internet","none","none",""]]],["MTN",[["Default","internet","none","none",""]]],["Tigo",[["Default","web.tigo.com.gh","web","none",""]]],["Vodafone",[["Default","browse","none","none",""]]]]',
+ 'gl': '[["Tele Greenland A/S",[["Default","internet","none","none",""]]]]',
+ 'gn': '[["Cellcom",[["Default","internet.cellcom.com","internet","cellcom",""]]],["Orange",[["Default","internetogn","none","none",""]]]]',
+ 'gr': '[["Cosmote",[["Default","internet","none","none",""]]],["Vodafone",[["Contract","internet","none","none",""],["Mobile '
+       'Broadband On '
+       'Demand","web.session","none","none",""]]],["Wind",[["Default","gint.b-online.gr","web","web",""]]]]',
+ 'gt': '[["Claro",[["Default","internet.ideasclaro","none","none",""]]],["Comcel '
+       '/ '
+       'Tigo",[["Default","Wap.tigo.gt","Wap","Wap",""]]],["Movistar",[["Default","internet.movistar.gt","movistargt","movistargt",""]]]]',
+ 'gy': '[["DigiCel",[["Default","internet","web","web",""]]],["GT&T Cellink '
+       'Plus",[["Default","wap.cellinkgy.com","test","test",""]]]]',
+ 'hk': '[["3",[["3G","mobile.three.com.hk","none","none",""],["4G '
+       'LTE","mobile.lte.three.com.hk","none","none",""]]],["CSL",[["Default","internet","none","none",""]]],["China '
+       'Mobile",[["Default","peoples.net","none","none",""]]],["Lycamobile",[["Default","data.lycamobile.hk","lmhk","plus",""]]],["New '
+       'World",[["Default","internet","none","none",""]]],["Orange",[["Default","web.orangehk.com","none","none",""]]],["PCCW '
+       '(Sunday)",[["Sunday (Old)","internet","none","none",""],["PCCW '
+       '2G/GPRS","pccwdata","none","none",""],["PCCW '
+       '3G","pccw","none","none",""]]],["SmarTone",[["Default","internet","none","none",""]]],["Sunday",[["Default","internet","none","none",""]]]]',
+ 'hn': '[["Tigo",[["Default","internet.tigo.hn","none","none",""]]]]',
+ 'hr': '[["CARNet '
+       'Tele2",[["Default","carnet.tele2.hr","AAIEDU",null,""]]],["CARNet '
+       'VIPNET",[["Default","carnet.vip.hr","AAIEDU",null,""]]],["T-Mobile",[["Default","web.htgprs","none","none",""]]],["Tele2",[["Default","mobileinternet.tele2.hr","none","none",""]]],["VIPNET",[["Contract '
+       'and Prepaid","data.vip.hr","none","none",""],["GPRS '
+       '5","gprs5.vipnet.hr","38591","38591",""],["GPRS '
+       '0","gprs0.vipnet.hr","38591","38591",""],["3G","3g.vip.hr","38591","38591",""]]]]',
+ 'hu': '[["DIGI",[["DIGI '
+       'Move","digi","none","none",""]]],["Invitel",[["net.and.go","invitel.mobilnet","none","none",""]]],["T-Mobile",[["Default","internet","none","none",""]]],["Telenor",[["mobilinternet","net","none","none",""]]],["Vodafone",[["Előf. '
+       'Normál","standardnet.vodafone.net","vodawap","vodawap",""],["Előf. '
+       'töm.","internet.vodafone.net","none","none",""],["Felt. '
+       'norm.","vitamax.snet.vodafone.net","none","none",""],["Vodafone (felt. '
+       'töm.)","vitamax.internet.vodafone.net","none","none",""]]]]',
+ 'id': '[["3",[["GPRS","3gprs","3gprs","3gprs",""],["Monthly Internet '
+       'Service","3data","3data","3data",""]]],["AXIS",[["Default","AXIS","axis","123456",""]]],["Excelcomindo '
+       '(XL)",[["Default","www.xlgprs.net","xlgprs","proxl",""]]],["Indosat",[["IM3/Mentari '
+       'Time-based","indosatgprs","indosat@durasi","indosat@durasi",""],["IM3/Mentari '
+       'Volume-based","indosatgprs","indosat","indosat",""],["Matrix '
+       '3G/3.5G","indosatgprs","indosat","indosat",""]]],["Telkomsel",[["Default","telkomsel","wap","wap123",""],["Flash '
+       'Time-based","flash","foo","bar",""],["Flash '
+       'Volume-based","internet","foo","bar",""]]]]',
+ 'ie': '[["E-Mobile",[["Broadband To '
+       'Go","broadband.eircommbb.ie","none","none",""]]],["Lycamobile",[["Default","data.lycamobile.ie","lmie","plus",""]]],["Meteor",[["Meteor '
+       'Data","data.mymeteor.ie","my","meteor",""],["Broadband To '
+       'Go","broadband.mymeteor.ie","none","none",""],["GPRS","isp.mymeteor.ie","my","isp",""]]],["O2",[["Contract","open.internet","gprs","gprs",""],["Prepaid","pp.internet","faster","web",""],["Old '
+       'Config Internet and MMS","internet","none","none",""]]],["Three '
+       'Ireland",[["Default","3ireland.ie","none","none",""]]],["Vodafone",[["Default","hs.vodafone.ie","vodafone","vodafone",""],["Old","isp.vodafone.ie","vodafone","vodafone",""],["Prepaid","live.vodafone.com","vodafone","vodafone",""]]]]',
+ 'il': '[["CellCom",[["Default","internetg","none","none",""]]],["GolanTelecom",[["Default","internet.golantelecom.net.il","none","none",""]]],["Home '
+       'Cellular",[["Default","hcminternet","none","none",""]]],["Hot '
+       'Mobile",[["Default","net.hotm","none","none",""]]],["Orange",[["3G '
+       'Internet","uinternet","none","none",""]]],["Pelephone",[["3G","internet.pelephone.net.il","pcl@3g","pcl",""]]],["Rami '
+       'Levi",[["Default","internet.rl","rl@3g","rl",""]]],["YouPhone '
+       '3G",[["Default","data.youphone.co.il","none","none",""]]]]',
+ 'im': '[["Manx Telecom",[["Default","3gpronto","none","none",""]]],["Sure '
+       '(Cable & Wireless)",[["Internet","internet","none","none",""]]]]',
+ 'in': '[["AIRCEL",[["Web","aircelweb","none","none",""],["GPRS","aircelgprs","none","none",""],["GPRS '
+       '(Postpaid)","aircelgprs.po","none","none",""],["GPRS '
+       '(Prepaid)","aircelgprs.pr","none","none",""]]],["Airtel",[["Default","airtelgprs.com","none","none",""]]],["BSNL/CellOne",[["New '
+       'GPRS/3G","bsnlnet","none","none",""],["Old South Zone A (Karnatka, '
+       'Andhra Pradesh, Chennai, Tamil Nadu, '
+       'Kerala)","bsnlsouth","none","none",""],["Old South Zone B (Karnatka, '
+       'Andhra Pradesh, Chennai, Tamil Nadu, '
+       'Kerala)","gprssouth.cellone.in","none","none",""],["Old North Zone '
+       '(Haryana, Punjab, UP(East), UP(West), Himachal Pradesh, Rajasthan, '
+       'Jammu & Kashmir)","gprsnorth.cellone.in","none","none",""],["Old West '
+       'Zone (Maharashtra, Gujrat, Madhya Pradesh, '
+       'Chattishgarh)","gprswest.cellone.in","none","none",""],["Old East Zone '
+       'Prepaid (Jharkhand, Bihar, Kolkata, West Bengal, Orissa, Assam, North '
+       'East, Adman Nicobar)","www.e.pr","none","none",""],["Old East Zone '
+       'Postpaid (Jharkhand, Bihar, Kolkata, West Bengal, Orissa, Assam, North '
+       'East, Adman Nicobar)","www.e.po","none","none",""]]],["Idea '
+       'Cellular",[["Default","internet","none","none",""]]],["MTNL",[["Delhi '
+       '(3G Prepaid / Postpaid)","mtnl.net","mtnl","mtnl123",""],["Mumbai (3G '
+       'Prepaid / '
+       'Postpaid)","mtnl.net","none","none",""],["Delhi","gprsmtnldel","mtnl","mtnl123",""],["Mumbai '
+       '(Prepaid)","gprsppsmum","mtnl","mtnl123",""],["Mumbai (Postpaid / Plan '
+       '2)","gprsmtnlmum","mtnl","mtnl123",""]]],["Reliance",[["Smart '
+       'Net","smartnet","none","none",""],["Netconnect '
+       '(RCOMNET)","rcomnet","none","none",""]]],["Spice '
+       'telecom",[["Default","Simplyenjoy","spice","spice",""],["kar","simplydownload","none","none",""]]],["Tata '
+       'Docomo",[["Internet","TATA.DOCOMO.INTERNET","none","none",""],["Internet","TATADOCOMO3G","none","none",""]]],["Vodafone",[["Vodafone '
+       'Connect","www","none","none",""]]]]',
+ 'iq': '[["Asia '
+       'Cell",[["Default","net.asiacell.com","none","none",""]]],["Korek",[["Default","net.korek.com","korek","korek",""]]]]',
+ 'ir': '[["ایرانسل",[["Default","mtnirancell","none","none",""]]],["همراه '
+       'اول",[["Default","mcinet","none","none",""]]]]',
+ 'is': '[["Nova",[["Default","internet.nova.is","none","none",""]]],["Síminn",[["Default","internet","none","none",""]]],["Vodafone",[["Default","vmc.gprs.is","none","none",""]]]]',
+ 'it': '[["3",[["Ricaricabile","tre.it","none","none",""],["Abbonamento","datacard.tre.it","none","none",""]]],["Bip",[["Megabip '
+       'Internet","internet.vistream.it","none","none",""]]],["CoopVoce",[["Internet '
+       'Mobile","web.coopvoce.it","none","none",""]]],["Fastweb",[["Voce/dati","apn.fastweb.it","none","none",""],["Solo '
+       'dati","datacard.fastweb.it","none","none",""]]],["Iliad",[["Iliad","iliad","none","none",""]]],["Lycamobile",[["Default","data.lycamobile.it","lmit","plus",""]]],["Nòverca",[["Noverca '
+       'WEB","web.noverca.it","none","none",""]]],["PosteMobile",[["Default","internet.postemobile.it","none","none",""]]],["TIM",[["Maxxi '
+       'Alice/Internet","ibox.tim.it","none","none",""]]],["Tiscali",[["Tiscali '
+       'Internet","tiscalimobileinternet","none","none",""]]],["Vodafone",[["Mobile '
+       'Internet","mobile.vodafone.it","none","none",""],["Vodafone Internet '
+       'Key","web.omnitel.it","none","none",""],["Internet Facile '
+       '(old)","web.omnitel.it","none","none",""]]],["Wind",[["Non-business","internet.wind","Wind","Wind",""],["Business","internet.wind.biz","Wind","Wind",""]]]]',
+ 'je': '[["Airtel-Vodaphone",[["Default","airtel-ci-gprs.com","none","none",""]]],["Jersey '
+       'Telecom",[["Default","pepper","abc","abc",""]]],["Sure (Cable & '
+       'Wireless)",[["Internet","internet","none","none",""]]]]',
+ 'jm': '[["Cable & '
+       'Wireless",[["Default","wap","none","none",""]]],["Digicel",[["Default","web.digiceljamaica.com","wapuser","wap03jam",""]]]]',
+ 'jo': '[["Orange",[["Mobile '
+       'Broadband","net.orange.jo","net","net",""]]],["Zain",[["Mobile '
+       'Broadband","zain","Zain","Zain",""]]]]',
+ 'jp': '[["NTTdocomo",[["mopera","mopera.ne.jp","none","none",""],["mopera '
+       'U","mopera.net","none","none",""]]],["Softbank '
+       'Mobile",[["Default","softbank","ai@softbank","softbank",""]]],["b-mobile",[["u300","dm.jplat.net","bmobile@u300","bmobile",""],["Visitor '
+       'SIM","bmobile.ne.jp","bmobile@4g","bmobile",""]]],["e-mobile",[["Default","emb.ne.jp","em","em",""]]]]',
+ 'ke': '[["Airtel",[["Default","ke.celtel.com","none","none",""]]],["Orange",[["Default","bew.orange.co.ke","none","none",""]]],["Safaricom",[["Safaricom '
+       '(Prepaid)","safaricom","saf","data",""],["Default","safaricom","web","web",""]]],["yu '
+       '(Econet)",[["Default","internet.econet.co.ke","none","none",""]]]]',
+ 'kg': '[["Beeline",[["Default","internet.beeline.kg","none","none",""]]],["MegaCom",[["Default","internet","none","none",""]]],["O!",[["Default","internet","none","none",""]]]]',
+ 'kh': '[["Beeline",[["Default","gprs.beeline.com.kh","none","none",""]]],["Cellcard",[["Default","cellcard","mobitel","mobitel",""]]],["Hello",[["Default","hellowww","none","none",""]]],["Metfone",[["Default","metfone","none","none",""]]],["Mfone",[["Default","Mfone","none","none",""]]],["Smart '
+       'Mobile",[["Default","smart","none","none",""]]],["qb",[["Default","WAP","none","none",""]]]]',
+ 'kr': '[["KT",[["KT 3G","alwayson.ktfwing.com","none","none",""],["KT '
+       'LTE","lte.ktfwing.com","none","none",""]]],["LG '
+       'U+",[["Default","internet.lguplus.co.kr","none","none",""]]],["SK '
+       'Telecom",[["SKT 3G","web.sktelecom.com","none","none",""],["SKT '
+       'LTE","lte.sktelecom.com","none","none",""]]]]',
+ 'kw': '[["Viva",[["Default","viva","none","none",""]]],["Wataniya",[["Default","action.wataniya.com","none","none",""]]],["Zain",[["Personal","pps","pps","pps",""],["Corporate","apn01","none","none",""]]]]',
+ 'kz': '[["Activ",[["Default","internet","none","none",""]]],["Altel '
+       '4G",[["Default","internet","none","none",""]]],["Beeline",[["Default","internet.beeline.kz","@internet.beeline","none",""]]],["K\'CELL",[["Default","internet","none","none",""]]],["Tele2",[["Default","internet","none","none",""]]]]',
+ 'la': '[["Beeline '
+       '(Tigo)",[["Default","beelinenet","none","none",""]]],["ETL",[["Default","etlnet","none","none",""]]],["Lao '
+       'Telecom",[["Default","ltcnet","none","none",""]]],["Unitel",[["Unitel '
+       '(2G)","startelecom","none","none",""],["Unitel '
+       '(3G)","unitel3g","none","none",""]]]]',
+ 'lb': '[["MTC Touch",[["Default","gprs.mtctouch.com.lb","none","none",""]]]]',
+ 'lc': '[["Cable & Wireless",[["Default","internet","none","none",""]]]]',
+ 'li': '[["Datamobile",[["Default","datamobile.ag","none","none",""]]]]',
+ 'lk': '[["Airtel",[["Default","www.wap.airtel.lk","none","none",""]]],["Dialog '
+       'GSM",[["Postpaid","www.dialogsl.com","none","none",""],["Prepaid","ppinternet","none","none",""],["Unlimited '
+       'Broadband","dialogbb","none","none",""],["Prepaid '
+       '(Kitbb)","kitbb.com","none","none",""]]],["Hutch",[["Default","htwap","none","none",""]]],["Mobitel",[["Default","isp","none","none",""]]],["Tigo",[["Default","wap","none","none",""]]]]',
+ 'ls': '[["Vodacom Lesotho",[["Default","internet","none","none",""]]]]',
+ 'lt': '[["Bite",[["Default","banga","none","none",""]]],["Omnitel '
+       '(contract)",[["Contract","gprs.omnitel.net","none","none",""],["No '
+       'contract","gprs.startas.lt","omni","omni",""]]],["TELE2 '
+       'GPRS",[["Default","internet.tele2.lt","none","none",""]]]]',
+ 'lu': '[["LUXGSM",[["Default","web.pt.lu","none","none",""]]],["Orange",[["Default","orange.lu","none","none",""]]],["Tango",[["hspa","hspa","tango","tango",""],["internet","internet","tango","tango",""]]],["VOXmobile",[["Default","vox.lu","none","none",""]]]]',
+ 'lv': '[["Bite",[["Bite '
+       'plus","wap","none","none",""],["Prepaid/Contract","internet","none","none",""]]],["LMT",[["Default","internet.lmt.lv","none","none",""],["O!Karte '
+       'internet","open.lmt.lv","none","none",""],["O!Karte","okarte.lmt.lv","none","none",""]]],["Tele2",[["Regular","internet.tele2.lv","gprs","internet",""],["Mobile '
+       'Internet","mobileinternet.tele2.lv","wap","wap",""],["Zelta '
+       'Zivtina","data.tele2.lv","wap","wap",""]]]]',
+ 'ma': '[["Ittissalat Al Maghrib '
+       '(IAM)",[["Abonnement","www.iamgprs1.ma","none","none",""],["Pre-payé","www.iamgprs2.ma","none","none",""]]],["Medi '
+       'Telecom",[["Abonnement","internet1.meditel.ma","MEDINET","MEDINET",""],["Pre-payé","internet2.meditel.ma","MEDINET","MEDINET",""]]],["WANA",[["INWI","www.wana.ma","none","none",""]]]]',
+ 'md': '[["Moldcell",[["Internet","internet","gprs","gprs",""]]],["Orange",[["Internet","internet","gprs","gprs",""]]],["Unité",[["Internet '
+       'cu abonament","internet.unite.md","gprs","gprs",""],["Internet fără '
+       'abonament","internet3g.unite.md","gprs","gprs",""]]]]',
+ 'me': '[["ProMonte '
+       'GSM",[["Default","gprs.promonte.com","none","none",""]]],["T-Mobile",[["Mobile '
+       'Broadband","tmcg-data","38267","38267",""],["GPRS","tmcg-nw","38267","38267",""],["Postpaid '
+       '(old)","internet-postpaid","none","none",""],["Prepaid '
+       '(old)","internet-prepaid","none","none",""]]],["m:tel",[["Default","gprsinternet","none","none",""]]]]',
+ 'mg': '[["Airtel",[["Default","internet","none","none",""]]],["Orange",[["Default","orangeworld","world","orange",""]]],["Telma",[["Default","internet","none","none",""]]]]',
+ 'mk': '[["Lycamobile",[["Default","data.lycamobile.mk","lmde","plus",""]]],["One",[["Internet","datacard","none","none",""]]],["T-Mobile",[["Default","internet","internet","internet",""]]],["Vodafone",[["Default","vipoperator","vipoperator","vipoperator",""]]]]',
+ 'ml': '[["Malitel",[["3G+","web.malitel3.ml","internet","internet",""]]],["Orange",[["Internet '
+       'Every '
+       'Where","iew","iew","iew",""],["Internet","internet","internet","internet",""]]]]',
+ 'mm': '[["MPT",[["MPTNET","mptnet","mptnet","mptnet",""]]],["Ooredoo",[["Ooredoo","internet","internet","internet",""]]],["Telenor",[["Telenor","internet","internet","internet",""]]]]',
+ 'mn': '[["MobiCom",[["Default","internet","none","none",""]]]]',
+ 'mo': '[["3 / '
+       'Hutchison",[["Default","web.hutchisonmacau.com","hutchison","1234",""]]],["CTM",[["Default","ctm-mobile","none","none",""]]]]',
+ 'mt': '[["GO '
+       'Mobile",[["Postpaid","gosurfing","none","none",""],["Prepaid","rtgsurfing","none","none",""]]],["Melita",[["Melita '
+       'Connector","web.melita","none","none",""]]],["Vodafone",[["Default","Internet","internet","internet",""]]]]',
+ 'mu': '[["Emtel",[["Default","WEB","none","none",""]]]]',
+ 'mv': '[["Dhiraagu",[["Default","internet.dhimobile","none","none",""]]],["Wataniya",[["Default","WataniyaNet","none","none",""]]]]',
+ 'mw': '[["Airtel MW",[["All '
+       'plans","internet","none","none",""]]],["TNM",[["Default","Internet","none","none",""]]]]',
+ 'mx': '[["Movistar",[["Default","internet.movistar.mx","movistar","movistar",""]]],["Telcel",[["Default","internet.itelcel.com","webgprs","webgprs2002",""]]]]',
+ 'my': '[["Celcom",[["GPRS","celcom.net.my","none","none",""],["Celcom '
+       '3G","celcom3g","none","none",""]]],["DiGi",[["Mobile '
+       'Internet","diginet","none","none",""],["Broadband","3gdgnet","none","none",""]]],["Maxis",[["Broadband","maxisbb","maxis","wap",""],["GPRS","net","maxis","net",""],["3G '
+       '(handsets)","unet","maxis","wap",""]]]]',
+ 'mz': '[["MCel",[["Default","isp.mcel.mz","guest","guest",""]]],["Movitel",[["Default","default","none","none",""]]],["Vodacom",[["Contract '
+       '/ Prepaid","internet","none","none",""]]]]',
+ 'na': '[["Leo",[["Leo","internet","none","none",""]]],["MTC",[["Tango","ppsinternet","ppsuser","ppsuser",""],["Contract","internet","none","none",""]]]]',
+ 'ng': '[["Airtel '
+       'NG",[["Default","internet.ng.airtel.com.ng","internet","internet",""]]],["Etisalat",[["Etisalat '
+       'Internet","etisalat","none","none",""]]],["Glo Mobile",[["Pay as You '
+       'Go","glosecure","gprs","gprs",""],["Glo 3G '
+       'Packs","gloflat","flat","flat",""]]],["MTN",[["Default","web.gprs.mtnnigeria.net","web","web",""]]]]',
+ 'ni': '[["Claro",[["Web","web.emovil","webemovil","webemovil",""],["Web (Alo '
+       'pcs)","internet.ideasalo.ni","internet","internet",""]]],["Movistar",[["Default","internet.movistar.ni","internet","internet",""]]]]',
+ 'nl': '[["Ben",[["Ben internet '
+       '(prepaid)","basic.internet.ben.data","none","none",""],["Ben '
+       'internet","internet.ben","none","none",""]]],["Galaxy",[["Default","internet","none","none",""]]],["Hi",[["Default","portalmmm.nl","none","none",""]]],["KPN '
+       'NL",[["KPN Prepaid Mobiel '
+       'Internet","prepaidinternet","none","none",""],["KPN 3G/2G LTE Mobiel '
+       'Internet","fastinternet","none","none",""],["Default","internet","KPN","gprs",""],["KPN '
+       '4G LTE Mobiel Internet","KPN4G.nl","none","none",""],["KPN Mobiel '
+       'Internet","portalmmm.nl","none","none",""]]],["Lebara",[["Default","multimedia.lebara.nl","none","none",""]]],["Lycamobile",[["Default","data.lycamobile.nl","lmnl","plus",""]]],["MEDIONmobile",[["Aldi '
+       'Talk Mobiel Prepaid '
+       'Internet","portalmmm.nl","none","none",""]]],["Orange",[["Default","internet","orange","orange",""]]],["Simpel",[["Default","internet.access.nl","none","none",""]]],["T-Mobile",[["T-Mobile '
+       'Internet","internet","none","none",""],["T-Mobile '
+       'NL","smartsites.t-mobile","none","none",""]]],["Tele2",[["Default","data.tele2.nl","none","none",""]]],["Telfort",[["Default","internet","telfortnl","none",""]]],["Vodafone",[["Non-business","live.vodafone.com","vodafone","vodafone",""],["Business","office.vodafone.nl","vodafone","vodafone",""],["M2M","m2m.global.vodafone.nl","web","web",""]]],["XS4ALL '
+       'Mobiel Internet",[["Default","umts.xs4all.nl","xs4all","xs4all",""]]]]',
+ 'no': '[["Altibox",[["Default","internet","none","none",""]]],["Chess",[["Default","netcom","chess","chess",""]]],["Ludo '
+       'Mobil",[["Default","internet.ventelo.no","none","none",""]]],["Lycamobile",[["Default","data.lyca-mobile.no","lmno","plus",""]]],["MyCall",[["Default","internet","none","none",""]]],["Netcom",[["Default","internet.netcom.no","netcom","netcom",""]]],["Network '
+       'Norway",[["Default","internet","none","none",""]]],["OneCall",[["Default","internet","none","none",""]]],["Phonero",[["Default","internet.phonero.no","none","none",""]]],["TDC",[["Default","internet.no","none","none",""]]],["Tele2",[["Mobilt '
+       'bredbånd","mobileinternet.tele2.no","none","none",""]]],["Telenor",[["Telenor","telenor.smart","none","none",""]]],["Telipol",[["Default","internet","none","none",""]]],["Ventelo",[["Default","internet.ventelo.no","none","none",""]]]]',
+ 'np': '[["Mero Mobile",[["Default","mero","none","none",""]]],["Nepal '
+       'Telecom",[["Default","ntnet","none","none",""]]]]',
+ 'nz': '[["2-Degrees",[["Broadband","internet","none","none",""]]],["Orcon",[["Broadband","www.orcon.net.nz","none","none",""]]],["Telecom '
+       'New Zealand",[["XT mobile (Internet with '
+       'Firewall)","internet.telecom.co.nz","none","none",""],["XT mobile '
+       '(Direct Internet)","direct.telecom.co.nz","none","none",""],["XT '
+       'mobile (One Office/Remote '
+       'Office)","oa.telecom.co.nz","none","none",""]]],["TelstraClear",[["Broadband","www.telstraclear.net.nz","none","none",""]]],["Vodafone",[["WAP","live.vodafone.com","none","none",""],["Contract '
+       '/ Prepaid '
+       '(Restricted)","www.vodafone.net.nz","none","none",""],["Unrestricted '
+       '(public)","internet","none","none",""]]]]',
+ 'om': '[["Nawras",[["Default","isp.nawras.com.om","none","none",""]]],["Oman '
+       'Mobile",[["Mobile Broadband","taif","taif","taif",""],["Internet '
+       '(old)","internet","none","none",""]]]]',
+ 'pa': '[["Cable and '
+       'Wireless",[["Default","apn01.cwpanama.com.pa","none","none",""]]],["Movistar",[["Default","internet.movistar.pa","movistarpa","movistarpa",""]]]]',
+ 'pe': '[["Claro",[["Default","tim.pe","tim","tulibertad",""],["Internet Móvil '
+       'Prepago","ba.amx","amx","amx",""]]],["Movistar",[["Default","movistar.pe","movistar@datos","movistar",""]]],["Nextel",[["Default","datacard.nextel.com.pe","none","none",""]]]]',
+ 'pf': '[["Vini",[["Default","internet","none","none",""]]]]',
+ 'pg': '[["Digicel",[["Prepaid","internet.digicelpng.com","none","none",""]]]]',
+ 'ph': '[["Digitel (Sun '
+       'Cellular)",[["Default","minternet","none","none",""]]],["Globe '
+       'Telecom",[["Postpaid","internet.globe.com.ph","globe","globe",""],["Prepaid","http.globe.com.ph","globe","globe",""],["WAP","www.globe.com.ph","globe","globe",""]]],["Smart",[["Default","internet","witsductoor","banonoy",""]]]]',
+ 'pk': '[["Djuice",[["Default","internet","telenor","telenor",""]]],["Mobilink",[["Internet","connect.mobilinkworld.com","none","none",""],["Jazz","jazzconnect.mobilinkworld.com","none","none",""]]],["Telenor",[["Default","internet","telenor","telenor",""]]],["Ufone",[["Default","ufone.internet","ufone","ufone",""]]],["Warid",[["Default","warid","none","none",""]]],["ZONG",[["Default","zonginternet","none","none",""]]]]',
+ 'pl': '[["Cyfrowy '
+       'Polsat",[["Default","multi.internet","none","none",""]]],["Heyah",[["heyah.pl","heyah.pl","none","none",""],["internet","internet","none","none",""]]],["INEA",[["Default","telogic.internet","internet","none",""]]],["Lycamobile",[["Default","data.lycamobile.pl","lmpl","plus",""]]],["Multimo",[["Default '
+       'APN","internet","internet","internet",""],["APN: '
+       'mni.internet","mni.internet","mni.internet","none",""],["APN: '
+       'telogic.internet","telogic.internet","telogic.internet","none",""]]],["Netia",[["Default","internet","none","none",""]]],["Orange",[["Standard '
+       'access","internet","internet","internet",""],["Standard access '
+       '(IPv6)","internetipv6","internetipv6","internetipv6",""],["External '
+       'dynamic IP address (requires '
+       'activation)","vpn","none","none",""],["External static IP address '
+       '(requires '
+       'activation)","vpn.static.pl","none","none",""]]],["Play",[["Default","internet","none","none",""]]],["Plus",[["Standard '
+       'access","internet","internet","internet",""],["External dynamic IP '
+       'address (requires '
+       'activation)","pro","plusgsm","plusgsm",""],["External static IP '
+       'address (requires activation)","m2m","plusgsm","plusgsm",""],["iPlus '
+       'optimizer with data '
+       'compression","optimizer","none","none",""]]],["T-Mobile",[["Default","internet","none","none",""]]],["Vectra",[["Default","internet","none","none",""]]],["Virgin '
+       'Mobile",[["Internet","virgin-internet","none","none",""]]],["aero2",[["Default","darmowy","none","none",""]]],["nju '
+       'mobile",[["Standard '
+       'access","internet","internet","internet",""],["Standard access '
+       '(IPv6)","internetipv6","internetipv6","internetipv6",""]]]]',
+ 'pt': '[["Clix",[["Default","clixinternetmovel","none","none",""]]],["Kanguru",[["Portable","kanguru-portatil","none","none",""],["Tempo '
+       '(Prepaid)","kanguru-tempo","none","none",""],["Fixo","kangurufixo","none","none",""]]],["Lycamobile",[["Default","data.lycamobile.pt","lmpt","plus",""]]],["Optimus",[["3G","umts","none","none",""],["GPRS","internet","none","none",""]]],["TMN",[["Tmn '
+       'Internet","internet","tmn","tmn",""]]],["Vodafone",[["Default","internet.vodafone.pt","vodafone","vodafone",""],["Vodafone '
+       'Internet","net2.vodafone.pt","none","none",""]]],["ZON",[["Dados '
+       'Móveis","internet.zon.pt","none","none",""]]]]',
+ 'py': '[["Claro",[["Internet","gprs.claro.com.py","none","none",""]]],["Personal",[["Default","internet","none","none",""]]],["Tigo",[["Internet","internet.tigo.py","none","none",""],["Broadband","broadband.tigo.py","tigo","tigo",""]]],["VOX",[["Default","vox.wap","none","none",""]]]]',
+ 'qa': '[["Q-Tel",[["Qatarnet","gprs.qtel","gprs","gprs",""]]],["Vodafone",[["Web","web.vodafone.com.qa","none","none",""],["Web '
+       '(old)","vodafone.com.qa","none","none",""]]]]',
+ 're': '[["SFR Réunion",[["Contract / '
+       'Prepaid","websfr","none","none",""],["SFR '
+       'slsfr","slsfr","none","none",""],["SFR '
+       'internetpro","internetpro","none","none",""],["SFR '
+       'ipnet","ipnet","none","none",""]]]]',
+ 'ro': '[["Digi.Net Mobil",[["Home","internet","none","none",""],["Business '
+       '(static)","static","none","none",""]]],["Lycamobile",[["Default","data.lycamobile.ro","lmro","plus",""]]],["Orange",[["Default","internet","none","none",""]]],["Vodafone",[["Mobile '
+       'Internet '
+       '(Prepaid)","tobe.vodafone.ro","tobe.vodafone.ro","vodafone",""],["Mobile '
+       'Internet '
+       '(Postpaid)","internet.vodafone.ro","internet.vodafone.ro","vodafone",""],["Mobile '
+       'Internet '
+       '(Prepaid)","internet.pre.vodafone.ro","internet.pre.vodafone.ro","vodafone",""],["Live! '
+       '(Postpaid)","live.vodafone.com","live","vodafone",""],["Live! '
+       '(Prepaid)","live.pre.vodafone.ro","live.pre.vodafone.com","vodafone",""]]]]',
+ 'rs': '[["Telekom '
+       'Srbija",[["Default","gprsinternet","mts","064",""]]],["Telenor",[["Default","internet","telenor","gprs",""]]],["VIP '
+       'Mobile",[["Default","vipmobile","vipmobile","vipmobile",""]]]]',
+ 'ru': '[["BaikalWestCom",[["Default","inet.bwc.ru","bwc","bwc",""]]],["Beeline",[["3G '
+       'modem","home.beeline.ru","beeline","beeline",""],["Mobile '
+       'phone","internet.beeline.ru","beeline","beeline",""]]],["ETK",[["Default","wap.etk.ru","none","none",""]]],["Enisey '
+       'TeleCom",[["Default","internet.etk.ru","etk","none",""]]],["MTS",[["Default","internet.mts.ru","mts","mts",""]]],["Megafon",[["RUS","internet","gdata","gdata",""]]],["Motiv",[["Default","inet.ycc.ru","motiv","none",""]]],["NCC",[["Default","internet","ncc","none",""]]],["NTC",[["Default","internet.ntc","none","none",""]]],["Tatincom",[["Default","internet.tatincom.ru","tatincom","tatincom",""]]],["Tele2",[["Default","internet.tele2.ru","none","none",""]]],["U-tel",[["Default","internet.usi.ru","none","none",""]]],["Yota",[["Internet '
+       'for LTE modems","internet.yota","none","none",""],["Internet for LTE '
+       'modems (in case internet.yota does not '
+       'work)","yota.ru","none","none",""]]]]',
+ 'rw': '[["MTN",[["Default","internet.mtn","none","none",""]]],["Tigo",[["Default","web.tigo.rw","none","none",""]]]]',
+ 'sa': '[["Mobily",[["Postpaid","web1","none","none",""],["Prepaid","web2","none","none",""]]],["STC",[["Default","jawalnet.com.sa","none","none",""]]],["Zain",[["Default","zain","none","none",""]]]]',
+ 'sd': '[["MTN",[["Default","internet","none","none",""]]],["Sudani",[["Default","sudaninet","sudani","sudani",""]]],["Zain",[["Default","internet","none","none",""]]]]',
+ 'se': '[["3",[["Mobiltelefon","data.tre.se","none","none",""],["Bredband","bredband.tre.se","none","none",""],["Bredband '
+       'Kontantkort","net.tre.se","none","none",""]]],["Com '
+       'Hem",[["Default","bredband.comhem.se","none","none",""]]],["Comviq",[["Surf","data.comviq.se","none","none",""],["Tele2 '
+       'Comviq 3G","internet.tele2.se","none","none",""],["Tele2 Comviq 3G '
+       '(7,2 '
+       'Mbit/s)","mobileinternet.tele2.se","none","none",""]]],["Glocalnet",[["Mobilt '
+       'Bredband","bredband.glocalnet.se","none","none",""],["Glocalnet '
+       'Internet","internet.glocalnet.se","none","none",""]]],["Halebop",[["Default","halebop.telia.se","none","none",""]]],["Lycamobile",[["Default","data.lycamobile.se","lmse","plus",""]]],["Multicom '
+       'Security",[["Mobiflex","mobiflex.telia.se","none","none",""]]],["Parlino",[["Default","internet.parlino.se","none","none",""]]],["TDC",[["Default","internet.se","none","none",""]]],["Tele2",[["Mobilt '
+       'Internet","internet.tele2.se","none","none",""],["Mobilt '
+       'Bredband","mobileinternet.tele2.se","none","none",""]]],["Telenor",[["Mobilt '
+       'Internet","internet.telenor.se","none","none",""],["Mobilsurf med '
+       'maxtaxa","services.telenor.se","none","none",""],["Mobilt '
+       'Bredband","bredband.telenor.se","none","none",""]]],["Telia",[["Telia '
+       '3G","online.telia.se","none","none",""]]],["Universal '
+       'Telecom",[["Mobilt Bredband","sp-internet","none","none",""],["Mobilt '
+       'Internet","internet.uvtc.com","none","none",""]]],["djuice",[["Default","internet.djuice.se","none","none",""]]]]',
+ 'sg': '[["M1",[["SunSurf/Mobile Broadband '
+       '(postpaid)","sunsurf","65","none",""],["MiWorld Mobile '
+       '(postpaid)","miworld","65(mobilenumber)","user123",""],["MiWorld '
+       'Mobile '
+       '(prepaid)","miworldcard","65(mobilenumber)","user123",""],["Mobile '
+       'Broadband (prepaid)","prepaidbb","none","none",""],["M Card '
+       '(prepaid)","sunsurfmcard","none","none",""]]],["SingTel",[["Default","internet","none","none",""]]],["Starhub",[["MaxMobile '
+       'Broadband (prepaid)","shppd","none","none",""],["MaxMobile Broadband '
+       '(postpaid)","shinternet","none","none",""]]]]',
+ 'si': '[["Mobitel",[["Postpaid","internet","mobitel","internet",""],["Default","internetpro","mobitel","internet",""]]],["T-2",[["Default","internet.t-2.net","none","none",""]]],["Telemach",[["NET2GO/FREE2GO","internet","none","none",""]]],["Vodafone '
+       '/ '
+       'Simobil",[["Default","internet.simobil.si","simobil","internet",""]]]]',
+ 'sk': '[["O2",[["Internet","o2internet","none","none",""]]],["Orange",[["Default","internet","none","none",""]]],["Slovak '
+       'Telekom",[["Default","internet","none","none",""]]]]',
+ 'sn': '[["Tigo",[["Default","wap.sentelgsm.com","none","none",""]]]]',
+ 'sv': '[["Claro",[["Internet","internet.ideasclaro","none","none",""]]],["Movistar",[["Default","internet.movistar.sv","movistarsv","movistarsv",""]]],["Tigo",[["Default","internet.tigo.sv","none","none",""]]],["digicel",[["Default","wap.digicelsv.com","none","none",""]]]]',
+ 'sz': '[["Eswatini Mobile",[["Default","internet","none","none",""]]],["MTN '
+       'Eswatini",[["Default","mymtn.co.sz","none","none",""]]]]',
+ 'th': '[["AIS",[["Default","internet","none","none",""]]],["AIS (AWN)",[["AIS '
+       'internet","internet","none","none",""]]],["DTAC",[["Default","www.dtac.co.th","none","none",""]]],["TOT '
+       '3G",[["Default","internet","none","none",""]]],["True '
+       'Move",[["Default","internet","true","true",""]]]]',
+ 'tn': '[["Lycamobile",[["Default","data.lycamobile.tn","lmtn","plus",""]]],["Orange",[["Internet","weborange","none","none",""],["Internet '
+       'Everywhere Prepaid","keygp","none","none",""],["Internet Everywhere '
+       'Professional","keypro","none","none",""]]],["Tunisie Télécom / '
+       'TUNTEL",[["GPRS DATA","gprs.tn","gprs","gprs",""],["WEB '
+       'DATA","internet.tn","none","none",""]]]]',
+ 'tr': '[["Avea",[["Default","internet","none","none",""],["(former '
+       'Aycell)","aycell","none","none",""]]],["Turkcell",[["Turkcell '
+       'internet","internet","none","none",""],["Turkcell '
+       '3G","mgb","none","none",""]]],["Vodafone",[["Vodafone '
+       'Internet","internet","vodafone","vodafone",""],["KKTC '
+       'Telsim","edge.kktctelsim.com","none","none",""]]]]',
+ 'tt': '[["Digicel",[["Default","wap.digiceltt.com","wap","wap",""]]],["bmobile '
+       '/ TSTT",[["Default","internet","wap","wap",""]]]]',
+ 'tw': '[["Chunghwa Telecom '
+       '(emome)",[["Default","emome","web","web",""],["Default","internet","none","none",""]]],["Far '
+       'EasTone / KGT",[["Default","internet","none","none",""]]],["TW '
+       'Mobile",[["Default","internet","none","none",""]]],["TransAsia",[["Default","internet","none","none",""]]],["Vibo '
+       'Telecom / Aurora",[["Default","vibo","none","none",""]]]]',
+ 'tz': '[["Airtel '
+       'Tanzania",[["Default","internet","none","none",""]]],["Vodacom",[["Default","internet","none","none",""]]],["Zantel",[["Default","znet","none","none",""]]],["tiGO",[["Default","internet","none","none",""]]]]',
+ 'ua': '[["Beeline",[["Default","internet.beeline.ua","none","none",""]]],["Djuice",[["Internet '
+       'GPRS","www.djuice.com.ua","none","none",""],["Internet '
+       'XL","xl.kyivstar.net","none","none",""],["Internet '
+       '3G","3g.kyivstar.net","none","none",""]]],["Jeans",[["Default","www.jeans.ua","none","none",""],["Hyper.NET","hyper.net","none","none",""]]],["MTS",[["GPRS '
+       'Internet","internet","internet","none",""],["Hyper.NET","hyper.net","none","none",""],["HyperActive","active","none","none",""],["umc.ua","www.umc.ua","none","none",""]]],["Utel",[["Default","3g.utel.ua","none","none",""]]],["kyivstar",[["Ace&Base","www.ab.kyivstar.net","igprs","internet",""],["Contract '
+       'GPRS","www.kyivstar.net","none","none",""],["Internet '
+       '3G","3g.kyivstar.net","none","none",""]]],["life:)",[["Standard","internet","none","none",""],["Faster","speed","none","none",""]]]]',
+ 'ug': '[["MTN",[["Default","yellopix.mtn.co.ug","none","none",""]]],["Orange",[["Default","orange.ug","none","none",""]]],["UTL",[["Mobile '
+       'Broadband","utbroadband","none","none",""],["Mobile '
+       'Internet","utweb","none","none",""]]],["Warid",[["Default","web.waridtel.co.ug","none","none",""]]],["Zain",[["Default","web.ug.zain.com","none","none",""]]]]',
+ 'us': '[["AT&T",[["MEdia Net '
+       '(phones)","wap.cingular","none","none",""],["LaptopConnect (data '
+       'cards)","Broadband","none","none",""],["Data Connect '
+       '(old)","isp.cingular","none","none",""],["LTE","pta","none","none",""]]],["BendBroadband",[["Default","ISP","none","none",""]]],["Cincinnati '
+       'Bell '
+       'Wireless",[["Default","wap.gocbw.com","cbw","none",""]]],["Lycamobile",[["Default","data.lycamobile.com","none","none",""]]],["MTPCS '
+       '(Cellular '
+       'One)",[["Default","wapgw.chinookwireless.net","none","none",""]]],["SpeedTalk '
+       'Mobile",[["Broadband","mobilenet","none","none",""]]],["Straight '
+       'Talk",[["Default","att.mvno","none","none",""],["Default","tfdata","none","none",""]]],["T-Mobile",[["LTE","fast.t-mobile.com","none","none",""],["Internet/WebConnect","epc.tmobile.com","none","none",""],["Web2Go/t-zones","wap.voicestream.com","none","none",""],["Internet '
+       '(old)","internet2.voicestream.com","none","none",""],["Internet with '
+       'VPN '
+       '(old)","internet3.voicestream.com","none","none",""]]],["Verizon",[["4G '
+       'LTE Contract","vzwims","none","none",""],["4G LTE '
+       'Contract","vzwinternet","none","none",""]]]]',
+ 'uy': '[["Ancel",[["ADSL Móvil","adslmovil","none","none",""],["ADSL Móvil '
+       'Prepago","prepago.ancel","BAM","BAM",""],["GPRS","gprs.ancel","none","none",""]]],["Claro",[["3G '
+       'Internet","gprs.claro.com.uy","ctigprs","ctigprs999",""],["2G '
+       'Internet","internet.ctimovil.com.uy","ctiweb","ctiweb999",""]]],["Movistar",[["3G '
+       'Internet","apnumt.movistar.com.uy","movistar","movistar",""],["2G '
+       'Internet","webapn.movistar.com.uy","movistar","movistar",""]]]]',
+ 'uz': '[["Beeline",[["Default","internet.beeline.uz","beeline","beeline",""]]],["UMS",[["Default","net.ums.uz",null,null,""]]]]',
+ 'vc': '[["Digicel",[["Default","wap.digiceloecs.com","wapoecs","wap03oecs",""]]]]',
+ 've': '[["Digitel '
+       'TIM",[["Default","gprsweb.digitel.ve","none","none",""]]],["Movilnet",[["Default","int.movilnet.com.ve","none","none",""]]],["Movistar",[["Default","internet.movistar.ve","none","none",""]]]]',
+ 'vn': '[["Beeline '
+       'VN",[["Default","internet","none","none",""]]],["EVNTelecom/E-Mobile",[["EVNTelecomNet","e-internet","none","none",""]]],["MobiFone",[["Default","m-wap","mms","mms",""]]],["Vietnamobile",[["Default","internet","none","none",""]]],["Viettel '
+       'Mobile",[["Mobile Internet","v-internet","none","none",""],["D-com '
+       '3G","e-connect","none","none",""]]],["Vinaphone",[["Mobile '
+       'Internet","m3-world","mms","mms",""],["Mobile '
+       'Broadband","m3-card","mms","mms",""]]]]',
+ 'za': '[["8.ta",[["Default","internet","none","none",""]]],["Cell-c",[["Default","internet","none","none",""]]],["MTN",[["Default","internet","none","none",""]]],["Virgin '
+       'Mobile",[["Default","vdata","none","none",""]]],["Vodacom",[["Default","internet","none","none",""],["Unrestricted","unrestricted","none","none",""]]]]'}
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+RED Plugin
+Copyright (C) 2026 Matthias Bolte <matthias@tinkerforge.com>
+
+settings_utils.py: Settings Utils
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import time
+
+from PyQt5.QtCore import QTimer
+
+# settings scripts whose results are collected at once as (section, script name,
+# params), each one would otherwise be executed by a settings tab on its own
+def get_settings_status_sections(image_version):
+    if image_version.number < (1, 10):
+        network_status_script = 'settings_network_status'
+    else:
+        network_status_script = 'settings_network_status_nm'
+
+    return [
+        ('services',           'settings_services',               ['CHECK']),
+        ('network_status',     network_status_script,             []),
+        ('network_interfaces', 'settings_network_get_interfaces', []),
+        ('ap_status',          'settings_ap_status',              []),
+        ('fs_expand_check',    'settings_fs_expand_check',        ['/dev/mmcblk0'])
+    ]
+
+# Snapshot of the settings status collected by executing the settings scripts
+# of several settings tabs at once. Each section result is handed out once,
+# afterwards the settings tabs execute their own script again. This keeps the
+# results of a later refresh or an apply from being served from an outdated
+# snapshot.
+class SettingsStatus:
+    MAX_AGE = 60 # seconds
+
+    def __init__(self):
+        self.results   = {}
+        self.timestamp = 0
+
+    def update(self, results):
+        self.results   = {}
+        self.timestamp = time.monotonic()
+
+        # drop sections that could not be executed at all, the settings tab
+        # executes its own script for them instead
+        for section, result in results.items():
+            if result.error == None:
+                self.results[section] = result
+
+    def clear(self):
+        self.results = {}
+
+    def take(self, section):
+        if time.monotonic() - self.timestamp > SettingsStatus.MAX_AGE:
+            self.results = {}
+
+        return self.results.pop(section, None)
+
+    # Reports the snapshot result of the section if available, otherwise the
+    # script is executed. The result_callback is always called asynchronously.
+    def execute_script(self, script_manager, section, script_name, result_callback, params=None):
+        result = self.take(section)
+
+        if result == None:
+            script_manager.execute_script(script_name, result_callback, params)
+        else:
+            QTimer.singleShot(0, lambda: result_callback(result))
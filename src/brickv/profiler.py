@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2026 Matthias Bolte <matthias@tinkerforge.com>
+
+profiler.py: Opt-in runtime instrumentation
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+import bisect
+import json
+import threading
+import time
+
+# upper bucket bounds, the last bucket collects everything above
+DURATION_BOUNDS = [0.0001 * 2 ** i for i in range(18)] # 0.1 ms to 13.1 s
+DEPTH_BOUNDS = [0] + [2 ** i for i in range(13)] # 0 to 4096
+
+def get_function_name(function):
+    self_ = getattr(function, '__self__', None)
+    name = getattr(function, '__qualname__', None)
+
+    if name == None:
+        name = getattr(function, '__name__', repr(function))
+
+    if self_ != None and '.' not in name:
+        name = type(self_).__name__ + '.' + name
+
+    return name
+
+def get_device_name(device):
+    return '{0} [{1}]'.format(getattr(device, 'DEVICE_DISPLAY_NAME', type(device).__name__), device.uid_string)
+
+class Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def record(self, value):
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+        if self.min == None or value < self.min:
+            self.min = value
+
+        if self.max == None or value > self.max:
+            self.max = value
+
+    # returns the upper bound of the bucket that contains the percentile
+    def percentile(self, p):
+        if self.count == 0:
+            return None
+
+        threshold = self.count * p / 100.0
+        seen = 0
+
+        for i, count in enumerate(self.buckets):
+            seen += count
+
+            if seen >= threshold:
+                if i < len(self.bounds):
+                    return min(self.bounds[i], self.max)
+
+                return self.max
+
+        return self.max
+
+    def to_dict(self, duration):
+        return {
+            'count': self.count,
+            'rate': self.count / duration if duration > 0 else None,
+            'mean': self.total / self.count if self.count > 0 else None,
+            'min': self.min,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': self.max,
+            'bounds': self.bounds,
+            'buckets': self.buckets
+        }
+
+class Profiler:
+    """
+    Collects timings, counts and gauges into fixed-size histograms. All
+    instrumentation points check the enabled flag first, so the cost while
+    disabled is a single attribute lookup. The IPConnection is instrumented
+    by wrapping its methods while the profiler is enabled, the bindings
+    themselves stay untouched.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.histograms = {} # by category, by name
+        self.counters = {} # by category, by name
+        self.gauges = {} # by category, by name
+        self.start_time = time.monotonic()
+        self.gauge_callbacks = []
+        self.wrapped = [] # (class, attribute name, original)
+
+    def enable(self):
+        if self.enabled:
+            return
+
+        self.wrap_ip_connection()
+        self.reset()
+        self.enabled = True
+
+    def disable(self):
+        if not self.enabled:
+            return
+
+        self.enabled = False
+
+        for cls, name, original in reversed(self.wrapped):
+            setattr(cls, name, original)
+
+        self.wrapped = []
+
+    def reset(self):
+        with self.lock:
+            self.histograms = {}
+            self.counters = {}
+            self.gauges = {}
+            self.start_time = time.monotonic()
+
+    def record(self, category, name, value, bounds=DURATION_BOUNDS):
+        with self.lock:
+            histograms = self.histograms.setdefault(category, {})
+            histogram = histograms.get(name)
+
+            if histogram == None:
+                histogram = Histogram(bounds)
+                histograms[name] = histogram
+
+            histogram.record(value)
+
+    def count(self, category, name, n=1):
+        with self.lock:
+            counters = self.counters.setdefault(category, {})
+            counters[name] = counters.get(name, 0) + n
+
+    def set_gauge(self, category, name, value):
+        with self.lock:
+            self.gauges.setdefault(category, {})[name] = value
+
+    # callback() is called on each snapshot and can update gauges
+    def add_gauge_callback(self, callback):
+        self.gauge_callbacks.append(callback)
+
+    def snapshot(self):
+        for callback in self.gauge_callbacks:
+            callback(self)
+
+        with self.lock:
+            duration = time.monotonic() - self.start_time
+
+            return {
+                'duration': duration,
+                'histograms': {category: {name: histogram.to_dict(duration) for name, histogram in histograms.items()}
+                               for category, histograms in self.histograms.items()},
+                'counters': {category: {name: {'count': count, 'rate': count / duration if duration > 0 else None}
+                                        for name, count in counters.items()}
+                             for category, counters in self.counters.items()},
+                'gauges': {category: dict(gauges) for category, gauges in self.gauges.items()}
+            }
+
+    def save_json(self, filename):
+        with open(filename, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2, sort_keys=True)
+
+    def wrap(self, cls, name, wrapper):
+        original = getattr(cls, name)
+
+        self.wrapped.append((cls, name, original))
+        setattr(cls, name, wrapper(original))
+
+    def wrap_ip_connection(self):
+        from brickv.bindings.ip_connection import IPConnection, get_uid_from_data, get_function_id_from_data
+
+        profiler = self
+        function_names = {} # by device class, by function ID
+
+        def get_function_label(device, function_id):
+            cls = type(device)
+            names = function_names.get(cls)
+
+            if names == None:
+                names = {}
+
+                for attribute in dir(cls):
+                    if attribute.startswith('FUNCTION_') or attribute.startswith('CALLBACK_'):
+                        names[getattr(cls, attribute)] = attribute.lower().split('_', 1)[1]
+
+                function_names[cls] = names
+
+            return '{0}.{1}'.format(get_device_name(device), names.get(function_id, function_id))
+
+        def wrap_send_request(send_request):
+            def send_request_wrapper(self, device, function_id, *args, **kwargs):
+                if not profiler.enabled:
+                    return send_request(self, device, function_id, *args, **kwargs)
+
+                start = time.monotonic()
+
+                try:
+                    return send_request(self, device, function_id, *args, **kwargs)
+                finally:
+                    profiler.record('Request Latency', get_function_label(device, function_id), time.monotonic() - start)
+
+            return send_request_wrapper
+
+        def wrap_dispatch_packet(dispatch_packet):
+            def dispatch_packet_wrapper(self, packet):
+                if profiler.enabled:
+                    device = self.devices.get(get_uid_from_data(packet))
+
+                    if device != None:
+                        function_id = get_function_id_from_data(packet)
+                        profiler.count('Device Callbacks', get_function_label(device, function_id))
+
+                return dispatch_packet(self, packet)
+
+            return dispatch_packet_wrapper
+
+        self.wrap(IPConnection, 'send_request', wrap_send_request)
+        self.wrap(IPConnection, 'dispatch_packet', wrap_dispatch_packet)
+
+profiler = Profiler()
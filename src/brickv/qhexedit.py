@@ -25,25 +25,48 @@
 # * Use writeData on QBuffer directly instead of using QByteArray
 # * Remove QBuffer and QIODevice and replace it by str
 # * Remove Font picker
+# * Store data in a size-limited buffer, coalesce repaints and cache the
+#   rendered text of each row
 
 import string
 
 from PyQt5.Qt import Qt
-from PyQt5.QtGui import QFontMetrics, QClipboard, QPen, QPainter
+from PyQt5.QtCore import QTimer, QPointF
+from PyQt5.QtGui import QFontMetrics, QClipboard, QPen, QPainter, QStaticText
 from PyQt5.QtWidgets import QMenu, QApplication, QAbstractScrollArea, QAction
 
+DEFAULT_MAX_DATA_SIZE = 1024 * 1024 # bytes
+UPDATE_INTERVAL = 16 # milliseconds, roughly one display refresh
+ROW_CACHE_SIZE = 1024 # rows
+
 #where is QtGlobal ?
 def qBound(mini, value, maxi):
     return max(mini, min(value, maxi))
 
+class RowRender:
+    def __init__(self, address, hex_dump, ascii_runs):
+        self.address = address # QStaticText
+        self.hex_dump = hex_dump # QStaticText
+        self.ascii_runs = ascii_runs # [(first char index, printable, QStaticText), ...]
+
 class QHexeditWidget(QAbstractScrollArea):
     highlightingNone = 0
     highlightingData = 1
     highlightingAscii = 2
 
-    def __init__(self, font, parent=None):
+    def __init__(self, font, parent=None, max_data_size=DEFAULT_MAX_DATA_SIZE):
         super().__init__(parent)
-        self.data = ""
+        # the data is kept in a bytearray of which the first buffer_start
+        # bytes are already discarded. this makes appending and discarding
+        # data from the front cheap
+        self.buffer = bytearray()
+        self.buffer_start = 0
+        self.max_data_size = max_data_size
+        self.row_cache = {}
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(UPDATE_INTERVAL)
+        self.update_timer.timeout.connect(self.updateAppendedData)
         self.row_width = 16
         self.word_width = 1
         self.address_color = Qt.blue
@@ -107,7 +130,31 @@ class QHexeditWidget(QAbstractScrollArea):
     Desc: returns how much data we are viewing
     '''
     def dataSize(self):
-        return len(self.data)
+        return len(self.buffer) - self.buffer_start
+
+    '''
+    Name: dataSlice(int start, int end) const
+    Desc: returns the data in the given range as str
+    '''
+    def dataSlice(self, start, end):
+        start = max(0, start)
+        end = max(start, end)
+
+        return self.buffer[self.buffer_start + start:self.buffer_start + end].decode('latin-1')
+
+    '''
+    Name: setMaxDataSize(int size)
+    Desc: sets how many bytes are kept, older data is discarded
+    '''
+    def setMaxDataSize(self, size):
+        self.max_data_size = size
+        self.discardOldData()
+        self.updateScrollbars()
+        self.viewport().update()
+        return
+
+    def maxDataSize(self):
+        return self.max_data_size
 
     '''
     Name: setFont(const QFont &f)
@@ -174,7 +221,7 @@ class QHexeditWidget(QAbstractScrollArea):
         # offset now refers to the first visible byte
         while offset < end:
             if (offset + chars_per_row) > start:
-                row_data = self.data[offset:chars_per_row + offset]
+                row_data = self.dataSlice(offset, chars_per_row + offset)
 
                 if row_data is not None:
                     if self.show_address:
@@ -200,7 +247,12 @@ class QHexeditWidget(QAbstractScrollArea):
     Desc: clears all data from the view
     '''
     def clear(self):
-        self.data = ""
+        self.buffer = bytearray()
+        self.buffer_start = 0
+        self.address_offset = 0
+        self.row_cache = {}
+        self.deselect()
+        self.updateScrollbars()
         self.repaint()
         return
 
@@ -338,8 +390,8 @@ class QHexeditWidget(QAbstractScrollArea):
             horn = 1
         else:
             horn = 0
-        self.verticalScrollBar().setMaximum(max(0, sz / bpr + horn - self.viewport().height() / self.font_height))
-        self.horizontalScrollBar().setMaximum(max(0, (self.line3() - self.viewport().width()) / self.font_width))
+        self.verticalScrollBar().setMaximum(int(max(0, sz // bpr + horn - self.viewport().height() // self.font_height)))
+        self.horizontalScrollBar().setMaximum(int(max(0, (self.line3() - self.viewport().width()) // self.font_width)))
         return
 
 
@@ -350,7 +402,7 @@ class QHexeditWidget(QAbstractScrollArea):
     def scrollTo(self, offset):
         bpr = self.bytesPerRow()
         self.origin = offset % bpr
-        address = offset / bpr
+        address = offset // bpr
 
         self.updateScrollbars()
 
@@ -561,13 +613,51 @@ class QHexeditWidget(QAbstractScrollArea):
             self.highlighting = self.highlightingNone
         return
 
+    '''
+    Name: appendData(const str &data)
+    Desc: appends data, the view is updated at most once per UPDATE_INTERVAL
+    '''
     def appendData(self, data):
-        self.data += data
+        self.buffer += data.encode('latin-1', 'replace')
+        self.discardOldData()
+
+        if not self.update_timer.isActive():
+            self.update_timer.start()
+
+    def updateAppendedData(self):
         self.deselect()
         self.updateScrollbars()
         slider = self.verticalScrollBar()
         slider.setSliderPosition(slider.maximum())
-        self.repaint()
+        self.viewport().update()
+
+    '''
+    Name: discardOldData()
+    Desc: discards whole rows from the front until the data fits into max_data_size
+    '''
+    def discardOldData(self):
+        excess = self.dataSize() - self.max_data_size
+
+        if excess <= 0:
+            return
+
+        bpr = self.bytesPerRow()
+        discard = ((excess + bpr - 1) // bpr) * bpr
+
+        self.buffer_start += discard
+        self.address_offset += discard
+
+        if self.selection_start != -1:
+            self.selection_start -= discard
+            self.selection_end -= discard
+
+            if self.selection_start < 0 or self.selection_end < 0:
+                self.deselect()
+
+        # compact the buffer once the discarded part got bigger than the rest
+        if self.buffer_start > self.max_data_size:
+            del self.buffer[:self.buffer_start]
+            self.buffer_start = 0
 
     '''
     Name: resizeEvent(QResizeEvent *)
@@ -581,6 +671,7 @@ class QHexeditWidget(QAbstractScrollArea):
     '''
     def setAddressOffset(self, offset):
         self.address_offset = offset
+        self.row_cache = {}
         return
 
     '''
@@ -782,6 +873,83 @@ class QHexeditWidget(QAbstractScrollArea):
                 break
         return
 
+    '''
+    Name: isRowSelected(offset, int length) const
+    '''
+    def isRowSelected(self, offset, length):
+        if not self.hasSelectedText() or self.selection_start == self.selection_end:
+            return False
+
+        start = min(self.selection_start, self.selection_end)
+        end = max(self.selection_start, self.selection_end)
+
+        return start < offset + length and offset < end
+
+    '''
+    Name: createRowRender(offset, const str &row_data) const
+    Desc: prepares the text of a row for drawing, so that each part of a row
+          can be drawn with a single call instead of one call per byte
+    '''
+    def createRowRender(self, offset, row_data):
+        def static_text(text):
+            result = QStaticText(text)
+            result.setTextFormat(Qt.PlainText)
+            return result
+
+        address = static_text(self.formatAddress(self.address_offset + offset))
+        words = []
+
+        for i in range(0, self.row_width):
+            if (i + 1) * self.word_width <= len(row_data):
+                words.append(str(self.format_bytes(row_data, i * self.word_width)))
+            else:
+                break
+
+        hex_dump = static_text(' '.join(words))
+        ascii_runs = []
+        run_start = 0
+        run_text = ''
+        run_printable = None
+
+        for i, ch in enumerate(row_data):
+            printable = self.is_printable(ch)
+
+            if printable != run_printable:
+                if len(run_text) > 0:
+                    ascii_runs.append((run_start, run_printable, static_text(run_text)))
+
+                run_start = i
+                run_text = ''
+                run_printable = printable
+
+            if printable:
+                run_text += ch
+            else:
+                run_text += self.unprintable_char
+
+        if len(run_text) > 0:
+            ascii_runs.append((run_start, run_printable, static_text(run_text)))
+
+        return RowRender(address, hex_dump, ascii_runs)
+
+    '''
+    Name: getRowRender(offset, const str &row_data)
+    Desc: returns the cached render of a row. the key contains the absolute
+          address, so rows stay cached while data is appended and discarded
+    '''
+    def getRowRender(self, offset, row_data):
+        key = (self.address_offset + offset, len(row_data), self.word_width, self.row_width, self.show_address_separator)
+        render = self.row_cache.get(key)
+
+        if render == None:
+            if len(self.row_cache) >= ROW_CACHE_SIZE:
+                self.row_cache = {}
+
+            render = self.createRowRender(offset, row_data)
+            self.row_cache[key] = render
+
+        return render
+
     '''
     Name: paintEvent(QPaintEvent *)
     '''
@@ -807,20 +975,41 @@ class QHexeditWidget(QAbstractScrollArea):
         data_size = self.dataSize()
         widget_height = self.height()
 
+        text_pen = QPen(self.palette().text().color())
+        non_printable_pen = QPen(self.non_printable_text)
+        hex_dump_left = self.hexDumpLeft()
+        ascii_dump_left = self.asciiDumpLeft()
+
         while (row + self.font_height < widget_height) and (offset < data_size):
-            row_data = self.data[offset:chars_per_row+offset]
+            row_data = self.dataSlice(offset, chars_per_row + offset)
             if row_data is not None: # != '' ?
+                render = self.getRowRender(offset, row_data)
+                # rows with selected bytes are drawn byte by byte, all
+                # other rows from their cached render
+                selected = self.isRowSelected(offset, len(row_data))
+
                 if self.show_address:
-                    address_rva = self.address_offset + offset
-                    addressBuffer = self.formatAddress(address_rva)
                     painter.setPen(QPen(self.address_color))
-                    painter.drawText(0, row, len(addressBuffer) * (self.font_width+1), self.font_height, Qt.AlignTop, addressBuffer)
+                    painter.drawStaticText(0, row, render.address)
 
                 painter.setPen(QPen(Qt.black))
                 if self.show_hex:
-                    self.drawHexDump(painter, offset, row, data_size, word_count, row_data)
+                    if selected:
+                        self.drawHexDump(painter, offset, row, data_size, word_count, row_data)
+                    else:
+                        painter.setPen(text_pen)
+                        painter.drawStaticText(QPointF(hex_dump_left, row), render.hex_dump)
                 if self.show_ascii:
-                    self.drawAsciiDump(painter, offset, row, data_size, row_data)
+                    if selected:
+                        self.drawAsciiDump(painter, offset, row, data_size, row_data)
+                    else:
+                        for start, printable, text in render.ascii_runs:
+                            if printable:
+                                painter.setPen(text_pen)
+                            else:
+                                painter.setPen(non_printable_pen)
+
+                            painter.drawStaticText(QPointF(ascii_dump_left + start * self.font_width, row), text)
             offset += chars_per_row
             row += self.font_height
 
@@ -860,7 +1049,7 @@ class QHexeditWidget(QAbstractScrollArea):
     Name: allBytes() const
     '''
     def allBytes(self):
-        return self.data
+        return self.dataSlice(0, self.dataSize())
 
     '''
     Name: selectedBytes() const
@@ -869,8 +1058,7 @@ class QHexeditWidget(QAbstractScrollArea):
         if self.hasSelectedText():
             s = min(self.selection_start, self.selection_end)
             e = max(self.selection_start, self.selection_end)
-            self.data.seek(s)
-            return self.data[s:e]
+            return self.dataSlice(s, e)
         return []
 
     '''
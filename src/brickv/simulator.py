@@ -0,0 +1,718 @@
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2026 Matthias Bolte <matthias@tinkerforge.com>
+
+simulator.py: Simulated Brick Daemon with synthetic devices for load testing
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# Usage: python3 -m brickv.simulator --stacks 10 --callback-period 10
+#
+# Serves the TCP/IP protocol implemented by ip_connection.py on localhost.
+# The supported functions, their payload formats and the callbacks of each
+# device type are taken from the Python bindings, all getters and callbacks
+# return deterministic synthetic values.
+
+import argparse
+import heapq
+import importlib
+import inspect
+import itertools
+import random
+import re
+import socket
+import struct
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from brickv.bindings.ip_connection import IPConnection, Device, BrickDaemon, base58encode, base58decode, unpack_payload
+from brickv.bindings.brick_master import BrickMaster
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 4223
+DEFAULT_DEVICE_TYPES = ['bricklet_temperature_v2', 'bricklet_humidity_v2', 'bricklet_ambient_light_v3',
+                        'bricklet_barometer_v2', 'bricklet_voltage_current_v2']
+BRICKLET_POSITIONS = 'abcd'
+MAX_STACK_SIZE = 8
+STREAM_CHUNKS = 4 # chunks per simulated multi-chunk stream
+EVENT_CALLBACK_PERIOD = 100 # milliseconds, for callbacks that can only be enabled or disabled
+BRICKD_UID = base58decode('2')
+
+HEADER = struct.Struct('<IBBBB')
+
+ERROR_CODE_NOT_SUPPORTED = 2
+
+# value ranges for synthetic values, kept small so that plots look sensible
+VALUE_RANGES = {
+    'b': (-100, 100),
+    'B': (0, 200),
+    'h': (-1000, 1000),
+    'H': (0, 2000),
+    'i': (-10000, 10000),
+    'I': (0, 20000),
+    'q': (-10000, 10000),
+    'Q': (0, 20000),
+    'f': (-100, 100),
+    'd': (-100, 100)
+}
+
+SEND_REQUEST_PATTERN = re.compile(r"self\.ipcon\.send_request\(self, \w+\.(FUNCTION_\w+), \(.*?\), '([^']*)', (\d+), '([^']*)'\)")
+RETURN_TUPLE_PATTERN = re.compile(r"return (\w+)\(\*self\.ipcon\.send_request")
+NAMEDTUPLE_PATTERN = re.compile(r"^(\w+) = namedtuple\('\w+', \[([^\]]*)\]\)", re.M)
+CALLBACK_SETTER_PATTERN = re.compile(r"^set_(\w+)_callback_(configuration|period)$")
+
+FunctionSpec = namedtuple('FunctionSpec', 'name request_form response_length response_form response_roles')
+CallbackSpec = namedtuple('CallbackSpec', 'name length form roles fixed_length')
+
+# stream roles of a getter response, derived from the field names of its
+# named tuple. callbacks get their roles from the bindings directly
+def get_stream_roles(fields):
+    roles = []
+
+    for field in fields:
+        role = None
+
+        if field.endswith('_chunk_offset'):
+            role = 'stream_chunk_offset'
+        elif field.endswith('_chunk_data'):
+            role = 'stream_chunk_data'
+        elif field.endswith('_length'):
+            prefix = field[:-len('_length')]
+
+            if prefix + '_chunk_data' in fields or prefix + '_data' in fields:
+                role = 'stream_length'
+        elif field.endswith('_data') and field[:-len('_data')] + '_length' in fields:
+            role = 'stream_chunk_data'
+
+        roles.append(role)
+
+    return roles
+
+# returns a list of (code, count) tuples, '!' is used as code for bools
+def parse_form(form):
+    elements = []
+
+    for f in form.split(' '):
+        if len(f) == 0:
+            continue
+
+        if '!' in f:
+            elements.append(('!', int(f[:-1]) if len(f) > 1 else 1))
+        else:
+            elements.append((f[-1], int(f[:-1]) if len(f) > 1 else 1))
+
+    return elements
+
+def get_max_value(code):
+    if code in 'fd':
+        return None
+
+    return (1 << (8 * struct.calcsize('<' + code) - (1 if code.islower() else 0))) - 1
+
+def wave(code, t):
+    low, high = VALUE_RANGES.get(code, (0, 100))
+    span = high - low
+    t %= 2 * span
+
+    return low + (t if t < span else 2 * span - t)
+
+def synthesize_payload(form, roles, t, stream_values):
+    payload = b''
+
+    if roles == None:
+        roles = [None] * len(parse_form(form))
+
+    for i, ((code, count), role) in enumerate(zip(parse_form(form), roles)):
+        if role in stream_values:
+            payload += struct.pack('<' + code, stream_values[role])
+        elif code == '!':
+            bits = [(t + i + k) % 2 == 0 for k in range(count)]
+
+            if count == 1:
+                payload += struct.pack('<?', bits[0])
+            else:
+                data = bytearray((count + 7) // 8)
+
+                for k, bit in enumerate(bits):
+                    if bit:
+                        data[k // 8] |= 1 << (k % 8)
+
+                payload += bytes(data)
+        elif code == 'c':
+            payload += bytes(ord('a') + (t + k) % 26 for k in range(count))
+        elif code == 's':
+            payload += b'Simulated'.ljust(count, b'\0')[:count]
+        else:
+            values = [wave(code, t + i * 7 + k * 3) for k in range(count)]
+
+            if code in 'fd':
+                values = [float(value) for value in values]
+
+            payload += struct.pack('<{0}{1}'.format(count, code), *values)
+
+    return payload
+
+# returns the total length of a simulated stream, or None if the form
+# contains no stream
+def get_stream_length(form, roles, fixed_length):
+    if roles == None or 'stream_chunk_data' not in roles:
+        return None
+
+    elements = parse_form(form)
+    chunk_length = elements[roles.index('stream_chunk_data')][1]
+
+    if fixed_length != None:
+        return fixed_length
+
+    if 'stream_chunk_offset' not in roles:
+        return chunk_length
+
+    length = chunk_length * STREAM_CHUNKS
+
+    if 'stream_length' in roles and length > get_max_value(elements[roles.index('stream_length')][0]):
+        return chunk_length
+
+    return length
+
+def load_device_class(name):
+    module = importlib.import_module('brickv.bindings.' + name)
+
+    for value in vars(module).values():
+        if inspect.isclass(value) and issubclass(value, Device) and value.__module__ == module.__name__:
+            return value
+
+    raise ValueError('Bindings module {0} contains no device class'.format(name))
+
+class DeviceSpec:
+    """
+    Functions and callbacks of a device type. The payload formats are taken
+    from the generated bindings source, which is uniform enough to be
+    matched by regular expressions.
+    """
+
+    cache = {} # by device class
+
+    @staticmethod
+    def get(device_class):
+        spec = DeviceSpec.cache.get(device_class)
+
+        if spec == None:
+            spec = DeviceSpec(device_class)
+            DeviceSpec.cache[device_class] = spec
+
+        return spec
+
+    def __init__(self, device_class):
+        self.device_class = device_class
+        self.functions = {} # by function ID
+        self.callbacks = {} # by callback ID
+        self.callback_setters = {} # callback ID by function ID
+
+        source = inspect.getsource(sys.modules[device_class.__module__])
+        tuples = {}
+
+        for name, fields in NAMEDTUPLE_PATTERN.findall(source):
+            tuples[name] = [field.strip().strip("'") for field in fields.split(',')]
+
+        for chunk in source.split('\n    def ')[1:]:
+            match = SEND_REQUEST_PATTERN.search(chunk)
+
+            if match == None:
+                continue
+
+            name = chunk[:chunk.index('(')]
+            tuple_match = RETURN_TUPLE_PATTERN.search(chunk)
+            roles = None
+
+            if tuple_match != None and tuple_match.group(1) in tuples:
+                roles = get_stream_roles(tuples[tuple_match.group(1)])
+
+            function_id = getattr(device_class, match.group(1))
+            self.functions[function_id] = FunctionSpec(name, match.group(2), int(match.group(3)), match.group(4), roles)
+
+        callback_names = {}
+
+        for attribute in dir(device_class):
+            if attribute.startswith('CALLBACK_'):
+                callback_names[getattr(device_class, attribute)] = attribute
+
+        # the callback formats are only available from a device object
+        device = device_class('2', IPConnection())
+
+        for callback_id, (length, form) in device.callback_formats.items():
+            high_level_callback = device.high_level_callbacks.get(-callback_id)
+
+            if high_level_callback != None:
+                roles = list(high_level_callback[0])
+                fixed_length = high_level_callback[1]['fixed_length']
+            else:
+                roles = None
+                fixed_length = None
+
+            self.callbacks[callback_id] = CallbackSpec(callback_names.get(callback_id, str(callback_id)), length, form, roles, fixed_length)
+
+        for function_id, function in self.functions.items():
+            match = CALLBACK_SETTER_PATTERN.match(function.name)
+
+            if match == None:
+                continue
+
+            for name in ['CALLBACK_' + match.group(1).upper(), 'CALLBACK_' + match.group(1).upper() + '_LOW_LEVEL']:
+                callback_id = abs(getattr(device_class, name, 0))
+
+                if callback_id in self.callbacks:
+                    self.callback_setters[function_id] = callback_id
+                    break
+
+class SimulatedDevice:
+    def __init__(self, uid, connected_uid, position, spec, hardware_version, firmware_version):
+        self.uid = base58decode(uid)
+        self.uid_string = uid
+        self.connected_uid = connected_uid
+        self.position = position
+        self.spec = spec
+        self.hardware_version = hardware_version
+        self.firmware_version = firmware_version
+        self.lock = threading.Lock()
+        self.counters = {} # by function or callback ID
+        self.stream_offsets = {} # by function or callback ID
+        self.callback_generations = {} # by callback ID
+
+    def get_identity_payload(self):
+        return struct.pack('<8s8sc3B3BH', self.uid_string.encode('ascii'), self.connected_uid.encode('ascii'),
+                           self.position.encode('ascii'), *self.hardware_version, *self.firmware_version,
+                           self.spec.device_class.DEVICE_IDENTIFIER)
+
+    # callback and function IDs cannot collide, they share the counters
+    def next_payload(self, key, form, roles, fixed_length=None):
+        with self.lock:
+            t = self.counters.get(key, 0)
+            self.counters[key] = t + 1
+            stream_length = get_stream_length(form, roles, fixed_length)
+            stream_values = {}
+
+            if stream_length != None:
+                offset = self.stream_offsets.get(key, 0)
+                chunk_length = parse_form(form)[roles.index('stream_chunk_data')][1]
+                next_offset = offset + chunk_length
+
+                self.stream_offsets[key] = next_offset if next_offset < stream_length else 0
+                stream_values = {'stream_length': stream_length, 'stream_chunk_offset': offset}
+
+        return synthesize_payload(form, roles, t + self.uid % 1000, stream_values)
+
+    # returns the generation that identifies the new callback timer
+    def next_callback_generation(self, callback_id):
+        with self.lock:
+            generation = self.callback_generations.get(callback_id, 0) + 1
+            self.callback_generations[callback_id] = generation
+
+            return generation
+
+    def is_callback_generation(self, callback_id, generation):
+        with self.lock:
+            return self.callback_generations.get(callback_id) == generation
+
+def create_devices(stacks, masters_per_stack, bricklets_per_master, device_types, seed,
+                   hardware_version=(1, 0, 0), firmware_version=(2, 0, 0)):
+    rng = random.Random(seed)
+    master_spec = DeviceSpec.get(BrickMaster)
+    bricklet_specs = itertools.cycle([DeviceSpec.get(load_device_class(name)) for name in device_types])
+    count = stacks * masters_per_stack * (1 + bricklets_per_master)
+    uids = iter(base58encode(uid) for uid in rng.sample(range(1000, 1 << 31), count))
+    devices = []
+
+    for _ in range(stacks):
+        bottom_uid = None
+
+        for position in range(masters_per_stack):
+            uid = next(uids)
+
+            if bottom_uid == None:
+                bottom_uid = uid
+                connected_uid = '0'
+            else:
+                connected_uid = bottom_uid
+
+            devices.append(SimulatedDevice(uid, connected_uid, str(position), master_spec, hardware_version, firmware_version))
+
+            for bricklet_position in BRICKLET_POSITIONS[:bricklets_per_master]:
+                devices.append(SimulatedDevice(next(uids), uid, bricklet_position, next(bricklet_specs), hardware_version, firmware_version))
+
+    return devices
+
+class Scheduler(threading.Thread):
+    """
+    Single timer thread for delayed responses and periodic callbacks. All
+    packets that become due at the same time are written with one send
+    call per client.
+    """
+
+    def __init__(self, flush):
+        super().__init__(daemon=True)
+
+        self.flush = flush
+        self.condition = threading.Condition()
+        self.events = [] # heap of (due, order, function, arguments)
+        self.order = 0
+
+    def schedule(self, due, function, *arguments):
+        with self.condition:
+            self.order += 1
+
+            heapq.heappush(self.events, (due, self.order, function, arguments))
+
+            if self.events[0][1] == self.order:
+                self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while True:
+                    now = time.monotonic()
+
+                    if len(self.events) > 0 and self.events[0][0] <= now:
+                        break
+
+                    self.condition.wait(self.events[0][0] - now if len(self.events) > 0 else None)
+
+                due_events = []
+
+                while len(self.events) > 0 and self.events[0][0] <= now:
+                    due_events.append(heapq.heappop(self.events))
+
+            for due, _, function, arguments in due_events:
+                function(due, *arguments)
+
+            self.flush()
+
+class SimulatedClient(threading.Thread):
+    def __init__(self, simulator, sock):
+        super().__init__(daemon=True)
+
+        self.simulator = simulator
+        self.socket = sock
+        self.pending_lock = threading.Lock()
+        self.pending = []
+        self.alive = True
+
+    def queue(self, packet):
+        with self.pending_lock:
+            self.pending.append(packet)
+
+    def flush(self):
+        with self.pending_lock:
+            pending = self.pending
+            self.pending = []
+
+        if len(pending) == 0 or not self.alive:
+            return
+
+        try:
+            self.socket.sendall(b''.join(pending))
+        except OSError:
+            self.close()
+
+    def close(self):
+        self.alive = False
+
+        try:
+            self.socket.close()
+        except OSError:
+            pass
+
+        self.simulator.remove_client(self)
+
+    def run(self):
+        pending_data = b''
+
+        while self.alive:
+            try:
+                data = self.socket.recv(8192)
+            except OSError:
+                data = b''
+
+            if len(data) == 0:
+                break
+
+            pending_data += data
+
+            while len(pending_data) >= 8:
+                length = pending_data[4]
+
+                if length < 8:
+                    pending_data = b''
+                    break
+
+                if len(pending_data) < length:
+                    break
+
+                packet = pending_data[:length]
+                pending_data = pending_data[length:]
+
+                self.simulator.handle_request(self, packet)
+
+        self.close()
+
+class Simulator:
+    def __init__(self, devices, latency=0, jitter=0, callback_period=None, seed=0):
+        self.devices = {device.uid: device for device in devices}
+        self.latency = latency / 1000 # seconds
+        self.jitter = jitter / 1000 # seconds
+        self.callback_period = callback_period # milliseconds, overrides client configuration
+        self.rng_lock = threading.Lock()
+        self.rng = random.Random(seed)
+        self.clients_lock = threading.Lock()
+        self.clients = []
+        self.scheduler = Scheduler(self.flush)
+        self.server_socket = None
+
+    def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.listen(host, port)
+        self.accept_loop()
+
+    # returns the bound port, port 0 selects a free port
+    def listen(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server_socket.bind((host, port))
+        self.server_socket.listen(16)
+
+        self.scheduler.start()
+
+        if self.callback_period != None:
+            now = time.monotonic()
+
+            for device in self.devices.values():
+                for callback_id in device.spec.callbacks:
+                    self.start_callback(now, device, callback_id, self.callback_period)
+
+        return self.server_socket.getsockname()[1]
+
+    def accept_loop(self):
+        while True:
+            try:
+                sock, _ = self.server_socket.accept()
+            except OSError:
+                break
+
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            client = SimulatedClient(self, sock)
+
+            with self.clients_lock:
+                self.clients.append(client)
+
+            client.start()
+
+    def stop(self):
+        if self.server_socket != None:
+            # closing alone doesn't wake up a blocking accept call on Linux
+            try:
+                self.server_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+            self.server_socket.close()
+
+        with self.clients_lock:
+            clients = list(self.clients)
+
+        for client in clients:
+            client.close()
+
+    def remove_client(self, client):
+        with self.clients_lock:
+            if client in self.clients:
+                self.clients.remove(client)
+
+    def flush(self):
+        with self.clients_lock:
+            clients = list(self.clients)
+
+        for client in clients:
+            client.flush()
+
+    def get_response_due(self):
+        with self.rng_lock:
+            jitter = self.rng.uniform(0, self.jitter) if self.jitter > 0 else 0
+
+        return time.monotonic() + self.latency + jitter
+
+    def send_packet(self, due, client, packet):
+        client.queue(packet)
+
+    def respond(self, client, uid, function_id, sequence_number, payload=b'', error_code=0):
+        packet = HEADER.pack(uid, 8 + len(payload), function_id, (sequence_number << 4) | (1 << 3), error_code << 6) + payload
+
+        self.scheduler.schedule(self.get_response_due(), self.send_packet, client, packet)
+
+    def enumerate(self, client):
+        due = self.get_response_due()
+
+        for device in self.devices.values():
+            payload = device.get_identity_payload() + struct.pack('<B', IPConnection.ENUMERATION_TYPE_AVAILABLE)
+            packet = HEADER.pack(device.uid, 8 + len(payload), IPConnection.CALLBACK_ENUMERATE, 0, 0) + payload
+
+            self.scheduler.schedule(due, self.send_packet, client, packet)
+
+    def start_callback(self, now, device, callback_id, period):
+        generation = device.next_callback_generation(callback_id)
+
+        if period > 0:
+            self.scheduler.schedule(now + period / 1000, self.fire_callback, device, callback_id, generation, period)
+
+    def fire_callback(self, due, device, callback_id, generation, period):
+        if not device.is_callback_generation(callback_id, generation):
+            return
+
+        callback = device.spec.callbacks[callback_id]
+        payload = device.next_payload(callback_id, callback.form, callback.roles, callback.fixed_length)
+        payload = payload[:callback.length - 8].ljust(callback.length - 8, b'\0')
+        packet = HEADER.pack(device.uid, callback.length, callback_id, 0, 0) + payload
+
+        with self.clients_lock:
+            clients = list(self.clients)
+
+        for client in clients:
+            client.queue(packet)
+
+        # skip ticks instead of bursting if the scheduler fell behind
+        now = time.monotonic()
+        due = max(due + period / 1000, now)
+
+        self.scheduler.schedule(due, self.fire_callback, device, callback_id, generation, period)
+
+    def configure_callback(self, device, function, callback_id, payload):
+        if self.callback_period != None:
+            return
+
+        try:
+            values = unpack_payload(payload, function.request_form)
+        except struct.error:
+            return
+
+        # unpack_payload does not return a list for single element forms
+        value = values if len(parse_form(function.request_form)) == 1 else values[0]
+
+        if isinstance(value, bool):
+            period = EVENT_CALLBACK_PERIOD if value else 0
+        else:
+            period = value
+
+        self.start_callback(time.monotonic(), device, callback_id, period)
+
+    def handle_request(self, client, packet):
+        uid, length, function_id, sequence_number_and_options, _ = HEADER.unpack_from(packet)
+        sequence_number = (sequence_number_and_options >> 4) & 0x0F
+        response_expected = (sequence_number_and_options >> 3) & 0x01 != 0
+
+        if function_id == IPConnection.FUNCTION_ENUMERATE:
+            self.enumerate(client)
+            return
+
+        if function_id == IPConnection.FUNCTION_DISCONNECT_PROBE:
+            return
+
+        if uid == BRICKD_UID:
+            if function_id == BrickDaemon.FUNCTION_GET_AUTHENTICATION_NONCE:
+                with self.rng_lock:
+                    nonce = bytes(self.rng.randrange(256) for _ in range(4))
+
+                self.respond(client, uid, function_id, sequence_number, nonce)
+            elif response_expected:
+                # every authentication attempt succeeds
+                self.respond(client, uid, function_id, sequence_number)
+
+            return
+
+        device = self.devices.get(uid)
+
+        if device == None:
+            return # like brickd, requests for unknown devices are dropped
+
+        if function_id == 255: # <device>.get_identity
+            self.respond(client, uid, function_id, sequence_number, device.get_identity_payload())
+            return
+
+        function = device.spec.functions.get(function_id)
+
+        if function == None:
+            if response_expected:
+                self.respond(client, uid, function_id, sequence_number, error_code=ERROR_CODE_NOT_SUPPORTED)
+
+            return
+
+        callback_id = device.spec.callback_setters.get(function_id)
+
+        if callback_id != None:
+            self.configure_callback(device, function, callback_id, packet[8:])
+
+        if len(function.response_form) > 0:
+            payload = device.next_payload(function_id, function.response_form, function.response_roles)
+            payload = payload[:function.response_length - 8].ljust(function.response_length - 8, b'\0')
+
+            self.respond(client, uid, function_id, sequence_number, payload)
+        elif response_expected:
+            self.respond(client, uid, function_id, sequence_number)
+
+def parse_version(version):
+    parts = tuple(int(part) for part in version.split('.'))
+
+    if len(parts) != 3:
+        raise argparse.ArgumentTypeError('invalid version: ' + version)
+
+    return parts
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulated Brick Daemon for load testing')
+
+    parser.add_argument('--host', default=DEFAULT_HOST, help='listen address (default: {0})'.format(DEFAULT_HOST))
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='listen port (default: {0})'.format(DEFAULT_PORT))
+    parser.add_argument('--stacks', type=int, default=1, help='number of stacks (default: 1)')
+    parser.add_argument('--masters-per-stack', type=int, default=1, choices=range(1, MAX_STACK_SIZE + 1), metavar='N',
+                        help='Master Bricks per stack (default: 1)')
+    parser.add_argument('--bricklets-per-master', type=int, default=4, choices=range(len(BRICKLET_POSITIONS) + 1), metavar='N',
+                        help='Bricklets per Master Brick (default: 4)')
+    parser.add_argument('--device-types', default=','.join(DEFAULT_DEVICE_TYPES),
+                        help='comma separated bindings module names of the simulated Bricklets')
+    parser.add_argument('--firmware-version', type=parse_version, default=(2, 0, 0), help='firmware version of all devices (default: 2.0.0)')
+    parser.add_argument('--latency', type=float, default=0, help='response latency in milliseconds (default: 0)')
+    parser.add_argument('--jitter', type=float, default=0, help='maximum additional random response latency in milliseconds (default: 0)')
+    parser.add_argument('--callback-period', type=int, default=None,
+                        help='trigger all callbacks of all devices with this period in milliseconds, ignoring the callback configuration')
+    parser.add_argument('--seed', type=int, default=0, help='seed for UIDs and latency jitter (default: 0)')
+
+    args = parser.parse_args(sys.argv[1:])
+
+    devices = create_devices(args.stacks, args.masters_per_stack, args.bricklets_per_master,
+                             [name.strip() for name in args.device_types.split(',')], args.seed,
+                             firmware_version=args.firmware_version)
+    simulator = Simulator(devices, args.latency, args.jitter, args.callback_period, args.seed)
+
+    print('Simulating {0} devices on {1}:{2}'.format(len(devices), args.host, args.port))
+
+    try:
+        simulator.serve(args.host, args.port)
+    except KeyboardInterrupt:
+        simulator.stop()
+
+if __name__ == '__main__':
+    main()
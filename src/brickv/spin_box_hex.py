@@ -26,6 +26,18 @@ from PyQt5.QtCore import QRegExp
 from PyQt5.QtWidgets import QSpinBox
 from PyQt5.QtGui import QRegExpValidator
 
+# formats value as hex digits in blocks of digit_block_size digits, starting
+# from the least significant digit
+def format_hex_blocks(value, digit_block_size=2):
+    rev_text = hex(value).replace('0x', '').upper()[::-1]
+    blocks = [rev_text[i:i+digit_block_size] for i in range(0, len(rev_text), digit_block_size)]
+
+    # Reverse blocks and chars in block to undo reverse on the string above
+    text = ' '.join(s[::-1] for s in blocks[::-1])
+    if len(blocks[0]) != digit_block_size:
+        text = '0' * (digit_block_size - len(blocks[0])) + text
+    return text
+
 class SpinBoxHex(QSpinBox):
     def __init__(self, parent=None, default_value=0, digit_block_size=2):
         super().__init__(parent)
@@ -58,11 +70,4 @@ class SpinBoxHex(QSpinBox):
     def textFromValue(self, value):
         if not self.hex_mode_enabled:
             return super().textFromValue(value)
-        rev_text = hex(value).replace('0x', '').upper()[::-1]
-        blocks = [rev_text[i:i+self.digit_block_size] for i in range(0, len(rev_text), self.digit_block_size)]
-
-        # Reverse blocks and chars in block to undo reverse on the string above
-        text = ' '.join(s[::-1] for s in blocks[::-1])
-        if len(blocks[0]) != self.digit_block_size:
-            text = '0' * (self.digit_block_size - len(blocks[0])) + text
-        return text
+        return format_hex_blocks(value, self.digit_block_size)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2026 Matthias Bolte <matthias@tinkerforge.com>
+
+test_simulator.py: Tests for the simulated Brick Daemon
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# Usage: cd src && python3 -m pytest brickv/tests
+
+import queue
+import threading
+import unittest
+
+from brickv.bindings.ip_connection import IPConnection
+from brickv.bindings.brick_master import BrickMaster
+from brickv.bindings.bricklet_temperature_v2 import BrickletTemperatureV2
+from brickv.simulator import Simulator, create_devices
+
+TIMEOUT = 5 # seconds
+
+class TestSimulator(unittest.TestCase):
+    def setUp(self):
+        self.devices = create_devices(1, 1, 1, ['bricklet_temperature_v2'], 0)
+        self.simulator = Simulator(self.devices)
+        self.port = self.simulator.listen('127.0.0.1', 0)
+        self.accept_thread = threading.Thread(target=self.simulator.accept_loop)
+        self.accept_thread.daemon = True
+        self.accept_thread.start()
+
+        self.ipcon = IPConnection()
+        self.ipcon.connect('127.0.0.1', self.port)
+
+    def tearDown(self):
+        self.ipcon.disconnect()
+        self.simulator.stop()
+        self.accept_thread.join(TIMEOUT)
+
+    def enumerate(self):
+        enumerations = queue.Queue()
+
+        def cb_enumerate(uid, connected_uid, position, hardware_version, firmware_version,
+                         device_identifier, enumeration_type):
+            enumerations.put((uid, connected_uid, position, device_identifier))
+
+        self.ipcon.register_callback(IPConnection.CALLBACK_ENUMERATE, cb_enumerate)
+        self.ipcon.enumerate()
+
+        return [enumerations.get(timeout=TIMEOUT) for _ in self.devices]
+
+    def test_enumerate(self):
+        master_uid, bricklet_uid = [device.uid_string for device in self.devices]
+
+        self.assertEqual(sorted(self.enumerate()),
+                         sorted([(master_uid, '0', '0', BrickMaster.DEVICE_IDENTIFIER),
+                                 (bricklet_uid, master_uid, 'a', BrickletTemperatureV2.DEVICE_IDENTIFIER)]))
+
+    def test_getter(self):
+        temperature = BrickletTemperatureV2(self.devices[1].uid_string, self.ipcon)
+
+        self.assertTrue(-10000 <= temperature.get_temperature() <= 10000)
+        self.assertEqual(temperature.get_identity().device_identifier, BrickletTemperatureV2.DEVICE_IDENTIFIER)
+
+    def test_callback(self):
+        temperature = BrickletTemperatureV2(self.devices[1].uid_string, self.ipcon)
+        values = queue.Queue()
+
+        temperature.register_callback(BrickletTemperatureV2.CALLBACK_TEMPERATURE, values.put)
+        temperature.set_temperature_callback_configuration(10, False, 'x', 0, 0)
+
+        for _ in range(3):
+            self.assertTrue(-10000 <= values.get(timeout=TIMEOUT) <= 10000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2026 Matthias Bolte <matthias@tinkerforge.com>
+
+test_esp_flash.py: Tests for the ESP8266 flasher against a fake Master/ESP
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# Usage: cd src && python3 -m pytest tests
+
+import hashlib
+import struct
+import threading
+import time
+import unittest
+from unittest import mock
+
+from brickv.esp_flash import ESPROM, CesantaFlasher, TFSerial
+
+SECTOR = ESPROM.ESP_FLASH_SECTOR
+BLOCK = ESPROM.ESP_FLASH_BLOCK
+
+def slip_encode(packet):
+    return b'\xc0' + packet.replace(b'\xdb', b'\xdb\xdd').replace(b'\xc0', b'\xdb\xdc') + b'\xc0'
+
+def slip_decode(packet):
+    return packet.replace(b'\xdb\xdc', b'\xc0').replace(b'\xdb\xdd', b'\xdb')
+
+# Emulates the ESP8266 ROM loader far enough to upload the flasher stub and the
+# Cesanta flasher stub with its digest, write (including erase) and boot commands
+class FakeESP:
+    def __init__(self, flash_size):
+        self.flash = bytearray(b'\xff' * flash_size)
+        self.erased_sectors = []
+        self.written_sectors = []
+        self.reset()
+
+    def reset(self):
+        self.mode = 'rom'
+        self.input = bytearray()
+        self.output = bytearray()
+        self.stub_command = None
+        self.write_address = None
+        self.write_remaining = 0
+        self.write_buffer = bytearray()
+        self.write_count = 0
+        self.write_digest = None
+
+    def receive(self, data):
+        self.input.extend(data)
+
+        while len(self.input) > 0:
+            if self.write_remaining > 0:
+                self.receive_write_data()
+                continue
+
+            start = self.input.find(b'\xc0')
+
+            if start < 0:
+                del self.input[:]
+                break
+
+            end = self.input.find(b'\xc0', start + 1)
+
+            if end < 0:
+                break
+
+            packet = slip_decode(bytes(self.input[start + 1:end]))
+            del self.input[:end + 1]
+
+            if self.mode == 'rom':
+                self.handle_rom_packet(packet)
+            else:
+                self.handle_stub_packet(packet)
+
+    def send(self, packet):
+        self.output.extend(slip_encode(packet))
+
+    def handle_rom_packet(self, packet):
+        _, op, _, _ = struct.unpack('<BBHI', packet[:8])
+        response = struct.pack('<BBHI', 1, op, 2, 0) + b'\0\0'
+
+        if op == ESPROM.ESP_SYNC:
+            for _ in range(8):
+                self.send(response)
+        else:
+            self.send(response)
+
+        if op == ESPROM.ESP_MEM_END and struct.unpack('<II', packet[8:16])[1] != 0:
+            self.mode = 'stub'
+            self.send(b'OHAI')
+
+    def handle_stub_packet(self, packet):
+        if self.stub_command == None:
+            command = packet[0]
+
+            if command == CesantaFlasher.CMD_BOOT_FW:
+                self.send(b'\0')
+            else:
+                self.stub_command = command
+
+            return
+
+        command = self.stub_command
+        self.stub_command = None
+
+        if command == CesantaFlasher.CMD_FLASH_DIGEST:
+            address, length, block_size = struct.unpack('<III', packet)
+
+            for offset in range(0, length, block_size):
+                self.send(hashlib.md5(self.flash[address + offset:address + offset + block_size]).digest())
+
+            self.send(hashlib.md5(self.flash[address:address + length]).digest())
+            self.send(b'\0')
+        elif command == CesantaFlasher.CMD_FLASH_WRITE:
+            address, length, erase = struct.unpack('<III', packet)
+
+            if erase:
+                for sector in range(address // SECTOR, (address + length) // SECTOR):
+                    self.flash[sector * SECTOR:(sector + 1) * SECTOR] = b'\xff' * SECTOR
+                    self.erased_sectors.append(sector)
+
+            self.write_address = address
+            self.write_remaining = length
+            self.write_count = 0
+            self.write_digest = hashlib.md5()
+            self.send(struct.pack('<I', 0))
+        else:
+            raise Exception('Unexpected stub command {0}'.format(command))
+
+    def receive_write_data(self):
+        length = min(len(self.input), self.write_remaining, BLOCK - len(self.write_buffer))
+
+        self.write_buffer.extend(self.input[:length])
+        del self.input[:length]
+        self.write_remaining -= length
+
+        if len(self.write_buffer) < BLOCK and self.write_remaining > 0:
+            return
+
+        address = self.write_address + self.write_count
+        self.flash[address:address + len(self.write_buffer)] = self.write_buffer
+        self.write_digest.update(self.write_buffer)
+
+        if address // SECTOR not in self.written_sectors:
+            self.written_sectors.append(address // SECTOR)
+
+        self.write_count += len(self.write_buffer)
+        self.write_buffer = bytearray()
+        self.send(struct.pack('<I', self.write_count))
+
+        if self.write_remaining == 0:
+            self.send(self.write_digest.digest())
+            self.send(b'\0')
+
+# Provides the WIFI Extension 2.0 serial port relay of the Master Brick
+class FakeMaster:
+    def __init__(self, esp):
+        self.esp = esp
+        self.lock = threading.Lock()
+
+    def start_wifi2_bootloader(self):
+        with self.lock:
+            self.esp.reset()
+
+        return 0
+
+    def write_wifi2_serial_port(self, data, length):
+        with self.lock:
+            self.esp.receive(bytes(data[:length]))
+
+        return 0
+
+    def read_wifi2_serial_port(self, length):
+        with self.lock:
+            data = list(self.esp.output[:length])
+            del self.esp.output[:length]
+
+        return data + [0] * (length - len(data)), len(data)
+
+class TestCesantaFlasher(unittest.TestCase):
+    def setUp(self):
+        self.esp = FakeESP(16 * SECTOR)
+        self.rom = ESPROM(FakeMaster(self.esp), startup_delay=0)
+        self.rom.connect()
+        self.flasher = CesantaFlasher(self.rom, ESPROM.ESP_ROM_BAUD)
+
+    def tearDown(self):
+        self.rom.close()
+
+    def write_image(self, address, image):
+        progress = []
+
+        with mock.patch('time.sleep') as sleep:
+            written = self.flasher.flash_write_changed(address, image, progress.append)
+
+        self.assertEqual(sleep.call_count, 0, 'reads must not poll with sleep')
+        self.assertEqual(bytes(self.esp.flash[address:address + len(image)]), image)
+        self.assertEqual(progress[-1], len(image) // BLOCK)
+
+        return written
+
+    def test_unchanged_image_is_not_written(self):
+        image = bytes(range(256)) * (8 * SECTOR // 256)
+        self.esp.flash[SECTOR:9 * SECTOR] = image
+
+        self.assertEqual(self.write_image(SECTOR, image), 0)
+        self.assertEqual(self.esp.erased_sectors, [])
+        self.assertEqual(self.esp.written_sectors, [])
+
+    def test_only_differing_sectors_are_written(self):
+        image = bytearray(bytes(range(256)) * (8 * SECTOR // 256))
+        self.esp.flash[SECTOR:9 * SECTOR] = image
+
+        for sector in [1, 2, 6]:
+            image[sector * SECTOR + 100] ^= 0xff
+
+        self.assertEqual(self.write_image(SECTOR, bytes(image)), 3 * SECTOR)
+        self.assertEqual(sorted(self.esp.erased_sectors), [2, 3, 7])
+        self.assertEqual(sorted(self.esp.written_sectors), [2, 3, 7])
+
+    def test_boot_fw(self):
+        self.flasher.boot_fw()
+
+class TestTFSerial(unittest.TestCase):
+    def test_read_is_woken_by_data_received(self):
+        port = TFSerial(FakeMaster(FakeESP(SECTOR)), startup_delay=0)
+        port.timeout = 5
+
+        try:
+            timer = threading.Timer(0.05, port.data_received, [b'\xc0OHAI\xc0'])
+            timer.start()
+
+            start = time.time()
+            data = port.read(6)
+
+            self.assertEqual(data, b'\xc0OHAI\xc0')
+            self.assertLess(time.time() - start, 1)
+            self.assertEqual(port.inWaiting(), 0)
+        finally:
+            timer.join()
+            port.close()
+
+    def test_read_times_out(self):
+        port = TFSerial(FakeMaster(FakeESP(SECTOR)), startup_delay=0)
+        port.timeout = 0.1
+
+        try:
+            self.assertEqual(port.read(1), b'')
+        finally:
+            port.close()
+
+    def test_flush_input_recovers_from_read_error(self):
+        master = FakeMaster(FakeESP(SECTOR))
+        read_wifi2_serial_port = master.read_wifi2_serial_port
+        master.read_wifi2_serial_port = mock.Mock(side_effect=Exception('Timeout'))
+        port = TFSerial(master, startup_delay=0)
+        port.timeout = 1
+
+        try:
+            with self.assertRaises(Exception):
+                port.read(1)
+
+            master.read_wifi2_serial_port = read_wifi2_serial_port
+            port.flushInput()
+            master.esp.output.extend(b'\xc0OHAI\xc0')
+
+            self.assertEqual(port.read(6), b'\xc0OHAI\xc0')
+        finally:
+            port.close()
+
+    def test_idle_relay_stops_polling(self):
+        master = FakeMaster(FakeESP(SECTOR))
+        master.read_wifi2_serial_port = mock.Mock(wraps=master.read_wifi2_serial_port)
+        port = TFSerial(master, startup_delay=0)
+
+        try:
+            time.sleep(0.5)
+            count = master.read_wifi2_serial_port.call_count
+            time.sleep(0.5)
+
+            self.assertEqual(master.read_wifi2_serial_port.call_count, count)
+        finally:
+            port.close()
+
+if __name__ == '__main__':
+    unittest.main()